@@ -6,12 +6,22 @@ Upload image folders to imx.to as galleries
 
 import sys
 import os
+import time
 from datetime import datetime
 
+_STARTUP_START = time.perf_counter()
+_STARTUP_MODULES = len(sys.modules)
+
+# Run as a script, this module is __main__; register it as 'bbdrop' too so the
+# `from bbdrop import ...` in src/ reuses it instead of executing it a second time
+if __name__ == "__main__":
+    sys.modules.setdefault('bbdrop', sys.modules[__name__])
+
 # Console hiding moved to after GUI window appears (see line ~2220)
 
 # Check for --debug flag early (before heavy imports)
 DEBUG_MODE = '--debug' in sys.argv
+PROFILE_STARTUP = '--profile-startup' in sys.argv
 
 def debug_print(msg):
     """Print debug message if DEBUG_MODE is enabled, otherwise print on same line"""
@@ -34,9 +44,8 @@ def debug_print(msg):
         # Console operations failed, silently ignore
         pass
 
-import requests
-from requests.adapters import HTTPAdapter
-import pycurl
+# requests, pycurl, tqdm and cryptography are imported where they are used, so the
+# GUI hand-off and --help/--version paths start without loading them
 import io
 import json
 import argparse
@@ -46,11 +55,14 @@ from typing import Optional, Any
 
 from concurrent.futures import ThreadPoolExecutor, as_completed
 import concurrent.futures
-import time
 import threading
-from tqdm import tqdm
+from src.utils.archive_utils import is_archive_gallery_path
 from src.utils.format_utils import format_binary_size, format_binary_rate
 from src.utils.logger import log
+from src.utils.tracing import traced
+from src.utils.startup_profile import (
+    enable_startup_profile, record_phase, report_startup_profile, startup_phase,
+)
 import configparser
 import hashlib
 import getpass
@@ -438,7 +450,6 @@ def remove_windows_context_menu():
         return False
 
 import base64
-from cryptography.fernet import Fernet
 import hashlib
 
 class NestedProgressBar:
@@ -454,6 +465,7 @@ class NestedProgressBar:
         self.children = []
         
     def __enter__(self):
+        from tqdm import tqdm
         indent = "  " * self.level
         self.pbar = tqdm(
             total=self.total,
@@ -508,6 +520,7 @@ def encrypt_password(password):
     NOTE: This is kept for backward compatibility only.
     New code should store credentials directly via keyring (see set_credential).
     """
+    from cryptography.fernet import Fernet
     key = get_encryption_key()
     f = Fernet(key)
     return f.encrypt(password.encode()).decode()
@@ -521,6 +534,7 @@ def decrypt_password(encrypted_password):
         raise CredentialDecryptionError("No encrypted password provided")
 
     try:
+        from cryptography.fernet import Fernet
         key = get_encryption_key()
         f = Fernet(key)
         return f.decrypt(encrypted_password.encode()).decode()
@@ -773,7 +787,21 @@ def build_gallery_filenames(gallery_name, gallery_id):
     return gallery_name, json_filename, bbcode_filename
 
 def check_if_gallery_exists(folder_name):
-    """Check if gallery files already exist for this folder"""
+    """Check if gallery files already exist for this folder.
+
+    Uses the SQLite artifact index; falls back to globbing the central store
+    if the index is unavailable.
+    """
+    try:
+        from src.storage.artifact_index import backfill_artifact_index
+        from src.storage.database import QueueStore
+        store = QueueStore()
+        backfill_artifact_index(store)
+        by_name, _ = store.find_existing_artifacts([folder_name])
+        return [p for p in by_name.get(folder_name, []) if os.path.exists(p)]
+    except Exception as e:
+        log(f"Artifact index lookup failed, scanning central store: {e}", level="warning", category="database")
+
     central_path = get_central_storage_path()
     
     # Check central location
@@ -793,6 +821,25 @@ def check_if_gallery_exists(folder_name):
     
     return existing_files
 
+def check_if_galleries_exist(folder_paths):
+    """Batch duplicate check for many folders using the artifact index.
+
+    Matches by folder name and by content fingerprint, so renamed folders
+    holding the same images are reported too.
+    Returns a dict of folder path -> list of existing artifact files.
+    """
+    try:
+        from src.storage.artifact_index import find_previously_uploaded
+        return find_previously_uploaded(folder_paths)
+    except Exception as e:
+        log(f"Artifact index lookup failed, scanning central store: {e}", level="warning", category="database")
+        results = {}
+        for folder_path in folder_paths:
+            existing_files = check_if_gallery_exists(os.path.basename(folder_path))
+            if existing_files:
+                results[folder_path] = existing_files
+        return results
+
 def get_unnamed_galleries():
     """Get list of unnamed galleries from database (much faster than config file)"""
     try:
@@ -908,7 +955,6 @@ def remove_unnamed_gallery(gallery_id):
                 
                 log(f"Removed {gallery_id} from unnamed galleries list", level="debug", category="renaming")
 
-from src.network.cookies import get_firefox_cookies, load_cookies_from_file
 
 def get_template_path():
     """Get the template directory path (uses configured central store location)."""
@@ -1099,6 +1145,7 @@ def generate_bbcode_from_template(template_name, data):
 
 from typing import Optional
 
+@traced("save_artifacts", category="artifacts", gallery_arg="folder_path")
 def save_gallery_artifacts(
     folder_path: str,
     results: dict,
@@ -1124,6 +1171,9 @@ def save_gallery_artifacts(
         store_in_uploaded = defaults.get('store_in_uploaded', True)
     if store_in_central is None:
         store_in_central = defaults.get('store_in_central', True)
+    if is_archive_gallery_path(folder_path):
+        # Galleries streamed from an archive have no folder to write .uploaded into
+        store_in_uploaded = False
 
     gallery_id = results.get('gallery_id', '')
     gallery_name = results.get('gallery_name') or os.path.basename(folder_path)
@@ -1266,6 +1316,14 @@ def save_gallery_artifacts(
         written_paths.setdefault('central', {})['bbcode'] = os.path.join(central_path, bbcode_filename)
         written_paths.setdefault('central', {})['json'] = os.path.join(central_path, json_filename)
 
+    # Keep the duplicate-detection index in sync with what was written
+    try:
+        from src.storage.artifact_index import record_saved_artifacts
+        record_saved_artifacts(folder_path, gallery_id, gallery_name, written_paths,
+                               images=results.get('images', []))
+    except (sqlite3.Error, OSError) as e:
+        log(f"Failed to index gallery artifacts: {e}", level="warning", category="database")
+
     return written_paths
 
 
@@ -1386,6 +1444,9 @@ class ImxToUploader:
     
     def _setup_resilient_session(self, parallel_batch_size=4):
         """Create a session with connection pooling (no automatic retries to avoid timeout conflicts)"""
+        import requests
+        from requests.adapters import HTTPAdapter
+
         # Configure connection pooling - use at least parallel_batch_size connections
         pool_size = max(10, parallel_batch_size)
         adapter = HTTPAdapter(
@@ -1518,8 +1579,13 @@ class ImxToUploader:
             curl = self._curl_local.curl
             curl.setopt(pycurl.COOKIELIST, "ALL")
             log("Cleared pycurl API cookies for new gallery", level="debug", category="uploads")
+
+    def get_last_ttfb(self):
+        """Time to first response byte (seconds) of this thread's last upload, or None."""
+        return getattr(self._curl_local, 'last_ttfb', None)
     
-    def upload_image(self, image_path, create_gallery=False, gallery_id=None, thumbnail_size=3, thumbnail_format=2, thread_session=None, progress_callback=None):
+    @traced("upload_image", category="network")
+    def upload_image(self, image_path, create_gallery=False, gallery_id=None, thumbnail_size=3, thumbnail_format=2, thread_session=None, progress_callback=None, file_data=None):
         """
         Upload a single image to imx.to
 
@@ -1531,11 +1597,16 @@ class ImxToUploader:
             thumbnail_format (int): Thumbnail format (1=Fixed width, 2=Proportional, 3=Square, 4=Fixed height)
             thread_session (requests.Session): Optional thread-local session for concurrent uploads
             progress_callback (callable): Optional callback(bytes_sent, total_bytes) for bandwidth tracking
+            file_data (bytes): Optional image bytes already in memory (e.g. read from an archive);
+                image_path is then only used for the file name and content type
 
         Returns:
             dict: API response
         """
-        if not os.path.exists(image_path):
+        import pycurl
+        from src.network.bandwidth_governor import get_bandwidth_governor, IMX_SERVICE
+
+        if file_data is None and not os.path.exists(image_path):
             raise FileNotFoundError(f"Image file not found: {image_path}")
 
         # Use thread-local session if provided, otherwise use shared session
@@ -1545,8 +1616,9 @@ class ImxToUploader:
         # Keeping file handles open during network I/O causes Python's file I/O to serialize
         # the reads even though HTTP operations can be concurrent (7x performance penalty)
         file_read_start = time.time()
-        with open(image_path, 'rb') as f:
-            file_data = f.read()
+        if file_data is None:
+            with open(image_path, 'rb') as f:
+                file_data = f.read()
         file_read_time = time.time() - file_read_start
 
         if not hasattr(self, '_first_read_logged'):
@@ -1564,6 +1636,7 @@ class ImxToUploader:
 
             def curl_progress_callback(download_total, downloaded, upload_total, uploaded):
                 callback_count[0] += 1
+                shaper.update(uploaded)  # blocks while over the bandwidth limit
 
                 if progress_callback and upload_total > 0:
                     try:
@@ -1610,10 +1683,9 @@ class ImxToUploader:
 
             curl.setopt(pycurl.HTTPPOST, form_data)
 
-            # Set progress tracking
-            if progress_callback:
-                curl.setopt(pycurl.NOPROGRESS, 0)
-                curl.setopt(pycurl.XFERINFOFUNCTION, curl_progress_callback)
+            # Set progress tracking (also drives bandwidth shaping)
+            curl.setopt(pycurl.NOPROGRESS, 0)
+            curl.setopt(pycurl.XFERINFOFUNCTION, curl_progress_callback)
 
             # Capture response
             curl.setopt(pycurl.WRITEDATA, response_buffer)
@@ -1623,10 +1695,12 @@ class ImxToUploader:
             curl.setopt(pycurl.TIMEOUT, self.upload_read_timeout)
 
             # Perform upload
-            curl.perform()
+            with get_bandwidth_governor().transfer(IMX_SERVICE) as shaper:
+                curl.perform()
 
             # Get response
             status_code = curl.getinfo(pycurl.RESPONSE_CODE)
+            self._curl_local.last_ttfb = curl.getinfo(pycurl.STARTTRANSFER_TIME)
             # NOTE: Don't close curl handle - keep connection alive for reuse
 
             if status_code == 200:
@@ -1660,6 +1734,8 @@ class ImxToUploader:
         Returns:
             dict: Contains gallery URL and individual image URLs
         """
+        from tqdm import tqdm
+
         start_time = time.time()
         log(f"upload_folder({folder_path}) started at {start_time:.6f}", level="debug", category="timing")
         
@@ -2131,9 +2207,21 @@ class ImxToUploader:
         
         return results
 
+if PROFILE_STARTUP and __name__ == "__main__":
+    enable_startup_profile(_STARTUP_START)
+    record_phase("import bbdrop", _STARTUP_START, _STARTUP_MODULES)
+
+
 def main():
-    # Migrate credentials from INI to Registry (runs once, safe to call multiple times)
-    migrate_credentials_from_ini()
+    if PROFILE_STARTUP:
+        import atexit
+        atexit.register(report_startup_profile)
+
+    with startup_phase("migrate settings"):
+        # Migrate credentials from INI to Registry (runs once, safe to call multiple times)
+        migrate_credentials_from_ini()
+        # Migrate from old imxup installation if needed (first run after upgrade)
+        migrate_from_imxup()
 
     # Auto-launch GUI if double-clicked (no arguments, no other console processes)
     if len(sys.argv) == 1:  # No arguments provided
@@ -2150,11 +2238,8 @@ def main():
         except (AttributeError, OSError, TypeError):
             pass  # Not Windows or check failed, don't auto-launch GUI
 
-    # Migrate from old imxup installation if needed (first run after upgrade)
-    migrate_from_imxup()
-
-    # Load user defaults
-    user_defaults = load_user_defaults()
+    with startup_phase("load defaults"):
+        user_defaults = load_user_defaults()
 
     parser = argparse.ArgumentParser(description='Upload image folders to imx.to as galleries and generate bbcode.\n\nSettings file: ' + get_config_path())
     parser.add_argument('-v', '--version', action='store_true', help='Show version and exit')
@@ -2171,13 +2256,23 @@ def main():
                        help='Maximum retry attempts for failed uploads (default: 3)')
     parser.add_argument('--parallel', type=int,
                        default=user_defaults.get('parallel_batch_size', 4),
-                       help='Number of images to upload simultaneously (default: 4)')
+                       help='Number of images to upload simultaneously, shared by all --jobs galleries (default: 4)')
+    parser.add_argument('--jobs', '-j', type=int, default=1,
+                       help='Number of galleries to upload at the same time (default: 1)')
+    parser.add_argument('--progress-format', choices=['text', 'jsonl'], default='text',
+                       help='Progress output: text, or one JSON event per line (default: text)')
+    parser.add_argument('--progress-file', metavar='FILE',
+                       help='Write --progress-format jsonl events to FILE instead of stdout')
+    parser.add_argument('--journal', metavar='FILE',
+                       help='Resume journal: record uploaded files in FILE and skip them when the same command is run again')
     parser.add_argument('--setup-secure', action='store_true',
                        help='Set up secure password storage (interactive)')
     parser.add_argument('--rename-unnamed', action='store_true',
                        help='Rename all unnamed galleries from previous uploads')
     parser.add_argument('--template', '-t', 
                        help='Template name to use for bbcode generation (default: "default")')
+    parser.add_argument('--tab',
+                       help='GUI tab to add the folders to (default: current tab)')
 
     parser.add_argument('--install-context-menu', action='store_true',
                        help='Install Windows context menu integration')
@@ -2187,11 +2282,29 @@ def main():
                        help='Launch graphical user interface')
     parser.add_argument('--debug', action='store_true',
                        help='Enable debug mode: print all log messages to console')
+    parser.add_argument('--trace', metavar='FILE',
+                       help='Record per-phase timing spans and write them as Chrome trace JSON to FILE on exit')
+    parser.add_argument('--profile-startup', action='store_true',
+                       help='Print import and initialization time per startup phase to stderr')
 
-    args = parser.parse_args()
+    with startup_phase("parse arguments"):
+        args = parser.parse_args()
     if args.version:
         print(f"imxup {__version__}")
         return
+
+    if args.trace:
+        import atexit
+        from src.utils.tracing import enable_tracing, export_chrome_trace
+        enable_tracing()
+
+        def _write_trace():
+            try:
+                count = export_chrome_trace(args.trace)
+                print(f"Wrote {count} trace spans to {args.trace}")
+            except OSError as e:
+                print(f"Failed to write trace file {args.trace}: {e}")
+        atexit.register(_write_trace)
     
     # Handle GUI launch
     if args.gui:
@@ -2201,12 +2314,26 @@ def main():
             # This allows ImxToUploader to detect GUI mode even after sys.argv is modified
             os.environ['BBDROP_GUI_MODE'] = '1'
 
+            # Hand our folders to a running instance before loading Qt. Processes
+            # started together (one per selected folder) are batched into one message.
+            from src.network.single_instance import forward_to_running_instance
+            from src.utils.archive_utils import is_archive_file
+            folders_to_add = [p for p in args.folder_paths if os.path.isdir(p) or is_archive_file(p)]
+            with startup_phase("forward to running instance"):
+                delivered, folders_to_add = forward_to_running_instance(
+                    folders_to_add, tab=args.tab, template=args.template)
+            if delivered:
+                if not folders_to_add:
+                    print(f"{timestamp()} INFO: BBDrop GUI already running, bringing existing instance to front.")
+                return
+
             # Import only lightweight PyQt6 basics for splash screen FIRST
             debug_print("Importing PyQt6.QtWidgets...")
-            from PyQt6.QtWidgets import QApplication, QProgressDialog
-            from PyQt6.QtCore import Qt, QTimer
-            #debug_print("Importing splash screen...")
-            from src.gui.splash_screen import SplashScreen
+            with startup_phase("import Qt"):
+                from PyQt6.QtWidgets import QApplication, QProgressDialog
+                from PyQt6.QtCore import Qt, QTimer
+                #debug_print("Importing splash screen...")
+                from src.gui.splash_screen import SplashScreen
 
             # Check if folder paths were provided for GUI
             if args.folder_paths:
@@ -2218,6 +2345,8 @@ def main():
 
             # Create QApplication and show splash IMMEDIATELY (before heavy imports)
             debug_print("Creating QApplication...")
+            qapp_start = time.perf_counter()
+            qapp_modules = len(sys.modules)
             app = QApplication(sys.argv)
             #debug_print("Setting Fusion style...")
             app.setStyle("Fusion")
@@ -2271,6 +2400,7 @@ def main():
             debug_print("Processing events...")
             app.processEvents()  # Force splash to appear NOW
             #debug_print("Events processed")
+            record_phase("create QApplication and splash", qapp_start, qapp_modules)
 
             # NOW import the heavy main_window module (while splash is visible)
             splash.set_status("Loading modules")
@@ -2281,35 +2411,22 @@ def main():
                 except (OSError, AttributeError):
                     pass
             debug_print("Importing main_window...")
-            from src.gui.main_window import BBDropGUI, check_single_instance
-
-            # Check for existing instance
-            folders_to_add = []
-            if len(sys.argv) > 1:
-                for arg in sys.argv[1:]:
-                    if os.path.isdir(arg):
-                        folders_to_add.append(arg)
-                if folders_to_add and check_single_instance(folders_to_add[0]):
-                    splash.finish_and_hide()
-                    return
-            else:
-                if check_single_instance():
-                    print(f"{timestamp()} INFO: BBDrop GUI already running, bringing existing instance to front.")
-                    splash.finish_and_hide()
-                    return
+            with startup_phase("import main window"):
+                from src.gui.main_window import BBDropGUI
 
             splash.set_status("Creating main window")
 
             # Create main window (pass splash for progress updates)
-            window = BBDropGUI(splash)
+            with startup_phase("create main window"):
+                window = BBDropGUI(splash)
 
             # Now set Fusion style after widgets are initialized
             splash.set_status("Setting Fusion style...")
             app.setStyle("Fusion")
 
-            # Add folders from command line if provided
+            # Add folders from command line (and other instances started with us)
             if folders_to_add:
-                window.add_folders(folders_to_add)
+                window.add_paths_from_instance(folders_to_add, {'tab': args.tab, 'template': args.template}, focus=False)
 
             # Hide splash BEFORE loading galleries
             splash.finish_and_hide()
@@ -2333,7 +2450,8 @@ def main():
                 # Process events to keep UI responsive (already batched every 10 galleries)
                 QApplication.processEvents()
 
-            window._initialize_table_from_queue(progress_callback=update_progress)
+            with startup_phase("load galleries"):
+                window._initialize_table_from_queue(progress_callback=update_progress)
 
             # DO NOT call processEvents() here - it would force immediate execution of the
             # QTimer.singleShot(100, _create_deferred_widgets) callback, creating 997 widgets
@@ -2343,8 +2461,10 @@ def main():
             progress.close()
 
             # NOW show the main window (galleries already loaded)
-            window.show()
-            window.raise_()        # Bring to front of window stack
+            with startup_phase("show window"):
+                window.show()
+                window.raise_()        # Bring to front of window stack
+            report_startup_profile()
 
             # Defer window activation to avoid blocking the event loop
             QTimer.singleShot(0, window.activateWindow)
@@ -2459,7 +2579,6 @@ def main():
             rename_worker = RenameWorker()
 
             # Wait for initial login (RenameWorker logs in automatically on init)
-            import time
             if not rename_worker.login_complete.wait(timeout=30):
                 debug_print(f"RenameWorker: Login timeout")
                 debug_print(f" To rename galleries manually:")
@@ -2527,7 +2646,25 @@ def main():
     # public_gallery is deprecated but kept for compatibility
     # All galleries are public now
     
+    # JSON-lines progress goes to stdout (human output moves to stderr) or to a file
+    from src.processing.batch_upload import ProgressWriter
+    progress_stream = None
+    saved_stdout = None
+    if args.progress_format == 'jsonl':
+        if args.progress_file:
+            try:
+                progress_stream = open(args.progress_file, 'a', encoding='utf-8')
+            except OSError as e:
+                debug_print(f"{timestamp()} Cannot open progress file {args.progress_file}: {e}")
+                return 1
+        else:
+            progress_stream = saved_stdout = sys.stdout
+            sys.stdout = sys.stderr
+    progress = ProgressWriter(args.progress_format, progress_stream)
+
     try:
+        startup_start = time.perf_counter()
+        startup_modules = len(sys.modules)
         uploader = ImxToUploader()
         all_results = []
 
@@ -2546,47 +2683,34 @@ def main():
         except Exception as e:
             debug_print(f"{timestamp()} Rename Worker: Error trying to initialize RenameWorker: {e}")
             
-        engine = UploadEngine(uploader, rename_worker)
-
-        # Process multiple galleries
-        for folder_path in expanded_paths:
-            gallery_name = args.name if args.name else None
-
-            try:
-                debug_print(f"{timestamp()} Starting upload: {os.path.basename(folder_path)}")
-                results = engine.run(
-                    folder_path=folder_path,
-                    gallery_name=gallery_name,
-                    thumbnail_size=args.size,
-                    thumbnail_format=args.format,
-                    max_retries=args.max_retries,
-                    parallel_batch_size=args.parallel,
-                    template_name=args.template or "default",
-                )
-
-                # Save artifacts through shared helper
-                try:
-                    save_gallery_artifacts(
-                        folder_path=folder_path,
-                        results=results,
-                        template_name=args.template or "default",
-                    )
-                except Exception as e:
-                    debug_print(f"{timestamp()} WARNING: Artifact save error: {e}")
-
-                all_results.append(results)
+        from src.core.upload_retry import load_retry_policy
+        from src.processing.batch_upload import BatchOptions, BatchUploader, ResumeJournal
+
+        journal = ResumeJournal(args.journal) if args.journal else None
+        batch = BatchUploader(
+            uploader, rename_worker,
+            BatchOptions(
+                thumbnail_size=args.size,
+                thumbnail_format=args.format,
+                max_retries=args.max_retries,
+                parallel=args.parallel,
+                jobs=args.jobs,
+                template_name=args.template or "default",
+                gallery_name=args.name or None,
+            ),
+            progress=progress,
+            journal=journal,
+            retry_policy=load_retry_policy(),
+        )
+        record_phase("create uploader", startup_start, startup_modules)
+        report_startup_profile()
+        summary = batch.run(expanded_paths)
+        all_results = summary.results
+        if summary.interrupted:
+            debug_print(f"{timestamp()} Upload interrupted by user")
+        for failure in summary.failed:
+            debug_print(f"{timestamp()} Error uploading {failure['path']}: {failure['error']}")
 
-            except KeyboardInterrupt:
-                debug_print("{timestamp()} Upload interrupted by user")
-                # Cleanup RenameWorker on interrupt
-                if rename_worker:
-                    rename_worker.stop()
-                    debug_print(f"{timestamp()} Background RenameWorker stopped")
-                break
-            except Exception as e:
-                debug_print(f"{timestamp()} Error uploading {folder_path}: {str(e)}")
-                continue
-        
         # Display summary for all galleries
         if all_results:
             print("\n" + "="*60)
@@ -2639,15 +2763,16 @@ def main():
                 rename_worker.stop()
                 debug_print(f"{timestamp()} Rename Worker: Background worker stopped")
                 
-            return 0  # Success
+            return summary.exit_code
         else:
             # Cleanup RenameWorker
             if rename_worker:
                 rename_worker.stop()
                 debug_print(f"{timestamp()} Background RenameWorker stopped")
                 
-            debug_print("{timestamp()} No galleries were successfully uploaded.")
-            return 1  # No galleries uploaded
+            if not summary.skipped:
+                debug_print(f"{timestamp()} No galleries were successfully uploaded.")
+            return summary.exit_code
             
     except Exception as e:
         # Cleanup RenameWorker on exception
@@ -2659,16 +2784,22 @@ def main():
             pass  # Ignore cleanup errors
         debug_print(f"{timestamp()} ERROR: Rename Worker: Error: {str(e)}")
         return 1  # Error occurred
+    finally:
+        # Close the progress file and give stdout back to the caller
+        if args.progress_file and progress_stream is not None:
+            progress_stream.close()
+        if saved_stdout is not None:
+            sys.stdout = saved_stdout
 
 if __name__ == "__main__":
     try:
-        main()
+        exit_code = main()
     except KeyboardInterrupt:
         log("{timestamp()} KeyboardInterrupt: Exiting gracefully...", level="debug", category="ui")
-        sys.exit(0)
+        sys.exit(130)
     except SystemExit:
-        # Handle argparse errors gracefully
-        pass
+        # argparse usage errors (2) and explicit exits keep their code
+        raise
     except Exception as e:
         # Log crash to file when running with --noconsole (so we can debug it)
         try:
@@ -2684,3 +2815,4 @@ if __name__ == "__main__":
         except Exception:
             pass
         sys.exit(1)
+    sys.exit(exit_code)
@@ -0,0 +1,18 @@
+"""
+Offline benchmark suite for the upload pipeline.
+
+Runs UploadEngine, FileHostClient and RenameWorker end to end against a local
+mock of imx.to and a generic file host (see mock_server), with synthetic image
+corpora and configurable latency, bandwidth caps and error injection. Each
+scenario reports files/s, MB/s, p50/p95 latency, peak RSS and CPU.
+
+Usage:
+    python -m benchmarks                                  # all scenarios
+    python -m benchmarks imx_upload --latency-ms 40 --bandwidth-kbps 20000
+    python -m benchmarks --output results.json
+    python -m benchmarks --compare results.json           # flag regressions vs. an earlier run
+    python -m benchmarks queue_memory --queue-sizes 10000,100000   # RSS of loaded queue history
+
+The suite runs with a throwaway home directory so it never touches the
+user's settings, queue database or stored sessions.
+"""
@@ -0,0 +1,108 @@
+"""
+Command line entry point: python -m benchmarks --help
+"""
+
+import argparse
+import os
+import shutil
+import sys
+import tempfile
+from pathlib import Path
+
+# Project root on the path (bbdrop.py and src/ live there)
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+
+def _isolate_app_data(home: str) -> None:
+    """Point the app's data, settings and cache locations at a scratch directory."""
+    for var in ('HOME', 'USERPROFILE', 'APPDATA', 'LOCALAPPDATA'):
+        os.environ[var] = home
+    os.environ['XDG_CONFIG_HOME'] = os.path.join(home, '.config')
+    os.environ['XDG_DATA_HOME'] = os.path.join(home, '.local', 'share')
+    os.environ['XDG_CACHE_HOME'] = os.path.join(home, '.cache')
+
+
+def main() -> int:
+    from benchmarks.scenarios import ScenarioOptions, scenario_names
+
+    parser = argparse.ArgumentParser(prog="python -m benchmarks",
+                                     description="Offline upload pipeline benchmarks")
+    parser.add_argument('scenarios', nargs='*', metavar='SCENARIO',
+                        help=f"Scenarios to run (default: all): {', '.join(scenario_names())}")
+    corpus = parser.add_argument_group("corpus")
+    corpus.add_argument('--galleries', type=int, default=4)
+    corpus.add_argument('--images', type=int, default=25, help="Images per gallery")
+    corpus.add_argument('--image-size-kb', type=int, default=256)
+    corpus.add_argument('--files', type=int, default=8, help="Files for file host scenarios")
+    corpus.add_argument('--file-size-kb', type=int, default=4096)
+    corpus.add_argument('--fanout-hosts', type=int, default=3, help="Hosts per file in file_host_fanout")
+    corpus.add_argument('--status-urls', type=int, default=5000, help="URLs per status check")
+    corpus.add_argument('--workers', type=int, default=4, help="Concurrent uploads")
+    corpus.add_argument('--ipc-paths', type=int, default=1000, help="Paths sent by single_instance senders")
+    corpus.add_argument('--queue-sizes', default="10000,50000,100000",
+                        help="Comma-separated gallery counts loaded by queue_memory")
+    corpus.add_argument('--seed', type=int, default=0)
+    network = parser.add_argument_group("simulated network")
+    network.add_argument('--latency-ms', type=float, default=0.0)
+    network.add_argument('--jitter-ms', type=float, default=0.0)
+    network.add_argument('--bandwidth-kbps', type=float, default=0.0, help="Upload cap in KiB/s (0 = unlimited)")
+    network.add_argument('--error-rate', type=float, default=0.0, help="Fraction of requests that fail")
+    network.add_argument('--error-mode', choices=['http', 'drop'], default='http')
+    network.add_argument('--offline-rate', type=float, default=0.0, help="Fraction of images reported offline")
+    disk = parser.add_argument_group("throttled disk (imx_upload_prefetch)")
+    disk.add_argument('--disk-seek-ms', type=float, default=8.0, help="Seek time when switching files")
+    disk.add_argument('--disk-mbps', type=float, default=40.0, help="Sequential read rate in MiB/s")
+    output = parser.add_argument_group("results")
+    output.add_argument('--output', '-o', help="Write results JSON to this file")
+    output.add_argument('--compare', help="Compare against an earlier results JSON")
+    output.add_argument('--threshold', type=float, default=0.10, help="Relative change reported as a regression")
+    output.add_argument('--fail-on-regression', action='store_true', help="Exit with status 1 on regressions")
+    args = parser.parse_args()
+    try:
+        queue_sizes = tuple(int(n) for n in args.queue_sizes.split(',') if n.strip())
+    except ValueError:
+        parser.error(f"invalid --queue-sizes: {args.queue_sizes}")
+    unknown = [name for name in args.scenarios if name not in scenario_names()]
+    if unknown:
+        parser.error(f"unknown scenario(s): {', '.join(unknown)}")
+
+    home = tempfile.mkdtemp(prefix="bbdrop_bench_home_")
+    _isolate_app_data(home)
+    try:
+        from benchmarks.mock_server import MockServerConfig
+        from benchmarks.runner import (compare_results, format_comparison, format_results,
+                                       load_results, run_benchmarks, save_results)
+
+        options = ScenarioOptions(
+            galleries=args.galleries, images_per_gallery=args.images, image_size_kb=args.image_size_kb,
+            file_count=args.files, file_size_kb=args.file_size_kb, fanout_hosts=args.fanout_hosts,
+            workers=args.workers,
+            status_check_urls=args.status_urls, ipc_paths=args.ipc_paths, queue_sizes=queue_sizes,
+            disk_seek_ms=args.disk_seek_ms, disk_mb_per_sec=args.disk_mbps,
+            seed=args.seed,
+        )
+        server_config = MockServerConfig(
+            latency_ms=args.latency_ms, jitter_ms=args.jitter_ms, bandwidth_kbps=args.bandwidth_kbps,
+            error_rate=args.error_rate, error_mode=args.error_mode, offline_rate=args.offline_rate,
+            seed=args.seed,
+        )
+        results = run_benchmarks(args.scenarios or scenario_names(), options, server_config)
+        print(format_results(results))
+
+        if args.output:
+            save_results(results, args.output)
+            print(f"\nResults written to {args.output}")
+
+        if args.compare:
+            rows = compare_results(load_results(args.compare), results, args.threshold)
+            print(f"\nComparison with {args.compare} (threshold {args.threshold:.0%}):")
+            print(format_comparison(rows))
+            if args.fail_on_regression and any(r['status'] == 'regressed' for r in rows):
+                return 1
+        return 0
+    finally:
+        shutil.rmtree(home, ignore_errors=True)
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,47 @@
+"""
+Synthetic image corpora for benchmark scenarios.
+"""
+
+import os
+import random
+from pathlib import Path
+from typing import List
+
+# Minimal JPEG markers so files look like images to extension/magic checks
+_JPEG_HEADER = b"\xff\xd8\xff\xe0\x00\x10JFIF\x00\x01\x01\x00\x00\x01\x00\x01\x00\x00"
+_JPEG_TRAILER = b"\xff\xd9"
+
+
+def create_gallery_corpus(root: str, galleries: int, images_per_gallery: int,
+                          size_kb: int, seed: int = 0) -> List[str]:
+    """Create gallery folders filled with fake JPEG files.
+
+    Image sizes vary by +/-25% around size_kb so throughput numbers are not
+    dominated by a single request size.
+
+    Returns:
+        List of gallery folder paths
+    """
+    rng = random.Random(seed)
+    folders = []
+    for g in range(galleries):
+        folder = Path(root) / f"gallery_{g:03d}"
+        folder.mkdir(parents=True, exist_ok=True)
+        for i in range(images_per_gallery):
+            size = max(1, int(size_kb * 1024 * rng.uniform(0.75, 1.25)))
+            payload = os.urandom(max(0, size - len(_JPEG_HEADER) - len(_JPEG_TRAILER)))
+            (folder / f"{i:04d}.jpg").write_bytes(_JPEG_HEADER + payload + _JPEG_TRAILER)
+        folders.append(str(folder))
+    return folders
+
+
+def create_file_corpus(root: str, count: int, size_kb: int) -> List[Path]:
+    """Create archive-sized files for file host scenarios."""
+    directory = Path(root) / "files"
+    directory.mkdir(parents=True, exist_ok=True)
+    files = []
+    for i in range(count):
+        path = directory / f"upload_{i:03d}.zip"
+        path.write_bytes(os.urandom(size_kb * 1024))
+        files.append(path)
+    return files
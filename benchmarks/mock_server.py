@@ -0,0 +1,391 @@
+"""
+Local HTTP server mimicking imx.to and a generic file host.
+
+Endpoints (all on one port):
+    POST /upload.php                imx.to API upload (creates a gallery when create_gallery=true)
+    POST /login.php                 web login (redirects to /user/dashboard)
+    GET  /user/gallery/manage       session check
+    GET  /user/gallery/edit?id=     gallery edit page
+    POST /user/gallery/edit?id=     gallery rename
+    POST /user/moderate             image status check ("Found: N images" + imageallcodes textarea)
+    POST /host/upload               file host, standard style (JSON response with download link)
+    GET  /host/init?name=&size=     file host, multistep style: returns upload URL and ID
+    POST /host/put/<upload_id>      multistep file upload
+    GET  /host/poll/<upload_id>     multistep poll: returns the link once the upload is processed
+
+Network conditions are set with MockServerConfig: fixed + random latency per
+request, a server-wide bandwidth cap for request bodies, and an injected error
+rate (HTTP 500 or dropped connections).
+"""
+
+from __future__ import annotations
+
+import json
+import random
+import string
+import sys
+import threading
+import time
+from dataclasses import dataclass, field
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Dict, Optional, Set, Tuple
+from urllib.parse import parse_qs, urlsplit
+
+READ_CHUNK_SIZE = 64 * 1024
+
+# Bytes of filler HTML emitted per checked image by /user/moderate, to mimic the
+# size of the real response (which lists the codes of every image)
+MODERATE_BYTES_PER_IMAGE = 600
+
+
+@dataclass
+class MockServerConfig:
+    """Network conditions simulated by the mock server."""
+
+    latency_ms: float = 0.0          # Added before every response
+    jitter_ms: float = 0.0           # Uniform random extra latency
+    bandwidth_kbps: float = 0.0      # Server-wide cap on request body bytes (0 = unlimited)
+    error_rate: float = 0.0          # Fraction of requests that fail
+    error_mode: str = "http"         # "http" (500 response) or "drop" (close the connection)
+    offline_rate: float = 0.0        # Fraction of images /user/moderate reports as offline
+    poll_ready_after: int = 1        # Polls before a multistep upload reports its link
+    seed: Optional[int] = None
+
+
+@dataclass
+class MockServerStats:
+    """Counters updated by the request handlers."""
+
+    requests: Dict[str, int] = field(default_factory=dict)
+    errors_injected: int = 0
+    bytes_received: int = 0
+    galleries_created: int = 0
+    renames: int = 0
+
+
+class _Throttle:
+    """Paces reads so all connections together stay under a byte rate."""
+
+    def __init__(self, bytes_per_second: float):
+        self.rate = bytes_per_second
+        self._next_time = 0.0
+        self._lock = threading.Lock()
+
+    def consume(self, nbytes: int) -> None:
+        if self.rate <= 0:
+            return
+        with self._lock:
+            now = time.perf_counter()
+            start = max(now, self._next_time)
+            self._next_time = start + nbytes / self.rate
+            delay = self._next_time - now
+        if delay > 0:
+            time.sleep(delay)
+
+
+class _QuietHTTPServer(ThreadingHTTPServer):
+    """ThreadingHTTPServer that ignores clients dropping connections."""
+
+    def handle_error(self, request, client_address):
+        if not isinstance(sys.exc_info()[1], ConnectionError):
+            super().handle_error(request, client_address)
+
+
+class MockServer:
+    """Threaded mock imx.to / file host server, usable as a context manager.
+
+    Example:
+        with MockServer(MockServerConfig(latency_ms=50, error_rate=0.02)) as server:
+            uploader.upload_url = f"{server.url}/upload.php"
+    """
+
+    def __init__(self, config: Optional[MockServerConfig] = None, host: str = "127.0.0.1", port: int = 0):
+        self.config = config or MockServerConfig()
+        self.stats = MockServerStats()
+        self.galleries: Dict[str, str] = {}       # gallery_id -> name
+        self.images: Set[str] = set()             # uploaded image ids
+        self._polls: Dict[str, int] = {}          # upload_id -> polls remaining
+        self._uploads: Dict[str, str] = {}        # upload_id -> filename
+        self._lock = threading.Lock()
+        self._rng = random.Random(self.config.seed)
+        self._throttle = _Throttle(self.config.bandwidth_kbps * 1024)
+        self._httpd = _QuietHTTPServer((host, port), _make_handler(self))
+        self._httpd.daemon_threads = True
+        self._thread: Optional[threading.Thread] = None
+
+    @property
+    def url(self) -> str:
+        host, port = self._httpd.server_address[:2]
+        return f"http://{host}:{port}"
+
+    def start(self) -> MockServer:
+        self._thread = threading.Thread(target=self._httpd.serve_forever, daemon=True, name="MockServer")
+        self._thread.start()
+        return self
+
+    def stop(self) -> None:
+        self._httpd.shutdown()
+        self._httpd.server_close()
+        if self._thread:
+            self._thread.join(timeout=5)
+
+    def __enter__(self) -> MockServer:
+        return self.start()
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        self.stop()
+
+    # ------------------------------------------------------------------
+    # State helpers (called from handler threads)
+    # ------------------------------------------------------------------
+
+    def _new_id(self, length: int = 8) -> str:
+        with self._lock:
+            return ''.join(self._rng.choices(string.ascii_lowercase + string.digits, k=length))
+
+    def _roll(self, rate: float) -> bool:
+        if rate <= 0:
+            return False
+        with self._lock:
+            return self._rng.random() < rate
+
+    def _delay(self) -> float:
+        jitter = 0.0
+        if self.config.jitter_ms:
+            with self._lock:
+                jitter = self._rng.uniform(0, self.config.jitter_ms)
+        return (self.config.latency_ms + jitter) / 1000.0
+
+    def _count(self, route: str) -> None:
+        with self._lock:
+            self.stats.requests[route] = self.stats.requests.get(route, 0) + 1
+
+
+def _make_handler(server: MockServer):
+    """Build a request handler class bound to a MockServer instance."""
+
+    class Handler(BaseHTTPRequestHandler):
+        protocol_version = "HTTP/1.1"  # keep-alive, and "Expect: 100-continue" for curl uploads
+        disable_nagle_algorithm = True
+
+        def log_message(self, format, *args):
+            pass
+
+        # -- plumbing ---------------------------------------------------
+
+        def _read_body(self) -> bytes:
+            length = int(self.headers.get('Content-Length') or 0)
+            chunks = []
+            remaining = length
+            while remaining > 0:
+                chunk = self.rfile.read(min(READ_CHUNK_SIZE, remaining))
+                if not chunk:
+                    break
+                server._throttle.consume(len(chunk))
+                chunks.append(chunk)
+                remaining -= len(chunk)
+            body = b''.join(chunks)
+            with server._lock:
+                server.stats.bytes_received += len(body)
+            return body
+
+        def _send(self, status: int, body: bytes, content_type: str = "text/html; charset=utf-8",
+                  headers: Optional[Dict[str, str]] = None) -> None:
+            self.send_response(status)
+            self.send_header("Content-Type", content_type)
+            self.send_header("Content-Length", str(len(body)))
+            for name, value in (headers or {}).items():
+                self.send_header(name, value)
+            self.end_headers()
+            self.wfile.write(body)
+
+        def _send_json(self, payload, status: int = 200) -> None:
+            self._send(status, json.dumps(payload).encode(), "application/json")
+
+        def _redirect(self, location: str) -> None:
+            self._send(302, b'', headers={"Location": location})
+
+        def _handle(self, method: str) -> None:
+            parts = urlsplit(self.path)
+            query = {k: v[0] for k, v in parse_qs(parts.query).items()}
+            body = self._read_body() if method == "POST" else b''
+
+            route = f"{method} {_route_name(parts.path)}"
+            server._count(route)
+
+            delay = server._delay()
+            if delay:
+                time.sleep(delay)
+
+            if server._roll(server.config.error_rate):
+                with server._lock:
+                    server.stats.errors_injected += 1
+                if server.config.error_mode == "drop":
+                    self.close_connection = True
+                    self.connection.close()
+                    return
+                self._send(500, b"Internal Server Error (injected)")
+                return
+
+            handler = _ROUTES.get((method, _route_name(parts.path)))
+            if handler is None:
+                self._send(404, b"Not Found")
+                return
+            handler(self, parts.path, query, body)
+
+        def do_GET(self):
+            self._handle("GET")
+
+        def do_POST(self):
+            self._handle("POST")
+
+        # -- imx.to API -------------------------------------------------
+
+        def imx_upload(self, path, query, body):
+            fields, file_size = _parse_multipart(self.headers.get('Content-Type', ''), body)
+            gallery_id = fields.get('gallery_id')
+            if fields.get('create_gallery') == 'true' or not gallery_id:
+                gallery_id = server._new_id()
+                with server._lock:
+                    server.galleries[gallery_id] = ''
+                    server.stats.galleries_created += 1
+            image_id = server._new_id()
+            with server._lock:
+                server.images.add(image_id)
+            self._send_json({
+                'status': 'success',
+                'data': {
+                    'gallery_id': gallery_id,
+                    'image_url': f"https://imx.to/i/{image_id}",
+                    'thumb_url': f"https://imx.to/u/t/{image_id}.jpg",
+                    'original_filename': fields.get('image', ''),
+                    'size': file_size,
+                },
+            })
+
+        # -- imx.to web -------------------------------------------------
+
+        def login(self, path, query, body):
+            self._redirect("/user/dashboard")
+
+        def dashboard(self, path, query, body):
+            self._send(200, b"<html><body>Dashboard</body></html>")
+
+        def gallery_edit(self, path, query, body):
+            gallery_id = query.get('id', '')
+            if self.command == "POST":
+                name = parse_qs(body.decode('utf-8', 'replace')).get('gallery_name', [''])[0]
+                with server._lock:
+                    server.galleries[gallery_id] = name
+                    server.stats.renames += 1
+            self._send(200, (
+                f'<html><body><form method="post" action="/user/gallery/edit?id={gallery_id}">'
+                f'<input name="gallery_name" value="{server.galleries.get(gallery_id, "")}">'
+                '<input type="submit" name="submit_new_gallery" value="Rename Gallery">'
+                '</form></body></html>'
+            ).encode())
+
+        def moderate(self, path, query, body):
+            urls = parse_qs(body.decode('utf-8', 'replace')).get('imagesid', [''])[0].split('\n')
+            urls = [u.strip() for u in urls if u.strip()]
+            online = [u for u in urls if not server._roll(server.config.offline_rate)]
+            filler = "<div class='img'></div>" * (MODERATE_BYTES_PER_IMAGE // 23)
+            page = (
+                "<html><body>"
+                f"<p>Found: {len(online)} images</p>"
+                + filler * len(urls)
+                + '<textarea class="imageallcodes">' + "\n".join(online) + "</textarea>"
+                "</body></html>"
+            )
+            self._send(200, page.encode())
+
+        # -- generic file host --------------------------------------------
+
+        def host_upload(self, path, query, body):
+            fields, file_size = _parse_multipart(self.headers.get('Content-Type', ''), body)
+            file_id = server._new_id(12)
+            self._send_json({
+                'status': 'success',
+                'result': {'file_id': file_id, 'url': f"https://host.example/f/{file_id}", 'size': file_size},
+            })
+
+        def host_init(self, path, query, body):
+            upload_id = server._new_id(12)
+            with server._lock:
+                server._uploads[upload_id] = query.get('name', '')
+                server._polls[upload_id] = max(1, server.config.poll_ready_after)
+            host, port = self.server.server_address[:2]
+            self._send_json({
+                'status': 200,
+                'response': {'upload': {'url': f"http://{host}:{port}/host/put/{upload_id}",
+                                        'upload_id': upload_id, 'state': 0}},
+            })
+
+        def host_put(self, path, query, body):
+            self._send_json({'status': 200, 'response': {'upload': {'state': 1}}})
+
+        def host_poll(self, path, query, body):
+            upload_id = path.rsplit('/', 1)[-1]
+            with server._lock:
+                remaining = server._polls.get(upload_id)
+                if remaining is not None:
+                    server._polls[upload_id] = remaining - 1
+            if remaining is None:
+                self._send_json({'status': 404, 'response': None}, status=404)
+            elif remaining > 1:
+                self._send_json({'status': 200, 'response': {'upload': {'state': 1}}})
+            else:
+                self._send_json({'status': 200, 'response': {'upload': {
+                    'state': 2, 'file': {'url': f"https://host.example/file/{upload_id}"}}}})
+
+    _ROUTES = {
+        ("POST", "/upload.php"): Handler.imx_upload,
+        ("POST", "/login.php"): Handler.login,
+        ("GET", "/user/dashboard"): Handler.dashboard,
+        ("GET", "/user/gallery/manage"): Handler.dashboard,
+        ("GET", "/user/gallery/edit"): Handler.gallery_edit,
+        ("POST", "/user/gallery/edit"): Handler.gallery_edit,
+        ("POST", "/user/moderate"): Handler.moderate,
+        ("POST", "/host/upload"): Handler.host_upload,
+        ("GET", "/host/init"): Handler.host_init,
+        ("POST", "/host/put"): Handler.host_put,
+        ("GET", "/host/poll"): Handler.host_poll,
+    }
+    return Handler
+
+
+def _route_name(path: str) -> str:
+    """Collapse ID path segments (/host/put/<id> -> /host/put)."""
+    for prefix in ("/host/put/", "/host/poll/"):
+        if path.startswith(prefix):
+            return prefix.rstrip('/')
+    return path
+
+
+def _parse_multipart(content_type: str, body: bytes) -> Tuple[Dict[str, str], int]:
+    """Minimal multipart/form-data parser.
+
+    Returns:
+        (text fields, size of the largest file part); file parts map to their filename
+    """
+    fields: Dict[str, str] = {}
+    file_size = 0
+    marker = "boundary="
+    if marker not in content_type:
+        return fields, len(body)
+    boundary = b"--" + content_type.split(marker, 1)[1].split(';')[0].strip().strip('"').encode()
+    for part in body.split(boundary):
+        head, sep, data = part.partition(b"\r\n\r\n")
+        if not sep:
+            continue
+        headers = head.decode('utf-8', 'replace')
+        if 'name="' not in headers:
+            continue
+        name = headers.split('name="', 1)[1].split('"', 1)[0]
+        data = data[:-2] if data.endswith(b"\r\n") else data
+        if 'filename="' in headers:
+            fields[name] = headers.split('filename="', 1)[1].split('"', 1)[0]
+            file_size = max(file_size, len(data))
+        else:
+            fields[name] = data.decode('utf-8', 'replace')
+    return fields, file_size
@@ -0,0 +1,144 @@
+"""
+Run benchmark scenarios and save/compare JSON results.
+"""
+
+from __future__ import annotations
+
+import json
+import platform
+import subprocess
+import tempfile
+import time
+from dataclasses import asdict
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional
+
+from benchmarks.mock_server import MockServer, MockServerConfig
+from benchmarks.scenarios import SCENARIOS, ScenarioOptions
+
+# Metrics compared between runs: name -> True when higher is better
+COMPARED_METRICS = {
+    'ops_per_sec': True,
+    'mb_per_sec': True,
+    'latency_ms.p50': False,
+    'latency_ms.p95': False,
+    'peak_rss_mb': False,
+    'cpu_percent': False,
+}
+
+
+def _git_commit() -> Optional[str]:
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"], capture_output=True, text=True, timeout=5,
+            cwd=Path(__file__).resolve().parent.parent,
+        ).stdout.strip() or None
+    except (OSError, subprocess.SubprocessError):
+        return None
+
+
+def run_benchmarks(names: Iterable[str], options: ScenarioOptions,
+                   server_config: MockServerConfig) -> Dict[str, Any]:
+    """Run scenarios against a fresh mock server each.
+
+    Returns:
+        Results document: run metadata plus one entry per scenario
+    """
+    results: Dict[str, Any] = {
+        'commit': _git_commit(),
+        'timestamp': time.time(),
+        'python': platform.python_version(),
+        'platform': platform.platform(),
+        'options': asdict(options),
+        'server': asdict(server_config),
+        'scenarios': {},
+    }
+    for name in names:
+        with tempfile.TemporaryDirectory(prefix=f"bbdrop_bench_{name}_") as workdir:
+            with MockServer(server_config) as server:
+                result = SCENARIOS[name](server, options, workdir)
+                result.extra['server_requests'] = sum(server.stats.requests.values())
+                result.extra['errors_injected'] = server.stats.errors_injected
+        results['scenarios'][name] = result.to_dict()
+    return results
+
+
+def save_results(results: Dict[str, Any], path: str) -> None:
+    with open(path, 'w', encoding='utf-8') as f:
+        json.dump(results, f, indent=2)
+
+
+def load_results(path: str) -> Dict[str, Any]:
+    with open(path, 'r', encoding='utf-8') as f:
+        return json.load(f)
+
+
+def _metric(entry: Dict[str, Any], key: str) -> Optional[float]:
+    value: Any = entry
+    for part in key.split('.'):
+        if not isinstance(value, dict) or part not in value:
+            return None
+        value = value[part]
+    return float(value) if isinstance(value, (int, float)) else None
+
+
+def compare_results(baseline: Dict[str, Any], current: Dict[str, Any],
+                    threshold: float = 0.10) -> List[Dict[str, Any]]:
+    """Compare scenario metrics between two result documents.
+
+    Args:
+        baseline: Earlier results (e.g. from the previous commit)
+        current: New results
+        threshold: Relative change beyond which a metric counts as regressed/improved
+
+    Returns:
+        One row per scenario/metric present in both: scenario, metric, baseline,
+        current, change (relative) and status ('regressed', 'improved' or 'same')
+    """
+    rows = []
+    for name, entry in current.get('scenarios', {}).items():
+        base_entry = baseline.get('scenarios', {}).get(name)
+        if not base_entry:
+            continue
+        for metric, higher_is_better in COMPARED_METRICS.items():
+            old, new = _metric(base_entry, metric), _metric(entry, metric)
+            if old is None or new is None:
+                continue
+            change = (new - old) / old if old else 0.0
+            better = change > 0 if higher_is_better else change < 0
+            status = 'same'
+            if abs(change) > threshold:
+                status = 'improved' if better else 'regressed'
+            rows.append({
+                'scenario': name, 'metric': metric, 'baseline': old, 'current': new,
+                'change': change, 'status': status,
+            })
+    return rows
+
+
+def format_results(results: Dict[str, Any]) -> str:
+    """Render scenario results as a text table."""
+    lines = [
+        f"{'Scenario':<22}{'ops':>7}{'fail':>6}{'ops/s':>9}{'MB/s':>9}"
+        f"{'p50 ms':>10}{'p95 ms':>10}{'RSS MB':>9}{'CPU %':>8}",
+        "=" * 90,
+    ]
+    for name, r in results['scenarios'].items():
+        lines.append(
+            f"{name:<22}{r['operations']:>7}{r['failed']:>6}{r['ops_per_sec']:>9.2f}{r['mb_per_sec']:>9.2f}"
+            f"{r['latency_ms']['p50']:>10.1f}{r['latency_ms']['p95']:>10.1f}"
+            f"{r['peak_rss_mb']:>9.1f}{r['cpu_percent']:>8.1f}"
+        )
+    return "\n".join(lines)
+
+
+def format_comparison(rows: List[Dict[str, Any]]) -> str:
+    """Render compare_results() rows as a text table."""
+    marks = {'regressed': '✗', 'improved': '✓', 'same': ' '}
+    lines = [f"  {'Scenario':<22}{'Metric':<16}{'Baseline':>12}{'Current':>12}{'Change':>9}", "=" * 73]
+    for row in rows:
+        lines.append(
+            f"{marks[row['status']]} {row['scenario']:<22}{row['metric']:<16}"
+            f"{row['baseline']:>12.2f}{row['current']:>12.2f}{row['change'] * 100:>8.1f}%"
+        )
+    return "\n".join(lines)
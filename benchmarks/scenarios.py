@@ -0,0 +1,569 @@
+"""
+Benchmark scenarios driving the real upload components against MockServer.
+
+Each scenario takes the running server, a ScenarioOptions and a scratch
+directory, and returns a ScenarioResult.
+"""
+
+from __future__ import annotations
+
+import builtins
+import os
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from typing import Callable, Dict, List, Tuple
+
+from benchmarks.corpus import create_file_corpus, create_gallery_corpus
+from benchmarks.mock_server import MockServer
+from benchmarks.stats import LatencyRecorder, ResourceMonitor, ScenarioResult
+
+
+@dataclass
+class ScenarioOptions:
+    """Corpus size and client concurrency shared by all scenarios."""
+
+    galleries: int = 4
+    images_per_gallery: int = 25
+    image_size_kb: int = 256
+    file_count: int = 8
+    file_size_kb: int = 4096
+    fanout_hosts: int = 3
+    workers: int = 4
+    status_check_urls: int = 5000
+    ipc_paths: int = 1000
+    queue_sizes: Tuple[int, ...] = (10_000, 50_000, 100_000)
+    disk_seek_ms: float = 8.0
+    disk_mb_per_sec: float = 40.0
+    seed: int = 0
+
+
+def _make_uploader(server: MockServer):
+    """ImxToUploader pointed at the mock API."""
+    os.environ['BBDROP_GUI_MODE'] = '1'  # no stored credentials must not exit
+    from bbdrop import ImxToUploader
+    uploader = ImxToUploader()
+    uploader.base_url = server.url
+    uploader.web_url = server.url
+    uploader.upload_url = f"{server.url}/upload.php"
+    return uploader
+
+
+def _make_rename_worker(server: MockServer):
+    from src.processing.rename_worker import RenameWorker
+    return RenameWorker(web_url=server.url, authenticate=False)
+
+
+def _wait_for_queue(rename_worker, timeout: float = 60.0) -> None:
+    deadline = time.monotonic() + timeout
+    while rename_worker.queue.unfinished_tasks and time.monotonic() < deadline:
+        time.sleep(0.01)
+
+
+def imx_upload(server: MockServer, options: ScenarioOptions, workdir: str) -> ScenarioResult:
+    """Upload galleries with UploadEngine; galleries are renamed by RenameWorker."""
+    from src.core.engine import UploadEngine
+
+    folders = create_gallery_corpus(os.path.join(workdir, "imx"), options.galleries,
+                                    options.images_per_gallery, options.image_size_kb, options.seed)
+    uploader = _make_uploader(server)
+    rename_worker = _make_rename_worker(server)
+    engine = UploadEngine(uploader, rename_worker)
+    recorder = LatencyRecorder()
+    ttfb = LatencyRecorder()
+
+    def on_timing(filename: str, seconds: float, size: int, first_byte) -> None:
+        recorder.record(seconds, size)
+        if first_byte is not None:
+            ttfb.record(first_byte)
+
+    try:
+        with ResourceMonitor() as monitor:
+            for folder in folders:
+                result = engine.run(
+                    folder_path=folder,
+                    gallery_name=os.path.basename(folder),
+                    thumbnail_size=3,
+                    thumbnail_format=2,
+                    max_retries=3,
+                    parallel_batch_size=options.workers,
+                    template_name="default",
+                    on_image_timing=on_timing,
+                )
+                recorder.failed += result.get('failed_count', 0)
+            _wait_for_queue(rename_worker)
+    finally:
+        rename_worker.stop(timeout=2.0)
+
+    return ScenarioResult.from_measurements(
+        "imx_upload", recorder, monitor,
+        galleries=len(folders),
+        renamed=server.stats.renames,
+        ttfb_p50_ms=round(ttfb.histogram.percentile(50) * 1000, 3),
+    )
+
+
+class _ThrottledDisk:
+    """Stand-in for a slow rotational disk (USB HDD, SMB share) under a directory.
+
+    While active, binary reads of files under root go through one simulated
+    disk head: reads are serialized, paced to mb_per_sec in 256 KiB pieces,
+    and pay seek_ms whenever the head switches to a different file. Threads
+    reading different files at once therefore pay a seek per piece.
+    """
+
+    PIECE = 256 * 1024
+
+    def __init__(self, root: str, seek_ms: float, mb_per_sec: float):
+        self.root = os.path.abspath(root) + os.sep
+        self.seek = seek_ms / 1000
+        self.bytes_per_sec = mb_per_sec * 1024 * 1024
+        self.seeks = 0
+        self._head = None
+        self._lock = threading.Lock()
+        self._open = builtins.open
+
+    def __enter__(self) -> "_ThrottledDisk":
+        disk = self
+
+        class ThrottledFile:
+            def __init__(self, f, path):
+                self._f = f
+                self._path = path
+
+            def read(self, size: int = -1) -> bytes:
+                parts = []
+                while size < 0 or size > 0:
+                    piece = disk._read(self._f, self._path, disk.PIECE if size < 0 else min(size, disk.PIECE))
+                    if not piece:
+                        break
+                    parts.append(piece)
+                    if size > 0:
+                        size -= len(piece)
+                return b"".join(parts)
+
+            def __getattr__(self, name):
+                return getattr(self._f, name)
+
+            def __enter__(self):
+                return self
+
+            def __exit__(self, *exc):
+                self._f.close()
+
+        def throttled_open(file, mode='r', *args, **kwargs):
+            f = disk._open(file, mode, *args, **kwargs)
+            path = os.path.abspath(file) if isinstance(file, (str, os.PathLike)) else None
+            if path and 'b' in mode and 'r' in mode and path.startswith(disk.root):
+                return ThrottledFile(f, path)
+            return f
+
+        builtins.open = throttled_open
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        builtins.open = self._open
+
+    def _read(self, f, path: str, size: int) -> bytes:
+        with self._lock:
+            data = f.read(size)
+            cost = len(data) / self.bytes_per_sec
+            if data and self._head != path:
+                self._head = path
+                self.seeks += 1
+                cost += self.seek
+            time.sleep(cost)
+            return data
+
+
+def imx_upload_prefetch(server: MockServer, options: ScenarioOptions, workdir: str) -> ScenarioResult:
+    """Upload galleries from a throttled disk stand-in, without and with image read-ahead.
+
+    The direct pass lets every upload thread read its own image (prefetch
+    disabled); the prefetch pass uses UploadEngine's ImagePrefetcher. Both
+    passes read through _ThrottledDisk; latency and throughput are for the
+    prefetch pass, both passes' MiB/s and disk seeks are reported in extra.
+    """
+    from src.core.engine import UploadEngine
+    from src.core.image_prefetch import DEFAULT_PREFETCH_DEPTH
+
+    folders = create_gallery_corpus(os.path.join(workdir, "imx_prefetch"), options.galleries,
+                                    options.images_per_gallery, options.image_size_kb, options.seed)
+    uploader = _make_uploader(server)
+
+    def upload_all(prefetch_depth: int) -> Tuple[LatencyRecorder, ResourceMonitor, int]:
+        engine = UploadEngine(uploader, prefetch_depth=prefetch_depth)
+        recorder = LatencyRecorder()
+        with _ThrottledDisk(workdir, options.disk_seek_ms, options.disk_mb_per_sec) as disk, \
+                ResourceMonitor() as monitor:
+            for folder in folders:
+                result = engine.run(
+                    folder_path=folder,
+                    gallery_name=os.path.basename(folder),
+                    thumbnail_size=3,
+                    thumbnail_format=2,
+                    max_retries=3,
+                    parallel_batch_size=options.workers,
+                    template_name="default",
+                    on_image_timing=lambda name, seconds, size, first_byte: recorder.record(seconds, size),
+                )
+                recorder.failed += result.get('failed_count', 0)
+        return recorder, monitor, disk.seeks
+
+    def mib_per_sec(recorder: LatencyRecorder, monitor: ResourceMonitor) -> float:
+        return round(recorder.bytes / max(monitor.wall_seconds, 1e-9) / (1024 * 1024), 2)
+
+    direct, direct_monitor, direct_seeks = upload_all(0)
+    recorder, monitor, seeks = upload_all(DEFAULT_PREFETCH_DEPTH)
+    direct_rate = mib_per_sec(direct, direct_monitor)
+    prefetch_rate = mib_per_sec(recorder, monitor)
+
+    return ScenarioResult.from_measurements(
+        "imx_upload_prefetch", recorder, monitor,
+        galleries=len(folders),
+        direct_mib_per_sec=direct_rate, prefetch_mib_per_sec=prefetch_rate,
+        speedup=round(prefetch_rate / direct_rate, 2) if direct_rate else None,
+        direct_seeks=direct_seeks, prefetch_seeks=seeks,
+    )
+
+
+def _host_config(server: MockServer, multistep: bool):
+    from src.core.file_host_config import HostConfig
+    if multistep:
+        return HostConfig(
+            name="Mock Multistep",
+            upload_init_url=f"{server.url}/host/init?name={{filename}}&size={{size}}",
+            upload_url_path=["response", "upload", "url"],
+            upload_id_path=["response", "upload", "upload_id"],
+            upload_poll_url=f"{server.url}/host/poll/{{upload_id}}",
+            upload_poll_delay=0.05,
+            upload_poll_retries=20,
+            link_path=["response", "upload", "file", "url"],
+        )
+    return HostConfig(
+        name="Mock Standard",
+        upload_endpoint=f"{server.url}/host/upload",
+        file_field="file",
+        link_path=["result", "url"],
+        file_id_path=["result", "file_id"],
+    )
+
+
+def _file_host_upload(name: str, multistep: bool, server: MockServer, options: ScenarioOptions,
+                      workdir: str) -> ScenarioResult:
+    from src.core.engine import AtomicCounter
+    from src.network.file_host_client import FileHostClient
+
+    files = create_file_corpus(os.path.join(workdir, name), options.file_count, options.file_size_kb)
+    config = _host_config(server, multistep)
+    counter = AtomicCounter()
+    recorder = LatencyRecorder()
+
+    def upload(path) -> None:
+        client = FileHostClient(config, counter)
+        start = time.perf_counter()
+        try:
+            result = client.upload_file(path)
+            recorder.record(time.perf_counter() - start, path.stat().st_size, ok=bool(result.get('url')))
+        except Exception:
+            recorder.record(time.perf_counter() - start, ok=False)
+
+    with ResourceMonitor() as monitor:
+        with ThreadPoolExecutor(max_workers=options.workers) as pool:
+            list(pool.map(upload, files))
+
+    return ScenarioResult.from_measurements(name, recorder, monitor, files=len(files))
+
+
+def file_host_standard(server: MockServer, options: ScenarioOptions, workdir: str) -> ScenarioResult:
+    """Single-request multipart uploads through FileHostClient."""
+    return _file_host_upload("file_host_standard", False, server, options, workdir)
+
+
+def file_host_multistep(server: MockServer, options: ScenarioOptions, workdir: str) -> ScenarioResult:
+    """Init -> upload -> poll uploads through FileHostClient."""
+    return _file_host_upload("file_host_multistep", True, server, options, workdir)
+
+
+def file_host_fanout(server: MockServer, options: ScenarioOptions, workdir: str) -> ScenarioResult:
+    """Each file to options.fanout_hosts hosts at once, with and without a shared ZIP read.
+
+    The independent pass gives every host its own reader (as without fan-out);
+    the shared pass goes through ZipFanOutRegistry. Disk bytes read by each
+    pass are reported in extra; latency and throughput are for the shared pass.
+    """
+    from src.core.engine import AtomicCounter
+    from src.network.file_host_client import FileHostClient
+    from src.processing.zip_fanout import ZipFanOutRegistry, ZipStream
+
+    files = create_file_corpus(os.path.join(workdir, "file_host_fanout"), options.file_count, options.file_size_kb)
+    config = _host_config(server, False)
+    hosts = [f"host{i}" for i in range(max(2, options.fanout_hosts))]
+    recorder = LatencyRecorder()
+
+    def upload(path, stream) -> bool:
+        client = FileHostClient(config, AtomicCounter())
+        start = time.perf_counter()
+        try:
+            ok = bool(client.upload_file(path, source=stream).get('url'))
+            recorder.record(time.perf_counter() - start, path.stat().st_size, ok=ok)
+            return ok
+        except Exception:
+            recorder.record(time.perf_counter() - start, ok=False)
+            return False
+        finally:
+            stream.close()
+
+    def upload_all(open_stream) -> int:
+        streams = []
+        with ThreadPoolExecutor(max_workers=len(hosts)) as pool:
+            for db_id, path in enumerate(files):
+                batch = [open_stream(db_id, host, path) for host in hosts]
+                streams.extend(batch)
+                list(pool.map(upload, [path] * len(hosts), batch))
+        return sum(stream.own_bytes for stream in streams)
+
+    independent_read = upload_all(lambda db_id, host, path: ZipStream(path, host))
+
+    recorder = LatencyRecorder()
+    registry = ZipFanOutRegistry(chunk_size=256 * 1024, join_window=1.0)
+    sessions = []
+
+    def open_shared(db_id, host, path):
+        stream = registry.open_stream(db_id, host, path, hosts)
+        if registry.session(db_id) not in sessions:
+            sessions.append(registry.session(db_id))
+        return stream
+
+    with ResourceMonitor() as monitor:
+        own_read = upload_all(open_shared)
+    shared_read = sum(session.shared_bytes_read for session in sessions) + own_read
+
+    return ScenarioResult.from_measurements(
+        "file_host_fanout", recorder, monitor, files=len(files), hosts=len(hosts),
+        independent_bytes_read=independent_read, shared_bytes_read=shared_read,
+        read_ratio=round(shared_read / independent_read, 3) if independent_read else None,
+    )
+
+
+def rename(server: MockServer, options: ScenarioOptions, workdir: str) -> ScenarioResult:
+    """Gallery renames over the RenameWorker web session."""
+    rename_worker = _make_rename_worker(server)
+    recorder = LatencyRecorder()
+    count = options.galleries * 10
+    try:
+        with ResourceMonitor() as monitor:
+            for i in range(count):
+                start = time.perf_counter()
+                ok = rename_worker.rename_gallery_with_session(f"g{i:05d}", f"Benchmark Gallery {i}")
+                recorder.record(time.perf_counter() - start, ok=ok)
+    finally:
+        rename_worker.stop(timeout=2.0)
+    return ScenarioResult.from_measurements("rename", recorder, monitor)
+
+
+def status_check(server: MockServer, options: ScenarioOptions, workdir: str) -> ScenarioResult:
+    """Image status checks via /user/moderate (streamed, with early exit when all are online)."""
+    rename_worker = _make_rename_worker(server)
+    per_gallery = max(1, options.status_check_urls // max(1, options.galleries))
+    galleries_data = [
+        {
+            'db_id': g,
+            'path': f"/bench/gallery_{g:03d}",
+            'name': f"gallery_{g:03d}",
+            'image_urls': [f"https://imx.to/i/{g:03d}x{i:05d}" for i in range(per_gallery)],
+        }
+        for g in range(options.galleries)
+    ]
+    total_urls = per_gallery * len(galleries_data)
+    recorder = LatencyRecorder()
+    online = 0
+    try:
+        with ResourceMonitor() as monitor:
+            for _ in range(3):
+                start = time.perf_counter()
+                try:
+                    results = rename_worker._perform_status_check(galleries_data)
+                    online = sum(r['online'] for r in results.values())
+                    recorder.record(time.perf_counter() - start, ok=bool(results))
+                except Exception:
+                    recorder.record(time.perf_counter() - start, ok=False)
+    finally:
+        rename_worker.stop(timeout=2.0)
+    return ScenarioResult.from_measurements("status_check", recorder, monitor,
+                                            urls=total_urls, online=online)
+
+
+def _free_port_pair() -> int:
+    """A localhost port p with p + 1 also free (single-instance server + batch collector)."""
+    import socket
+    for _ in range(50):
+        with socket.socket() as first:
+            first.bind(('localhost', 0))
+            port = first.getsockname()[1]
+            try:
+                with socket.socket() as second:
+                    second.bind(('localhost', port + 1))
+                    return port
+            except OSError:
+                continue
+    raise RuntimeError("No free port pair")
+
+
+def single_instance(server: MockServer, options: ScenarioOptions, workdir: str) -> ScenarioResult:
+    """Paths handed to a running GUI by one process per path (Explorer "send to").
+
+    Senders run as threads; the mock server is not used.
+    """
+    import threading
+    from PyQt6.QtCore import Qt
+    from src.network.client import SingleInstanceServer
+    from src.network.single_instance import forward_to_running_instance
+
+    port = _free_port_pair()
+    received: List[str] = []
+    messages = [0]
+    all_received = threading.Event()
+
+    def on_paths(paths, opts) -> None:
+        messages[0] += 1
+        received.extend(paths)
+        if len(received) >= options.ipc_paths:
+            all_received.set()
+
+    ipc_server = SingleInstanceServer(port=port)
+    ipc_server.paths_received.connect(on_paths, Qt.ConnectionType.DirectConnection)
+    server_thread = threading.Thread(target=ipc_server.run, daemon=True)
+    server_thread.start()
+    time.sleep(0.2)
+
+    recorder = LatencyRecorder()
+
+    def send(i: int) -> None:
+        start = time.perf_counter()
+        ok, _ = forward_to_running_instance([os.path.join(workdir, f"folder_{i:05d}")], port=port)
+        recorder.record(time.perf_counter() - start, ok=ok)
+
+    try:
+        with ResourceMonitor() as monitor:
+            start = time.perf_counter()
+            threads = [threading.Thread(target=send, args=(i,)) for i in range(options.ipc_paths)]
+            for t in threads:
+                t.start()
+            all_received.wait(timeout=30)
+            elapsed = time.perf_counter() - start
+            for t in threads:
+                t.join()
+    finally:
+        ipc_server.running = False
+        server_thread.join(timeout=3)
+
+    return ScenarioResult.from_measurements(
+        "single_instance", recorder, monitor,
+        paths=options.ipc_paths, received=len(set(received)),
+        gui_messages=messages[0], all_received_sec=round(elapsed, 3),
+    )
+
+
+
+# Run in a fresh interpreter per queue size so RSS reflects one load only
+_QUEUE_MEMORY_PROBE = """
+import gc, json, time
+import psutil
+from PyQt6.QtCore import QCoreApplication
+from src.storage.queue_manager import QueueManager
+app = QCoreApplication([])
+gc.collect()
+process = psutil.Process()
+before = process.memory_info().rss
+start = time.perf_counter()
+manager = QueueManager()
+seconds = time.perf_counter() - start
+gc.collect()
+after = process.memory_info().rss
+print("QUEUE_MEMORY " + json.dumps({'items': len(manager.items), 'seconds': seconds, 'rss': after - before}))
+manager.shutdown()
+"""
+
+
+def _add_history(store, start: int, stop: int) -> None:
+    """Completed galleries as they accumulate in a long-lived queue."""
+    now = int(time.time())
+    store.bulk_upsert({
+        'path': f"/bench/history/gallery_{i:06d}",
+        'name': f"gallery_{i:06d}",
+        'status': 'completed',
+        'added_time': now - i,
+        'finished_time': now - i,
+        'template_name': 'default',
+        'tab_name': 'Main',
+        'total_images': 50,
+        'uploaded_images': 50,
+        'total_size': 50 * 1024 * 1024,
+        'scan_complete': True,
+        'gallery_id': f"g{i:06d}",
+        'gallery_url': f"https://imx.to/g/g{i:06d}",
+        'insertion_order': i,
+    } for i in range(start, stop))
+
+
+def queue_memory(server: MockServer, options: ScenarioOptions, workdir: str) -> ScenarioResult:
+    """RSS of a QueueManager loading queue histories of each size in options.queue_sizes.
+
+    Galleries go into the (isolated) app database, then a separate process per
+    size builds QueueManager, which loads them through QueueStore.load_all_items.
+    The mock server is not used.
+    """
+    import json
+    import subprocess
+    import sys
+    from pathlib import Path
+    from src.storage.database import QueueStore
+
+    store = QueueStore()
+    recorder = LatencyRecorder()
+    per_size: Dict[str, Dict[str, float]] = {}
+    loaded = 0
+    try:
+        with ResourceMonitor() as monitor:
+            for size in sorted(options.queue_sizes):
+                _add_history(store, loaded, size)
+                loaded = size
+                proc = subprocess.run(
+                    [sys.executable, "-c", _QUEUE_MEMORY_PROBE],
+                    cwd=Path(__file__).resolve().parent.parent,
+                    capture_output=True, text=True, timeout=600,
+                    env=dict(os.environ, QT_QPA_PLATFORM='offscreen'),
+                )
+                lines = [line for line in proc.stdout.splitlines() if line.startswith("QUEUE_MEMORY ")]
+                if proc.returncode != 0 or not lines:
+                    recorder.record(0.0, ok=False)
+                    continue
+                probe = json.loads(lines[-1][len("QUEUE_MEMORY "):])
+                recorder.record(probe['seconds'])
+                per_size[str(size)] = {
+                    'items': probe['items'],
+                    'load_sec': round(probe['seconds'], 3),
+                    'rss_mb': round(probe['rss'] / (1024 * 1024), 1),
+                    'bytes_per_gallery': round(probe['rss'] / max(1, probe['items'])),
+                }
+    finally:
+        store._executor.shutdown(wait=True)
+    return ScenarioResult.from_measurements("queue_memory", recorder, monitor, sizes=per_size)
+
+SCENARIOS: Dict[str, Callable[[MockServer, ScenarioOptions, str], ScenarioResult]] = {
+    'imx_upload': imx_upload,
+    'imx_upload_prefetch': imx_upload_prefetch,
+    'file_host_standard': file_host_standard,
+    'file_host_multistep': file_host_multistep,
+    'file_host_fanout': file_host_fanout,
+    'rename': rename,
+    'status_check': status_check,
+    'single_instance': single_instance,
+    'queue_memory': queue_memory,
+}
+
+
+def scenario_names() -> List[str]:
+    return list(SCENARIOS)
@@ -0,0 +1,129 @@
+"""
+Measurement helpers for benchmark scenarios: per-operation latency,
+throughput and process resource usage (peak RSS, CPU).
+"""
+
+from __future__ import annotations
+
+import threading
+import time
+from dataclasses import asdict, dataclass, field
+from typing import Any, Dict, Optional
+
+import psutil
+
+from src.utils.latency_histogram import LogHistogram
+
+REPORTED_PERCENTILES = (50, 95, 99)
+
+
+class ResourceMonitor:
+    """Samples this process's RSS and CPU time in a background thread."""
+
+    def __init__(self, interval: float = 0.05):
+        self.interval = interval
+        self.peak_rss = 0
+        self._process = psutil.Process()
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+        self._cpu_start = 0.0
+        self._wall_start = 0.0
+        self.cpu_seconds = 0.0
+        self.wall_seconds = 0.0
+
+    def _sample(self) -> None:
+        try:
+            self.peak_rss = max(self.peak_rss, self._process.memory_info().rss)
+        except psutil.Error:
+            pass
+
+    def _run(self) -> None:
+        while not self._stop.wait(self.interval):
+            self._sample()
+
+    def _cpu_time(self) -> float:
+        times = self._process.cpu_times()
+        return times.user + times.system
+
+    def __enter__(self) -> ResourceMonitor:
+        self._sample()
+        self._cpu_start = self._cpu_time()
+        self._wall_start = time.perf_counter()
+        self._thread = threading.Thread(target=self._run, daemon=True, name="ResourceMonitor")
+        self._thread.start()
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        self._stop.set()
+        if self._thread:
+            self._thread.join()
+        self._sample()
+        self.wall_seconds = time.perf_counter() - self._wall_start
+        self.cpu_seconds = self._cpu_time() - self._cpu_start
+
+    @property
+    def cpu_percent(self) -> float:
+        """Average CPU use over the run (100 = one core fully busy)."""
+        return 100.0 * self.cpu_seconds / self.wall_seconds if self.wall_seconds else 0.0
+
+
+class LatencyRecorder:
+    """Thread-safe collection of per-operation latencies and outcomes."""
+
+    def __init__(self):
+        self.histogram = LogHistogram()
+        self.ok = 0
+        self.failed = 0
+        self.bytes = 0
+        self._lock = threading.Lock()
+
+    def record(self, seconds: float, nbytes: int = 0, ok: bool = True) -> None:
+        with self._lock:
+            if ok:
+                self.histogram.record(seconds)
+                self.ok += 1
+                self.bytes += nbytes
+            else:
+                self.failed += 1
+
+
+@dataclass
+class ScenarioResult:
+    """Outcome of one scenario run, serialized into the results JSON."""
+
+    name: str
+    operations: int
+    failed: int
+    bytes: int
+    wall_seconds: float
+    ops_per_sec: float
+    mb_per_sec: float
+    latency_ms: Dict[str, float]
+    peak_rss_mb: float
+    cpu_percent: float
+    extra: Dict[str, Any] = field(default_factory=dict)
+
+    @classmethod
+    def from_measurements(cls, name: str, recorder: LatencyRecorder, monitor: ResourceMonitor,
+                          **extra: Any) -> ScenarioResult:
+        wall = monitor.wall_seconds or 1e-9
+        hist = recorder.histogram
+        latency = {f"p{p}": round(hist.percentile(p) * 1000, 3) for p in REPORTED_PERCENTILES}
+        latency['mean'] = round(hist.mean * 1000, 3)
+        latency['max'] = round((hist.max or 0.0) * 1000, 3)
+        return cls(
+            name=name,
+            operations=recorder.ok,
+            failed=recorder.failed,
+            bytes=recorder.bytes,
+            wall_seconds=round(wall, 4),
+            ops_per_sec=round(recorder.ok / wall, 3),
+            mb_per_sec=round(recorder.bytes / wall / (1024 * 1024), 3),
+            latency_ms=latency,
+            peak_rss_mb=round(monitor.peak_rss / (1024 * 1024), 1),
+            cpu_percent=round(monitor.cpu_percent, 1),
+            extra=extra,
+        )
+
+    def to_dict(self) -> Dict[str, Any]:
+        return asdict(self)
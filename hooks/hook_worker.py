@@ -0,0 +1,96 @@
+#!/usr/bin/env python3
+"""
+Persistent mode for Python hooks.
+
+With "Keep hook running between galleries" enabled, imxup starts the hook
+once with --persistent and sends it one job per line on stdin instead of
+starting it for every gallery. A hook supports this by ending with:
+
+    if __name__ == "__main__":
+        if PERSISTENT_FLAG in sys.argv[1:]:
+            serve(main)
+        else:
+            main()
+
+Each job sets sys.argv to the arguments of a one-shot run and calls main().
+Whatever main() prints to stdout is sent back as the job's output (so the
+JSON mapping to ext1-4 works as usual), stderr goes to the imxup log, and
+sys.exit() inside main() ends only the job, not the worker. Module-level
+state (logins, HTTP sessions) survives between jobs.
+
+Protocol, one JSON object per line:
+    job:    {"id": 3, "argv": ["muh.py", "gofile", "/tmp/g.zip"], "context": {...}}
+    reply:  {"id": 3, "exit_code": 0, "output": "..."}
+    ping:   {"id": 4, "ping": true}
+    reply:  {"id": 4, "pong": true}
+"""
+
+import contextlib
+import io
+import json
+import sys
+import traceback
+from typing import Any, Callable, Dict
+
+PERSISTENT_FLAG = "--persistent"
+
+# Context of the job being run ({"gallery_name": ..., "gallery_path": ...})
+current_context: Dict[str, Any] = {}
+
+
+def _send(stream, message: Dict[str, Any]) -> None:
+    stream.write(json.dumps(message) + "\n")
+    stream.flush()
+
+
+def _exit_code(exc: SystemExit) -> int:
+    if exc.code is None:
+        return 0
+    if isinstance(exc.code, int):
+        return exc.code
+    print(exc.code, file=sys.stderr)
+    return 1
+
+
+def run_job(main: Callable[[], Any], message: Dict[str, Any]) -> Dict[str, Any]:
+    """Run main() for one job message and build the reply."""
+    global current_context
+    saved_argv = sys.argv
+    sys.argv = [str(arg) for arg in message.get("argv") or []]
+    current_context = message.get("context") or {}
+    output = io.StringIO()
+    reply: Dict[str, Any] = {"id": message.get("id"), "exit_code": 0}
+    try:
+        with contextlib.redirect_stdout(output):
+            main()
+    except SystemExit as e:
+        reply["exit_code"] = _exit_code(e)
+    except Exception as e:
+        traceback.print_exc(file=sys.stderr)
+        reply["exit_code"] = 1
+        reply["error"] = str(e)
+    finally:
+        sys.argv = saved_argv
+        current_context = {}
+    reply["output"] = output.getvalue()
+    return reply
+
+
+def serve(main: Callable[[], Any]) -> None:
+    """Run main() once per job read from stdin until stdin is closed."""
+    protocol_out = sys.stdout
+    for line in sys.stdin:
+        line = line.strip()
+        if not line:
+            continue
+        try:
+            message = json.loads(line)
+        except ValueError:
+            print(f"hook_worker: ignoring malformed job: {line[:200]}", file=sys.stderr)
+            continue
+        if not isinstance(message, dict):
+            continue
+        if message.get("ping"):
+            _send(protocol_out, {"id": message.get("id"), "pong": True})
+            continue
+        _send(protocol_out, run_job(main, message))
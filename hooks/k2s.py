@@ -19,6 +19,9 @@ map to ext1-4 fields in imxup's External Apps JSON mapping dialog.
 For imxup External Apps integration:
   Command: python "path/to/upload_multi_host.py" "%p" --service k2s --api-key YOUR_KEY
   Then use "Map JSON Keys..." to choose which fields to use
+
+With "Keep hook running between galleries" enabled, imxup starts this script
+once (--persistent, see hook_worker.py) and the HTTP session is reused.
 """
 
 import sys
@@ -47,6 +50,19 @@ SERVICES = {
 }
 
 
+# HTTP sessions by (service, access token); reused between jobs in persistent mode
+_SESSIONS = {}
+
+
+def get_session(service_key, api_key):
+    """Return the HTTP session for a service, keeping connections open between jobs"""
+    session = _SESSIONS.get((service_key, api_key))
+    if session is None:
+        session = requests.Session()
+        _SESSIONS[(service_key, api_key)] = session
+    return session
+
+
 def get_service_config(service_identifier):
     """
     Get service configuration by identifier (k2s, tez, fb, or full name)
@@ -209,7 +225,7 @@ def main():
     print(f"File: {file_path.name} ({file_path.stat().st_size / 1024 / 1024:.2f} MB)", file=sys.stderr)
     print("=" * 50, file=sys.stderr)
 
-    session = requests.Session()
+    session = get_session(service_key, args.api_key)
 
     # Step 1: Get upload form data
     print(f"Getting upload form data for: {file_path.name}", file=sys.stderr)
@@ -235,4 +251,8 @@ def main():
     print(f"[{service_name}] Finished uploading '{file_path.name}' ({file_path.stat().st_size / 1024 / 1024:.2f} MB) to {service_name}", file=sys.stderr)
 
 if __name__ == "__main__":
-    main()
+    if "--persistent" in sys.argv[1:]:
+        from hook_worker import serve
+        serve(main)
+    else:
+        main()
@@ -4,7 +4,7 @@ Multi-host file uploader inspired by PolyUploader
 Supports multiple file hosting services with minimal code
 
 Usage:
-    python muh.py <host> <file> [api_key]
+    python muh.py <host>[,<host>...] <file> [api_key[,api_key...]]
 
 Examples:
     python muh.py gofile test.jpg
@@ -12,6 +12,12 @@ Examples:
     python muh.py litterbox test.jpg 24h
     python muh.py filedot test.jpg username:password
     python muh.py rapidgator test.jpg username:password
+    python muh.py gofile,pixeldrain,catbox test.zip ",your_pixeldrain_key,"
+
+Several hosts are uploaded to in parallel. The file is read once and shared
+through a bounded buffer, each host has its own pooled HTTP session, and
+failed uploads are retried per host with exponential backoff. Credentials
+for several hosts are given comma-separated in host order.
 
 For imxup integration:
     Upload gallery folder: python "path/to/muh.py" gofile "%p"
@@ -25,6 +31,10 @@ For imxup integration:
     - %s: Size in bytes           - %b: BBCode path (completed only)
     - %t: Template name           - %z: ZIP path (auto-created if needed)
 
+    Persistent mode: with "Keep hook running between galleries" enabled imxup
+    starts this script once (--persistent, see hook_worker.py) and logins and
+    HTTP sessions are reused for every gallery.
+
     Note: When using %z, imxup automatically creates a temporary ZIP of the gallery
     using store mode (no compression) for maximum speed, then deletes it after upload.
 
@@ -33,16 +43,197 @@ The script outputs JSON that can be mapped to ext1-4 fields in imxup.
 
 import sys
 import json
+import threading
+import concurrent.futures
 import requests
 import base64
 import re
 import hashlib
 import time
+import contextlib
 from pathlib import Path
 from typing import Dict, List, Any, Optional, Union
 from datetime import datetime
 from urllib.parse import quote
 import mimetypes
+from requests.adapters import HTTPAdapter
+from urllib3.fields import RequestField
+from urllib3.filepost import choose_boundary
+
+CHUNK_SIZE = 1024 * 1024       # bytes per shared read when uploading to several hosts
+MAX_BUFFERED_CHUNKS = 16       # how far the fastest host may run ahead of the slowest
+POOL_SIZE = 4                  # pooled connections per host session
+UPLOAD_RETRIES = 2             # retries per host after the first attempt
+RETRY_BACKOFF = 2.0            # seconds before the first retry, doubled after each
+
+
+class FanOutReader:
+    """Reads a file once and serves its chunks to several consumers.
+
+    At most max_buffered chunks are held in memory: the reader waits while
+    the slowest active consumer is that far behind. A consumer that stops
+    early (failed upload) must close its stream so it no longer holds the
+    others back.
+    """
+
+    def __init__(self, file_path: Path, consumers: int, chunk_size: int = CHUNK_SIZE,
+                 max_buffered: int = MAX_BUFFERED_CHUNKS):
+        self.file_path = file_path
+        self.size = file_path.stat().st_size
+        self.chunk_size = chunk_size
+        self.max_buffered = max(1, max_buffered)
+        self._chunks: Dict[int, bytes] = {}
+        self._read_count = 0
+        self._eof = False
+        self._error: Optional[Exception] = None
+        self._positions = {consumer: 0 for consumer in range(consumers)}
+        self._cond = threading.Condition()
+        self._thread = threading.Thread(target=self._read_loop, daemon=True, name="muh-reader")
+        self._thread.start()
+
+    def stream(self, consumer: int) -> "FanOutStream":
+        return FanOutStream(self, consumer)
+
+    def _read_loop(self) -> None:
+        try:
+            with open(self.file_path, 'rb') as f:
+                while True:
+                    with self._cond:
+                        while self._positions and \
+                                self._read_count - min(self._positions.values()) >= self.max_buffered:
+                            self._cond.wait()
+                        if not self._positions:
+                            return
+                    chunk = f.read(self.chunk_size)
+                    with self._cond:
+                        if not chunk:
+                            self._eof = True
+                            self._cond.notify_all()
+                            return
+                        self._chunks[self._read_count] = chunk
+                        self._read_count += 1
+                        self._cond.notify_all()
+        except OSError as e:
+            with self._cond:
+                self._error = e
+                self._eof = True
+                self._cond.notify_all()
+
+    def _get_chunk(self, consumer: int, index: int) -> Optional[bytes]:
+        with self._cond:
+            while index >= self._read_count and not self._eof:
+                self._cond.wait()
+            if self._error is not None:
+                raise self._error
+            if index >= self._read_count:
+                return None
+            chunk = self._chunks[index]
+            if consumer in self._positions:
+                self._positions[consumer] = index + 1
+                self._trim()
+            return chunk
+
+    def _detach(self, consumer: int) -> None:
+        with self._cond:
+            self._positions.pop(consumer, None)
+            self._trim()
+
+    def _trim(self) -> None:
+        low = min(self._positions.values(), default=self._read_count)
+        for index in [i for i in self._chunks if i < low]:
+            del self._chunks[index]
+        self._cond.notify_all()
+
+
+class FanOutStream:
+    """File-like view of a FanOutReader for one consumer (read-once, sized)"""
+
+    def __init__(self, reader: FanOutReader, consumer: int):
+        self._reader = reader
+        self._consumer = consumer
+        self._index = 0
+        self._pending = b""
+        self._closed = False
+
+    def __len__(self) -> int:
+        return self._reader.size
+
+    def read(self, size: int = -1) -> bytes:
+        if self._closed:
+            return b""
+        parts = [self._pending]
+        have = len(self._pending)
+        while size < 0 or have < size:
+            chunk = self._reader._get_chunk(self._consumer, self._index)
+            if chunk is None:
+                break
+            self._index += 1
+            parts.append(chunk)
+            have += len(chunk)
+        data = b"".join(parts)
+        if size < 0:
+            self._pending = b""
+            return data
+        self._pending = data[size:]
+        return data[:size]
+
+    def close(self) -> None:
+        if not self._closed:
+            self._closed = True
+            self._reader._detach(self._consumer)
+
+
+class MultipartBody:
+    """Streaming multipart/form-data body: form fields, then one file.
+
+    requests builds multipart bodies in memory; this reads the file part
+    from its source while sending, with the same part headers.
+    """
+
+    def __init__(self, fields: Dict[str, Any], file_field: str, filename: str,
+                 content_type: str, source, size: int):
+        self.boundary = choose_boundary()
+        head = bytearray()
+        for name, value in fields.items():
+            head += self._part_header(RequestField(name=name, data=value))
+            head += (value if isinstance(value, bytes) else str(value).encode('utf-8')) + b"\r\n"
+        head += self._part_header(RequestField(name=file_field, data=b"", filename=filename),
+                                  content_type)
+        self._parts = [bytes(head), source, f"\r\n--{self.boundary}--\r\n".encode('latin-1')]
+        self._length = len(self._parts[0]) + size + len(self._parts[2])
+        self._part = 0
+        self._offset = 0
+
+    @property
+    def content_type(self) -> str:
+        return f"multipart/form-data; boundary={self.boundary}"
+
+    def _part_header(self, field: RequestField, content_type: Optional[str] = None) -> bytes:
+        field.make_multipart(content_type=content_type)
+        return f"--{self.boundary}\r\n".encode('latin-1') + field.render_headers().encode('utf-8')
+
+    def __len__(self) -> int:
+        return self._length
+
+    def read(self, size: int = -1) -> bytes:
+        out = bytearray()
+        while self._part < len(self._parts) and (size < 0 or len(out) < size):
+            part = self._parts[self._part]
+            want = -1 if size < 0 else size - len(out)
+            if isinstance(part, bytes):
+                end = len(part) if want < 0 else self._offset + want
+                data = part[self._offset:end]
+                self._offset += len(data)
+                exhausted = self._offset >= len(part)
+            else:
+                data = part.read(want)
+                exhausted = not data or want < 0
+            out += data
+            if exhausted:
+                self._part += 1
+                self._offset = 0
+        return bytes(out)
+
 
 class HostConfig:
     """Configuration for a file hosting service"""
@@ -625,6 +816,9 @@ class MultiHostUploader:
         self.host = host.lower()
         self.api_key = api_key
         self.session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=1, pool_maxsize=POOL_SIZE)
+        self.session.mount("https://", adapter)
+        self.session.mount("http://", adapter)
 
         if self.host not in HOSTS:
             raise ValueError(f"Unsupported host: {host}. Available: {', '.join(HOSTS.keys())}")
@@ -804,16 +998,35 @@ class MultiHostUploader:
 
         return headers
 
-    def upload_file(self, file_path: Path) -> Dict:
-        """Upload file to the hosting service"""
+    @contextlib.contextmanager
+    def _open_source(self, file_path: Path, source=None):
+        """Yield the shared stream if given, otherwise the file opened for reading"""
+        if source is not None:
+            yield source
+        else:
+            with open(file_path, 'rb') as f:
+                yield f
+
+    def _multipart(self, file_path: Path, source, fields: Optional[Dict] = None) -> MultipartBody:
+        return MultipartBody(fields or {}, self.config.file_field, file_path.name,
+                             self.get_mime_type(file_path), source, file_path.stat().st_size)
+
+    def upload_file(self, file_path: Path, source=None) -> Dict:
+        """Upload file to the hosting service
+
+        Args:
+            file_path: File to upload
+            source: Optional read-once stream of the file's bytes (FanOutStream);
+                the file is opened directly if not given
+        """
 
         # Handle multi-step uploads (like RapidGator)
         if self.config.upload_init_url:
-            return self._upload_multistep(file_path)
+            return self._upload_multistep(file_path, source)
 
         # Handle session-based uploads that need dynamic session IDs (but not if they use get_server)
         if self.config.auth_type == "session" and self.config.session_id_regex and not self.config.get_server:
-            return self._upload_session_based(file_path)
+            return self._upload_session_based(file_path, source)
 
         # Get upload URL
         if "{filename}" in self.config.upload_endpoint:
@@ -837,7 +1050,7 @@ class MultiHostUploader:
             sess_id = self._extract_session_id(page_resp.text)
 
         # Prepare the file and request
-        with open(file_path, 'rb') as f:
+        with self._open_source(file_path, source) as f:
             if self.config.method == "PUT":
                 # For PUT requests (like Pixeldrain, Transfer.sh)
                 response = self.session.put(
@@ -848,7 +1061,6 @@ class MultiHostUploader:
                 )
             else:
                 # For POST requests (most hosts)
-                files = {self.config.file_field: (file_path.name, f, self.get_mime_type(file_path))}
                 data = self.config.extra_fields.copy()
 
                 # Add sess_id if we extracted it
@@ -860,16 +1072,14 @@ class MultiHostUploader:
                     data["sess_id"] = sess_id
 
                 # Handle Litterbox time parameter from command line
-                if self.host == "litterbox" and len(sys.argv) > 3:
-                    time_param = sys.argv[3]
-                    if time_param in ["1h", "12h", "24h", "72h"]:
-                        data["time"] = time_param
+                if self.host == "litterbox" and self.api_key in ["1h", "12h", "24h", "72h"]:
+                    data["time"] = self.api_key
 
+                body = self._multipart(file_path, f, data)
                 response = self.session.post(
                     upload_url,
-                    files=files,
-                    data=data,
-                    headers=headers,
+                    data=body,
+                    headers={**headers, "Content-Type": body.content_type},
                     timeout=300,
                     allow_redirects=(self.host == "filespace")  # FileSpace needs redirects, others use Location header
                 )
@@ -877,7 +1087,7 @@ class MultiHostUploader:
         response.raise_for_status()
         return self.parse_response(response)
 
-    def _upload_session_based(self, file_path: Path) -> Dict[str, Any]:
+    def _upload_session_based(self, file_path: Path, source=None) -> Dict[str, Any]:
         """Upload file to session-based hosts that require dynamic session IDs"""
         # Get the upload page to extract session ID
         upload_page_url = f"{self.config.upload_endpoint.rstrip('/')}/upload"
@@ -893,20 +1103,21 @@ class MultiHostUploader:
         upload_url = f"{self.config.upload_endpoint.rstrip('/')}/cgi-bin/upload.cgi?upload_id={sess_id}&utype=reg"
 
         # Upload the file
-        with open(file_path, 'rb') as f:
-            files = {self.config.file_field: (file_path.name, f, self.get_mime_type(file_path))}
+        with self._open_source(file_path, source) as f:
             data = {
                 'sess_id': sess_id,
                 'utype': 'reg',
                 **self.config.extra_fields
             }
 
-            response = self.session.post(upload_url, files=files, data=data, timeout=300)
+            body = self._multipart(file_path, f, data)
+            response = self.session.post(upload_url, data=body, headers={"Content-Type": body.content_type},
+                                         timeout=300)
             response.raise_for_status()
 
         return self.parse_response(response)
 
-    def _upload_multistep(self, file_path: Path) -> Dict[str, Any]:
+    def _upload_multistep(self, file_path: Path, source=None) -> Dict[str, Any]:
         """Generic multi-step upload (init → upload → poll)"""
         # Step 1: Build init URL with parameters
         if not self.config.upload_init_url:
@@ -985,9 +1196,10 @@ class MultiHostUploader:
 
         # Step 3: Upload file
         print(f"Uploading file...", file=sys.stderr)
-        with open(file_path, 'rb') as f:
-            files = {self.config.file_field: (file_path.name, f, self.get_mime_type(file_path))}
-            upload_resp = self.session.post(upload_url, files=files, timeout=300)
+        with self._open_source(file_path, source) as f:
+            body = self._multipart(file_path, f)
+            upload_resp = self.session.post(upload_url, data=body, headers={"Content-Type": body.content_type},
+                                            timeout=300)
             upload_resp.raise_for_status()
 
         # Step 4: Poll for completion
@@ -1111,11 +1323,98 @@ class MultiHostUploader:
         return result
 
 
+# Uploaders by (host, credentials); in persistent mode they stay logged in between jobs
+_UPLOADERS: Dict[tuple, "MultiHostUploader"] = {}
+_UPLOADERS_LOCK = threading.Lock()
+
+
+def get_uploader(host: str, api_key: Optional[str] = None) -> "MultiHostUploader":
+    """Return a logged-in uploader, reusing the one from a previous job if any"""
+    key = (host.lower(), api_key)
+    with _UPLOADERS_LOCK:
+        uploader = _UPLOADERS.get(key)
+    if uploader is None:
+        uploader = MultiHostUploader(host, api_key)
+        with _UPLOADERS_LOCK:
+            uploader = _UPLOADERS.setdefault(key, uploader)
+    return uploader
+
+
+def _is_retryable(error: Exception) -> bool:
+    """Network errors, timeouts, 429 and 5xx are retried; anything else fails at once"""
+    if isinstance(error, requests.HTTPError) and error.response is not None:
+        return error.response.status_code == 429 or error.response.status_code >= 500
+    return isinstance(error, (requests.ConnectionError, requests.Timeout))
+
+
+def upload_with_retries(host: str, api_key: Optional[str], file_path: Path, source=None,
+                        retries: int = UPLOAD_RETRIES, backoff: float = RETRY_BACKOFF) -> Dict[str, Any]:
+    """Upload to one host, retrying transient failures with exponential backoff.
+
+    The first attempt reads from source if given (shared stream); retries
+    reopen the file since a shared stream can only be read once. The result
+    always carries attempts and elapsed_seconds; exceptions are turned into
+    a failed result.
+    """
+    started = time.monotonic()
+    attempts = 0
+    try:
+        uploader = get_uploader(host, api_key)
+        while True:
+            attempts += 1
+            try:
+                result = uploader.upload_file(file_path, source if attempts == 1 else None)
+                break
+            except Exception as e:
+                if source is not None:
+                    source.close()
+                if attempts > retries or not _is_retryable(e):
+                    raise
+                delay = backoff * 2 ** (attempts - 1)
+                print(f"[{host}] Attempt {attempts} failed: {e}; retrying in {delay:.1f}s", file=sys.stderr)
+                time.sleep(delay)
+    except Exception as e:
+        result = {
+            "host": HOSTS[host.lower()].name if host.lower() in HOSTS else host,
+            "error": str(e),
+            "status": "failed",
+            "success": False,
+            "timestamp": datetime.now().isoformat()
+        }
+    finally:
+        if source is not None:
+            source.close()
+    result["attempts"] = attempts
+    result["elapsed_seconds"] = round(time.monotonic() - started, 3)
+    return result
+
+
+def upload_to_hosts(hosts: List[str], api_keys: List[Optional[str]], file_path: Path,
+                    retries: int = UPLOAD_RETRIES, backoff: float = RETRY_BACKOFF) -> Dict[str, Dict[str, Any]]:
+    """Upload one file to several hosts in parallel, reading it only once.
+
+    Returns:
+        Dict mapping host -> upload result, in the given host order
+    """
+    reader = FanOutReader(file_path, len(hosts))
+    with concurrent.futures.ThreadPoolExecutor(max_workers=len(hosts), thread_name_prefix="muh") as pool:
+        futures = [
+            pool.submit(upload_with_retries, host, api_key, file_path, reader.stream(i), retries, backoff)
+            for i, (host, api_key) in enumerate(zip(hosts, api_keys))
+        ]
+        return {host: future.result() for host, future in zip(hosts, futures)}
+
+
+def _file_info(file_path: Path) -> Dict[str, Any]:
+    size = file_path.stat().st_size
+    return {"file_name": file_path.name, "file_size": size, "file_size_mb": f"{size / (1024*1024):.2f} MB"}
+
+
 def main():
     """Main entry point"""
 
     if len(sys.argv) < 3:
-        print("Usage: python multi_host_uploader.py <host> <file> [api_key]", file=sys.stderr)
+        print("Usage: python multi_host_uploader.py <host>[,<host>...] <file> [api_key[,api_key...]]", file=sys.stderr)
         print(f"Available hosts: {', '.join(HOSTS.keys())}", file=sys.stderr)
         print("\nExamples:", file=sys.stderr)
         print("  python multi_host_uploader.py gofile test.jpg", file=sys.stderr)
@@ -1123,9 +1422,10 @@ def main():
         print("  python multi_host_uploader.py litterbox test.jpg 72h", file=sys.stderr)
         print("  python multi_host_uploader.py filedot test.jpg username:password", file=sys.stderr)
         print("  python multi_host_uploader.py rapidgator test.jpg username:password", file=sys.stderr)
+        print("  python multi_host_uploader.py gofile,pixeldrain test.zip \",your_api_key\"", file=sys.stderr)
         sys.exit(1)
 
-    host = sys.argv[1]
+    hosts = list(dict.fromkeys(h.strip() for h in sys.argv[1].split(",") if h.strip()))
     file_path = Path(sys.argv[2])
     api_key = sys.argv[3] if len(sys.argv) > 3 else None
 
@@ -1145,37 +1445,69 @@ def main():
         print(json.dumps(error_output))
         sys.exit(1)
 
-    try:
-        uploader = MultiHostUploader(host, api_key)
-        print(f"Uploading to {uploader.config.name}...", file=sys.stderr)
-
-        result = uploader.upload_file(file_path)
-
-        # Add file info
-        result["file_name"] = file_path.name
-        result["file_size"] = file_path.stat().st_size
-        result["file_size_mb"] = f"{result['file_size'] / (1024*1024):.2f} MB"
+    if len(hosts) > 1:
+        # Credentials in host order; missing or empty entries mean none
+        keys = [k.strip() or None for k in api_key.split(",")] if api_key else []
+        keys += [None] * (len(hosts) - len(keys))
+        print(f"Uploading to {len(hosts)} hosts in parallel: {', '.join(hosts)}", file=sys.stderr)
+        started = time.monotonic()
+        results = upload_to_hosts(hosts, keys[:len(hosts)], file_path)
+
+        succeeded = [host for host, result in results.items() if result.get("success")]
+        output: Dict[str, Any] = {
+            "status": "success" if len(succeeded) == len(hosts) else "partial" if succeeded else "failed",
+            "success": bool(succeeded),
+            "timestamp": datetime.now().isoformat(),
+            "elapsed_seconds": round(time.monotonic() - started, 3),
+        }
+        if succeeded:
+            output["url"] = results[succeeded[0]]["url"]
+        for host, result in results.items():
+            if result.get("url"):
+                output[f"{host}_url"] = result["url"]
+        output["hosts"] = results
+        output.update(_file_info(file_path))
 
         # Output JSON for imxup
-        print(json.dumps(result, indent=2))
+        print(json.dumps(output, indent=2))
 
         # Summary to stderr
-        if result.get("success"):
-            print(f"\n✓ Upload successful!", file=sys.stderr)
-            print(f"URL: {result.get('url')}", file=sys.stderr)
-        else:
-            print(f"\n✗ Upload failed: {result.get('error')}", file=sys.stderr)
-
-    except Exception as e:
-        error_output = {
-            "error": str(e),
-            "status": "failed",
-            "timestamp": datetime.now().isoformat()
-        }
-        print(json.dumps(error_output))
-        print(f"Error: {e}", file=sys.stderr)
+        for host, result in results.items():
+            mark = "✓" if result.get("success") else "✗"
+            detail = result.get("url") if result.get("success") else result.get("error")
+            print(f"{mark} {result.get('host', host)} ({result['elapsed_seconds']:.1f}s, "
+                  f"{result['attempts']} attempt(s)): {detail}", file=sys.stderr)
+        if not succeeded:
+            sys.exit(1)
+        return
+
+    host = hosts[0] if hosts else sys.argv[1]
+    if host.lower() in HOSTS:
+        print(f"Uploading to {HOSTS[host.lower()].name}...", file=sys.stderr)
+    result = upload_with_retries(host, api_key, file_path)
+
+    if result.get("status") == "failed":
+        print(json.dumps(result))
+        print(f"Error: {result.get('error')}", file=sys.stderr)
         sys.exit(1)
 
+    # Add file info
+    result.update(_file_info(file_path))
+
+    # Output JSON for imxup
+    print(json.dumps(result, indent=2))
+
+    # Summary to stderr
+    if result.get("success"):
+        print(f"\n✓ Upload successful!", file=sys.stderr)
+        print(f"URL: {result.get('url')}", file=sys.stderr)
+    else:
+        print(f"\n✗ Upload failed: {result.get('error')}", file=sys.stderr)
+
 
 if __name__ == "__main__":
-    main()
\ No newline at end of file
+    if "--persistent" in sys.argv[1:]:
+        from hook_worker import serve
+        serve(main)
+    else:
+        main()
@@ -0,0 +1,293 @@
+"""
+Adaptive upload concurrency for UploadEngine.
+
+An AIMD (additive increase, multiplicative decrease) controller that tunes
+how many image uploads are in flight while a gallery uploads. After every
+window of completed uploads it looks at the error rate, the median per-file
+latency and the throughput of the window:
+
+  - errors above the threshold, or latency inflating without a throughput
+    gain, cut the limit multiplicatively
+  - a throughput drop right after an increase steps back by one
+  - otherwise the limit grows by one, up to the configured maximum
+
+Each session starts at the parallel uploads setting (parallel_batch_size), or
+at the limit chosen in the previous session when that is lower, and the
+controller moves between the configured minimum and maximum from there. The
+chosen limit is stored in the config file; it is dropped when the user changes
+parallel_batch_size.
+"""
+
+from __future__ import annotations
+
+import configparser
+import statistics
+import threading
+import time
+from dataclasses import dataclass
+from typing import Callable, List, Optional, Tuple
+
+from src.utils.logger import log
+
+# Settings (INI [Advanced] section, edited in Settings > Advanced)
+SETTING_ENABLED = "uploads/adaptive_concurrency"
+SETTING_MIN = "uploads/concurrency_min"
+SETTING_MAX = "uploads/concurrency_max"
+
+# Learned limit (INI section written by the upload worker)
+STATE_SECTION = "CONCURRENCY"
+STATE_KEY = "imx_limit"
+
+DEFAULT_MIN = 1
+DEFAULT_MAX = 12
+
+MIN_WINDOW_SAMPLES = 4          # Completions per decision (at least the current limit)
+ERROR_RATE_THRESHOLD = 0.10     # Failed fraction of a window that triggers a decrease
+LATENCY_INFLATION = 2.0         # Median latency vs. best seen that counts as queueing
+THROUGHPUT_GAIN = 1.05          # Relative gain that justifies inflated latency
+THROUGHPUT_DROP = 0.90          # Relative loss after an increase that reverts it
+DECREASE_FACTOR = 0.7           # Multiplicative decrease
+
+
+@dataclass
+class ConcurrencyDecision:
+    """Outcome of one controller window."""
+    action: str                 # 'increase', 'decrease', 'hold'
+    old_limit: int
+    new_limit: int
+    reason: str
+    samples: int
+    error_rate: float
+    median_latency: Optional[float]
+    throughput: float           # bytes/s
+
+    @property
+    def changed(self) -> bool:
+        return self.new_limit != self.old_limit
+
+
+class AdaptiveConcurrencyController:
+    """AIMD controller for the number of in-flight uploads.
+
+    Thread-safe: record() is called from the engine's dispatch loop while the
+    GUI may read limit/last_decision from another thread.
+    """
+
+    def __init__(self, minimum: int = DEFAULT_MIN, maximum: int = DEFAULT_MAX,
+                 initial: Optional[int] = None,
+                 on_change: Optional[Callable[[ConcurrencyDecision], None]] = None):
+        """Initialize the controller.
+
+        Args:
+            minimum: Lowest number of in-flight uploads
+            maximum: Highest number of in-flight uploads
+            initial: Starting limit (clamped to minimum..maximum, defaults to minimum)
+            on_change: Called with the decision whenever the limit changes
+        """
+        self.minimum = max(1, int(minimum))
+        self.maximum = max(self.minimum, int(maximum))
+        self.initial = self._clamp(initial if initial is not None else self.minimum)
+        self.on_change = on_change
+        self.last_decision: Optional[ConcurrencyDecision] = None
+
+        self._lock = threading.Lock()
+        self._clock = time.monotonic
+        self._limit = self.initial
+        self._samples: List[Tuple[bool, Optional[float], int]] = []
+        self._window_start = self._clock()
+        self._baseline_latency: Optional[float] = None
+        self._prev_throughput: Optional[float] = None
+
+    def _clamp(self, value: int) -> int:
+        return max(self.minimum, min(self.maximum, int(value)))
+
+    @property
+    def limit(self) -> int:
+        """Current number of uploads allowed in flight."""
+        with self._lock:
+            return self._limit
+
+    def begin(self) -> None:
+        """Start a fresh measurement window (call when a gallery starts).
+
+        The limit is kept; latency and throughput history are dropped because
+        they depend on the gallery's image sizes.
+        """
+        with self._lock:
+            self._samples = []
+            self._window_start = self._clock()
+            self._baseline_latency = None
+            self._prev_throughput = None
+
+    def record(self, success: bool, duration: Optional[float] = None,
+               size_bytes: int = 0) -> Optional[ConcurrencyDecision]:
+        """Record a finished upload.
+
+        Args:
+            success: Whether the upload succeeded
+            duration: Upload time in seconds (successful uploads)
+            size_bytes: Size of the uploaded file
+
+        Returns:
+            The decision if this completion closed a window, else None
+        """
+        with self._lock:
+            self._samples.append((success, duration, size_bytes if success else 0))
+            if len(self._samples) < max(MIN_WINDOW_SAMPLES, self._limit):
+                return None
+            decision = self._decide()
+            self._samples = []
+            self._window_start = self._clock()
+            self.last_decision = decision
+
+        if decision.changed:
+            log(f"Upload concurrency {decision.old_limit} -> {decision.new_limit} ({decision.reason})",
+                level="info", category="uploads")
+            if self.on_change:
+                try:
+                    self.on_change(decision)
+                except Exception:
+                    pass
+        else:
+            log(f"Upload concurrency held at {decision.new_limit} ({decision.reason})",
+                level="debug", category="uploads")
+        return decision
+
+    def _decide(self) -> ConcurrencyDecision:
+        """Evaluate the current window (lock held)."""
+        samples = len(self._samples)
+        failures = sum(1 for ok, _, _ in self._samples if not ok)
+        error_rate = failures / samples
+        latencies = [d for ok, d, _ in self._samples if ok and d is not None]
+        median = statistics.median(latencies) if latencies else None
+        elapsed = max(self._clock() - self._window_start, 1e-6)
+        throughput = sum(size for _, _, size in self._samples) / elapsed
+
+        old = self._limit
+        prev = self._prev_throughput
+        last_action = self.last_decision.action if self.last_decision else None
+        inflated = (median is not None and self._baseline_latency is not None
+                    and median > self._baseline_latency * LATENCY_INFLATION)
+        gained = prev is not None and throughput > prev * THROUGHPUT_GAIN
+
+        if error_rate >= ERROR_RATE_THRESHOLD:
+            action, new = 'decrease', self._clamp(old * DECREASE_FACTOR)
+            reason = f"error rate {error_rate:.0%}"
+        elif inflated and not gained:
+            action, new = 'decrease', self._clamp(old * DECREASE_FACTOR)
+            reason = f"latency {median:.2f}s vs {self._baseline_latency:.2f}s baseline"
+        elif last_action == 'increase' and prev and throughput < prev * THROUGHPUT_DROP:
+            action, new = 'decrease', self._clamp(old - 1)
+            reason = f"throughput fell to {throughput / 1024:.0f} KiB/s"
+        elif old < self.maximum:
+            action, new = 'increase', old + 1
+            reason = f"throughput {throughput / 1024:.0f} KiB/s"
+        else:
+            action, new = 'hold', old
+            reason = f"at maximum, throughput {throughput / 1024:.0f} KiB/s"
+
+        if new == old and action == 'decrease':
+            action = 'hold'
+            reason += " (at minimum)"
+
+        # Baseline latency only learns from healthy windows
+        if median is not None and error_rate < ERROR_RATE_THRESHOLD:
+            if self._baseline_latency is None or median < self._baseline_latency:
+                self._baseline_latency = median
+        self._prev_throughput = throughput
+        self._limit = new
+        return ConcurrencyDecision(action, old, new, reason, samples, error_rate, median, throughput)
+
+
+def load_concurrency_settings() -> dict:
+    """Adaptive concurrency settings from the INI [Advanced] section.
+
+    Returns:
+        Dictionary with 'enabled', 'minimum' and 'maximum'
+    """
+    from bbdrop import read_config
+
+    config = read_config()
+    settings = {'enabled': True, 'minimum': DEFAULT_MIN, 'maximum': DEFAULT_MAX}
+    if config.has_section('Advanced'):
+        settings['enabled'] = config.getboolean('Advanced', SETTING_ENABLED, fallback=True)
+        settings['minimum'] = config.getint('Advanced', SETTING_MIN, fallback=DEFAULT_MIN)
+        settings['maximum'] = config.getint('Advanced', SETTING_MAX, fallback=DEFAULT_MAX)
+    return settings
+
+
+def load_learned_limit() -> Optional[int]:
+    """The in-flight limit chosen in the previous session, if any."""
+    from bbdrop import read_config
+
+    try:
+        return read_config().getint(STATE_SECTION, STATE_KEY, fallback=None)
+    except ValueError:
+        return None
+
+
+def save_learned_limit(limit: int) -> None:
+    """Store the chosen in-flight limit as the next session's starting point.
+
+    Call from the GUI thread, which does the other config writes. The file is
+    replaced atomically so a crash never leaves a truncated config.
+    """
+    import os
+    import tempfile
+    from bbdrop import get_config_path, read_config
+
+    config = read_config()
+    if not config.has_section(STATE_SECTION):
+        config.add_section(STATE_SECTION)
+    config.set(STATE_SECTION, STATE_KEY, str(int(limit)))
+    path = get_config_path()
+    config_dir = os.path.dirname(path)
+    os.makedirs(config_dir, exist_ok=True)
+    fd, tmp_path = tempfile.mkstemp(prefix='.bbdrop-', suffix='.ini', dir=config_dir)
+    try:
+        with os.fdopen(fd, 'w', encoding='utf-8') as f:
+            config.write(f)
+        os.replace(tmp_path, path)
+    except Exception:
+        try:
+            os.remove(tmp_path)
+        except OSError:
+            pass
+        raise
+
+
+def forget_learned_limit(config: configparser.ConfigParser) -> None:
+    """Drop the learned limit from a config about to be saved (parallel_batch_size changed)."""
+    if config.has_section(STATE_SECTION):
+        config.remove_option(STATE_SECTION, STATE_KEY)
+
+
+def create_concurrency_controller(
+    batch_size: int,
+    on_change: Optional[Callable[[ConcurrencyDecision], None]] = None,
+) -> Optional[AdaptiveConcurrencyController]:
+    """Build a controller from the user's settings.
+
+    Args:
+        batch_size: The user's parallel_batch_size; the starting limit, unless
+            the previous session settled on a lower one
+        on_change: Called with each decision that changes the limit
+
+    Returns:
+        Controller, or None when adaptive concurrency is disabled
+    """
+    try:
+        settings = load_concurrency_settings()
+        learned = load_learned_limit()
+    except Exception as e:
+        log(f"Could not load adaptive concurrency settings: {e}", level="warning", category="uploads")
+        return None
+    if not settings['enabled']:
+        return None
+    maximum = max(1, settings['maximum'])
+    return AdaptiveConcurrencyController(
+        minimum=min(settings['minimum'], maximum),
+        maximum=maximum,
+        initial=batch_size if learned is None else min(batch_size, learned),
+        on_change=on_change,
+    )
@@ -52,7 +52,6 @@ DEFAULT_PUBLIC_GALLERY = 1  # 1=public, 0=private
 GALLERY_ID_LENGTH = 8
 
 # Progress Updates
-PROGRESS_UPDATE_BATCH_INTERVAL = 0.05  # seconds
 PROGRESS_UPDATE_THRESHOLD = 100  # milliseconds
 
 # URLs
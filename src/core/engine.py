@@ -11,6 +11,9 @@ from __future__ import annotations
 import os, shutil
 import time
 import concurrent.futures
+import heapq
+import itertools
+from collections import deque
 from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 import re
@@ -18,10 +21,15 @@ import sys
 import threading
 from functools import cmp_to_key
 import ctypes
-from typing import Callable, Iterable, Optional, Tuple, List, Dict, Any, Set
+from typing import Callable, Deque, Iterable, Optional, Tuple, List, Dict, Any, Set
 
+from src.core.adaptive_concurrency import AdaptiveConcurrencyController
+from src.core.image_prefetch import DEFAULT_PREFETCH_DEPTH, DEFAULT_PREFETCH_MAX_BYTES, ImagePrefetcher
+from src.core.upload_retry import ERROR_INVALID_FILE, RetryPolicy, classify_upload_error
+from src.utils.archive_utils import is_archive_gallery_path, get_archive_gallery_name
 from src.utils.format_utils import format_binary_size, format_binary_rate
 from src.utils.logger import log
+from src.utils.tracing import span
 
 
 class AtomicCounter:
@@ -75,6 +83,7 @@ class ByteCountingCallback:
 ProgressCallback = Callable[[int, int, int, str], None]
 SoftStopCallback = Callable[[], bool]
 ImageUploadedCallback = Callable[[str, Dict[str, Any], int], None]
+ImageTimingCallback = Callable[[str, float, int, Optional[float]], None]
 
 
 class UploadEngine:
@@ -89,7 +98,11 @@ class UploadEngine:
     def __init__(self, uploader: Any, rename_worker: Any = None,
                  global_byte_counter: Optional[AtomicCounter] = None,
                  gallery_byte_counter: Optional[AtomicCounter] = None,
-                 worker_thread: Optional[Any] = None):
+                 worker_thread: Optional[Any] = None,
+                 concurrency_controller: Optional[AdaptiveConcurrencyController] = None,
+                 retry_policy: Optional[RetryPolicy] = None,
+                 prefetch_depth: int = DEFAULT_PREFETCH_DEPTH,
+                 prefetch_max_bytes: int = DEFAULT_PREFETCH_MAX_BYTES):
         """Initialize upload engine with counters.
 
         Args:
@@ -98,12 +111,21 @@ class UploadEngine:
             global_byte_counter: Persistent counter tracking ALL galleries
             gallery_byte_counter: Per-gallery counter (reset after each gallery)
             worker_thread: Optional worker thread reference for bandwidth emission
+            concurrency_controller: Optional adaptive controller; when set it decides
+                the number of in-flight uploads instead of parallel_batch_size
+            retry_policy: Backoff and error classes for per-file retries
+            prefetch_depth: Images read ahead of the uploads (0 disables read-ahead)
+            prefetch_max_bytes: Memory bound of the read-ahead buffer
         """
         self.uploader = uploader
         self.rename_worker = rename_worker
         self.global_byte_counter = global_byte_counter or AtomicCounter()
         self.gallery_byte_counter = gallery_byte_counter  # Can be None
         self.worker_thread = worker_thread
+        self.concurrency_controller = concurrency_controller
+        self.retry_policy = retry_policy or RetryPolicy()
+        self.prefetch_depth = prefetch_depth
+        self.prefetch_max_bytes = prefetch_max_bytes
 
     def _is_gallery_unnamed(self, gallery_id: str) -> bool:
         """Check if gallery is in the unnamed galleries list."""
@@ -114,7 +136,29 @@ class UploadEngine:
         except Exception:
             return False
 
-    def run(
+    def run(self, folder_path: str, *args: Any, **kwargs: Any) -> Dict[str, Any]:
+        """Upload a gallery folder, or a gallery directory inside a ZIP/CBZ archive.
+
+        Archive galleries (virtual "<archive>::<dir>" paths) are read straight from
+        the archive without extracting to disk. Images of regular folders are
+        read ahead of the uploads by an ImagePrefetcher. See _run_gallery for arguments.
+        """
+        with span("upload_gallery", category="upload", gallery=folder_path):
+            if not is_archive_gallery_path(folder_path):
+                if self.prefetch_depth <= 0 or not os.path.isdir(folder_path):
+                    return self._run_gallery(folder_path, *args, **kwargs)
+                with ImagePrefetcher(folder_path, self.prefetch_depth, self.prefetch_max_bytes) as prefetcher:
+                    return self._run_gallery(folder_path, *args, image_prefetcher=prefetcher, **kwargs)
+            from src.services.archive_source import ArchiveImageSource
+            import zipfile
+            try:
+                source = ArchiveImageSource.from_gallery_path(folder_path)
+            except (OSError, zipfile.BadZipFile) as e:
+                raise FileNotFoundError(f"Archive not found or unreadable: {folder_path} ({e})") from e
+            with source:
+                return self._run_gallery(folder_path, *args, image_source=source, **kwargs)
+
+    def _run_gallery(
         self,
         folder_path: str,
         gallery_name: Optional[str],
@@ -133,11 +177,48 @@ class UploadEngine:
         on_progress: Optional[ProgressCallback] = None,
         should_soft_stop: Optional[SoftStopCallback] = None,
         on_image_uploaded: Optional[ImageUploadedCallback] = None,
+        # Per-image latency reporting: (filename, seconds, size_bytes, ttfb_seconds)
+        on_image_timing: Optional[ImageTimingCallback] = None,
+        # Archive member reader for archive galleries (None for regular folders)
+        image_source: Optional[Any] = None,
+        # Read-ahead buffer for regular folders (started here once the upload order is known)
+        image_prefetcher: Optional[ImagePrefetcher] = None,
     ) -> Dict[str, Any]:
         start_time = time.time()
-        if not os.path.exists(folder_path):
+        if image_source is None and not os.path.exists(folder_path):
             raise FileNotFoundError(f"Folder not found: {folder_path}")
 
+        def _file_size(name: str) -> int:
+            """Size of an image in the gallery, 0 if unavailable."""
+            try:
+                if image_source is not None:
+                    return image_source.get_size(name)
+                return os.path.getsize(os.path.join(folder_path, name))
+            except (OSError, KeyError):
+                return 0
+
+        def _upload_kwargs(name: str) -> Dict[str, Any]:
+            """Extra upload_image arguments: archive and prefetched images are passed in memory."""
+            if image_source is not None:
+                return {'file_data': image_source.read(name)}
+            data = image_prefetcher.take(name) if image_prefetcher is not None else None
+            return {} if data is None else {'file_data': data}
+
+        def _report_timing(name: str, duration: float) -> None:
+            """Pass a successful upload's timing to on_image_timing (never raises)."""
+            if not on_image_timing:
+                return
+            try:
+                ttfb = None
+                get_ttfb = getattr(self.uploader, 'get_last_ttfb', None)
+                if callable(get_ttfb):
+                    value = get_ttfb()
+                    if isinstance(value, (int, float)) and not isinstance(value, bool):
+                        ttfb = float(value)
+                on_image_timing(name, duration, _file_size(name), ttfb)
+            except Exception:
+                pass
+
         # Gather image files
         def _natural_sort_key(name: str):
             parts = re.split(r"(\d+)", name)
@@ -164,16 +245,21 @@ class UploadEngine:
             except Exception:
                 return sorted(names, key=_natural_sort_key)
         image_extensions = ('.jpg', '.jpeg', '.png', '.gif')
-        all_image_files: List[str] = _explorer_sort([
-            f for f in os.listdir(folder_path)
-            if f.lower().endswith(image_extensions) and os.path.isfile(os.path.join(folder_path, f))
-        ])
+        if image_source is not None:
+            all_image_files: List[str] = _explorer_sort(image_source.list_images())
+        else:
+            all_image_files = _explorer_sort([
+                f for f in os.listdir(folder_path)
+                if f.lower().endswith(image_extensions) and os.path.isfile(os.path.join(folder_path, f))
+            ])
         if not all_image_files:
             raise ValueError(f"No image files found in {folder_path}")
 
         # Resume: exclude already-uploaded files
         already_uploaded = already_uploaded or set()
         image_files: List[str] = [f for f in all_image_files if f not in already_uploaded]
+        if image_prefetcher is not None and image_files:
+            image_prefetcher.start(image_files)
 
         original_total_images = len(all_image_files)
 
@@ -182,15 +268,14 @@ class UploadEngine:
         image_dimensions_map: Dict[str, Tuple[int, int]] = {}
         total_size = 0
         for f in all_image_files:
-            fp = os.path.join(folder_path, f)
-            try:
-                total_size += os.path.getsize(fp)
-            except OSError:
-                pass
+            total_size += _file_size(f)
 
         # Determine gallery name
         if not gallery_name:
-            gallery_name = os.path.basename(folder_path)
+            if image_source is not None:
+                gallery_name = get_archive_gallery_name(folder_path)
+            else:
+                gallery_name = os.path.basename(folder_path)
         # Sanitize gallery name using the canonical helper (lazy import to avoid circular deps)
         try:
             from bbdrop import sanitize_gallery_name  # type: ignore
@@ -228,18 +313,21 @@ class UploadEngine:
             first_image_path = os.path.join(folder_path, first_file)
             log(f"Uploading first image to create gallery: {first_file}", level="info", category="uploads")
             first_upload_start = time.time()
-            first_response = self.uploader.upload_image(
-                first_image_path,
-                create_gallery=True,
-                thumbnail_size=thumbnail_size,
-                thumbnail_format=thumbnail_format,
-                progress_callback=ByteCountingCallback(self.global_byte_counter, self.gallery_byte_counter, self.worker_thread),
-            )
+            with span("create_gallery", category="upload", file=first_file):
+                first_response = self.uploader.upload_image(
+                    first_image_path,
+                    create_gallery=True,
+                    thumbnail_size=thumbnail_size,
+                    thumbnail_format=thumbnail_format,
+                    progress_callback=ByteCountingCallback(self.global_byte_counter, self.gallery_byte_counter, self.worker_thread),
+                    **_upload_kwargs(first_file),
+                )
             first_upload_duration = time.time() - first_upload_start
             if first_response.get('status') != 'success':
                 raise Exception(f"Failed to create gallery: {first_response}")
             gallery_id = first_response['data'].get('gallery_id')
             preseed_images = [first_response['data']]
+            _report_timing(first_file, first_upload_duration)
             # Log first image success with URL
             try:
                 first_url = first_response['data'].get('image_url', '')
@@ -249,10 +337,7 @@ class UploadEngine:
             # First image uploaded - set counters and files_to_upload
             files_to_upload = image_files[1:]  # Remaining files after first
             initial_completed = 1
-            try:
-                initial_uploaded_size = os.path.getsize(first_image_path)
-            except Exception:
-                initial_uploaded_size = 0
+            initial_uploaded_size = _file_size(first_file)
             # Report the first image upload so GUI resume/merge includes it
             if on_image_uploaded:
                 try:
@@ -313,7 +398,8 @@ class UploadEngine:
                     thread_sessions[thread_id] = session
                 return thread_sessions[thread_id]
 
-        def upload_single_image(image_file: str) -> Tuple[str, Optional[Dict[str, Any]], Optional[str], Optional[float], str]:
+        def upload_single_image(image_file: str, attempt: int = 1) -> Tuple[str, Optional[Dict[str, Any]], Optional[str], Optional[float], str, Optional[str]]:
+            """Upload one image; returns (file, data, error, duration, path, error_class)."""
             image_path = os.path.join(folder_path, image_file)
             try:
                 upload_start = time.time()
@@ -321,20 +407,24 @@ class UploadEngine:
                 # Get thread-local session for this upload
                 thread_session = get_thread_session()
 
-                response = self.uploader.upload_image(
-                    image_path,
-                    gallery_id=gallery_id,
-                    thumbnail_size=thumbnail_size,
-                    thumbnail_format=thumbnail_format,
-                    thread_session=thread_session,
-                    progress_callback=ByteCountingCallback(self.global_byte_counter, self.gallery_byte_counter, self.worker_thread),
-                )
+                with span("upload_file", category="upload", gallery=folder_path, file=image_file, attempt=attempt):
+                    response = self.uploader.upload_image(
+                        image_path,
+                        gallery_id=gallery_id,
+                        thumbnail_size=thumbnail_size,
+                        thumbnail_format=thumbnail_format,
+                        thread_session=thread_session,
+                        progress_callback=ByteCountingCallback(self.global_byte_counter, self.gallery_byte_counter, self.worker_thread),
+                        **_upload_kwargs(image_file),
+                    )
                 upload_duration = time.time() - upload_start
                 if response.get('status') == 'success':
-                    return image_file, response['data'], None, upload_duration, image_path
-                return image_file, None, f"API error: {response}", None, image_path
+                    _report_timing(image_file, upload_duration)
+                    return image_file, response['data'], None, upload_duration, image_path, None
+                return (image_file, None, f"API error: {response}", None, image_path,
+                        classify_upload_error(response=response))
             except Exception as e:
-                return image_file, None, f"Upload error: {e}", None, image_path
+                return image_file, None, f"Upload error: {e}", None, image_path, classify_upload_error(exc=e)
 
         # Concurrency loop
         uploaded_images: List[Tuple[str, Dict[str, Any]]] = []
@@ -344,33 +434,72 @@ class UploadEngine:
         def maybe_soft_stopping() -> bool:
             return bool(should_soft_stop and should_soft_stop())
 
+        # In-flight limit: adaptive controller if present, otherwise fixed batch size
+        controller = self.concurrency_controller
+        if controller:
+            controller.begin()
+        pool_size = controller.maximum if controller else parallel_batch_size
+
+        def in_flight_limit() -> int:
+            return controller.limit if controller else parallel_batch_size
+
+        def record_outcome(image_file: str, image_data: Optional[Dict[str, Any]],
+                           upload_duration: Optional[float], error_class: Optional[str]) -> None:
+            # Rejected files say nothing about server load
+            if controller and error_class != ERROR_INVALID_FILE:
+                controller.record(bool(image_data), upload_duration,
+                                  _file_size(image_file) if image_data else 0)
+
+        # Failed files go back on the work queue after a per-file backoff delay
+        retry_policy = self.retry_policy
+        attempts: Dict[str, int] = {}
+        last_errors: Dict[str, str] = {}
+        retry_heap: List[Tuple[float, int, str]] = []  # (ready_at, seq, image_file)
+        retry_seq = itertools.count()
+
         # Track concurrent uploads for visibility
-        active_uploads = 0
         max_concurrent_seen = 0
 
-        with ThreadPoolExecutor(max_workers=parallel_batch_size) as executor:
-            remaining: List[str] = list(files_to_upload)
+        with ThreadPoolExecutor(max_workers=pool_size) as executor:
+            remaining: Deque[str] = deque(files_to_upload)
             futures_map: Dict[concurrent.futures.Future, str] = {}
-            # Prime pool
-            for _ in range(min(parallel_batch_size, len(remaining))):
-                img = remaining.pop(0)
-                futures_map[executor.submit(upload_single_image, img)] = img
-                active_uploads += 1
 
+            def next_ready_file() -> Optional[str]:
+                # Due retries first so the gallery can finish as soon as possible
+                if retry_heap and retry_heap[0][0] <= time.monotonic():
+                    return heapq.heappop(retry_heap)[2]
+                return remaining.popleft() if remaining else None
+
+            def dispatch() -> None:
+                # Queue work up to the current limit if not soft-stopping
+                while len(futures_map) < in_flight_limit() and not maybe_soft_stopping():
+                    img = next_ready_file()
+                    if img is None:
+                        break
+                    attempts[img] = attempts.get(img, 0) + 1
+                    futures_map[executor.submit(upload_single_image, img, attempts[img])] = img
+
+            dispatch()
             max_concurrent_seen = len(futures_map)
-            #if on_log:
-            #    on_log(f"[concurrency] Primed pool with {len(futures_map)} initial uploads")
 
-            while futures_map:
+            while futures_map or (retry_heap and not maybe_soft_stopping()):
                 # Log current concurrency before waiting
                 current_active = len(futures_map)
                 if current_active > max_concurrent_seen:
                     max_concurrent_seen = current_active
-                done, _ = concurrent.futures.wait(list(futures_map.keys()), return_when=concurrent.futures.FIRST_COMPLETED)
+                # Wake up for completions or when the next retry is due
+                timeout = max(0.0, retry_heap[0][0] - time.monotonic()) if retry_heap else None
+                if futures_map:
+                    done, _ = concurrent.futures.wait(list(futures_map.keys()), timeout=timeout,
+                                                      return_when=concurrent.futures.FIRST_COMPLETED)
+                else:
+                    time.sleep(min(timeout or 0.0, 0.5))  # short naps keep soft stop responsive
+                    done = set()
                 for fut in done:
                     img = futures_map.pop(fut)
-                    active_uploads -= 1
-                    image_file, image_data, error, upload_duration, image_path = fut.result()
+                    image_file, image_data, error, upload_duration, image_path, error_class = fut.result()
+                    record_outcome(image_file, image_data, upload_duration, error_class)
+                    attempt = attempts.get(image_file, 1)
                     if image_data:
                         uploaded_images.append((image_file, image_data))
                         # Per-image success log (categorized)
@@ -380,70 +509,35 @@ class UploadEngine:
                             log(f"Uploaded (in {duration_str}s): {image_path}  ({img_url})", category="uploads:file")
                         except Exception:
                             pass
+                        if attempt > 1:
+                            log(f"[uploads] Retry successful: {image_file} (attempt {attempt})", level="info", category="uploads")
                         # Per-image callback for resume-aware consumers
                         if on_image_uploaded:
-                            try:
-                                size_bytes = os.path.getsize(os.path.join(folder_path, image_file))
-                            except Exception:
-                                size_bytes = 0
-                            on_image_uploaded(image_file, image_data, size_bytes)
+                            on_image_uploaded(image_file, image_data, _file_size(image_file))
                     else:
-                        failed_images.append((image_file, error or "unknown error"))
-                        # Log the failure immediately with clear error indication
-                        log(f"[uploads:file] ✗ Upload failed: {image_file} - {error or 'unknown error'}", level="warning", category="uploads:file")
+                        error = error or "unknown error"
+                        if retry_policy.should_retry(error_class) and attempt <= max_retries:
+                            delay = retry_policy.delay(attempt)
+                            last_errors[image_file] = error
+                            heapq.heappush(retry_heap, (time.monotonic() + delay, next(retry_seq), image_file))
+                            log(f"[uploads] Retrying {image_file} in {delay:.1f}s (attempt {attempt + 1}/{max_retries + 1}, {error_class}): {error}",
+                                level="info", category="uploads")
+                        else:
+                            failed_images.append((image_file, error))
+                            reason = (f"gave up after {attempt} attempts" if retry_policy.should_retry(error_class)
+                                      else f"not retried: {error_class}")
+                            # Log the failure immediately with clear error indication
+                            log(f"[uploads:file] ✗ Upload failed: {image_file} - {error} ({reason})", level="warning", category="uploads:file")
                     # Progress
                     completed_count = initial_completed + len(uploaded_images)
                     if on_progress:
                         percent = int((completed_count / max(original_total_images, 1)) * 100)
                         on_progress(completed_count, original_total_images, percent, image_file)
-                    # Queue next if not soft-stopping
-                    if remaining and not maybe_soft_stopping():
-                        nxt = remaining.pop(0)
-                        futures_map[executor.submit(upload_single_image, nxt)] = nxt
-                        active_uploads += 1
-
-        # Retries
-        retry_count = 0
-        while failed_images and retry_count < max_retries and not maybe_soft_stopping():
-            retry_count += 1
-            retry_failed: List[Tuple[str, str]] = []
-            log(f"[uploads] Retrying {len(failed_images)} failed uploads (attempt {retry_count}/{max_retries})", level="info", category="uploads")
-            with ThreadPoolExecutor(max_workers=parallel_batch_size) as executor:
-                remaining = [img for img, _ in failed_images]
-                futures_map = {executor.submit(upload_single_image, img): img for img in remaining[:parallel_batch_size]}
-                remaining = remaining[parallel_batch_size:]
-                while futures_map:
-                    done, _ = concurrent.futures.wait(list(futures_map.keys()), return_when=concurrent.futures.FIRST_COMPLETED)
-                    for fut in done:
-                        img = futures_map.pop(fut)
-                        image_file, image_data, error, upload_duration, image_path = fut.result()
-                        if image_data:
-                            uploaded_images.append((image_file, image_data))
-                            if on_image_uploaded:
-                                try:
-                                    size_bytes = os.path.getsize(os.path.join(folder_path, image_file))
-                                except Exception:
-                                    size_bytes = 0
-                                on_image_uploaded(image_file, image_data, size_bytes)
-                            # Per-image success log (retry path)
-                            try:
-                                img_url = image_data.get('image_url', '')
-                                duration_str = f"{upload_duration:.3f}" if upload_duration is not None else "?.???"
-                                log(f"Uploaded (in {duration_str}s): {image_path}  ({img_url})", category="uploads:file")
-                            except Exception:
-                                pass
-                            log(f"[uploads] Retry successful: {image_file}", level="info", category="uploads")
-                        else:
-                            retry_failed.append((image_file, error or "unknown error"))
-                            log(f"[uploads] ✗ Retry failed: {image_file} - {error or 'unknown error'}", level="warning", category="uploads")
-                        completed_count = initial_completed + len(uploaded_images)
-                        if on_progress:
-                            percent = int((completed_count / max(original_total_images, 1)) * 100)
-                            on_progress(completed_count, original_total_images, percent, image_file)
-                        if remaining:
-                            nxt = remaining.pop(0)
-                            futures_map[executor.submit(upload_single_image, nxt)] = nxt
-            failed_images = retry_failed
+                dispatch()
+
+        # Retries still waiting when a soft stop ended the loop count as failed
+        for _, _, image_file in sorted(retry_heap):
+            failed_images.append((image_file, last_errors.get(image_file, "unknown error")))
 
         # Log concurrency summary
         #if on_log:
@@ -457,12 +551,9 @@ class UploadEngine:
         # Stats
         end_time = time.time()
         upload_time = end_time - start_time
-        try:
-            uploaded_size = initial_uploaded_size + sum(
-                os.path.getsize(os.path.join(folder_path, img_file)) for img_file, _ in uploaded_images
-            )
-        except Exception:
-            uploaded_size = 0
+        uploaded_size = initial_uploaded_size + sum(
+            _file_size(img_file) for img_file, _ in uploaded_images
+        )
         transfer_speed = uploaded_size / upload_time if upload_time > 0 else 0
 
         # Dimensions: use precalculated if available, otherwise calculate from samples
@@ -484,10 +575,7 @@ class UploadEngine:
         # Attach filename and optional dims/sizes to each image entry for richer JSON (CLI parity)
         dims_by_name = image_dimensions_map
         for idx, (fname, data) in enumerate(uploaded_images):
-            try:
-                size_bytes = os.path.getsize(os.path.join(folder_path, fname))
-            except Exception:
-                size_bytes = 0
+            size_bytes = _file_size(fname)
             w, h = dims_by_name.get(fname, (0, 0))
             try:
                 base, ext = os.path.splitext(fname)
@@ -517,10 +605,7 @@ class UploadEngine:
             if preseed_images:
                 first_data = preseed_images[0]
                 fname = all_image_files[0]
-                try:
-                    size_bytes = os.path.getsize(os.path.join(folder_path, fname))
-                except Exception:
-                    size_bytes = 0
+                size_bytes = _file_size(fname)
                 w, h = dims_by_name.get(fname, (0, 0))
                 try:
                     base, ext = os.path.splitext(fname)
@@ -567,6 +652,8 @@ class UploadEngine:
             'thumbnail_size': thumbnail_size,
             'thumbnail_format': thumbnail_format,
             'parallel_batch_size': parallel_batch_size,
+            'concurrency_limit': in_flight_limit(),
+            'max_concurrent': max_concurrent_seen,
             'template_name': template_name,
             'total_images': original_total_images,
             'started_at': datetime.fromtimestamp(start_time).strftime('%Y-%m-%d %H:%M:%S'),
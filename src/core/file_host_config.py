@@ -235,6 +235,8 @@ _HARDCODED_DEFAULTS = {
     "bbcode_format": "",
     "spinup_retry_enabled": True,
     "spinup_retry_max_time": 1800,  # 30 minutes in seconds
+    "bandwidth_limit_kbps": 0,  # Upload ceiling for this host in KiB/s (0 = no host-specific limit)
+    "bandwidth_weight": 0,  # Share of the global limit relative to other services (0 = default weight)
 }
 
 
@@ -327,7 +329,8 @@ def save_file_host_setting(host_id: str, key: str, value: Any) -> None:
     # Validate key (whitelist approach)
     valid_keys = {"enabled", "trigger", "max_connections", "max_file_size_mb",
                   "auto_retry", "max_retries", "inactivity_timeout", "upload_timeout",
-                  "bbcode_format", "spinup_retry_enabled", "spinup_retry_max_time"}
+                  "bbcode_format", "spinup_retry_enabled", "spinup_retry_max_time",
+                  "bandwidth_limit_kbps", "bandwidth_weight"}
     if key not in valid_keys:
         raise ValueError(f"Invalid setting key: {key}")
 
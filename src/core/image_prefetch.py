@@ -0,0 +1,211 @@
+"""
+Read-ahead of gallery images for UploadEngine.
+
+Upload threads used to open and read each image only when its upload
+started, so on slow disks (USB HDDs, SMB shares) the read latency was added
+to every upload, and several threads reading different files at once made a
+rotational disk seek back and forth between them.
+
+An ImagePrefetcher reads the next images in upload order on one background
+thread into a buffer bounded by file count and bytes. Upload threads take
+the bytes of their image from the buffer and pass them to upload_image as
+file_data. An upload thread asking for an image the reader has not buffered
+yet waits for it if the reader will get there without running out of room;
+otherwise it reads the image itself as before (and the reader skips it).
+
+On rotational or unknown storage access is kept sequential: upload threads
+wait for any image within the read-ahead window instead of reading it in
+parallel with the reader, and only the file being read is hinted to the
+kernel (POSIX_FADV_WILLNEED, where os.posix_fadvise is available). On
+non-rotational storage upload threads only wait for the image the reader is
+on, and the hints cover the whole window so the kernel fetches in parallel.
+"""
+
+from __future__ import annotations
+
+import os
+import threading
+from typing import Dict, List, Optional, Sequence, Set
+
+from src.utils.logger import log
+
+DEFAULT_PREFETCH_DEPTH = 8                      # files buffered ahead of the uploads
+DEFAULT_PREFETCH_MAX_BYTES = 128 * 1024 * 1024  # memory bound of the buffer
+
+
+def is_rotational(path: str) -> Optional[bool]:
+    """Whether path lives on a rotational disk; None if it cannot be told (non-Linux, network shares)."""
+    try:
+        dev = os.stat(path).st_dev
+        block = f"/sys/dev/block/{os.major(dev)}:{os.minor(dev)}"
+        for candidate in (block, os.path.join(block, "..")):  # partitions keep queue/ on the parent disk
+            flag = os.path.join(candidate, "queue", "rotational")
+            if os.path.exists(flag):
+                with open(flag) as f:
+                    return f.read().strip() == "1"
+    except (OSError, AttributeError, ValueError):
+        pass
+    return None
+
+
+def _advise_willneed(path: str) -> None:
+    """Ask the kernel to start reading path into the page cache (no-op where unsupported)."""
+    try:
+        fd = os.open(path, os.O_RDONLY)
+    except OSError:
+        return
+    try:
+        os.posix_fadvise(fd, 0, 0, os.POSIX_FADV_WILLNEED)
+    except OSError:
+        pass
+    finally:
+        os.close(fd)
+
+
+class ImagePrefetcher:
+    """Reads a gallery's images ahead of the upload threads into a bounded buffer."""
+
+    def __init__(self, folder_path: str, depth: int = DEFAULT_PREFETCH_DEPTH,
+                 max_bytes: int = DEFAULT_PREFETCH_MAX_BYTES, sequential: Optional[bool] = None):
+        """
+        Args:
+            folder_path: Gallery folder the images are read from
+            depth: Maximum number of files held in the buffer
+            max_bytes: Maximum bytes held in the buffer (a single larger file is still read)
+            sequential: Keep disk access sequential (see module docstring); detected from the disk if None
+        """
+        self.folder_path = folder_path
+        self.depth = max(1, depth)
+        self.max_bytes = max_bytes
+        if sequential is None:
+            sequential = is_rotational(folder_path) is not False
+        self.sequential = sequential
+        self.hits = 0               # images taken from the buffer
+        self.misses = 0             # images the upload thread had to read itself
+        self.bytes_prefetched = 0
+        self._files: List[str] = []
+        self._position: Dict[str, int] = {}
+        self._next = 0              # index of the file the reader is on
+        self._pending_size: Optional[int] = None  # size of the file waiting for room in the buffer
+        self._buffer: Dict[str, bytes] = {}
+        self._buffered_bytes = 0
+        self._claimed: Set[str] = set()  # taken (or left to the upload thread); never buffered again
+        self._reading: Optional[str] = None
+        self._closed = False
+        self._cond = threading.Condition()
+        self._thread: Optional[threading.Thread] = None
+
+    def start(self, files: Sequence[str]) -> None:
+        """Start reading files (names inside folder_path) in the given order."""
+        self._files = list(files)
+        self._position = {name: index for index, name in enumerate(self._files)}
+        self._thread = threading.Thread(target=self._run, daemon=True,
+                                        name=f"prefetch-{os.path.basename(self.folder_path)}")
+        self._thread.start()
+
+    def take(self, name: str) -> Optional[bytes]:
+        """Bytes of an image, or None if the caller has to read it itself."""
+        with self._cond:
+            while self._is_coming(name):
+                self._cond.wait()
+            if name in self._claimed:
+                return None  # Retry of an image already handed out
+            self._claimed.add(name)
+            self._cond.notify_all()
+            data = self._buffer.pop(name, None)
+            if data is None:
+                self.misses += 1
+                return None
+            self._buffered_bytes -= len(data)
+            self.hits += 1
+            return data
+
+    def close(self) -> None:
+        """Stop reading and drop buffered images."""
+        with self._cond:
+            if self._closed:
+                return
+            self._closed = True
+            self._buffer.clear()
+            self._buffered_bytes = 0
+            self._cond.notify_all()
+        if self._thread is not None:
+            self._thread.join(timeout=5.0)
+            log(f"Prefetch of {os.path.basename(self.folder_path)}: {self.hits} from memory, "
+                f"{self.misses} read by upload threads ({'sequential' if self.sequential else 'parallel'} hints)",
+                level="debug", category="fileio")
+
+    def __enter__(self) -> "ImagePrefetcher":
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        self.close()
+
+    def _is_coming(self, name: str) -> bool:
+        """Whether the caller should wait for the reader to buffer name."""
+        if self._closed or name in self._claimed:
+            return False
+        if self._reading == name:
+            return True
+        position = self._position.get(name, -1)
+        window = self.depth if self.sequential else 1
+        if not self._next <= position < self._next + window:
+            return False
+        return self._pending_size is None or self._has_room(self._pending_size)
+
+    def _has_room(self, size: int) -> bool:
+        if not self._buffer:
+            return True
+        return len(self._buffer) < self.depth and self._buffered_bytes + size <= self.max_bytes
+
+    def _advance(self, index: int) -> None:
+        with self._cond:
+            self._next = index
+            self._cond.notify_all()
+
+    def _run(self) -> None:
+        try:
+            self._read_all()
+        finally:
+            self._advance(len(self._files))
+
+    def _read_all(self) -> None:
+        advise = hasattr(os, 'posix_fadvise')
+        hinted = 0  # files[:hinted] have been hinted
+        for index, name in enumerate(self._files):
+            path = os.path.join(self.folder_path, name)
+            try:
+                size = os.path.getsize(path)
+            except OSError:
+                self._advance(index + 1)
+                continue  # The upload thread reports the error
+            with self._cond:
+                self._pending_size = size
+                self._cond.notify_all()  # Waiting callers re-check whether the reader has room
+                while not self._closed and name not in self._claimed and not self._has_room(size):
+                    self._cond.wait()
+                self._pending_size = None
+                if self._closed:
+                    return
+                if name in self._claimed:
+                    self._next = index + 1
+                    continue
+                self._reading = name
+            if advise:
+                window = 1 if self.sequential else self.depth
+                for ahead in self._files[max(hinted, index):index + window]:
+                    _advise_willneed(os.path.join(self.folder_path, ahead))
+                hinted = max(hinted, index + window)
+            try:
+                with open(path, 'rb') as f:
+                    data: Optional[bytes] = f.read()
+            except OSError:
+                data = None
+            with self._cond:
+                self._reading = None
+                self._next = index + 1
+                if data is not None and not self._closed:
+                    self._buffer[name] = data
+                    self._buffered_bytes += len(data)
+                    self.bytes_prefetched += len(data)
+                self._cond.notify_all()
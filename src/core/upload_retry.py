@@ -0,0 +1,133 @@
+"""
+Per-file retry policy for UploadEngine.
+
+Failed uploads are classified so that only transient problems are retried,
+and each retry is delayed with exponential backoff and jitter so a burst of
+failures does not hit the server again all at once.
+"""
+
+from __future__ import annotations
+
+import json
+import random
+import re
+import sys
+from dataclasses import dataclass, field
+from typing import Any, Optional
+
+from src.utils.logger import log
+
+# Error classes
+ERROR_TIMEOUT = "timeout"              # connect/read timeout
+ERROR_CONNECTION = "connection"        # connection refused/reset, DNS, other network errors
+ERROR_SERVER = "server"                # HTTP 5xx or unparseable response
+ERROR_RATE_LIMITED = "rate_limited"    # HTTP 429
+ERROR_API = "api"                      # imx.to API returned status=error
+ERROR_INVALID_FILE = "invalid_file"    # missing/unreadable file or rejected by the server
+ERROR_INTERNAL = "internal"            # programming error in the upload path
+ERROR_UNKNOWN = "unknown"
+
+RETRYABLE_ERRORS = frozenset({
+    ERROR_TIMEOUT, ERROR_CONNECTION, ERROR_SERVER, ERROR_RATE_LIMITED, ERROR_API, ERROR_UNKNOWN,
+})
+
+# Setting (INI [Advanced] section) used as the first retry delay
+SETTING_RETRY_DELAY = "uploads/retry_delay_seconds"
+
+_STATUS_RE = re.compile(r"status code (\d{3})")
+_INVALID_FILE_HINTS = ("invalid", "not allowed", "too large", "unsupported", "not an image", "corrupt")
+
+
+def classify_upload_error(exc: Optional[BaseException] = None,
+                          response: Optional[Any] = None) -> str:
+    """Classify a failed image upload.
+
+    Args:
+        exc: Exception raised by upload_image, if any
+        response: API response dict when upload_image returned status != success
+
+    Returns:
+        One of the ERROR_* classes
+    """
+    if exc is not None:
+        # requests is not imported here; an exception can only be one of its types once it is loaded
+        requests = sys.modules.get('requests')
+        if requests is not None:
+            if isinstance(exc, requests.Timeout):
+                return ERROR_TIMEOUT
+            if isinstance(exc, requests.RequestException):
+                return ERROR_CONNECTION
+        if isinstance(exc, (FileNotFoundError, IsADirectoryError, PermissionError, KeyError)):
+            return ERROR_INVALID_FILE
+        if isinstance(exc, TimeoutError):
+            return ERROR_TIMEOUT
+        if isinstance(exc, json.JSONDecodeError):
+            return ERROR_SERVER
+        if isinstance(exc, ConnectionError):
+            return ERROR_CONNECTION
+        if isinstance(exc, (TypeError, AttributeError, NameError, AssertionError)):
+            return ERROR_INTERNAL
+        message = str(exc)
+        lowered = message.lower()
+        if "timeout" in lowered or "timed out" in lowered:
+            return ERROR_TIMEOUT
+        match = _STATUS_RE.search(message)
+        if match:
+            status = int(match.group(1))
+            if status == 429:
+                return ERROR_RATE_LIMITED
+            if status >= 500:
+                return ERROR_SERVER
+            if status in (400, 413, 415, 422):
+                return ERROR_INVALID_FILE
+            return ERROR_UNKNOWN
+        if "connection" in lowered or "network error" in lowered or "resolve" in lowered:
+            return ERROR_CONNECTION
+        if isinstance(exc, OSError):
+            return ERROR_INVALID_FILE
+        return ERROR_UNKNOWN
+
+    if isinstance(response, dict):
+        message = str(response.get('message') or response.get('error') or '').lower()
+        if any(hint in message for hint in _INVALID_FILE_HINTS):
+            return ERROR_INVALID_FILE
+        return ERROR_API
+    return ERROR_UNKNOWN
+
+
+@dataclass
+class RetryPolicy:
+    """Exponential backoff with jitter for per-file retries.
+
+    The delay before retry n (1-based) is base_delay * 2**(n-1), capped at
+    max_delay; with jitter the actual delay is drawn from the upper half of
+    that range so retries of files that failed together spread out.
+    """
+    base_delay: float = 1.0
+    max_delay: float = 60.0
+    jitter: bool = True
+    rng: random.Random = field(default_factory=random.Random, repr=False)
+
+    def delay(self, retry_number: int) -> float:
+        """Seconds to wait before the given retry (1 = first retry)."""
+        delay = min(self.max_delay, self.base_delay * (2 ** max(0, retry_number - 1)))
+        if self.jitter:
+            delay = delay / 2 + self.rng.uniform(0, delay / 2)
+        return max(0.0, delay)
+
+    @staticmethod
+    def should_retry(error_class: str) -> bool:
+        """Whether an error of this class is worth retrying."""
+        return error_class in RETRYABLE_ERRORS
+
+
+def load_retry_policy() -> RetryPolicy:
+    """Retry policy using the first retry delay from Settings > Advanced."""
+    try:
+        from bbdrop import read_config
+        config = read_config()
+        base_delay = config.getfloat('Advanced', SETTING_RETRY_DELAY, fallback=5.0)
+    except Exception as e:
+        log(f"Could not load retry delay setting: {e}", level="warning", category="uploads")
+        base_delay = 5.0
+    return RetryPolicy(base_delay=max(0.0, base_delay))
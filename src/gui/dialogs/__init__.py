@@ -1,9 +1,27 @@
 # Dialog windows
+#
+# Dialogs are imported on first attribute access, so importing one dialog
+# module (e.g. src.gui.dialogs.log_viewer) does not load all the others.
 
-from .credential_setup import CredentialSetupDialog
-from .unrenamed_galleries import UnrenamedGalleriesDialog
-from .image_status_dialog import ImageStatusDialog
-from .image_status_checker import ImageStatusChecker
-from .update_dialog import UpdateDialog
-from .proxy_pool_dialog import ProxyPoolDialog
-from .proxy_bulk_import_dialog import ProxyBulkImportDialog
+import importlib
+
+_LAZY_DIALOGS = {
+    'CredentialSetupDialog': 'credential_setup',
+    'UnrenamedGalleriesDialog': 'unrenamed_galleries',
+    'ImageStatusDialog': 'image_status_dialog',
+    'ImageStatusChecker': 'image_status_checker',
+    'UpdateDialog': 'update_dialog',
+    'ProxyPoolDialog': 'proxy_pool_dialog',
+    'ProxyBulkImportDialog': 'proxy_bulk_import_dialog',
+}
+
+__all__ = list(_LAZY_DIALOGS)
+
+
+def __getattr__(name):
+    module_name = _LAZY_DIALOGS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(f".{module_name}", __name__), name)
+    globals()[name] = value
+    return value
@@ -11,6 +11,8 @@ from PyQt6.QtWidgets import (
 )
 from PyQt6.QtCore import Qt
 
+from src.utils.archive_utils import is_archive_gallery_path, get_archive_gallery_name
+
 
 class ArchiveFolderSelector(QDialog):
     """Dialog for selecting folders from extracted archive"""
@@ -48,7 +50,11 @@ class ArchiveFolderSelector(QDialog):
         self.list_widget.setSelectionMode(QListWidget.SelectionMode.ExtendedSelection)
 
         for folder in self.folders:
-            item = QListWidgetItem(str(folder.name))
+            if is_archive_gallery_path(folder):
+                label = get_archive_gallery_name(folder)
+            else:
+                label = str(folder.name)
+            item = QListWidgetItem(label)
             item.setData(Qt.ItemDataRole.UserRole, folder)
             self.list_widget.addItem(item)
 
@@ -397,7 +397,8 @@ def show_duplicate_detection_dialogs(
     folders_to_add: List[str], 
     check_gallery_exists_func, 
     queue_manager, 
-    parent=None
+    parent=None,
+    check_galleries_exist_batch_func=None
 ) -> Tuple[List[str], List[str]]:
     """
     Show appropriate duplicate detection dialogs and return lists of folders to process.
@@ -407,6 +408,9 @@ def show_duplicate_detection_dialogs(
         check_gallery_exists_func: Function to check if gallery files exist
         queue_manager: Queue manager to check for existing items
         parent: Parent widget for dialogs
+        check_galleries_exist_batch_func: Optional function taking a list of folder
+            paths and returning {path: existing_files}. When given, all folders are
+            checked in one batch instead of calling check_gallery_exists_func per folder.
         
     Returns:
         Tuple of (folders_to_add_normally, folders_to_replace_in_queue)
@@ -415,6 +419,11 @@ def show_duplicate_detection_dialogs(
     previously_uploaded = []
     already_in_queue = []
     folders_to_add_normally = []
+
+    batch_existing = None
+    if check_galleries_exist_batch_func is not None:
+        candidates = [p for p in folders_to_add if not queue_manager.get_item(p)]
+        batch_existing = check_galleries_exist_batch_func(candidates) if candidates else {}
     
     for folder_path in folders_to_add:
         folder_name = os.path.basename(folder_path)
@@ -430,7 +439,10 @@ def show_duplicate_detection_dialogs(
             continue
         
         # Check if previously uploaded
-        existing_files = check_gallery_exists_func(folder_name)
+        if batch_existing is not None:
+            existing_files = batch_existing.get(folder_path, [])
+        else:
+            existing_files = check_gallery_exists_func(folder_name)
         if existing_files:
             previously_uploaded.append({
                 'path': folder_path,
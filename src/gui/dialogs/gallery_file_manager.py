@@ -5,6 +5,7 @@ Allows users to add/remove files from galleries and view file details
 
 import os
 import shutil
+import zipfile
 from pathlib import Path
 from typing import List, Optional, Set
 
@@ -18,6 +19,8 @@ from PyQt6.QtGui import QIcon, QPixmap, QDragEnterEvent, QDropEvent, QImage
 from PyQt6.QtNetwork import QNetworkAccessManager, QNetworkRequest
 
 from src.core.constants import IMAGE_EXTENSIONS
+from src.services.archive_source import ArchiveImageSource
+from src.utils.archive_utils import get_archive_gallery_name, is_archive_gallery_path
 from src.utils.logger import log
 
 
@@ -27,11 +30,24 @@ class FileScanner(QThread):
     file_scanned = pyqtSignal(str, bool, str)  # filename, is_valid, error_msg
     finished = pyqtSignal()
     
-    def __init__(self, folder_path: str, files: List[str]):
+    def __init__(self, folder_path: str, files: List[str],
+                 source: Optional[ArchiveImageSource] = None):
         super().__init__()
         self.folder_path = folder_path
         self.files = files
+        self.source = source
+        self._archive_files = set(source.list_images()) if source is not None else set()
         self._stop = False
+
+    def _exists(self, filename: str) -> bool:
+        if self.source is not None:
+            return filename in self._archive_files
+        return os.path.exists(os.path.join(self.folder_path, filename))
+
+    def _open(self, filename: str):
+        if self.source is not None:
+            return self.source.open(filename)
+        return open(os.path.join(self.folder_path, filename), 'rb')
     
     def run(self):
         """Scan files for validity - quick imghdr check with PIL fallback verification"""
@@ -43,13 +59,12 @@ class FileScanner(QThread):
             if self._stop:
                 break
 
-            filepath = os.path.join(self.folder_path, filename)
             is_valid = True
             error_msg = ""
 
             try:
                 # Check if file exists
-                if not os.path.exists(filepath):
+                if not self._exists(filename):
                     is_valid = False
                     error_msg = "File not found"
                 # Check if it's an image extension
@@ -58,11 +73,11 @@ class FileScanner(QThread):
                     error_msg = "Not an image file"
                 else:
                     # Quick validation with imghdr first
-                    with open(filepath, 'rb') as f:
+                    with self._open(filename) as f:
                         if not imghdr.what(f):
                             # imghdr failed - verify with PIL (more robust for some formats)
                             try:
-                                with Image.open(filepath) as img:
+                                with self._open(filename) as raw, Image.open(raw) as img:
                                     img.verify()  # Checks image integrity
                                     # Note: verify() will raise exception for truncated/corrupt files
                                 # PIL validation passed - image is actually valid
@@ -94,6 +109,7 @@ class GalleryFileManagerDialog(QDialog):
         self.gallery_item = queue_manager.get_item(gallery_path)
         self.modified: bool = False
         self.scanner: Optional[FileScanner] = None
+        self.archive_source: Optional[ArchiveImageSource] = None
         self._scan_progress_dialog: Optional[QProgressDialog] = None
 
         # Track original and current files
@@ -111,7 +127,11 @@ class GalleryFileManagerDialog(QDialog):
     
     def setup_ui(self):
         """Setup the dialog UI"""
-        self.setWindowTitle(f"Manage Files - {os.path.basename(self.gallery_path)}")
+        if is_archive_gallery_path(self.gallery_path):
+            title = get_archive_gallery_name(self.gallery_path)
+        else:
+            title = os.path.basename(self.gallery_path)
+        self.setWindowTitle(f"Manage Files - {title}")
         self.setModal(True)
         self.resize(800, 600)
         
@@ -254,6 +274,10 @@ class GalleryFileManagerDialog(QDialog):
                     log(f"Failed to load artifact: {e}", level="error", category="ui")
                     # Fall through to folder scan
 
+        if is_archive_gallery_path(self.gallery_path):
+            self.load_from_archive()
+            return
+
         # Fallback: scan folder for non-completed or if artifact not found
         if not os.path.exists(self.gallery_path):
             QMessageBox.warning(self, "Error", "Gallery folder does not exist")
@@ -268,6 +292,25 @@ class GalleryFileManagerDialog(QDialog):
         # Start scanning files
         self.scan_files(files)
 
+    def load_from_archive(self):
+        """Load files of a gallery read directly from an archive (read-only)"""
+        try:
+            self.archive_source = ArchiveImageSource.from_gallery_path(self.gallery_path)
+        except (OSError, zipfile.BadZipFile) as e:
+            log(f"Failed to open gallery archive: {e}", level="error", category="ui")
+            QMessageBox.warning(self, "Error", "Gallery archive could not be opened")
+            return
+
+        # Files inside an archive can't be added or deleted in place
+        self.add_btn.setEnabled(False)
+        self.add_btn.setToolTip("Cannot modify galleries inside an archive")
+        self.remove_btn.setToolTip("Cannot modify galleries inside an archive")
+        self.file_list.setAcceptDrops(False)
+
+        files = sorted(self.archive_source.list_images())
+        self.original_files.update(files)
+        self.scan_files(files)
+
     def load_from_artifact(self):
         """Load files from artifact data for completed galleries"""
         if not self.artifact_data:
@@ -311,7 +354,7 @@ class GalleryFileManagerDialog(QDialog):
         self._scan_progress_dialog = QProgressDialog("Scanning files...", "Cancel", 0, len(files), self)
         self._scan_progress_dialog.setWindowModality(Qt.WindowModality.WindowModal)
 
-        self.scanner = FileScanner(self.gallery_path, files)
+        self.scanner = FileScanner(self.gallery_path, files, self.archive_source)
         self.scanner.progress.connect(self._on_scan_progress)
         self.scanner.file_scanned.connect(self.on_file_scanned)
         self.scanner.finished.connect(self._on_scan_finished)
@@ -412,7 +455,7 @@ class GalleryFileManagerDialog(QDialog):
     def on_selection_changed(self):
         """Handle file selection change"""
         selected = self.file_list.selectedItems()
-        self.remove_btn.setEnabled(len(selected) > 0)
+        self.remove_btn.setEnabled(len(selected) > 0 and self.archive_source is None)
         
         # Update details
         if len(selected) == 1:
@@ -468,13 +511,19 @@ class GalleryFileManagerDialog(QDialog):
                 return
 
         # Fallback: show local file details for non-completed galleries
-        filepath = os.path.join(self.gallery_path, filename)
+        source = self.archive_source
+        if source is not None:
+            filepath = f"{self.gallery_path}/{filename}"
+            exists = filename in source.list_images()
+        else:
+            filepath = os.path.join(self.gallery_path, filename)
+            exists = os.path.exists(filepath)
 
         details = f"<b>File:</b> {filename}<br><br>"
 
-        if os.path.exists(filepath):
-            stat = os.stat(filepath)
-            size_mb = stat.st_size / (1024 * 1024)
+        if exists:
+            size = source.get_size(filename) if source is not None else os.stat(filepath).st_size
+            size_mb = size / (1024 * 1024)
             details += f"<b>Size:</b> {size_mb:.2f} MB<br>"
             details += f"<b>Path:</b> {filepath}<br><br>"
 
@@ -487,7 +536,8 @@ class GalleryFileManagerDialog(QDialog):
                     # Try to get dimensions
                     try:
                         from PIL import Image
-                        with Image.open(filepath) as img:
+                        image_file = source.open(filename) if source is not None else open(filepath, 'rb')
+                        with image_file, Image.open(image_file) as img:
                             details += f"<b>Dimensions:</b> {img.width} x {img.height}<br>"
                             details += f"<b>Format:</b> {img.format}<br>"
                     except (OSError, IOError):
@@ -686,9 +736,16 @@ class GalleryFileManagerDialog(QDialog):
         if added_count > 0:
             self.update_info_label()
     
+    def _close_archive_source(self) -> None:
+        """Close the archive opened for an archive gallery"""
+        if self.archive_source is not None:
+            self.archive_source.close()
+            self.archive_source = None
+
     def accept(self):
         """Accept changes and close dialog"""
         self._cleanup_scanner()
+        self._close_archive_source()
         if self.modified:
             # Update queue manager if needed
             if self.gallery_item:
@@ -710,9 +767,11 @@ class GalleryFileManagerDialog(QDialog):
     def reject(self):
         """Handle dialog rejection/cancel"""
         self._cleanup_scanner()
+        self._close_archive_source()
         super().reject()
 
     def closeEvent(self, event):
         """Handle dialog close event"""
         self._cleanup_scanner()
+        self._close_archive_source()
         super().closeEvent(event)
\ No newline at end of file
@@ -269,8 +269,7 @@ class LogSettingsWidget(QWidget):
         """Open the log viewer dialog"""
         try:
             from src.gui.dialogs.log_viewer import LogViewerDialog
-            initial_text = self._logger.read_current_log(tail_bytes=2 * 1024 * 1024) if self._logger else ""
-            dialog = LogViewerDialog(initial_text, self)
+            dialog = LogViewerDialog(parent=self)
             dialog.exec()
         except Exception:
             pass
@@ -2,24 +2,251 @@
 """
 Log Viewer Dialog for bbdrop application
 Provides log viewing, filtering, and configuration capabilities
+
+Log files are not loaded into the view. A LogLineIndex (src.utils.log_index)
+records line offsets in a background thread, LogTableModel reads the rows
+that are on screen, and level/category/find filters run in the same thread,
+delivering matching line numbers in chunks. Follow mode indexes only the
+bytes appended to the file since the last check.
 """
 
 import os
-from typing import Any, Dict
+import threading
+from array import array
+from typing import Any, Dict, List, Optional, Set, Tuple
 
 from PyQt6.QtWidgets import (
-    QDialog, QVBoxLayout, QHBoxLayout, QGroupBox, QGridLayout, QCheckBox,
-    QComboBox, QSpinBox, QLabel, QPushButton, QTabWidget, QWidget,
-    QTableWidget, QTableWidgetItem, QLineEdit, QDialogButtonBox, QHeaderView, QAbstractItemView, QApplication
+    QDialog, QVBoxLayout, QHBoxLayout, QCheckBox, QComboBox, QLabel, QPushButton, QWidget,
+    QTableView, QLineEdit, QDialogButtonBox, QHeaderView, QAbstractItemView, QApplication
 )
-from PyQt6.QtCore import Qt, QSettings
+from PyQt6.QtCore import Qt, QSettings, QThread, QTimer, QAbstractTableModel, QModelIndex, pyqtSignal
 from PyQt6.QtGui import QFont
-from src.gui.widgets.custom_widgets import CopyableLogTableWidget
 from src.utils.logger import log
+from src.utils.log_index import (
+    LEVEL_VALUES, IndexCancelled, LogLineIndex, LogQuery, decode_unicode, find_matches, parse_log_line
+)
+
+# Map filter choices to minimum level
+LEVEL_FILTER_MINIMUMS = {
+    "TRACE+": 5,
+    "DEBUG+": 10,
+    "INFO+": 20,
+    "WARNING+": 30,
+    "ERROR+": 40
+}
+
+FOLLOW_INTERVAL_MS = 1000
+MAX_LIVE_ENTRIES = 50000
+
+# (timestamp, level, category, message)
+LogEntry = Tuple[str, str, str, str]
+
+
+class LogTableModel(QAbstractTableModel):
+    """Log rows, newest first: live messages, then lines of a LogLineIndex.
+
+    Only line numbers are stored per row; text is read from the index and
+    parsed when a row is painted.
+    """
+
+    COLUMNS = ["Timestamp", "Level", "Category", "Message"]
+    _PARSED_CACHE_LIMIT = 4096
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._index: Optional[LogLineIndex] = None
+        self._lines = array('q')                      # indexed line numbers, newest first
+        self._live: List[Tuple[int, LogEntry]] = []   # (sequence, entry), newest first
+        self._live_seq = 0
+        self._parsed: Dict[int, LogEntry] = {}
+        self._expanded: Set[int] = set()              # row keys showing line breaks
+
+    # Qt model interface
+
+    def rowCount(self, parent=QModelIndex()) -> int:
+        return 0 if parent.isValid() else len(self._live) + len(self._lines)
+
+    def columnCount(self, parent=QModelIndex()) -> int:
+        return 0 if parent.isValid() else len(self.COLUMNS)
+
+    def data(self, index: QModelIndex, role: int = Qt.ItemDataRole.DisplayRole):
+        if not index.isValid():
+            return None
+        row, column = index.row(), index.column()
+        if role == Qt.ItemDataRole.DisplayRole:
+            entry = self.entry(row)
+            if entry is None:
+                return None
+            text = entry[column]
+            if column == 3 and self.row_key(row) in self._expanded:
+                text = text.replace('\\n', '\n')
+            return text
+        if role == Qt.ItemDataRole.TextAlignmentRole and column == 3 and self.row_key(row) in self._expanded:
+            return Qt.AlignmentFlag.AlignLeft | Qt.AlignmentFlag.AlignTop
+        return None
+
+    def headerData(self, section: int, orientation: Qt.Orientation, role: int = Qt.ItemDataRole.DisplayRole):
+        if role != Qt.ItemDataRole.DisplayRole:
+            return None
+        if orientation == Qt.Orientation.Horizontal:
+            return self.COLUMNS[section] if 0 <= section < len(self.COLUMNS) else None
+        return str(section + 1)
+
+    # Row access
+
+    def entry(self, row: int) -> Optional[LogEntry]:
+        """Parsed (timestamp, level, category, message) shown in a row."""
+        live_count = len(self._live)
+        if 0 <= row < live_count:
+            return self._live[row][1]
+        row -= live_count
+        if not 0 <= row < len(self._lines) or self._index is None:
+            return None
+        lineno = self._lines[row]
+        entry = self._parsed.get(lineno)
+        if entry is None:
+            timestamp, level, category, message = parse_log_line(self._index.line(lineno))
+            entry = (timestamp, level, category, decode_unicode(message))
+            if len(self._parsed) >= self._PARSED_CACHE_LIMIT:
+                self._parsed.clear()
+            self._parsed[lineno] = entry
+        return entry
+
+    def row_key(self, row: int) -> int:
+        """Stable identity of a row while rows are inserted above it."""
+        live_count = len(self._live)
+        if row < live_count:
+            return -1 - self._live[row][0]
+        return self._lines[row - live_count]
+
+    # Updates
+
+    def set_index(self, index: Optional[LogLineIndex]) -> None:
+        self.beginResetModel()
+        self._index = index
+        self._lines = array('q')
+        self._live = []
+        self._parsed.clear()
+        self._expanded.clear()
+        self.endResetModel()
+
+    def reset_rows(self, live_entries: List[LogEntry] = ()) -> None:
+        """Drop all rows, keeping the index; live_entries are newest first."""
+        self.beginResetModel()
+        self._lines = array('q')
+        self._live = []
+        self._expanded.clear()
+        self._push_live(live_entries)
+        self.endResetModel()
+
+    def append_lines(self, lines: List[int]) -> None:
+        """Add older indexed lines below the current rows."""
+        if not lines:
+            return
+        first = self.rowCount()
+        self.beginInsertRows(QModelIndex(), first, first + len(lines) - 1)
+        self._lines.extend(lines)
+        self.endInsertRows()
+
+    def prepend_lines(self, lines: List[int]) -> None:
+        """Add newly appended indexed lines (newest first) above the older ones."""
+        if not lines:
+            return
+        first = len(self._live)
+        self.beginInsertRows(QModelIndex(), first, first + len(lines) - 1)
+        self._lines[0:0] = array('q', lines)
+        self.endInsertRows()
+
+    def add_live(self, entries: List[LogEntry]) -> None:
+        """Add live messages (newest first) at the top."""
+        if not entries:
+            return
+        self.beginInsertRows(QModelIndex(), 0, len(entries) - 1)
+        self._push_live(entries)
+        self.endInsertRows()
+
+    def trim_live(self, limit: int) -> None:
+        """Drop the oldest live messages beyond limit."""
+        if len(self._live) <= limit:
+            return
+        self.beginRemoveRows(QModelIndex(), limit, len(self._live) - 1)
+        del self._live[limit:]
+        self.endRemoveRows()
+
+    def _push_live(self, entries) -> None:
+        entries = list(entries)
+        start = self._live_seq
+        self._live_seq += len(entries)
+        # Highest sequence number on the newest entry
+        self._live[0:0] = [(start + len(entries) - 1 - i, entry) for i, entry in enumerate(entries)]
+
+    def set_expanded(self, rows: Set[int]) -> None:
+        """Show line breaks in the messages of these rows only."""
+        keys = {self.row_key(row) for row in rows if 0 <= row < self.rowCount()}
+        if keys == self._expanded:
+            return
+        self._expanded = keys
+        if self.rowCount():
+            self.dataChanged.emit(self.index(0, 3), self.index(self.rowCount() - 1, 3))
+
+
+class LogQueryThread(QThread):
+    """Builds/updates a LogLineIndex and searches it off the GUI thread."""
+
+    MODE_SEARCH = "search"   # (re)index if needed, then search every line
+    MODE_FOLLOW = "follow"   # index appended bytes, search only the new lines
+
+    indexed = pyqtSignal(int, int)             # generation, lines indexed
+    rows_found = pyqtSignal(int, object, bool) # generation, line numbers (newest first), prepend
+    source_replaced = pyqtSignal(int)          # generation; file was rotated or truncated
+
+    def __init__(self, index: LogLineIndex, query: LogQuery, generation: int,
+                 mode: str = MODE_SEARCH, index_ready: bool = False):
+        super().__init__()
+        self.index = index
+        self.query = query
+        self.generation = generation
+        self.mode = mode
+        self.index_ready = index_ready
+        self._stop = False
+
+    def stop(self):
+        self._stop = True
+
+    def _should_stop(self) -> bool:
+        return self._stop
+
+    def run(self):
+        try:
+            if self.mode == self.MODE_FOLLOW:
+                span = self.index.update(self._should_stop)
+                if span is None:
+                    self.source_replaced.emit(self.generation)
+                    return
+                matches = [lineno for chunk in find_matches(self.index, self.query, span[0], span[1],
+                                                            should_stop=self._should_stop)
+                           for lineno in chunk]
+                if matches and not self._stop:
+                    self.rows_found.emit(self.generation, matches, True)
+                return
+
+            if not self.index_ready or self.index.update(self._should_stop) is None:
+                self.index.build(self._should_stop)
+                self.indexed.emit(self.generation, len(self.index))
+            for chunk in find_matches(self.index, self.query, 0, len(self.index),
+                                      should_stop=self._should_stop):
+                self.rows_found.emit(self.generation, chunk, False)
+        except IndexCancelled:
+            pass
+        except Exception as e:
+            log(f"Log viewer query failed: {e}", level="error", category="ui")
 
 
 class LogViewerDialog(QDialog):
     """Popout viewer for application logs."""
+
+    _live_pending = pyqtSignal()
+
     def __init__(self, initial_text: str = "", parent=None):
         super().__init__(parent)
         self.setWindowTitle("Log Viewer")
@@ -29,6 +256,17 @@ class LogViewerDialog(QDialog):
 
         self.follow_enabled = True
 
+        # Index, query thread and live messages
+        self._index: Optional[LogLineIndex] = None
+        self._source_key: Optional[Tuple] = None
+        self._index_ready = False
+        self._generation = 0
+        self._query_thread: Optional[LogQueryThread] = None
+        self._live_entries: List[LogEntry] = []       # unfiltered, oldest first
+        self._pending_live: List[LogEntry] = []
+        self._pending_lock = threading.Lock()
+        self._closed = False
+
         layout = QVBoxLayout(self)
 
         # Prepare logger for reading logs
@@ -93,24 +331,24 @@ class LogViewerDialog(QDialog):
         self.cmb_level_filter = QComboBox()
         self.cmb_level_filter.addItems(["All", "TRACE+", "DEBUG+", "INFO+", "WARNING+", "ERROR+"])
         self.cmb_level_filter.setToolTip("Filter by minimum log level")
-        
+
         # Load saved level filter from QSettings
         settings = QSettings("bbdrop", "bbdrop")
         settings.beginGroup("log_viewer")
         saved_level = settings.value("level_filter", "INFO+")
         settings.endGroup()
         self.cmb_level_filter.setCurrentText(saved_level)
-        
+
         filters_bar.addWidget(self.cmb_level_filter)
 
         filters_bar.addStretch()
         logs_vbox.addLayout(filters_bar)
 
-        # Body: log view table with timestamp, level, category, message columns
+        # Body: log view with timestamp, level, category, message columns
         body_hbox = QHBoxLayout()
-        self.log_view = QTableWidget()
-        self.log_view.setColumnCount(4)
-        self.log_view.setHorizontalHeaderLabels(["Timestamp", "Level", "Category", "Message"])
+        self._model = LogTableModel(self)
+        self.log_view = QTableView()
+        self.log_view.setModel(self._model)
         self.log_view.setAlternatingRowColors(True)
         self.log_view.setSelectionBehavior(QAbstractItemView.SelectionBehavior.SelectRows)
         self.log_view.setSelectionMode(QAbstractItemView.SelectionMode.ExtendedSelection)
@@ -119,6 +357,8 @@ class LogViewerDialog(QDialog):
         vert_header = self.log_view.verticalHeader()
         if vert_header:
             vert_header.setVisible(True)
+            # Uniform row heights: no per-row measuring however many lines match
+            vert_header.setSectionResizeMode(QHeaderView.ResizeMode.Fixed)
         # Enable grid with semi-transparent styling
         self.log_view.setShowGrid(True)
         # Set monospace font
@@ -136,12 +376,11 @@ class LogViewerDialog(QDialog):
 
         # Apply inline stylesheet for semi-transparent gridlines
         # Get theme mode from palette
-        from PyQt6.QtWidgets import QApplication
         palette = QApplication.palette()
         theme_mode = 'dark' if palette.window().color().lightness() < 128 else 'light'
         gridline_color = "rgba(102, 102, 102, 0.2)" if theme_mode == 'dark' else "rgba(204, 204, 204, 0.2)"
         self.log_view.setStyleSheet(f"""
-            QTableWidget {{
+            QTableView {{
                 gridline-color: {gridline_color};
             }}
         """)
@@ -149,239 +388,37 @@ class LogViewerDialog(QDialog):
         body_hbox.addWidget(self.log_view, 1)
         logs_vbox.addLayout(body_hbox)
         # Connect selection handler for auto-expand
-        self.log_view.itemSelectionChanged.connect(self._on_selection_changed)
+        self.log_view.selectionModel().selectionChanged.connect(self._on_selection_changed)
         self._selected_rows: set[int] = set()  # Track which rows are currently selected
 
-
         # Just show the logs tab (no tabs needed)
         layout.addWidget(logs_container)
 
-        # Populate initial log content via loader (with tail selection default)
-        def _tail_bytes_from_choice(text: str) -> int | None:
-            t = (text or "").lower()
-            if "full" in t:
-                return None
-            if "128" in t:
-                return 128 * 1024
-            if "512" in t:
-                return 512 * 1024
-            return 2 * 1024 * 1024
-
-        def _normalize_dates(block: str) -> str:
-            if not block:
-                return ""
-            try:
-                from datetime import datetime as _dt
-                today = _dt.now().strftime("%Y-%m-%d ")
-                lines = block.splitlines()
-                out = []
-                for line in lines:
-                    if len(line) >= 8 and line[2:3] == ":" and line[5:6] == ":":
-                        out.append(today + line)
-                    else:
-                        out.append(line)
-                return "\n".join(out)
-            except Exception:
-                return block
+        # Live messages arrive from any thread; rows are added on the GUI thread
+        self._live_pending.connect(self._flush_live, Qt.ConnectionType.QueuedConnection)
 
-        def _load_logs_list():
-            self.cmb_file_select.clear()
-            self.cmb_file_select.addItem("Current (bbdrop.log)", userData="__current__")
-            try:
-                if self._logger:
-                    logs_dir = self._logger.get_logs_dir()
-                    files = []
-                    for name in os.listdir(logs_dir):
-                        if name.startswith("bbdrop.log"):
-                            files.append(name)
-                    files.sort(reverse=True)
-                    for name in files:
-                        self.cmb_file_select.addItem(name, userData=os.path.join(logs_dir, name))
-            except Exception:
-                pass
-
-        def _read_selected_file() -> str:
-            # Read according to file selection and tail size
-            tail = _tail_bytes_from_choice(self.cmb_tail.currentText())
-            try:
-                if self.cmb_file_select.currentData() == "__current__" and self._logger:
-                    return self._logger.read_current_log(tail_bytes=tail) or ""
-                # Else fallback to reading the selected path
-                path = self.cmb_file_select.currentData()
-                if not path:
-                    return ""
-                if str(path).endswith(".gz"):
-                    import gzip
-                    with gzip.open(path, "rb") as f:
-                        data = f.read()
-                    if tail:
-                        data = data[-int(tail):]
-                    return data.decode("utf-8", errors="replace")
-                else:
-                    if tail and os.path.exists(path):
-                        size = os.path.getsize(path)
-                        with open(path, "rb") as f:
-                            if size > tail:
-                                f.seek(-tail, os.SEEK_END)
-                            data = f.read()
-                        return data.decode("utf-8", errors="replace")
-                    with open(path, "r", encoding="utf-8", errors="replace") as f:
-                        return f.read()
-            except Exception:
-                return ""
-
-        def _decode_unicode(text: str) -> str:
-            """Decode Unicode escape sequences like \u2713 to actual characters like ✓"""
-            try:
-                return text.encode('utf-8').decode('unicode_escape')
-            except Exception:
-                return text
+        # Follow mode polls the file for appended lines
+        self._follow_timer = QTimer(self)
+        self._follow_timer.setInterval(FOLLOW_INTERVAL_MS)
+        self._follow_timer.timeout.connect(self._follow_tick)
 
-        def _parse_log_line(line: str) -> tuple:
-            """Parse a log line into (timestamp, level, category, message)
-
-            Used when reading log files from disk.
-            """
-            try:
-                # Check for timestamp at start: YYYY-MM-DD HH:MM:SS
-                if len(line) >= 19 and line[4] == '-' and line[7] == '-' and line[10] == ' ' and line[13] == ':' and line[16] == ':':
-                    timestamp = line[:19]
-                    rest = line[20:].lstrip()
-                else:
-                    timestamp = ""
-                    rest = line
-
-                # Extract level from prefix (TRACE:, DEBUG:, INFO:, WARNING:, ERROR:, CRITICAL:)
-                level = "INFO"  # Default
-                level_prefixes = ["TRACE:", "DEBUG:", "INFO:", "WARNING:", "ERROR:", "CRITICAL:"]
-                for prefix in level_prefixes:
-                    if rest.startswith(prefix):
-                        level = prefix[:-1]  # Remove the colon
-                        rest = rest[len(prefix):].lstrip()
-                        break
-
-                # Extract category from [category] or [category:subtype]
-                category = "general"
-                if rest.startswith("[") and "]" in rest:
-                    close_idx = rest.find("]")
-                    tag = rest[1:close_idx]
-                    # Split on : to get category
-                    category = tag.split(":")[0] if ":" in tag else tag
-                    message = rest[close_idx + 1:].lstrip()
-                else:
-                    message = rest
-
-                return timestamp, level, category, message
-            except Exception:
-                return "", "INFO", "general", line
-
-        def _apply_initial_content():
-            try:
-                block = initial_text or _read_selected_file()
-            except Exception:
-                block = initial_text
-            norm = _normalize_dates(block)
-            # Add lines in reverse order (newest first)
-            self.log_view.setRowCount(0)
-            if norm:
-                lines = norm.splitlines()
-                row_num = 1
-                for line in reversed(lines):
-                    timestamp, level, category, message = _parse_log_line(line)
-
-                    # Apply level filter (use default INFO+ for initial load)
-                    if hasattr(self, 'cmb_level_filter') and not self._should_show_level(level):
-                        continue
-
-                    row = self.log_view.rowCount()
-                    self.log_view.insertRow(row)
-                    self.log_view.setVerticalHeaderItem(row, QTableWidgetItem(str(row_num)))
-                    self.log_view.setItem(row, 0, QTableWidgetItem(timestamp))
-                    self.log_view.setItem(row, 1, QTableWidgetItem(level))
-                    self.log_view.setItem(row, 2, QTableWidgetItem(category))
-                    self.log_view.setItem(row, 3, QTableWidgetItem(_decode_unicode(message)))
-                    row_num += 1
-
-        _load_logs_list()
-        _apply_initial_content()
+        self._load_logs_list()
+        self._open_source(initial_text)
+        self._follow_timer.start()
 
         # Register with logger to receive live log messages with metadata
         from src.utils.logger import register_log_viewer
         register_log_viewer(self)
 
         # Wire toolbar actions
-        def _strip_datetime_prefix(s: str) -> str:
-            try:
-                t = s.lstrip()
-                # YYYY-MM-DD HH:MM:SS
-                if len(t) >= 19 and t[4] == '-' and t[7] == '-' and t[10] == ' ' and t[13] == ':' and t[16] == ':':
-                    return t[19:].lstrip()
-                # HH:MM:SS
-                if len(t) >= 8 and t[2] == ':' and t[5] == ':':
-                    return t[8:].lstrip()
-                return s
-            except Exception:
-                return s
-
-        def _filter_block_by_view_cats(block: str) -> str:
-            if not block:
-                return ""
-            try:
-                lines = block.splitlines()
-                out = []
-                for line in lines:
-                    # Extract token after optional date/time prefix
-                    head = _strip_datetime_prefix(line)
-                    cat = "general"
-                    if head.startswith("[") and "]" in head:
-                        token = head[1:head.find("]")]
-                        cat = token.split(":")[0] or "general"
-                    if cat in self._filters_row and not self._filters_row[cat].isChecked():
-                        continue
-                    out.append(line)
-                return "\n".join(out)
-            except Exception:
-                return block
-
-        def on_refresh():
-            text = _normalize_dates(_read_selected_file())
-            text = _filter_block_by_view_cats(text)
-            # Add lines in reverse order (newest first)
-            self.log_view.setRowCount(0)
-            if text:
-                lines = text.splitlines()
-                row_num = 1
-                for line in reversed(lines):
-                    timestamp, level, category, message = _parse_log_line(line)
-
-                    # Apply level filter
-                    if not self._should_show_level(level):
-                        continue
-
-                    row = self.log_view.rowCount()
-                    self.log_view.insertRow(row)
-                    self.log_view.setVerticalHeaderItem(row, QTableWidgetItem(str(row_num)))
-                    self.log_view.setItem(row, 0, QTableWidgetItem(timestamp))
-                    self.log_view.setItem(row, 1, QTableWidgetItem(level))
-                    self.log_view.setItem(row, 2, QTableWidgetItem(category))
-                    self.log_view.setItem(row, 3, QTableWidgetItem(_decode_unicode(message)))
-                    row_num += 1
-            
-            # Apply find filter to maintain search during refresh
-            self._apply_find_filter_to_all_rows()
-
-        self.btn_refresh.clicked.connect(on_refresh)
-        self.cmb_file_select.currentIndexChanged.connect(on_refresh)
-        self.cmb_tail.currentIndexChanged.connect(on_refresh)
+        self.btn_refresh.clicked.connect(self.on_refresh)
+        self.cmb_file_select.currentIndexChanged.connect(self.on_refresh)
+        self.cmb_tail.currentIndexChanged.connect(self.on_refresh)
 
         # Changing view filters should refilter the current view
-        def on_filter_changed(_=None):
-            # Re-apply filtering to current content by simulating a refresh
-            on_refresh()
-        # Bind filters row checkboxes
         for _key, cb in self._filters_row.items():
             try:
-                cb.toggled.connect(on_filter_changed)
+                cb.toggled.connect(self._requery)
             except Exception:
                 pass
         # Bind level dropdown with QSettings save
@@ -393,25 +430,24 @@ class LogViewerDialog(QDialog):
             settings.endGroup()
             settings.sync()  # Ensure immediate write
             # Apply filter
-            on_filter_changed()
-        
+            self._requery()
+
         self.cmb_level_filter.currentTextChanged.connect(on_level_filter_changed)
 
         def on_clear():
-            self.log_view.setRowCount(0)
+            # Drop rows still arriving from a search; Refresh brings everything back
+            self._stop_query_thread()
+            self._generation += 1
+            self._live_entries.clear()
+            self._model.reset_rows()
         self.btn_clear.clicked.connect(on_clear)
 
         def on_follow_toggle(_=None):
             self.follow_enabled = self.chk_follow.isChecked()
         self.chk_follow.toggled.connect(on_follow_toggle)
 
-        # Find functionality - live filtering as user types
-        def on_find_text_changed():
-            """Filter table rows based on search text"""
-            self._apply_find_filter_to_all_rows()
-        
-        # Connect to textChanged for live filtering
-        self.find_input.textChanged.connect(on_find_text_changed)
+        # Find - live filtering as user types (searched in the query thread)
+        self.find_input.textChanged.connect(self._requery)
 
         # Bottom button row
         button_layout = QHBoxLayout()
@@ -425,6 +461,146 @@ class LogViewerDialog(QDialog):
         button_layout.addWidget(button_box)
         layout.addLayout(button_layout)
 
+    # ------------------------------------------------------------ log sources
+
+    def _tail_bytes(self) -> Optional[int]:
+        t = (self.cmb_tail.currentText() or "").lower()
+        if "full" in t:
+            return None
+        if "128" in t:
+            return 128 * 1024
+        if "512" in t:
+            return 512 * 1024
+        return 2 * 1024 * 1024
+
+    def _load_logs_list(self):
+        self.cmb_file_select.blockSignals(True)
+        self.cmb_file_select.clear()
+        self.cmb_file_select.addItem("Current (bbdrop.log)", userData="__current__")
+        try:
+            if self._logger:
+                logs_dir = self._logger.get_logs_dir()
+                files = []
+                for name in os.listdir(logs_dir):
+                    if name.startswith("bbdrop.log"):
+                        files.append(name)
+                files.sort(reverse=True)
+                for name in files:
+                    self.cmb_file_select.addItem(name, userData=os.path.join(logs_dir, name))
+        except Exception:
+            pass
+        self.cmb_file_select.blockSignals(False)
+
+    def _selected_source(self) -> Optional[Tuple[str, Optional[int]]]:
+        """(path, tail bytes) of the selected log file, or None if there is no file."""
+        path = self.cmb_file_select.currentData()
+        if path == "__current__":
+            try:
+                path = self._logger.get_current_log_path() if self._logger else None
+            except Exception:
+                path = None
+        if isinstance(path, str) and path and os.path.isfile(path):
+            return path, self._tail_bytes()
+        return None
+
+    def _open_source(self, initial_text: str = "") -> None:
+        """Show initial_text, else the selected log file, indexed from scratch."""
+        source = None if initial_text else self._selected_source()
+        if source:
+            index = LogLineIndex(source[0], tail_bytes=source[1])
+        else:
+            # No file to read: text handed to the dialog plus live messages
+            index = LogLineIndex.from_text(initial_text)
+            source = ("text",) if initial_text else None
+        self._index = index
+        self._source_key = source
+        self._index_ready = False
+        self._model.set_index(index)
+        self._requery()
+
+    def on_refresh(self, *_args) -> None:
+        """Reopen the log if a different file/tail is selected, else re-read what was appended."""
+        selected = self._selected_source()
+        keep_text = self._source_key == ("text",) and selected is None
+        if selected != self._source_key and not keep_text:
+            self._open_source()
+        else:
+            self._requery()
+
+    # ---------------------------------------------------------------- queries
+
+    def _min_level(self) -> int:
+        filter_text = self.cmb_level_filter.currentText()
+        if filter_text == "All":
+            return 0
+        return LEVEL_FILTER_MINIMUMS.get(filter_text, 20)
+
+    def _current_query(self) -> LogQuery:
+        return LogQuery(
+            min_level=self._min_level(),
+            hidden_categories=frozenset(key for key, cb in self._filters_row.items() if not cb.isChecked()),
+            pattern=(self.find_input.text() or "").strip().lower(),
+        )
+
+    def _stop_query_thread(self) -> None:
+        thread = self._query_thread
+        if thread is not None:
+            thread.stop()
+            thread.wait()
+            self._query_thread = None
+
+    def _start_query_thread(self, mode: str) -> None:
+        thread = LogQueryThread(self._index, self._current_query(), self._generation,
+                                mode=mode, index_ready=self._index_ready)
+        thread.indexed.connect(self._on_indexed)
+        thread.rows_found.connect(self._on_rows_found)
+        thread.source_replaced.connect(self._on_source_replaced)
+        self._query_thread = thread
+        thread.start()
+
+    def _requery(self, *_args) -> None:
+        """Filter the whole log again with the current level/category/find settings."""
+        if self._index is None:
+            return
+        self._stop_query_thread()
+        self._generation += 1
+        query = self._current_query()
+        self._model.reset_rows([entry for entry in reversed(self._live_entries) if query.matches(entry)])
+        self._start_query_thread(LogQueryThread.MODE_SEARCH)
+
+    def _follow_tick(self) -> None:
+        """Pick up lines appended to the log file since the last check."""
+        if not (self.follow_enabled and self._index is not None and self._index.is_file and self._index_ready):
+            return
+        if self._query_thread is not None and self._query_thread.isRunning():
+            return
+        self._query_thread = None
+        self._start_query_thread(LogQueryThread.MODE_FOLLOW)
+
+    def is_loading(self) -> bool:
+        """True while the log is being indexed or searched."""
+        return self._query_thread is not None and self._query_thread.isRunning()
+
+    def _on_indexed(self, generation: int, _line_count: int) -> None:
+        if generation == self._generation:
+            self._index_ready = True
+
+    def _on_rows_found(self, generation: int, lines: List[int], prepend: bool) -> None:
+        if generation != self._generation:
+            return
+        if prepend:
+            self._model.prepend_lines(lines)
+            if self.follow_enabled:
+                self.log_view.scrollToTop()
+        else:
+            self._model.append_lines(lines)
+
+    def _on_source_replaced(self, generation: int) -> None:
+        if generation == self._generation:
+            # Rotated or truncated: index the new file
+            self._index_ready = False
+            QTimer.singleShot(0, self._requery)
+
     def open_log_settings(self):
         """Open comprehensive settings to the Log tab"""
         try:
@@ -443,74 +619,49 @@ class LogViewerDialog(QDialog):
         except Exception as e:
             log(f"Error opening log settings: {e}", level="error", category="ui")
 
+    # --------------------------------------------------------- live messages
+
     def append_message(self, message: str, level: str = "info", category: str = "general"):
         """
         Append live log message with metadata (from logger.py).
 
+        Called from whichever thread logged the message; rows are added on the
+        GUI thread. While a log file is shown, follow mode reads new lines from
+        the file instead.
+
         Args:
             message: Formatted log message
             level: Log level (trace/debug/info/warning/error/critical)
             category: Log category (uploads/auth/network/etc.)
         """
         try:
-            # Extract timestamp from message
-            timestamp = ""
-            msg_text = message
-
-            # Check for timestamp at start: HH:MM:SS or YYYY-MM-DD HH:MM:SS
-            if len(message) >= 19 and message[4] == '-' and message[7] == '-':
-                # Full timestamp: YYYY-MM-DD HH:MM:SS
-                timestamp = message[:19]
-                msg_text = message[20:].lstrip()
-            elif len(message) >= 8 and message[2] == ':' and message[5] == ':':
-                # Time only: HH:MM:SS - add today's date
-                from datetime import datetime as _dt
-                today = _dt.now().strftime("%Y-%m-%d")
-                timestamp = f"{today} {message[:8]}"
-                msg_text = message[9:].lstrip()
-
-            # Strip level prefix and category tag from message for clean display
-            level_prefixes = ["TRACE:", "DEBUG:", "INFO:", "WARNING:", "ERROR:", "CRITICAL:"]
-            for prefix in level_prefixes:
-                if msg_text.startswith(prefix):
-                    msg_text = msg_text[len(prefix):].lstrip()
-                    break
-
-            # Strip [category] or [category:subtype] tag
-            if msg_text.startswith("[") and "]" in msg_text:
-                close_idx = msg_text.find("]")
-                msg_text = msg_text[close_idx + 1:].lstrip()
-
-            # Apply category filter
-            if category in self._filters_row and not self._filters_row[category].isChecked():
-                return
-
-            # Apply level filter
-            if not self._should_show_level(level):
-                return
-
-            # Prepend to table (newest first)
-            self.log_view.insertRow(0)
-
-            # Update row numbers for all rows
-            for row in range(self.log_view.rowCount()):
-                self.log_view.setVerticalHeaderItem(row, QTableWidgetItem(str(row + 1)))
-
-            # Set data for new row (4 columns)
-            self.log_view.setItem(0, 0, QTableWidgetItem(timestamp))
-            self.log_view.setItem(0, 1, QTableWidgetItem(level.upper()))
-            self.log_view.setItem(0, 2, QTableWidgetItem(category))
-            self.log_view.setItem(0, 3, QTableWidgetItem(msg_text))
+            timestamp, _level, _category, msg_text = parse_log_line(message)
+            entry = (timestamp, level.upper(), category, msg_text)
+            with self._pending_lock:
+                self._pending_live.append(entry)
+                first_pending = len(self._pending_live) == 1
+            if threading.current_thread() is threading.main_thread():
+                self._flush_live()
+            elif first_pending:
+                self._live_pending.emit()
+        except Exception:
+            pass
 
-            # Scroll to top if follow enabled
+    def _flush_live(self) -> None:
+        with self._pending_lock:
+            entries, self._pending_live = self._pending_live, []
+        if not entries or self._index is None or self._index.is_file:
+            return
+        self._live_entries.extend(entries)
+        if len(self._live_entries) > MAX_LIVE_ENTRIES:
+            del self._live_entries[:-MAX_LIVE_ENTRIES]
+        query = self._current_query()
+        shown = [entry for entry in reversed(entries) if query.matches(entry)]
+        if shown:
+            self._model.add_live(shown)
+            self._model.trim_live(MAX_LIVE_ENTRIES)
             if self.follow_enabled:
                 self.log_view.scrollToTop()
-            
-            # Apply find filter to newly inserted row (critical for live filtering)
-            pattern = (self.find_input.text() or "").strip().lower()
-            self._apply_find_filter_to_row(0, pattern)
-        except Exception:
-            pass
 
     def _should_show_level(self, level: str) -> bool:
         """Check if a log level should be shown based on the level filter dropdown.
@@ -522,101 +673,51 @@ class LogViewerDialog(QDialog):
             True if the level should be shown, False otherwise
         """
         try:
-            filter_text = self.cmb_level_filter.currentText()
-            if filter_text == "All":
-                return True
-
-            # Map level strings to numeric values
-            level_values = {
-                "trace": 5,
-                "debug": 10,
-                "info": 20,
-                "warning": 30,
-                "error": 40,
-                "critical": 50
-            }
-
-            # Map filter choices to minimum level
-            filter_minimums = {
-                "TRACE+": 5,
-                "DEBUG+": 10,
-                "INFO+": 20,
-                "WARNING+": 30,
-                "ERROR+": 40
-            }
-
-            level_num = level_values.get(level.lower(), 20)  # Default to INFO
-            min_level = filter_minimums.get(filter_text, 20)  # Default to INFO+
-
-            return level_num >= min_level
+            min_level = self._min_level()
+            return LEVEL_VALUES.get(level.lower(), 20) >= min_level  # Default to INFO
         except Exception:
             return True  # Show by default if error
 
-    def _apply_find_filter_to_row(self, row: int, pattern: str) -> None:
-        """Apply search filter to a single row.
-        
-        Args:
-            row: Row index to filter
-            pattern: Lowercase search pattern (already stripped)
-        """
-        if not pattern:
-            self.log_view.setRowHidden(row, False)
-            return
-        
-        match_found = False
-        for col in range(4):  # 4 columns: timestamp, level, category, message
-            item = self.log_view.item(row, col)
-            if item and pattern in item.text().lower():
-                match_found = True
-                break
-        self.log_view.setRowHidden(row, not match_found)
-
-    def _apply_find_filter_to_all_rows(self) -> None:
-        """Apply current search filter to all rows."""
-        pattern = (self.find_input.text() or "").strip().lower()
-        for row in range(self.log_view.rowCount()):
-            self._apply_find_filter_to_row(row, pattern)
-    def _on_selection_changed(self):
+    def _on_selection_changed(self, *_args):
         """Handle row selection changes - enable word wrap and line breaks for selected rows"""
         try:
-            selected_rows = set()
-            for item in self.log_view.selectedItems():
-                selected_rows.add(item.row())
+            selected_rows = {index.row() for index in self.log_view.selectionModel().selectedRows()}
+            self._model.set_expanded(selected_rows)
 
-            # Process newly selected rows
+            # Resize newly selected rows to fit content
             for row in selected_rows - self._selected_rows:
-                message_item = self.log_view.item(row, 3)  # Message column
-                if message_item:
-                    # Enable word wrap
-                    message_item.setTextAlignment(Qt.AlignmentFlag.AlignLeft | Qt.AlignmentFlag.AlignTop)
-                    # Store original text and replace \n with actual line breaks
-                    original_text = message_item.text()
-                    if '\\n' in original_text:
-                        message_item.setText(original_text.replace('\\n', '\n'))
-                    # Resize row to fit content
-                    self.log_view.resizeRowToContents(row)
-
-            # Process deselected rows
+                self.log_view.resizeRowToContents(row)
+
+            # Reset deselected rows to default height
+            default_height = self.log_view.verticalHeader().defaultSectionSize()
             for row in self._selected_rows - selected_rows:
-                message_item = self.log_view.item(row, 3)  # Message column
-                if message_item:
-                    # Get text and collapse line breaks back to \n
-                    text = message_item.text()
-                    if '\n' in text:
-                        message_item.setText(text.replace('\n', '\\n'))
-                    # Reset row height to default
-                    self.log_view.setRowHeight(row, self.log_view.verticalHeader().defaultSectionSize())
+                if row < self._model.rowCount():
+                    self.log_view.setRowHeight(row, default_height)
 
             self._selected_rows = selected_rows
         except Exception:
             # Silently handle any errors in selection handling
             pass
-    
-    def closeEvent(self, event):
-        """Unregister from logger when dialog closes"""
+
+    def _shutdown(self) -> None:
+        """Unregister from the logger and stop background work (once)."""
+        if self._closed:
+            return
+        self._closed = True
         from src.utils.logger import unregister_log_viewer
         unregister_log_viewer(self)
+        self._follow_timer.stop()
+        self._stop_query_thread()
+
+    def done(self, result):
+        self._shutdown()
+        super().done(result)
+
+    def closeEvent(self, event):
+        """Unregister from logger when dialog closes"""
+        self._shutdown()
         super().closeEvent(event)
+
     def _center_on_parent(self):
         """Center dialog on parent window or screen"""
         if self.parent():
@@ -670,6 +670,10 @@ class ShutdownWorker(QThread):
             if not self._force_stop_event.is_set():
                 self.mw.completion_worker.wait(3000)
 
+        # Stop persistent hook workers
+        from src.processing.hooks_executor import shutdown_hooks_executor
+        shutdown_hooks_executor()
+
         # Stop worker status monitoring
         if hasattr(self.mw, 'worker_status_widget'):
             self.mw.worker_status_widget.stop_monitoring()
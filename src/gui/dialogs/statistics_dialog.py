@@ -1,9 +1,11 @@
 #!/usr/bin/env python3
 """
 Statistics Dialog
-Shows comprehensive application usage statistics from QSettings and MetricsStore
+Shows comprehensive application usage statistics from the queue database,
+QSettings and MetricsStore
 """
 
+import sqlite3
 import time
 from typing import Optional
 
@@ -15,31 +17,66 @@ from PyQt6.QtWidgets import (
 )
 from PyQt6.QtCore import Qt, QSettings
 
+from src.gui.widgets.latency_chart import LatencyChartWidget
 from src.utils.format_utils import format_binary_size, format_binary_rate, format_duration
 from src.utils.logger import log
 
+# Latency tab timeframes: (label, seconds back from now, chart resolution)
+LATENCY_TIMEFRAMES = [
+    ("Last Hour", 3600, "minute"),
+    ("Last 24 Hours", 86400, "hour"),
+    ("Last 7 Days", 7 * 86400, "hour"),
+    ("Last 30 Days", 30 * 86400, "day"),
+    ("Last 90 Days", 90 * 86400, "day"),
+]
+
+LATENCY_PERCENTILES = (50, 90, 95, 99)
+
+# Breakdown tab timeframes: (label, days back from today; None for all time)
+BREAKDOWN_TIMEFRAMES = [
+    ("All Time", None),
+    ("Today", 0),
+    ("Last 7 Days", 6),
+    ("Last 30 Days", 29),
+]
+
+# Breakdown tab groupings: (label, key in QueueStore.get_upload_stats())
+BREAKDOWN_GROUPS = [
+    ("Day", "by_day"),
+    ("Tab", "by_tab"),
+    ("Template", "by_template"),
+    ("File Host", "by_host"),
+]
+
 
 class StatisticsDialog(QDialog):
     """Dialog displaying comprehensive application statistics.
 
     Shows upload totals, scanner stats, session information, speed records,
     and per-host file upload statistics. Uses a tabbed interface with
-    General stats and File Hosts tabs.
+    General stats, Breakdown, File Hosts and Latency tabs.
+
+    Upload totals and breakdowns come from the database rollups maintained
+    as galleries complete (QueueStore.get_upload_stats).
 
     Attributes:
         _session_start_time: Time when the current session started (for live calculation)
+        _store: QueueStore to read upload statistics from
     """
 
-    def __init__(self, parent=None, session_start_time: Optional[float] = None):
+    def __init__(self, parent=None, session_start_time: Optional[float] = None, store=None):
         """Initialize the Statistics Dialog.
 
         Args:
             parent: Parent widget for the dialog
             session_start_time: Unix timestamp when current session started.
                                Falls back to current time if not provided.
+            store: QueueStore to read upload statistics from.
+                   Defaults to the parent window's queue store.
         """
         super().__init__(parent)
         self._session_start_time = session_start_time or time.time()
+        self._store = store
 
         self.setWindowTitle("Application Statistics")
         self.setModal(True)
@@ -47,8 +84,11 @@ class StatisticsDialog(QDialog):
         self.resize(750, 480)
         self._center_on_parent()
 
+        started = time.perf_counter()
         self._setup_ui()
         self._load_stats()
+        log(f"Statistics dialog loaded in {(time.perf_counter() - started) * 1000:.1f}ms",
+            level="debug", category="stats")
 
     def _center_on_parent(self) -> None:
         """Center dialog on parent window or screen."""
@@ -81,10 +121,18 @@ class StatisticsDialog(QDialog):
         general_tab = self._create_general_tab()
         self._tab_widget.addTab(general_tab, "General")
 
-        # Tab 2: File Host Statistics
+        # Tab 2: Uploads by day, tab, template or host
+        breakdown_tab = self._create_breakdown_tab()
+        self._tab_widget.addTab(breakdown_tab, "Breakdown")
+
+        # Tab 3: File Host Statistics
         file_hosts_tab = self._create_file_hosts_tab()
         self._tab_widget.addTab(file_hosts_tab, "File Hosts")
 
+        # Tab 4: Per-file latency percentiles
+        latency_tab = self._create_latency_tab()
+        self._tab_widget.addTab(latency_tab, "Latency")
+
         main_layout.addWidget(self._tab_widget)
 
         # Close button
@@ -125,6 +173,50 @@ class StatisticsDialog(QDialog):
         layout.addLayout(columns_layout)
         return tab
 
+    def _create_breakdown_tab(self) -> QWidget:
+        """Create the Breakdown tab content.
+
+        Returns:
+            QWidget containing upload totals grouped by day, tab, template or host
+        """
+        tab = QWidget()
+        layout = QVBoxLayout(tab)
+        layout.setContentsMargins(10, 10, 10, 10)
+
+        filter_layout = QHBoxLayout()
+        filter_layout.addWidget(QLabel("Timeframe:"))
+        self._breakdown_timeframe_combo = QComboBox()
+        for label, days in BREAKDOWN_TIMEFRAMES:
+            self._breakdown_timeframe_combo.addItem(label, days)
+        self._breakdown_timeframe_combo.setMinimumWidth(120)
+        self._breakdown_timeframe_combo.currentIndexChanged.connect(self._load_breakdown_stats)
+        filter_layout.addWidget(self._breakdown_timeframe_combo)
+
+        filter_layout.addWidget(QLabel("Group by:"))
+        self._breakdown_group_combo = QComboBox()
+        for label, key in BREAKDOWN_GROUPS:
+            self._breakdown_group_combo.addItem(label, key)
+        self._breakdown_group_combo.currentIndexChanged.connect(self._load_breakdown_stats)
+        filter_layout.addWidget(self._breakdown_group_combo)
+        filter_layout.addStretch()
+        layout.addLayout(filter_layout)
+
+        self._breakdown_table = QTableWidget()
+        self._breakdown_table.setColumnCount(4)
+        self._breakdown_table.setAlternatingRowColors(True)
+        self._breakdown_table.setSelectionBehavior(QTableWidget.SelectionBehavior.SelectRows)
+        self._breakdown_table.setEditTriggers(QTableWidget.EditTrigger.NoEditTriggers)
+        self._breakdown_table.verticalHeader().setVisible(False)
+        header = self._breakdown_table.horizontalHeader()
+        header.setSectionResizeMode(0, QHeaderView.ResizeMode.Stretch)
+        for col in range(1, 4):
+            header.setSectionResizeMode(col, QHeaderView.ResizeMode.ResizeToContents)
+        layout.addWidget(self._breakdown_table)
+
+        self._breakdown_total_label = QLabel("")
+        layout.addWidget(self._breakdown_total_label)
+        return tab
+
     def _create_file_hosts_tab(self) -> QWidget:
         """Create the File Hosts statistics tab content.
 
@@ -176,6 +268,57 @@ class StatisticsDialog(QDialog):
         layout.addWidget(self._file_hosts_table)
         return tab
 
+    def _create_latency_tab(self) -> QWidget:
+        """Create the Latency tab content.
+
+        Returns:
+            QWidget containing per-host percentile table and percentile chart
+        """
+        tab = QWidget()
+        layout = QVBoxLayout(tab)
+        layout.setContentsMargins(10, 10, 10, 10)
+
+        filter_layout = QHBoxLayout()
+        filter_layout.addWidget(QLabel("Timeframe:"))
+        self._latency_timeframe_combo = QComboBox()
+        for label, seconds, resolution in LATENCY_TIMEFRAMES:
+            self._latency_timeframe_combo.addItem(label, (seconds, resolution))
+        self._latency_timeframe_combo.setCurrentIndex(1)  # Default to Last 24 Hours
+        self._latency_timeframe_combo.setMinimumWidth(120)
+        self._latency_timeframe_combo.currentIndexChanged.connect(self._load_latency_stats)
+        filter_layout.addWidget(self._latency_timeframe_combo)
+
+        filter_layout.addWidget(QLabel("Metric:"))
+        self._latency_metric_combo = QComboBox()
+        self._latency_metric_combo.addItem("Upload Time", "upload_time")
+        self._latency_metric_combo.addItem("Speed", "speed")
+        self._latency_metric_combo.addItem("Time to First Byte", "ttfb")
+        self._latency_metric_combo.currentIndexChanged.connect(self._load_latency_stats)
+        filter_layout.addWidget(self._latency_metric_combo)
+        filter_layout.addStretch()
+        layout.addLayout(filter_layout)
+
+        self._latency_table = QTableWidget()
+        self._latency_table.setColumnCount(2 + len(LATENCY_PERCENTILES))
+        self._latency_table.setHorizontalHeaderLabels(
+            ["Host", "Files"] + [f"p{p}" for p in LATENCY_PERCENTILES]
+        )
+        self._latency_table.setAlternatingRowColors(True)
+        self._latency_table.setSelectionBehavior(QTableWidget.SelectionBehavior.SelectRows)
+        self._latency_table.setSelectionMode(QTableWidget.SelectionMode.SingleSelection)
+        self._latency_table.setEditTriggers(QTableWidget.EditTrigger.NoEditTriggers)
+        self._latency_table.verticalHeader().setVisible(False)
+        header = self._latency_table.horizontalHeader()
+        header.setSectionResizeMode(0, QHeaderView.ResizeMode.Stretch)
+        for col in range(1, self._latency_table.columnCount()):
+            header.setSectionResizeMode(col, QHeaderView.ResizeMode.ResizeToContents)
+        self._latency_table.itemSelectionChanged.connect(self._load_latency_chart)
+        layout.addWidget(self._latency_table, 1)
+
+        self._latency_chart = LatencyChartWidget()
+        layout.addWidget(self._latency_chart, 1)
+        return tab
+
     def _create_session_group(self) -> QGroupBox:
         """Create the session statistics group box.
 
@@ -297,8 +440,22 @@ class StatisticsDialog(QDialog):
 
         return group
 
+    def _get_store(self):
+        """Return the QueueStore holding upload statistics, or None if unavailable."""
+        if self._store is None:
+            queue_manager = getattr(self.parent(), 'queue_manager', None)
+            self._store = getattr(queue_manager, 'store', None)
+        if self._store is None:
+            try:
+                from src.storage.database import QueueStore
+                self._store = QueueStore()
+            except (ImportError, sqlite3.Error, OSError) as e:
+                log(f"Failed to open queue database for statistics: {type(e).__name__}: {e}",
+                    level="warning", category="stats")
+        return self._store
+
     def _load_stats(self) -> None:
-        """Load all statistics from QSettings and display."""
+        """Load all statistics from the database and QSettings and display."""
         settings = QSettings("BBDropUploader", "Stats")
         # Session stats
         app_startups = settings.value("app_startup_count", 0, type=int)
@@ -318,16 +475,17 @@ class StatisticsDialog(QDialog):
         avg_session_seconds = total_time // max(1, app_startups)
         self._avg_session_label.setText(format_duration(avg_session_seconds))
 
-        # Upload stats
-        total_galleries = settings.value("total_galleries", 0, type=int)
-        total_images = settings.value("total_images", 0, type=int)
-
-        # Handle both v2 (string) and legacy (int) formats
-        total_size_str = settings.value("total_size_bytes_v2", "0")
-        try:
-            total_size = int(total_size_str)
-        except (ValueError, TypeError):
-            total_size = settings.value("total_size_bytes", 0, type=int)
+        # Upload stats (database rollups)
+        totals = {'galleries': 0, 'images': 0, 'bytes': 0}
+        store = self._get_store()
+        if store is not None:
+            try:
+                totals = store.get_upload_totals()
+            except sqlite3.Error as e:
+                log(f"Failed to load upload totals: {e}", level="warning", category="stats")
+        total_galleries = totals['galleries']
+        total_images = totals['images']
+        total_size = totals['bytes']
 
         fastest_kbps = settings.value("fastest_kbps", 0.0, type=float)
         fastest_timestamp = settings.value("fastest_kbps_timestamp", "")
@@ -388,8 +546,70 @@ class StatisticsDialog(QDialog):
         self._offline_images_label.style().unpolish(self._offline_images_label)
         self._offline_images_label.style().polish(self._offline_images_label)
 
-        # Load file host statistics
+        # Load breakdown and file host statistics
+        self._load_breakdown_stats()
         self._load_file_host_stats()
+        self._load_latency_stats()
+
+    def _load_breakdown_stats(self, *_args) -> None:
+        """Load upload totals grouped by the selected field for the selected timeframe."""
+        days = self._breakdown_timeframe_combo.currentData()
+        group = self._breakdown_group_combo.currentData() or "by_day"
+        since_ts = None if days is None else time.time() - days * 86400
+        self._breakdown_table.clearSpans()
+
+        stats = None
+        store = self._get_store()
+        if store is not None:
+            try:
+                stats = store.get_upload_stats(since_ts)
+            except sqlite3.Error as e:
+                log(f"Failed to load upload breakdown: {e}", level="warning", category="stats")
+
+        if group == "by_host":
+            labels = ["Host", "Files", "Failed", "Data Uploaded"]
+        else:
+            labels = [self._breakdown_group_combo.currentText(), "Galleries", "Images", "Data Uploaded"]
+        self._breakdown_table.setHorizontalHeaderLabels(labels)
+
+        rows = stats.get(group, []) if stats else []
+        if not rows:
+            self._breakdown_table.setRowCount(1)
+            text = ("Unable to load upload statistics" if stats is None else
+                    f"No uploads for {self._breakdown_timeframe_combo.currentText()}")
+            item = QTableWidgetItem(text)
+            item.setTextAlignment(Qt.AlignmentFlag.AlignCenter)
+            self._breakdown_table.setItem(0, 0, item)
+            self._breakdown_table.setSpan(0, 0, 1, 4)
+            self._breakdown_total_label.setText("")
+            return
+
+        self._breakdown_table.setRowCount(len(rows))
+        for row, entry in enumerate(rows):
+            if group == "by_host":
+                name = entry['host_name'].title()
+                values = [f"{entry['files']:,}", f"{entry['failed']:,}"]
+            else:
+                if group == "by_day":
+                    name = entry['day']
+                elif group == "by_tab":
+                    name = entry['tab_name']
+                else:
+                    name = entry['template'] or "(none)"
+                values = [f"{entry['galleries']:,}", f"{entry['images']:,}"]
+            values.append(format_binary_size(entry['bytes']))
+
+            self._breakdown_table.setItem(row, 0, QTableWidgetItem(name))
+            for col, text in enumerate(values, start=1):
+                item = QTableWidgetItem(text)
+                item.setTextAlignment(Qt.AlignmentFlag.AlignRight | Qt.AlignmentFlag.AlignVCenter)
+                self._breakdown_table.setItem(row, col, item)
+
+        totals = stats['totals']
+        self._breakdown_total_label.setText(
+            f"Total: {totals['galleries']:,} galleries, {totals['images']:,} images, "
+            f"{format_binary_size(totals['bytes'])}"
+        )
 
     def _on_timeframe_changed(self, index: int) -> None:
         """Handle timeframe filter selection change.
@@ -478,3 +698,85 @@ class StatisticsDialog(QDialog):
             rate_item.setTextAlignment(Qt.AlignmentFlag.AlignRight | Qt.AlignmentFlag.AlignVCenter)
             self._file_hosts_table.setItem(row, 6, rate_item)
 
+    def _latency_formatter(self, metric: str):
+        """Value formatter for a latency metric (seconds or bytes/s)."""
+        if metric == "speed":
+            # MetricsStore stores B/s, format_binary_rate expects KiB/s
+            return lambda value: format_binary_rate(value / 1024)
+        return lambda value: f"{value * 1000:.0f} ms" if value < 1 else f"{value:.2f} s"
+
+    def _latency_range(self) -> tuple:
+        """Return (start_ts, end_ts, resolution) for the selected latency timeframe."""
+        seconds, resolution = self._latency_timeframe_combo.currentData() or (86400, "hour")
+        end_ts = time.time()
+        return end_ts - seconds, end_ts, resolution
+
+    def _load_latency_stats(self, *_args) -> None:
+        """Load per-host latency percentiles for the selected timeframe and metric."""
+        metric = self._latency_metric_combo.currentData() or "upload_time"
+        start_ts, end_ts, _resolution = self._latency_range()
+        formatter = self._latency_formatter(metric)
+        columns = self._latency_table.columnCount()
+        self._latency_table.clearSpans()
+
+        try:
+            from src.utils.metrics_store import get_metrics_store
+            metrics_store = get_metrics_store()
+            rows = []
+            for host_name in metrics_store.get_latency_hosts(start_ts, end_ts):
+                stats = metrics_store.get_latency_percentiles(
+                    host_name, metric, start_ts, end_ts, LATENCY_PERCENTILES
+                )
+                if stats.get('count'):
+                    rows.append((host_name, stats))
+        except (ImportError, RuntimeError, OSError) as e:
+            log(f"Failed to load latency metrics: {type(e).__name__}: {e}",
+                level="warning", category="stats")
+            rows = None
+
+        if not rows:
+            self._latency_table.setRowCount(1)
+            text = ("Unable to load latency statistics" if rows is None else
+                    f"No uploads for {self._latency_timeframe_combo.currentText()}")
+            item = QTableWidgetItem(text)
+            item.setTextAlignment(Qt.AlignmentFlag.AlignCenter)
+            self._latency_table.setItem(0, 0, item)
+            self._latency_table.setSpan(0, 0, 1, columns)
+            self._latency_chart.set_series([], [], message=text)
+            return
+
+        rows.sort(key=lambda r: r[1]['count'], reverse=True)
+        self._latency_table.setRowCount(len(rows))
+        for row, (host_name, stats) in enumerate(rows):
+            host_item = QTableWidgetItem(host_name.title() if host_name != "imx.to" else host_name)
+            host_item.setData(Qt.ItemDataRole.UserRole, host_name)
+            self._latency_table.setItem(row, 0, host_item)
+            values = [f"{stats['count']:,}"] + [formatter(stats[f"p{p}"]) for p in LATENCY_PERCENTILES]
+            for col, text in enumerate(values, start=1):
+                item = QTableWidgetItem(text)
+                item.setTextAlignment(Qt.AlignmentFlag.AlignRight | Qt.AlignmentFlag.AlignVCenter)
+                self._latency_table.setItem(row, col, item)
+
+        self._latency_table.selectRow(0)
+        self._load_latency_chart()
+
+    def _load_latency_chart(self) -> None:
+        """Plot p50/p95 over time for the selected host."""
+        selected = self._latency_table.selectedItems()
+        host_item = self._latency_table.item(selected[0].row(), 0) if selected else None
+        host_name = host_item.data(Qt.ItemDataRole.UserRole) if host_item else None
+        if not host_name:
+            return
+
+        metric = self._latency_metric_combo.currentData() or "upload_time"
+        start_ts, end_ts, resolution = self._latency_range()
+        try:
+            from src.utils.metrics_store import get_metrics_store
+            series = get_metrics_store().get_latency_series(
+                host_name, metric, start_ts, end_ts, resolution, percentiles=(50, 95)
+            )
+        except (ImportError, RuntimeError, OSError) as e:
+            log(f"Failed to load latency series: {type(e).__name__}: {e}",
+                level="warning", category="stats")
+            series = []
+        self._latency_chart.set_series(series, ["p50", "p95"], self._latency_formatter(metric))
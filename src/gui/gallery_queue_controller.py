@@ -12,16 +12,16 @@ Handles:
 
 import os
 import time
-from typing import TYPE_CHECKING, List
+from typing import TYPE_CHECKING, Any, Dict, List, Optional, Tuple
 
 from PyQt6.QtCore import QObject, QTimer, Qt, QMutexLocker
 from PyQt6.QtWidgets import (
     QFileDialog, QListView, QTreeView, QAbstractItemView,
-    QProgressDialog, QMessageBox
+    QMessageBox
 )
 
 from src.utils.logger import log
-from src.utils.archive_utils import is_archive_file
+from src.utils.archive_utils import is_archive_file, is_archive_gallery_path, get_archive_gallery_name
 from src.processing.archive_worker import ArchiveExtractionWorker
 from src.storage.queue_manager import GalleryQueueItem
 
@@ -118,13 +118,16 @@ class GalleryQueueController(QObject):
         # Process archives in background threads
         for archive_path in archives:
             worker = ArchiveExtractionWorker(archive_path, mw.archive_coordinator)
+            worker.signals.folder_ready.connect(mw.on_archive_folder_ready)
+            worker.signals.progress.connect(mw.on_archive_extraction_progress)
             worker.signals.finished.connect(mw.on_archive_extraction_finished)
             worker.signals.error.connect(mw.on_archive_extraction_error)
             mw._thread_pool.start(worker)
             log(f"Started background extraction for: {os.path.basename(archive_path)}",
                 level="debug", category="ui")
 
-    def add_folders(self, folder_paths: List[str]):
+    def add_folders(self, folder_paths: List[str], template_name: Optional[str] = None,
+                    tab_name: Optional[str] = None):
         """Add folders to the upload queue with duplicate detection.
 
         Routes to appropriate handler based on folder count:
@@ -133,16 +136,38 @@ class GalleryQueueController(QObject):
 
         Args:
             folder_paths: List of folder paths to add to queue
+            template_name: Template for the new items (default: selected template)
+            tab_name: Tab for the new items (default: current tab)
         """
         log(f"add_folders called with {len(folder_paths)} paths",
             level="trace", category="queue")
 
         if len(folder_paths) == 1:
-            self._add_single_folder(folder_paths[0])
+            self._add_single_folder(folder_paths[0], template_name, tab_name)
         else:
-            self._add_multiple_folders_with_duplicate_detection(folder_paths)
+            self._add_multiple_folders_with_duplicate_detection(folder_paths, template_name, tab_name)
 
-    def _add_single_folder(self, path: str):
+    def _resolve_target(self, template_name: Optional[str] = None,
+                        tab_name: Optional[str] = None) -> Tuple[str, str]:
+        """Template and tab for new items, falling back to the current selection.
+
+        Unknown template or tab names (e.g. sent by another instance) are ignored.
+        """
+        mw = self._main_window
+        if not template_name or mw.template_combo.findText(template_name) < 0:
+            template_name = mw.template_combo.currentText()
+        tab_manager = getattr(mw, 'tab_manager', None)
+        if not tab_name or not (tab_manager and tab_manager.get_tab_by_name(tab_name)):
+            current_tab = (
+                mw.gallery_table.current_tab
+                if hasattr(mw.gallery_table, 'current_tab')
+                else "Main"
+            )
+            tab_name = "Main" if current_tab == "All Tabs" else current_tab
+        return template_name, tab_name
+
+    def _add_single_folder(self, path: str, template_name: Optional[str] = None,
+                           tab_name: Optional[str] = None):
         """Add a single folder with duplicate detection.
 
         Checks if folder is already in queue or was previously uploaded,
@@ -150,6 +175,8 @@ class GalleryQueueController(QObject):
 
         Args:
             path: Path to the folder to add
+            template_name: Template for the new item (default: selected template)
+            tab_name: Tab for the new item (default: current tab)
         """
         mw = self._main_window
         log(f"_add_single_folder called with path={path}", level="trace", category="queue")
@@ -197,13 +224,7 @@ class GalleryQueueController(QObject):
                 return  # User chose not to upload
 
         # Proceed with adding
-        template_name = mw.template_combo.currentText()
-        current_tab = (
-            mw.gallery_table.current_tab
-            if hasattr(mw.gallery_table, 'current_tab')
-            else "Main"
-        )
-        actual_tab = "Main" if current_tab == "All Tabs" else current_tab
+        template_name, actual_tab = self._resolve_target(template_name, tab_name)
 
         result = mw.queue_manager.add_item(
             path, template_name=template_name, tab_name=actual_tab
@@ -228,10 +249,11 @@ class GalleryQueueController(QObject):
                 category="queue", level="warning")
 
     def _add_archive_folder(self, folder_path: str, archive_path: str):
-        """Add a folder from extracted archive to queue.
+        """Add a folder from an archive to queue.
 
         Args:
-            folder_path: Path to the extracted folder
+            folder_path: Path to the extracted folder, or a virtual archive
+                gallery path when the archive is uploaded without extraction
             archive_path: Path to the source archive file
         """
         mw = self._main_window
@@ -243,7 +265,10 @@ class GalleryQueueController(QObject):
         )
 
         # Derive gallery name from folder, removing "extract_" prefix if present
-        folder_name = os.path.basename(folder_path)
+        if is_archive_gallery_path(folder_path):
+            folder_name = get_archive_gallery_name(folder_path)
+        else:
+            folder_name = os.path.basename(folder_path)
         if folder_name.startswith('extract_'):
             gallery_name = folder_name[8:]
         else:
@@ -268,79 +293,69 @@ class GalleryQueueController(QObject):
                     category="queue", level="info")
 
     def _add_multiple_folders(self, folder_paths: List[str]):
-        """Add multiple folders efficiently using the batch method.
-
-        Shows a progress dialog during addition and assigns items to the current tab.
+        """Add multiple folders without duplicate dialogs, to the current tab.
 
         Args:
             folder_paths: List of folder paths to add
         """
-        mw = self._main_window
-        template_name = mw.template_combo.currentText()
+        try:
+            template_name, actual_tab = self._resolve_target()
+            self._add_folders_bulk(folder_paths, template_name, actual_tab)
+        except Exception as e:
+            log(f"Adding multiple folders: {str(e)}", category="queue", level="error")
 
-        # Show progress dialog for multiple folders
-        progress = QProgressDialog(
-            "Adding galleries...", "Cancel", 0, len(folder_paths), mw
-        )
-        progress.setWindowModality(Qt.WindowModality.WindowModal)
-        progress.setAutoClose(True)
-        progress.setValue(0)
+    def _add_folders_bulk(self, folder_paths: List[str], template_name: str,
+                          tab_name: str) -> Dict[str, Any]:
+        """Queue folders in one batch and append their table rows together.
 
-        try:
-            results = mw.queue_manager.add_multiple_items(folder_paths, template_name)
+        Validation and scanning happen on the scan worker afterwards; the
+        status bar scan indicator shows how many galleries are still pending.
 
-            # Set all added items to current active tab
-            current_tab = (
-                mw.gallery_table.current_tab
-                if hasattr(mw.gallery_table, 'current_tab')
-                else "Main"
-            )
-            actual_tab = "Main" if current_tab == "All Tabs" else current_tab
-
-            if actual_tab != "Main" and results['added_paths']:
-                tab_info = mw.tab_manager.get_tab_by_name(actual_tab)
-                if tab_info:
-                    for path in results['added_paths']:
-                        item = mw.queue_manager.get_item(path)
-                        if item:
-                            item.tab_name = actual_tab
-                            mw.queue_manager._save_single_item(item)
-
-            progress.setValue(len(folder_paths))
-
-            # Show results
-            if results['added'] > 0:
-                log(f"Added {results['added']} galleries to queue",
-                    category="queue", level="info")
-            if results['duplicates'] > 0:
-                log(f"Skipped {results['duplicates']} duplicate galleries",
-                    category="queue", level="info")
-            if results['failed'] > 0:
-                log(f"Failed to add {results['failed']} galleries", category="queue")
-                for error in results['errors'][:5]:
-                    log(f"WARNING: {error}", category="queue", level="warning")
-                if len(results['errors']) > 5:
-                    log(f"... and {len(results['errors']) - 5} more errors",
-                        category="queue", level="warning")
-
-            # Add all successfully added items to table
-            for path in results.get('added_paths', []):
-                item = mw.queue_manager.get_item(path)
-                if item:
-                    mw._add_gallery_to_table(item)
+        Args:
+            folder_paths: Folder paths to add, in queue order
+            template_name: Template for the new items
+            tab_name: Tab for the new items
 
-        except Exception as e:
-            log(f"Adding multiple folders: {str(e)}", category="queue", level="error")
-        finally:
-            progress.close()
+        Returns:
+            Results from QueueManager.add_items_bulk
+        """
+        mw = self._main_window
+        results = mw.queue_manager.add_items_bulk(
+            folder_paths, template_name=template_name, tab_name=tab_name
+        )
 
-    def _add_multiple_folders_with_duplicate_detection(self, folder_paths: List[str]):
+        items = [mw.queue_manager.get_item(path) for path in results['added_paths']]
+        mw._add_galleries_to_table([item for item in items if item])
+
+        if results['added'] > 0:
+            log(f"Added {results['added']} galleries to queue",
+                category="queue", level="info")
+            mw.show_status_message(
+                f"Added {results['added']} galleries, validating in background...", 5000
+            )
+        if results['duplicates'] > 0:
+            log(f"Skipped {results['duplicates']} duplicate galleries",
+                category="queue", level="info")
+        if results['failed'] > 0:
+            log(f"Failed to add {results['failed']} galleries", category="queue")
+            for error in results['errors'][:5]:
+                log(f"WARNING: {error}", category="queue", level="warning")
+            if len(results['errors']) > 5:
+                log(f"... and {len(results['errors']) - 5} more errors",
+                    category="queue", level="warning")
+        return results
+
+    def _add_multiple_folders_with_duplicate_detection(self, folder_paths: List[str],
+                                                       template_name: Optional[str] = None,
+                                                       tab_name: Optional[str] = None):
         """Add multiple folders with duplicate detection dialogs.
 
         Shows dialogs for duplicate detection before adding folders to queue.
 
         Args:
             folder_paths: List of folder paths to add
+            template_name: Template for the new items (default: selected template)
+            tab_name: Tab for the new items (default: current tab)
         """
         mw = self._main_window
         from src.gui.dialogs.duplicate_detection_dialogs import show_duplicate_detection_dialogs
@@ -351,75 +366,34 @@ class GalleryQueueController(QObject):
                 folders_to_add=folder_paths,
                 check_gallery_exists_func=mw._check_if_gallery_exists,
                 queue_manager=mw.queue_manager,
-                parent=mw
+                parent=mw,
+                check_galleries_exist_batch_func=getattr(mw, '_check_if_galleries_exist', None)
             )
 
-            # Get current tab before adding items
-            current_tab = (
-                mw.gallery_table.current_tab
-                if hasattr(mw.gallery_table, 'current_tab')
-                else "Main"
-            )
-            actual_tab = "Main" if current_tab == "All Tabs" else current_tab
+            # Get target tab and template before adding items
+            template_name, actual_tab = self._resolve_target(template_name, tab_name)
 
-            # Process folders that passed duplicate checks
-            if folders_to_add_normally:
-                template_name = mw.template_combo.currentText()
-                log(f"Multiple folders - adding to tab: {actual_tab}",
-                    level="debug", category="queue")
-
-                for folder_path in folders_to_add_normally:
-                    try:
-                        result = mw.queue_manager.add_item(
-                            folder_path,
-                            template_name=template_name,
-                            tab_name=actual_tab
-                        )
-                        if result:
-                            item = mw.queue_manager.get_item(folder_path)
-                            if item:
-                                mw._add_gallery_to_table(item)
-                            log(f"Added to queue: {os.path.basename(folder_path)}",
-                                category="queue", level="debug")
-                    except Exception as e:
-                        log(f"Error while adding folder: {os.path.basename(folder_path)}: {e}",
-                            level="error", category="queue")
-
-            # Process folders that should replace existing queue items
+            # Replaced items are removed first so the whole batch is added in one pass
             if folders_to_replace_in_queue:
                 log(f"Replacing {len(folders_to_replace_in_queue)} folders in queue",
                     level="debug", category="queue")
-                template_name = mw.template_combo.currentText()
-                log(f"Multiple folders replacement - adding to tab: {actual_tab}",
-                    level="debug", category="queue")
-
                 for folder_path in folders_to_replace_in_queue:
                     try:
-                        # Remove existing item from both queue and table
                         mw.queue_manager.remove_item(folder_path)
                         mw._remove_gallery_from_table(folder_path)
-
-                        # Add new item with correct tab
-                        result = mw.queue_manager.add_item(
-                            folder_path,
-                            template_name=template_name,
-                            tab_name=actual_tab
-                        )
-                        if result:
-                            item = mw.queue_manager.get_item(folder_path)
-                            if item:
-                                mw._add_gallery_to_table(item)
-                        log(f"Replaced {os.path.basename(folder_path)} in queue",
-                            level="debug", category="queue")
                     except Exception as e:
                         log(f"Error while replacing {os.path.basename(folder_path)}: {e}",
                             level="error", category="queue")
 
+            folders = list(folders_to_add_normally) + list(folders_to_replace_in_queue)
+            if folders:
+                log(f"Multiple folders - adding to tab: {actual_tab}",
+                    level="debug", category="queue")
+                self._add_folders_bulk(folders, template_name, actual_tab)
+
             # Update display
             total_processed = len(folders_to_add_normally) + len(folders_to_replace_in_queue)
             if total_processed > 0:
-                log(f"Added {total_processed} galleries to queue",
-                    level="info", category="queue")
                 QTimer.singleShot(
                     100,
                     lambda: (
@@ -451,6 +425,35 @@ class GalleryQueueController(QObject):
         mw.raise_()
         mw.activateWindow()
 
+    def add_paths_from_instance(self, paths: List[str], options: Dict[str, Any], focus: bool = True):
+        """Add paths forwarded by another instance in one batch.
+
+        Also brings the window to focus if hidden.
+
+        Args:
+            paths: Folder or archive paths (empty to just focus the window)
+            options: Optional 'tab' and 'template' for the new galleries
+            focus: Bring the window to the front afterwards
+        """
+        mw = self._main_window
+        folders = [p for p in paths if os.path.isdir(p)]
+        archives = [p for p in paths if os.path.isfile(p) and is_archive_file(p)]
+        if len(folders) + len(archives) < len(paths):
+            log(f"Ignored {len(paths) - len(folders) - len(archives)} forwarded path(s) that are not folders or archives",
+                level="warning", category="queue")
+
+        if folders:
+            self.add_folders(folders, options.get('template'), options.get('tab'))
+        if archives:
+            self.add_folders_or_archives(archives)
+
+        if not focus:
+            return
+        if not mw.isVisible():
+            mw.show()
+        mw.raise_()
+        mw.activateWindow()
+
     # =========================================================================
     # Queue Action Methods
     # =========================================================================
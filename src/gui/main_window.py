@@ -20,7 +20,6 @@ Key Features:
 Main Classes:
     BBDropGUI: Primary application window and controller
     CompletionWorker: Background thread for post-upload processing
-    SingleInstanceServer: TCP server for single-instance communication
     AdaptiveGroupBox: Custom QGroupBox with proper size hint propagation
     LogTextEdit: QTextEdit subclass with double-click signal support
     NumericTableWidgetItem: QTableWidgetItem with numeric sorting
@@ -52,7 +51,6 @@ import os
 import json
 import logging
 import re
-import socket
 import threading
 import time
 import traceback
@@ -94,18 +92,15 @@ from bbdrop import ImxToUploader, get_project_root, load_user_defaults, sanitize
 from bbdrop import create_windows_context_menu, remove_windows_context_menu
 from src.utils.format_utils import format_binary_size, format_binary_rate, timestamp
 from src.utils.logger import log, set_main_window
+from src.utils.progress_bus import CHANNEL_GALLERY, get_progress_bus
 from src.gui.splash_screen import SplashScreen
 from src.gui.icon_manager import IconManager, init_icon_manager, get_icon_manager
-from src.gui.dialogs.log_viewer import LogViewerDialog
-from src.gui.dialogs.bbcode_viewer import BBCodeViewerDialog
-from src.gui.dialogs.help_dialog import HelpDialog
 
 
 from src.core.engine import UploadEngine
 from src.core.constants import IMAGE_EXTENSIONS
 from src.storage.database import QueueStore
 from src.utils.logging import get_logger
-from src.gui.settings_dialog import ComprehensiveSettingsDialog
 from src.gui.tab_manager import TabManager
 
 # Import widget classes from module
@@ -161,23 +156,19 @@ from src.storage.queue_manager import GalleryQueueItem, QueueManager
 
 # Import background task classes one at a time
 from src.processing.tasks import (
-    BackgroundTaskSignals, BackgroundTask, ProgressUpdateBatcher,
+    BackgroundTaskSignals, BackgroundTask,
     IconCache, TableRowUpdateTask, TableUpdateQueue
 )
 from src.processing.upload_workers import UploadWorker
 
-# Import dialog classes
-from src.gui.dialogs.template_manager import TemplateManagerDialog, PlaceholderHighlighter
-from src.gui.dialogs.log_viewer import LogViewerDialog
-from src.gui.dialogs.credential_setup import CredentialSetupDialog
-from src.gui.dialogs.bbcode_viewer import BBCodeViewerDialog
-from src.gui.dialogs.help_dialog import HelpDialog
+# Dialogs (settings, help, log viewer, BBCode viewer, credentials, statistics, file
+# manager) are imported when first opened to keep them off the startup path
 
 # Import archive support
 from src.services.archive_service import ArchiveService
 from src.processing.archive_coordinator import ArchiveCoordinator
 from src.processing.archive_worker import ArchiveExtractionWorker
-from src.utils.archive_utils import is_archive_file
+from src.utils.archive_utils import gallery_exists, is_archive_file
 from src.utils.system_utils import convert_to_wsl_path, is_wsl2
 
 # Import artifact handling
@@ -211,7 +202,7 @@ def format_timestamp_for_display(timestamp_value, include_seconds=False):
         return "", ""
 
 # Import network classes
-from src.network.client import GUIImxToUploader
+from src.network.client import GUIImxToUploader, SingleInstanceServer
 
 # Single instance communication port
 COMMUNICATION_PORT = 27849
@@ -328,65 +319,6 @@ class NumericTableWidgetItem(QTableWidgetItem):
         except Exception:
             return super().__lt__(other)
 
-class SingleInstanceServer(QThread):
-    """TCP server for single-instance application communication.
-
-    Listens on localhost:COMMUNICATION_PORT for messages from new instances.
-    When a second instance starts, it sends folder paths to this server and exits.
-    This allows handling "Open With" and drag-drop to EXE in Windows Explorer.
-
-    Signals:
-        folder_received(str): Emitted when message received (folder path or empty for focus)
-
-    Port:
-        Default port is 27849 (COMMUNICATION_PORT constant)
-
-    Protocol:
-        Simple UTF-8 text messages over TCP
-        - Non-empty string = folder path to add to queue
-        - Empty string = focus existing window
-
-    Thread Safety:
-        Runs in separate thread to avoid blocking GUI.
-        Uses signal/slot for thread-safe communication with main window.
-    """
-    
-    folder_received = pyqtSignal(str)
-    
-    def __init__(self, port=COMMUNICATION_PORT):
-        super().__init__()
-        self.port = port
-        self.running = True
-        
-    def run(self):
-        try:
-            server_socket = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
-            server_socket.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
-            server_socket.bind(('localhost', self.port))
-            server_socket.listen(1)
-            server_socket.settimeout(1.0)  # Timeout for checking self.running
-            
-            while self.running:
-                try:
-                    client_socket, _ = server_socket.accept()
-                    data = client_socket.recv(1024).decode('utf-8')
-                    # Emit signal for both folder paths and empty messages (window focus)
-                    self.folder_received.emit(data)
-                    client_socket.close()
-                except socket.timeout:
-                    continue
-                except Exception as e:
-                    if self.running:  # Only log if we're supposed to be running
-                        log(f"Server error: {e}", level="error", category="ipc")
-                        
-            server_socket.close()
-        except Exception as e:
-            log(f"Failed to start server: {e}", level="error", category="ipc")
-    
-    def stop(self):
-        self.running = False
-        self.wait()
-
 class BBDropGUI(QMainWindow):
     """Main application window for BBDrop GUI.
 
@@ -542,7 +474,8 @@ class BBDropGUI(QMainWindow):
         # Initialize archive support
         temp_dir = Path(get_config_path()).parent / "temp"
         archive_service = ArchiveService(temp_dir)
-        self.archive_coordinator = ArchiveCoordinator(archive_service, parent_widget=self)
+        self.archive_coordinator = ArchiveCoordinator(archive_service, parent_widget=self,
+                                                      stream_archives=True)
         if self.splash:
             self.splash.set_status("QueueManager")
         
@@ -615,14 +548,15 @@ class BBDropGUI(QMainWindow):
                 # Connect manager signals to UI handlers (via worker_signal_handler)
                 self.file_host_manager.test_completed.connect(self.worker_signal_handler.on_file_host_test_completed)
                 self.file_host_manager.upload_started.connect(self.worker_signal_handler.on_file_host_upload_started)
-                self.file_host_manager.upload_progress.connect(self.worker_signal_handler.on_file_host_upload_progress)
+                # Progress and bandwidth arrive through the progress bus; deliver what
+                # is pending before the completion handlers run
+                self.file_host_manager.upload_completed.connect(self.worker_signal_handler.progress_pump.flush)
+                self.file_host_manager.upload_failed.connect(self.worker_signal_handler.progress_pump.flush)
                 self.file_host_manager.upload_completed.connect(self.worker_signal_handler.on_file_host_upload_completed)
                 self.file_host_manager.upload_failed.connect(self.worker_signal_handler.on_file_host_upload_failed)
-                self.file_host_manager.bandwidth_updated.connect(self.worker_signal_handler.on_file_host_bandwidth_updated)
 
                 # Connect to worker status widget (via worker_signal_handler)
                 self.file_host_manager.upload_started.connect(self.worker_signal_handler._on_filehost_worker_started)
-                self.file_host_manager.upload_progress.connect(self.worker_signal_handler._on_filehost_worker_progress)
                 self.file_host_manager.upload_completed.connect(self.worker_signal_handler._on_filehost_worker_completed)
                 self.file_host_manager.upload_failed.connect(self.worker_signal_handler._on_filehost_worker_failed)
                 self.file_host_manager.storage_updated.connect(self.worker_status_widget.update_worker_storage)
@@ -673,14 +607,6 @@ class BBDropGUI(QMainWindow):
             self.splash.set_status("IconCache()")
         self._icon_cache = IconCache()
         
-        # Initialize progress update batcher
-        if self.splash:
-            self.splash.set_status("Progress Update Batcher")
-        self._progress_batcher = ProgressUpdateBatcher(
-            self._process_batched_progress_update,
-            batch_interval=0.05  # 50ms batching
-        )
-        
         # Initialize table update queue
         self._table_update_queue = None  # Will be set after table creation
         
@@ -692,6 +618,7 @@ class BBDropGUI(QMainWindow):
             self.splash.set_status("Starting SingleInstanceServer...")
         self.server = SingleInstanceServer()
         self.server.folder_received.connect(self.add_folder_from_command_line)
+        self.server.paths_received.connect(self.add_paths_from_instance)
         self.server.start()
         
         if self.splash:
@@ -1366,7 +1293,7 @@ class BBDropGUI(QMainWindow):
         try:
             from bbdrop import (
                 format_binary_rate, format_binary_size, get_unnamed_galleries,
-                check_if_gallery_exists, timestamp, get_central_storage_path,
+                check_if_gallery_exists, check_if_galleries_exist, timestamp, get_central_storage_path,
                 build_gallery_filenames, save_gallery_artifacts, generate_bbcode_from_template,
                 load_templates, get_template_path, __version__,
                 get_central_store_base_path, set_central_store_base_path
@@ -1375,6 +1302,7 @@ class BBDropGUI(QMainWindow):
             self._format_binary_size = format_binary_size
             self._get_unnamed_galleries = get_unnamed_galleries
             self._check_if_gallery_exists = check_if_gallery_exists
+            self._check_if_galleries_exist = check_if_galleries_exist
             self._timestamp = timestamp
             self._get_central_storage_path = get_central_storage_path
             self._build_gallery_filenames = build_gallery_filenames
@@ -1391,6 +1319,7 @@ class BBDropGUI(QMainWindow):
             self._format_binary_size = lambda size, precision=2: f"{size} B" if size else ""
             self._get_unnamed_galleries = lambda: {}
             self._check_if_gallery_exists = lambda name: []
+            self._check_if_galleries_exist = lambda paths: {}
             self._timestamp = lambda: time.strftime("%H:%M:%S")
             self._get_central_storage_path = lambda: os.path.expanduser("~/.bbdrop")
             self._build_gallery_filenames = lambda name, id: (f"{name}_{id}.json", f"{name}_{id}.json", f"{name}_{id}_bbcode.txt")
@@ -2121,6 +2050,27 @@ class BBDropGUI(QMainWindow):
         speed_layout.addWidget(self.speed_fastest_value_label, 1, 1)
         speed_layout.addWidget(self.speed_transferred_text_label, 2, 0)
         speed_layout.addWidget(self.speed_transferred_value_label, 2, 1)
+
+        # Live upload bandwidth limit (shared by imx.to and file host uploads)
+        self.speed_limit_text_label = QLabel("Limit:")
+        self.speed_limit_spin = QSpinBox()
+        self.speed_limit_spin.setRange(0, 10000000)
+        self.speed_limit_spin.setSingleStep(256)
+        self.speed_limit_spin.setSuffix(" KiB/s")
+        self.speed_limit_spin.setSpecialValueText("Unlimited")
+        self.speed_limit_spin.setAlignment(Qt.AlignmentFlag.AlignRight)
+        self.speed_limit_spin.setToolTip(
+            "Total upload bandwidth for all uploads (0 = unlimited).\n"
+            "A time-of-day schedule in Settings > Advanced overrides this while active."
+        )
+        self._speed_limit_timer = QTimer(self)
+        self._speed_limit_timer.setSingleShot(True)
+        self._speed_limit_timer.setInterval(500)
+        self._speed_limit_timer.timeout.connect(self._apply_bandwidth_limit)
+        self.speed_limit_spin.valueChanged.connect(lambda _: self._speed_limit_timer.start())
+        speed_layout.addWidget(self.speed_limit_text_label, 3, 0)
+        speed_layout.addWidget(self.speed_limit_spin, 3, 1)
+        self.refresh_bandwidth_limit_control()
         
         # Keep bottom short like the original progress box; fix width to avoid jitter
         speed_group.setSizePolicy(QSizePolicy.Policy.Fixed, QSizePolicy.Policy.Fixed)
@@ -2167,6 +2117,7 @@ class BBDropGUI(QMainWindow):
         """Prompt to set credentials only if API key is not set."""
         if not api_key_is_set():
             log(f"No API key set. Showing credential dialog...", level="warning", category="auth")
+            from src.gui.dialogs.credential_setup import CredentialSetupDialog
             self.credential_dialog = CredentialSetupDialog(self, standalone=True)
             # Use non-blocking show() instead of blocking exec() to prevent GUI freezing
             self.credential_dialog.show()
@@ -2325,6 +2276,23 @@ class BBDropGUI(QMainWindow):
         """Handle updates to the templates directory by refreshing the combo box."""
         self.refresh_template_combo()
 
+    def refresh_bandwidth_limit_control(self):
+        """Show the configured global upload limit in the Speed box."""
+        from src.network.bandwidth_governor import get_bandwidth_governor
+        self.speed_limit_spin.blockSignals(True)
+        self.speed_limit_spin.setValue(get_bandwidth_governor().global_limit_kbps)
+        self.speed_limit_spin.blockSignals(False)
+
+    def _apply_bandwidth_limit(self):
+        """Apply and persist the global upload limit from the Speed box."""
+        from src.network.bandwidth_governor import get_bandwidth_governor, save_global_limit
+        kbps = self.speed_limit_spin.value()
+        get_bandwidth_governor().set_global_limit(kbps)
+        try:
+            save_global_limit(kbps)
+        except OSError as e:
+            log(f"Could not save bandwidth limit: {e}", level="warning", category="network")
+
     def refresh_template_combo(self, preferred: str | None = None):
         """Reload templates into the dropdown, preserving selection when possible."""
         from bbdrop import load_templates
@@ -2353,6 +2321,7 @@ class BBDropGUI(QMainWindow):
     def open_comprehensive_settings(self, tab_index=0):
         """Open comprehensive settings dialog to specific tab"""
         # Pass file_host_manager to settings dialog
+        from src.gui.settings_dialog import ComprehensiveSettingsDialog
         file_host_manager = getattr(self, 'file_host_manager', None)
         dialog = ComprehensiveSettingsDialog(self, file_host_manager=file_host_manager)
         if 0 <= tab_index < dialog.tab_widget.count():
@@ -2424,6 +2393,7 @@ class BBDropGUI(QMainWindow):
 
     def open_help_dialog(self):
         """Open the help/documentation dialog"""
+        from src.gui.dialogs.help_dialog import HelpDialog
         dialog = HelpDialog(self)
         # Use non-blocking show() for help dialog
         dialog.show()
@@ -2778,12 +2748,20 @@ class BBDropGUI(QMainWindow):
         """
         self.gallery_queue_controller._add_archive_folder(folder_path, archive_path)
 
+    def on_archive_folder_ready(self, archive_path: str, folder_path: str):
+        """Queue a folder as soon as it is extracted (called from worker thread signal)"""
+        self._add_archive_folder(folder_path, archive_path)
+
+    def on_archive_extraction_progress(self, archive_path: str, percent: int):
+        """Show archive extraction progress in the status bar"""
+        self.show_status_message(f"Extracting {os.path.basename(archive_path)}: {percent}%")
+
     def on_archive_extraction_finished(self, archive_path: str, selected_folders: List[str]):
         """Handle successful archive extraction (called from worker thread signal)"""
         log(f"Archive extraction completed: {os.path.basename(archive_path)} ({len(selected_folders)} folders)", 
             level="info", category="fileio")
         
-        # Add all selected folders to queue
+        # Add all selected folders to queue (folders already queued early are skipped)
         for folder_path in selected_folders:
             self._add_archive_folder(folder_path, archive_path)
 
@@ -2881,7 +2859,19 @@ class BBDropGUI(QMainWindow):
         """
         self.gallery_queue_controller.add_folder_from_command_line(folder_path)
     
-    def _add_gallery_to_table(self, item: GalleryQueueItem):
+    def add_paths_from_instance(self, paths: List[str], options: Dict[str, Any], focus: bool = True):
+        """Add paths forwarded by another instance in one batch.
+
+        Delegates to GalleryQueueController.
+
+        Args:
+            paths: Folder or archive paths to add (empty to just focus the window)
+            options: Optional 'tab' and 'template' for the new galleries
+            focus: Bring the window to the front afterwards
+        """
+        self.gallery_queue_controller.add_paths_from_instance(paths, options, focus)
+
+    def _add_gallery_to_table(self, item: GalleryQueueItem, refresh_caches: bool = True):
         """Add a new gallery item to the table without rebuilding"""
         log(f"_add_gallery_to_table called for {item.path} with tab_name={item.tab_name}", level="debug", category="queue")
 
@@ -2918,15 +2908,37 @@ class BBDropGUI(QMainWindow):
             self.gallery_table.setRowHidden(row, True)
             log(f"Row {row} set HIDDEN - item tab '{item.tab_name}' != current tab '{current_tab}'", level="trace", category="queue")
         
-        # Invalidate TabManager's cache for this tab so it reloads from database
-        if hasattr(self.gallery_table, 'tab_manager') and item.tab_name:
-            self.gallery_table.tab_manager.invalidate_tab_cache(item.tab_name)
-            log(f"Invalidated TabManager cache for tab {item.tab_name}", level="debug", category="queue")
+        if refresh_caches:
+            self._refresh_caches_after_add({item.tab_name})
+
+    def _refresh_caches_after_add(self, tab_names):
+        """Invalidate tab and visibility caches after rows were added"""
+        # Invalidate TabManager's cache for these tabs so they reload from database
+        if hasattr(self.gallery_table, 'tab_manager'):
+            for tab_name in tab_names:
+                if tab_name:
+                    self.gallery_table.tab_manager.invalidate_tab_cache(tab_name)
+                    log(f"Invalidated TabManager cache for tab {tab_name}", level="debug", category="queue")
 
         # CRITICAL FIX: Invalidate table update queue visibility cache so new visible rows get updates
         if hasattr(self, '_table_update_queue') and self._table_update_queue:
             self._table_update_queue.invalidate_visibility_cache()
-            log(f"Invalidated table update queue visibility cache after adding row {row}", level="debug", category="queue")
+            log("Invalidated table update queue visibility cache after adding rows", level="debug", category="queue")
+
+    def _add_galleries_to_table(self, items: List[GalleryQueueItem]):
+        """Append many gallery items with table updates and sorting suspended"""
+        if not items:
+            return
+        sorting_enabled = self.gallery_table.isSortingEnabled()
+        self.gallery_table.setUpdatesEnabled(False)
+        self.gallery_table.setSortingEnabled(False)
+        try:
+            for item in items:
+                self._add_gallery_to_table(item, refresh_caches=False)
+        finally:
+            self.gallery_table.setSortingEnabled(sorting_enabled)
+            self.gallery_table.setUpdatesEnabled(True)
+        self._refresh_caches_after_add({item.tab_name for item in items})
     
     def _remove_gallery_from_table(self, path: str):
         """Remove a gallery from the table and update mappings"""
@@ -3256,7 +3268,7 @@ class BBDropGUI(QMainWindow):
         QTimer.singleShot(0, self.progress_tracker._update_counts_and_progress)
     
     def on_progress_updated(self, path: str, completed: int, total: int, progress_percent: int, current_image: str):
-        """Handle progress updates from worker - NON-BLOCKING"""
+        """Handle the latest progress for a gallery (once per frame, from the progress bus)"""
         # Only update the data model (fast operation)
         with QMutexLocker(self.queue_manager.mutex):
             if path in self.queue_manager.items:
@@ -3276,8 +3288,7 @@ class BBDropGUI(QMainWindow):
                     log(f"Exception in main_window: {e}", level="error", category="ui")
                     raise
 
-        # Add to batched progress updates for non-blocking GUI updates
-        self._progress_batcher.add_update(path, completed, total, progress_percent, current_image)
+        self._process_batched_progress_update(path, completed, total, progress_percent, current_image)
         
     def _process_batched_progress_update(self, path: str, completed: int, total: int, progress_percent: int, current_image: str):
         """Process batched progress updates on main thread - minimal operations only"""
@@ -3449,7 +3460,8 @@ class BBDropGUI(QMainWindow):
         # Force final progress update to show 100% completion
         if path in self.queue_manager.items:
             final_item = self.queue_manager.items[path]
-            self._progress_batcher.add_update(path, final_item.uploaded_images, final_item.total_images, 100, "")
+            get_progress_bus().publish(
+                CHANNEL_GALLERY, path, (final_item.uploaded_images, final_item.total_images, 100, ""))
         
         # Cleanup temp folder if from archive
         if path in self.queue_manager.items:
@@ -3513,33 +3525,25 @@ class BBDropGUI(QMainWindow):
     #        raise
     
     def _update_stats_deferred(self, results: dict):
-        """Update cumulative stats in background"""
+        """Update the fastest speed record and refresh the stats display.
+
+        Gallery, image and byte totals are counted by the database when the
+        gallery is saved as completed (see QueueStore.get_upload_totals).
+        """
         try:
-            successful_count = results.get('successful_count', 0)
             settings = QSettings("BBDropUploader", "Stats")
-            total_galleries = settings.value("total_galleries", 0, type=int) + 1
-            total_images_acc = settings.value("total_images", 0, type=int) + successful_count
-            base_total_str = settings.value("total_size_bytes_v2", "0")
-            try:
-                base_total = int(str(base_total_str))
-            except Exception:
-                base_total = settings.value("total_size_bytes", 0, type=int)
-            total_size_acc = base_total + int(results.get('uploaded_size', 0) or 0)
             transfer_speed = float(results.get('transfer_speed', 0) or 0)
             current_kbps = transfer_speed / 1024.0
             fastest_kbps = settings.value("fastest_kbps", 0.0, type=float)
             if current_kbps > fastest_kbps:
-                fastest_kbps = current_kbps
                 # Save timestamp when new record is set
                 from datetime import datetime
+                settings.setValue("fastest_kbps", current_kbps)
                 settings.setValue("fastest_kbps_timestamp",
                                   datetime.now().strftime("%Y-%m-%d %H:%M:%S"))
-            settings.setValue("total_galleries", total_galleries)
-            settings.setValue("total_images", total_images_acc)
-            settings.setValue("total_size_bytes_v2", str(total_size_acc))
-            settings.setValue("fastest_kbps", fastest_kbps)
-            settings.sync()
+                settings.sync()
             # Refresh progress display to show updated stats
+            self.progress_tracker.invalidate_stats_cache()
             self.progress_tracker.update_progress_display()
         except Exception as e:
             log(f"ERROR: Exception in main_window: {e}", level="error", category="ui")
@@ -3776,15 +3780,10 @@ class BBDropGUI(QMainWindow):
 
     def open_log_viewer_popup(self):
         """Open standalone log viewer dialog popup"""
-        try:
-            log(f"Opening log viewer dialog popup", level="debug", category="ui")
-            from src.utils.logging import get_logger
-            initial_text = get_logger().read_current_log(tail_bytes=2 * 1024 * 1024) or ""
-        except Exception as e:
-            log("Error opening log viewer dialog popup: {e}", level="error", category="ui")
-            initial_text = ""
-
-        dialog = LogViewerDialog(initial_text, self)
+        log(f"Opening log viewer dialog popup", level="debug", category="ui")
+        # The dialog indexes the current log file in the background
+        from src.gui.dialogs.log_viewer import LogViewerDialog
+        dialog = LogViewerDialog(parent=self)
         dialog.show()  # Non-modal dialog
 
     def open_icon_manager(self):
@@ -3952,8 +3951,8 @@ class BBDropGUI(QMainWindow):
                         clipboard.setText(download_link)
                         log(f"Copied {host_name} link to clipboard", level="info", category="file_hosts")
             else:
-                # Validate gallery folder exists before queuing
-                if not os.path.isdir(gallery_path):
+                # Validate gallery folder (or its archive) exists before queuing
+                if not gallery_exists(gallery_path):
                     log(f"Cannot upload to {host_name}: gallery folder not found: {gallery_path}", level="warning", category="file_hosts")
                     new_path = self._handle_missing_gallery_folder(gallery_path, host_name)
                     if new_path:
@@ -4228,6 +4227,7 @@ class BBDropGUI(QMainWindow):
             return
         
         # Open the viewer dialog
+        from src.gui.dialogs.bbcode_viewer import BBCodeViewerDialog
         dialog = BBCodeViewerDialog(path, self)
         dialog.exec()
     
@@ -4295,14 +4295,12 @@ class BBDropGUI(QMainWindow):
         else:
             # Try pattern-based lookup using gallery_id if exact filename fails
             if item and item.gallery_id:
-                import glob
-                log(f"BBcode copy: exact filename not found, trying pattern-based lookup for gallery_id '{item.gallery_id}'", level="debug", category="fileio")
-                pattern = os.path.join(central_path, f"*_{item.gallery_id}_bbcode.txt")
-                matches = glob.glob(pattern)
-                log(f"BBcode copy, found {len(matches)} matches for '{pattern}': {matches}", level="debug", category="fileio")
-                if matches:
-                    central_bbcode = matches[0]  # Use first match
-                    log(f"BBcode copy using pattern match: {central_bbcode}", level="debug", category="fileio")
+                from src.utils.artifact_finder import find_gallery_bbcode_by_id
+                log(f"BBcode copy: exact filename not found, looking up gallery_id '{item.gallery_id}' in artifact index", level="debug", category="fileio")
+                match = find_gallery_bbcode_by_id(item.gallery_id)
+                if match:
+                    central_bbcode = match
+                    log(f"BBcode copy using indexed artifact: {central_bbcode}", level="debug", category="fileio")
                     if os.path.exists(central_bbcode):
                         with open(central_bbcode, 'r', encoding='utf-8') as f:
                             content = f.read()
@@ -4768,8 +4766,8 @@ class BBDropGUI(QMainWindow):
     @pyqtSlot()
     def _stop_all_timers(self):
         """Stop all timers and batchers (must run on main thread)."""
-        if hasattr(self, '_progress_batcher'):
-            self._progress_batcher.cleanup()
+        if hasattr(self, 'worker_signal_handler'):
+            self.worker_signal_handler.stop()
         if hasattr(self, '_table_update_queue'):
             self._table_update_queue.cleanup()
         if hasattr(self, '_background_update_timer') and self._background_update_timer.isActive():
@@ -5083,20 +5081,23 @@ class BBDropGUI(QMainWindow):
             import traceback
             traceback.print_exc()
 
-def check_single_instance(folder_path=None):
-    """Check if another instance is running and send folder if needed"""
-    try:
-        client_socket = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
-        client_socket.connect(('localhost', COMMUNICATION_PORT))
+def check_single_instance(folder_paths=None, tab=None, template=None):
+    """Check if another instance is running and hand it our folders.
 
-        # Send folder path or empty string to bring window to front
-        message = folder_path if folder_path else ""
-        client_socket.send(message.encode('utf-8'))
+    Args:
+        folder_paths: Folder path or list of paths to forward (None to just focus)
+        tab: Optional tab for the forwarded galleries
+        template: Optional template for the forwarded galleries
 
-        client_socket.close()
-        return True  # Another instance is running
-    except ConnectionRefusedError:
-        return False  # No other instance running
+    Returns:
+        (running, paths): running is True when another instance took the
+        paths; otherwise paths holds ours plus any collected from other
+        processes started at the same time.
+    """
+    from src.network.single_instance import forward_to_running_instance
+    if isinstance(folder_paths, str):
+        folder_paths = [folder_paths]
+    return forward_to_running_instance(list(folder_paths or []), tab=tab, template=template)
 
 
 # ==============================================================================
@@ -7,6 +7,7 @@ Handles:
     - Menu bar creation with File, View, Settings, Tools, Help menus
     - About and License dialog display
     - Windows Explorer context menu integration
+    - Performance trace recording and Chrome trace export
 """
 
 import os
@@ -16,6 +17,7 @@ from PyQt6.QtCore import QObject, Qt
 from PyQt6.QtGui import QActionGroup, QPixmap
 from PyQt6.QtWidgets import (
     QDialog,
+    QFileDialog,
     QLabel,
     QMessageBox,
     QPushButton,
@@ -215,6 +217,18 @@ class MenuManager(QObject):
             action_remove_ctx = context_menu.addAction("Remove Context Menu...")
             action_remove_ctx.triggered.connect(self.remove_context_menu)
 
+            # Performance trace submenu
+            trace_menu = tools_menu.addMenu("Performance Trace")
+            action_record_trace = trace_menu.addAction("Record Trace")
+            action_record_trace.setCheckable(True)
+            from src.utils.tracing import is_tracing_enabled
+            action_record_trace.setChecked(is_tracing_enabled())
+            action_record_trace.toggled.connect(self.toggle_tracing)
+            action_export_trace = trace_menu.addAction("Export Trace...")
+            action_export_trace.triggered.connect(lambda: self.export_trace(selected_only=False))
+            action_export_gallery_trace = trace_menu.addAction("Export Trace for Selected Gallery...")
+            action_export_gallery_trace.triggered.connect(lambda: self.export_trace(selected_only=True))
+
             # Help menu
             help_menu = menu_bar.addMenu("Help")
             action_help = help_menu.addAction("Help")
@@ -404,3 +418,58 @@ class MenuManager(QObject):
             except Exception as e:
                 log(f"Exception in menu_manager: {e}", level="error", category="ui")
                 raise
+
+    # =========================================================================
+    # Performance Trace
+    # =========================================================================
+
+    def toggle_tracing(self, enabled: bool):
+        """Start or stop recording pipeline spans."""
+        from src.utils.tracing import enable_tracing, disable_tracing
+        if enabled:
+            enable_tracing()
+        else:
+            disable_tracing()
+        log(f"Performance tracing {'enabled' if enabled else 'disabled'}", category="ui", level="info")
+
+    def _selected_gallery_path(self):
+        """Path of the first selected gallery in the queue table, or None."""
+        table = getattr(self._main_window.gallery_table, 'table', self._main_window.gallery_table)
+        from src.gui.widgets.gallery_table import GalleryTableWidget
+        for item in table.selectedItems():
+            name_item = table.item(item.row(), GalleryTableWidget.COL_NAME)
+            if name_item and name_item.data(Qt.ItemDataRole.UserRole):
+                return name_item.data(Qt.ItemDataRole.UserRole)
+        return None
+
+    def export_trace(self, selected_only: bool = False):
+        """Export recorded spans as Chrome trace JSON.
+
+        Args:
+            selected_only: Only export spans of the selected gallery
+        """
+        mw = self._main_window
+        gallery = None
+        if selected_only:
+            gallery = self._selected_gallery_path()
+            if not gallery:
+                QMessageBox.information(mw, "Performance Trace", "Select a gallery first.")
+                return
+
+        path, _ = QFileDialog.getSaveFileName(
+            mw, "Export Performance Trace", "bbdrop_trace.json", "Chrome Trace (*.json)"
+        )
+        if not path:
+            return
+        try:
+            from src.utils.tracing import export_chrome_trace, is_tracing_enabled
+            count = export_chrome_trace(path, gallery=gallery)
+        except OSError as e:
+            QMessageBox.warning(mw, "Performance Trace", f"Failed to export trace: {e}")
+            log(f"Failed to export trace: {e}", category="ui", level="error")
+            return
+        message = f"Exported {count} spans to {path}."
+        if not count and not is_tracing_enabled():
+            message += "\n\nEnable Tools > Performance Trace > Record Trace first."
+        QMessageBox.information(mw, "Performance Trace", message)
+        log(f"Exported {count} trace spans to {path}", category="ui", level="info")
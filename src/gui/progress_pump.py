@@ -0,0 +1,98 @@
+"""Fixed-rate delivery of progress bus updates to the GUI.
+
+Worker threads publish progress into the shared ProgressBus
+(src.utils.progress_bus); ProgressBusPump drains it on the GUI thread once
+per frame and hands each key's latest state to the subscribed handlers.
+"""
+
+from collections import defaultdict
+from typing import Any, Callable, Dict, Hashable, List, Optional
+
+from PyQt6.QtCore import QObject, QTimer
+
+from src.utils.logger import log
+from src.utils.progress_bus import ProgressBus, ProgressBusStats, get_progress_bus
+
+SETTING_REFRESH_HZ = "gui/progress_refresh_hz"
+DEFAULT_REFRESH_HZ = 20
+MIN_REFRESH_HZ = 1
+MAX_REFRESH_HZ = 60
+
+ProgressHandler = Callable[[Hashable, Any], None]
+
+
+def load_refresh_rate() -> int:
+    """Progress refresh rate from Settings > Advanced."""
+    try:
+        from bbdrop import read_config
+        rate = read_config().getint('Advanced', SETTING_REFRESH_HZ, fallback=DEFAULT_REFRESH_HZ)
+    except Exception as e:
+        log(f"Could not load progress refresh rate: {e}", level="warning", category="ui")
+        rate = DEFAULT_REFRESH_HZ
+    return rate
+
+
+class ProgressBusPump(QObject):
+    """Drains a ProgressBus at a fixed rate and dispatches per channel."""
+
+    def __init__(self, bus: Optional[ProgressBus] = None, rate_hz: int = DEFAULT_REFRESH_HZ,
+                 parent: Optional[QObject] = None):
+        """Initialize the pump (call start() to begin draining).
+
+        Args:
+            bus: Bus to drain (defaults to the process-wide bus)
+            rate_hz: Drains per second
+            parent: Optional parent QObject
+        """
+        super().__init__(parent)
+        self._bus = bus if bus is not None else get_progress_bus()
+        self._handlers: Dict[str, List[ProgressHandler]] = defaultdict(list)
+        self._timer = QTimer(self)
+        self._timer.timeout.connect(self.flush)
+        self._rate_hz = DEFAULT_REFRESH_HZ
+        self.set_rate(rate_hz)
+
+    @property
+    def rate_hz(self) -> int:
+        return self._rate_hz
+
+    def subscribe(self, channel: str, handler: ProgressHandler) -> None:
+        """Call handler(key, state) with each drained state on channel."""
+        self._handlers[channel].append(handler)
+
+    def set_rate(self, rate_hz: int) -> None:
+        self._rate_hz = max(MIN_REFRESH_HZ, min(MAX_REFRESH_HZ, int(rate_hz)))
+        self._timer.setInterval(round(1000 / self._rate_hz))
+
+    def start(self) -> None:
+        self._timer.start()
+
+    def stop(self) -> None:
+        """Stop the timer and deliver whatever is still pending."""
+        self._timer.stop()
+        self.flush()
+        stats = self._bus.stats()
+        log(f"Progress bus: {stats.published} published, {stats.delivered} delivered, "
+            f"{stats.coalesced} coalesced over {stats.drains} frames",
+            level="debug", category="ui")
+
+    def stats(self) -> ProgressBusStats:
+        return self._bus.stats()
+
+    def flush(self, *_args) -> None:
+        """Deliver pending states now.
+
+        Connected ahead of completion/failure signals so the last progress
+        for an upload is handled before its completion.
+        """
+        for channel, updates in self._bus.drain().items():
+            handlers = self._handlers.get(channel)
+            if not handlers:
+                continue
+            for key, state in updates.items():
+                for handler in handlers:
+                    try:
+                        handler(key, state)
+                    except Exception as e:
+                        log(f"Progress handler for {channel} failed: {e}",
+                            level="error", category="ui")
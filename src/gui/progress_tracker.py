@@ -61,17 +61,25 @@ class ProgressTracker(QObject):
         now = time.time()
         if now - self._stats_cache_time > 5.0:  # Refresh every 5s
             settings = self._stats_settings
+            totals = {'galleries': 0, 'images': 0, 'bytes': 0}
+            try:
+                totals = self._main_window.queue_manager.store.get_upload_totals()
+            except Exception as e:
+                log(f"Error loading upload totals: {e}", level="debug", category="ui")
             self._cached_stats = {
-                'total_galleries': settings.value("total_galleries", 0, type=int),
-                'total_images': settings.value("total_images", 0, type=int),
-                'total_size_bytes_v2': settings.value("total_size_bytes_v2", "0"),
-                'total_size_bytes': settings.value("total_size_bytes", 0, type=int),
+                'total_galleries': totals['galleries'],
+                'total_images': totals['images'],
+                'total_size_bytes': totals['bytes'],
                 'fastest_kbps': settings.value("fastest_kbps", 0.0, type=float),
                 'fastest_kbps_timestamp': settings.value("fastest_kbps_timestamp", ""),
             }
             self._stats_cache_time = now
         return self._cached_stats
 
+    def invalidate_stats_cache(self):
+        """Reload statistics on the next progress display update."""
+        self._stats_cache_time = 0.0
+
     def _update_counts_and_progress(self):
         """Update both button counts and progress display together."""
         self._update_button_counts()
@@ -176,11 +184,7 @@ class ProgressTracker(QObject):
         cached = self._get_cached_stats()
         total_galleries = cached['total_galleries']
         total_images_acc = cached['total_images']
-        total_size_bytes_v2 = cached['total_size_bytes_v2']
-        try:
-            total_size_acc = int(str(total_size_bytes_v2))
-        except Exception:
-            total_size_acc = cached['total_size_bytes']
+        total_size_acc = cached['total_size_bytes']
         fastest_kbps = cached['fastest_kbps']
 
         self._main_window.stats_total_galleries_value_label.setText(f"{total_galleries}")
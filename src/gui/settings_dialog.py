@@ -1363,6 +1363,7 @@ class ComprehensiveSettingsDialog(QDialog):
             getattr(self, f'hook_{hook_type}_enabled').toggled.connect(lambda: self.mark_tab_dirty(TabIndex.HOOKS))
             getattr(self, f'hook_{hook_type}_command').textChanged.connect(lambda: self.mark_tab_dirty(TabIndex.HOOKS))
             getattr(self, f'hook_{hook_type}_show_console').toggled.connect(lambda: self.mark_tab_dirty(TabIndex.HOOKS))
+            getattr(self, f'hook_{hook_type}_persistent').toggled.connect(lambda: self.mark_tab_dirty(TabIndex.HOOKS))
 
     def _create_hook_section(self, parent_layout, title, hook_type):
         """Create a compact section for configuring a single hook"""
@@ -1406,6 +1407,9 @@ class ComprehensiveSettingsDialog(QDialog):
         show_console_check = QCheckBox()
         show_console_check.setVisible(False)
         setattr(self, f'hook_{hook_type}_show_console', show_console_check)
+        persistent_check = QCheckBox()
+        persistent_check.setVisible(False)
+        setattr(self, f'hook_{hook_type}_persistent', persistent_check)
 
         for i in range(1, 5):
             key_input = QLineEdit()
@@ -1899,6 +1903,13 @@ class ComprehensiveSettingsDialog(QDialog):
         current_show_console = getattr(self, f'hook_{hook_type}_show_console').isChecked()
         show_console_check.setChecked(current_show_console)
         options_layout.addWidget(show_console_check)
+        persistent_check = QCheckBox("Keep hook running between galleries")
+        persistent_check.setToolTip(
+            "Start the hook once and send it one job per gallery instead of starting it every time.\n"
+            "Logins and connections are reused. The hook must support --persistent (see hooks/hook_worker.py)."
+        )
+        persistent_check.setChecked(getattr(self, f'hook_{hook_type}_persistent').isChecked())
+        options_layout.addWidget(persistent_check)
         options_layout.addStretch()
         layout.addLayout(options_layout)
 
@@ -2280,6 +2291,7 @@ class ComprehensiveSettingsDialog(QDialog):
 
             # Save the show console checkbox
             getattr(self, f'hook_{hook_type}_show_console').setChecked(show_console_check.isChecked())
+            getattr(self, f'hook_{hook_type}_persistent').setChecked(persistent_check.isChecked())
 
             # Save the JSON key mappings
             for i in range(1, 5):
@@ -2415,6 +2427,12 @@ class ComprehensiveSettingsDialog(QDialog):
         with open(config_file, 'w', encoding='utf-8') as f:
             config.write(f)
 
+        # Apply upload bandwidth limits to running transfers
+        from src.network.bandwidth_governor import get_bandwidth_governor
+        get_bandwidth_governor().load_settings()
+        if self.parent() and hasattr(self.parent(), 'refresh_bandwidth_limit_control'):
+            self.parent().refresh_bandwidth_limit_control()
+
         # Save bandwidth settings to QSettings (for BandwidthManager)
         alpha_up = all_values.get('bandwidth/alpha_up', 0.6)
         alpha_down = all_values.get('bandwidth/alpha_down', 0.15)
@@ -2423,11 +2441,13 @@ class ComprehensiveSettingsDialog(QDialog):
         qsettings.setValue("bandwidth/alpha_up", alpha_up)
         qsettings.setValue("bandwidth/alpha_down", alpha_down)
 
-        # Update the running BandwidthManager if available
+        # Update the running BandwidthManager and progress refresh rate if available
         if self.parent() and hasattr(self.parent(), 'worker_signal_handler'):
             handler = self.parent().worker_signal_handler
             if hasattr(handler, 'bandwidth_manager'):
                 handler.bandwidth_manager.update_smoothing(alpha_up, alpha_down)
+            if hasattr(handler, 'progress_pump'):
+                handler.progress_pump.set_rate(all_values.get('gui/progress_refresh_hz', 20))
 
         return True
 
@@ -2783,6 +2803,7 @@ class ComprehensiveSettingsDialog(QDialog):
                     getattr(self, f'hook_{hook_type}_enabled'),
                     getattr(self, f'hook_{hook_type}_command'),
                     getattr(self, f'hook_{hook_type}_show_console'),
+                    getattr(self, f'hook_{hook_type}_persistent'),
                 ])
 
             for control in controls:
@@ -2808,6 +2829,8 @@ class ComprehensiveSettingsDialog(QDialog):
                 getattr(self, f'hook_{hook_type}_enabled').setChecked(enabled)
                 getattr(self, f'hook_{hook_type}_command').setText(command)
                 getattr(self, f'hook_{hook_type}_show_console').setChecked(show_console)
+                getattr(self, f'hook_{hook_type}_persistent').setChecked(
+                    config.getboolean('EXTERNAL_APPS', f'hook_{hook_type}_persistent', fallback=False))
 
                 # Load JSON key mappings
                 for i in range(1, 5):
@@ -3073,6 +3096,8 @@ class ComprehensiveSettingsDialog(QDialog):
                 config.set('EXTERNAL_APPS', f'hook_{hook_type}_enabled', str(enabled))
                 config.set('EXTERNAL_APPS', f'hook_{hook_type}_command', escaped_command)
                 config.set('EXTERNAL_APPS', f'hook_{hook_type}_show_console', str(show_console))
+                config.set('EXTERNAL_APPS', f'hook_{hook_type}_persistent',
+                           str(getattr(self, f'hook_{hook_type}_persistent').isChecked()))
 
                 # Save JSON key mappings
                 for i in range(1, 5):
@@ -3082,6 +3107,9 @@ class ComprehensiveSettingsDialog(QDialog):
             with open(config_file, 'w', encoding='utf-8') as f:
                 config.write(f)
 
+            from src.processing.hooks_executor import get_hooks_executor
+            get_hooks_executor().invalidate_config()
+
         except Exception as e:
             log(f"Failed to save external apps settings: {e}", level="warning", category="settings")
 
@@ -3526,6 +3554,11 @@ class ComprehensiveSettingsDialog(QDialog):
             new_batch_size = self.batch_size_slider.value()
             config.set('DEFAULTS', 'parallel_batch_size', str(new_batch_size))
 
+            # A limit learned under the old batch size no longer reflects the user's choice
+            if old_batch_size != new_batch_size:
+                from src.core.adaptive_concurrency import forget_learned_limit
+                forget_learned_limit(config)
+
             # Signal uploader to refresh connection pool if batch size changed
             if old_batch_size != new_batch_size and self.parent_window and hasattr(self.parent_window, 'uploader'):
                 try:
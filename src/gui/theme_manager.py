@@ -6,14 +6,17 @@ main_window.py to improve maintainability and separation of concerns.
 Handles:
     - Dark/light theme switching with QPalette and QSS
     - Font size management throughout the application
-    - Stylesheet caching for performance
+    - Stylesheet caching for performance (in memory and on disk, keyed by
+      the source files' modification times)
     - Design token injection from tokens.json
     - Modular QSS loading from assets/styles/ directory
 """
 
+import hashlib
 import json
 import os
 import re
+import time
 from typing import TYPE_CHECKING, Any
 
 from PyQt6.QtCore import QObject, QTimer
@@ -40,6 +43,9 @@ COMPONENT_FILES = [
     'labels.qss',
 ]
 
+# Bump when the way stylesheets are compiled changes, to ignore older disk caches
+STYLESHEET_CACHE_VERSION = 1
+
 
 def get_assets_dir() -> str:
     """Get the absolute path to the assets directory.
@@ -51,6 +57,16 @@ def get_assets_dir() -> str:
     return os.path.join(get_project_root(), "assets")
 
 
+def get_stylesheet_cache_dir() -> str:
+    """Get the directory holding compiled stylesheets.
+
+    Returns:
+        str: Absolute path to central_store/cache/styles
+    """
+    from bbdrop import get_central_store_base_path
+    return os.path.join(get_central_store_base_path(), "cache", "styles")
+
+
 def is_dark_mode() -> bool:
     """Check if the application is in dark mode.
 
@@ -111,6 +127,12 @@ class ThemeManager(QObject):
     1. Modular (preferred): Loads base.qss + components/*.qss + themes/{theme}.qss
     2. Legacy (fallback): Loads monolithic styles.qss with embedded theme markers
 
+    Compiled stylesheets are cached per theme in memory and on disk, keyed by
+    the modification times and sizes of the QSS and token files they were built
+    from, so only the first apply after an asset change reads and parses them.
+    Applying a theme skips the palette or stylesheet when the application
+    already has them, since every setStyleSheet() re-polishes all widgets.
+
     Attributes:
         _main_window: Reference to the main BBDropGUI window
         _cached_base_qss: Cached base stylesheet content (legacy mode)
@@ -119,6 +141,8 @@ class ThemeManager(QObject):
         _cached_modular_dark_qss: Cached modular dark stylesheet (modular mode)
         _cached_modular_light_qss: Cached modular light stylesheet (modular mode)
         _modular_qss_available: Whether modular QSS structure exists
+        _stylesheet_cache: Compiled stylesheets by theme, as (cache key, QSS)
+        last_theme_switch_ms: Duration of the last apply_theme() call
     """
 
     def __init__(self, main_window: 'BBDropGUI'):
@@ -137,6 +161,10 @@ class ThemeManager(QObject):
         self._cached_modular_dark_qss: str | None = None
         self._cached_modular_light_qss: str | None = None
         self._modular_qss_available: bool | None = None
+        # Compiled stylesheets by theme: (cache key, stylesheet)
+        self._stylesheet_cache: dict[str, tuple[str, str]] = {}
+        self._last_stylesheet_source = ''
+        self.last_theme_switch_ms: float | None = None
 
     # =========================================================================
     # Design Token Methods
@@ -604,8 +632,128 @@ class ThemeManager(QObject):
     # Theme Application Methods
     # =========================================================================
 
+    def _stylesheet_sources(self, theme: str) -> list[str]:
+        """List the files a theme's stylesheet is compiled from.
+
+        Args:
+            theme: Theme name ('light' or 'dark')
+
+        Returns:
+            list[str]: Paths of the QSS and token files (existing or not)
+        """
+        assets_dir = get_assets_dir()
+        sources = [os.path.join(assets_dir, "tokens.json")]
+        if self._check_modular_qss_available():
+            styles_dir = os.path.join(assets_dir, "styles")
+            sources.append(os.path.join(styles_dir, "base.qss"))
+            sources.extend(os.path.join(styles_dir, "components", name) for name in COMPONENT_FILES)
+            sources.append(os.path.join(styles_dir, "themes", f"{theme}.qss"))
+        sources.append(os.path.join(assets_dir, "styles.qss"))
+        return sources
+
+    def _stylesheet_cache_key(self, theme: str) -> str:
+        """Build the cache key for a theme from its source files' mtimes and sizes.
+
+        Args:
+            theme: Theme name ('light' or 'dark')
+
+        Returns:
+            str: Hex digest identifying the current sources of the theme
+        """
+        signature = []
+        for path in self._stylesheet_sources(theme):
+            try:
+                stat = os.stat(path)
+                signature.append((path, stat.st_mtime_ns, stat.st_size))
+            except OSError:
+                signature.append((path, None, None))
+        payload = repr((STYLESHEET_CACHE_VERSION, theme, signature))
+        return hashlib.sha1(payload.encode('utf-8')).hexdigest()[:16]
+
+    def _read_stylesheet_cache(self, theme: str, key: str) -> str | None:
+        """Read a compiled stylesheet from the disk cache.
+
+        Args:
+            theme: Theme name ('light' or 'dark')
+            key: Cache key from _stylesheet_cache_key()
+
+        Returns:
+            str | None: Cached stylesheet, or None if absent or unreadable
+        """
+        try:
+            path = os.path.join(get_stylesheet_cache_dir(), f"{theme}-{key}.qss")
+            with open(path, 'r', encoding='utf-8') as f:
+                return f.read()
+        except OSError:
+            return None
+        except Exception as e:
+            log(f"Error reading cached stylesheet: {e}", level="debug", category="ui")
+            return None
+
+    def _write_stylesheet_cache(self, theme: str, key: str, stylesheet: str) -> None:
+        """Write a compiled stylesheet to the disk cache, replacing older builds.
+
+        Args:
+            theme: Theme name ('light' or 'dark')
+            key: Cache key from _stylesheet_cache_key()
+            stylesheet: Compiled stylesheet content
+        """
+        try:
+            cache_dir = get_stylesheet_cache_dir()
+            os.makedirs(cache_dir, exist_ok=True)
+            path = os.path.join(cache_dir, f"{theme}-{key}.qss")
+            tmp_path = f"{path}.{os.getpid()}.tmp"
+            with open(tmp_path, 'w', encoding='utf-8') as f:
+                f.write(stylesheet)
+            os.replace(tmp_path, path)
+            for name in os.listdir(cache_dir):
+                if name.startswith(f"{theme}-") and name.endswith(".qss") and name != os.path.basename(path):
+                    os.remove(os.path.join(cache_dir, name))
+        except Exception as e:
+            log(f"Error writing stylesheet cache: {e}", level="debug", category="ui")
+
     def _get_stylesheet_for_theme(self, theme: str) -> str:
-        """Get the complete stylesheet for a theme.
+        """Get the complete stylesheet for a theme, from cache where possible.
+
+        Looks in memory, then on disk, under a key built from the source
+        files' mtimes and sizes. Compiles and caches the stylesheet on a miss.
+
+        Args:
+            theme: Theme name ('light' or 'dark')
+
+        Returns:
+            str: Complete stylesheet content ready for application
+        """
+        key = self._stylesheet_cache_key(theme)
+        cached = self._stylesheet_cache.get(theme)
+        if cached is not None and cached[0] == key:
+            self._last_stylesheet_source = 'memory'
+            return cached[1]
+
+        stylesheet = self._read_stylesheet_cache(theme, key)
+        if stylesheet is not None:
+            self._last_stylesheet_source = 'disk'
+        else:
+            self._last_stylesheet_source = 'compiled'
+            self._clear_compiled_caches()
+            stylesheet = self._compile_stylesheet(theme)
+            self._write_stylesheet_cache(theme, key, stylesheet)
+
+        self._stylesheet_cache[theme] = (key, stylesheet)
+        return stylesheet
+
+    def _clear_compiled_caches(self) -> None:
+        """Drop the per-file caches so the next compile rereads changed sources."""
+        global _cached_tokens
+        _cached_tokens = None
+        self._cached_base_qss = None
+        self._cached_dark_qss = None
+        self._cached_light_qss = None
+        self._cached_modular_dark_qss = None
+        self._cached_modular_light_qss = None
+
+    def _compile_stylesheet(self, theme: str) -> str:
+        """Build the complete stylesheet for a theme from its source files.
 
         Tries to load modular QSS first (base + components + theme file).
         Falls back to legacy styles.qss if modular files are not available.
@@ -643,6 +791,7 @@ class ThemeManager(QObject):
             mode: Theme mode to apply ('light' or 'dark')
         """
         mw = self._main_window
+        started = time.perf_counter()
         try:
             qapp = QApplication.instance()
             if qapp is None or not isinstance(qapp, QApplication):
@@ -650,6 +799,7 @@ class ThemeManager(QObject):
 
             # Disable updates during theme switch to prevent intermediate repaints
             mw.setUpdatesEnabled(False)
+            restyled = False
             try:
                 # Try to load modular QSS first, fallback to legacy
                 stylesheet = self._get_stylesheet_for_theme(mode)
@@ -685,8 +835,8 @@ class ThemeManager(QObject):
                         log(f"Exception in theme_manager apply_theme: {e}",
                             level="error", category="ui")
                         raise
-                    qapp.setPalette(palette)
-                    qapp.setStyleSheet(stylesheet)
+                    self._set_app_palette(qapp, palette)
+                    restyled = self._set_app_stylesheet(qapp, stylesheet)
                 elif mode == 'light':
                     palette = qapp.palette()
                     try:
@@ -717,8 +867,8 @@ class ThemeManager(QObject):
                         log(f"Exception in theme_manager apply_theme: {e}",
                             level="error", category="ui")
                         raise
-                    qapp.setPalette(palette)
-                    qapp.setStyleSheet(stylesheet)
+                    self._set_app_palette(qapp, palette)
+                    restyled = self._set_app_stylesheet(qapp, stylesheet)
                 else:
                     # Default to dark if unknown mode
                     return self.apply_theme('dark')
@@ -741,11 +891,51 @@ class ThemeManager(QObject):
                     raise
             finally:
                 mw.setUpdatesEnabled(True)
+
+            self.last_theme_switch_ms = (time.perf_counter() - started) * 1000
+            log(f"Applied {mode} theme in {self.last_theme_switch_ms:.1f}ms "
+                f"(stylesheet from {self._last_stylesheet_source}, "
+                f"{'restyled' if restyled else 'already applied'})",
+                level="debug", category="ui")
         except Exception as e:
             log(f"Exception in theme_manager apply_theme: {e}",
                 level="error", category="ui")
             raise
 
+    def _set_app_palette(self, qapp: QApplication, palette: QPalette) -> bool:
+        """Set the application palette unless it is already in use.
+
+        Args:
+            qapp: Application instance
+            palette: Palette to apply
+
+        Returns:
+            bool: True if the palette was changed
+        """
+        if qapp.palette() == palette:
+            return False
+        qapp.setPalette(palette)
+        return True
+
+    def _set_app_stylesheet(self, qapp: QApplication, stylesheet: str) -> bool:
+        """Set the application stylesheet unless it is already in use.
+
+        Setting a stylesheet re-polishes every widget, which takes seconds
+        with a large gallery table, so re-applying the current theme (for
+        example when the settings dialog is saved) must not do it again.
+
+        Args:
+            qapp: Application instance
+            stylesheet: Stylesheet to apply
+
+        Returns:
+            bool: True if the stylesheet was changed
+        """
+        if qapp.styleSheet() == stylesheet:
+            return False
+        qapp.setStyleSheet(stylesheet)
+        return True
+
     # =========================================================================
     # Font Size Methods
     # =========================================================================
@@ -767,10 +957,12 @@ class ThemeManager(QObject):
                 table_font_size = max(font_size - 1, 6)  # Table 1pt smaller, minimum 6pt
                 header_font_size = max(font_size - 2, 6)  # Headers even smaller
 
-                # Set font directly on the table widget - this affects all items
+                # Set font directly on the table widget - this affects all items.
+                # Skip unchanged fonts: each setFont() relayouts the whole table.
                 table_font = QFont()
                 table_font.setPointSize(table_font_size)
-                table.setFont(table_font)
+                if table.font() != table_font:
+                    table.setFont(table_font)
 
                 # Set smaller font on each header item
                 header_font = QFont()
@@ -779,7 +971,7 @@ class ThemeManager(QObject):
                 # Use the actual table (table = mw.gallery_table.table)
                 for col in range(table.columnCount()):
                     header_item = table.horizontalHeaderItem(col)
-                    if header_item:
+                    if header_item and header_item.font() != header_font:
                         header_item.setFont(header_font)
 
             # Update log text font
@@ -793,7 +985,8 @@ class ThemeManager(QObject):
                     log(f"Exception in theme_manager apply_font_size: {e}",
                         level="error", category="ui")
                     raise
-                mw.log_text.setFont(log_font)
+                if mw.log_text.font() != log_font:
+                    mw.log_text.setFont(log_font)
 
             # Save the current font size
             if hasattr(mw, 'settings'):
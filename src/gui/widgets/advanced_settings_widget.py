@@ -20,14 +20,44 @@ ADVANCED_SETTINGS = [
         "min": 6,
         "max": 24
     },
+    {
+        "key": "gui/progress_refresh_hz",
+        "description": "How many times per second upload progress and speeds are redrawn",
+        "default": 20,
+        "type": "int",
+        "min": 1,
+        "max": 60
+    },
     {
         "key": "uploads/retry_delay_seconds",
-        "description": "Seconds to wait before retrying a failed upload",
+        "description": "Seconds to wait before retrying a failed image upload (doubles with each attempt, with jitter)",
         "default": 5,
         "type": "int",
         "min": 1,
         "max": 300
     },
+    {
+        "key": "uploads/adaptive_concurrency",
+        "description": "Tune the number of simultaneous imx.to uploads from latency, throughput and errors",
+        "default": True,
+        "type": "bool"
+    },
+    {
+        "key": "uploads/concurrency_min",
+        "description": "Fewest simultaneous imx.to uploads the adaptive tuning may use",
+        "default": 1,
+        "type": "int",
+        "min": 1,
+        "max": 32
+    },
+    {
+        "key": "uploads/concurrency_max",
+        "description": "Most simultaneous imx.to uploads the adaptive tuning may use (it starts from the parallel uploads setting)",
+        "default": 12,
+        "type": "int",
+        "min": 1,
+        "max": 32
+    },
     {
         "key": "scanning/skip_hidden_files",
         "description": "Skip hidden files (starting with .) when scanning folders",
@@ -53,6 +83,53 @@ ADVANCED_SETTINGS = [
         "max": 0.5,
         "decimals": 2
     },
+    # Upload bandwidth limits (applied immediately on save)
+    {
+        "key": "bandwidth_limit/global_kbps",
+        "description": "Total upload bandwidth limit for all uploads in KiB/s (0 = unlimited)",
+        "default": 0,
+        "type": "int",
+        "min": 0,
+        "max": 10000000
+    },
+    {
+        "key": "bandwidth_limit/schedule",
+        "description": "Time-of-day overrides for the total limit, e.g. '08:00-18:00=2048; 23:00-07:00=0' (KiB/s, 0 = unlimited)",
+        "default": "",
+        "type": "str"
+    },
+    {
+        "key": "bandwidth_limit/imx_kbps",
+        "description": "Upload bandwidth limit for imx.to in KiB/s (0 = no separate limit)",
+        "default": 0,
+        "type": "int",
+        "min": 0,
+        "max": 10000000
+    },
+    {
+        "key": "bandwidth_limit/file_host_kbps",
+        "description": "Upload bandwidth limit per file host in KiB/s (0 = no separate limit)",
+        "default": 0,
+        "type": "int",
+        "min": 0,
+        "max": 10000000
+    },
+    {
+        "key": "bandwidth_limit/imx_weight",
+        "description": "Priority weight of imx.to when sharing the total limit with file hosts",
+        "default": 1,
+        "type": "int",
+        "min": 1,
+        "max": 100
+    },
+    {
+        "key": "bandwidth_limit/file_host_weight",
+        "description": "Priority weight of each file host when sharing the total limit",
+        "default": 1,
+        "type": "int",
+        "min": 1,
+        "max": 100
+    },
 ]
 
 
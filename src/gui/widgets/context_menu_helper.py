@@ -32,6 +32,7 @@ class GalleryContextMenuHelper(QObject):
             self._add_file_operations(menu, selected_paths)
             self._add_status_operations(menu, selected_paths)
             self._add_template_submenu(menu, selected_paths)
+            self._add_priority_submenu(menu, selected_paths)
             self._add_move_to_submenu(menu, selected_paths)
         else:
             # No selection: offer Add Folders
@@ -204,6 +205,29 @@ class GalleryContextMenuHelper(QObject):
                     lambda checked, target_tab=tab_name: self._delegate_to_main_window('_move_selected_to_tab', selected_paths, target_tab)
                 )
     
+    def _add_priority_submenu(self, menu, selected_paths):
+        """Add 'Set priority' submenu (upload order of queued galleries)"""
+        if not self.main_window or not hasattr(self.main_window, 'queue_manager'):
+            return
+        from src.storage.queue_scheduler import PRIORITY_NAMES
+
+        queue_manager = self.main_window.queue_manager
+        current = {getattr(queue_manager.get_item(path), 'priority', None) for path in selected_paths}
+        priority_menu = menu.addMenu("Set priority")
+        for priority, label in PRIORITY_NAMES.items():
+            action = priority_menu.addAction(label)
+            action.setCheckable(True)
+            action.setChecked(current == {priority})
+            action.triggered.connect(
+                lambda checked, target=priority: self._set_priority(selected_paths, target)
+            )
+
+    def _set_priority(self, gallery_paths: list, priority: int):
+        """Set upload priority for multiple galleries"""
+        queue_manager = self.main_window.queue_manager
+        updated = sum(1 for path in gallery_paths if queue_manager.set_item_priority(path, priority))
+        log(f"Set priority {priority} for {updated} galleries", level="info", category="queue")
+
     def _add_no_selection_items(self, menu):
         """Add menu items when no galleries are selected"""
         add_action = menu.addAction("Add Folders...")
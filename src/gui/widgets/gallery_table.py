@@ -28,12 +28,12 @@ from PyQt6.QtGui import (
 
 # Import existing utilities
 from src.core.constants import IMAGE_EXTENSIONS
+from src.utils.archive_utils import gallery_exists, get_gallery_location
 from src.utils.logger import log
 from src.gui.widgets.custom_widgets import TableProgressWidget, ActionButtonWidget
 from src.gui.icon_manager import get_icon_manager
 
 # Import dialogs
-from src.gui.dialogs.gallery_file_manager import GalleryFileManagerDialog
 from src.gui.dialogs.message_factory import show_warning
 
 
@@ -660,7 +660,8 @@ class GalleryTableWidget(QTableWidget):
             parent_window = parent_window.parent()
 
         if parent_window:
-            # Create and show the file manager dialog
+            # Create and show the file manager dialog (imported on first use: it loads QtNetwork)
+            from src.gui.dialogs.gallery_file_manager import GalleryFileManagerDialog
             dialog = GalleryFileManagerDialog(path, parent_window.queue_manager, parent_window)
             if dialog.exec() == QDialog.DialogCode.Accepted:
                 # Refresh the gallery display if files were modified
@@ -916,10 +917,13 @@ class GalleryTableWidget(QTableWidget):
                     widget._update_specific_gallery_display(path)
 
     def open_folders_via_menu(self, paths):
-        """Open the given gallery folders in the OS file manager"""
+        """Open the given gallery folders in the OS file manager.
+
+        Archive galleries open the folder containing the archive.
+        """
         for path in paths:
-            if os.path.isdir(path):
-                QDesktopServices.openUrl(QUrl.fromLocalFile(path))
+            if gallery_exists(path):
+                QDesktopServices.openUrl(QUrl.fromLocalFile(get_gallery_location(path)))
 
     def cancel_selected_via_menu(self, queued_paths):
         """Cancel upload for selected queued items"""
@@ -1079,14 +1083,10 @@ class GalleryTableWidget(QTableWidget):
 
             # If exact file doesn't exist, try pattern-based lookup
             if not os.path.exists(central_bbcode) and item.gallery_id:
-                import glob
-                #print(f"DEBUG: Exact file not found, trying pattern for gallery_id: {item.gallery_id}")
-                pattern = os.path.join(central_path, f"*_{item.gallery_id}_bbcode.txt")
-                matches = glob.glob(pattern)
-                #print(f"DEBUG: Pattern '{pattern}' found {len(matches)} matches: {matches}")
-                if matches:
-                    central_bbcode = matches[0]
-                    #print(f"DEBUG: Using pattern match: {central_bbcode}")
+                from src.utils.artifact_finder import find_gallery_bbcode_by_id
+                match = find_gallery_bbcode_by_id(item.gallery_id)
+                if match:
+                    central_bbcode = match
 
             # Move file I/O to background to avoid blocking GUI
             def _read_bbcode_async():
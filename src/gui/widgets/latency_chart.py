@@ -0,0 +1,110 @@
+"""
+Latency chart widget for BBDrop application.
+Draws percentile lines over time for the statistics dialog.
+"""
+
+import time
+from typing import Callable, Dict, List, Optional
+
+from PyQt6.QtWidgets import QWidget
+from PyQt6.QtCore import Qt, QPointF, QRectF
+from PyQt6.QtGui import QPainter, QColor, QPen, QPolygonF
+
+
+class LatencyChartWidget(QWidget):
+    """Line chart of latency percentiles per time slot.
+
+    Points come from MetricsStore.get_latency_series(): dicts with a 'ts'
+    key (slot start, unix time) and one key per plotted percentile.
+    """
+
+    LINE_COLORS = {
+        'p50': QColor(52, 152, 219),
+        'p90': QColor(46, 204, 113),
+        'p95': QColor(230, 126, 34),
+        'p99': QColor(231, 76, 60),
+    }
+    MARGIN_LEFT = 70
+    MARGIN_RIGHT = 12
+    MARGIN_TOP = 22
+    MARGIN_BOTTOM = 24
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._series: List[Dict[str, float]] = []
+        self._keys: List[str] = []
+        self._formatter: Callable[[float], str] = lambda v: f"{v:.2f}"
+        self._message = "No data"
+        self.setMinimumHeight(160)
+
+    def set_series(self, series: List[Dict[str, float]], keys: List[str],
+                   formatter: Optional[Callable[[float], str]] = None,
+                   message: str = "No data") -> None:
+        """Replace the plotted data.
+
+        Args:
+            series: Points sorted by 'ts'
+            keys: Percentile keys to draw (e.g. ['p50', 'p95'])
+            formatter: Formats values for the Y axis labels
+            message: Text shown when there are no points
+        """
+        self._series = list(series)
+        self._keys = list(keys)
+        if formatter:
+            self._formatter = formatter
+        self._message = message
+        self.update()
+
+    def paintEvent(self, event):
+        painter = QPainter(self)
+        painter.setRenderHint(QPainter.RenderHint.Antialiasing)
+        text_color = self.palette().windowText().color()
+
+        plot = QRectF(
+            self.MARGIN_LEFT, self.MARGIN_TOP,
+            max(1, self.width() - self.MARGIN_LEFT - self.MARGIN_RIGHT),
+            max(1, self.height() - self.MARGIN_TOP - self.MARGIN_BOTTOM),
+        )
+        if not self._series:
+            painter.setPen(text_color)
+            painter.drawText(self.rect(), Qt.AlignmentFlag.AlignCenter, self._message)
+            return
+
+        t_min = self._series[0]['ts']
+        t_max = self._series[-1]['ts']
+        t_span = max(t_max - t_min, 1)
+        v_max = max((p.get(k, 0.0) for p in self._series for k in self._keys), default=0.0) or 1.0
+
+        def to_point(ts: float, value: float) -> QPointF:
+            x = plot.left() + (ts - t_min) / t_span * plot.width() if len(self._series) > 1 else plot.center().x()
+            y = plot.bottom() - value / v_max * plot.height()
+            return QPointF(x, y)
+
+        # Axes and gridlines
+        grid_pen = QPen(QColor(128, 128, 128, 80))
+        for i in range(5):
+            y = plot.bottom() - plot.height() * i / 4
+            painter.setPen(grid_pen)
+            painter.drawLine(QPointF(plot.left(), y), QPointF(plot.right(), y))
+            painter.setPen(text_color)
+            painter.drawText(QRectF(0, y - 8, self.MARGIN_LEFT - 6, 16),
+                             Qt.AlignmentFlag.AlignRight | Qt.AlignmentFlag.AlignVCenter,
+                             self._formatter(v_max * i / 4))
+
+        time_format = "%H:%M" if t_span <= 86400 else "%m-%d"
+        for ts, align in ((t_min, Qt.AlignmentFlag.AlignLeft), (t_max, Qt.AlignmentFlag.AlignRight)):
+            painter.drawText(QRectF(plot.left(), plot.bottom() + 4, plot.width(), 16),
+                             align, time.strftime(time_format, time.localtime(ts)))
+
+        # Percentile lines with legend
+        legend_x = plot.left()
+        for key in self._keys:
+            color = self.LINE_COLORS.get(key, text_color)
+            painter.setPen(QPen(color, 2))
+            points = [to_point(p['ts'], p.get(key, 0.0)) for p in self._series]
+            if len(points) > 1:
+                painter.drawPolyline(QPolygonF(points))
+            for point in points:
+                painter.drawEllipse(point, 2, 2)
+            painter.drawText(QRectF(legend_x, 2, 60, 16), Qt.AlignmentFlag.AlignLeft, key)
+            legend_x += 50
@@ -254,6 +254,8 @@ class WorkerStatus:
     bytes_remaining: int = 0
     storage_used_bytes: int = 0
     storage_total_bytes: int = 0
+    concurrency: int = 0
+    concurrency_reason: str = ""
 
 
 class ColumnType(Enum):
@@ -292,6 +294,7 @@ CORE_COLUMNS = [
     ColumnConfig('status_text', 'status text', 100, ColumnType.TEXT, default_visible=True, alignment=Qt.AlignmentFlag.AlignLeft | Qt.AlignmentFlag.AlignVCenter),
     ColumnConfig('files_remaining', 'queue (files)', 90, ColumnType.COUNT, default_visible=True, alignment=Qt.AlignmentFlag.AlignRight | Qt.AlignmentFlag.AlignVCenter),
     ColumnConfig('bytes_remaining', 'queue (bytes)', 110, ColumnType.BYTES, default_visible=True, alignment=Qt.AlignmentFlag.AlignRight | Qt.AlignmentFlag.AlignVCenter),
+    ColumnConfig('concurrency', 'in flight', 70, ColumnType.COUNT, default_visible=True, alignment=Qt.AlignmentFlag.AlignRight | Qt.AlignmentFlag.AlignVCenter, tooltip="Simultaneous uploads (adaptive for imx.to)"),
     ColumnConfig('storage', 'storage', 140, ColumnType.WIDGET, default_visible=True, alignment=Qt.AlignmentFlag.AlignCenter | Qt.AlignmentFlag.AlignVCenter),
 ]
 
@@ -996,6 +999,22 @@ class WorkerStatusWidget(QWidget):
                     self._update_bytes_remaining(worker_id, bytes_remaining)
                     break  # Only one IMX worker
 
+    @pyqtSlot(str, int, str)
+    def update_worker_concurrency(self, worker_id: str, limit: int, reason: str):
+        """Update the in-flight upload limit chosen by the adaptive controller.
+
+        Args:
+            worker_id: Worker identifier
+            limit: Number of uploads allowed in flight
+            reason: Why the controller picked this limit
+        """
+        if worker_id in self._workers:
+            worker = self._workers[worker_id]
+            worker.concurrency = limit
+            worker.concurrency_reason = reason
+            worker.last_update = datetime.now().timestamp()
+            self._update_concurrency(worker_id, limit, reason)
+
     @pyqtSlot(str, int, int)
     def update_filehost_queue_columns(self, host_name: str, files_remaining: int, bytes_remaining: int):
         """Update queue columns for a specific file host worker.
@@ -1252,6 +1271,22 @@ class WorkerStatusWidget(QWidget):
         if col_idx >= 0:
             self._update_worker_cell(worker_id, col_idx, bytes_remaining, lambda v: format_bytes(v) if v > 0 else "—")
 
+    def _update_concurrency(self, worker_id: str, limit: int, reason: str):
+        """Update in-flight limit cell for a worker.
+
+        Args:
+            worker_id: Worker identifier
+            limit: Number of uploads allowed in flight
+            reason: Tooltip text explaining the limit
+        """
+        col_idx = self._get_column_index('concurrency')
+        if col_idx >= 0:
+            self._update_worker_cell(worker_id, col_idx, limit, lambda v: format_count(v) if v > 0 else "—")
+            row = self._worker_row_map.get(worker_id)
+            item = self.status_table.item(row, col_idx) if row is not None else None
+            if item:
+                item.setToolTip(f"In flight\n{limit} simultaneous uploads ({reason})")
+
     def _update_storage_progress(self, worker_id: str, used_bytes: int, total_bytes: int):
         """Update storage progress bar for a worker using StorageProgressBar.update_storage().
 
@@ -1550,6 +1585,20 @@ class WorkerStatusWidget(QWidget):
                     bytes_item.setFont(bytes_font)
                     self.status_table.setItem(row_idx, col_idx, bytes_item)
 
+                elif col_config.id == 'concurrency':
+                    # In-flight upload limit column
+                    conc_text = format_count(worker.concurrency) if worker.concurrency > 0 else "—"
+                    conc_item = QTableWidgetItem(conc_text)
+                    conc_item.setTextAlignment(col_config.alignment)
+                    conc_item.setData(Qt.ItemDataRole.UserRole + 10, worker.concurrency)
+                    if worker.concurrency > 0:
+                        conc_item.setToolTip(f"In flight\n{worker.concurrency} simultaneous uploads ({worker.concurrency_reason})")
+                    conc_font = QFont("Consolas")
+                    conc_font.setPointSizeF(METRIC_FONT_SIZE_DEFAULT)
+                    conc_font.setStyleHint(QFont.StyleHint.Monospace)
+                    conc_item.setFont(conc_font)
+                    self.status_table.setItem(row_idx, col_idx, conc_item)
+
                 elif col_config.id == 'storage':
                     # Storage progress bar column
                     # IMX.to has unlimited storage - show green bar with infinity symbol
@@ -9,6 +9,7 @@ Handles:
     - Queue item status changes
     - Bandwidth and storage updates
     - Worker status widget updates
+    - Progress bus delivery (upload progress and bandwidth, once per frame)
 """
 
 from datetime import datetime
@@ -19,6 +20,10 @@ from PyQt6.QtCore import QObject, QTimer, QSettings, QMutexLocker, QMutex
 from src.utils.logger import log
 from src.utils.format_utils import format_binary_size
 from src.gui.bandwidth_manager import BandwidthManager
+from src.gui.progress_pump import ProgressBusPump, load_refresh_rate
+from src.utils.progress_bus import (
+    BANDWIDTH_SOURCE_IMX, CHANNEL_BANDWIDTH, CHANNEL_FILE_HOST, CHANNEL_GALLERY,
+)
 
 if TYPE_CHECKING:
     from src.gui.main_window import BBDropGUI
@@ -40,6 +45,14 @@ class WorkerSignalHandler(QObject):
         self.bandwidth_manager = BandwidthManager(self)
         self.bandwidth_manager.total_bandwidth_updated.connect(self._on_total_bandwidth_updated)
 
+        # Upload progress and bandwidth samples arrive through the progress bus,
+        # drained once per frame instead of one queued signal per update
+        self.progress_pump = ProgressBusPump(rate_hz=load_refresh_rate(), parent=self)
+        self.progress_pump.subscribe(
+            CHANNEL_GALLERY, lambda path, state: main_window.on_progress_updated(path, *state))
+        self.progress_pump.subscribe(CHANNEL_FILE_HOST, self._on_file_host_progress_state)
+        self.progress_pump.subscribe(CHANNEL_BANDWIDTH, self._on_bandwidth_sample)
+        self.progress_pump.start()
 
     def start_worker(self):
         """Start the upload worker thread."""
@@ -52,7 +65,10 @@ class WorkerSignalHandler(QObject):
                 level="debug", category="uploads")
             mw.worker = UploadWorker(mw.queue_manager)
             log(f"New UploadWorker created ({id(mw.worker)})", level="debug", category="uploads")
-            mw.worker.progress_updated.connect(mw.on_progress_updated)
+            # Progress and bandwidth come through the progress bus; deliver what is
+            # pending before completion handlers run
+            mw.worker.gallery_completed.connect(self.progress_pump.flush)
+            mw.worker.gallery_failed.connect(self.progress_pump.flush)
             mw.worker.gallery_started.connect(mw.on_gallery_started)
             mw.worker.gallery_completed.connect(mw.on_gallery_completed)
             mw.worker.gallery_failed.connect(mw.on_gallery_failed)
@@ -61,11 +77,11 @@ class WorkerSignalHandler(QObject):
             mw.worker.ext_fields_updated.connect(mw.on_ext_fields_updated)
             mw.worker.log_message.connect(mw.add_log_message)
             mw.worker.queue_stats.connect(self.on_queue_stats)
-            mw.worker.bandwidth_updated.connect(self.bandwidth_manager.on_imx_bandwidth)
 
             # Connect to worker status widget
             mw.worker.gallery_started.connect(self._on_imx_worker_started)
-            mw.worker.bandwidth_updated.connect(self._on_imx_worker_speed)
+            mw.worker.concurrency_changed.connect(self._on_imx_worker_concurrency)
+            mw.worker.concurrency_learned.connect(self._on_imx_concurrency_learned)
             mw.worker.gallery_completed.connect(self._on_imx_worker_finished)
             mw.worker.gallery_failed.connect(self._on_imx_worker_finished)
 
@@ -173,6 +189,21 @@ class WorkerSignalHandler(QObject):
         except Exception as e:
             log(f"Error handling file host upload progress: {e}", level="error", category="file_hosts")
 
+    def _on_file_host_progress_state(self, key, state):
+        """Handle the latest file host upload progress from the progress bus."""
+        db_id, host_name = key
+        uploaded, total, speed_bps = state
+        self.on_file_host_upload_progress(db_id, host_name, uploaded, total, speed_bps)
+        self._on_filehost_worker_progress(db_id, host_name, uploaded, total, speed_bps)
+
+    def _on_bandwidth_sample(self, source: str, kbps: float):
+        """Handle the latest bandwidth sample for imx.to or a file host."""
+        if source == BANDWIDTH_SOURCE_IMX:
+            self.bandwidth_manager.on_imx_bandwidth(kbps)
+            self._on_imx_worker_speed(kbps)
+        else:
+            self.on_file_host_bandwidth_updated(source, kbps)
+
     def on_file_host_upload_completed(self, db_id: int, host_name: str, result: dict):
         """Handle file host upload completed - ASYNC to prevent blocking main thread."""
         log(f"File host upload completed: {host_name} for gallery {db_id}",
@@ -290,6 +321,22 @@ class WorkerSignalHandler(QObject):
             status="uploading"
         )
 
+    def _on_imx_worker_concurrency(self, limit: int, reason: str):
+        """Handle imx.to adaptive in-flight limit change."""
+        mw = self._main_window
+        if not hasattr(mw, 'worker_status_widget'):
+            return  # Widget disabled, skip update
+
+        mw.worker_status_widget.update_worker_concurrency("imx_worker_1", limit, reason)
+
+    def _on_imx_concurrency_learned(self, limit: int):
+        """Save the imx.to in-flight limit as the next session's starting point."""
+        from src.core.adaptive_concurrency import save_learned_limit
+        try:
+            save_learned_limit(limit)
+        except Exception as e:
+            log(f"Could not save upload concurrency: {e}", level="warning", category="uploads")
+
     def _on_imx_worker_finished(self, *args):
         """Handle imx.to worker upload finished."""
         # Deactivate IMX bandwidth source so monitor shows 0
@@ -523,6 +570,8 @@ class WorkerSignalHandler(QObject):
             log(f"Error updating total bandwidth display: {e}", level="error", category="ui")
 
     def stop(self):
-        """Stop the bandwidth manager timer on shutdown."""
+        """Stop the progress pump and bandwidth manager timers on shutdown."""
+        if hasattr(self, 'progress_pump'):
+            self.progress_pump.stop()
         if hasattr(self, 'bandwidth_manager'):
             self.bandwidth_manager.stop()
@@ -0,0 +1,467 @@
+"""
+Process-wide upload bandwidth governor.
+
+Hierarchical token buckets shape all uploads: a global limit is divided
+between the services that currently have transfers running (imx.to and each
+file host) in proportion to their priority weights, and every service can
+additionally be capped on its own. Shares are rebalanced whenever a transfer
+starts or ends, so an idle service never holds bandwidth.
+
+Uploads report their progress from the pycurl XFERINFOFUNCTION callback:
+
+    with get_bandwidth_governor().transfer("imx", should_stop) as shaper:
+        curl.setopt(pycurl.XFERINFOFUNCTION, lambda dt, d, ut, u: shaper.update(u))
+        curl.perform()
+
+update() blocks the transfer thread until the bytes curl has sent fit in the
+service's bucket, which stalls the socket and keeps the rate at the limit.
+
+A time-of-day schedule can override the global limit, e.g.
+"08:00-18:00=2048; 23:00-07:00=0" (KiB/s, 0 = unlimited).
+"""
+
+import math
+import threading
+import time
+from datetime import datetime
+from typing import Callable, Dict, List, Optional, Tuple
+
+from src.utils.logger import log
+
+IMX_SERVICE = "imx"
+FILE_HOST_SERVICE_PREFIX = "file_host:"
+
+# Bucket capacity in seconds of traffic (how much an idle bucket can burst)
+BURST_SECONDS = 0.1
+# Minimum bucket capacity so large curl writes are not split into many waits
+MIN_BURST_BYTES = 16 * 1024
+# Longest single sleep while waiting for tokens (keeps stop requests responsive)
+MAX_WAIT_SLICE = 0.1
+# How often the time-of-day schedule is re-evaluated
+SCHEDULE_CHECK_INTERVAL = 15.0
+
+# INI keys ([Advanced] section, edited in Settings > Advanced)
+SETTING_GLOBAL_LIMIT = "bandwidth_limit/global_kbps"
+SETTING_IMX_LIMIT = "bandwidth_limit/imx_kbps"
+SETTING_FILE_HOST_LIMIT = "bandwidth_limit/file_host_kbps"
+SETTING_IMX_WEIGHT = "bandwidth_limit/imx_weight"
+SETTING_FILE_HOST_WEIGHT = "bandwidth_limit/file_host_weight"
+SETTING_SCHEDULE = "bandwidth_limit/schedule"
+
+
+def file_host_service(host_id: str) -> str:
+    """Service name used for a file host's uploads."""
+    return f"{FILE_HOST_SERVICE_PREFIX}{host_id}"
+
+
+class TokenBucket:
+    """Token bucket allowing debt: consumers take tokens, then wait off any deficit."""
+
+    def __init__(self, rate: Optional[float] = None):
+        self._lock = threading.Lock()
+        self._rate: Optional[float] = None
+        self._capacity = 0.0
+        self._tokens = 0.0
+        self._last = time.monotonic()
+        self.set_rate(rate)
+
+    @property
+    def rate(self) -> Optional[float]:
+        """Bytes per second (None = unlimited)."""
+        return self._rate
+
+    def _refill(self, now: float) -> None:
+        if self._rate:
+            self._tokens = min(self._capacity, self._tokens + (now - self._last) * self._rate)
+        self._last = now
+
+    def set_rate(self, rate: Optional[float]) -> None:
+        with self._lock:
+            self._refill(time.monotonic())
+            self._rate = rate if rate and rate > 0 else None
+            if self._rate:
+                self._capacity = max(MIN_BURST_BYTES, self._rate * BURST_SECONDS)
+                self._tokens = min(self._tokens, self._capacity)
+            else:
+                self._tokens = 0.0
+
+    def consume(self, nbytes: int, should_stop: Optional[Callable[[], bool]] = None) -> float:
+        """Take nbytes tokens, sleeping until the bucket is out of debt.
+
+        Returns:
+            Seconds spent waiting
+        """
+        with self._lock:
+            if not self._rate:
+                return 0.0
+            self._refill(time.monotonic())
+            self._tokens -= nbytes
+            deficit = -self._tokens
+        waited = 0.0
+        while deficit > 0:
+            rate = self._rate
+            if not rate:
+                break
+            delay = min(deficit / rate, MAX_WAIT_SLICE)
+            time.sleep(delay)
+            waited += delay
+            if should_stop and should_stop():
+                break
+            with self._lock:
+                self._refill(time.monotonic())
+                deficit = -self._tokens
+        return waited
+
+
+class Transfer:
+    """One running upload registered with the governor."""
+
+    __slots__ = ('governor', 'service', 'should_stop', '_sent')
+
+    def __init__(self, governor: 'BandwidthGovernor', service: str,
+                 should_stop: Optional[Callable[[], bool]] = None):
+        self.governor = governor
+        self.service = service
+        self.should_stop = should_stop
+        self._sent = 0
+
+    def update(self, uploaded_total: int) -> None:
+        """Account for curl's cumulative upload count, blocking while over the limit."""
+        delta = uploaded_total - self._sent
+        if delta <= 0:
+            return
+        self._sent = uploaded_total
+        self.governor.consume(self.service, delta, self.should_stop)
+
+    def __enter__(self) -> 'Transfer':
+        self.governor._register(self)
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        self.governor._unregister(self)
+
+
+def parse_schedule(text: str) -> List[Tuple[int, int, int]]:
+    """Parse "HH:MM-HH:MM=KBPS; ..." into (start_minute, end_minute, kbps) rules.
+
+    Ranges may wrap past midnight. Invalid entries are skipped with a warning.
+    """
+    rules = []
+    for entry in (text or "").replace(',', ';').split(';'):
+        entry = entry.strip()
+        if not entry:
+            continue
+        try:
+            span, kbps = entry.split('=')
+            start, end = span.split('-')
+            rules.append((_parse_minute(start), _parse_minute(end), int(kbps)))
+        except ValueError:
+            log(f"Ignoring invalid bandwidth schedule entry: '{entry}'", level="warning", category="network")
+    return rules
+
+
+def _parse_minute(text: str) -> int:
+    hours, minutes = text.strip().split(':')
+    value = int(hours) * 60 + int(minutes)
+    if not 0 <= value <= 24 * 60:
+        raise ValueError(text)
+    return value
+
+
+def scheduled_limit(rules: List[Tuple[int, int, int]], when: datetime) -> Optional[int]:
+    """Limit (KiB/s) of the first rule covering the given time, None if none does."""
+    minute = when.hour * 60 + when.minute
+    for start, end, kbps in rules:
+        if start <= end:
+            if start <= minute < end:
+                return kbps
+        elif minute >= start or minute < end:
+            return kbps
+    return None
+
+
+class BandwidthGovernor:
+    """Hierarchical token-bucket shaper shared by all upload clients."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._global_kbps = 0
+        self._schedule: List[Tuple[int, int, int]] = []
+        self._service_limits: Dict[str, int] = {}     # service -> KiB/s ceiling (0 = none)
+        self._service_weights: Dict[str, float] = {}
+        self._default_file_host_limit = 0
+        self._default_file_host_weight = 1.0
+        self._buckets: Dict[str, TokenBucket] = {}
+        self._active: Dict[str, int] = {}             # service -> running transfers
+        self._effective_global: Optional[int] = None  # KiB/s after schedule (None = unlimited)
+        self._next_schedule_check = 0.0
+        self._clock: Callable[[], datetime] = datetime.now
+
+    # ------------------------------------------------------------------
+    # Configuration
+    # ------------------------------------------------------------------
+
+    def configure(self, global_kbps: int = 0, schedule: str = "",
+                  service_limits: Optional[Dict[str, int]] = None,
+                  service_weights: Optional[Dict[str, float]] = None,
+                  file_host_limit_kbps: int = 0, file_host_weight: float = 1.0) -> None:
+        """Replace the whole configuration (limits in KiB/s, 0 = unlimited).
+
+        Args:
+            global_kbps: Limit for all uploads together
+            schedule: Time-of-day overrides for the global limit (see parse_schedule)
+            service_limits: Per-service ceilings
+            service_weights: Per-service priority weights when sharing the global limit
+            file_host_limit_kbps: Ceiling for file hosts without their own entry
+            file_host_weight: Weight for file hosts without their own entry
+        """
+        with self._lock:
+            self._global_kbps = max(0, int(global_kbps or 0))
+            self._schedule = parse_schedule(schedule)
+            self._service_limits = dict(service_limits or {})
+            self._service_weights = dict(service_weights or {})
+            self._default_file_host_limit = max(0, int(file_host_limit_kbps or 0))
+            self._default_file_host_weight = max(0.01, float(file_host_weight or 1.0))
+            self._next_schedule_check = 0.0
+            self._rebalance()
+
+    def set_global_limit(self, kbps: int) -> None:
+        """Change the global limit immediately (0 = unlimited)."""
+        with self._lock:
+            self._global_kbps = max(0, int(kbps or 0))
+            self._next_schedule_check = 0.0
+            self._rebalance()
+        log(f"Upload bandwidth limit set to {self.describe_limit()}", level="info", category="network")
+
+    def set_service_limit(self, service: str, kbps: int, weight: Optional[float] = None) -> None:
+        """Change one service's ceiling (and optionally its weight) immediately."""
+        with self._lock:
+            self._service_limits[service] = max(0, int(kbps or 0))
+            if weight is not None:
+                self._service_weights[service] = max(0.01, float(weight))
+            self._rebalance()
+
+    def load_settings(self) -> None:
+        """Load limits from the INI [Advanced] section and per-host file host settings."""
+        values = _read_advanced_settings()
+        limits = {IMX_SERVICE: _to_int(values.get(SETTING_IMX_LIMIT))}
+        weights = {IMX_SERVICE: _to_float(values.get(SETTING_IMX_WEIGHT), 1.0)}
+        try:
+            from src.core.file_host_config import get_config_manager, get_file_host_setting
+            for host_id in get_config_manager().hosts:
+                host_limit = get_file_host_setting(host_id, "bandwidth_limit_kbps", "int")
+                host_weight = get_file_host_setting(host_id, "bandwidth_weight", "int")
+                if host_limit:
+                    limits[file_host_service(host_id)] = host_limit
+                if host_weight:
+                    weights[file_host_service(host_id)] = host_weight
+        except Exception as e:
+            log(f"Could not load per-host bandwidth settings: {e}", level="debug", category="network")
+        self.configure(
+            global_kbps=_to_int(values.get(SETTING_GLOBAL_LIMIT)),
+            schedule=str(values.get(SETTING_SCHEDULE, "") or ""),
+            service_limits=limits,
+            service_weights=weights,
+            file_host_limit_kbps=_to_int(values.get(SETTING_FILE_HOST_LIMIT)),
+            file_host_weight=_to_float(values.get(SETTING_FILE_HOST_WEIGHT), 1.0),
+        )
+
+    @property
+    def global_limit_kbps(self) -> int:
+        """Configured global limit (without schedule overrides)."""
+        return self._global_kbps
+
+    def effective_limit_kbps(self) -> Optional[int]:
+        """Global limit currently enforced (None = unlimited)."""
+        with self._lock:
+            self._check_schedule()
+            return self._effective_global
+
+    def describe_limit(self) -> str:
+        kbps = self.effective_limit_kbps()
+        return "unlimited" if kbps is None else f"{kbps} KiB/s"
+
+    def service_rate(self, service: str) -> Optional[float]:
+        """Bytes per second currently granted to a service (None = unlimited)."""
+        with self._lock:
+            bucket = self._buckets.get(service)
+            return bucket.rate if bucket else None
+
+    # ------------------------------------------------------------------
+    # Transfers
+    # ------------------------------------------------------------------
+
+    def transfer(self, service: str, should_stop: Optional[Callable[[], bool]] = None) -> Transfer:
+        """Context manager registering an upload for the duration of the block."""
+        return Transfer(self, service, should_stop)
+
+    def consume(self, service: str, nbytes: int, should_stop: Optional[Callable[[], bool]] = None) -> None:
+        bucket = self._buckets.get(service)
+        if bucket is None or bucket.rate is None:
+            if time.monotonic() < self._next_schedule_check:
+                return
+            with self._lock:
+                self._check_schedule()
+                bucket = self._buckets.get(service)
+            if bucket is None:
+                return
+        elif time.monotonic() >= self._next_schedule_check:
+            with self._lock:
+                self._check_schedule()
+        bucket.consume(nbytes, should_stop)
+
+    def _register(self, transfer: Transfer) -> None:
+        with self._lock:
+            self._active[transfer.service] = self._active.get(transfer.service, 0) + 1
+            if self._active[transfer.service] == 1:
+                self._rebalance()
+
+    def _unregister(self, transfer: Transfer) -> None:
+        with self._lock:
+            remaining = self._active.get(transfer.service, 0) - 1
+            if remaining > 0:
+                self._active[transfer.service] = remaining
+            else:
+                self._active.pop(transfer.service, None)
+                self._rebalance()
+
+    # ------------------------------------------------------------------
+    # Internals (called with self._lock held)
+    # ------------------------------------------------------------------
+
+    def _limit_for(self, service: str) -> int:
+        if service in self._service_limits:
+            return self._service_limits[service]
+        if service.startswith(FILE_HOST_SERVICE_PREFIX):
+            return self._default_file_host_limit
+        return 0
+
+    def _weight_for(self, service: str) -> float:
+        if service in self._service_weights:
+            return self._service_weights[service]
+        if service.startswith(FILE_HOST_SERVICE_PREFIX):
+            return self._default_file_host_weight
+        return 1.0
+
+    def _update_effective_limit(self) -> bool:
+        """Re-evaluate the schedule (rate limited); returns True if the global limit changed."""
+        now = time.monotonic()
+        if now < self._next_schedule_check:
+            return False
+        self._next_schedule_check = now + SCHEDULE_CHECK_INTERVAL
+        kbps = scheduled_limit(self._schedule, self._clock()) if self._schedule else None
+        if kbps is None:
+            kbps = self._global_kbps
+        effective = kbps or None
+        if effective == self._effective_global:
+            return False
+        self._effective_global = effective
+        return True
+
+    def _check_schedule(self) -> None:
+        if self._update_effective_limit():
+            self._rebalance()
+
+    def _rebalance(self) -> None:
+        """Water-fill the global limit over active services by weight, respecting ceilings."""
+        self._update_effective_limit()
+        services = set(self._buckets) | set(self._active) | set(self._service_limits)
+        rates: Dict[str, Optional[float]] = {}
+        for service in services:
+            ceiling = self._limit_for(service) * 1024 or None
+            if self._effective_global:
+                ceiling = min(ceiling or math.inf, self._effective_global * 1024)
+            rates[service] = ceiling
+
+        if self._effective_global and self._active:
+            remaining = self._effective_global * 1024.0
+            pending = set(self._active)
+            while pending:
+                total_weight = sum(self._weight_for(s) for s in pending)
+                capped = {s for s in pending
+                          if (self._limit_for(s) * 1024 or math.inf) <= remaining * self._weight_for(s) / total_weight}
+                if not capped:
+                    for s in pending:
+                        rates[s] = remaining * self._weight_for(s) / total_weight
+                    break
+                for s in capped:
+                    rates[s] = float(self._limit_for(s) * 1024)
+                    remaining -= rates[s]
+                pending -= capped
+
+        for service, rate in rates.items():
+            bucket = self._buckets.get(service)
+            if bucket is None:
+                self._buckets[service] = TokenBucket(rate)
+            elif bucket.rate != rate:
+                bucket.set_rate(rate)
+
+
+def _to_int(value, default: int = 0) -> int:
+    try:
+        return int(value)
+    except (TypeError, ValueError):
+        return default
+
+
+def _to_float(value, default: float) -> float:
+    try:
+        return float(value)
+    except (TypeError, ValueError):
+        return default
+
+
+def _read_advanced_settings() -> Dict[str, str]:
+    """Raw values of the INI [Advanced] section."""
+    import configparser
+    import os
+    from bbdrop import get_config_path
+
+    config = configparser.ConfigParser()
+    path = get_config_path()
+    if os.path.exists(path):
+        config.read(path, encoding='utf-8')
+    return dict(config.items('Advanced')) if config.has_section('Advanced') else {}
+
+
+def save_global_limit(kbps: int) -> None:
+    """Persist the global limit to the INI [Advanced] section."""
+    import configparser
+    import os
+    from bbdrop import get_config_path
+
+    config = configparser.ConfigParser()
+    path = get_config_path()
+    if os.path.exists(path):
+        config.read(path, encoding='utf-8')
+    if kbps:
+        if not config.has_section('Advanced'):
+            config.add_section('Advanced')
+        config.set('Advanced', SETTING_GLOBAL_LIMIT, str(int(kbps)))
+    elif config.has_section('Advanced'):
+        config.remove_option('Advanced', SETTING_GLOBAL_LIMIT)
+    with open(path, 'w', encoding='utf-8') as f:
+        config.write(f)
+
+
+_governor: Optional[BandwidthGovernor] = None
+_governor_lock = threading.Lock()
+
+
+def get_bandwidth_governor() -> BandwidthGovernor:
+    """Get or create the global BandwidthGovernor (settings are loaded on creation).
+
+    Returns:
+        Global BandwidthGovernor instance
+    """
+    global _governor
+    if _governor is None:
+        with _governor_lock:
+            if _governor is None:
+                governor = BandwidthGovernor()
+                try:
+                    governor.load_settings()
+                except Exception as e:
+                    log(f"Could not load bandwidth settings: {e}", level="warning", category="network")
+                _governor = governor
+    return _governor
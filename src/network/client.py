@@ -14,8 +14,14 @@ from functools import cmp_to_key
 from PyQt6.QtCore import QThread, pyqtSignal
 
 from bbdrop import ImxToUploader, timestamp, sanitize_gallery_name
+from src.core.adaptive_concurrency import AdaptiveConcurrencyController
 from src.core.engine import UploadEngine, AtomicCounter
+from src.core.upload_retry import load_retry_policy
+from src.network.single_instance import SOCKET_TIMEOUT, ProtocolError, read_message, send_message
+from src.services.archive_source import ArchiveImageSource
+from src.utils.archive_utils import is_archive_gallery_path, get_archive_gallery_name
 from src.utils.logger import log
+from src.utils.progress_bus import CHANNEL_GALLERY, get_progress_bus
 from src.core.constants import (
     COMMUNICATION_PORT,
     QUEUE_STATE_UPLOADING
@@ -35,7 +41,8 @@ class GUIImxToUploader(ImxToUploader):
                      parallel_batch_size=4, template_name="default",
                      precalculated_dimensions=None,
                      global_byte_counter: Optional[AtomicCounter] = None,
-                     gallery_byte_counter: Optional[AtomicCounter] = None):
+                     gallery_byte_counter: Optional[AtomicCounter] = None,
+                     concurrency_controller: Optional[AdaptiveConcurrencyController] = None):
         """GUI-friendly upload delegating to the shared UploadEngine.
 
         Args:
@@ -48,6 +55,7 @@ class GUIImxToUploader(ImxToUploader):
             template_name: BBCode template name
             global_byte_counter: Persistent counter across ALL galleries
             gallery_byte_counter: Per-gallery counter (reset for each gallery)
+            concurrency_controller: Optional adaptive in-flight limit controller
         """
         # Non-blocking signals and resume support
         current_item = self.worker_thread.current_item if self.worker_thread else None
@@ -86,7 +94,10 @@ class GUIImxToUploader(ImxToUploader):
 
         # Sanitize name like CLI
         if not gallery_name:
-            gallery_name = os.path.basename(folder_path)
+            if is_archive_gallery_path(folder_path):
+                gallery_name = get_archive_gallery_name(folder_path)
+            else:
+                gallery_name = os.path.basename(folder_path)
         original_name = gallery_name
         # No sanitization - only rename worker should sanitize
 
@@ -112,13 +123,17 @@ class GUIImxToUploader(ImxToUploader):
             rename_worker,
             global_byte_counter=global_byte_counter,
             gallery_byte_counter=gallery_byte_counter,
-            worker_thread=self.worker_thread
+            worker_thread=self.worker_thread,
+            concurrency_controller=concurrency_controller,
+            retry_policy=load_retry_policy()
         )
 
+        progress_bus = get_progress_bus()
+
         def on_progress(completed: int, total: int, percent: int, current_image: str):
             if not self.worker_thread:
                 return
-            self.worker_thread.progress_updated.emit(folder_path, completed, total, percent, current_image)
+            progress_bus.publish(CHANNEL_GALLERY, folder_path, (completed, total, percent, current_image))
             # Trigger bandwidth update (main loop blocked during uploads)
             try:
                 self.worker_thread._emit_current_bandwidth()
@@ -141,6 +156,17 @@ class GUIImxToUploader(ImxToUploader):
                     except Exception:
                         pass
 
+        try:
+            from src.utils.metrics_store import get_metrics_store
+            metrics_store = get_metrics_store()
+        except Exception:
+            metrics_store = None
+
+        def on_image_timing(fname: str, duration: float, size_bytes: int, ttfb: Optional[float]):
+            if metrics_store:
+                metrics_store.record_latency("imx.to", upload_time=duration,
+                                             bytes_uploaded=size_bytes, ttfb=ttfb)
+
         # Get existing gallery_id for resume/append operations
         existing_gallery_id = None
         if current_item and hasattr(current_item, 'gallery_id') and current_item.gallery_id:
@@ -160,6 +186,7 @@ class GUIImxToUploader(ImxToUploader):
             on_progress=on_progress,
             should_soft_stop=should_soft_stop,
             on_image_uploaded=on_image_uploaded,
+            on_image_timing=on_image_timing,
         )
 
         # Merge previously uploaded images (from earlier partial runs) with this run's results
@@ -189,10 +216,16 @@ class GUIImxToUploader(ImxToUploader):
                         except Exception:
                             return sorted(names, key=_natural_key)
 
-                    all_image_files = _explorer_sort([
-                        f for f in os.listdir(folder_path)
-                        if f.lower().endswith(image_extensions) and os.path.isfile(os.path.join(folder_path, f))
-                    ])
+                    archive_sizes = {}
+                    if is_archive_gallery_path(folder_path):
+                        with ArchiveImageSource.from_gallery_path(folder_path) as source:
+                            archive_sizes = {name: source.get_size(name) for name in source.list_images()}
+                        all_image_files = _explorer_sort(list(archive_sizes))
+                    else:
+                        all_image_files = _explorer_sort([
+                            f for f in os.listdir(folder_path)
+                            if f.lower().endswith(image_extensions) and os.path.isfile(os.path.join(folder_path, f))
+                        ])
                     file_position = {fname: idx for idx, fname in enumerate(all_image_files)}
 
                     # Collect enriched image data from accumulated uploads across runs
@@ -220,8 +253,11 @@ class GUIImxToUploader(ImxToUploader):
                                 pass
                         # Size bytes
                         try:
-                            enriched.setdefault('size_bytes',
-                                              os.path.getsize(os.path.join(folder_path, fname)))
+                            if fname in archive_sizes:
+                                enriched.setdefault('size_bytes', archive_sizes[fname])
+                            else:
+                                enriched.setdefault('size_bytes',
+                                                  os.path.getsize(os.path.join(folder_path, fname)))
                         except Exception:
                             enriched.setdefault('size_bytes', 0)
                         combined_by_name[fname] = enriched
@@ -252,8 +288,18 @@ class GUIImxToUploader(ImxToUploader):
 
 
 class SingleInstanceServer(QThread):
-    """Server for single instance communication"""
+    """Server for single instance communication.
+
+    Speaks the framed JSON protocol from src.network.single_instance and
+    acknowledges every message. Raw text from older versions is still
+    accepted as a single folder path.
+
+    Signals:
+        paths_received(list, dict): Paths and options ('tab', 'template') of one message
+        folder_received(str): Single path from a legacy sender, or "" to focus the window
+    """
 
+    paths_received = pyqtSignal(list, dict)
     folder_received = pyqtSignal(str)
 
     def __init__(self, port=COMMUNICATION_PORT):
@@ -267,16 +313,13 @@ class SingleInstanceServer(QThread):
             server_socket = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
             server_socket.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
             server_socket.bind(('localhost', self.port))
-            server_socket.listen(1)
+            server_socket.listen(socket.SOMAXCONN)
             server_socket.settimeout(1.0)  # Timeout for checking self.running
 
             while self.running:
                 try:
                     client_socket, _ = server_socket.accept()
-                    data = client_socket.recv(1024).decode('utf-8')
-                    # Emit signal for both folder paths and empty messages (window focus)
-                    self.folder_received.emit(data)
-                    client_socket.close()
+                    self._handle_connection(client_socket)
                 except socket.timeout:
                     continue
                 except Exception as e:
@@ -287,6 +330,35 @@ class SingleInstanceServer(QThread):
         except Exception as e:
             log(f"Failed to start server: {e}", level="error", category="network")
 
+    def _handle_connection(self, client_socket):
+        """Read one message, acknowledge it and emit its paths."""
+        try:
+            client_socket.settimeout(SOCKET_TIMEOUT)
+            try:
+                message = read_message(client_socket)
+            except ProtocolError as e:
+                log(f"Rejected single-instance message: {e}", level="warning", category="network")
+                try:
+                    send_message(client_socket, {'ok': False, 'error': str(e)})
+                except OSError:
+                    pass
+                return
+
+            paths = [p for p in message.get('paths', []) if isinstance(p, str) and p]
+            if message.get('legacy'):
+                # Emit for both folder paths and empty messages (window focus)
+                self.folder_received.emit(paths[0] if paths else "")
+                return
+            options = {k: message[k] for k in ('tab', 'template') if isinstance(message.get(k), str)}
+            try:
+                send_message(client_socket, {'ok': True, 'received': len(paths)})
+            except OSError:
+                pass  # Sender gave up waiting; still add its paths
+            log(f"Received {len(paths)} path(s) from another instance", level="debug", category="network")
+            self.paths_received.emit(paths, options)
+        finally:
+            client_socket.close()
+
     def stop(self):
         """Stop the server"""
         self.running = False
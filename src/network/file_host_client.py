@@ -12,6 +12,7 @@ import base64
 import zipfile
 import threading
 import functools
+import uuid
 from pathlib import Path
 from typing import Dict, Any, Optional, Callable, List, Union
 from io import BytesIO
@@ -19,11 +20,56 @@ from urllib.parse import quote
 
 from src.core.file_host_config import HostConfig
 from src.core.engine import AtomicCounter
+from src.network.bandwidth_governor import Transfer, file_host_service, get_bandwidth_governor
 from src.utils.logger import log
 from src.proxy.pycurl_adapter import PyCurlProxyAdapter
 from src.proxy.models import ProxyEntry
 
 
+class _MultipartReader:
+    """multipart/form-data body for READFUNCTION uploads from a stream.
+
+    Used when the file's bytes come from a read-once stream (shared ZIP read)
+    rather than a path libcurl can open itself. Part layout matches libcurl's
+    HTTPPOST form: the file part first, then the text fields.
+    """
+
+    def __init__(self, file_field: str, filename: str, source, size: int, fields: List[tuple]):
+        self.boundary = f"------------------------{uuid.uuid4().hex}"
+        head = (f"--{self.boundary}\r\n"
+                f"Content-Disposition: form-data; name=\"{file_field}\"; filename=\"{filename}\"\r\n"
+                f"Content-Type: application/octet-stream\r\n\r\n").encode('utf-8')
+        tail = b"".join(
+            f"\r\n--{self.boundary}\r\nContent-Disposition: form-data; name=\"{name}\"\r\n\r\n{value}".encode('utf-8')
+            for name, value in fields
+        ) + f"\r\n--{self.boundary}--\r\n".encode('utf-8')
+        self._parts = [head, source, tail]
+        self._length = len(head) + size + len(tail)
+        self._part = 0
+        self._offset = 0
+
+    @property
+    def content_type_header(self) -> str:
+        return f"Content-Type: multipart/form-data; boundary={self.boundary}"
+
+    def __len__(self) -> int:
+        return self._length
+
+    def read(self, size: int) -> bytes:
+        while self._part < len(self._parts):
+            part = self._parts[self._part]
+            if isinstance(part, bytes):
+                data = part[self._offset:self._offset + size]
+                self._offset += len(data)
+            else:
+                data = part.read(size)
+            if data:
+                return data
+            self._part += 1
+            self._offset = 0
+        return b""
+
+
 class FileHostClient:
     """pycurl-based file host uploader with bandwidth tracking."""
 
@@ -77,6 +123,8 @@ class FileHostClient:
         self.current_speed_bps = 0.0
         self.should_stop_func: Optional[Callable[[], bool]] = None
         self.on_progress_func: Optional[Callable[[int, int, float], None]] = None
+        self._shaper: Optional[Transfer] = None
+        self._upload_source = None  # Read-once stream for the next transfer (see upload_file)
 
         # Authentication token (for token-based auth)
         self.auth_token: Optional[str] = None
@@ -763,6 +811,10 @@ class FileHostClient:
             self.last_time = current_time
             self.last_uploaded_for_speed = uploaded
 
+        # Bandwidth shaping (blocks while over the limit)
+        if self._shaper is not None:
+            self._shaper.update(uploaded)
+
         # Check for cancellation
         if self.should_stop_func and self.should_stop_func():
             return 1  # Abort transfer
@@ -773,11 +825,21 @@ class FileHostClient:
 
         return 0
 
+    def _shaped_perform(self, curl: pycurl.Curl) -> None:
+        """Run an upload transfer registered with the global bandwidth governor."""
+        service = file_host_service(self.host_id or self.config.name)
+        with get_bandwidth_governor().transfer(service, self.should_stop_func) as self._shaper:
+            try:
+                curl.perform()
+            finally:
+                self._shaper = None
+
     def upload_file(
         self,
         file_path: Path,
         on_progress: Optional[Callable[[int, int, float], None]] = None,
-        should_stop: Optional[Callable[[], bool]] = None
+        should_stop: Optional[Callable[[], bool]] = None,
+        source=None
     ) -> Dict[str, Any]:
         """Upload file to file host.
 
@@ -785,6 +847,9 @@ class FileHostClient:
             file_path: Path to file to upload
             on_progress: Optional progress callback (uploaded_bytes, total_bytes, speed_bps)
             should_stop: Optional cancellation check callback
+            source: Optional read-once stream of the file's bytes (ZipStream from a
+                shared ZIP read). Used for the first transfer attempt only; token
+                retries read the file from disk.
 
         Returns:
             Dictionary with upload results
@@ -798,6 +863,7 @@ class FileHostClient:
         self.last_time = time.time()
         self.last_uploaded_for_speed = 0
         self.current_speed_bps = 0.0
+        self._upload_source = source
 
         if self._log_callback: self._log_callback(f"Uploading {file_path.name} to {self.config.name}...", "info")
 
@@ -808,6 +874,11 @@ class FileHostClient:
         # Standard upload
         return self._upload_standard(file_path)
 
+    def _take_upload_source(self):
+        """The stream passed to upload_file, once; None afterwards (read the file instead)."""
+        source, self._upload_source = self._upload_source, None
+        return source
+
     def _upload_standard(self, file_path: Path) -> Dict[str, Any]:
         """Perform standard single-step upload.
 
@@ -855,8 +926,9 @@ class FileHostClient:
 
             # Prepare headers
             headers = self._prepare_headers()
-            if headers:
-                curl.setopt(pycurl.HTTPHEADER, [f"{k}: {v}" for k, v in headers.items()])
+            header_lines = [f"{k}: {v}" for k, v in headers.items()]
+            if header_lines:
+                curl.setopt(pycurl.HTTPHEADER, header_lines)
 
             # Session cookies
             if self.cookie_jar:
@@ -919,31 +991,42 @@ class FileHostClient:
 
             # Upload file
             file_size = file_path.stat().st_size
+            source = self._take_upload_source()
 
             if self.config.method == "PUT":
-                with open(file_path, 'rb') as f:
+                if source is not None:
                     curl.setopt(pycurl.UPLOAD, 1)
-                    curl.setopt(pycurl.READDATA, f)
-                    curl.setopt(pycurl.INFILESIZE, file_size)
-                    curl.perform()
+                    curl.setopt(pycurl.READFUNCTION, source.read)
+                    curl.setopt(pycurl.INFILESIZE_LARGE, file_size)
+                    self._shaped_perform(curl)
+                else:
+                    with open(file_path, 'rb') as f:
+                        curl.setopt(pycurl.UPLOAD, 1)
+                        curl.setopt(pycurl.READDATA, f)
+                        curl.setopt(pycurl.INFILESIZE, file_size)
+                        self._shaped_perform(curl)
             else:
                 # POST with multipart form data
-                form_fields = [
-                    (self.config.file_field, (
-                        pycurl.FORM_FILE, str(file_path),
-                        pycurl.FORM_FILENAME, self._get_clean_filename(file_path.name)
-                    )),
-                    *[(k, v) for k, v in self.config.extra_fields.items()]
-                ]
-                
+                text_fields = [(k, v) for k, v in self.config.extra_fields.items()]
+
                 # Add session ID if extracted (from upload page HTML or get_server API)
                 if sess_id:
-                    form_fields.append(('sess_id', sess_id))
+                    text_fields.append(('sess_id', sess_id))
                 elif server_sess_id:  # Katfile-style: sess_id from get_server API response
-                    form_fields.append(('sess_id', server_sess_id))
-                
-                curl.setopt(pycurl.HTTPPOST, form_fields)
-                curl.perform()
+                    text_fields.append(('sess_id', server_sess_id))
+
+                if source is not None:
+                    self._set_streamed_form(curl, header_lines, file_path, source, file_size, text_fields)
+                else:
+                    form_fields = [
+                        (self.config.file_field, (
+                            pycurl.FORM_FILE, str(file_path),
+                            pycurl.FORM_FILENAME, self._get_clean_filename(file_path.name)
+                        )),
+                        *text_fields
+                    ]
+                    curl.setopt(pycurl.HTTPPOST, form_fields)
+                self._shaped_perform(curl)
 
             response_code = curl.getinfo(pycurl.RESPONSE_CODE)
 
@@ -956,6 +1039,16 @@ class FileHostClient:
         finally:
             curl.close()
 
+    def _set_streamed_form(self, curl: pycurl.Curl, header_lines: List[str], file_path: Path, source,
+                           file_size: int, text_fields: List[tuple], file_field: Optional[str] = None) -> None:
+        """Configure a multipart POST whose file part is read from source."""
+        body = _MultipartReader(file_field or self.config.file_field, self._get_clean_filename(file_path.name),
+                                source, file_size, [(k, str(v)) for k, v in text_fields])
+        curl.setopt(pycurl.POST, 1)
+        curl.setopt(pycurl.READFUNCTION, body.read)
+        curl.setopt(pycurl.POSTFIELDSIZE_LARGE, len(body))
+        curl.setopt(pycurl.HTTPHEADER, [*header_lines, body.content_type_header])
+
     def _upload_multistep(self, file_path: Path, **kwargs) -> Dict[str, Any]:
         """Perform multi-step upload (init → upload → poll).
 
@@ -1119,20 +1212,25 @@ class FileHostClient:
                 curl.setopt(pycurl.XFERINFOFUNCTION, self._xferinfo_callback)
 
                 # Build form fields: file + form_data (ajax, params, signature for K2S)
-                form_fields: List[Any] = [
-                    (file_field, (
-                        pycurl.FORM_FILE, str(file_path),
-                        pycurl.FORM_FILENAME, self._get_clean_filename(file_path.name)
-                    ))
-                ]
+                source = self._take_upload_source()
+                if source is not None:
+                    self._set_streamed_form(curl, [], file_path, source, file_size,
+                                            list(form_data.items()), file_field)
+                else:
+                    form_fields: List[Any] = [
+                        (file_field, (
+                            pycurl.FORM_FILE, str(file_path),
+                            pycurl.FORM_FILENAME, self._get_clean_filename(file_path.name)
+                        ))
+                    ]
 
-                # Add form_data fields if present (K2S: ajax, params, signature)
-                for key, value in form_data.items():
-                    form_fields.append((key, str(value)))
+                    # Add form_data fields if present (K2S: ajax, params, signature)
+                    for key, value in form_data.items():
+                        form_fields.append((key, str(value)))
 
-                curl.setopt(pycurl.HTTPPOST, form_fields)
+                    curl.setopt(pycurl.HTTPPOST, form_fields)
 
-                curl.perform()
+                self._shaped_perform(curl)
 
                 response_code = curl.getinfo(pycurl.RESPONSE_CODE)
                 if response_code not in [200, 201]:
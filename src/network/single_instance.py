@@ -0,0 +1,204 @@
+"""
+Single-instance IPC protocol.
+
+A second BBDrop process hands its folder paths to the running GUI over a
+localhost TCP connection and exits. Messages are framed as a 4-byte
+big-endian length followed by UTF-8 JSON:
+
+    {"type": "add", "paths": [...], "tab": "Main", "template": "default"}
+
+and the server answers every message with {"ok": true, "received": N}.
+An empty "paths" list only brings the window to the front.
+
+Explorer starts one process per selected folder, so senders first try to
+become the batch collector on COMMUNICATION_PORT + 1: the collector gathers
+the paths of every process that starts within a short window and forwards
+them to the GUI as one message. Senders that find a collector hand their
+paths to it instead.
+
+Frames always start with a zero byte (MAX_MESSAGE_BYTES < 16 MiB), which
+is how the server tells them apart from the raw text sent by older versions.
+"""
+
+import json
+import socket
+import struct
+import time
+from typing import Any, Dict, List, Optional, Tuple
+
+from src.core.constants import COMMUNICATION_PORT
+from src.utils.logger import log
+
+BATCH_PORT_OFFSET = 1               # Collector port = GUI port + offset
+BATCH_WINDOW = 0.25                 # Seconds the collector waits for more senders
+BATCH_WINDOW_MAX = 2.0              # Upper bound while senders keep arriving
+MAX_MESSAGE_BYTES = 16 * 1024 * 1024 - 1
+MAX_LEGACY_BYTES = 64 * 1024        # Raw-text messages are a single path
+SOCKET_TIMEOUT = 5.0
+
+_HEADER = struct.Struct(">I")
+
+
+class ProtocolError(Exception):
+    """Malformed or oversized single-instance message."""
+
+
+def encode_message(message: Dict[str, Any]) -> bytes:
+    """Frame a message: 4-byte big-endian length + UTF-8 JSON."""
+    payload = json.dumps(message, ensure_ascii=False).encode('utf-8')
+    if len(payload) > MAX_MESSAGE_BYTES:
+        raise ProtocolError(f"Message too large ({len(payload)} bytes)")
+    return _HEADER.pack(len(payload)) + payload
+
+
+def _recv_exact(sock: socket.socket, count: int, initial: bytes = b"") -> bytes:
+    data = bytearray(initial)
+    while len(data) < count:
+        chunk = sock.recv(min(count - len(data), 65536))
+        if not chunk:
+            raise ProtocolError("Connection closed mid-message")
+        data.extend(chunk)
+    return bytes(data)
+
+
+def read_message(sock: socket.socket) -> Dict[str, Any]:
+    """Read one message from a connected socket.
+
+    Raw text from older senders (no frame, first byte non-zero) is read until
+    the peer closes and returned as {"type": "add", "paths": [text], "legacy": True}.
+    """
+    first = sock.recv(1)
+    if not first:
+        return {'type': 'add', 'paths': [], 'legacy': True}
+    if first != b"\x00":
+        data = bytearray(first)
+        while len(data) < MAX_LEGACY_BYTES:
+            chunk = sock.recv(65536)
+            if not chunk:
+                break
+            data.extend(chunk)
+        text = data.decode('utf-8', errors='replace')
+        return {'type': 'add', 'paths': [text] if text else [], 'legacy': True}
+
+    (length,) = _HEADER.unpack(_recv_exact(sock, _HEADER.size, first))
+    if length > MAX_MESSAGE_BYTES:
+        raise ProtocolError(f"Message too large ({length} bytes)")
+    try:
+        message = json.loads(_recv_exact(sock, length).decode('utf-8'))
+    except ValueError as e:
+        raise ProtocolError(f"Invalid message: {e}") from e
+    if not isinstance(message, dict) or not isinstance(message.get('paths', []), list):
+        raise ProtocolError("Invalid message: expected an object with a 'paths' list")
+    return message
+
+
+def send_message(sock: socket.socket, message: Dict[str, Any]) -> None:
+    sock.sendall(encode_message(message))
+
+
+def request(message: Dict[str, Any], port: int, timeout: float = SOCKET_TIMEOUT) -> Dict[str, Any]:
+    """Send a message and wait for the acknowledgement.
+
+    Raises:
+        OSError: Nothing is listening or the connection failed
+        ProtocolError: The reply was malformed
+    """
+    with socket.create_connection(('localhost', port), timeout=timeout) as sock:
+        send_message(sock, message)
+        return read_message(sock)
+
+
+def build_add_message(paths: List[str], tab: Optional[str] = None,
+                      template: Optional[str] = None) -> Dict[str, Any]:
+    message: Dict[str, Any] = {'type': 'add', 'paths': list(paths)}
+    if tab:
+        message['tab'] = tab
+    if template:
+        message['template'] = template
+    return message
+
+
+def _collect_batch(listener: socket.socket, message: Dict[str, Any],
+                   window: float) -> Dict[str, Any]:
+    """Gather messages from other senders until the window passes without a new one."""
+    paths = list(message.get('paths', []))
+    start = time.monotonic()
+    deadline = start + window
+    while True:
+        remaining = deadline - time.monotonic()
+        if remaining <= 0:
+            break
+        listener.settimeout(remaining)
+        try:
+            conn, _ = listener.accept()
+        except socket.timeout:
+            break
+        with conn:
+            try:
+                conn.settimeout(SOCKET_TIMEOUT)
+                incoming = read_message(conn)
+                paths.extend(incoming.get('paths', []))
+                for key in ('tab', 'template'):
+                    if key in incoming and key not in message:
+                        message[key] = incoming[key]
+                send_message(conn, {'ok': True, 'received': len(incoming.get('paths', []))})
+            except (OSError, ProtocolError) as e:
+                log(f"Batch collector: dropped sender: {e}", level="debug", category="network")
+        # Keep the window open while senders keep arriving
+        deadline = min(time.monotonic() + window, start + BATCH_WINDOW_MAX)
+
+    batched = dict(message)
+    batched['paths'] = list(dict.fromkeys(paths))
+    return batched
+
+
+def forward_to_running_instance(paths: List[str], tab: Optional[str] = None,
+                                template: Optional[str] = None,
+                                port: int = COMMUNICATION_PORT,
+                                batch_window: float = BATCH_WINDOW) -> Tuple[bool, List[str]]:
+    """Hand paths to a running GUI instance, batching with concurrent senders.
+
+    Args:
+        paths: Folder/archive paths to add (empty to just focus the window)
+        tab: Optional tab to add the galleries to
+        template: Optional BBCode template for the galleries
+        port: GUI instance port
+        batch_window: Seconds to wait for other senders when collecting
+
+    Returns:
+        (delivered, paths): delivered is True when a running instance (or a
+        collector) accepted the paths. When no instance is running, the
+        caller should start the GUI with the returned paths, which include
+        any collected from other senders.
+    """
+    message = build_add_message(paths, tab, template)
+    listener = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+    if hasattr(socket, 'SO_EXCLUSIVEADDRUSE'):
+        listener.setsockopt(socket.SOL_SOCKET, socket.SO_EXCLUSIVEADDRUSE, 1)
+    try:
+        listener.bind(('localhost', port + BATCH_PORT_OFFSET))
+        listener.listen(socket.SOMAXCONN)
+    except OSError:
+        # Another sender is collecting: hand the paths over to it
+        listener.close()
+        try:
+            reply = request(message, port + BATCH_PORT_OFFSET)
+            if reply.get('ok'):
+                return True, list(paths)
+        except (OSError, ProtocolError):
+            pass  # Collector just finished; talk to the GUI directly
+        try:
+            return bool(request(message, port).get('ok')), list(paths)
+        except (OSError, ProtocolError):
+            return False, list(paths)
+
+    try:
+        batched = _collect_batch(listener, message, batch_window) if batch_window > 0 else message
+    finally:
+        listener.close()
+
+    try:
+        reply = request(batched, port)
+        return bool(reply.get('ok')), batched['paths']
+    except (OSError, ProtocolError):
+        return False, batched['paths']
@@ -7,6 +7,7 @@ Orchestrates extraction, folder selection, and cleanup
 from pathlib import Path
 from typing import Optional
 
+from src.services.archive_extractor import FolderReadyCallback, ProgressCallback
 from src.services.archive_service import ArchiveService
 from src.utils.archive_utils import get_archive_name
 from src.gui.dialogs.archive_folder_selector import ArchiveFolderSelector
@@ -15,21 +16,34 @@ from src.gui.dialogs.archive_folder_selector import ArchiveFolderSelector
 class ArchiveCoordinator:
     """Coordinates archive processing workflow"""
 
-    def __init__(self, archive_service: ArchiveService, parent_widget=None):
+    def __init__(self, archive_service: ArchiveService, parent_widget=None,
+                 stream_archives: bool = False):
         """Initialize coordinator
 
         Args:
             archive_service: Service for extraction and cleanup
             parent_widget: Parent widget for dialogs
+            stream_archives: Upload galleries straight from the archive when
+                possible instead of extracting to a temp directory
         """
         self.service = archive_service
         self.parent = parent_widget
+        self.stream_archives = stream_archives
 
-    def process_archive(self, archive_path: str | Path) -> Optional[list[Path]]:
+    def process_archive(self, archive_path: str | Path,
+                        on_folder_ready: Optional[FolderReadyCallback] = None,
+                        on_progress: Optional[ProgressCallback] = None) -> Optional[list[Path]]:
         """Process archive and return selected folders
 
+        When on_folder_ready is given and the archive has to be extracted,
+        folders are selected up front and only the selected ones are extracted;
+        each is reported as soon as it is complete so it can be queued while
+        the rest of the archive is still being written.
+
         Args:
             archive_path: Path to archive file
+            on_folder_ready: Optional callback for each extracted folder
+            on_progress: Optional callback with (bytes_written, bytes_total)
 
         Returns:
             List of selected folder paths, or None if cancelled/failed
@@ -37,6 +51,17 @@ class ArchiveCoordinator:
         archive_path = Path(archive_path)
         archive_name = get_archive_name(archive_path)
 
+        # Stream from the archive when every image member can be read in place
+        if self.stream_archives:
+            galleries = self.service.list_archive_galleries(archive_path)
+            if galleries is not None:
+                if not galleries:
+                    return None
+                return self._select_folders(archive_name, galleries)
+
+        if on_folder_ready is not None:
+            return self._extract_selected(archive_path, archive_name, on_folder_ready, on_progress)
+
         # Extract archive
         temp_dir = self.service.extract_archive(archive_path)
         if not temp_dir:
@@ -50,6 +75,58 @@ class ArchiveCoordinator:
             self.service.cleanup_temp_dir(temp_dir)
             return None
 
+        selected = self._select_folders(archive_name, folders)
+        if selected:
+            return selected
+
+        # User cancelled or no selection
+        self.service.cleanup_temp_dir(temp_dir)
+        return None
+
+    def _extract_selected(self, archive_path: Path, archive_name: str,
+                          on_folder_ready: FolderReadyCallback,
+                          on_progress: Optional[ProgressCallback]) -> Optional[list[Path]]:
+        """Select folders from the archive listing, then extract only those
+
+        Args:
+            archive_path: Path to archive file
+            archive_name: Archive name for the dialog title
+            on_folder_ready: Callback for each extracted folder
+            on_progress: Optional callback with (bytes_written, bytes_total)
+
+        Returns:
+            List of extracted folder paths, or None if cancelled/failed
+        """
+        inner_dirs = self.service.list_archive_folders(archive_path)
+        if not inner_dirs:
+            return None
+
+        # Dialog only shows folder names; map them back to inner directories
+        candidates = {Path(archive_name, inner): inner for inner in inner_dirs}
+        selected = self._select_folders(archive_name, list(candidates))
+        if not selected:
+            return None
+
+        temp_dir = self.service.extract_archive(
+            archive_path,
+            folders=[candidates[folder] for folder in selected],
+            on_folder_ready=on_folder_ready,
+            on_progress=on_progress,
+        )
+        if not temp_dir:
+            return None
+        return self.service.get_folders(temp_dir) or None
+
+    def _select_folders(self, archive_name: str, folders: list[Path]) -> Optional[list[Path]]:
+        """Return the single folder, or let the user pick when there are several
+
+        Args:
+            archive_name: Archive name for the dialog title
+            folders: Candidate folder paths
+
+        Returns:
+            List of selected folder paths, or None if cancelled
+        """
         # If only one folder, return it directly
         if len(folders) == 1:
             return folders
@@ -60,7 +137,4 @@ class ArchiveCoordinator:
             selected = dialog.get_selected_folders()
             if selected:
                 return selected
-
-        # User cancelled or no selection
-        self.service.cleanup_temp_dir(temp_dir)
         return None
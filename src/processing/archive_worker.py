@@ -14,8 +14,10 @@ class ArchiveExtractionSignals(QObject):
     finished = pyqtSignal(str, list)  # archive_path, selected_folder_paths
     # Emitted if extraction fails or user cancels
     error = pyqtSignal(str, str)  # archive_path, error_message
-    # Emitted for progress updates (optional, for future progress dialog)
+    # Emitted for progress updates (bytes written, as percent)
     progress = pyqtSignal(str, int)  # archive_path, progress_percent
+    # Emitted for each folder as soon as it is fully extracted
+    folder_ready = pyqtSignal(str, str)  # archive_path, folder_path
 
 
 class ArchiveExtractionWorker(QRunnable):
@@ -38,12 +40,28 @@ class ArchiveExtractionWorker(QRunnable):
         self.archive_path = archive_path
         self.coordinator = coordinator
         self.signals = ArchiveExtractionSignals()
+        self._last_percent = -1
+
+    def _on_folder_ready(self, folder: Path):
+        """Forward a completed folder so it can be queued immediately"""
+        self.signals.folder_ready.emit(self.archive_path, str(folder))
+
+    def _on_progress(self, bytes_done: int, bytes_total: int):
+        """Emit extraction progress when the percentage changes"""
+        percent = int(bytes_done * 100 / bytes_total) if bytes_total else 100
+        if percent != self._last_percent:
+            self._last_percent = percent
+            self.signals.progress.emit(self.archive_path, percent)
 
     def run(self):
         """Execute archive extraction in background thread"""
         try:
             # Process archive (extraction + folder selection)
-            selected_folders = self.coordinator.process_archive(self.archive_path)
+            selected_folders = self.coordinator.process_archive(
+                self.archive_path,
+                on_folder_ready=self._on_folder_ready,
+                on_progress=self._on_progress,
+            )
 
             if selected_folders:
                 # Convert Path objects to strings for signal
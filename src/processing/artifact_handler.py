@@ -288,10 +288,18 @@ class ArtifactHandler(QObject):
         success_count = 0
         error_count = 0
 
+        # Resolve all JSON artifacts with one index lookup instead of one per gallery
+        from src.utils.artifact_finder import find_gallery_jsons_by_ids
+        items = {path: widget.queue_manager.get_item(path) for path in paths}
+        json_paths = find_gallery_jsons_by_ids(
+            (item.gallery_id, path) for path, item in items.items()
+            if item and item.status == "completed" and getattr(item, 'gallery_id', None)
+        )
+
         for path in paths:
             try:
                 log(f"DEBUG: Processing path: {path}", level="debug", category="fileio")
-                item = widget.queue_manager.get_item(path)
+                item = items[path]
                 if not item:
                     log(f"DEBUG: No item found for path: {path}", category="fileio", level="debug")
                     continue
@@ -307,7 +315,8 @@ class ArtifactHandler(QObject):
                     template_name = "default"
 
                 # Call the existing regeneration method (force=True since this is explicit user action)
-                self.regenerate_gallery_bbcode(path, template_name)
+                self.regenerate_gallery_bbcode(path, template_name,
+                                               json_path=json_paths.get(getattr(item, 'gallery_id', None)))
                 success_count += 1
                 log(f"DEBUG: Successfully regenerated BBCode for {path}", category="fileio", level="debug")
 
@@ -324,12 +333,13 @@ class ArtifactHandler(QObject):
         else:
             QMessageBox.information(self._main_window, "No Action", "No completed galleries found to regenerate.")
 
-    def regenerate_gallery_bbcode(self, gallery_path, new_template):
+    def regenerate_gallery_bbcode(self, gallery_path, new_template, json_path=None):
         """Regenerate BBCode for an uploaded gallery using its JSON artifact.
 
         Args:
             gallery_path: Absolute path to the gallery folder
             new_template: Name of the template to use for regeneration
+            json_path: JSON artifact path if already resolved (looked up by gallery ID otherwise)
 
         Raises:
             Exception: If gallery not found, no JSON artifact, or regeneration fails
@@ -351,7 +361,8 @@ class ArtifactHandler(QObject):
         if not gallery_id:
             raise Exception("Gallery ID not found in database")
 
-        json_path = find_gallery_json_by_id(gallery_id, gallery_path)
+        if not json_path:
+            json_path = find_gallery_json_by_id(gallery_id, gallery_path)
         if not json_path:
             raise Exception(f"No JSON artifact file found for gallery ID {gallery_id}")
 
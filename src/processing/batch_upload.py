@@ -0,0 +1,407 @@
+"""
+Headless batch uploads for the command line.
+
+Uploads several galleries at once over a shared connection budget, reports
+progress as text or JSON lines, and keeps a resume journal so that an
+interrupted run continues where it stopped.
+"""
+
+from __future__ import annotations
+
+import concurrent.futures
+import json
+import os
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from typing import Any, Dict, IO, List, Optional
+
+from src.core.engine import AtomicCounter, UploadEngine
+from src.core.upload_retry import RetryPolicy
+from src.utils.logger import log
+
+# Exit codes (argparse uses 2 for usage errors)
+EXIT_OK = 0                 # every gallery fully uploaded (or already done per journal)
+EXIT_ERROR = 1              # fatal error before/around the batch
+EXIT_PARTIAL = 3            # some galleries or images failed
+EXIT_ALL_FAILED = 4         # no gallery was uploaded
+EXIT_INTERRUPTED = 130      # stopped by Ctrl+C; the journal keeps finished files
+
+PROGRESS_FORMATS = ('text', 'jsonl')
+RATE_INTERVAL = 1.0         # seconds between 'rate' events
+
+
+class ProgressWriter:
+    """Writes machine-readable progress events as JSON lines.
+
+    In 'text' mode events are dropped; human-readable output is printed by
+    the caller instead.
+    """
+
+    def __init__(self, fmt: str = 'text', stream: Optional[IO[str]] = None):
+        self.format = fmt
+        self.stream = stream
+        self._lock = threading.Lock()
+
+    @property
+    def enabled(self) -> bool:
+        return self.format == 'jsonl' and self.stream is not None
+
+    def event(self, name: str, **fields: Any) -> None:
+        """Write one event line: {"event": name, "ts": unix time, **fields}."""
+        if not self.enabled:
+            return
+        line = json.dumps({'event': name, 'ts': round(time.time(), 3), **fields}, default=str)
+        with self._lock:
+            try:
+                self.stream.write(line + "\n")
+                self.stream.flush()
+            except (OSError, ValueError):
+                pass  # Closed pipe must not abort the uploads
+
+
+@dataclass
+class JournalEntry:
+    """Resume state of one gallery."""
+    gallery_id: Optional[str] = None
+    files: Dict[str, Dict[str, Any]] = field(default_factory=dict)
+    done: bool = False
+
+
+class ResumeJournal:
+    """Append-only JSON-lines journal of uploaded files and finished galleries.
+
+    Every uploaded image is written as soon as it is done, so a killed run
+    loses at most the images that were in flight. A truncated last line
+    (killed mid-write) is ignored on load.
+    """
+
+    def __init__(self, path: str):
+        self.path = path
+        self._lock = threading.Lock()
+        self._entries: Dict[str, JournalEntry] = {}
+        self._load()
+
+    @staticmethod
+    def _key(folder_path: str) -> str:
+        return os.path.normcase(os.path.abspath(folder_path))
+
+    def _load(self) -> None:
+        if not os.path.exists(self.path):
+            return
+        with open(self.path, 'r', encoding='utf-8') as f:
+            for line in f:
+                try:
+                    record = json.loads(line)
+                    entry = self._entries.setdefault(record['path'], JournalEntry())
+                except (ValueError, KeyError, TypeError):
+                    continue
+                kind = record.get('type')
+                if kind == 'gallery':
+                    entry.gallery_id = record.get('gallery_id')
+                elif kind == 'file':
+                    entry.files[record.get('file')] = record.get('data') or {}
+                elif kind == 'done':
+                    entry.done = True
+
+    def _append(self, record: Dict[str, Any]) -> None:
+        with self._lock:
+            os.makedirs(os.path.dirname(os.path.abspath(self.path)), exist_ok=True)
+            with open(self.path, 'a', encoding='utf-8') as f:
+                f.write(json.dumps(record, default=str) + "\n")
+
+    def get(self, folder_path: str) -> JournalEntry:
+        """Snapshot of a gallery's resume state (empty entry if unknown)."""
+        with self._lock:
+            entry = self._entries.get(self._key(folder_path), JournalEntry())
+            return JournalEntry(entry.gallery_id, dict(entry.files), entry.done)
+
+    def record_gallery(self, folder_path: str, gallery_id: str) -> None:
+        key = self._key(folder_path)
+        with self._lock:
+            self._entries.setdefault(key, JournalEntry()).gallery_id = gallery_id
+        self._append({'type': 'gallery', 'path': key, 'gallery_id': gallery_id})
+
+    def record_file(self, folder_path: str, file_name: str, data: Dict[str, Any]) -> None:
+        key = self._key(folder_path)
+        with self._lock:
+            self._entries.setdefault(key, JournalEntry()).files[file_name] = data
+        self._append({'type': 'file', 'path': key, 'file': file_name, 'data': data})
+
+    def record_done(self, folder_path: str, gallery_id: str) -> None:
+        key = self._key(folder_path)
+        with self._lock:
+            self._entries.setdefault(key, JournalEntry()).done = True
+        self._append({'type': 'done', 'path': key, 'gallery_id': gallery_id})
+
+
+class ConnectionBudget:
+    """Splits a total number of simultaneous image uploads between running galleries.
+
+    Each running gallery holds a share whose limit is recomputed on every
+    read, so a gallery that finishes hands its connections to the others.
+    Shares are passed to UploadEngine as its concurrency controller.
+    """
+
+    def __init__(self, total: int):
+        self.total = max(1, int(total))
+        self._lock = threading.Lock()
+        self._shares: List['BudgetShare'] = []
+
+    def share(self) -> 'BudgetShare':
+        return BudgetShare(self)
+
+    def _limit_for(self, share: 'BudgetShare') -> int:
+        with self._lock:
+            if share not in self._shares:
+                return self.total
+            count = len(self._shares)
+            rank = self._shares.index(share)
+            return max(1, self.total // count + (1 if rank < self.total % count else 0))
+
+    def _join(self, share: 'BudgetShare') -> None:
+        with self._lock:
+            self._shares.append(share)
+
+    def _leave(self, share: 'BudgetShare') -> None:
+        with self._lock:
+            if share in self._shares:
+                self._shares.remove(share)
+
+
+class BudgetShare:
+    """One gallery's part of a ConnectionBudget (context manager)."""
+
+    def __init__(self, budget: ConnectionBudget):
+        self._budget = budget
+        self.maximum = budget.total
+
+    @property
+    def limit(self) -> int:
+        return self._budget._limit_for(self)
+
+    def begin(self) -> None:
+        pass
+
+    def record(self, success: bool, duration: Optional[float] = None, size_bytes: int = 0) -> None:
+        pass
+
+    def __enter__(self) -> 'BudgetShare':
+        self._budget._join(self)
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        self._budget._leave(self)
+
+
+@dataclass
+class BatchOptions:
+    """Upload settings applied to every gallery of a batch."""
+    thumbnail_size: int = 3
+    thumbnail_format: int = 2
+    max_retries: int = 3
+    parallel: int = 4               # simultaneous image uploads across all jobs
+    jobs: int = 1                   # galleries uploaded at once
+    template_name: str = "default"
+    gallery_name: Optional[str] = None
+
+
+@dataclass
+class BatchSummary:
+    """Outcome of a batch run."""
+    results: List[Dict[str, Any]] = field(default_factory=list)
+    failed: List[Dict[str, str]] = field(default_factory=list)   # galleries that raised
+    skipped: List[str] = field(default_factory=list)             # already done per journal
+    interrupted: bool = False
+
+    @property
+    def exit_code(self) -> int:
+        if self.interrupted:
+            return EXIT_INTERRUPTED
+        incomplete = [r for r in self.results if r.get('failed_count')]
+        if not self.results and not self.skipped:
+            return EXIT_ALL_FAILED
+        if self.failed or incomplete:
+            return EXIT_PARTIAL
+        return EXIT_OK
+
+
+class BatchUploader:
+    """Uploads a list of gallery folders with up to options.jobs galleries at once."""
+
+    def __init__(self, uploader: Any, rename_worker: Any, options: BatchOptions,
+                 progress: Optional[ProgressWriter] = None,
+                 journal: Optional[ResumeJournal] = None,
+                 retry_policy: Optional[RetryPolicy] = None,
+                 save_artifacts: Optional[Any] = None):
+        """Initialize the batch uploader.
+
+        Args:
+            uploader: ImxToUploader shared by all jobs (curl handles are per thread)
+            rename_worker: Optional RenameWorker for gallery renames
+            options: Upload settings
+            progress: Event writer for --progress-format jsonl
+            journal: Resume journal, or None to always upload everything
+            retry_policy: Per-file retry policy for every gallery
+            save_artifacts: Artifact writer (defaults to bbdrop.save_gallery_artifacts)
+        """
+        self.uploader = uploader
+        self.rename_worker = rename_worker
+        self.options = options
+        self.progress = progress or ProgressWriter()
+        self.journal = journal
+        self.retry_policy = retry_policy
+        self.save_artifacts = save_artifacts
+        self.byte_counter = AtomicCounter()
+        self.budget = ConnectionBudget(options.parallel)
+        self._stop = threading.Event()
+
+    def stop(self) -> None:
+        """Finish in-flight images, then stop (pending galleries are not started)."""
+        self._stop.set()
+
+    def run(self, folder_paths: List[str]) -> BatchSummary:
+        """Upload all folders and return the summary."""
+        summary = BatchSummary()
+        jobs = max(1, min(self.options.jobs, self.budget.total, len(folder_paths) or 1))
+        self.progress.event('batch_started', galleries=len(folder_paths), jobs=jobs,
+                            connections=self.budget.total)
+        start = time.time()
+
+        rate_stop = threading.Event()
+        rate_thread = threading.Thread(target=self._emit_rates, args=(rate_stop,), daemon=True,
+                                       name="BatchProgressRate")
+        if self.progress.enabled:
+            rate_thread.start()
+
+        with ThreadPoolExecutor(max_workers=jobs, thread_name_prefix="BatchJob") as executor:
+            futures = {executor.submit(self._upload_gallery, path): path for path in folder_paths}
+            pending = set(futures)
+            try:
+                while pending:
+                    # Short waits keep the main thread responsive to Ctrl+C
+                    _, pending = concurrent.futures.wait(pending, timeout=0.5)
+            except KeyboardInterrupt:
+                summary.interrupted = True
+                self.stop()
+                for fut in pending:
+                    fut.cancel()
+                concurrent.futures.wait([f for f in pending if not f.cancelled()])
+
+        for fut, path in futures.items():
+            if fut.cancelled():
+                continue
+            status, payload = fut.result()
+            if status == 'done':
+                summary.results.append(payload)
+            elif status == 'skipped':
+                summary.skipped.append(path)
+            elif status == 'failed':
+                summary.failed.append({'path': path, 'error': payload})
+        if self._stop.is_set():
+            summary.interrupted = True
+
+        rate_stop.set()
+        if rate_thread.is_alive():
+            rate_thread.join(timeout=RATE_INTERVAL * 2)
+        self.progress.event(
+            'batch_done',
+            galleries=len(summary.results), skipped=len(summary.skipped),
+            failed=len(summary.failed),
+            incomplete=sum(1 for r in summary.results if r.get('failed_count')),
+            bytes=self.byte_counter.get(), seconds=round(time.time() - start, 3),
+            interrupted=summary.interrupted, exit_code=summary.exit_code,
+        )
+        return summary
+
+    def _emit_rates(self, stop: threading.Event) -> None:
+        last_bytes, last_time = self.byte_counter.get(), time.monotonic()
+        while not stop.wait(RATE_INTERVAL):
+            now_bytes, now = self.byte_counter.get(), time.monotonic()
+            rate = (now_bytes - last_bytes) / max(now - last_time, 1e-6)
+            self.progress.event('rate', bytes_per_sec=round(rate), bytes=now_bytes)
+            last_bytes, last_time = now_bytes, now
+
+    def _upload_gallery(self, folder_path: str):
+        """Upload one gallery; returns (status, payload) with status done/skipped/failed/stopped."""
+        if self._stop.is_set():
+            return 'stopped', None
+        entry = self.journal.get(folder_path) if self.journal else JournalEntry()
+        if entry.done:
+            log(f"Skipping {folder_path}: already uploaded (journal)", level="info", category="uploads")
+            self.progress.event('gallery_skipped', path=folder_path, gallery_id=entry.gallery_id)
+            return 'skipped', None
+
+        log(f"Starting upload: {os.path.basename(folder_path)}", level="info", category="uploads")
+        self.progress.event('gallery_started', path=folder_path, resume_gallery_id=entry.gallery_id,
+                            already_uploaded=len(entry.files))
+        timings: Dict[str, float] = {}
+        gallery_ids: List[str] = [entry.gallery_id] if entry.gallery_id else []
+
+        def on_image_timing(fname: str, duration: float, size_bytes: int, ttfb: Optional[float]) -> None:
+            timings[fname] = duration
+
+        def on_image_uploaded(fname: str, data: Dict[str, Any], size_bytes: int) -> None:
+            if self.journal:
+                if not gallery_ids and data.get('gallery_id'):
+                    gallery_ids.append(data['gallery_id'])
+                    self.journal.record_gallery(folder_path, data['gallery_id'])
+                self.journal.record_file(folder_path, fname, data)
+            seconds = timings.pop(fname, None)
+            self.progress.event('file_done', path=folder_path, file=fname, bytes=size_bytes,
+                                seconds=round(seconds, 3) if seconds is not None else None,
+                                url=data.get('image_url'))
+
+        try:
+            with self.budget.share() as share:
+                engine = UploadEngine(self.uploader, self.rename_worker,
+                                      global_byte_counter=self.byte_counter,
+                                      concurrency_controller=share,
+                                      retry_policy=self.retry_policy)
+                results = engine.run(
+                    folder_path=folder_path,
+                    gallery_name=self.options.gallery_name,
+                    thumbnail_size=self.options.thumbnail_size,
+                    thumbnail_format=self.options.thumbnail_format,
+                    max_retries=self.options.max_retries,
+                    parallel_batch_size=self.options.parallel,
+                    template_name=self.options.template_name,
+                    already_uploaded=set(entry.files),
+                    existing_gallery_id=entry.gallery_id,
+                    should_soft_stop=self._stop.is_set,
+                    on_image_uploaded=on_image_uploaded,
+                    on_image_timing=on_image_timing,
+                )
+        except Exception as e:
+            log(f"Error uploading {folder_path}: {e}", level="error", category="uploads")
+            self.progress.event('gallery_failed', path=folder_path, error=str(e))
+            return 'failed', str(e)
+
+        if entry.files:
+            # Images from the interrupted run come first, in upload order
+            results['images'] = list(entry.files.values()) + list(results.get('images', []))
+
+        for fname, reason in results.get('failed_details', []):
+            self.progress.event('file_failed', path=folder_path, file=fname, error=reason)
+
+        try:
+            save = self.save_artifacts
+            if save is None:
+                from bbdrop import save_gallery_artifacts as save
+            save(folder_path=folder_path, results=results, template_name=self.options.template_name)
+        except Exception as e:
+            log(f"Artifact save error for {folder_path}: {e}", level="warning", category="uploads")
+            self.progress.event('error', path=folder_path, error=f"Artifact save error: {e}")
+
+        complete = not results.get('failed_count') and results.get('successful_count', 0) >= results.get('total_images', 0)
+        if self.journal and complete and results.get('gallery_id'):
+            self.journal.record_done(folder_path, results['gallery_id'])
+        self.progress.event(
+            'gallery_done', path=folder_path, gallery_id=results.get('gallery_id'),
+            gallery_url=results.get('gallery_url'), gallery_name=results.get('gallery_name'),
+            uploaded=results.get('successful_count', 0), failed=results.get('failed_count', 0),
+            total=results.get('total_images', 0), bytes=results.get('uploaded_size', 0),
+            seconds=round(results.get('upload_time', 0.0), 3),
+        )
+        return 'done', results
@@ -2,16 +2,19 @@
 File host worker lifecycle manager.
 
 Manages one persistent worker per enabled file host. Handles worker spawning/killing,
-signal relay to GUI, and host enable/disable operations.
+signal relay to GUI, and host enable/disable operations. Workers uploading the same
+gallery share one sequential read of its ZIP (see src.processing.zip_fanout).
 """
 
 import threading
+from pathlib import Path
 from typing import Dict, Optional
 
 from PyQt6.QtCore import QObject, pyqtSignal
 
 from src.core.file_host_config import get_config_manager
 from src.processing.file_host_workers import FileHostWorker
+from src.processing.zip_fanout import ZipFanOutRegistry, ZipStream
 from src.storage.database import QueueStore
 from src.utils.logger import log
 
@@ -32,10 +35,8 @@ class FileHostWorkerManager(QObject):
     spinup_complete = pyqtSignal(str, str)  # host_id, error_message
     enabled_workers_changed = pyqtSignal(list)  # List of enabled host_ids
     upload_started = pyqtSignal(int, str)  # gallery_id, host_name
-    upload_progress = pyqtSignal(int, str, int, int, float)  # gallery_id, host_name, uploaded, total, speed_bps
     upload_completed = pyqtSignal(int, str, dict)  # gallery_id, host_name, result
     upload_failed = pyqtSignal(int, str, str)  # gallery_id, host_name, error
-    bandwidth_updated = pyqtSignal(str, float)  # host_id, KB/s
     worker_status_updated = pyqtSignal(str, str)  # host_id, status_text
 
     def __init__(self, queue_store: QueueStore):
@@ -49,6 +50,7 @@ class FileHostWorkerManager(QObject):
         self.workers: Dict[str, FileHostWorker] = {}  # Enabled workers (spinup succeeded)
         self.pending_workers: Dict[str, FileHostWorker] = {}  # Workers spinning up (testing credentials)
         self._pending_lock = threading.Lock()  # Protects pending_workers dict
+        self.zip_fanout = ZipFanOutRegistry()  # Shared ZIP reads per gallery
 
     def init_enabled_hosts(self) -> None:
         """Spawn workers for all enabled file hosts at startup.
@@ -129,6 +131,7 @@ class FileHostWorkerManager(QObject):
 
             #  Create and configure worker
             worker = FileHostWorker(host_id, self.queue_store)
+            worker.zip_stream_provider = self.open_zip_stream
             self._connect_worker_signals(worker)
 
             # Add to pending_workers (NOT workers yet - not enabled until spinup succeeds)
@@ -176,6 +179,34 @@ class FileHostWorkerManager(QObject):
         # Emit enabled workers list change (for tab view and dialog sync)
         self.enabled_workers_changed.emit(list(self.workers.keys()))
 
+    def open_zip_stream(self, db_id: int, host_name: str, zip_path: Path, gallery_path: str) -> ZipStream:
+        """Open a gallery ZIP for upload, sharing the read with the other hosts about to upload it.
+
+        Called from worker threads. The hosts expected to join are the enabled
+        hosts with a pending or in-progress upload for the same gallery that
+        are idle or already on this gallery; a host busy with another gallery
+        would keep the others waiting for the whole join window.
+
+        Args:
+            db_id: Gallery database ID
+            host_name: Host opening the stream
+            zip_path: Gallery ZIP
+            gallery_path: Gallery folder (to look up the other hosts' uploads)
+
+        Returns:
+            Stream of the ZIP's bytes for this host
+        """
+        def available(host: str) -> bool:
+            worker = self.workers.get(host)
+            return worker is not None and worker.current_db_id in (None, db_id)
+
+        expected = {
+            upload['host_name'] for upload in self.queue_store.get_file_host_uploads(gallery_path)
+            if upload['gallery_fk'] == db_id and upload['status'] in ('pending', 'uploading')
+            and available(upload['host_name'])
+        }
+        return self.zip_fanout.open_stream(db_id, host_name, zip_path, expected, available)
+
     def get_worker(self, host_id: str) -> Optional[FileHostWorker]:
         """Get worker reference for a host.
 
@@ -282,13 +313,9 @@ class FileHostWorkerManager(QObject):
         worker.spinup_complete.connect(self._on_spinup_complete)
         # Upload signals
         worker.upload_started.connect(self.upload_started)
-        worker.upload_progress.connect(self.upload_progress)
         worker.upload_completed.connect(self.upload_completed)
         worker.upload_failed.connect(self.upload_failed)
 
-        # Bandwidth signal
-        worker.bandwidth_updated.connect(self.bandwidth_updated)
-
         # Status signal
         worker.status_updated.connect(self.worker_status_updated.emit)
 
@@ -10,7 +10,7 @@ import json
 import threading
 import traceback
 from pathlib import Path
-from typing import Optional, Dict, Any
+from typing import Any, Callable, Dict, Optional
 
 from PyQt6.QtCore import QThread, pyqtSignal, pyqtSlot, QSettings, Qt
 
@@ -23,6 +23,8 @@ from src.proxy.resolver import ProxyResolver
 from src.proxy.models import ProxyContext
 from src.storage.database import QueueStore
 from src.utils.logger import log
+from src.utils.progress_bus import CHANNEL_BANDWIDTH, CHANNEL_FILE_HOST, get_progress_bus
+from src.utils.tracing import span, traced
 from src.utils.zip_manager import get_zip_manager
 from src.utils.format_utils import format_binary_size
 
@@ -41,10 +43,8 @@ class FileHostWorker(QThread):
 
     # Signals for communication with GUI
     upload_started = pyqtSignal(int, str)  # db_id, host_name
-    upload_progress = pyqtSignal(int, str, int, int, float)  # db_id, host_name, uploaded_bytes, total_bytes, speed_bps
     upload_completed = pyqtSignal(int, str, dict)  # db_id, host_name, result_dict
     upload_failed = pyqtSignal(int, str, str)  # db_id, host_name, error_message
-    bandwidth_updated = pyqtSignal(str, float)  # host_id, KB/s from pycurl
     log_message = pyqtSignal([str], [str, str])  # Overloaded: (message) or (level, message) for backward compatibility
 
     # New signals for testing and storage
@@ -104,9 +104,10 @@ class FileHostWorker(QThread):
         self.current_db_id: Optional[int] = None
         self._should_stop_current = False
 
-        # Thread-safe upload throttle state
-        self._upload_throttle_state = {}  # {(db_id, host): {'last_emit': time, 'last_progress': (up, total)}}
-        self._throttle_lock = threading.Lock()
+        # Shared ZIP reads: set by FileHostWorkerManager to open a ZipStream that the
+        # other hosts uploading the same gallery read along with
+        # (db_id, host_name, zip_path, gallery_path) -> ZipStream or None
+        self.zip_stream_provider: Optional[Callable[[int, str, Path, str], Any]] = None
 
         # Connect credentials update signal
         self.credentials_update_requested.connect(self._update_credentials)
@@ -152,11 +153,6 @@ class FileHostWorker(QThread):
                 self.host_credentials.pop(self.host_id, None)
                 self._log("Credentials cleared", level="debug")
 
-    def _cleanup_upload_throttle_state(self, db_id: int, host_name: str):
-        """Clean up throttling state for an upload to prevent memory leaks."""
-        with self._throttle_lock:
-            self._upload_throttle_state.pop((db_id, host_name), None)
-
     def _create_client(self, host_config: HostConfig) -> FileHostClient:
         """Create FileHostClient with session reuse and proxy support.
 
@@ -658,6 +654,7 @@ class FileHostWorker(QThread):
 
         self._log("Worker stopped", level="info")
 
+    @traced("file_host_upload", category="file_hosts", gallery_arg="gallery_path")
     def _process_upload(
         self,
         upload_id: int,
@@ -685,6 +682,7 @@ class FileHostWorker(QThread):
         # Initialize timing and size tracking for metrics
         upload_start_time = time.time()
         zip_size = 0
+        zip_stream = None
 
         self._log(
             f"Starting upload to {host_name} for gallery {db_id} ({gallery_name})",
@@ -713,11 +711,12 @@ class FileHostWorker(QThread):
                     error_msg += f" (WSL2 path: {folder_path})"
                 raise FileNotFoundError(error_msg)
 
-            zip_path = self.zip_manager.create_or_reuse_zip(
-                db_id=db_id,
-                folder_path=folder_path,
-                gallery_name=gallery_name
-            )
+            with span("file_host_zip", category="file_hosts", host=host_name):
+                zip_path = self.zip_manager.create_or_reuse_zip(
+                    db_id=db_id,
+                    folder_path=folder_path,
+                    gallery_name=gallery_name
+                )
 
             zip_size = zip_path.stat().st_size
 
@@ -728,45 +727,31 @@ class FileHostWorker(QThread):
                 total_bytes=zip_size
             )
 
+            # Share one sequential read of the ZIP with the other hosts uploading it
+            if self.zip_stream_provider is not None:
+                try:
+                    zip_stream = self.zip_stream_provider(db_id, host_name, zip_path, gallery_path)
+                except Exception as e:
+                    self._log(f"Shared ZIP read unavailable, reading on our own: {e}", level="debug")
+
             # Step 2: Create client and upload (reuses session if available)
             client = self._create_client(host_config)
+            progress_bus = get_progress_bus()
 
             def on_progress(uploaded: int, total: int, speed_bps: float = 0.0):
                 """Progress callback from pycurl with speed tracking."""
                 try:
-                    # Throttle progress signal emissions to max 4 per second using instance-level state
-                    current_time = time.time()
-                    upload_key = (db_id, host_name)
-
-                    should_emit = False
-                    with self._throttle_lock:
-                        state = self._upload_throttle_state.setdefault(upload_key, {
-                            'last_emit': 0,
-                            'last_progress': (0, 0)
-                        })
-
-                        time_elapsed = current_time - state['last_emit']
-                        if time_elapsed >= 0.25:  # Max 4 per second
-                            last_progress = state['last_progress']
-                            # Emit if progress changed or it's been >0.5s (prevent frozen UI)
-                            if (uploaded, total) != last_progress or time_elapsed >= 0.5:
-                                should_emit = True
-                                state['last_emit'] = current_time
-                                state['last_progress'] = (uploaded, total)
-
-                    # Emit outside the lock to avoid deadlocks
-                    if should_emit:
-                        self.upload_progress.emit(db_id, host_name, uploaded, total, speed_bps)
-
-                    # Emit bandwidth periodically (speed_bps is bytes/sec, convert to KB/s)
-                    # Only emit when we have actual speed data - don't emit 0 during
+                    # The GUI reads the latest state from the progress bus each frame
+                    progress_bus.publish(CHANNEL_FILE_HOST, (db_id, host_name), (uploaded, total, speed_bps))
+
+                    # Publish bandwidth (speed_bps is bytes/sec, convert to KB/s)
+                    # Only publish when we have actual speed data - don't publish 0 during
                     # connection setup, SSL handshake, or server response wait
                     if speed_bps > 0:
                         kbps = speed_bps / 1024.0
                         self._emit_bandwidth_immediate(kbps)
                 except Exception as e:
                     self._log(f"Progress callback error: {e}\n{traceback.format_exc()}", level="error")
-                    self._cleanup_upload_throttle_state(db_id, host_name)
                     # Continue upload - don't abort on display errors
 
             def should_stop():
@@ -777,11 +762,13 @@ class FileHostWorker(QThread):
             upload_start_time = time.time()
 
             # Perform upload
-            result = client.upload_file(
-                file_path=zip_path,
-                on_progress=on_progress,
-                should_stop=should_stop
-            )
+            with span("file_host_transfer", category="file_hosts", host=host_name):
+                result = client.upload_file(
+                    file_path=zip_path,
+                    on_progress=on_progress,
+                    should_stop=should_stop,
+                    source=zip_stream
+                )
 
             # Calculate transfer time for metrics
             upload_elapsed_time = time.time() - upload_start_time
@@ -795,8 +782,6 @@ class FileHostWorker(QThread):
                 # This ensures GUI gets immediate notification without waiting for DB writes
                 self.upload_completed.emit(db_id, host_name, result)
 
-                self._cleanup_upload_throttle_state(db_id, host_name)
-
                 # Update database with success (AFTER signal emission)
                 self.queue_store.update_file_host_upload(
                     upload_id,
@@ -822,6 +807,11 @@ class FileHostWorker(QThread):
                         transfer_time=upload_elapsed_time,
                         success=True
                     )
+                    metrics_store.record_latency(
+                        self.host_id,
+                        upload_time=upload_elapsed_time,
+                        bytes_uploaded=zip_size
+                    )
                 self._log(
                     f"Successfully uploaded {gallery_name}: {download_url}",
                     level="info")
@@ -864,7 +854,6 @@ class FileHostWorker(QThread):
             )
 
             if should_retry:
-                self._cleanup_upload_throttle_state(db_id, host_name)  # ADD THIS LINE
                 # Increment retry count and set back to pending
                 self.queue_store.update_file_host_upload(
                     upload_id,
@@ -882,8 +871,6 @@ class FileHostWorker(QThread):
                 # This ensures GUI gets immediate notification
                 self.upload_failed.emit(db_id, host_name, error_msg)
 
-                self._cleanup_upload_throttle_state(db_id, host_name)
-
                 # Mark as failed (AFTER signal emission)
                 self.queue_store.update_file_host_upload(
                     upload_id,
@@ -909,6 +896,10 @@ class FileHostWorker(QThread):
                     )
 
         finally:
+            # Stop taking part in the shared read before the ZIP can be deleted
+            if zip_stream is not None:
+                zip_stream.close()
+
             # Release ZIP reference
             self.zip_manager.release_zip(db_id)
 
@@ -919,7 +910,7 @@ class FileHostWorker(QThread):
             self._should_stop_current = False
 
     def _emit_bandwidth(self):
-        """Calculate and emit current bandwidth."""
+        """Calculate current bandwidth and publish it to the progress bus."""
         now = time.time()
 
         # Only emit every 0.5 seconds
@@ -934,8 +925,7 @@ class FileHostWorker(QThread):
             # Calculate KB/s
             kbps = (bytes_transferred / 1024.0) / elapsed
 
-            # Emit signal
-            self.bandwidth_updated.emit(self.host_id, kbps)
+            get_progress_bus().publish(CHANNEL_BANDWIDTH, self.host_id, kbps)
 
             # Update tracking
             self._bw_last_bytes = current_bytes
@@ -943,15 +933,15 @@ class FileHostWorker(QThread):
             self._bw_last_emit = now
 
     def _emit_bandwidth_immediate(self, kbps: float):
-        """Emit bandwidth immediately without throttling (for pycurl-calculated speeds)."""
+        """Publish a pycurl-calculated speed to the progress bus."""
         now = time.time()
 
-        # Still throttle to 0.5 seconds to avoid GUI overload
+        # Still throttle to 0.5 seconds
         if now - self._bw_last_emit < 0.5:
             return
 
-        # Emit the speed directly (already calculated by pycurl callback)
-        self.bandwidth_updated.emit(self.host_id, kbps)
+        # Publish the speed directly (already calculated by pycurl callback)
+        get_progress_bus().publish(CHANNEL_BANDWIDTH, self.host_id, kbps)
 
         # Update tracking
         self._bw_last_emit = now
@@ -1,25 +1,61 @@
 """
 External program hooks executor for running programs at gallery lifecycle events.
+
+Hook jobs are queued on a HookScheduler: each hook type has its own bounded
+queue and a fixed number of worker threads, so a burst of completed galleries
+cannot start dozens of hook processes at once. Hook output is streamed into
+the log line by line while the process runs. Hooks with persistent mode
+enabled stay running between jobs (see src.processing.persistent_hooks).
 """
 
 import os
+import queue
 import subprocess
 import json
 import configparser
 import concurrent.futures
+import threading
 import time
 import sys
-from typing import Any, Dict, List, Optional, Tuple
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, List, Optional, Tuple
 from bbdrop import get_config_path
+from src.processing.persistent_hooks import HookWorkerError, PersistentHookPool
+from src.utils.archive_utils import gallery_exists, is_archive_gallery_path, split_archive_gallery_path
 from src.utils.logger import log
+from src.utils.tracing import span
+
+HOOK_TIMEOUT_SECONDS = 300
+DEFAULT_MAX_CONCURRENT = 2     # hook processes per hook type
+DEFAULT_MAX_PENDING = 32       # queued jobs per hook type before submit() blocks
+
+
+@dataclass
+class HookStats:
+    """Timing counters for one hook type."""
+    runs: int = 0
+    failures: int = 0
+    timeouts: int = 0
+    total_seconds: float = 0.0
+    max_seconds: float = 0.0
+
+    @property
+    def avg_seconds(self) -> float:
+        return self.total_seconds / self.runs if self.runs else 0.0
 
 
 class HooksExecutor:
     """Executes external programs at gallery lifecycle events"""
 
     def __init__(self):
-        # Don't cache config - reload fresh each time execute_hooks is called
-        pass
+        # Config is loaded on first use and cached until the INI file changes
+        # or invalidate_config() is called (settings saved)
+        self._cached_config: Optional[Dict] = None
+        self._config_stamp: Optional[Tuple[float, int]] = None
+        self._config_lock = threading.Lock()
+        self._stats: Dict[str, HookStats] = {}
+        self._stats_lock = threading.Lock()
+        self._persistent = PersistentHookPool()
 
     def _remove_temp_file_with_retry(self, file_path: str, max_retries: int = 5, initial_delay: float = 0.1) -> bool:
         """
@@ -65,6 +101,50 @@ class HooksExecutor:
 
         return False
 
+    @staticmethod
+    def _config_file_stamp() -> Optional[Tuple[float, int]]:
+        try:
+            st = os.stat(get_config_path())
+            return st.st_mtime, st.st_size
+        except OSError:
+            return None
+
+    def get_config(self) -> Dict:
+        """Hooks configuration, re-read only when the INI file has changed."""
+        stamp = self._config_file_stamp()
+        with self._config_lock:
+            if self._cached_config is None or stamp != self._config_stamp:
+                self._cached_config = self._load_config()
+                self._config_stamp = stamp
+            return self._cached_config
+
+    def invalidate_config(self) -> None:
+        """Drop the cached configuration (call after saving hook settings)."""
+        with self._config_lock:
+            self._cached_config = None
+        # Commands may have changed; workers restart on next use
+        self._persistent.shutdown()
+
+    def shutdown(self) -> None:
+        """Stop persistent hook workers."""
+        self._persistent.shutdown()
+
+    def get_stats(self) -> Dict[str, HookStats]:
+        """Per hook type timing stats since startup."""
+        with self._stats_lock:
+            return {hook_type: HookStats(**vars(stats)) for hook_type, stats in self._stats.items()}
+
+    def _record_run(self, hook_type: str, seconds: float, success: bool, timed_out: bool = False) -> None:
+        with self._stats_lock:
+            stats = self._stats.setdefault(hook_type, HookStats())
+            stats.runs += 1
+            stats.total_seconds += seconds
+            stats.max_seconds = max(stats.max_seconds, seconds)
+            if not success:
+                stats.failures += 1
+            if timed_out:
+                stats.timeouts += 1
+
     def _load_config(self) -> Dict:
         """Load external apps configuration from INI file"""
         config = configparser.ConfigParser()
@@ -73,12 +153,20 @@ class HooksExecutor:
         if os.path.exists(config_file):
             config.read(config_file, encoding='utf-8')
 
+        try:
+            max_concurrent = max(1, int(config.get('EXTERNAL_APPS', 'max_concurrent',
+                                                   fallback=DEFAULT_MAX_CONCURRENT)))
+        except (TypeError, ValueError):
+            max_concurrent = DEFAULT_MAX_CONCURRENT
+
         hooks_config = {
             'parallel_execution': config.getboolean('EXTERNAL_APPS', 'parallel_execution', fallback=True),
+            'max_concurrent': max_concurrent,
             'added': {
                 'enabled': config.getboolean('EXTERNAL_APPS', 'hook_added_enabled', fallback=False),
                 'command': config.get('EXTERNAL_APPS', 'hook_added_command', fallback=''),
                 'show_console': config.getboolean('EXTERNAL_APPS', 'hook_added_show_console', fallback=False),
+                'persistent': config.getboolean('EXTERNAL_APPS', 'hook_added_persistent', fallback=False),
                 'key_mapping': {
                     'ext1': config.get('EXTERNAL_APPS', 'hook_added_key1', fallback='ext1'),
                     'ext2': config.get('EXTERNAL_APPS', 'hook_added_key2', fallback='ext2'),
@@ -90,6 +178,7 @@ class HooksExecutor:
                 'enabled': config.getboolean('EXTERNAL_APPS', 'hook_started_enabled', fallback=False),
                 'command': config.get('EXTERNAL_APPS', 'hook_started_command', fallback=''),
                 'show_console': config.getboolean('EXTERNAL_APPS', 'hook_started_show_console', fallback=False),
+                'persistent': config.getboolean('EXTERNAL_APPS', 'hook_started_persistent', fallback=False),
                 'key_mapping': {
                     'ext1': config.get('EXTERNAL_APPS', 'hook_started_key1', fallback='ext1'),
                     'ext2': config.get('EXTERNAL_APPS', 'hook_started_key2', fallback='ext2'),
@@ -101,6 +190,7 @@ class HooksExecutor:
                 'enabled': config.getboolean('EXTERNAL_APPS', 'hook_completed_enabled', fallback=False),
                 'command': config.get('EXTERNAL_APPS', 'hook_completed_command', fallback=''),
                 'show_console': config.getboolean('EXTERNAL_APPS', 'hook_completed_show_console', fallback=False),
+                'persistent': config.getboolean('EXTERNAL_APPS', 'hook_completed_persistent', fallback=False),
                 'key_mapping': {
                     'ext1': config.get('EXTERNAL_APPS', 'hook_completed_key1', fallback='ext1'),
                     'ext2': config.get('EXTERNAL_APPS', 'hook_completed_key2', fallback='ext2'),
@@ -176,6 +266,11 @@ class HooksExecutor:
 
     def _execute_hook_with_config(self, hook_type: str, context: Dict, config: Dict) -> Tuple[bool, Optional[Dict]]:
         """Execute a single hook with provided config and return success status and parsed JSON output"""
+        with span(f"hook.{hook_type}", category="hooks", gallery=context.get('gallery_path')):
+            return self._run_hook(hook_type, context, config)
+
+    def _run_hook(self, hook_type: str, context: Dict, config: Dict) -> Tuple[bool, Optional[Dict]]:
+        """Run a hook's command (see _execute_hook_with_config)"""
         hook_config = config.get(hook_type, {})
 
         if not hook_config.get('enabled'):
@@ -192,7 +287,13 @@ class HooksExecutor:
         if '%z' in command and not context.get('zip_path'):
             # Command needs a ZIP but one doesn't exist - create temporary ZIP
             gallery_path = context.get('gallery_path', '')
-            if gallery_path and os.path.isdir(gallery_path):
+            archive_path, inner_dir = ('', '')
+            if is_archive_gallery_path(gallery_path):
+                archive_path, inner_dir = split_archive_gallery_path(gallery_path)
+            if archive_path and not inner_dir:
+                # The archive itself is the gallery's ZIP - pass it through, never delete it
+                context['zip_path'] = archive_path
+            elif gallery_path and gallery_exists(gallery_path):
                 try:
                     from src.processing.upload_to_filehost import create_temp_zip
                     temp_zip_path = create_temp_zip(gallery_path)
@@ -225,38 +326,31 @@ class HooksExecutor:
                 cmd_args = shlex.split(final_command)
 
             # Execute the command without shell to avoid special character issues
-            result = subprocess.run(
-                cmd_args,
-                shell=False,
-                capture_output=True,
-                text=True,
-                timeout=300,  # 5 minute timeout
-                creationflags=creation_flags
-            )
-
-            # Log combined stdout/stderr as single expandable message with \n line breaks
-            output_parts = []
-            if result.stdout:
-                # Replace actual newlines with literal \n for log viewer auto-expand
-                stdout_display = result.stdout.replace('\n', '\\n').rstrip('\\n')
-                output_parts.append(f"[stdout]\\n{stdout_display}")
-            if result.stderr:
-                stderr_display = result.stderr.replace('\n', '\\n').rstrip('\\n')
-                output_parts.append(f"[stderr]\\n{stderr_display}")
-
-            combined_output = '\\n\\n'.join(output_parts) if output_parts else ""
-
-            if result.returncode != 0:
-                log(f"Hook {hook_type} failed with code {result.returncode}\\n{combined_output}", level="error", category="hooks")
+            started = time.monotonic()
+            try:
+                if hook_config.get('persistent'):
+                    returncode, stdout, stderr = self._run_persistent(hook_type, cmd_args, context, creation_flags)
+                else:
+                    returncode, stdout, stderr = self._run_process(hook_type, cmd_args, creation_flags)
+            except subprocess.TimeoutExpired:
+                self._record_run(hook_type, time.monotonic() - started, False, timed_out=True)
+                raise
+            elapsed = time.monotonic() - started
+
+            if returncode != 0:
+                self._record_run(hook_type, elapsed, False)
+                if temp_zip_path:
+                    self._remove_temp_file_with_retry(temp_zip_path)
+                last_error = stderr.strip().splitlines()[-1] if stderr.strip() else ""
+                log(f"Hook {hook_type} failed with code {returncode} after {elapsed:.2f}s"
+                    + (f": {last_error}" if last_error else ""), level="error", category="hooks")
                 return False, None
-            else:
-                log(f"Hook '{hook_type}' output:\\n{combined_output}", level="info", category="hooks")
-        
+
             # Try to parse JSON from stdout
             json_data = None
-            if result.stdout.strip():
+            if stdout.strip():
                 try:
-                    json_data = json.loads(result.stdout.strip())
+                    json_data = json.loads(stdout.strip())
                     log(f"Hook {hook_type} returned JSON: {json_data}", level="debug", category="hooks")
                 except json.JSONDecodeError:
                     log(f"Hook {hook_type} output is not valid JSON, ignoring", level="debug", category="hooks")
@@ -266,11 +360,12 @@ class HooksExecutor:
                 self._remove_temp_file_with_retry(temp_zip_path)
 
             # Log single success message for GUI
-            log(f"Hook '{hook_type}' completed successfully", level="info", category="hooks")
+            self._record_run(hook_type, elapsed, True)
+            log(f"Hook '{hook_type}' completed successfully in {elapsed:.2f}s", level="info", category="hooks")
             return True, json_data
 
         except subprocess.TimeoutExpired:
-            log(f"Hook {hook_type} timed out after 300 seconds", level="error", category="hooks")
+            log(f"Hook {hook_type} timed out after {HOOK_TIMEOUT_SECONDS} seconds", level="error", category="hooks")
             # Clean up temp ZIP on timeout
             if temp_zip_path:
                 self._remove_temp_file_with_retry(temp_zip_path)
@@ -282,6 +377,61 @@ class HooksExecutor:
                 self._remove_temp_file_with_retry(temp_zip_path)
             return False, None
 
+    def _run_persistent(self, hook_type: str, cmd_args: List[str], context: Dict,
+                        creation_flags: int) -> Tuple[int, str, str]:
+        """Run a hook as a job on its persistent worker (same result shape as _run_process)."""
+        try:
+            return self._persistent.run(hook_type, cmd_args, context, HOOK_TIMEOUT_SECONDS, creation_flags)
+        except HookWorkerError as e:
+            return 1, "", str(e)
+
+    def _run_process(self, hook_type: str, cmd_args: List[str], creation_flags: int) -> Tuple[int, str, str]:
+        """Run a hook process, logging its stdout/stderr line by line as it is written.
+
+        Returns:
+            (return code, full stdout, full stderr)
+
+        Raises:
+            subprocess.TimeoutExpired: The process was killed after HOOK_TIMEOUT_SECONDS
+        """
+        process = subprocess.Popen(
+            cmd_args,
+            shell=False,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.PIPE,
+            text=True,
+            encoding='utf-8',
+            errors='replace',
+            creationflags=creation_flags
+        )
+        captured: Dict[str, List[str]] = {'stdout': [], 'stderr': []}
+
+        def pump(stream, name: str) -> None:
+            level = "info" if name == "stdout" else "warning"
+            try:
+                for line in stream:
+                    captured[name].append(line)
+                    text = line.rstrip('\r\n')
+                    if text:
+                        log(f"Hook '{hook_type}' [{name}] {text}", level=level, category="hooks")
+            except (OSError, ValueError):
+                pass  # Pipe closed after the process was killed
+
+        readers = [threading.Thread(target=pump, args=(process.stdout, "stdout"), daemon=True),
+                   threading.Thread(target=pump, args=(process.stderr, "stderr"), daemon=True)]
+        for reader in readers:
+            reader.start()
+        try:
+            returncode = process.wait(timeout=HOOK_TIMEOUT_SECONDS)
+        except subprocess.TimeoutExpired:
+            process.kill()
+            process.wait()
+            raise
+        finally:
+            for reader in readers:
+                reader.join(timeout=5)
+        return returncode, ''.join(captured['stdout']), ''.join(captured['stderr'])
+
     def execute_hooks(self, hook_types: List[str], context: Dict) -> Dict[str, Any]:
         """
         Execute one or more hooks (parallel or sequential based on config).
@@ -293,8 +443,8 @@ class HooksExecutor:
         Returns:
             Dictionary with combined results from all hooks, including ext1-4 values
         """
-        # Reload config fresh each time to pick up any settings changes
-        config = self._load_config()
+        # Cached; re-read only after the settings have changed
+        config = self.get_config()
 
         # Filter to only enabled hooks
         enabled_hooks = [h for h in hook_types if config.get(h, {}).get('enabled')]
@@ -369,6 +519,95 @@ def get_hooks_executor() -> HooksExecutor:
     return _hooks_executor
 
 
+def shutdown_hooks_executor() -> None:
+    """Stop the global executor's persistent hook workers, if it was ever created (call on exit)"""
+    if _hooks_executor is not None:
+        _hooks_executor.shutdown()
+
+
+class HookScheduler:
+    """Runs hook jobs on a bounded queue and worker threads per hook type.
+
+    Each hook type gets max_concurrent daemon workers (from the hooks config),
+    so at most that many of its processes run at once. submit() blocks while
+    max_pending jobs of the same type are already waiting, which slows the
+    producer down instead of piling up threads.
+    """
+
+    def __init__(self, executor: Optional[HooksExecutor] = None, max_concurrent: Optional[int] = None,
+                 max_pending: int = DEFAULT_MAX_PENDING):
+        self._executor = executor
+        self._max_concurrent = max_concurrent
+        self._max_pending = max_pending
+        self._lanes: Dict[str, queue.Queue] = {}
+        self._lock = threading.Lock()
+        self._idle = threading.Condition(self._lock)
+        self._unfinished = 0
+
+    def _lane(self, hook_type: str) -> queue.Queue:
+        with self._lock:
+            lane = self._lanes.get(hook_type)
+            if lane is not None:
+                return lane
+            lane = self._lanes[hook_type] = queue.Queue(maxsize=self._max_pending)
+            workers = self._max_concurrent
+            if workers is None:
+                executor = self._executor or get_hooks_executor()
+                workers = executor.get_config().get('max_concurrent', DEFAULT_MAX_CONCURRENT)
+            for i in range(max(1, workers)):
+                threading.Thread(target=self._work, args=(lane,), daemon=True,
+                                 name=f"hook-{hook_type}-{i + 1}").start()
+            return lane
+
+    def submit(self, hook_type: str, job: Callable[[], Any]) -> None:
+        """Queue job to run on a worker for hook_type (blocks while that queue is full)."""
+        lane = self._lane(hook_type)
+        with self._lock:
+            self._unfinished += 1
+        try:
+            lane.put_nowait(job)
+        except queue.Full:
+            log(f"Hook queue for '{hook_type}' is full ({self._max_pending} waiting), waiting for a free slot",
+                level="debug", category="hooks")
+            lane.put(job)
+
+    def pending(self, hook_type: str) -> int:
+        """Jobs of hook_type waiting for a worker."""
+        lane = self._lanes.get(hook_type)
+        return lane.qsize() if lane is not None else 0
+
+    def wait_idle(self, timeout: Optional[float] = None) -> bool:
+        """Wait until every submitted job has finished. Returns False on timeout."""
+        with self._idle:
+            return self._idle.wait_for(lambda: self._unfinished == 0, timeout)
+
+    def _work(self, lane: queue.Queue) -> None:
+        while True:
+            job = lane.get()
+            try:
+                job()
+            except Exception as e:
+                log(f"Hook job raised exception: {e}", level="error", category="hooks")
+            finally:
+                with self._idle:
+                    self._unfinished -= 1
+                    if self._unfinished == 0:
+                        self._idle.notify_all()
+
+
+_hook_scheduler = None
+_hook_scheduler_lock = threading.Lock()
+
+
+def get_hook_scheduler() -> HookScheduler:
+    """Get or create the global hook scheduler instance"""
+    global _hook_scheduler
+    with _hook_scheduler_lock:
+        if _hook_scheduler is None:
+            _hook_scheduler = HookScheduler()
+        return _hook_scheduler
+
+
 def execute_gallery_hooks(event_type: str, gallery_path: str, gallery_name: Optional[str] = None,
                           tab_name: str = "Main", image_count: int = 0,
                           gallery_id: Optional[str] = None, json_path: Optional[str] = None,
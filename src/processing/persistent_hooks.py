@@ -0,0 +1,291 @@
+"""
+Persistent hook workers.
+
+A hook run in persistent mode is started once with the --persistent flag and
+then receives one gallery job per JSON line on stdin, instead of starting a
+new process (and logging in to every host again) for each gallery:
+
+    bbdrop -> hook   {"id": 3, "argv": ["muh.py", "gofile", "/tmp/g.zip"], "context": {...}}
+    hook -> bbdrop   {"id": 3, "exit_code": 0, "output": "{\"url\": ...}"}
+    bbdrop -> hook   {"id": 4, "ping": true}
+    hook -> bbdrop   {"id": 4, "pong": true}
+
+"argv" is the hook's sys.argv for a one-shot run and "output" is what it
+would have printed to stdout, so JSON mapping to ext1-4 works unchanged.
+Anything the hook writes to stderr is streamed into the log. The hook side of
+the protocol is hooks/hook_worker.py.
+"""
+
+import json
+import queue
+import re
+import subprocess
+import threading
+import time
+from typing import Any, Dict, List, Optional, Tuple
+
+from src.utils.logger import log
+
+PERSISTENT_FLAG = "--persistent"
+PING_TIMEOUT_SECONDS = 5.0
+HEALTH_CHECK_IDLE_SECONDS = 60.0   # ping idle workers before reuse after this long
+STOP_TIMEOUT_SECONDS = 2.0
+
+_PYTHON_EXECUTABLE = re.compile(r'^(python[\d.]*w?|pythonw?|py)(\.exe)?$', re.IGNORECASE)
+
+
+class HookWorkerError(Exception):
+    """A persistent hook worker exited or sent no usable response."""
+
+    def __init__(self, message: str, delivered: bool = True):
+        super().__init__(message)
+        self.delivered = delivered  # False if the job never reached the worker
+
+
+class HookWorkerTimeout(HookWorkerError):
+    """A persistent hook worker did not answer in time."""
+
+
+def split_launch_args(cmd_args: List[str]) -> Tuple[List[str], List[str]]:
+    """Split a parsed hook command into the worker launch command and the job argv.
+
+    For Python hooks the interpreter (with its options) and the script are
+    launched; for anything else just the program. The job argv is what the
+    hook sees as sys.argv in a one-shot run.
+
+    Returns:
+        (launch args including PERSISTENT_FLAG, job argv)
+    """
+    if not cmd_args:
+        raise ValueError("Empty hook command")
+    if _PYTHON_EXECUTABLE.match(re.split(r'[\\/]', cmd_args[0])[-1]) and len(cmd_args) > 1:
+        script = 1
+        while script < len(cmd_args) - 1 and cmd_args[script].startswith('-') and cmd_args[script] != '-m':
+            script += 1
+        if cmd_args[script] == '-m':
+            script += 1
+        return cmd_args[:script + 1] + [PERSISTENT_FLAG], cmd_args[script:]
+    return [cmd_args[0], PERSISTENT_FLAG], list(cmd_args)
+
+
+class PersistentHookWorker:
+    """One running hook process that handles one job at a time."""
+
+    def __init__(self, launch_args: List[str], name: str, creation_flags: int = 0):
+        self.launch_args = list(launch_args)
+        self.name = name
+        self.creation_flags = creation_flags
+        self.last_used = 0.0
+        self.jobs_run = 0
+        self._process: Optional[subprocess.Popen] = None
+        self._responses: queue.Queue = queue.Queue()
+        self._next_id = 0
+
+    @property
+    def pid(self) -> Optional[int]:
+        return self._process.pid if self._process is not None else None
+
+    def start(self) -> None:
+        self._process = subprocess.Popen(
+            self.launch_args,
+            shell=False,
+            stdin=subprocess.PIPE,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.PIPE,
+            text=True,
+            encoding='utf-8',
+            errors='replace',
+            bufsize=1,
+            creationflags=self.creation_flags
+        )
+        self._responses = queue.Queue()
+        threading.Thread(target=self._read_stdout, args=(self._process, self._responses),
+                         daemon=True, name=f"hook-{self.name}-stdout").start()
+        threading.Thread(target=self._read_stderr, args=(self._process,),
+                         daemon=True, name=f"hook-{self.name}-stderr").start()
+        self.last_used = time.monotonic()
+        log(f"Started persistent '{self.name}' hook (pid {self._process.pid})", level="info", category="hooks")
+
+    def is_alive(self) -> bool:
+        return self._process is not None and self._process.poll() is None
+
+    def _read_stdout(self, process: subprocess.Popen, responses: queue.Queue) -> None:
+        try:
+            for line in process.stdout:
+                text = line.strip()
+                if not text:
+                    continue
+                try:
+                    message = json.loads(text)
+                except ValueError:
+                    message = None
+                if isinstance(message, dict) and 'id' in message:
+                    responses.put(message)
+                else:
+                    log(f"Hook '{self.name}' [stdout] {text}", level="info", category="hooks")
+        except (OSError, ValueError):
+            pass
+        responses.put(None)  # Process exited
+
+    def _read_stderr(self, process: subprocess.Popen) -> None:
+        try:
+            for line in process.stderr:
+                text = line.rstrip('\r\n')
+                if text:
+                    log(f"Hook '{self.name}' [stderr] {text}", level="warning", category="hooks")
+        except (OSError, ValueError):
+            pass
+
+    def request(self, message: Dict[str, Any], timeout: float) -> Dict[str, Any]:
+        """Send one message and wait for the response carrying the same id."""
+        if not self.is_alive():
+            raise HookWorkerError("worker is not running", delivered=False)
+        self._next_id += 1
+        message = dict(message, id=self._next_id)
+        try:
+            self._process.stdin.write(json.dumps(message, default=str) + "\n")
+            self._process.stdin.flush()
+        except (OSError, ValueError) as e:
+            raise HookWorkerError(f"could not send job: {e}", delivered=False)
+
+        deadline = time.monotonic() + timeout
+        while True:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                raise HookWorkerTimeout(f"no response after {timeout:.0f}s")
+            try:
+                response = self._responses.get(timeout=remaining)
+            except queue.Empty:
+                raise HookWorkerTimeout(f"no response after {timeout:.0f}s")
+            if response is None:
+                raise HookWorkerError(f"worker exited with code {self._process.wait()}")
+            if response.get('id') == message['id']:
+                return response
+            # Late answer to an earlier request; ignore
+
+    def ping(self, timeout: float = PING_TIMEOUT_SECONDS) -> bool:
+        """Health check: True if the worker answers a ping."""
+        try:
+            return bool(self.request({'ping': True}, timeout).get('pong'))
+        except HookWorkerError:
+            return False
+
+    def run_job(self, argv: List[str], context: Dict[str, Any], timeout: float) -> Tuple[int, str, str]:
+        """Run one gallery job.
+
+        Returns:
+            (exit code, stdout output of the hook, error message or "")
+        """
+        response = self.request({'argv': argv, 'context': context}, timeout)
+        self.last_used = time.monotonic()
+        self.jobs_run += 1
+        try:
+            exit_code = int(response.get('exit_code', 1))
+        except (TypeError, ValueError):
+            exit_code = 1
+        return exit_code, str(response.get('output') or ''), str(response.get('error') or '')
+
+    def stop(self) -> None:
+        """Close stdin (the worker exits at EOF), then kill if it does not."""
+        process = self._process
+        if process is None:
+            return
+        try:
+            process.stdin.close()
+        except (OSError, ValueError):
+            pass
+        try:
+            process.wait(timeout=STOP_TIMEOUT_SECONDS)
+        except subprocess.TimeoutExpired:
+            process.kill()
+            process.wait()
+        log(f"Stopped persistent '{self.name}' hook (pid {process.pid}) after {self.jobs_run} jobs",
+            level="debug", category="hooks")
+
+
+class PersistentHookPool:
+    """Idle persistent workers by launch command.
+
+    A worker is checked out for one job at a time; concurrency is bounded by
+    the hook scheduler, so the pool grows to at most max_concurrent workers
+    per hook type.
+    """
+
+    def __init__(self):
+        self._idle: Dict[Tuple[str, ...], List[PersistentHookWorker]] = {}
+        self._lock = threading.Lock()
+        self._generation = 0
+
+    def run(self, name: str, cmd_args: List[str], context: Dict[str, Any], timeout: float,
+            creation_flags: int = 0) -> Tuple[int, str, str]:
+        """Run a hook command as a job on a persistent worker.
+
+        Returns:
+            (exit code, hook stdout, error message or "")
+
+        Raises:
+            subprocess.TimeoutExpired: The job did not finish in time (worker killed)
+            HookWorkerError: The worker exited while running the job
+        """
+        launch_args, argv = split_launch_args(cmd_args)
+        key = tuple(launch_args) + (str(creation_flags),)
+        for attempt in range(2):
+            worker, generation = self._checkout(key, launch_args, name, creation_flags)
+            try:
+                result = worker.run_job(argv, context, timeout)
+            except HookWorkerTimeout:
+                log(f"Persistent '{name}' hook timed out, restarting it", level="warning", category="hooks")
+                worker.stop()
+                raise subprocess.TimeoutExpired(launch_args, timeout)
+            except HookWorkerError as e:
+                worker.stop()
+                if not e.delivered and attempt == 0:
+                    log(f"Persistent '{name}' hook was not running ({e}), restarting",
+                        level="warning", category="hooks")
+                    continue
+                log(f"Persistent '{name}' hook crashed: {e}", level="error", category="hooks")
+                raise
+            self._checkin(key, worker, generation)
+            return result
+        raise HookWorkerError("worker could not be started", delivered=False)
+
+    def _checkout(self, key: Tuple[str, ...], launch_args: List[str], name: str,
+                  creation_flags: int) -> Tuple[PersistentHookWorker, int]:
+        while True:
+            with self._lock:
+                generation = self._generation
+                idle = self._idle.get(key)
+                worker = idle.pop() if idle else None
+            if worker is None:
+                worker = PersistentHookWorker(launch_args, name, creation_flags)
+                worker.start()
+                return worker, generation
+            if not worker.is_alive():
+                log(f"Persistent '{name}' hook exited while idle, restarting", level="warning", category="hooks")
+                worker.stop()
+                continue
+            if time.monotonic() - worker.last_used > HEALTH_CHECK_IDLE_SECONDS and not worker.ping():
+                log(f"Persistent '{name}' hook failed health check, restarting", level="warning", category="hooks")
+                worker.stop()
+                continue
+            return worker, generation
+
+    def _checkin(self, key: Tuple[str, ...], worker: PersistentHookWorker, generation: int) -> None:
+        with self._lock:
+            if generation == self._generation and worker.is_alive():
+                self._idle.setdefault(key, []).append(worker)
+                return
+        worker.stop()
+
+    def idle_count(self) -> int:
+        with self._lock:
+            return sum(len(workers) for workers in self._idle.values())
+
+    def shutdown(self) -> None:
+        """Stop idle workers; busy ones stop when their job finishes."""
+        with self._lock:
+            self._generation += 1
+            workers = [w for idle in self._idle.values() for w in idle]
+            self._idle.clear()
+        for worker in workers:
+            worker.stop()
@@ -15,6 +15,7 @@ import os
 from typing import List, Dict, Callable, Optional, Any
 from PyQt6.QtCore import QObject, pyqtSignal
 from src.utils.logger import log
+from src.utils.tracing import traced
 
 
 def save_session_cookies_to_keyring(session_cookies):
@@ -122,9 +123,14 @@ class RenameWorker(QObject):
     STATUS_CHECK_MAX_SCAN_SIZE = 100 * 1024  # 100KB - scan limit for finding count
     STATUS_CHECK_MAX_MEMORY_SIZE = 50 * 1024 * 1024  # 50MB memory threshold
 
-    def __init__(self):
+    def __init__(self, web_url: str = "https://imx.to", authenticate: bool = True):
         """Initialize RenameWorker with own web session.
 
+        Args:
+            web_url: Base URL of the imx.to web interface
+            authenticate: Log in (and auto-rename unnamed galleries) in the background.
+                When False the session is used as-is, e.g. against a local mock server.
+
         Sets up:
         - Credential loading from keyring/QSettings
         - HTTP session with retry strategy
@@ -134,9 +140,9 @@ class RenameWorker(QObject):
         """
         super().__init__()
         # Import existing functions
-        from bbdrop import (get_config_path, decrypt_password, get_firefox_cookies,
-                          load_cookies_from_file, get_unnamed_galleries,
+        from bbdrop import (get_config_path, decrypt_password, get_unnamed_galleries,
                           remove_unnamed_gallery, sanitize_gallery_name, get_credential)
+        from src.network.cookies import get_firefox_cookies, load_cookies_from_file
 
         # Store references to these functions
         self._get_config_path = get_config_path
@@ -174,7 +180,7 @@ class RenameWorker(QObject):
         # Web session and credentials
         self.username = None
         self.password = None
-        self.web_url = "https://imx.to"
+        self.web_url = web_url.rstrip('/')
         self.session = None
 
         # Load credentials from QSettings (Registry)
@@ -215,7 +221,11 @@ class RenameWorker(QObject):
         self.status_check_thread.start()
 
         # Login and auto-rename in background
-        threading.Thread(target=self._initial_login, daemon=True).start()
+        if authenticate:
+            threading.Thread(target=self._initial_login, daemon=True).start()
+        else:
+            self.login_successful = True
+            self.login_complete.set()
 
     def _attempt_reauth_with_rate_limit(self) -> bool:
         """
@@ -459,6 +469,7 @@ class RenameWorker(QObject):
         return False
 
     # EXACT COPY of ImxToUploader.rename_gallery_with_session() - lines 1300-1365 from bbdrop.py
+    @traced("rename_gallery", category="rename")
     def rename_gallery_with_session(self, gallery_id, new_name, retry_on_auth_failure=True):
         """Rename gallery using existing session (will re-login on 403)"""
         log(f"RenameWorker (ID: {self._instance_id}) using session {id(self.session)} for rename of {gallery_id} ({new_name})", level="debug", category="renaming")
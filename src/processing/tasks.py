@@ -1,6 +1,6 @@
 """
 Background task management for BBDrop application.
-Handles async operations, progress batching, and table updates.
+Handles async operations, icon caching, and table updates.
 """
 
 import time
@@ -13,7 +13,7 @@ from PyQt6.QtCore import QObject, QRunnable, pyqtSignal, QTimer, QMutex, QMutexL
 from PyQt6.QtWidgets import QTableWidgetItem
 
 from src.core.constants import (
-    PROGRESS_UPDATE_BATCH_INTERVAL, TABLE_UPDATE_INTERVAL,
+    TABLE_UPDATE_INTERVAL,
     QUEUE_STATE_UPLOADING
 )
 
@@ -43,62 +43,6 @@ class BackgroundTask(QRunnable):
             self.signals.error.emit(str(e))
 
 
-class ProgressUpdateBatcher:
-    """Batches and throttles progress updates to prevent GUI blocking"""
-    
-    def __init__(self, update_callback: Callable, batch_interval: float = PROGRESS_UPDATE_BATCH_INTERVAL):
-        self._callback = update_callback
-        self._batch_interval = batch_interval
-        self._pending_updates: Dict[str, Dict[str, Any]] = {}
-        self._last_batch_time: float = 0
-        self._timer = QTimer()
-        self._timer.setSingleShot(True)
-        self._timer.timeout.connect(self._process_batch)
-    
-    def add_update(self, path: str, completed: int, total: int, progress_percent: int, current_image: str):
-        """Add a progress update to the batch"""
-        self._pending_updates[path] = {
-            'completed': completed,
-            'total': total,
-            'progress_percent': progress_percent,
-            'current_image': current_image,
-            'timestamp': time.time()
-        }
-        
-        # Schedule batch processing if not already scheduled
-        current_time = time.time()
-        if not self._timer.isActive():
-            if current_time - self._last_batch_time >= self._batch_interval:
-                self._process_batch()
-            else:
-                remaining_time = int((self._batch_interval - (current_time - self._last_batch_time)) * 1000)
-                self._timer.start(max(remaining_time, 10))
-    
-    def _process_batch(self):
-        """Process all pending updates"""
-        if not self._pending_updates:
-            return
-
-        updates_to_process = self._pending_updates.copy()
-        self._pending_updates.clear()
-        self._last_batch_time = time.time()
-
-        # Process updates on main thread
-        for path, update_data in updates_to_process.items():
-            self._callback(
-                path,
-                update_data['completed'],
-                update_data['total'],
-                update_data['progress_percent'],
-                update_data['current_image']
-            )
-
-    def cleanup(self):
-        """Stop timer and cleanup resources"""
-        if self._timer.isActive():
-            self._timer.stop()
-
-
 class IconCache:
     """Thread-safe icon cache to prevent blocking icon loads"""
     
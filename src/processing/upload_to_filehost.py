@@ -4,6 +4,8 @@ import tempfile
 import time
 from pathlib import Path
 
+from src.utils.archive_utils import get_archive_gallery_name, is_archive_gallery_path
+
 def zip_folder(folder_path, output_path=None, compression='store'):
     """
     Zip a folder, prioritizing speed over compression.
@@ -55,13 +57,18 @@ def create_temp_zip(folder_path):
     Uses store mode (no compression) for maximum speed.
 
     Args:
-        folder_path (str): Path to the folder to zip
+        folder_path (str): Path to the folder to zip, or a virtual archive gallery path
+            (its images are re-packed from the archive)
 
     Returns:
         str: Path to the created temporary zip file
     """
-    folder_path = Path(folder_path)
-    folder_name = folder_path.name
+    archive_gallery = is_archive_gallery_path(folder_path)
+    if archive_gallery:
+        folder_name = get_archive_gallery_name(folder_path)
+    else:
+        folder_path = Path(folder_path)
+        folder_name = folder_path.name
 
     # Create temp file with clean gallery name (no prefix - temp dir indicates it's temporary)
     temp_dir = tempfile.gettempdir()
@@ -75,4 +82,18 @@ def create_temp_zip(folder_path):
             # If we can't remove it, create a new unique name with timestamp
             temp_zip_path = os.path.join(temp_dir, f"{folder_name}_{int(time.time())}.zip")
 
-    return zip_folder(folder_path, temp_zip_path[:-4], compression='store')
\ No newline at end of file
+    if archive_gallery:
+        return _zip_archive_gallery(folder_path, folder_name, temp_zip_path)
+    return zip_folder(folder_path, temp_zip_path[:-4], compression='store')
+
+
+def _zip_archive_gallery(gallery_path, folder_name, output_path):
+    """Re-pack the images of an archive gallery into a store mode ZIP laid out like zip_folder's"""
+    from src.services.archive_source import ArchiveImageSource
+
+    with ArchiveImageSource.from_gallery_path(gallery_path) as source:
+        with zipfile.ZipFile(output_path, 'w', zipfile.ZIP_STORED) as zipf:
+            for name in sorted(source.list_images()):
+                zipf.writestr(f"{folder_name}/{name}", source.read(name))
+
+    return output_path
\ No newline at end of file
@@ -17,9 +17,11 @@ from bbdrop import (
 )
 from src.network.client import GUIImxToUploader
 from src.utils.logger import log
+from src.utils.progress_bus import BANDWIDTH_SOURCE_IMX, CHANNEL_BANDWIDTH, get_progress_bus
 from src.storage.queue_manager import GalleryQueueItem
 from src.core.engine import AtomicCounter
-from src.processing.hooks_executor import execute_gallery_hooks
+from src.core.adaptive_concurrency import create_concurrency_controller
+from src.processing.hooks_executor import execute_gallery_hooks, get_hook_scheduler
 
 # Import RenameWorker at module level for testing
 try:
@@ -36,7 +38,6 @@ class UploadWorker(QThread):
     """Worker thread for uploading galleries"""
 
     # Signals for communication with GUI
-    progress_updated = pyqtSignal(str, int, int, int, str)  # path, completed, total, progress%, current_image
     gallery_started = pyqtSignal(str, int)  # path, total_images
     gallery_completed = pyqtSignal(str, dict)  # path, results
     gallery_failed = pyqtSignal(str, str)  # path, error_message
@@ -45,7 +46,8 @@ class UploadWorker(QThread):
     ext_fields_updated = pyqtSignal(str, dict)  # path, ext_fields dict (for hook results)
     log_message = pyqtSignal(str)
     queue_stats = pyqtSignal(dict)  # aggregate status stats for GUI updates
-    bandwidth_updated = pyqtSignal(float)  # Instantaneous KB/s from pycurl progress callbacks
+    concurrency_changed = pyqtSignal(int, str)  # in-flight upload limit, reason for the last change
+    concurrency_learned = pyqtSignal(int)  # in-flight limit to start the next session from
 
     def __init__(self, queue_manager):
         """Initialize upload worker with queue manager"""
@@ -169,7 +171,7 @@ class UploadWorker(QThread):
                         time_diff = current_time - poll_last_time
                         if time_diff > 0:
                             instant_kbps = ((current_bytes - poll_last_bytes) / time_diff) / 1024.0
-                            self.bandwidth_updated.emit(instant_kbps)
+                            get_progress_bus().publish(CHANNEL_BANDWIDTH, BANDWIDTH_SOURCE_IMX, instant_kbps)
                             poll_last_bytes = current_bytes
                             poll_last_time = current_time
                 except Exception:
@@ -178,6 +180,7 @@ class UploadWorker(QThread):
         polling_thread = threading.Thread(target=poll_bandwidth, daemon=True, name="BandwidthPoller")
         polling_thread.start()
 
+        concurrency_controller = None
         try:
             # Check for soft-stop request BEFORE clearing
             soft_stop_requested = getattr(self, '_soft_stop_requested_for', None) == item.path
@@ -190,11 +193,15 @@ class UploadWorker(QThread):
 
             log(f"Starting upload: {item.name or os.path.basename(item.path)}", category="uploads", level="info")
 
+            # Resuming a gallery whose per-image data was released (completed
+            # then rescanned, or loaded from history) - restore it for resume and artifacts
+            self.queue_manager.load_uploaded_images(item.path)
+
             # Update status to uploading
             self.queue_manager.update_item_status(item.path, "uploading")
             item.start_time = time.time()
 
-            # Execute "started" hook in background
+            # Execute "started" hook in background (queued, bounded per hook type)
             def run_started_hook():
                 try:
                     ext_fields = execute_gallery_hooks(
@@ -215,7 +222,7 @@ class UploadWorker(QThread):
                 except Exception as e:
                     log(f"Error executing started hook: {e}", level="error", category="hooks")
 
-            threading.Thread(target=run_started_hook, daemon=True).start()
+            get_hook_scheduler().submit('started', run_started_hook)
 
             # Emit start signal
             self.gallery_started.emit(item.path, item.total_images or 0)
@@ -229,6 +236,14 @@ class UploadWorker(QThread):
             # Get upload settings
             defaults = load_user_defaults()
 
+            # Adaptive in-flight limit (None when disabled in Advanced settings)
+            concurrency_controller = create_concurrency_controller(
+                defaults.get('parallel_batch_size', 4),
+                on_change=lambda d: self.concurrency_changed.emit(d.new_limit, d.reason)
+            )
+            if concurrency_controller:
+                self.concurrency_changed.emit(concurrency_controller.limit, "starting limit")
+
             # Pass the item directly for precalculated dimensions (engine uses getattr on it)
             if item.scan_complete and (item.avg_width or item.avg_height):
                 log(f"Using precalculated dimensions for {item.name}: {item.avg_width}x{item.avg_height}", level="debug", category="uploads")
@@ -244,7 +259,8 @@ class UploadWorker(QThread):
                 template_name=item.template_name,
                 precalculated_dimensions=item,  # Pass item directly, engine extracts dimensions via getattr
                 global_byte_counter=self.global_byte_counter,
-                gallery_byte_counter=self.current_gallery_counter
+                gallery_byte_counter=self.current_gallery_counter,
+                concurrency_controller=concurrency_controller
             )
 
             # Handle paused state
@@ -287,6 +303,10 @@ class UploadWorker(QThread):
             stop_polling.set()
             polling_thread.join(timeout=0.5)
 
+            # Keep the chosen in-flight limit as the next starting point (saved on the GUI thread)
+            if concurrency_controller and concurrency_controller.limit != concurrency_controller.initial:
+                self.concurrency_learned.emit(concurrency_controller.limit)
+
             # Clear gallery counter
             self.current_gallery_counter = None
 
@@ -343,7 +363,7 @@ class UploadWorker(QThread):
             # Complete success
             self.queue_manager.update_item_status(item.path, "completed")
 
-            # Execute "completed" hook in background
+            # Execute "completed" hook in background (queued, bounded per hook type)
             def run_completed_hook():
                 try:
                     # Get artifact paths
@@ -380,7 +400,7 @@ class UploadWorker(QThread):
                 except Exception as e:
                     log(f"Error executing completed hook: {e}", level="error", category="hooks")
 
-            threading.Thread(target=run_completed_hook, daemon=True).start()
+            get_hook_scheduler().submit('completed', run_completed_hook)
 
         # Notify GUI
         self.gallery_completed.emit(item.path, results)
@@ -439,7 +459,7 @@ class UploadWorker(QThread):
                 bytes_diff = current_bytes - self._bw_last_bytes
                 if bytes_diff > 0:
                     instant_kbps = (bytes_diff / time_diff) / 1024.0
-                    self.bandwidth_updated.emit(instant_kbps)
+                    get_progress_bus().publish(CHANNEL_BANDWIDTH, BANDWIDTH_SOURCE_IMX, instant_kbps)
                     self._bw_last_emit = current_time
 
             # Update tracking
@@ -0,0 +1,299 @@
+"""
+Shared sequential reads of a gallery ZIP for several file hosts.
+
+When a gallery goes to several hosts, each FileHostWorker would otherwise open
+and read the same ZIP on its own, often far enough apart that the pages are
+evicted in between. A ZipFanOut reads the ZIP once, front to back, and copies
+each chunk into a small bounded ring buffer per host. Hosts read from their
+ring through a ZipStream (file-like, read-once).
+
+A host whose ring is full when the next chunk arrives is too slow to keep up.
+Instead of stalling the others, it is detached: it drains what is already in
+its ring and then continues from its own file handle. The shared reader only
+waits when every attached host is full.
+
+FileHostWorkerManager owns a ZipFanOutRegistry. The first worker to open a
+stream for a db_id starts a session that the other expected hosts join; the
+shared read starts once they all have joined or the join window has passed.
+Expected hosts that start uploading another gallery meanwhile are no longer
+waited for. Hosts arriving later read on their own.
+"""
+
+import threading
+import time
+from collections import deque
+from pathlib import Path
+from typing import Callable, Deque, Dict, Iterable, List, Optional
+
+from src.utils.logger import log
+
+FANOUT_CHUNK_SIZE = 1024 * 1024      # bytes per shared read
+FANOUT_RING_CHUNKS = 16              # ring buffer capacity per host (chunks)
+FANOUT_JOIN_WINDOW = 3.0             # seconds to wait for the other hosts to join
+FANOUT_RECHECK_INTERVAL = 0.1        # seconds between checks whether missing hosts are still coming
+
+
+class ZipStream:
+    """Read-once, sized view of a ZIP for one host.
+
+    Without a session it simply reads the file. With a session it reads the
+    host's ring buffer and switches to its own file handle if detached.
+    """
+
+    def __init__(self, path: Path, host: str, session: Optional["ZipFanOut"] = None):
+        self.path = Path(path)
+        self.host = host
+        self.size = self.path.stat().st_size
+        self._session = session
+        self._ring: Deque[bytes] = deque()
+        self._head_pos = 0
+        self._own_file = None
+        self._own_offset = 0 if session is None else None  # set when detached
+        self._closed = False
+        self.shared_bytes = 0   # bytes received through the ring
+        self.own_bytes = 0      # bytes this stream read from disk itself
+
+    def __len__(self) -> int:
+        return self.size
+
+    @property
+    def fell_back(self) -> bool:
+        """True if this stream was detached from the shared read."""
+        return self._session is not None and self._own_offset is not None
+
+    def read(self, size: int = -1) -> bytes:
+        if self._closed:
+            return b""
+        if self._session is not None:
+            data = self._session._read_ring(self, size)
+            if data is not None:
+                self.shared_bytes += len(data)
+                return data
+        return self._read_own(size)
+
+    def _read_own(self, size: int) -> bytes:
+        if self._own_offset is None:
+            return b""  # Shared read finished
+        if self._own_file is None:
+            self._own_file = open(self.path, 'rb')
+            self._own_file.seek(self._own_offset)
+        data = self._own_file.read(size)
+        self.own_bytes += len(data)
+        if self._session is not None:
+            self._session._count_own(len(data))
+        return data
+
+    def close(self) -> None:
+        if self._closed:
+            return
+        self._closed = True
+        if self._own_file is not None:
+            self._own_file.close()
+            self._own_file = None
+        if self._session is not None:
+            self._session._detach(self, closing=True)
+
+    def __enter__(self) -> "ZipStream":
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        self.close()
+
+
+class ZipFanOut:
+    """One shared sequential read of a ZIP, fanned out to per-host ring buffers."""
+
+    def __init__(self, zip_path: Path, expected_hosts: Iterable[str], chunk_size: int = FANOUT_CHUNK_SIZE,
+                 ring_chunks: int = FANOUT_RING_CHUNKS, join_window: float = FANOUT_JOIN_WINDOW,
+                 host_available: Optional[Callable[[str], bool]] = None):
+        """
+        Args:
+            zip_path: ZIP to read
+            expected_hosts: Hosts to wait for before the shared read starts
+            chunk_size: Bytes per shared read
+            ring_chunks: Ring buffer capacity per host (chunks)
+            join_window: Seconds to wait for the expected hosts
+            host_available: False for an expected host that can no longer join
+                soon (busy with another gallery); not waited for
+        """
+        self.zip_path = Path(zip_path)
+        self.expected_hosts = set(expected_hosts)
+        self.host_available = host_available
+        self.chunk_size = chunk_size
+        self.ring_chunks = max(1, ring_chunks)
+        self.join_window = join_window
+        self.created = time.monotonic()
+        self.started = False
+        self.shared_bytes_read = 0
+        self.own_bytes_read = 0
+        self._attached: List[ZipStream] = []
+        self._joined: set = set()
+        self._offset = 0
+        self._eof = False
+        self._error: Optional[Exception] = None
+        self._cond = threading.Condition()
+        self._thread = threading.Thread(target=self._run, daemon=True, name=f"zip-fanout-{self.zip_path.name}")
+
+    def start(self) -> None:
+        """Start the shared read (it waits for the expected hosts to join first)."""
+        self._thread.start()
+
+    @property
+    def bytes_read(self) -> int:
+        """Total bytes read from disk: the shared read plus detached hosts' own reads."""
+        with self._cond:
+            return self.shared_bytes_read + self.own_bytes_read
+
+    def join(self, host: str) -> Optional[ZipStream]:
+        """Open a stream for host, or None if the shared read has already started."""
+        with self._cond:
+            if self.started:
+                return None
+            stream = ZipStream(self.zip_path, host, self)
+            self._attached.append(stream)
+            self._joined.add(host)
+            self._cond.notify_all()
+            return stream
+
+    def wait_done(self, timeout: Optional[float] = None) -> bool:
+        """Wait for the shared read to finish; True if it has."""
+        if self._thread.ident is None:
+            return False
+        self._thread.join(timeout)
+        return not self._thread.is_alive()
+
+    def _still_coming(self) -> set:
+        """Expected hosts that have not joined and may still do so (lock held)."""
+        missing = self.expected_hosts - self._joined
+        if self.host_available is not None:
+            missing = {host for host in missing if self.host_available(host)}
+        return missing
+
+    def _wait_for_hosts(self) -> None:
+        deadline = self.created + self.join_window
+        with self._cond:
+            while self._still_coming():
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    break
+                if self.host_available is not None:
+                    remaining = min(remaining, FANOUT_RECHECK_INTERVAL)
+                self._cond.wait(remaining)
+            self.started = True
+            missing = self.expected_hosts - self._joined
+        if missing:
+            log(f"Shared read of {self.zip_path.name} starting without {', '.join(sorted(missing))}",
+                level="debug", category="file_hosts")
+
+    def _run(self) -> None:
+        self._wait_for_hosts()
+        try:
+            with open(self.zip_path, 'rb') as f:
+                while True:
+                    with self._cond:
+                        while self._attached and all(len(s._ring) >= self.ring_chunks for s in self._attached):
+                            self._cond.wait()
+                        if not self._attached:
+                            return
+                    chunk = f.read(self.chunk_size)
+                    with self._cond:
+                        self.shared_bytes_read += len(chunk)
+                        if not chunk:
+                            self._eof = True
+                            self._cond.notify_all()
+                            return
+                        for stream in list(self._attached):
+                            if len(stream._ring) >= self.ring_chunks:
+                                # Too slow to keep up: continue on its own from this chunk
+                                stream._own_offset = self._offset
+                                self._attached.remove(stream)
+                                log(f"{stream.host} fell behind the shared read of {self.zip_path.name} "
+                                    f"at {self._offset} bytes, reading on its own",
+                                    level="debug", category="file_hosts")
+                            else:
+                                stream._ring.append(chunk)
+                        self._offset += len(chunk)
+                        self._cond.notify_all()
+        except OSError as e:
+            with self._cond:
+                self._error = e
+                self._eof = True
+                self._cond.notify_all()
+
+    def _read_ring(self, stream: ZipStream, size: int) -> Optional[bytes]:
+        """Bytes from the stream's ring, b"" at end of file, None if it must read on its own."""
+        with self._cond:
+            while not stream._ring and not self._eof and stream in self._attached:
+                self._cond.wait()
+            if stream._ring:
+                head = stream._ring[0]
+                end = len(head) if size < 0 else min(len(head), stream._head_pos + size)
+                data = head[stream._head_pos:end]
+                stream._head_pos = end
+                if end >= len(head):
+                    stream._ring.popleft()
+                    stream._head_pos = 0
+                    self._cond.notify_all()
+                return data
+            if self._error is not None and stream in self._attached:
+                raise self._error
+            if stream in self._attached:
+                return b""
+            return None
+
+    def _count_own(self, nbytes: int) -> None:
+        with self._cond:
+            self.own_bytes_read += nbytes
+
+    def _detach(self, stream: ZipStream, closing: bool = False) -> None:
+        with self._cond:
+            if stream in self._attached:
+                self._attached.remove(stream)
+            if closing:
+                stream._ring.clear()
+            self._cond.notify_all()
+
+
+class ZipFanOutRegistry:
+    """Fan-out sessions by gallery, open for joining until their shared read starts."""
+
+    def __init__(self, chunk_size: int = FANOUT_CHUNK_SIZE, ring_chunks: int = FANOUT_RING_CHUNKS,
+                 join_window: float = FANOUT_JOIN_WINDOW):
+        self.chunk_size = chunk_size
+        self.ring_chunks = ring_chunks
+        self.join_window = join_window
+        self._sessions: Dict[int, ZipFanOut] = {}
+        self._lock = threading.Lock()
+
+    def open_stream(self, db_id: int, host: str, zip_path: Path, expected_hosts: Iterable[str],
+                    host_available: Optional[Callable[[str], bool]] = None) -> ZipStream:
+        """Stream of zip_path for host, shared with the other expected hosts where possible.
+
+        Args:
+            db_id: Gallery database ID the ZIP belongs to
+            host: Host opening the stream
+            zip_path: ZIP to read
+            expected_hosts: All hosts about to upload this ZIP (including host)
+            host_available: See ZipFanOut
+        """
+        expected = set(expected_hosts) | {host}
+        if len(expected) < 2:
+            return ZipStream(zip_path, host)
+        with self._lock:
+            for done in [key for key, s in self._sessions.items() if key != db_id and s.wait_done(0)]:
+                del self._sessions[done]
+            session = self._sessions.get(db_id)
+            if session is not None and session.zip_path == Path(zip_path) and not session.wait_done(0):
+                # Join the session, or read alone if its shared read is already under way
+                return session.join(host) or ZipStream(zip_path, host)
+            session = ZipFanOut(zip_path, expected, self.chunk_size, self.ring_chunks, self.join_window,
+                                host_available)
+            self._sessions[db_id] = session
+            stream = session.join(host)
+            session.start()
+            return stream
+
+    def session(self, db_id: int) -> Optional[ZipFanOut]:
+        """Current fan-out session for a gallery, if any."""
+        with self._lock:
+            return self._sessions.get(db_id)
@@ -0,0 +1,172 @@
+#!/usr/bin/env python3
+"""
+Parallel archive extraction
+Extracts ZIP members with a bounded thread pool and reports each gallery
+folder as soon as all of its files are on disk
+"""
+
+import os
+import shutil
+import sys
+import threading
+import zipfile
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from pathlib import Path
+from typing import Callable, Iterable, Optional
+
+# Copy buffer for member extraction (zipfile.extractall uses 8 KiB)
+EXTRACT_BUFFER_SIZE = 1024 * 1024
+
+# Default number of members extracted concurrently
+DEFAULT_EXTRACT_WORKERS = 4
+
+FolderReadyCallback = Callable[[Path], None]
+ProgressCallback = Callable[[int, int], None]
+
+_WINDOWS_ILLEGAL_CHARS = str.maketrans({c: '_' for c in ':<>|"?*'})
+
+
+def _member_dir(info: zipfile.ZipInfo) -> str:
+    """Directory of a ZIP member ('' for the archive root)"""
+    name = info.filename.replace('\\', '/')
+    return name.rsplit('/', 1)[0] if '/' in name else ''
+
+
+def list_archive_folders(archive_path: str | Path) -> Optional[list[str]]:
+    """List directories inside an archive that directly contain files
+
+    Reads only the central directory, nothing is extracted.
+
+    Args:
+        archive_path: Path to archive file
+
+    Returns:
+        Sorted list of inner directories ('' for the archive root),
+        or None if the archive cannot be read
+    """
+    try:
+        with zipfile.ZipFile(archive_path, 'r') as archive:
+            return sorted({_member_dir(info) for info in archive.infolist() if not info.is_dir()})
+    except (OSError, zipfile.BadZipFile):
+        return None
+
+
+class ParallelArchiveExtractor:
+    """Extract archive members concurrently into a destination directory"""
+
+    def __init__(self, archive_path: str | Path, dest_dir: str | Path,
+                 max_workers: int = DEFAULT_EXTRACT_WORKERS,
+                 buffer_size: int = EXTRACT_BUFFER_SIZE):
+        """Initialize extractor
+
+        Args:
+            archive_path: Path to archive file
+            dest_dir: Directory to extract into (must exist)
+            max_workers: Number of members extracted concurrently
+            buffer_size: Copy buffer size in bytes
+        """
+        self.archive_path = str(archive_path)
+        self.dest_dir = Path(dest_dir)
+        self.max_workers = max(1, int(max_workers))
+        self.buffer_size = buffer_size
+        self._local = threading.local()
+        self._archives: list[zipfile.ZipFile] = []
+        self._lock = threading.Lock()
+
+    def extract(self, folders: Optional[Iterable[str]] = None,
+                on_folder_ready: Optional[FolderReadyCallback] = None,
+                on_progress: Optional[ProgressCallback] = None) -> list[Path]:
+        """Extract members and report completed folders
+
+        Args:
+            folders: Inner directories to extract (None = whole archive)
+            on_folder_ready: Called with each folder path once all its files are written
+            on_progress: Called with (bytes_written, bytes_total) after each member
+
+        Returns:
+            List of extracted folder paths in completion order
+
+        Raises:
+            OSError, zipfile.BadZipFile: If a member cannot be extracted
+        """
+        wanted = None if folders is None else set(folders)
+        with zipfile.ZipFile(self.archive_path, 'r') as archive:
+            members = [
+                info for info in archive.infolist()
+                if not info.is_dir() and (wanted is None or _member_dir(info) in wanted)
+            ]
+
+        targets = {}
+        pending: dict[Path, int] = {}
+        for info in members:
+            target = self._target_path(info)
+            if target is None:
+                continue
+            targets[info.filename] = target
+            pending[target.parent] = pending.get(target.parent, 0) + 1
+        # Extract folder by folder so the first galleries complete early
+        members = sorted((m for m in members if m.filename in targets),
+                         key=lambda m: (str(targets[m.filename].parent), m.filename))
+
+        bytes_total = sum(info.file_size for info in members)
+        bytes_done = 0
+        ready: list[Path] = []
+        try:
+            with ThreadPoolExecutor(max_workers=self.max_workers) as pool:
+                futures = {
+                    pool.submit(self._extract_member, info, targets[info.filename]): info
+                    for info in members
+                }
+                try:
+                    for future in as_completed(futures):
+                        future.result()
+                        info = futures[future]
+                        bytes_done += info.file_size
+                        if on_progress:
+                            on_progress(bytes_done, bytes_total)
+                        folder = targets[info.filename].parent
+                        pending[folder] -= 1
+                        if pending[folder] == 0:
+                            ready.append(folder)
+                            if on_folder_ready:
+                                on_folder_ready(folder)
+                except BaseException:
+                    for future in futures:
+                        future.cancel()
+                    raise
+        finally:
+            self._close_archives()
+        return ready
+
+    def _target_path(self, info: zipfile.ZipInfo) -> Optional[Path]:
+        """Safe destination path for a member (None for unusable names)"""
+        name = os.path.splitdrive(info.filename.replace('\\', '/'))[1]
+        parts = [p for p in name.split('/') if p not in ('', '.', '..')]
+        if sys.platform == 'win32':
+            parts = [p.translate(_WINDOWS_ILLEGAL_CHARS).rstrip('. ') for p in parts]
+            parts = [p for p in parts if p]
+        if not parts:
+            return None
+        return self.dest_dir.joinpath(*parts)
+
+    def _thread_archive(self) -> zipfile.ZipFile:
+        """Per-thread ZipFile so reads and decompression run in parallel"""
+        archive = getattr(self._local, 'archive', None)
+        if archive is None:
+            archive = zipfile.ZipFile(self.archive_path, 'r')
+            self._local.archive = archive
+            with self._lock:
+                self._archives.append(archive)
+        return archive
+
+    def _extract_member(self, info: zipfile.ZipInfo, target: Path) -> None:
+        """Write one member to disk with a large copy buffer"""
+        target.parent.mkdir(parents=True, exist_ok=True)
+        with self._thread_archive().open(info) as src, open(target, 'wb') as dst:
+            shutil.copyfileobj(src, dst, self.buffer_size)
+
+    def _close_archives(self) -> None:
+        with self._lock:
+            archives, self._archives = self._archives, []
+        for archive in archives:
+            archive.close()
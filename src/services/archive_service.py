@@ -5,10 +5,17 @@ Handles extracting archives and cleaning up temp directories
 """
 
 import shutil
-import zipfile
 from pathlib import Path
-from typing import Optional
-
+from typing import Iterable, Optional
+
+from src.services.archive_extractor import (
+    DEFAULT_EXTRACT_WORKERS,
+    FolderReadyCallback,
+    ProgressCallback,
+    ParallelArchiveExtractor,
+    list_archive_folders,
+)
+from src.services.archive_source import list_archive_galleries
 from src.utils.archive_utils import (
     is_valid_archive,
     validate_temp_extraction_path,
@@ -19,20 +26,31 @@ from src.utils.archive_utils import (
 class ArchiveService:
     """Service for extracting archives and managing temp directories"""
 
-    def __init__(self, base_temp_dir: str | Path):
+    def __init__(self, base_temp_dir: str | Path, max_workers: int = DEFAULT_EXTRACT_WORKERS):
         """Initialize with base temporary directory
 
         Args:
             base_temp_dir: Base directory for temp extractions (e.g., ~/.bbdrop/temp)
+            max_workers: Number of archive members extracted concurrently
         """
         self.base_temp_dir = Path(base_temp_dir)
         self.base_temp_dir.mkdir(parents=True, exist_ok=True)
+        self.max_workers = max_workers
 
-    def extract_archive(self, archive_path: str | Path) -> Optional[Path]:
+    def extract_archive(self, archive_path: str | Path,
+                        folders: Optional[Iterable[str]] = None,
+                        on_folder_ready: Optional[FolderReadyCallback] = None,
+                        on_progress: Optional[ProgressCallback] = None) -> Optional[Path]:
         """Extract archive to temp directory
 
+        Members are extracted in parallel; each folder is reported through
+        on_folder_ready as soon as all of its files are written.
+
         Args:
             archive_path: Path to archive file
+            folders: Inner directories to extract (None = whole archive)
+            on_folder_ready: Called with each completed folder path
+            on_progress: Called with (bytes_written, bytes_total)
 
         Returns:
             Path to extraction directory, or None if extraction failed
@@ -48,9 +66,8 @@ class ArchiveService:
             temp_dir.mkdir(parents=True, exist_ok=True)
 
             # Extract ZIP archive (works for both .zip and .cbz)
-            archive_path = Path(archive_path)
-            with zipfile.ZipFile(archive_path, 'r') as archive:
-                archive.extractall(path=temp_dir)
+            extractor = ParallelArchiveExtractor(archive_path, temp_dir, max_workers=self.max_workers)
+            extractor.extract(folders, on_folder_ready=on_folder_ready, on_progress=on_progress)
 
             return temp_dir
 
@@ -59,6 +76,37 @@ class ArchiveService:
             self.cleanup_temp_dir(temp_dir)
             return None
 
+    def list_archive_folders(self, archive_path: str | Path) -> Optional[list[str]]:
+        """List inner directories with files without extracting
+
+        Args:
+            archive_path: Path to archive file
+
+        Returns:
+            Sorted inner directories ('' for the archive root), or None if
+            the archive is invalid
+        """
+        if not is_valid_archive(archive_path):
+            return None
+        return list_archive_folders(archive_path)
+
+    def list_archive_galleries(self, archive_path: str | Path) -> Optional[list[Path]]:
+        """List image folders inside an archive without extracting it
+
+        Args:
+            archive_path: Path to archive file
+
+        Returns:
+            List of virtual archive gallery paths, or None if the archive
+            must be extracted (invalid, encrypted or unsupported compression)
+        """
+        if not is_valid_archive(archive_path):
+            return None
+        galleries = list_archive_galleries(archive_path)
+        if galleries is None:
+            return None
+        return [Path(gallery) for gallery in galleries]
+
     def get_folders(self, temp_dir: Path) -> list[Path]:
         """Find folders with files in extracted directory
 
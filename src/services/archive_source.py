@@ -0,0 +1,190 @@
+#!/usr/bin/env python3
+"""
+Read gallery images directly from ZIP/CBZ archives
+Lets the upload pipeline stream members from an archive instead of
+extracting the whole archive to a temp directory first
+"""
+
+import struct
+import threading
+import zipfile
+from pathlib import Path
+from typing import BinaryIO, Optional
+
+from src.core.constants import IMAGE_EXTENSIONS
+from src.utils.archive_utils import (
+    make_archive_gallery_path,
+    split_archive_gallery_path,
+)
+
+# Compression methods zipfile can decode without optional modules
+_SUPPORTED_COMPRESSION = {zipfile.ZIP_STORED, zipfile.ZIP_DEFLATED}
+
+# Metadata folders created by archivers that never hold gallery images
+_IGNORED_DIRS = ('__MACOSX/',)
+
+
+def _is_image_member(info: zipfile.ZipInfo) -> bool:
+    """Check if a ZIP member is an image file (not a directory or metadata)"""
+    if info.is_dir() or info.filename.startswith(_IGNORED_DIRS):
+        return False
+    name = info.filename.rsplit('/', 1)[-1]
+    return not name.startswith('._') and name.lower().endswith(IMAGE_EXTENSIONS)
+
+
+def _member_dir(info: zipfile.ZipInfo) -> str:
+    """Directory of a ZIP member ('' for the archive root)"""
+    return info.filename.rsplit('/', 1)[0] if '/' in info.filename else ''
+
+
+def _is_streamable_member(info: zipfile.ZipInfo) -> bool:
+    """Check if a member can be read without extraction"""
+    encrypted = bool(info.flag_bits & 0x1)
+    return not encrypted and info.compress_type in _SUPPORTED_COMPRESSION
+
+
+def list_archive_galleries(archive_path: str | Path) -> Optional[list[str]]:
+    """List galleries inside an archive as virtual gallery paths
+
+    A gallery is any directory that directly contains image members.
+
+    Args:
+        archive_path: Path to archive file
+
+    Returns:
+        Sorted list of virtual gallery paths, or None if the archive cannot be
+        streamed (unreadable, encrypted or unsupported compression)
+    """
+    try:
+        with zipfile.ZipFile(archive_path, 'r') as archive:
+            gallery_dirs = set()
+            for info in archive.infolist():
+                if not _is_image_member(info):
+                    continue
+                if not _is_streamable_member(info):
+                    return None
+                gallery_dirs.add(_member_dir(info))
+    except (OSError, zipfile.BadZipFile):
+        return None
+    return [make_archive_gallery_path(archive_path, d) for d in sorted(gallery_dirs)]
+
+
+class ArchiveImageSource:
+    """Image files of one gallery directory inside a ZIP archive
+
+    Stored (uncompressed) members - the common case for image archives - are
+    read straight from their data offset with a per-thread file handle, so
+    concurrent upload threads don't serialize on the ZipFile lock.
+    Compressed members are decoded through zipfile.
+    """
+
+    def __init__(self, archive_path: str | Path, inner_dir: str = ''):
+        """Open archive and index images in the given directory
+
+        Args:
+            archive_path: Path to archive file
+            inner_dir: Directory inside the archive ('' for the archive root)
+
+        Raises:
+            OSError: If archive cannot be opened
+            zipfile.BadZipFile: If archive is not a valid ZIP file
+        """
+        self.archive_path = str(archive_path)
+        self.inner_dir = inner_dir.replace('\\', '/').strip('/')
+        self._zip = zipfile.ZipFile(self.archive_path, 'r')
+        self._members: dict[str, zipfile.ZipInfo] = {}
+        for info in self._zip.infolist():
+            if _is_image_member(info) and _member_dir(info) == self.inner_dir:
+                self._members[info.filename.rsplit('/', 1)[-1]] = info
+        self._data_offsets: dict[str, int] = {}
+        self._local = threading.local()
+        self._handles: list[BinaryIO] = []
+        self._lock = threading.Lock()
+
+    @classmethod
+    def from_gallery_path(cls, gallery_path: str) -> 'ArchiveImageSource':
+        """Open the source for a virtual archive gallery path"""
+        archive_path, inner_dir = split_archive_gallery_path(gallery_path)
+        return cls(archive_path, inner_dir)
+
+    def list_images(self) -> list[str]:
+        """Image file names in this gallery (unsorted)"""
+        return list(self._members)
+
+    def get_size(self, name: str) -> int:
+        """Uncompressed size of an image in bytes"""
+        return self._members[name].file_size
+
+    def is_streamable(self) -> bool:
+        """Check that all images can be read without extraction"""
+        return all(_is_streamable_member(info) for info in self._members.values())
+
+    def read(self, name: str) -> bytes:
+        """Read an image fully into memory
+
+        Args:
+            name: Image file name as returned by list_images()
+
+        Returns:
+            Image bytes
+
+        Raises:
+            KeyError: If the image is not part of this gallery
+        """
+        info = self._members[name]
+        if info.compress_type != zipfile.ZIP_STORED or info.flag_bits & 0x1:
+            return self._zip.read(info)
+        handle = self._thread_handle()
+        handle.seek(self._data_offset(info, handle))
+        data = handle.read(info.file_size)
+        if len(data) != info.file_size:
+            raise OSError(f"Truncated archive member: {info.filename}")
+        return data
+
+    def open(self, name: str) -> BinaryIO:
+        """Open an image as a binary stream (for header checks and PIL)"""
+        return self._zip.open(self._members[name])
+
+    def _thread_handle(self) -> BinaryIO:
+        """Get or open the raw archive handle for the current thread"""
+        handle = getattr(self._local, 'handle', None)
+        if handle is None:
+            handle = open(self.archive_path, 'rb')
+            self._local.handle = handle
+            with self._lock:
+                self._handles.append(handle)
+        return handle
+
+    def _data_offset(self, info: zipfile.ZipInfo, handle: BinaryIO) -> int:
+        """Offset of a member's data, parsed from its local file header"""
+        offset = self._data_offsets.get(info.filename)
+        if offset is None:
+            handle.seek(info.header_offset)
+            header = handle.read(zipfile.sizeFileHeader)
+            if len(header) != zipfile.sizeFileHeader:
+                raise OSError(f"Truncated archive header: {info.filename}")
+            fields = struct.unpack(zipfile.structFileHeader, header)
+            if fields[zipfile._FH_SIGNATURE] != zipfile.stringFileHeader:
+                raise zipfile.BadZipFile(f"Bad local header: {info.filename}")
+            offset = (info.header_offset + zipfile.sizeFileHeader
+                      + fields[zipfile._FH_FILENAME_LENGTH]
+                      + fields[zipfile._FH_EXTRA_FIELD_LENGTH])
+            self._data_offsets[info.filename] = offset
+        return offset
+
+    def close(self) -> None:
+        """Close the archive and all per-thread handles"""
+        with self._lock:
+            handles, self._handles = self._handles, []
+        for handle in handles:
+            try:
+                handle.close()
+            except OSError:
+                pass
+        self._zip.close()
+
+    def __enter__(self) -> 'ArchiveImageSource':
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        self.close()
@@ -0,0 +1,295 @@
+"""
+Persistent index of saved gallery artifacts.
+
+Previously every dropped folder triggered a glob over the central artifact
+directory. The index keeps one row per saved JSON artifact (gallery name,
+gallery ID, content fingerprint, paths, modification time) in the
+``artifact_index`` table so that a whole batch of dropped folders is checked
+with a single query, and artifacts are found by gallery ID without scanning
+directories (see src.utils.artifact_finder).
+
+The content fingerprint is a hash over the sorted (file name, size) pairs of
+a gallery's images, which also matches folders that were renamed after upload.
+"""
+
+from __future__ import annotations
+
+import glob
+import hashlib
+import json
+import os
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+from src.core.constants import IMAGE_EXTENSIONS
+from src.utils.logger import log
+
+
+def compute_fingerprint(entries: Iterable[Tuple[str, int]]) -> Optional[str]:
+    """Hash sorted (file name, size) pairs into a content fingerprint.
+
+    File names are compared case-insensitively so the fingerprint of a folder
+    on disk matches the normalized names stored in JSON artifacts.
+
+    Returns:
+        Hex digest, or None when there are no entries
+    """
+    normalized = sorted(
+        (os.path.basename(str(name)).lower(), int(size or 0))
+        for name, size in entries
+        if name
+    )
+    if not normalized:
+        return None
+    digest = hashlib.sha1()
+    for name, size in normalized:
+        digest.update(f"{name}\0{size}\n".encode('utf-8', errors='surrogateescape'))
+    return digest.hexdigest()
+
+
+def compute_folder_fingerprint(folder_path: str) -> Optional[str]:
+    """Fingerprint the image files directly inside a folder."""
+    entries = []
+    try:
+        with os.scandir(folder_path) as it:
+            for entry in it:
+                if not entry.name.lower().endswith(IMAGE_EXTENSIONS):
+                    continue
+                try:
+                    if entry.is_file():
+                        entries.append((entry.name, entry.stat().st_size))
+                except OSError:
+                    continue
+    except OSError:
+        return None
+    return compute_fingerprint(entries)
+
+
+def fingerprint_from_images(images: Iterable[Dict[str, Any]]) -> Optional[str]:
+    """Fingerprint the 'images' list of an upload result or JSON artifact."""
+    entries = []
+    for img in images or []:
+        if not isinstance(img, dict):
+            continue
+        name = img.get('original_filename')
+        if name:
+            entries.append((name, img.get('size_bytes', 0)))
+    return compute_fingerprint(entries)
+
+
+def _mtime(path: str) -> Optional[float]:
+    try:
+        return os.stat(path).st_mtime
+    except OSError:
+        return None
+
+
+def record_saved_artifacts(
+    folder_path: str,
+    gallery_id: str,
+    gallery_name: str,
+    written_paths: Dict[str, Dict[str, str]],
+    images: Optional[Iterable[Dict[str, Any]]] = None,
+    store=None,
+) -> int:
+    """Add freshly written artifacts to the index.
+
+    Args:
+        folder_path: Source image folder (used for the content fingerprint)
+        gallery_id: imx.to gallery ID
+        gallery_name: Gallery name used in the artifact filenames
+        written_paths: Return value of save_gallery_artifacts
+        images: Fallback for the fingerprint when the folder is gone
+        store: Optional QueueStore instance
+
+    Returns:
+        Number of index rows written
+    """
+    if not written_paths:
+        return 0
+    fingerprint = None
+    if folder_path and os.path.isdir(folder_path):
+        fingerprint = compute_folder_fingerprint(folder_path)
+    if fingerprint is None and images is not None:
+        fingerprint = fingerprint_from_images(images)
+
+    entries = []
+    for location, paths in written_paths.items():
+        if not isinstance(paths, dict) or not paths.get('json'):
+            continue
+        entries.append({
+            'gallery_id': gallery_id,
+            'gallery_name': gallery_name,
+            'fingerprint': fingerprint,
+            'json_path': paths['json'],
+            'bbcode_path': paths.get('bbcode'),
+            'location': location,
+            'json_mtime': _mtime(paths['json']),
+        })
+    if not entries:
+        return 0
+
+    if store is None:
+        from src.storage.database import QueueStore
+        store = QueueStore()
+    return store.index_gallery_artifacts(entries)
+
+
+def _read_artifact_entry(json_path: str, location: str = 'central') -> Optional[Dict[str, Any]]:
+    """Build an index entry from an existing JSON artifact file."""
+    try:
+        with open(json_path, 'r', encoding='utf-8') as f:
+            payload = json.load(f)
+    except (OSError, ValueError):
+        return None
+    meta = payload.get('meta', {}) if isinstance(payload, dict) else {}
+    gallery_id = meta.get('gallery_id')
+    gallery_name = meta.get('gallery_name')
+    if not gallery_id or not gallery_name:
+        return None
+    bbcode_path = os.path.join(
+        os.path.dirname(json_path), f"{gallery_name}_{gallery_id}_bbcode.txt"
+    )
+    return {
+        'gallery_id': gallery_id,
+        'gallery_name': gallery_name,
+        'fingerprint': fingerprint_from_images(payload.get('images', [])),
+        'json_path': json_path,
+        'bbcode_path': bbcode_path if os.path.exists(bbcode_path) else None,
+        'location': location,
+        'json_mtime': _mtime(json_path),
+    }
+
+
+def index_artifact_files(json_paths: Iterable[str], location: str, store=None) -> int:
+    """Add existing JSON artifact files (found outside the index) to the index."""
+    entries = [e for e in (_read_artifact_entry(p, location) for p in json_paths) if e]
+    if not entries:
+        return 0
+    if store is None:
+        from src.storage.database import QueueStore
+        store = QueueStore()
+    return store.index_gallery_artifacts(entries)
+
+
+def backfill_artifact_index(store=None, central_path: Optional[str] = None, force: bool = False) -> int:
+    """Import artifacts already in the central store into the index (one-time).
+
+    Args:
+        store: Optional QueueStore instance
+        central_path: Central galleries directory; defaults to the configured one
+        force: Re-run even if the backfill has already completed
+
+    Returns:
+        Number of artifacts indexed
+    """
+    if store is None:
+        from src.storage.database import QueueStore
+        store = QueueStore()
+    if not force and store.is_artifact_index_backfilled():
+        return 0
+    if central_path is None:
+        from bbdrop import get_central_storage_path
+        central_path = get_central_storage_path()
+
+    entries = []
+    if os.path.isdir(central_path):
+        for json_path in glob.glob(os.path.join(glob.escape(central_path), "*.json")):
+            entry = _read_artifact_entry(json_path)
+            if entry:
+                entries.append(entry)
+
+    indexed = store.index_gallery_artifacts(entries) if entries else 0
+    store.mark_artifact_index_backfilled()
+    log(f"Artifact index backfill complete: {indexed} artifacts indexed from {central_path}",
+        level="info", category="database")
+    return indexed
+
+
+def find_artifacts_by_gallery_ids(gallery_ids: Iterable[str], store=None) -> Dict[str, List[Dict[str, Any]]]:
+    """Find indexed artifacts for many gallery IDs in one batch query.
+
+    Each candidate is checked with a stat: rows for deleted files are removed
+    from the index and changed modification times are written back.
+
+    Args:
+        gallery_ids: imx.to gallery IDs
+        store: Optional QueueStore instance
+
+    Returns:
+        Dict mapping gallery ID -> artifact dicts ('json_path', 'bbcode_path',
+        'location', 'json_mtime'), newest first. IDs without artifacts are omitted.
+    """
+    gallery_ids = [g for g in gallery_ids if g]
+    if not gallery_ids:
+        return {}
+    if store is None:
+        from src.storage.database import QueueStore
+        store = QueueStore()
+    backfill_artifact_index(store)
+
+    removed: List[str] = []
+    changed: Dict[str, float] = {}
+    results: Dict[str, List[Dict[str, Any]]] = {}
+    for gallery_id, artifacts in store.get_artifacts_by_gallery_ids(gallery_ids).items():
+        present = []
+        for artifact in artifacts:
+            mtime = _mtime(artifact['json_path'])
+            if mtime is None:
+                removed.append(artifact['json_path'])
+                continue
+            if mtime != artifact['json_mtime']:
+                changed[artifact['json_path']] = mtime
+                artifact['json_mtime'] = mtime
+            present.append(artifact)
+        if present:
+            present.sort(key=lambda a: a['json_mtime'], reverse=True)
+            results[gallery_id] = present
+    if removed or changed:
+        store.refresh_artifact_index(removed, changed)
+    return results
+
+
+def find_previously_uploaded(folder_paths: Iterable[str], store=None) -> Dict[str, List[str]]:
+    """Find artifacts of earlier uploads for many folders in one batch query.
+
+    A folder matches when an artifact exists for its name, or for a gallery
+    with the same content fingerprint (catches renamed folders).
+
+    Args:
+        folder_paths: Folder paths about to be added
+        store: Optional QueueStore instance
+
+    Returns:
+        Dict mapping folder path -> list of existing artifact paths.
+        Folders without matches are omitted.
+    """
+    folder_paths = list(folder_paths)
+    if not folder_paths:
+        return {}
+    if store is None:
+        from src.storage.database import QueueStore
+        store = QueueStore()
+    backfill_artifact_index(store)
+
+    names: Dict[str, str] = {}
+    fingerprints: Dict[str, Optional[str]] = {}
+    for path in folder_paths:
+        names[path] = os.path.basename(os.path.normpath(path))
+        fingerprints[path] = compute_folder_fingerprint(path)
+
+    by_name, by_fingerprint = store.find_existing_artifacts(
+        names.values(), [f for f in fingerprints.values() if f]
+    )
+
+    results: Dict[str, List[str]] = {}
+    for path in folder_paths:
+        matches = list(by_name.get(names[path], []))
+        fingerprint = fingerprints[path]
+        if fingerprint:
+            matches.extend(by_fingerprint.get(fingerprint, []))
+        # Preserve order, drop duplicates from name + fingerprint hits and
+        # artifacts that were deleted since they were indexed
+        matches = [m for m in dict.fromkeys(matches) if os.path.exists(m)]
+        if matches:
+            results[path] = matches
+    return results
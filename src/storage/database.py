@@ -14,6 +14,7 @@ from __future__ import annotations
 
 import os
 import sqlite3
+import sys
 import threading
 import time
 from concurrent.futures import ThreadPoolExecutor
@@ -43,6 +44,84 @@ def _connect(db_path: Optional[str] = None) -> sqlite3.Connection:
     return conn
 
 
+# Settings key recording the one-time artifact index import (v2 adds modification times)
+ARTIFACT_INDEX_BACKFILL_KEY = "artifact_index_backfilled_v2"
+
+# Settings key holding upload totals imported from the legacy QSettings counters
+STATS_BASELINE_KEY = "stats_legacy_baseline_v1"
+
+# Bytes counted for a completed gallery: uploaded bytes, or its size if they were not tracked
+_GALLERY_BYTES_SQL = "CASE WHEN {t}.uploaded_bytes > 0 THEN {t}.uploaded_bytes ELSE COALESCE({t}.total_size, 0) END"
+
+# Trigger bodies adding a finished gallery or file host upload to its rollup
+_GALLERY_ROLLUP_SQL = f"""
+        INSERT INTO stats_gallery_daily(day, tab_id, template, galleries, images, bytes)
+        VALUES (date(COALESCE(NEW.finished_ts, strftime('%s', 'now')), 'unixepoch', 'localtime'),
+                COALESCE(NEW.tab_id, 0), COALESCE(NEW.template, ''), 1,
+                COALESCE(NEW.uploaded_images, 0), {_GALLERY_BYTES_SQL.format(t='NEW')})
+        ON CONFLICT(day, tab_id, template) DO UPDATE SET
+            galleries = galleries + 1, images = images + excluded.images, bytes = bytes + excluded.bytes;"""
+
+_HOST_ROLLUP_SQL = """
+        INSERT INTO stats_host_daily(day, host_name, files, failed, bytes)
+        VALUES (date(COALESCE(NEW.finished_ts, strftime('%s', 'now')), 'unixepoch', 'localtime'),
+                NEW.host_name,
+                NEW.status = 'completed', NEW.status = 'failed',
+                CASE WHEN NEW.status = 'completed' THEN COALESCE(NEW.total_bytes, 0) ELSE 0 END)
+        ON CONFLICT(day, host_name) DO UPDATE SET
+            files = files + excluded.files, failed = failed + excluded.failed, bytes = bytes + excluded.bytes;"""
+
+# Rollup tables for the statistics dialog, kept up to date by triggers.
+# Completed galleries are counted per (day, tab, template) and file host
+# uploads per (day, host) at the moment they finish, so totals survive
+# galleries being cleared from the queue and never need a table scan.
+_STATS_ROLLUP_SCHEMA = f"""
+    CREATE TABLE IF NOT EXISTS stats_gallery_daily (
+        day TEXT NOT NULL,
+        tab_id INTEGER NOT NULL DEFAULT 0,
+        template TEXT NOT NULL DEFAULT '',
+        galleries INTEGER NOT NULL DEFAULT 0,
+        images INTEGER NOT NULL DEFAULT 0,
+        bytes INTEGER NOT NULL DEFAULT 0,
+        PRIMARY KEY (day, tab_id, template)
+    );
+
+    CREATE TABLE IF NOT EXISTS stats_host_daily (
+        day TEXT NOT NULL,
+        host_name TEXT NOT NULL,
+        files INTEGER NOT NULL DEFAULT 0,
+        failed INTEGER NOT NULL DEFAULT 0,
+        bytes INTEGER NOT NULL DEFAULT 0,
+        PRIMARY KEY (day, host_name)
+    );
+
+    CREATE TRIGGER IF NOT EXISTS stats_gallery_completed_insert
+    AFTER INSERT ON galleries WHEN NEW.status = 'completed'
+    BEGIN
+        {_GALLERY_ROLLUP_SQL}
+    END;
+
+    CREATE TRIGGER IF NOT EXISTS stats_gallery_completed_update
+    AFTER UPDATE OF status ON galleries WHEN NEW.status = 'completed' AND OLD.status <> 'completed'
+    BEGIN
+        {_GALLERY_ROLLUP_SQL}
+    END;
+
+    CREATE TRIGGER IF NOT EXISTS stats_host_upload_finished_insert
+    AFTER INSERT ON file_host_uploads WHEN NEW.status IN ('completed', 'failed')
+    BEGIN
+        {_HOST_ROLLUP_SQL}
+    END;
+
+    CREATE TRIGGER IF NOT EXISTS stats_host_upload_finished
+    AFTER UPDATE OF status ON file_host_uploads
+    WHEN NEW.status IN ('completed', 'failed') AND OLD.status <> NEW.status
+    BEGIN
+        {_HOST_ROLLUP_SQL}
+    END;
+"""
+
+
 # Module-level set to track which database paths have been initialized.
 # This prevents repeated schema introspection (~20 SQL statements) on every method call.
 # Thread-safe because set operations are atomic in CPython (GIL protected).
@@ -179,6 +258,21 @@ def _ensure_schema(conn: sqlite3.Connection) -> None:
         CREATE INDEX IF NOT EXISTS file_host_uploads_status_idx ON file_host_uploads(status);
         CREATE INDEX IF NOT EXISTS file_host_uploads_host_idx ON file_host_uploads(host_name);
         CREATE INDEX IF NOT EXISTS file_host_uploads_host_status_idx ON file_host_uploads(host_name, status);
+
+        CREATE TABLE IF NOT EXISTS artifact_index (
+            id INTEGER PRIMARY KEY,
+            gallery_id TEXT NOT NULL,
+            gallery_name TEXT NOT NULL,
+            fingerprint TEXT,
+            json_path TEXT NOT NULL UNIQUE,
+            bbcode_path TEXT,
+            location TEXT,
+            json_mtime REAL,
+            indexed_ts INTEGER DEFAULT (strftime('%s', 'now'))
+        );
+        CREATE INDEX IF NOT EXISTS artifact_index_name_idx ON artifact_index(gallery_name);
+        CREATE INDEX IF NOT EXISTS artifact_index_fingerprint_idx ON artifact_index(fingerprint);
+        CREATE INDEX IF NOT EXISTS artifact_index_gallery_id_idx ON artifact_index(gallery_id);
         """
     )
     # Run migrations after core schema creation (this adds tab_name column and indexes)
@@ -303,11 +397,75 @@ def _run_migrations(conn: sqlite3.Connection) -> None:
             conn.execute("ALTER TABLE galleries ADD COLUMN imx_status_checked INTEGER")
             log("+ Added imx_status_checked column", level="info", category="database")
 
+        # Migration 7: Artifact modification times for lookups by gallery ID
+        cursor = conn.execute("PRAGMA table_info(artifact_index)")
+        columns = [column[1] for column in cursor.fetchall()]
+
+        if 'json_mtime' not in columns:
+            log("Adding json_mtime column to artifact_index table...", level="info", category="database")
+            conn.execute("ALTER TABLE artifact_index ADD COLUMN json_mtime REAL")
+            log("+ Added json_mtime column", level="info", category="database")
+
+        # Migration 8: Statistics rollup tables
+        _ensure_stats_rollups(conn)
+
+        # Migration 9: Upload priority (see queue_scheduler)
+        cursor = conn.execute("PRAGMA table_info(galleries)")
+        columns = [column[1] for column in cursor.fetchall()]
+
+        if 'priority' not in columns:
+            log("Adding priority column to galleries table...", level="info", category="database")
+            conn.execute("ALTER TABLE galleries ADD COLUMN priority INTEGER NOT NULL DEFAULT 0")
+            log("+ Added priority column", level="info", category="database")
+
     except Exception as e:
         log(f"Warning: Migration failed: {e}", level="warning", category="database")
         # Continue anyway - the app should still work
 
 
+def _ensure_stats_rollups(conn: sqlite3.Connection) -> None:
+    """Create the statistics rollup tables and triggers, backfilling them once.
+
+    The backfill counts galleries and file host uploads that finished before
+    the rollups existed, in the same transaction that creates the triggers.
+    After that only the triggers write to the rollups.
+    """
+    existing = conn.execute(
+        "SELECT name FROM sqlite_master WHERE type = 'table' AND name = 'stats_gallery_daily'"
+    ).fetchone()
+    if existing:
+        conn.executescript(_STATS_ROLLUP_SCHEMA)
+        return
+
+    log("Building statistics rollups from existing galleries...", level="info", category="database")
+    try:
+        conn.executescript(f"""
+            BEGIN;
+            {_STATS_ROLLUP_SCHEMA}
+            INSERT INTO stats_gallery_daily(day, tab_id, template, galleries, images, bytes)
+            SELECT date(COALESCE(NULLIF(g.finished_ts, 0), g.added_ts), 'unixepoch', 'localtime'),
+                   COALESCE(g.tab_id, 0), COALESCE(g.template, ''), COUNT(*),
+                   SUM(COALESCE(g.uploaded_images, 0)), SUM({_GALLERY_BYTES_SQL.format(t='g')})
+            FROM galleries g
+            WHERE g.status = 'completed'
+            GROUP BY 1, 2, 3;
+
+            INSERT INTO stats_host_daily(day, host_name, files, failed, bytes)
+            SELECT date(COALESCE(finished_ts, created_ts), 'unixepoch', 'localtime'), host_name,
+                   SUM(status = 'completed'), SUM(status = 'failed'),
+                   SUM(CASE WHEN status = 'completed' THEN COALESCE(total_bytes, 0) ELSE 0 END)
+            FROM file_host_uploads
+            WHERE status IN ('completed', 'failed')
+            GROUP BY 1, 2;
+            COMMIT;
+        """)
+    except Exception:
+        if conn.in_transaction:
+            conn.execute("ROLLBACK")
+        raise
+    log("+ Built statistics rollups", level="info", category="database")
+
+
 def _initialize_default_tabs(conn: sqlite3.Connection) -> None:
     """Initialize default system tabs (one-time migration)."""
     try:
@@ -571,6 +729,9 @@ class QueueStore:
             'imx_status': imx_status,
             'imx_status_checked': imx_status_checked
         }
+        # Only written when given, so partial saves keep the stored priority
+        if 'priority' in item:
+            optional_fields['priority'] = int(item.get('priority') or 0)
 
         for col_name, col_value in optional_fields.items():
             if col_name in existing_columns:
@@ -597,6 +758,10 @@ class QueueStore:
             with _ConnectionContext(self.db_path) as conn:
                 _ensure_schema(conn)
                 try:
+                    # One transaction for the whole batch: a single fsync instead of one per row.
+                    # IMMEDIATE takes the write lock up front (waiting on busy_timeout), since a
+                    # deferred transaction that has already read cannot wait to upgrade its lock.
+                    conn.execute("BEGIN IMMEDIATE")
                     for it in items_list:
                         try:
                             #print(f"DEBUG: Processing item: path={it.get('path')}, tab_name={it.get('tab_name', 'Main')}, status={it.get('status')}")
@@ -640,7 +805,10 @@ class QueueStore:
                             log(f"Failed to upsert item {it.get('path', 'unknown')}: {item_error}", level="warning", category="database")
                             # Continue with other items instead of failing completely
                             continue
+                    conn.execute("COMMIT")
                 except Exception as tx_error:
+                    if conn.in_transaction:
+                        conn.execute("ROLLBACK")
                     log(f"Transaction failed: {tx_error}", level="error", category="database")
                     raise
         except Exception as e:
@@ -665,7 +833,7 @@ class QueueStore:
                     g.insertion_order, g.failed_files, g.tab_name, g.tab_id,
                     g.custom1, g.custom2, g.custom3, g.custom4,
                     g.ext1, g.ext2, g.ext3, g.ext4,
-                    g.imx_status, g.imx_status_checked
+                    g.imx_status, g.imx_status_checked, g.priority
                 FROM galleries g
                 ORDER BY g.insertion_order ASC, g.added_ts ASC
                 """
@@ -673,16 +841,19 @@ class QueueStore:
 
             rows = cur.fetchall()
             items: List[Dict[str, Any]] = []
+            # Status, template and tab repeat across thousands of rows; intern
+            # them so every loaded item shares one string per value.
+            intern = sys.intern
             for r in rows:
-                # Optimized schema: 29 columns (removed image_files GROUP_CONCAT for 100x speedup)
+                # Optimized schema: 30 columns (removed image_files GROUP_CONCAT for 100x speedup)
                 item: Dict[str, Any] = {
                     'db_id': int(r[0]),  # Database primary key
                     'path': r[1],
                     'name': r[2],
-                    'status': r[3],
+                    'status': intern(r[3]) if r[3] else r[3],
                     'added_time': int(r[4] or 0),
                     'finished_time': int(r[5] or 0) or None,
-                    'template_name': r[6],
+                    'template_name': intern(r[6]) if r[6] else r[6],
                     'total_images': int(r[7] or 0),
                     'uploaded_images': int(r[8] or 0),
                     'total_size': int(r[9] or 0),
@@ -693,7 +864,7 @@ class QueueStore:
                     'gallery_url': r[14] or "",
                     'insertion_order': int(r[15] or 0),
                     'failed_files': json.loads(r[16]) if r[16] else [],
-                    'tab_name': r[17] or 'Main',
+                    'tab_name': intern(r[17]) if r[17] else 'Main',
                     'tab_id': int(r[18] or 1),
                     'custom1': r[19] or '',
                     'custom2': r[20] or '',
@@ -705,6 +876,7 @@ class QueueStore:
                     'ext4': r[26] or '',
                     'imx_status': r[27] or '',
                     'imx_status_checked': int(r[28]) if r[28] else None,
+                    'priority': int(r[29] or 0),
                     'uploaded_files': [],  # Load separately when needed, not in gallery list query
                 }
                 items.append(item)
@@ -932,6 +1104,9 @@ class QueueStore:
             
             rows = cur.fetchall()
             items: List[Dict[str, Any]] = []
+            # Status, template and tab repeat across thousands of rows; intern
+            # them so every loaded item shares one string per value.
+            intern = sys.intern
             for r in rows:
                 if has_failed_files:
                     # New schema - 24 columns (id at index 0, custom1-4 at 18-21, imx_status at 22-23)
@@ -1427,6 +1602,51 @@ class QueueStore:
                 log(f"Error adding file host upload: {e}", level="error", category="database")
                 return None
 
+    def bulk_add_file_host_uploads(
+        self,
+        uploads: Iterable[Tuple[str, str]],
+        status: str = 'pending'
+    ) -> int:
+        """Add file host upload records for many galleries in a single transaction.
+
+        Galleries must already be persisted; pairs whose gallery is unknown are skipped.
+
+        Args:
+            uploads: (gallery_path, host_name) pairs
+            status: Initial status for every record
+
+        Returns:
+            Number of records written
+        """
+        pairs = [(os.path.normpath(path), host) for path, host in uploads]
+        if not pairs:
+            return 0
+
+        with _ConnectionContext(self.db_path) as conn:
+            _ensure_schema(conn)
+            try:
+                conn.execute("BEGIN IMMEDIATE")
+                written = 0
+                for gallery_path, host_name in pairs:
+                    row = conn.execute("SELECT id FROM galleries WHERE path = ?", (gallery_path,)).fetchone()
+                    if not row:
+                        continue
+                    conn.execute(
+                        """
+                        INSERT OR REPLACE INTO file_host_uploads
+                        (gallery_fk, host_name, status, created_ts)
+                        VALUES (?, ?, ?, strftime('%s', 'now'))
+                        """,
+                        (row[0], host_name, status)
+                    )
+                    written += 1
+                conn.execute("COMMIT")
+                return written
+            except Exception as e:
+                conn.execute("ROLLBACK")
+                log(f"Error adding file host uploads: {e}", level="error", category="database")
+                return 0
+
     def get_file_host_uploads(self, gallery_path: str) -> List[Dict[str, Any]]:
         """Get all file host uploads for a gallery.
 
@@ -1751,6 +1971,40 @@ class QueueStore:
 
         return result
 
+    def get_uploaded_images(self, gallery_path: str) -> List[Tuple[str, Dict[str, Any]]]:
+        """Get the per-image upload data stored for one gallery.
+
+        Args:
+            gallery_path: Path of the gallery
+
+        Returns:
+            List of (filename, data) pairs in the shape of
+            GalleryQueueItem.uploaded_images_data, where data holds
+            'image_url', 'thumb_url', 'size_bytes', 'width' and 'height'.
+        """
+        with _ConnectionContext(self.db_path) as conn:
+            _ensure_schema(conn)
+            cursor = conn.execute(
+                """
+                SELECT i.filename, i.url, i.thumb_url, i.size_bytes, i.width, i.height
+                FROM images i
+                JOIN galleries g ON i.gallery_fk = g.id
+                WHERE g.path = ?
+                ORDER BY i.id
+                """,
+                (gallery_path,)
+            )
+            return [
+                (filename, {
+                    'image_url': url or '',
+                    'thumb_url': thumb_url or '',
+                    'size_bytes': int(size_bytes or 0),
+                    'width': int(width or 0),
+                    'height': int(height or 0),
+                })
+                for filename, url, thumb_url, size_bytes, width, height in cursor.fetchall()
+            ]
+
     def update_gallery_imx_status(self, gallery_path: str, status_text: str, checked_timestamp: int) -> bool:
         """Update the IMX status for a gallery.
 
@@ -2045,3 +2299,346 @@ class QueueStore:
                 for r in cursor.fetchall()
             ]
 
+
+    # ----------------------------- Artifact Index ----------------------------
+
+    def index_gallery_artifacts(self, entries: Iterable[Dict[str, Any]]) -> int:
+        """Insert or refresh artifact index rows in a single transaction.
+
+        Args:
+            entries: Dicts with 'gallery_id', 'gallery_name', 'json_path' and
+                optionally 'fingerprint', 'bbcode_path', 'location' and 'json_mtime'
+
+        Returns:
+            Number of rows written
+        """
+        rows = []
+        for entry in entries:
+            json_path = entry.get('json_path')
+            gallery_id = entry.get('gallery_id')
+            gallery_name = entry.get('gallery_name')
+            if not json_path or not gallery_id or not gallery_name:
+                continue
+            rows.append((
+                str(gallery_id),
+                str(gallery_name),
+                entry.get('fingerprint'),
+                os.path.normpath(json_path),
+                os.path.normpath(entry['bbcode_path']) if entry.get('bbcode_path') else None,
+                entry.get('location'),
+                entry.get('json_mtime'),
+            ))
+        if not rows:
+            return 0
+
+        with _ConnectionContext(self.db_path) as conn:
+            _ensure_schema(conn)
+            try:
+                conn.execute("BEGIN")
+                conn.executemany(
+                    """
+                    INSERT INTO artifact_index
+                        (gallery_id, gallery_name, fingerprint, json_path, bbcode_path, location,
+                         json_mtime, indexed_ts)
+                    VALUES (?, ?, ?, ?, ?, ?, ?, strftime('%s', 'now'))
+                    ON CONFLICT(json_path) DO UPDATE SET
+                        gallery_id = excluded.gallery_id,
+                        gallery_name = excluded.gallery_name,
+                        fingerprint = COALESCE(excluded.fingerprint, artifact_index.fingerprint),
+                        bbcode_path = excluded.bbcode_path,
+                        location = excluded.location,
+                        json_mtime = COALESCE(excluded.json_mtime, artifact_index.json_mtime),
+                        indexed_ts = excluded.indexed_ts
+                    """,
+                    rows
+                )
+                conn.execute("COMMIT")
+            except Exception as e:
+                conn.execute("ROLLBACK")
+                log(f"Error indexing gallery artifacts: {e}", level="error", category="database")
+                return 0
+        return len(rows)
+
+    def find_existing_artifacts(
+        self,
+        gallery_names: Iterable[str],
+        fingerprints: Iterable[str] = ()
+    ) -> Tuple[Dict[str, List[str]], Dict[str, List[str]]]:
+        """Look up indexed artifacts for many gallery names and fingerprints at once.
+
+        Args:
+            gallery_names: Gallery names to match exactly
+            fingerprints: Content fingerprints to match (see artifact_index module)
+
+        Returns:
+            Tuple of (name -> artifact paths, fingerprint -> artifact paths).
+            Names and fingerprints without matches are omitted.
+        """
+        names = list({n for n in gallery_names if n})
+        prints = list({f for f in fingerprints if f})
+        by_name: Dict[str, List[str]] = {}
+        by_fingerprint: Dict[str, List[str]] = {}
+        if not names and not prints:
+            return by_name, by_fingerprint
+
+        def _paths(json_path: str, bbcode_path: Optional[str]) -> List[str]:
+            return [p for p in (bbcode_path, json_path) if p]
+
+        # Stay well under SQLite's host parameter limit
+        chunk_size = 500
+        with _ConnectionContext(self.db_path) as conn:
+            _ensure_schema(conn)
+            for start in range(0, len(names), chunk_size):
+                chunk = names[start:start + chunk_size]
+                placeholders = ','.join(['?'] * len(chunk))
+                cursor = conn.execute(
+                    f"""
+                    SELECT gallery_name, json_path, bbcode_path FROM artifact_index
+                    WHERE gallery_name IN ({placeholders})
+                    ORDER BY indexed_ts DESC
+                    """,
+                    tuple(chunk)
+                )
+                for name, json_path, bbcode_path in cursor.fetchall():
+                    by_name.setdefault(name, []).extend(_paths(json_path, bbcode_path))
+            for start in range(0, len(prints), chunk_size):
+                chunk = prints[start:start + chunk_size]
+                placeholders = ','.join(['?'] * len(chunk))
+                cursor = conn.execute(
+                    f"""
+                    SELECT fingerprint, json_path, bbcode_path FROM artifact_index
+                    WHERE fingerprint IN ({placeholders})
+                    ORDER BY indexed_ts DESC
+                    """,
+                    tuple(chunk)
+                )
+                for fingerprint, json_path, bbcode_path in cursor.fetchall():
+                    by_fingerprint.setdefault(fingerprint, []).extend(_paths(json_path, bbcode_path))
+        return by_name, by_fingerprint
+
+    def get_artifacts_by_gallery_ids(self, gallery_ids: Iterable[str]) -> Dict[str, List[Dict[str, Any]]]:
+        """Look up indexed artifacts for many gallery IDs at once.
+
+        Args:
+            gallery_ids: imx.to gallery IDs
+
+        Returns:
+            Dict mapping gallery ID -> artifact dicts ('json_path', 'bbcode_path',
+            'location', 'json_mtime'), newest first. IDs without artifacts are omitted.
+        """
+        ids = list({str(g) for g in gallery_ids if g})
+        results: Dict[str, List[Dict[str, Any]]] = {}
+        if not ids:
+            return results
+
+        # Stay well under SQLite's host parameter limit
+        chunk_size = 500
+        with _ConnectionContext(self.db_path) as conn:
+            _ensure_schema(conn)
+            for start in range(0, len(ids), chunk_size):
+                chunk = ids[start:start + chunk_size]
+                placeholders = ','.join(['?'] * len(chunk))
+                cursor = conn.execute(
+                    f"""
+                    SELECT gallery_id, json_path, bbcode_path, location, json_mtime FROM artifact_index
+                    WHERE gallery_id IN ({placeholders})
+                    ORDER BY json_mtime IS NULL, json_mtime DESC, indexed_ts DESC
+                    """,
+                    tuple(chunk)
+                )
+                for gallery_id, json_path, bbcode_path, location, json_mtime in cursor.fetchall():
+                    results.setdefault(gallery_id, []).append({
+                        'json_path': json_path,
+                        'bbcode_path': bbcode_path,
+                        'location': location,
+                        'json_mtime': json_mtime,
+                    })
+        return results
+
+    def refresh_artifact_index(self, removed_paths: Iterable[str] = (),
+                               mtimes: Optional[Dict[str, float]] = None) -> None:
+        """Drop index rows for deleted artifacts and store changed modification times.
+
+        Args:
+            removed_paths: JSON artifact paths that no longer exist
+            mtimes: JSON artifact path -> current modification time
+        """
+        removed = [(path,) for path in removed_paths]
+        updated = [(mtime, path) for path, mtime in (mtimes or {}).items()]
+        if not removed and not updated:
+            return
+        with _ConnectionContext(self.db_path) as conn:
+            _ensure_schema(conn)
+            try:
+                conn.execute("BEGIN")
+                if removed:
+                    conn.executemany("DELETE FROM artifact_index WHERE json_path = ?", removed)
+                if updated:
+                    conn.executemany("UPDATE artifact_index SET json_mtime = ? WHERE json_path = ?", updated)
+                conn.execute("COMMIT")
+            except Exception as e:
+                conn.execute("ROLLBACK")
+                log(f"Error refreshing artifact index: {e}", level="error", category="database")
+
+    def is_artifact_index_backfilled(self) -> bool:
+        """Return True once existing artifacts have been imported into the index."""
+        with _ConnectionContext(self.db_path) as conn:
+            _ensure_schema(conn)
+            row = conn.execute(
+                "SELECT value_text FROM settings WHERE key = ?", (ARTIFACT_INDEX_BACKFILL_KEY,)
+            ).fetchone()
+            return bool(row and str(row[0]) == "1")
+
+    def mark_artifact_index_backfilled(self) -> None:
+        """Record that the one-time artifact index backfill has run."""
+        with _ConnectionContext(self.db_path) as conn:
+            _ensure_schema(conn)
+            conn.execute(
+                "INSERT OR REPLACE INTO settings(key, value_text) VALUES(?, ?)",
+                (ARTIFACT_INDEX_BACKFILL_KEY, "1")
+            )
+
+    # ----------------------------- Statistics ----------------------------
+    def migrate_stats_from_qsettings_if_needed(self, qsettings: Any) -> None:
+        """One-time import of the legacy QSettings upload counters.
+
+        Galleries cleared from the queue before the rollups existed are only
+        counted there. Whatever the counters hold beyond the rollups is stored
+        as a baseline that is added to all-time totals.
+
+        qsettings is expected to be the QSettings("BBDropUploader", "Stats") store.
+        """
+        try:
+            with _ConnectionContext(self.db_path) as conn:
+                _ensure_schema(conn)
+                if conn.execute("SELECT 1 FROM settings WHERE key = ?", (STATS_BASELINE_KEY,)).fetchone():
+                    return
+                legacy = {'galleries': 0, 'images': 0, 'bytes': 0}
+                if qsettings is not None:
+                    legacy['galleries'] = qsettings.value("total_galleries", 0, type=int) or 0
+                    legacy['images'] = qsettings.value("total_images", 0, type=int) or 0
+                    try:
+                        legacy['bytes'] = int(str(qsettings.value("total_size_bytes_v2", "0")))
+                    except (TypeError, ValueError):
+                        legacy['bytes'] = qsettings.value("total_size_bytes", 0, type=int) or 0
+                counted = self._query_gallery_totals(conn, "")
+                baseline = {key: max(0, int(legacy[key]) - counted[key]) for key in legacy}
+                conn.execute(
+                    "INSERT OR REPLACE INTO settings(key, value_text) VALUES(?, ?)",
+                    (STATS_BASELINE_KEY, json.dumps(baseline))
+                )
+                if any(baseline.values()):
+                    log(f"Imported legacy upload totals not in the database: {baseline}",
+                        level="info", category="database")
+        except Exception as e:
+            log(f"Could not import legacy upload statistics: {e}", level="warning", category="database")
+
+    def _query_gallery_totals(self, conn: sqlite3.Connection, since_day: str) -> Dict[str, int]:
+        row = conn.execute(
+            """
+            SELECT COALESCE(SUM(galleries), 0), COALESCE(SUM(images), 0), COALESCE(SUM(bytes), 0)
+            FROM stats_gallery_daily WHERE day >= ?
+            """,
+            (since_day,)
+        ).fetchone()
+        return {'galleries': row[0], 'images': row[1], 'bytes': row[2]}
+
+    def _add_stats_baseline(self, conn: sqlite3.Connection, totals: Dict[str, int]) -> Dict[str, int]:
+        row = conn.execute("SELECT value_text FROM settings WHERE key = ?", (STATS_BASELINE_KEY,)).fetchone()
+        if row:
+            try:
+                baseline = json.loads(row[0])
+                for key in totals:
+                    totals[key] += int(baseline.get(key, 0) or 0)
+            except (TypeError, ValueError, AttributeError):
+                pass
+        return totals
+
+    def get_upload_totals(self) -> Dict[str, int]:
+        """Get all-time upload totals (galleries, images, bytes) from the rollups.
+
+        Returns:
+            Dict with 'galleries', 'images' and 'bytes', including the legacy baseline
+        """
+        with _ConnectionContext(self.db_path) as conn:
+            _ensure_schema(conn)
+            return self._add_stats_baseline(conn, self._query_gallery_totals(conn, ""))
+
+    def get_upload_stats(self, since_ts: Optional[float] = None) -> Dict[str, Any]:
+        """Get upload statistics with breakdowns from the rollup tables.
+
+        Args:
+            since_ts: Only count uploads finished on or after the (local) day of
+                this timestamp. None for all time, including the legacy baseline.
+
+        Returns:
+            Dict containing:
+            - totals: {galleries, images, bytes}
+            - by_day: [{day, galleries, images, bytes}], newest first
+            - by_tab: [{tab_id, tab_name, galleries, images, bytes}], most galleries first
+            - by_template: [{template, galleries, images, bytes}], most galleries first
+            - by_host: [{host_name, files, failed, bytes}], most files first
+        """
+        since_day = time.strftime('%Y-%m-%d', time.localtime(since_ts)) if since_ts is not None else ""
+        stats: Dict[str, Any] = {}
+
+        with _ConnectionContext(self.db_path) as conn:
+            _ensure_schema(conn)
+            stats['totals'] = self._query_gallery_totals(conn, since_day)
+            if since_ts is None:
+                self._add_stats_baseline(conn, stats['totals'])
+
+            cursor = conn.execute(
+                """
+                SELECT day, SUM(galleries), SUM(images), SUM(bytes)
+                FROM stats_gallery_daily WHERE day >= ?
+                GROUP BY day ORDER BY day DESC
+                """,
+                (since_day,)
+            )
+            stats['by_day'] = [
+                {'day': row[0], 'galleries': row[1], 'images': row[2], 'bytes': row[3]}
+                for row in cursor.fetchall()
+            ]
+
+            cursor = conn.execute(
+                """
+                SELECT s.tab_id, COALESCE(t.name, '(deleted tab)'), SUM(s.galleries), SUM(s.images), SUM(s.bytes)
+                FROM stats_gallery_daily s LEFT JOIN tabs t ON t.id = s.tab_id
+                WHERE s.day >= ?
+                GROUP BY s.tab_id ORDER BY 3 DESC
+                """,
+                (since_day,)
+            )
+            stats['by_tab'] = [
+                {'tab_id': row[0], 'tab_name': row[1], 'galleries': row[2], 'images': row[3], 'bytes': row[4]}
+                for row in cursor.fetchall()
+            ]
+
+            cursor = conn.execute(
+                """
+                SELECT template, SUM(galleries), SUM(images), SUM(bytes)
+                FROM stats_gallery_daily WHERE day >= ?
+                GROUP BY template ORDER BY 2 DESC
+                """,
+                (since_day,)
+            )
+            stats['by_template'] = [
+                {'template': row[0], 'galleries': row[1], 'images': row[2], 'bytes': row[3]}
+                for row in cursor.fetchall()
+            ]
+
+            cursor = conn.execute(
+                """
+                SELECT host_name, SUM(files), SUM(failed), SUM(bytes)
+                FROM stats_host_daily WHERE day >= ?
+                GROUP BY host_name ORDER BY 2 DESC
+                """,
+                (since_day,)
+            )
+            stats['by_host'] = [
+                {'host_name': row[0], 'files': row[1], 'failed': row[2], 'bytes': row[3]}
+                for row in cursor.fetchall()
+            ]
+
+        return stats
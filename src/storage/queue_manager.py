@@ -8,15 +8,19 @@ import time
 import threading
 import queue
 from queue import Queue
-from typing import Dict, List, Optional, Any, Set
+from typing import Dict, List, Optional, Any, Set, Tuple
 from dataclasses import dataclass, field
 from contextlib import contextmanager
 
 from PyQt6.QtCore import QObject, pyqtSignal, QMutex, QMutexLocker, QSettings, QTimer
 
 from src.storage.database import QueueStore
+from src.storage.queue_scheduler import QueueScheduler, SchedulerPolicy, clamp_priority
+from src.services.archive_source import ArchiveImageSource
+from src.utils.archive_utils import gallery_exists, is_archive_gallery_path, get_archive_gallery_name
 from bbdrop import sanitize_gallery_name, load_user_defaults, timestamp
 from src.utils.logger import log
+from src.utils.tracing import span
 from src.core.constants import (
     QUEUE_STATE_READY, QUEUE_STATE_QUEUED, QUEUE_STATE_UPLOADING,
     QUEUE_STATE_COMPLETED, QUEUE_STATE_FAILED, QUEUE_STATE_SCAN_FAILED,
@@ -26,9 +30,15 @@ from src.core.constants import (
 )
 
 
-@dataclass
+@dataclass(slots=True)
 class GalleryQueueItem:
-    """Represents a gallery in the upload queue"""
+    """Represents a gallery in the upload queue
+
+    Per-image upload data (uploaded_files, uploaded_images_data) is only kept
+    in memory while a gallery can still upload. Once a completed gallery has
+    been saved it is released; QueueManager.get_uploaded_images() and
+    load_uploaded_images() read it back from the database.
+    """
     path: str
     name: Optional[str] = None
     status: str = QUEUE_STATE_READY
@@ -60,7 +70,7 @@ class GalleryQueueItem:
     # Failed validation details
     failed_files: list = field(default_factory=list)
     
-    # Resume support
+    # Resume support (released for completed galleries once saved)
     uploaded_files: set = field(default_factory=set)
     uploaded_images_data: list = field(default_factory=list)
     uploaded_bytes: int = 0
@@ -94,6 +104,9 @@ class GalleryQueueItem:
     imx_status: str = ""
     imx_status_checked: Optional[int] = None
 
+    # Upload order (PRIORITY_LOW..PRIORITY_URGENT, see queue_scheduler)
+    priority: int = 0
+
 
 class QueueManager(QObject):
     """Manages the gallery upload queue with persistence"""
@@ -106,9 +119,9 @@ class QueueManager(QObject):
     def __init__(self):
         super().__init__()
         self.items: Dict[str, GalleryQueueItem] = {}
-        self.queue = Queue()
         self.mutex = QMutex()
         self.settings = QSettings("BBDropUploader", "QueueManager")
+        self.scheduler = QueueScheduler(SchedulerPolicy.from_settings(self.settings))
         self.store = QueueStore()
         self._next_order = 0
         self._next_db_id = 1  # Track next database ID for predictive assignment
@@ -142,6 +155,7 @@ class QueueManager(QObject):
         # Migration and initialization
         try:
             self.store.migrate_from_qsettings_if_needed(self.settings)
+            self.store.migrate_stats_from_qsettings_if_needed(QSettings("BBDropUploader", "Stats"))
         except Exception:
             pass
         self.load_persistent_queue()
@@ -187,9 +201,14 @@ class QueueManager(QObject):
     
     def _comprehensive_scan_item(self, path: str):
         """Scan and validate a gallery item"""
+        with span("scan", category="scan", gallery=path):
+            self._scan_item(path)
+
+    def _scan_item(self, path: str):
+        """Validate path, list and scan images, then mark the item ready"""
         try:
             # Validation
-            if not os.path.exists(path) or not os.path.isdir(path):
+            if not self._gallery_path_exists(path):
                 self._mark_item_failed(path, "Path does not exist or is not a directory")
                 #log(f" Scan completed for {path}")
                 #log(f" [scan] Path does not exist or is not a directory: {path}")
@@ -197,7 +216,8 @@ class QueueManager(QObject):
                 return
             
             # Find images
-            files = self._get_image_files(path)
+            with span("scan.list_files", category="scan"):
+                files = self._get_image_files(path)
             if not files:
                 self.mark_scan_failed(path, "No images found")
                 log(f"Scan Worker: No images found: {path}", level="warning", category="scan")
@@ -217,7 +237,8 @@ class QueueManager(QObject):
                 item.status = QUEUE_STATE_SCANNING
             
             # Scan images
-            scan_result = self._scan_images(path, files)
+            with span("scan.images", category="scan", images=len(files)):
+                scan_result = self._scan_images(path, files)
             
             if scan_result['failed_files']:
                 self._mark_item_failed(
@@ -262,7 +283,7 @@ class QueueManager(QObject):
                             # Auto-start the upload by changing status to queued and adding to queue
                             self._update_status_count(old_status, QUEUE_STATE_QUEUED)
                             item.status = QUEUE_STATE_QUEUED
-                            self.queue.put(item)  # CRITICAL: Add to queue so worker picks it up
+                            self._schedule_item(item)  # CRITICAL: Add to queue so worker picks it up
                             log(f"Auto-queued {path} for immediate upload", level="debug", category="queue")
 
                         # Emit signal directly (we're already in mutex lock)
@@ -290,8 +311,16 @@ class QueueManager(QObject):
             self.mark_scan_failed(path, f"Scan error: {e}")
             log(f"Scan Worker: Scan error: {e}", level="error", category="scan")
     
+    @staticmethod
+    def _gallery_path_exists(path: str) -> bool:
+        """Check that a gallery folder (or the archive of an archive gallery) exists"""
+        return gallery_exists(path)
+
     def _get_image_files(self, path: str) -> List[str]:
         """Get list of image files in directory"""
+        if is_archive_gallery_path(path):
+            with ArchiveImageSource.from_gallery_path(path) as source:
+                return source.list_images()
         files = []
         for f in os.listdir(path):
             if f.lower().endswith(IMAGE_EXTENSIONS):
@@ -302,7 +331,15 @@ class QueueManager(QObject):
     
     def _scan_images(self, path: str, files: List[str]) -> dict:
         """Scan images for validation and metadata"""
-        gallery_name = os.path.basename(path)
+        if is_archive_gallery_path(path):
+            # Validate straight from the archive, nothing is extracted
+            with ArchiveImageSource.from_gallery_path(path) as source:
+                return self._scan_image_files(path, files, source)
+        return self._scan_image_files(path, files)
+
+    def _scan_image_files(self, path: str, files: List[str], source: Optional[ArchiveImageSource] = None) -> dict:
+        """Scan images of a folder, or of an archive gallery when source is given"""
+        gallery_name = get_archive_gallery_name(path) if source else os.path.basename(path)
 
         result: dict[str, Any] = {
             'total_size': 0,
@@ -337,15 +374,16 @@ class QueueManager(QObject):
             for i, f in enumerate(files):
                 fp = os.path.join(path, f)
                 try:
-                    result['total_size'] += os.path.getsize(fp)
+                    result['total_size'] += source.get_size(f) if source else os.path.getsize(fp)
 
                     # Validate with imghdr if available, otherwise use PIL directly
                     if has_imghdr:
-                        with open(fp, 'rb') as img:
+                        with (source.open(f) if source else open(fp, 'rb')) as img:
                             if not imghdr.what(img):
                                 # imghdr failed - verify with PIL (more robust for some formats)
                                 try:
-                                    with Image.open(fp) as pil_img:
+                                    img.seek(0)
+                                    with Image.open(img if source else fp) as pil_img:
                                         pil_img.verify()  # Checks image integrity
                                 except Exception as pil_error:
                                     # Both imghdr and PIL failed - mark as invalid
@@ -353,8 +391,12 @@ class QueueManager(QObject):
                     else:
                         # No imghdr - use PIL-only validation
                         try:
-                            with Image.open(fp) as pil_img:
-                                pil_img.verify()  # Checks image integrity
+                            if source:
+                                with source.open(f) as img, Image.open(img) as pil_img:
+                                    pil_img.verify()
+                            else:
+                                with Image.open(fp) as pil_img:
+                                    pil_img.verify()  # Checks image integrity
                         except Exception as pil_error:
                             result['failed_files'].append((f, f"Invalid image: {str(pil_error)}"))
 
@@ -373,7 +415,7 @@ class QueueManager(QObject):
 
         # Calculate dimensions with sampling
         if not result['failed_files']:
-            dims = self._calculate_dimensions(path, files, sampling)
+            dims = self._calculate_dimensions(path, files, sampling, source)
             if dims:
                 # Use the outlier exclusion utility if configured
                 from src.utils.sampling_utils import calculate_dimensions_with_outlier_exclusion
@@ -391,9 +433,10 @@ class QueueManager(QObject):
         
         return result
     
-    def _calculate_dimensions(self, path: str, files: List[str], sampling: int) -> List[tuple]:
+    def _calculate_dimensions(self, path: str, files: List[str], sampling: int,
+                              source: Optional[ArchiveImageSource] = None) -> List[tuple]:
         """Calculate image dimensions with sampling"""
-        gallery_name = os.path.basename(path)
+        gallery_name = get_archive_gallery_name(path) if source else os.path.basename(path)
         dims = []
 
         try:
@@ -419,7 +462,8 @@ class QueueManager(QObject):
             log(f"Scan Worker: Dimension sampling: method={enhanced_config['sampling_method']}, fixed={enhanced_config['sampling_fixed_count']}, pct={enhanced_config['sampling_percentage']}% for '{gallery_name}'", level="debug", category="scan")
 
             # Get sample indices using new logic
-            sample_indices = get_sample_indices(files, enhanced_config, path)
+            # Small-image exclusion needs files on disk; skipped for archive galleries
+            sample_indices = get_sample_indices(files, enhanced_config, None if source else path)
             samples = [files[i] for i in sample_indices]
 
             log(f"Scan Worker: Sampling {len(samples)} of {len(files)} files for dimensions for '{gallery_name}'", level="debug", category="scan")
@@ -428,8 +472,12 @@ class QueueManager(QObject):
             for f in samples:
                 fp = os.path.join(path, f)
                 try:
-                    with Image.open(fp) as img:
-                        dims.append(img.size)
+                    if source:
+                        with source.open(f) as fh, Image.open(fh) as img:
+                            dims.append(img.size)
+                    else:
+                        with Image.open(fp) as img:
+                            dims.append(img.size)
                 except (OSError, IOError):
                     continue
 
@@ -785,6 +833,7 @@ class QueueManager(QObject):
                 'ext2': getattr(item, 'ext2', ''),
                 'ext3': getattr(item, 'ext3', ''),
                 'ext4': getattr(item, 'ext4', ''),
+                'priority': getattr(item, 'priority', 0),
             }
             
             self.store.bulk_upsert_async([item_data])
@@ -825,7 +874,58 @@ class QueueManager(QObject):
                 log(f"DEBUG: SQLite: bulk_upsert_async database save completed", level="debug", category="db")
             except Exception as e:
                 log(f"Database save failed: {e}", level="error", category="db")
-                pass
+                return
+
+            # The save above owns the per-image data now; completed galleries
+            # don't need it in memory until it is asked for again.
+            for item in items:
+                if item.status == QUEUE_STATE_COMPLETED:
+                    self._release_uploaded_images(item)
+
+    @staticmethod
+    def _release_uploaded_images(item: GalleryQueueItem) -> None:
+        """Drop per-image upload data that has been persisted."""
+        if item.uploaded_files or item.uploaded_images_data:
+            item.uploaded_files = set()
+            item.uploaded_images_data = []
+
+    def get_uploaded_images(self, path: str) -> List[Tuple[str, dict]]:
+        """Per-image upload data for a gallery as (filename, data) pairs.
+
+        Served from memory while the gallery holds it, otherwise read from
+        the database (e.g. for completed galleries).
+        """
+        with QMutexLocker(self.mutex):
+            item = self.items.get(path)
+            if item is not None and item.uploaded_images_data:
+                return list(item.uploaded_images_data)
+        try:
+            return self.store.get_uploaded_images(path)
+        except Exception as e:
+            log(f"Failed to load uploaded images for {path}: {e}", level="error", category="db")
+            return []
+
+    def load_uploaded_images(self, path: str) -> bool:
+        """Restore released per-image data onto the item before it uploads again.
+
+        Resume and artifact generation read uploaded_files/uploaded_images_data
+        from the item. Returns True if data was loaded.
+        """
+        with QMutexLocker(self.mutex):
+            item = self.items.get(path)
+            if item is None or item.uploaded_files or not item.uploaded_images:
+                return False
+        images = self.get_uploaded_images(path)
+        if not images:
+            return False
+        with QMutexLocker(self.mutex):
+            if item.uploaded_files:
+                return False
+            item.uploaded_files = {fname for fname, _ in images}
+            item.uploaded_images_data = images
+        log(f"Loaded {len(images)} uploaded images for {os.path.basename(path)}",
+            level="debug", category="queue")
+        return True
     
     def _item_to_dict(self, item: GalleryQueueItem) -> dict:
         """Convert item to dictionary for storage"""
@@ -871,7 +971,8 @@ class QueueManager(QObject):
             'source_archive_path': item.source_archive_path,
             'is_from_archive': item.is_from_archive,
             'imx_status': item.imx_status,
-            'imx_status_checked': item.imx_status_checked
+            'imx_status_checked': item.imx_status_checked,
+            'priority': item.priority
         }
     
     def load_persistent_queue(self):
@@ -887,7 +988,7 @@ class QueueManager(QObject):
             
             # Skip invalid paths unless completed
             if status != QUEUE_STATE_COMPLETED:
-                if not os.path.exists(path) or not os.path.isdir(path):
+                if not self._gallery_path_exists(path):
                     continue
             
             # Create item from data
@@ -897,6 +998,9 @@ class QueueManager(QObject):
             if item.db_id:
                 self._next_db_id = max(self._next_db_id, item.db_id + 1)
             self.items[path] = item
+            # Galleries added in bulk may not have been scanned before shutdown
+            if item.status in (QUEUE_STATE_VALIDATING, QUEUE_STATE_SCANNING):
+                self._scan_queue.put(path)
         
         self._rebuild_status_counts()
         self.queue_loaded.emit()
@@ -950,7 +1054,7 @@ class QueueManager(QObject):
                      'max_height', 'min_width', 'min_height', 'scan_complete',
                      'uploaded_bytes', 'final_kibps', 'error_message',
                      'source_archive_path', 'is_from_archive',
-                     'imx_status', 'imx_status_checked', 'tab_id']:
+                     'imx_status', 'imx_status_checked', 'tab_id', 'priority']:
             if field in data:
                 setattr(item, field, data[field])
 
@@ -970,7 +1074,12 @@ class QueueManager(QObject):
             if path in self.items:
                 return False
             
-            gallery_name = name or os.path.basename(path)
+            if name:
+                gallery_name = name
+            elif is_archive_gallery_path(path):
+                gallery_name = get_archive_gallery_name(path)
+            else:
+                gallery_name = os.path.basename(path)
             log(f"DEBUG: Creating GalleryQueueItem for {gallery_name} ({path}) with tab_name={tab_name}...", level="debug", category="queue")
             item = GalleryQueueItem(
                 path=path,
@@ -999,32 +1108,7 @@ class QueueManager(QObject):
         self._scan_queue.put(path)
 
         # Execute "added" hook in background
-        from src.processing.hooks_executor import execute_gallery_hooks
-        import threading
-        def run_added_hook():
-            try:
-                ext_fields = execute_gallery_hooks(
-                    event_type='added',
-                    gallery_path=path,
-                    gallery_name=gallery_name,
-                    tab_name=tab_name,
-                    image_count=0  # Not scanned yet
-                )
-                # Update ext fields if hook returned any
-                if ext_fields:
-                    with QMutexLocker(self.mutex):
-                        if path in self.items:
-                            for key, value in ext_fields.items():
-                                setattr(self.items[path], key, value)
-                            self._schedule_debounced_save([path])
-                    log(f"Updated fields from 'gallery added' hook: {ext_fields}", level="info", category="hooks")
-                    # Emit signal through parent if available
-                    if hasattr(self, 'parent') and self.parent and hasattr(self.parent, 'on_ext_fields_updated'):
-                        self.parent.on_ext_fields_updated(path, ext_fields)
-            except Exception as e:
-                log(f"Error executing added hook: {e}", level="warning", category="hooks")
-
-        threading.Thread(target=run_added_hook, daemon=True).start()
+        self._run_added_hooks([(path, gallery_name, tab_name)])
 
         # Check for file host auto-upload triggers (on_added)
         try:
@@ -1055,6 +1139,127 @@ class QueueManager(QObject):
 
         #print(f"DEBUG: add_item returning True")
         return True
+
+    def add_items_bulk(self, paths: List[str], template_name: str = "default",
+                       tab_name: str = "Main") -> Dict[str, Any]:
+        """Add many galleries at once.
+
+        Items are created under a single lock and persisted in one database
+        transaction. Validation and scanning are deferred to the scan worker,
+        which receives the paths in queue order.
+
+        Returns:
+            Dict with 'added', 'duplicates', 'failed', 'errors' and 'added_paths'
+        """
+        results: Dict[str, Any] = {'added': 0, 'duplicates': 0, 'failed': 0,
+                                   'errors': [], 'added_paths': []}
+        new_items: List[GalleryQueueItem] = []
+        with QMutexLocker(self.mutex):
+            now = time.time()
+            for path in paths:
+                if path in self.items:
+                    results['duplicates'] += 1
+                    continue
+                try:
+                    if is_archive_gallery_path(path):
+                        gallery_name = get_archive_gallery_name(path)
+                    else:
+                        gallery_name = os.path.basename(path)
+                    item = GalleryQueueItem(
+                        path=path,
+                        name=gallery_name,
+                        status=QUEUE_STATE_VALIDATING,
+                        insertion_order=self._next_order,
+                        db_id=self._next_db_id,
+                        added_time=now,
+                        template_name=template_name,
+                        tab_name=tab_name
+                    )
+                except Exception as e:
+                    results['failed'] += 1
+                    results['errors'].append(f"{os.path.basename(path)}: {e}")
+                    continue
+                self._next_order += 1
+                self._next_db_id += 1
+                self.items[path] = item
+                self._update_status_count("", QUEUE_STATE_VALIDATING)
+                new_items.append(item)
+            if not new_items:
+                return results
+            rows = [self._item_to_dict(item) for item in new_items]
+            self._inc_version()
+
+        results['added'] = len(new_items)
+        results['added_paths'] = [item.path for item in new_items]
+        log(f"Bulk add: {len(new_items)} galleries queued for validation "
+            f"({results['duplicates']} already in queue)", level="debug", category="queue")
+
+        # One transaction for every row; validating rows are requeued on restart
+        self.store.bulk_upsert_async(rows)
+        for item in new_items:
+            self._scan_queue.put(item.path)
+
+        self._run_added_hooks([(item.path, item.name, item.tab_name) for item in new_items])
+
+        # File host auto-upload triggers (on_added), written after the galleries exist
+        try:
+            from src.core.file_host_config import get_config_manager
+            triggered_hosts = get_config_manager().get_hosts_by_trigger('added')
+            if triggered_hosts:
+                log(f"Gallery added trigger: Queuing {len(new_items)} galleries for "
+                    f"{len(triggered_hosts)} enabled hosts with 'On Added' trigger",
+                    level="info", category="file_hosts")
+                uploads = [(item.path, host_id) for item in new_items for host_id in triggered_hosts]
+                self.store._executor.submit(self.store.bulk_add_file_host_uploads, uploads)
+        except Exception as e:
+            log(f"Error checking file host triggers on gallery added: {e}", level="error", category="file_hosts")
+
+        return results
+
+    def _run_added_hooks(self, entries: List[Tuple[str, Optional[str], str]]):
+        """Queue 'gallery added' hooks for (path, name, tab) entries on the hook scheduler"""
+        from src.processing.hooks_executor import execute_gallery_hooks, get_hook_scheduler, get_hooks_executor
+
+        if not get_hooks_executor().get_config().get('added', {}).get('enabled'):
+            return
+
+        def run_added_hook(path, gallery_name, tab_name):
+            try:
+                ext_fields = execute_gallery_hooks(
+                    event_type='added',
+                    gallery_path=path,
+                    gallery_name=gallery_name,
+                    tab_name=tab_name,
+                    image_count=0  # Not scanned yet
+                )
+                # Update ext fields if hook returned any
+                if ext_fields:
+                    with QMutexLocker(self.mutex):
+                        if path in self.items:
+                            for key, value in ext_fields.items():
+                                setattr(self.items[path], key, value)
+                            self._schedule_debounced_save([path])
+                    log(f"Updated fields from 'gallery added' hook: {ext_fields}", level="info", category="hooks")
+                    # Emit signal through parent if available
+                    if hasattr(self, 'parent') and self.parent and hasattr(self.parent, 'on_ext_fields_updated'):
+                        self.parent.on_ext_fields_updated(path, ext_fields)
+            except Exception as e:
+                log(f"Error executing added hook: {e}", level="warning", category="hooks")
+
+        def queue_added_hooks():
+            # Submitting blocks while the 'added' queue is full, so feed it from a thread
+            scheduler = get_hook_scheduler()
+            for path, gallery_name, tab_name in entries:
+                scheduler.submit('added', lambda p=path, n=gallery_name, t=tab_name: run_added_hook(p, n, t))
+
+        threading.Thread(target=queue_added_hooks, daemon=True).start()
+
+    def get_scan_queue_status(self) -> Dict[str, int]:
+        """Scan backlog for the status bar indicator"""
+        with QMutexLocker(self.mutex):
+            pending = (self._status_counts.get(QUEUE_STATE_VALIDATING, 0)
+                       + self._status_counts.get(QUEUE_STATE_SCANNING, 0))
+        return {'queue_size': self._scan_queue.qsize(), 'items_pending_scan': pending}
     
     def start_item(self, path: str) -> bool:
         """Queue an item for upload"""
@@ -1069,21 +1274,43 @@ class QueueManager(QObject):
             old_status = item.status
             item.status = QUEUE_STATE_QUEUED
             self._update_status_count(old_status, QUEUE_STATE_QUEUED)
-            self.queue.put(item)
+            self._schedule_item(item)
             self._schedule_debounced_save([path])
             self._inc_version()
             return True
     
     def get_next_item(self) -> Optional[GalleryQueueItem]:
-        """Get next queued item"""
+        """Get next queued item in scheduler order"""
+        def still_queued(path: str) -> bool:
+            item = self.items.get(path)
+            return item is not None and item.status in [QUEUE_STATE_QUEUED, QUEUE_STATE_UPLOADING]
+
+        path = self.scheduler.pop(still_queued)
+        return self.items.get(path) if path is not None else None
+
+    def _schedule_item(self, item: GalleryQueueItem):
+        """Hand a queued item to the scheduler"""
+        self.scheduler.push(item.path, item.priority, item.total_size, item.tab_name)
+
+    def set_item_priority(self, path: str, priority: int) -> bool:
+        """Set an item's upload priority, re-ordering it if already queued"""
+        with QMutexLocker(self.mutex):
+            if path not in self.items:
+                return False
+            item = self.items[path]
+            item.priority = clamp_priority(priority)
+            self.scheduler.update(path, priority=item.priority)
+            self._schedule_debounced_save([path])
+            self._inc_version()
+            return True
+
+    def set_scheduler_policy(self, policy: SchedulerPolicy):
+        """Change how queued items are ordered and remember it"""
+        self.scheduler.set_policy(policy)
         try:
-            item = self.queue.get_nowait()
-            if item.path in self.items:
-                if self.items[item.path].status in [QUEUE_STATE_QUEUED, QUEUE_STATE_UPLOADING]:
-                    return item
-            return self.get_next_item()  # Try next
-        except queue.Empty:
-            return None
+            policy.save(self.settings)
+        except Exception as e:
+            log(f"Could not save scheduler settings: {e}", level="warning", category="queue")
     
     def update_custom_field(self, path: str, field_name: str, value: str):
         """Update a custom field for an item"""
@@ -1107,6 +1334,8 @@ class QueueManager(QObject):
             if path in self.items:
                 old_status = self.items[path].status
                 self.items[path].status = status
+                if status not in (QUEUE_STATE_QUEUED, QUEUE_STATE_UPLOADING):
+                    self.scheduler.discard(path)
                 
                 # When marking as completed, ensure progress is 100%
                 if status == "completed":
@@ -1138,6 +1367,7 @@ class QueueManager(QObject):
             
             old_status = self.items[path].status
             self._update_status_count(old_status, "")
+            self.scheduler.discard(path)
             del self.items[path]
             self._renumber_items()
             self._inc_version()
@@ -0,0 +1,244 @@
+"""
+Upload order for queued galleries.
+
+QueueManager.get_next_item used to hand out queued galleries first in,
+first out. QueueScheduler keeps them in heaps ordered by a virtual deadline
+instead:
+
+    deadline = queued_at - priority * priority_step + size penalty
+
+so a gallery behaves as if it had been queued priority_step seconds earlier
+per priority level, and, with shortest_first, size_step seconds later per
+GiB (capped at max_size_delay). Since priorities and the size penalty are
+bounded, a gallery queued at t always runs before anything queued after
+t + (the largest bonus): waiting ages every gallery towards the front and
+nothing starves. With the default policy every deadline is the queue time,
+which is the old FIFO order.
+
+With tab_weights set, each tab gets its own heap and tabs take turns by
+stride scheduling: a tab with weight 2 gets twice the uploads of a tab with
+weight 1 while both have galleries queued. Tabs not listed have weight 1; a
+weight of 0 holds the tab's galleries until the weights change. The tab is
+fixed when a gallery is queued.
+
+Entries are replaced or dropped when a gallery is re-queued, re-prioritised
+or leaves the queued state; stale entries are skipped when popped.
+"""
+
+from __future__ import annotations
+
+import heapq
+import itertools
+import json
+import threading
+import time
+from dataclasses import dataclass, field
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from src.utils.logger import log
+
+PRIORITY_LOW = -1
+PRIORITY_NORMAL = 0
+PRIORITY_HIGH = 1
+PRIORITY_URGENT = 2
+
+PRIORITY_NAMES = {
+    PRIORITY_URGENT: "Urgent",
+    PRIORITY_HIGH: "High",
+    PRIORITY_NORMAL: "Normal",
+    PRIORITY_LOW: "Low",
+}
+
+GIB = 1024 ** 3
+
+# QSettings keys (QueueManager settings)
+SETTINGS_PREFIX = "scheduler/"
+
+
+def clamp_priority(priority: Any) -> int:
+    """Priority limited to PRIORITY_LOW..PRIORITY_URGENT (invalid values are normal)."""
+    try:
+        return max(PRIORITY_LOW, min(PRIORITY_URGENT, int(priority)))
+    except (TypeError, ValueError):
+        return PRIORITY_NORMAL
+
+
+@dataclass
+class SchedulerPolicy:
+    """How queued galleries are ordered."""
+
+    priority_step: float = 600.0    # seconds of waiting one priority level is worth
+    shortest_first: bool = False    # small galleries first (by total_size)
+    size_step: float = 300.0        # seconds of waiting added per GiB with shortest_first
+    max_size_delay: float = 3600.0  # cap on the size penalty
+    tab_weights: Dict[str, float] = field(default_factory=dict)  # upload share per tab; 0 holds the tab
+
+    def deadline(self, priority: int, size: int, queued_at: float) -> float:
+        """Virtual deadline of a gallery; lower runs first."""
+        deadline = queued_at - clamp_priority(priority) * self.priority_step
+        if self.shortest_first:
+            deadline += min(max(0, size) / GIB * self.size_step, self.max_size_delay)
+        return deadline
+
+    def weight(self, tab: str) -> float:
+        return max(0.0, float(self.tab_weights.get(tab, 1.0)))
+
+    @classmethod
+    def from_settings(cls, settings: Any) -> "SchedulerPolicy":
+        """Policy stored in QSettings; defaults for missing or unreadable values."""
+        policy = cls()
+        try:
+            step = settings.value(SETTINGS_PREFIX + "priority_step", None)
+            if isinstance(step, (str, int, float)):
+                policy.priority_step = max(0.0, float(step))
+            shortest = settings.value(SETTINGS_PREFIX + "shortest_first", None)
+            if isinstance(shortest, (str, bool)):
+                policy.shortest_first = shortest is True or str(shortest).lower() == "true"
+            weights = settings.value(SETTINGS_PREFIX + "tab_weights", None)
+            if isinstance(weights, str) and weights:
+                policy.tab_weights = {str(tab): float(w) for tab, w in json.loads(weights).items()}
+        except (ValueError, TypeError, AttributeError) as e:
+            log(f"Ignoring invalid scheduler settings: {e}", level="warning", category="queue")
+        return policy
+
+    def save(self, settings: Any) -> None:
+        settings.setValue(SETTINGS_PREFIX + "priority_step", self.priority_step)
+        settings.setValue(SETTINGS_PREFIX + "shortest_first", self.shortest_first)
+        settings.setValue(SETTINGS_PREFIX + "tab_weights", json.dumps(self.tab_weights))
+
+
+@dataclass
+class _Queued:
+    priority: int
+    size: int
+    tab: str
+    queued_at: float
+    entry: List[Any]  # [deadline, seq, path]; path is None once stale
+
+
+class QueueScheduler:
+    """Heap-backed order of queued galleries (thread-safe)."""
+
+    def __init__(self, policy: Optional[SchedulerPolicy] = None):
+        self._policy = policy or SchedulerPolicy()
+        self._lock = threading.Lock()
+        self._seq = itertools.count()
+        self._queued: Dict[str, _Queued] = {}
+        self._lanes: Dict[str, List[List[Any]]] = {}
+        self._live: Dict[str, int] = {}             # live entries per lane
+        self._lane_heap: List[Tuple[float, int, str]] = []  # (pass, seq, lane) of runnable lanes
+        self._lane_scheduled: set = set()
+        self._pass: Dict[str, float] = {}
+        self._vtime = 0.0
+
+    @property
+    def policy(self) -> SchedulerPolicy:
+        return self._policy
+
+    def set_policy(self, policy: SchedulerPolicy) -> None:
+        """Switch policy and re-order everything queued."""
+        with self._lock:
+            self._policy = policy
+            queued = sorted(self._queued.items(), key=lambda kv: kv[1].entry[1])
+            self._queued.clear()
+            self._lanes.clear()
+            self._live.clear()
+            self._lane_heap.clear()
+            self._lane_scheduled.clear()
+            self._pass.clear()
+            self._vtime = 0.0
+            for path, q in queued:
+                self._push(path, q.priority, q.size, q.tab, q.queued_at)
+
+    def push(self, path: str, priority: int = PRIORITY_NORMAL, size: int = 0, tab: str = "Main",
+             queued_at: Optional[float] = None) -> None:
+        """Queue a gallery (replacing an earlier entry for the same path)."""
+        with self._lock:
+            self._discard(path)
+            self._push(path, clamp_priority(priority), size, tab, time.time() if queued_at is None else queued_at)
+
+    def update(self, path: str, priority: Optional[int] = None, size: Optional[int] = None) -> bool:
+        """Re-order a queued gallery, keeping its queue time; False if it is not queued."""
+        with self._lock:
+            q = self._queued.get(path)
+            if q is None:
+                return False
+            self._discard(path)
+            self._push(path, q.priority if priority is None else clamp_priority(priority),
+                       q.size if size is None else size, q.tab, q.queued_at)
+            return True
+
+    def discard(self, path: str) -> None:
+        with self._lock:
+            self._discard(path)
+
+    def pop(self, accept: Optional[Callable[[str], bool]] = None) -> Optional[str]:
+        """Next gallery to upload, or None.
+
+        Entries for which accept(path) is False are dropped without using up
+        their tab's turn.
+        """
+        with self._lock:
+            while self._lane_heap:
+                lane_pass, _, lane = heapq.heappop(self._lane_heap)
+                self._lane_scheduled.discard(lane)
+                heap = self._lanes.get(lane, [])
+                path = None
+                while heap and path is None:
+                    entry = heapq.heappop(heap)
+                    if entry[2] is None:
+                        continue
+                    candidate = entry[2]
+                    self._forget(candidate, lane)
+                    if accept is None or accept(candidate):
+                        path = candidate
+                if path is None:
+                    continue
+                self._vtime = lane_pass
+                self._pass[lane] = lane_pass + 1.0 / self._lane_weight(lane)
+                self._schedule_lane(lane)
+                return path
+            return None
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._queued)
+
+    def __contains__(self, path: str) -> bool:
+        with self._lock:
+            return path in self._queued
+
+    # Internals (lock held)
+
+    def _lane_of(self, tab: str) -> str:
+        return tab if self._policy.tab_weights else ""
+
+    def _lane_weight(self, lane: str) -> float:
+        return self._policy.weight(lane) if lane else 1.0
+
+    def _push(self, path: str, priority: int, size: int, tab: str, queued_at: float) -> None:
+        entry = [self._policy.deadline(priority, size, queued_at), next(self._seq), path]
+        self._queued[path] = _Queued(priority, size, tab, queued_at, entry)
+        lane = self._lane_of(tab)
+        heapq.heappush(self._lanes.setdefault(lane, []), entry)
+        self._live[lane] = self._live.get(lane, 0) + 1
+        if lane not in self._lane_scheduled:
+            # An idle tab resumes at the current virtual time rather than with saved-up turns
+            self._pass[lane] = max(self._pass.get(lane, 0.0), self._vtime)
+            self._schedule_lane(lane)
+
+    def _schedule_lane(self, lane: str) -> None:
+        if self._live.get(lane, 0) > 0 and self._lane_weight(lane) > 0 and lane not in self._lane_scheduled:
+            heapq.heappush(self._lane_heap, (self._pass[lane], next(self._seq), lane))
+            self._lane_scheduled.add(lane)
+
+    def _forget(self, path: str, lane: str) -> None:
+        del self._queued[path]
+        self._live[lane] -= 1
+
+    def _discard(self, path: str) -> None:
+        q = self._queued.get(path)
+        if q is None:
+            return
+        q.entry[2] = None
+        self._forget(path, self._lane_of(q.tab))
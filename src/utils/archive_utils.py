@@ -5,6 +5,7 @@ Handles archive detection, validation, and path inspection
 """
 
 import os
+import re
 from pathlib import Path
 from typing import Optional
 
@@ -15,6 +16,16 @@ SUPPORTED_ARCHIVE_EXTENSIONS = {
     '.cbz',  # Comic book ZIP archive
 }
 
+# Separator between archive path and inner directory in archive gallery paths,
+# e.g. "C:/dl/set.zip::photos/day1" (empty inner part = archive root)
+ARCHIVE_GALLERY_SEPARATOR = '::'
+
+_ARCHIVE_GALLERY_RE = re.compile(
+    r'^(?P<archive>.+?\.(?:' + '|'.join(ext.lstrip('.') for ext in sorted(SUPPORTED_ARCHIVE_EXTENSIONS)) + r'))'
+    + re.escape(ARCHIVE_GALLERY_SEPARATOR) + r'(?P<inner>.*)$',
+    re.IGNORECASE
+)
+
 
 def is_archive_file(path: str | Path) -> bool:
     """Check if a file is a supported archive format
@@ -161,3 +172,91 @@ def find_folders_with_files(root_dir: str | Path) -> list[Path]:
     return folders_with_files
 
 
+def make_archive_gallery_path(archive_path: str | Path, inner_dir: str = '') -> str:
+    """Build the virtual path of a gallery stored inside an archive
+
+    Args:
+        archive_path: Path to archive file
+        inner_dir: Directory inside the archive ('' for the archive root)
+
+    Returns:
+        Virtual gallery path ("<archive>::<inner_dir>")
+    """
+    inner = str(inner_dir or '').replace('\\', '/').strip('/')
+    return f"{archive_path}{ARCHIVE_GALLERY_SEPARATOR}{inner}"
+
+
+def is_archive_gallery_path(path: str | Path) -> bool:
+    """Check if a path refers to a gallery inside an archive
+
+    Args:
+        path: Path to check
+
+    Returns:
+        True if path is a virtual archive gallery path
+    """
+    if not path:
+        return False
+    return _ARCHIVE_GALLERY_RE.match(str(path)) is not None
+
+
+def split_archive_gallery_path(path: str | Path) -> tuple[str, str]:
+    """Split a virtual archive gallery path
+
+    Args:
+        path: Virtual gallery path
+
+    Returns:
+        Tuple of (archive path, inner directory using '/' separators)
+
+    Raises:
+        ValueError: If path is not an archive gallery path
+    """
+    match = _ARCHIVE_GALLERY_RE.match(str(path))
+    if not match:
+        raise ValueError(f"Not an archive gallery path: {path}")
+    inner = match.group('inner').replace('\\', '/').strip('/')
+    return match.group('archive'), inner
+
+
+def gallery_exists(path: str | Path) -> bool:
+    """Check that a gallery folder, or the archive of an archive gallery, exists
+
+    Args:
+        path: Gallery folder or virtual archive gallery path
+
+    Returns:
+        True if the gallery can be read
+    """
+    if is_archive_gallery_path(path):
+        return os.path.isfile(split_archive_gallery_path(path)[0])
+    return os.path.isdir(path)
+
+
+def get_gallery_location(path: str | Path) -> str:
+    """Get the folder to show in the file manager for a gallery
+
+    Args:
+        path: Gallery folder or virtual archive gallery path
+
+    Returns:
+        The gallery folder, or the folder holding the archive of an archive gallery
+    """
+    if is_archive_gallery_path(path):
+        return os.path.dirname(split_archive_gallery_path(path)[0])
+    return str(path)
+
+
+def get_archive_gallery_name(path: str | Path) -> str:
+    """Get the display name of a gallery inside an archive
+
+    Args:
+        path: Virtual gallery path
+
+    Returns:
+        Inner directory name, or the archive name for the archive root
+    """
+    archive_path, inner = split_archive_gallery_path(path)
+    if inner:
+        return inner.rsplit('/', 1)[-1]
+    return get_archive_name(archive_path)
@@ -1,18 +1,127 @@
 """
 Artifact finder utility for locating gallery JSON and BBCode files by gallery ID.
+
+Lookups go through the artifact index (src.storage.artifact_index), so finding
+an artifact costs one query and a stat instead of a directory scan. The
+central store and .uploaded folders are only globbed when the index cannot be
+used, or for a gallery's own .uploaded folder when it has nothing indexed.
 """
 import os
 import glob
-from typing import Optional
+from typing import Dict, Iterable, List, Optional, Tuple
+
+from src.utils.logger import log
+
+
+def _central_storage_path() -> str:
+    try:
+        from bbdrop import get_central_storage_path
+        return get_central_storage_path()
+    except (ImportError, Exception):
+        # Fallback to hardcoded path if imports fail
+        return os.path.join(os.path.expanduser("~"), ".bbdrop", "galleries")
+
+
+def _uploaded_dir(gallery_path: Optional[str]) -> Optional[str]:
+    return os.path.normpath(os.path.join(gallery_path, ".uploaded")) if gallery_path else None
+
+
+def _glob_gallery_json(gallery_id: str, gallery_path: Optional[str] = None,
+                       include_central: bool = True) -> Optional[str]:
+    """Directory-scan lookup, used when the index is unavailable."""
+    search_locations = []
+    uploaded_dir = _uploaded_dir(gallery_path)
+    if uploaded_dir and os.path.exists(uploaded_dir):
+        search_locations.append(uploaded_dir)
+    if include_central:
+        central_path = _central_storage_path()
+        if os.path.exists(central_path):
+            search_locations.append(central_path)
+
+    for location in search_locations:
+        pattern = os.path.join(glob.escape(location), f"*_{glob.escape(gallery_id)}.json")
+        matches = glob.glob(pattern)
+        if matches:
+            # Return the most recent match
+            return sorted(matches, key=os.path.getmtime, reverse=True)[0]
+    return None
+
+
+def _select_artifact(artifacts: List[dict], gallery_path: Optional[str]) -> Optional[dict]:
+    """Prefer the gallery's own .uploaded artifact, then the newest central one."""
+    uploaded_dir = _uploaded_dir(gallery_path)
+    if uploaded_dir:
+        for artifact in artifacts:
+            if os.path.dirname(os.path.normpath(artifact['json_path'])) == uploaded_dir:
+                return artifact
+    for artifact in artifacts:
+        if artifact.get('location') != 'uploaded':
+            return artifact
+    return None
+
+
+def find_gallery_jsons_by_ids(galleries: Iterable[Tuple[str, Optional[str]]], store=None) -> Dict[str, str]:
+    """
+    Find JSON artifact files for many galleries with one index query.
 
+    Args:
+        galleries: (gallery_id, gallery_path or None) pairs
+        store: Optional QueueStore instance
 
-def find_gallery_json_by_id(gallery_id: str, gallery_path: Optional[str] = None) -> Optional[str]:
+    Returns:
+        Dict mapping gallery ID -> JSON path. Galleries without an artifact are omitted.
+        Prefers the gallery's .uploaded location if both exist.
     """
-    Find JSON artifact file by gallery ID pattern (*_{gallery_id}.json).
+    galleries = [(gallery_id, gallery_path) for gallery_id, gallery_path in galleries if gallery_id]
+    if not galleries:
+        return {}
+
+    try:
+        from src.storage.artifact_index import find_artifacts_by_gallery_ids, index_artifact_files
+        indexed = find_artifacts_by_gallery_ids((gallery_id for gallery_id, _ in galleries), store)
+    except Exception as e:
+        log(f"Artifact index lookup failed, scanning artifact folders: {e}",
+            level="warning", category="fileio")
+        found = {}
+        for gallery_id, gallery_path in galleries:
+            json_path = _glob_gallery_json(gallery_id, gallery_path)
+            if json_path:
+                found[gallery_id] = json_path
+        return found
+
+    found = {}
+    unindexed = []
+    for gallery_id, gallery_path in galleries:
+        artifact = _select_artifact(indexed.get(gallery_id, []), gallery_path)
+        uploaded_dir = _uploaded_dir(gallery_path)
+        own_upload = artifact is not None and uploaded_dir is not None and \
+            os.path.dirname(os.path.normpath(artifact['json_path'])) == uploaded_dir
+        if gallery_path and not own_upload:
+            # .uploaded artifacts written before the index existed: scan that one folder
+            json_path = _glob_gallery_json(gallery_id, gallery_path, include_central=False)
+            if json_path:
+                found[gallery_id] = json_path
+                unindexed.append(json_path)
+                continue
+        if artifact is not None:
+            found[gallery_id] = artifact['json_path']
+
+    if unindexed:
+        try:
+            index_artifact_files(unindexed, 'uploaded', store)
+        except Exception as e:
+            log(f"Could not index .uploaded artifacts: {e}", level="debug", category="fileio")
+    return found
+
+
+def find_gallery_json_by_id(gallery_id: str, gallery_path: Optional[str] = None, store=None) -> Optional[str]:
+    """
+    Find JSON artifact file for a gallery ID ({name}_{gallery_id}.json).
 
     Args:
         gallery_id: The gallery ID to search for (e.g., "1gq6n")
         gallery_path: Optional path to check for .uploaded subfolder first
+        store: Optional QueueStore instance
 
     Returns:
         Path to JSON file if found, None otherwise.
@@ -20,34 +129,33 @@ def find_gallery_json_by_id(gallery_id: str, gallery_path: Optional[str] = None)
     """
     if not gallery_id:
         return None
+    return find_gallery_jsons_by_ids([(gallery_id, gallery_path)], store).get(gallery_id)
 
-    search_locations = []
 
-    # Check .uploaded subfolder first if gallery_path provided
-    if gallery_path:
-        uploaded_dir = os.path.join(gallery_path, ".uploaded")
-        if os.path.exists(uploaded_dir):
-            search_locations.append(uploaded_dir)
+def find_gallery_bbcode_by_id(gallery_id: str, store=None) -> Optional[str]:
+    """
+    Find the central BBCode artifact for a gallery ID ({name}_{gallery_id}_bbcode.txt).
 
-    # Check central storage
-    try:
-        from bbdrop import get_central_storage_path
-        central_path = get_central_storage_path()
-        if os.path.exists(central_path):
-            search_locations.append(central_path)
-    except (ImportError, Exception):
-        # Fallback to hardcoded path if imports fail
-        home = os.path.expanduser("~")
-        fallback_central = os.path.join(home, ".bbdrop", "galleries")
-        if os.path.exists(fallback_central):
-            search_locations.append(fallback_central)
+    Used when the BBCode file is not under the gallery's current name
+    (e.g. the gallery was renamed after upload).
 
-    # Search for files matching the pattern
-    for location in search_locations:
-        pattern = os.path.join(location, f"*_{gallery_id}.json")
+    Returns:
+        Path to the newest BBCode file if found, None otherwise.
+    """
+    if not gallery_id:
+        return None
+    try:
+        from src.storage.artifact_index import find_artifacts_by_gallery_ids
+        artifacts = find_artifacts_by_gallery_ids([gallery_id], store).get(gallery_id, [])
+    except Exception as e:
+        log(f"Artifact index lookup failed, scanning central store: {e}",
+            level="warning", category="fileio")
+        pattern = os.path.join(glob.escape(_central_storage_path()), f"*_{glob.escape(gallery_id)}_bbcode.txt")
         matches = glob.glob(pattern)
-        if matches:
-            # Return the first match (most recent if multiple exist)
-            return sorted(matches, key=os.path.getmtime, reverse=True)[0]
+        return sorted(matches, key=os.path.getmtime, reverse=True)[0] if matches else None
 
-    return None
\ No newline at end of file
+    for artifact in artifacts:
+        bbcode_path = artifact.get('bbcode_path')
+        if artifact.get('location') != 'uploaded' and bbcode_path and os.path.exists(bbcode_path):
+            return bbcode_path
+    return None
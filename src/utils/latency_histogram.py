@@ -0,0 +1,121 @@
+"""
+Log-bucketed histograms for latency and throughput metrics.
+
+Values are counted in buckets whose boundaries grow geometrically (HDR-style),
+so every recorded value is reproduced within a fixed relative error regardless
+of magnitude. Histograms are sparse, mergeable and serialize to compact JSON,
+which makes them suitable for storing pre-aggregated time buckets in SQLite.
+"""
+
+from __future__ import annotations
+
+import json
+import math
+from typing import Dict, Iterable, Optional
+
+# Bucket growth factor: each bucket is ~4% wider than the previous one,
+# i.e. reported percentiles are within ~2% of the true value.
+BUCKET_GROWTH = 1.04
+_LOG_GROWTH = math.log(BUCKET_GROWTH)
+
+# Values at or below this are counted in a single "zero" bucket
+MIN_TRACKABLE_VALUE = 1e-6
+
+_ZERO_BUCKET = -(2 ** 31)
+
+
+def bucket_index(value: float) -> int:
+    """Return the bucket index for a value."""
+    if value <= MIN_TRACKABLE_VALUE:
+        return _ZERO_BUCKET
+    return math.floor(math.log(value) / _LOG_GROWTH)
+
+
+def bucket_value(index: int) -> float:
+    """Return the representative (geometric midpoint) value of a bucket."""
+    if index == _ZERO_BUCKET:
+        return 0.0
+    return BUCKET_GROWTH ** (index + 0.5)
+
+
+class LogHistogram:
+    """Sparse log-bucketed histogram with exact count, sum, min and max."""
+
+    __slots__ = ('counts', 'count', 'total', 'min', 'max')
+
+    def __init__(self):
+        self.counts: Dict[int, int] = {}
+        self.count = 0
+        self.total = 0.0
+        self.min: Optional[float] = None
+        self.max: Optional[float] = None
+
+    def record(self, value: float, count: int = 1) -> None:
+        """Record a value (negative values are clamped to zero)."""
+        value = max(0.0, float(value))
+        index = bucket_index(value)
+        self.counts[index] = self.counts.get(index, 0) + count
+        self.count += count
+        self.total += value * count
+        self.min = value if self.min is None else min(self.min, value)
+        self.max = value if self.max is None else max(self.max, value)
+
+    def merge(self, other: LogHistogram) -> LogHistogram:
+        """Add the contents of another histogram to this one (returns self)."""
+        if not other.count:
+            return self
+        for index, n in other.counts.items():
+            self.counts[index] = self.counts.get(index, 0) + n
+        self.count += other.count
+        self.total += other.total
+        self.min = other.min if self.min is None else min(self.min, other.min)
+        self.max = other.max if self.max is None else max(self.max, other.max)
+        return self
+
+    @property
+    def mean(self) -> float:
+        return self.total / self.count if self.count else 0.0
+
+    def percentile(self, pct: float) -> float:
+        """Value at the given percentile (0-100), clamped to the observed range."""
+        if not self.count:
+            return 0.0
+        rank = max(1, math.ceil(self.count * min(max(pct, 0.0), 100.0) / 100.0))
+        seen = 0
+        for index in sorted(self.counts):
+            seen += self.counts[index]
+            if seen >= rank:
+                return min(max(bucket_value(index), self.min), self.max)
+        return self.max or 0.0
+
+    def percentiles(self, pcts: Iterable[float]) -> Dict[float, float]:
+        """Values for several percentiles."""
+        return {p: self.percentile(p) for p in pcts}
+
+    def to_json(self) -> str:
+        return json.dumps({
+            'c': {str(k): v for k, v in self.counts.items()},
+            'n': self.count,
+            's': self.total,
+            'lo': self.min,
+            'hi': self.max,
+        }, separators=(',', ':'))
+
+    @classmethod
+    def from_json(cls, data: str) -> LogHistogram:
+        hist = cls()
+        if not data:
+            return hist
+        payload = json.loads(data)
+        hist.counts = {int(k): int(v) for k, v in payload.get('c', {}).items()}
+        hist.count = int(payload.get('n', 0))
+        hist.total = float(payload.get('s', 0.0))
+        hist.min = payload.get('lo')
+        hist.max = payload.get('hi')
+        return hist
+
+    def __len__(self) -> int:
+        return self.count
+
+    def __repr__(self) -> str:
+        return f"LogHistogram(count={self.count}, min={self.min}, max={self.max})"
@@ -0,0 +1,414 @@
+"""
+Line-offset index and queries over log files for the log viewer.
+
+LogLineIndex records where each line starts, so any line can be read back
+without holding the log in memory:
+
+- plain files are memory-mapped while they are scanned for newlines;
+  update() then indexes only the bytes appended since (tail-follow)
+- .gz archives are inflated once, keeping a zlib checkpoint every
+  GZ_CHECKPOINT_SPACING bytes of output, so reading a line inflates at most
+  one checkpoint span (each checkpoint holds a copy of the 32 KB window)
+- text passed in directly (LogLineIndex.from_text)
+
+build() and update() are meant for one worker thread; line() may be called
+from the GUI thread at the same time. find_matches() runs a LogQuery over a
+range of lines and yields matching line numbers in chunks, newest first.
+"""
+
+from __future__ import annotations
+
+import bisect
+import mmap
+import os
+import re
+import threading
+import zlib
+from array import array
+from collections import OrderedDict
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Callable, FrozenSet, Iterator, List, Optional, Tuple
+
+BLOCK_SIZE = 256 * 1024           # bytes per cached read block of a plain file
+GZ_CHECKPOINT_SPACING = 4 * 1024 * 1024  # inflated bytes between gzip checkpoints (one cached block)
+SCAN_WINDOW = 8 * 1024 * 1024     # bytes scanned for newlines between cancellation checks
+CACHED_BLOCKS = 8
+CACHED_GZ_BLOCKS = 2
+_GZ_READ_SIZE = 64 * 1024
+
+_NEWLINE = re.compile(b"\n")
+
+LEVEL_VALUES = {
+    "trace": 5,
+    "debug": 10,
+    "info": 20,
+    "warning": 30,
+    "error": 40,
+    "critical": 50,
+}
+
+_LEVEL_PREFIXES = ("TRACE:", "DEBUG:", "INFO:", "WARNING:", "ERROR:", "CRITICAL:")
+
+StopCheck = Optional[Callable[[], bool]]
+
+
+class IndexCancelled(Exception):
+    """Raised by build()/update() when should_stop() returns True."""
+
+
+def parse_log_line(line: str) -> Tuple[str, str, str, str]:
+    """Split a log file line into (timestamp, level, category, message).
+
+    Lines start with "YYYY-MM-DD HH:MM:SS" (file format) or "HH:MM:SS"
+    (dated today), then an optional level prefix and [category:subtype] tag.
+    """
+    try:
+        if len(line) >= 19 and line[4] == '-' and line[7] == '-' and line[10] == ' ' \
+                and line[13] == ':' and line[16] == ':':
+            timestamp = line[:19]
+            rest = line[20:].lstrip()
+        elif len(line) >= 8 and line[2] == ':' and line[5] == ':':
+            timestamp = f"{datetime.now().strftime('%Y-%m-%d')} {line[:8]}"
+            rest = line[9:].lstrip()
+        else:
+            timestamp = ""
+            rest = line
+
+        level = "INFO"
+        for prefix in _LEVEL_PREFIXES:
+            if rest.startswith(prefix):
+                level = prefix[:-1]
+                rest = rest[len(prefix):].lstrip()
+                break
+
+        category = "general"
+        if rest.startswith("[") and "]" in rest:
+            close_idx = rest.find("]")
+            tag = rest[1:close_idx]
+            category = tag.split(":")[0] if ":" in tag else tag
+            message = rest[close_idx + 1:].lstrip()
+        else:
+            message = rest
+        return timestamp, level, category, message
+    except Exception:
+        return "", "INFO", "general", line
+
+
+def decode_unicode(text: str) -> str:
+    """Decode escape sequences like \\u2713 written by the logger into characters."""
+    if "\\" not in text:
+        return text
+    try:
+        return text.encode('utf-8').decode('unicode_escape')
+    except Exception:
+        return text
+
+
+@dataclass(frozen=True)
+class LogQuery:
+    """Which lines the viewer shows."""
+    min_level: int = 0                            # LEVEL_VALUES threshold (0 = all)
+    hidden_categories: FrozenSet[str] = frozenset()
+    pattern: str = ""                             # lowercase find text
+
+    @property
+    def matches_everything(self) -> bool:
+        return not self.min_level and not self.hidden_categories and not self.pattern
+
+    def matches(self, entry: Tuple[str, str, str, str]) -> bool:
+        """Test a parsed (timestamp, level, category, message) entry."""
+        timestamp, level, category, message = entry
+        if self.min_level and LEVEL_VALUES.get(level.lower(), 20) < self.min_level:
+            return False
+        if category in self.hidden_categories:
+            return False
+        if self.pattern:
+            pattern = self.pattern
+            return (pattern in timestamp.lower() or pattern in level.lower()
+                    or pattern in category.lower() or pattern in decode_unicode(message).lower())
+        return True
+
+
+def find_matches(index: LogLineIndex, query: LogQuery, start: int, stop: int,
+                 chunk_size: int = 2000, should_stop: StopCheck = None) -> Iterator[List[int]]:
+    """Yield line numbers in [start, stop) matching query, newest (highest) first.
+
+    Results come in chunks of up to chunk_size so a viewer can show the first
+    matches while the rest of the file is still being searched.
+    """
+    if query.matches_everything:
+        for high in range(stop, start, -chunk_size):
+            if should_stop and should_stop():
+                return
+            yield list(range(high - 1, max(start, high - chunk_size) - 1, -1))
+        return
+
+    found: List[int] = []
+    for lineno in range(stop - 1, start - 1, -1):
+        if lineno % 1024 == 0 and should_stop and should_stop():
+            return
+        if query.matches(parse_log_line(index.line(lineno))):
+            found.append(lineno)
+            if len(found) >= chunk_size:
+                yield found
+                found = []
+    if found:
+        yield found
+
+
+class LogLineIndex:
+    """Start offsets of every line in a log file (or text)."""
+
+    def __init__(self, path: Optional[str] = None, tail_bytes: Optional[int] = None,
+                 data: Optional[bytes] = None):
+        """Create an unbuilt index; call build() (off the GUI thread for files).
+
+        Args:
+            path: Log file (.gz archives are inflated)
+            tail_bytes: Only index lines in the last tail_bytes of the log
+            data: Log contents, instead of a path
+        """
+        self.path = path
+        self.tail_bytes = tail_bytes
+        self.compressed = bool(path) and str(path).endswith(".gz")
+        self._data = data
+        self._lock = threading.Lock()
+        self._offsets = array('Q')   # start of each indexed line
+        self._end = 0                # end of the last indexed line
+        self._identity: Optional[Tuple[int, int]] = None  # (st_dev, st_ino) of the indexed file
+        # gzip checkpoints: (output offset, input offset, decompressor at that point)
+        self._checkpoints: List[Tuple[int, int, object]] = []
+        self._checkpoint_outs: List[int] = []
+        self._blocks: OrderedDict = OrderedDict()  # block number -> bytes
+
+    @classmethod
+    def from_text(cls, text: str) -> LogLineIndex:
+        return cls(data=(text or "").encode("utf-8"))
+
+    @property
+    def is_file(self) -> bool:
+        return self._data is None
+
+    def __len__(self) -> int:
+        return len(self._offsets)
+
+    # ------------------------------------------------------------------ build
+
+    def build(self, should_stop: StopCheck = None) -> int:
+        """Index the whole source (or its tail) and return the line count."""
+        if self._data is not None:
+            starts, end = self._scan(self._data, 0, len(self._data), should_stop)
+            if end < len(self._data):  # last line without a newline
+                starts.append(end)
+                end = len(self._data)
+            self._publish(starts, end, replace=True)
+        elif self.compressed:
+            self._build_compressed(should_stop)
+        else:
+            self._build_plain(should_stop)
+        return len(self)
+
+    def update(self, should_stop: StopCheck = None) -> Optional[Tuple[int, int]]:
+        """Index lines appended to a plain file since the last build()/update().
+
+        Returns:
+            (first, end) range of new line numbers (empty when nothing was
+            appended), or None when the file was truncated or replaced
+            (e.g. rotated) and needs a new build().
+        """
+        count = len(self)
+        if self._data is not None or self.compressed:
+            return count, count
+        try:
+            st = os.stat(self.path)
+        except OSError:
+            return None
+        if (st.st_dev, st.st_ino) != self._identity or st.st_size < self._end:
+            return None
+        if st.st_size == self._end:
+            return count, count
+        with open(self.path, "rb") as f:
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                starts, end = self._scan(mm, self._end, len(mm), should_stop)
+        if starts:
+            self._publish(starts, end)
+        return count, len(self)
+
+    def _build_plain(self, should_stop: StopCheck) -> None:
+        st = os.stat(self.path)
+        self._identity = (st.st_dev, st.st_ino)
+        if st.st_size == 0:
+            self._publish(array('Q'), 0, replace=True)
+            return
+        with open(self.path, "rb") as f:
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                size = len(mm)
+                start = 0
+                if self.tail_bytes and size > self.tail_bytes:
+                    # First line that starts inside the tail
+                    nl = mm.find(b"\n", size - self.tail_bytes - 1)
+                    start = nl + 1 if nl >= 0 else size
+                # Only complete lines: a partial last line is picked up by update()
+                starts, end = self._scan(mm, start, size, should_stop)
+        self._publish(starts, end, replace=True)
+
+    def _build_compressed(self, should_stop: StopCheck) -> None:
+        decompressor = zlib.decompressobj(31)
+        checkpoints = [(0, 0, decompressor.copy())]
+        starts = array('Q')
+        line_start = 0
+        out_total = 0
+        in_total = 0
+        with open(self.path, "rb") as f:
+            while True:
+                if should_stop and should_stop():
+                    raise IndexCancelled()
+                chunk = f.read(_GZ_READ_SIZE)
+                if not chunk:
+                    break
+                in_total += len(chunk)
+                while chunk:
+                    data = decompressor.decompress(chunk)
+                    chunk = b""
+                    if decompressor.eof and decompressor.unused_data:
+                        # Concatenated gzip members
+                        chunk = decompressor.unused_data
+                        decompressor = zlib.decompressobj(31)
+                        if data:
+                            line_start = self._scan_piece(data, out_total, line_start, starts)
+                            out_total += len(data)
+                        if out_total - checkpoints[-1][0] >= GZ_CHECKPOINT_SPACING:
+                            checkpoints.append((out_total, in_total - len(chunk), decompressor.copy()))
+                        continue
+                    if data:
+                        line_start = self._scan_piece(data, out_total, line_start, starts)
+                        out_total += len(data)
+                if out_total - checkpoints[-1][0] >= GZ_CHECKPOINT_SPACING and not decompressor.eof:
+                    checkpoints.append((out_total, in_total, decompressor.copy()))
+        if line_start < out_total:
+            starts.append(line_start)
+        if self.tail_bytes and out_total > self.tail_bytes:
+            first = bisect.bisect_left(starts, out_total - self.tail_bytes)
+            starts = starts[first:]
+        with self._lock:
+            self._checkpoints = checkpoints
+            self._checkpoint_outs = [cp[0] for cp in checkpoints]
+        self._publish(starts, out_total, replace=True)
+
+    @staticmethod
+    def _scan_piece(data: bytes, base: int, line_start: int, starts: array) -> int:
+        """Record lines ending in one inflated piece; returns the open line's start."""
+        for match in _NEWLINE.finditer(data):
+            starts.append(line_start)
+            line_start = base + match.end()
+        return line_start
+
+    @staticmethod
+    def _scan(buf, pos: int, stop: int, should_stop: StopCheck) -> Tuple[array, int]:
+        """Starts of the complete lines in buf[pos:stop] and the end of the last one."""
+        starts = array('Q')
+        while pos < stop:
+            if should_stop and should_stop():
+                raise IndexCancelled()
+            window = min(stop, pos + SCAN_WINDOW)
+            ends = [m.end() for m in _NEWLINE.finditer(buf, pos, window)]
+            if not ends:
+                if window == stop:
+                    break
+                nl = buf.find(b"\n", window, stop)  # line longer than a window
+                if nl < 0:
+                    break
+                ends = [nl + 1]
+            starts.append(pos)
+            starts.extend(ends[:-1])
+            pos = ends[-1]
+        return starts, pos
+
+    def _publish(self, starts: array, end: int, replace: bool = False) -> None:
+        with self._lock:
+            if replace:
+                self._offsets = starts
+            else:
+                self._offsets.extend(starts)
+            self._end = end
+            self._blocks.clear()
+
+    # ------------------------------------------------------------------- read
+
+    def line(self, lineno: int) -> str:
+        """Text of one indexed line, without its line ending."""
+        with self._lock:
+            offsets = self._offsets
+            if lineno < 0 or lineno >= len(offsets):
+                return ""
+            start = offsets[lineno]
+            end = offsets[lineno + 1] if lineno + 1 < len(offsets) else self._end
+            raw = self._read(start, end)
+        return raw.decode("utf-8", errors="replace").rstrip("\r\n")
+
+    def _read(self, start: int, end: int) -> bytes:
+        if self._data is not None:
+            return self._data[start:end]
+        parts = []
+        pos = start
+        while pos < end:
+            block_start, block = self._block_at(pos)
+            if not block:
+                break
+            piece = block[pos - block_start:end - block_start]
+            parts.append(piece)
+            pos += len(piece)
+        return b"".join(parts)
+
+    def _block_at(self, pos: int) -> Tuple[int, bytes]:
+        """The cached block containing pos, as (block start offset, bytes)."""
+        if self.compressed:
+            number = bisect.bisect_right(self._checkpoint_outs, pos) - 1
+        else:
+            number = pos // BLOCK_SIZE
+        cached = self._blocks.get(number)
+        if cached is not None:
+            self._blocks.move_to_end(number)
+            return cached
+        cached = self._load_compressed_block(number) if self.compressed else self._load_plain_block(number)
+        self._blocks[number] = cached
+        if len(self._blocks) > (CACHED_GZ_BLOCKS if self.compressed else CACHED_BLOCKS):
+            self._blocks.popitem(last=False)
+        return cached
+
+    def _load_plain_block(self, number: int) -> Tuple[int, bytes]:
+        # Opened per block rather than held open, so log rotation can rename the file
+        start = number * BLOCK_SIZE
+        try:
+            with open(self.path, "rb") as f:
+                f.seek(start)
+                return start, f.read(min(BLOCK_SIZE, max(0, self._end - start)))
+        except OSError:
+            return start, b""
+
+    def _load_compressed_block(self, number: int) -> Tuple[int, bytes]:
+        out_start, in_start, state = self._checkpoints[number]
+        out_stop = (self._checkpoint_outs[number + 1]
+                    if number + 1 < len(self._checkpoints) else self._end)
+        decompressor = state.copy()
+        parts = []
+        produced = 0
+        try:
+            with open(self.path, "rb") as f:
+                f.seek(in_start)
+                while produced < out_stop - out_start:
+                    chunk = f.read(_GZ_READ_SIZE)
+                    if not chunk:
+                        break
+                    while chunk:
+                        data = decompressor.decompress(chunk)
+                        chunk = b""
+                        if decompressor.eof and decompressor.unused_data:
+                            chunk = decompressor.unused_data
+                            decompressor = zlib.decompressobj(31)
+                        parts.append(data)
+                        produced += len(data)
+        except (OSError, zlib.error):
+            pass
+        return out_start, b"".join(parts)[:out_stop - out_start]
@@ -19,15 +19,35 @@ import warnings
 from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta
 from queue import Queue, Empty
-from typing import Any, Dict, Optional
+from typing import Any, Dict, Iterable, Optional, Tuple
 
 from PyQt6.QtCore import QObject, pyqtSignal, QTimer
 
 # Access central data dir path from shared helper
 from bbdrop import get_central_store_base_path
+from src.utils.latency_histogram import LogHistogram
 
 logger = logging.getLogger(__name__)
 
+# Per-file latency metrics tracked as histograms:
+#   upload_time - seconds per file, speed - bytes/s, ttfb - seconds to first byte
+LATENCY_METRICS = ('upload_time', 'speed', 'ttfb')
+
+# Histogram rollup resolutions (bucket width in seconds)
+LATENCY_RESOLUTIONS = {'minute': 60, 'hour': 3600, 'day': 86400}
+
+# Minute buckets older than this are merged into hours, hours into days
+MINUTE_BUCKET_RETENTION = 2 * 86400
+HOUR_BUCKET_RETENTION = 30 * 86400
+
+# Seconds between writes of buffered latency samples
+LATENCY_FLUSH_INTERVAL = 5.0
+
+# Seconds between latency downsampling runs (the first runs when the store starts)
+LATENCY_DOWNSAMPLE_INTERVAL = 3600.0
+
+DEFAULT_PERCENTILES = (50, 90, 95, 99)
+
 
 class MetricsSignals(QObject):
     """Signals for metrics updates to UI components."""
@@ -102,6 +122,11 @@ class MetricsStore:
             #                         total_transfer_time, peak_speed, avg_speed, success_rate}}
             self._all_time_cache: Dict[str, Dict[str, Any]] = {}
 
+            # Latency histograms not yet written, keyed by (host, metric, minute_start)
+            self._latency_buffer: Dict[Tuple[str, str, int], LogHistogram] = {}
+            self._last_latency_flush = time.monotonic()
+            self._last_latency_downsample: Optional[float] = None
+
             # Write buffer queue
             self._write_queue: Queue = Queue()
             # CRITICAL FIX: Don't use ThreadPoolExecutor - use a manual daemon thread
@@ -188,6 +213,22 @@ class MetricsStore:
                         ON host_metrics(updated_ts DESC);
                     CREATE INDEX IF NOT EXISTS idx_host_metrics_host_period
                         ON host_metrics(host_name, period_type, period_date);
+
+                    CREATE TABLE IF NOT EXISTS latency_histograms (
+                        id INTEGER PRIMARY KEY,
+                        host_name TEXT NOT NULL,
+                        metric TEXT NOT NULL,
+                        resolution TEXT NOT NULL CHECK (resolution IN ('minute', 'hour', 'day')),
+                        bucket_start INTEGER NOT NULL,
+                        sample_count INTEGER DEFAULT 0,
+                        histogram TEXT NOT NULL,
+                        UNIQUE(host_name, metric, resolution, bucket_start)
+                    );
+
+                    CREATE INDEX IF NOT EXISTS idx_latency_host_metric
+                        ON latency_histograms(host_name, metric, bucket_start);
+                    CREATE INDEX IF NOT EXISTS idx_latency_resolution
+                        ON latency_histograms(resolution, bucket_start);
                 """)
                 logger.debug("Metrics database schema ensured")
             except Exception as e:
@@ -365,6 +406,179 @@ class MetricsStore:
         except Exception as e:
             logger.debug(f"Failed to emit metrics signals: {e}")
 
+    def record_latency(self, host_name: str, upload_time: float, bytes_uploaded: int = 0,
+                       ttfb: Optional[float] = None, timestamp: Optional[float] = None) -> None:
+        """
+        Record per-file latency samples into the host's histograms.
+
+        Samples are buffered in memory per minute and written by the
+        background worker; totals tracked by record_transfer() are not affected.
+
+        Args:
+            host_name: The host identifier (e.g., 'imx.to', 'rapidgator')
+            upload_time: Time taken for the file in seconds
+            bytes_uploaded: File size in bytes (used for the speed histogram)
+            ttfb: Optional time to first response byte in seconds
+            timestamp: Sample time (defaults to now)
+        """
+        ts = timestamp if timestamp is not None else time.time()
+        minute_start = int(ts // 60) * 60
+
+        samples = {'upload_time': max(0.0, upload_time)}
+        if upload_time > 0 and bytes_uploaded > 0:
+            samples['speed'] = bytes_uploaded / upload_time
+        if ttfb is not None and ttfb >= 0:
+            samples['ttfb'] = ttfb
+
+        with self._cache_lock:
+            for metric, value in samples.items():
+                key = (host_name, metric, minute_start)
+                hist = self._latency_buffer.get(key)
+                if hist is None:
+                    hist = self._latency_buffer[key] = LogHistogram()
+                hist.record(value)
+
+    def get_latency_histogram(self, host_name: str, metric: str, start_ts: float,
+                              end_ts: Optional[float] = None) -> LogHistogram:
+        """
+        Get the merged latency histogram for a host over a time range.
+
+        Buckets of any resolution that overlap the range are included, so
+        ranges reaching into downsampled data are widened to whole hours/days.
+
+        Args:
+            host_name: The host identifier
+            metric: One of LATENCY_METRICS
+            start_ts: Range start (unix timestamp)
+            end_ts: Range end (unix timestamp, defaults to now)
+
+        Returns:
+            LogHistogram (empty if there are no samples)
+        """
+        end_ts = end_ts if end_ts is not None else time.time()
+        result = LogHistogram()
+        for _resolution, _bucket_start, hist in self._query_latency_buckets(host_name, metric, start_ts, end_ts):
+            result.merge(hist)
+        return result
+
+    def get_latency_percentiles(self, host_name: str, metric: str, start_ts: float,
+                                end_ts: Optional[float] = None,
+                                percentiles: Iterable[float] = DEFAULT_PERCENTILES) -> Dict[str, Any]:
+        """
+        Get latency percentiles for a host over a time range.
+
+        Args:
+            host_name: The host identifier
+            metric: One of LATENCY_METRICS
+            start_ts: Range start (unix timestamp)
+            end_ts: Range end (unix timestamp, defaults to now)
+            percentiles: Percentiles to compute (0-100)
+
+        Returns:
+            Dict with count, min, max, mean and 'p<N>' keys (e.g. 'p95')
+        """
+        hist = self.get_latency_histogram(host_name, metric, start_ts, end_ts)
+        result = {
+            'count': hist.count,
+            'min': hist.min or 0.0,
+            'max': hist.max or 0.0,
+            'mean': hist.mean,
+        }
+        for pct in percentiles:
+            result[f"p{pct:g}"] = hist.percentile(pct)
+        return result
+
+    def get_latency_series(self, host_name: str, metric: str, start_ts: float,
+                           end_ts: Optional[float] = None, resolution: str = 'hour',
+                           percentiles: Iterable[float] = (50, 95)) -> list[Dict[str, Any]]:
+        """
+        Get latency percentiles per time slot, for charts.
+
+        Args:
+            host_name: The host identifier
+            metric: One of LATENCY_METRICS
+            start_ts: Range start (unix timestamp)
+            end_ts: Range end (unix timestamp, defaults to now)
+            resolution: Slot width, one of LATENCY_RESOLUTIONS
+            percentiles: Percentiles to compute per slot
+
+        Returns:
+            List of dicts with 'ts', 'count' and 'p<N>' keys, sorted by time
+        """
+        end_ts = end_ts if end_ts is not None else time.time()
+        slot_seconds = LATENCY_RESOLUTIONS.get(resolution, 3600)
+        slots: Dict[int, LogHistogram] = {}
+        for _res, bucket_start, hist in self._query_latency_buckets(host_name, metric, start_ts, end_ts):
+            slot = max(int(start_ts // slot_seconds), bucket_start // slot_seconds) * slot_seconds
+            slots.setdefault(slot, LogHistogram()).merge(hist)
+
+        series = []
+        for slot in sorted(slots):
+            hist = slots[slot]
+            point = {'ts': slot, 'count': hist.count}
+            for pct in percentiles:
+                point[f"p{pct:g}"] = hist.percentile(pct)
+            series.append(point)
+        return series
+
+    def get_latency_hosts(self, start_ts: float, end_ts: Optional[float] = None) -> list[str]:
+        """
+        Get hosts with latency samples in a time range.
+
+        Args:
+            start_ts: Range start (unix timestamp)
+            end_ts: Range end (unix timestamp, defaults to now)
+
+        Returns:
+            Sorted list of host names
+        """
+        end_ts = end_ts if end_ts is not None else time.time()
+        hosts = set()
+        with self._db_lock:
+            conn = self._connect()
+            try:
+                cursor = conn.execute("""
+                    SELECT DISTINCT host_name FROM latency_histograms
+                    WHERE bucket_start < ? AND bucket_start > ? - (
+                        CASE resolution WHEN 'minute' THEN 60 WHEN 'hour' THEN 3600 ELSE 86400 END)
+                """, (end_ts, start_ts))
+                hosts.update(row['host_name'] for row in cursor)
+            except Exception as e:
+                logger.error(f"Failed to query latency hosts: {e}")
+            finally:
+                conn.close()
+        with self._cache_lock:
+            hosts.update(host for host, _metric, minute in self._latency_buffer
+                         if start_ts - 60 < minute < end_ts)
+        return sorted(hosts)
+
+    def _query_latency_buckets(self, host_name: str, metric: str, start_ts: float,
+                               end_ts: float) -> list[Tuple[str, int, LogHistogram]]:
+        """Stored and buffered histogram buckets overlapping a time range."""
+        buckets = []
+        with self._db_lock:
+            conn = self._connect()
+            try:
+                cursor = conn.execute("""
+                    SELECT resolution, bucket_start, histogram FROM latency_histograms
+                    WHERE host_name = ? AND metric = ?
+                        AND bucket_start < ? AND bucket_start > ? - (
+                            CASE resolution WHEN 'minute' THEN 60 WHEN 'hour' THEN 3600 ELSE 86400 END)
+                """, (host_name, metric, end_ts, start_ts))
+                for row in cursor:
+                    buckets.append((row['resolution'], row['bucket_start'],
+                                    LogHistogram.from_json(row['histogram'])))
+            except Exception as e:
+                logger.error(f"Failed to query latency histograms: {e}")
+            finally:
+                conn.close()
+
+        with self._cache_lock:
+            for (host, buffered_metric, minute), hist in self._latency_buffer.items():
+                if host == host_name and buffered_metric == metric and start_ts - 60 < minute < end_ts:
+                    buckets.append(('minute', minute, LogHistogram().merge(hist)))
+        return buckets
+
     def _format_metrics(self, cache: Dict[str, Any]) -> Dict[str, Any]:
         """Format cache data into a clean metrics dict."""
         files_uploaded = cache.get('files_uploaded', 0)
@@ -664,6 +878,8 @@ class MetricsStore:
                 try:
                     item = self._write_queue.get(timeout=1.0)
                 except Empty:
+                    self._maybe_flush_latency()
+                    self._maybe_downsample_latency()
                     continue
 
                 if item is None:  # Shutdown signal
@@ -671,6 +887,8 @@ class MetricsStore:
 
                 self._process_write(item)
                 self._write_queue.task_done()
+                self._maybe_flush_latency()
+                self._maybe_downsample_latency()
 
             except Exception as e:
                 logger.error(f"Error in metrics write worker: {e}")
@@ -687,10 +905,123 @@ class MetricsStore:
             except Exception as e:
                 logger.error(f"Error processing remaining writes: {e}")
 
+        self._flush_latency_buffer()
         logger.debug("Metrics write worker stopped")
 
+    def _maybe_flush_latency(self) -> None:
+        """Write buffered latency histograms once the flush interval has passed."""
+        if self._latency_buffer and time.monotonic() - self._last_latency_flush >= LATENCY_FLUSH_INTERVAL:
+            self._flush_latency_buffer()
+
+    def _flush_latency_buffer(self) -> None:
+        """Merge buffered minute histograms into the database."""
+        with self._cache_lock:
+            pending, self._latency_buffer = self._latency_buffer, {}
+            self._last_latency_flush = time.monotonic()
+        if not pending:
+            return
+
+        with self._db_lock:
+            conn = self._connect()
+            try:
+                conn.execute("BEGIN TRANSACTION")
+                for (host_name, metric, minute_start), hist in pending.items():
+                    self._merge_histogram_row(conn, host_name, metric, 'minute', minute_start, hist)
+                conn.execute("COMMIT")
+            except Exception as e:
+                conn.execute("ROLLBACK")
+                logger.error(f"Failed to write latency histograms: {e}")
+            finally:
+                conn.close()
+
+    def _maybe_downsample_latency(self) -> None:
+        """Roll old latency buckets up to coarser resolutions (at startup, then hourly)."""
+        now = time.monotonic()
+        if (self._last_latency_downsample is not None
+                and now - self._last_latency_downsample < LATENCY_DOWNSAMPLE_INTERVAL):
+            return
+        self._last_latency_downsample = now
+
+        with self._db_lock:
+            conn = self._connect()
+            try:
+                minutes, hours = self._downsample_latency_resolutions(conn, time.time())
+                if minutes or hours:
+                    logger.info(f"Downsampled latency histograms: {minutes} minute and "
+                                f"{hours} hour buckets merged")
+            except Exception as e:
+                logger.error(f"Failed to downsample latency histograms: {e}")
+            finally:
+                conn.close()
+
+    def _merge_histogram_row(self, conn: sqlite3.Connection, host_name: str, metric: str,
+                             resolution: str, bucket_start: int, hist: LogHistogram) -> None:
+        """Add a histogram to the stored bucket (caller manages the transaction)."""
+        row = conn.execute("""
+            SELECT histogram FROM latency_histograms
+            WHERE host_name = ? AND metric = ? AND resolution = ? AND bucket_start = ?
+        """, (host_name, metric, resolution, bucket_start)).fetchone()
+        merged = LogHistogram().merge(hist)
+        if row:
+            merged.merge(LogHistogram.from_json(row['histogram']))
+        conn.execute("""
+            INSERT INTO latency_histograms
+                (host_name, metric, resolution, bucket_start, sample_count, histogram)
+            VALUES (?, ?, ?, ?, ?, ?)
+            ON CONFLICT(host_name, metric, resolution, bucket_start) DO UPDATE SET
+                sample_count = excluded.sample_count,
+                histogram = excluded.histogram
+        """, (host_name, metric, resolution, bucket_start, merged.count, merged.to_json()))
+
+    def _downsample_latency(self, conn: sqlite3.Connection, source: str, target: str,
+                            cutoff_ts: float) -> int:
+        """Merge source-resolution buckets older than cutoff into target-resolution buckets.
+
+        Returns:
+            Number of source buckets merged
+        """
+        target_seconds = LATENCY_RESOLUTIONS[target]
+        # Only roll up complete target buckets so none is split across resolutions
+        cutoff = int(cutoff_ts // target_seconds) * target_seconds
+        rows = conn.execute("""
+            SELECT host_name, metric, bucket_start, histogram FROM latency_histograms
+            WHERE resolution = ? AND bucket_start < ?
+        """, (source, cutoff)).fetchall()
+        if not rows:
+            return 0
+
+        merged: Dict[Tuple[str, str, int], LogHistogram] = {}
+        for row in rows:
+            key = (row['host_name'], row['metric'], row['bucket_start'] // target_seconds * target_seconds)
+            merged.setdefault(key, LogHistogram()).merge(LogHistogram.from_json(row['histogram']))
+
+        conn.execute("BEGIN TRANSACTION")
+        try:
+            for (host_name, metric, bucket_start), hist in merged.items():
+                self._merge_histogram_row(conn, host_name, metric, target, bucket_start, hist)
+            conn.execute("DELETE FROM latency_histograms WHERE resolution = ? AND bucket_start < ?",
+                         (source, cutoff))
+            conn.execute("COMMIT")
+        except Exception:
+            conn.execute("ROLLBACK")
+            raise
+        return len(rows)
+
+    def _downsample_latency_resolutions(self, conn: sqlite3.Connection, now: float) -> Tuple[int, int]:
+        """Merge old minute buckets into hours and old hour buckets into days.
+
+        Returns:
+            Number of minute and hour buckets merged
+        """
+        minutes = self._downsample_latency(conn, 'minute', 'hour', now - MINUTE_BUCKET_RETENTION)
+        hours = self._downsample_latency(conn, 'hour', 'day', now - HOUR_BUCKET_RETENTION)
+        return minutes, hours
+
     def _process_write(self, item: Dict[str, Any]) -> None:
         """Process a single write item from the queue."""
+        if item['type'] == 'latency_flush':
+            self._flush_latency_buffer()
+            return
         if item['type'] != 'transfer':
             return
 
@@ -766,6 +1097,7 @@ class MetricsStore:
         Blocks until all queued writes are processed.
         """
         logger.debug("Flushing metrics store...")
+        self._write_queue.put({'type': 'latency_flush'})
         self._write_queue.join()
         logger.debug("Metrics store flushed")
 
@@ -864,11 +1196,16 @@ class MetricsStore:
         """
         Remove daily metrics older than specified days.
 
+        Also downsamples latency histograms: minute buckets older than
+        MINUTE_BUCKET_RETENTION are merged into hour buckets, hour buckets older
+        than HOUR_BUCKET_RETENTION into day buckets, and day buckets older than
+        days_to_keep are removed.
+
         Args:
             days_to_keep: Number of days of daily data to retain
 
         Returns:
-            Number of rows deleted
+            Number of daily metric rows deleted
         """
         cutoff_date = (datetime.now() - timedelta(days=days_to_keep)).strftime('%Y-%m-%d')
         deleted = 0
@@ -884,6 +1221,18 @@ class MetricsStore:
                 logger.info(f"Cleaned up {deleted} old daily metric records")
             except Exception as e:
                 logger.error(f"Failed to cleanup old metrics: {e}")
+
+            try:
+                now = time.time()
+                minutes, hours = self._downsample_latency_resolutions(conn, now)
+                cursor = conn.execute("""
+                    DELETE FROM latency_histograms
+                    WHERE resolution = 'day' AND bucket_start < ?
+                """, (int(now - days_to_keep * 86400),))
+                logger.info(f"Downsampled latency histograms: {minutes} minute and {hours} hour "
+                            f"buckets merged, {cursor.rowcount} day buckets removed")
+            except Exception as e:
+                logger.error(f"Failed to downsample latency histograms: {e}")
             finally:
                 conn.close()
 
@@ -0,0 +1,92 @@
+"""
+Coalescing progress bus between worker threads and the GUI.
+
+Workers publish the latest state per key (a gallery path, a file host
+upload, a bandwidth source) instead of emitting a queued Qt signal for every
+update. The GUI drains the bus on a fixed-rate timer and receives only the
+newest state for each key since the previous drain:
+
+    bus = get_progress_bus()
+    bus.publish(CHANNEL_GALLERY, path, (completed, total, percent, image))
+    ...
+    for channel, updates in bus.drain().items():
+        for key, state in updates.items():
+            ...
+
+Publishing is a dict assignment under a short lock, so producers never wait
+on the GUI. Updates replaced before a drain are counted as coalesced.
+"""
+
+from __future__ import annotations
+
+import threading
+from dataclasses import dataclass
+from typing import Any, Dict, Hashable
+
+# Channels
+CHANNEL_GALLERY = "gallery"        # path -> (completed, total, percent, current_image)
+CHANNEL_FILE_HOST = "file_host"    # (db_id, host_name) -> (uploaded, total, speed_bps)
+CHANNEL_BANDWIDTH = "bandwidth"    # source -> KB/s ("imx.to" or a file host id)
+
+BANDWIDTH_SOURCE_IMX = "imx.to"
+
+
+@dataclass
+class ProgressBusStats:
+    """Counters since the bus was created (or last reset)."""
+    published: int = 0   # publish() calls
+    delivered: int = 0   # states handed out by drain()
+    coalesced: int = 0   # states replaced by a newer one before a drain
+    drains: int = 0
+    pending: int = 0     # states waiting for the next drain
+
+
+class ProgressBus:
+    """Thread-safe latest-value store, drained by the GUI."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._pending: Dict[str, Dict[Hashable, Any]] = {}
+        self._stats = ProgressBusStats()
+
+    def publish(self, channel: str, key: Hashable, state: Any) -> None:
+        """Replace the pending state for key (callable from any thread)."""
+        with self._lock:
+            updates = self._pending.get(channel)
+            if updates is None:
+                updates = self._pending[channel] = {}
+            elif key in updates:
+                self._stats.coalesced += 1
+            updates[key] = state
+            self._stats.published += 1
+
+    def drain(self) -> Dict[str, Dict[Hashable, Any]]:
+        """Take every pending state, grouped by channel."""
+        with self._lock:
+            pending, self._pending = self._pending, {}
+            self._stats.delivered += sum(len(updates) for updates in pending.values())
+            self._stats.drains += 1
+        return pending
+
+    def stats(self) -> ProgressBusStats:
+        with self._lock:
+            pending = sum(len(updates) for updates in self._pending.values())
+            return ProgressBusStats(
+                published=self._stats.published,
+                delivered=self._stats.delivered,
+                coalesced=self._stats.coalesced,
+                drains=self._stats.drains,
+                pending=pending,
+            )
+
+    def reset_stats(self) -> None:
+        with self._lock:
+            self._stats = ProgressBusStats()
+
+
+_bus = ProgressBus()
+
+
+def get_progress_bus() -> ProgressBus:
+    """Get the process-wide progress bus."""
+    return _bus
@@ -0,0 +1,91 @@
+"""
+Startup phase timing for ``--profile-startup``.
+
+Each phase records its wall time and how many modules it imported, so the
+report separates import cost from initialization work:
+
+    with startup_phase("import main_window"):
+        from src.gui.main_window import BBDropGUI
+
+Phases also open a tracing span, so ``--trace`` output shows them too.
+Profiling is off by default; while off, startup_phase() only checks a flag.
+"""
+
+from __future__ import annotations
+
+import sys
+import time
+from contextlib import contextmanager
+from typing import IO, Iterator, List, Optional, Tuple
+
+from src.utils.tracing import span
+
+_enabled = False
+_origin: Optional[float] = None
+_phases: List[Tuple[str, float, int]] = []  # (name, seconds, modules imported)
+_reported = False
+
+
+def enable_startup_profile(origin: Optional[float] = None) -> None:
+    """Start recording phases.
+
+    Args:
+        origin: time.perf_counter() value the report's total is measured from
+            (defaults to now)
+    """
+    global _enabled, _origin
+    _enabled = True
+    _origin = origin if origin is not None else time.perf_counter()
+
+
+def is_startup_profile_enabled() -> bool:
+    return _enabled
+
+
+def record_phase(name: str, start: float, modules_before: int) -> None:
+    """Record a phase that was timed by the caller (e.g. module-level imports)."""
+    if _enabled:
+        _phases.append((name, time.perf_counter() - start, len(sys.modules) - modules_before))
+
+
+@contextmanager
+def startup_phase(name: str) -> Iterator[None]:
+    """Time a block of startup work as one phase."""
+    if not _enabled:
+        yield
+        return
+    start = time.perf_counter()
+    modules_before = len(sys.modules)
+    try:
+        with span(name, category="startup"):
+            yield
+    finally:
+        record_phase(name, start, modules_before)
+
+
+def format_startup_report() -> str:
+    """Phase table with per-phase time, share of the total and imported module count."""
+    total = time.perf_counter() - _origin if _origin is not None else sum(p[1] for p in _phases)
+    width = max([len(name) for name, _, _ in _phases] + [len("Total")])
+    lines = [f"Startup profile ({len(sys.modules)} modules loaded)",
+             f"  {'Phase':<{width}}  {'ms':>8}  {'share':>6}  {'modules':>7}"]
+    for name, seconds, modules in _phases:
+        share = seconds / total * 100 if total > 0 else 0.0
+        lines.append(f"  {name:<{width}}  {seconds * 1000:8.1f}  {share:5.1f}%  {modules:7d}")
+    lines.append(f"  {'Total':<{width}}  {total * 1000:8.1f}")
+    return "\n".join(lines)
+
+
+def report_startup_profile(stream: Optional[IO[str]] = None) -> None:
+    """Print the report once (later calls are ignored)."""
+    global _reported
+    if not _enabled or _reported:
+        return
+    _reported = True
+    stream = stream if stream is not None else sys.stderr
+    if stream is None:  # No console (windowed build)
+        return
+    try:
+        print(format_startup_report(), file=stream, flush=True)
+    except (OSError, ValueError):
+        pass
@@ -0,0 +1,212 @@
+"""
+Lightweight per-phase tracing for the gallery pipeline.
+
+Spans are recorded into an in-memory ring buffer and can be exported as
+Chrome trace JSON (load in chrome://tracing or https://ui.perfetto.dev).
+Tracing is off by default; while off, span() returns a shared no-op context
+manager and @traced functions only pay for one flag check.
+
+Usage:
+    with span("upload_image", category="upload", gallery=folder_path):
+        ...
+
+    @traced("save_artifacts", category="artifacts")
+    def save_gallery_artifacts(...):
+        ...
+
+Spans opened with a ``gallery`` argument tag every nested span on the same
+thread, so export_chrome_trace(path, gallery=...) can extract one gallery.
+"""
+
+from __future__ import annotations
+
+import functools
+import inspect
+import json
+import os
+import threading
+import time
+from collections import deque
+from typing import Any, Callable, Dict, List, Optional
+
+# Number of completed spans kept in memory
+DEFAULT_TRACE_CAPACITY = 50000
+
+_enabled = False
+_events: deque = deque(maxlen=DEFAULT_TRACE_CAPACITY)
+_thread_names: Dict[int, str] = {}
+_local = threading.local()
+_PID = os.getpid()
+
+
+def enable_tracing(capacity: int = DEFAULT_TRACE_CAPACITY) -> None:
+    """Start recording spans (clears the buffer if the capacity changes)."""
+    global _enabled, _events
+    if _events.maxlen != capacity:
+        _events = deque(maxlen=capacity)
+    _enabled = True
+
+
+def disable_tracing() -> None:
+    """Stop recording spans (recorded spans are kept for export)."""
+    global _enabled
+    _enabled = False
+
+
+def is_tracing_enabled() -> bool:
+    return _enabled
+
+
+def clear_trace() -> None:
+    """Drop all recorded spans."""
+    _events.clear()
+    _thread_names.clear()
+
+
+class _Span:
+    """Active span; records a complete ('X') event when it exits."""
+
+    __slots__ = ('name', 'category', 'args', 'start_ns', 'prev_gallery')
+
+    def __init__(self, name: str, category: str, args: Dict[str, Any]):
+        self.name = name
+        self.category = category
+        self.args = args
+
+    def __enter__(self) -> _Span:
+        self.prev_gallery = getattr(_local, 'gallery', None)
+        gallery = self.args.get('gallery')
+        if gallery is not None:
+            _local.gallery = gallery
+        elif self.prev_gallery is not None:
+            self.args['gallery'] = self.prev_gallery
+        self.start_ns = time.perf_counter_ns()
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> bool:
+        end_ns = time.perf_counter_ns()
+        _local.gallery = self.prev_gallery
+        if exc_type is not None:
+            self.args['error'] = exc_type.__name__
+        thread = threading.current_thread()
+        tid = thread.ident or 0
+        if tid not in _thread_names:
+            _thread_names[tid] = thread.name
+        _events.append((self.name, self.category, self.start_ns, end_ns - self.start_ns, tid, self.args))
+        return False
+
+    def set(self, **args: Any) -> None:
+        """Attach extra arguments to the span (e.g. results known at the end)."""
+        self.args.update(args)
+
+
+class _NoopSpan:
+    """Shared span used while tracing is disabled."""
+
+    __slots__ = ()
+
+    def __enter__(self) -> _NoopSpan:
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> bool:
+        return False
+
+    def set(self, **args: Any) -> None:
+        pass
+
+
+_NOOP = _NoopSpan()
+
+
+def span(name: str, category: str = "bbdrop", **args: Any):
+    """Context manager timing a block of work.
+
+    Args:
+        name: Span name shown in the trace viewer
+        category: Comma-separated trace categories
+        **args: Arguments shown in the span details (``gallery`` tags nested spans)
+
+    Returns:
+        Context manager (a shared no-op when tracing is disabled)
+    """
+    if not _enabled:
+        return _NOOP
+    return _Span(name, category, args)
+
+
+def traced(name: Optional[str] = None, category: str = "bbdrop",
+           gallery_arg: Optional[str] = None) -> Callable:
+    """Decorator wrapping each call of a function in a span.
+
+    Args:
+        name: Span name (defaults to the function's qualified name)
+        category: Comma-separated trace categories
+        gallery_arg: Name of the parameter holding the gallery path, used to tag the span
+    """
+    def decorator(func: Callable) -> Callable:
+        span_name = name or func.__qualname__
+        arg_index = list(inspect.signature(func).parameters).index(gallery_arg) if gallery_arg else None
+
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            if not _enabled:
+                return func(*args, **kwargs)
+            span_args = {}
+            if gallery_arg:
+                gallery = kwargs.get(gallery_arg, args[arg_index] if arg_index < len(args) else None)
+                if gallery is not None:
+                    span_args['gallery'] = str(gallery)
+            with _Span(span_name, category, span_args):
+                return func(*args, **kwargs)
+        return wrapper
+    return decorator
+
+
+def get_trace_events(gallery: Optional[str] = None) -> List[Dict[str, Any]]:
+    """Recorded spans as Chrome trace events.
+
+    Args:
+        gallery: Only include spans tagged with this gallery path
+
+    Returns:
+        List of trace event dicts ('X' events plus thread name metadata)
+    """
+    events = []
+    tids = set()
+    for name, category, start_ns, duration_ns, tid, args in list(_events):
+        if gallery is not None and args.get('gallery') != gallery:
+            continue
+        tids.add(tid)
+        events.append({
+            'name': name,
+            'cat': category,
+            'ph': 'X',
+            'ts': start_ns / 1000.0,
+            'dur': duration_ns / 1000.0,
+            'pid': _PID,
+            'tid': tid,
+            'args': {k: v if isinstance(v, (str, int, float, bool)) or v is None else str(v)
+                     for k, v in args.items()},
+        })
+    for tid in tids:
+        events.append({
+            'name': 'thread_name', 'ph': 'M', 'pid': _PID, 'tid': tid,
+            'args': {'name': _thread_names.get(tid, str(tid))},
+        })
+    return events
+
+
+def export_chrome_trace(path: str, gallery: Optional[str] = None) -> int:
+    """Write recorded spans to a Chrome trace JSON file.
+
+    Args:
+        path: Output file path
+        gallery: Only export spans tagged with this gallery path
+
+    Returns:
+        Number of spans written
+    """
+    events = get_trace_events(gallery)
+    with open(path, 'w', encoding='utf-8') as f:
+        json.dump({'traceEvents': events, 'displayTimeUnit': 'ms'}, f)
+    return sum(1 for e in events if e['ph'] == 'X')
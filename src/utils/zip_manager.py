@@ -11,6 +11,7 @@ import tempfile
 import threading
 from pathlib import Path
 from typing import Dict, Tuple, Optional
+from src.utils.archive_utils import is_archive_gallery_path
 from src.utils.logger import log
 
 
@@ -236,6 +237,10 @@ class ZIPManager:
         Raises:
             Exception: If ZIP creation fails
         """
+        if is_archive_gallery_path(folder_path):
+            self._create_store_mode_zip_from_archive(folder_path, zip_path)
+            return
+
         if not folder_path.exists():
             raise FileNotFoundError(f"Folder does not exist: {folder_path}")
 
@@ -264,6 +269,29 @@ class ZIPManager:
             raise Exception(f"ZIP file was not created: {zip_path}")
 
 
+    def _create_store_mode_zip_from_archive(self, gallery_path: Path, zip_path: Path) -> None:
+        """Re-pack the images of an archive gallery into a store mode ZIP.
+
+        Args:
+            gallery_path: Virtual archive gallery path
+            zip_path: Path where ZIP should be created
+
+        Raises:
+            Exception: If ZIP creation fails
+        """
+        from src.services.archive_source import ArchiveImageSource
+
+        with ArchiveImageSource.from_gallery_path(str(gallery_path)) as source:
+            image_files = source.list_images()
+            if not image_files:
+                raise ValueError(f"No image files found in: {gallery_path}")
+            with zipfile.ZipFile(zip_path, 'w', zipfile.ZIP_STORED) as zf:
+                for name in image_files:
+                    zf.writestr(name, source.read(name))
+
+        if not zip_path.exists():
+            raise Exception(f"ZIP file was not created: {zip_path}")
+
 # Global singleton instance
 _zip_manager: Optional[ZIPManager] = None
 _zip_manager_lock = threading.Lock()
@@ -0,0 +1,137 @@
+#!/usr/bin/env python3
+"""
+Benchmark for uploading galleries straight from ZIP/CBZ archives.
+
+Compares the old extract-to-temp workflow with streaming archive members:
+1. Time-to-first-upload (archive dropped -> first image bytes handed to uploader)
+2. Disk bytes written before/while uploading
+
+Uploads are simulated by a fake uploader that only consumes the bytes, so the
+numbers isolate the local I/O cost.
+
+Usage:
+    python tests/benchmarks/archive_streaming_benchmark.py [--images N] [--size-kb KB]
+"""
+
+import argparse
+import os
+import shutil
+import sys
+import tempfile
+import time
+import zipfile
+from pathlib import Path
+
+# Add project root to path
+sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+
+from src.core.engine import UploadEngine
+from src.services.archive_service import ArchiveService
+
+
+class FakeUploader:
+    """Uploader stand-in that records when the first image arrives."""
+
+    headers = {}
+
+    def __init__(self):
+        self.first_upload_at = None
+        self.bytes_received = 0
+
+    def upload_image(self, image_path, create_gallery=False, gallery_id=None, file_data=None, **kwargs):
+        if file_data is None:
+            with open(image_path, 'rb') as f:
+                file_data = f.read()
+        if self.first_upload_at is None:
+            self.first_upload_at = time.perf_counter()
+        self.bytes_received += len(file_data)
+        return {'status': 'success', 'data': {'gallery_id': gallery_id or 'bench', 'image_url': ''}}
+
+
+def create_test_archive(directory, image_count, size_kb):
+    """Create a STORED archive with one gallery folder of fake images"""
+    archive_path = os.path.join(directory, "benchmark_gallery.zip")
+    payload = os.urandom(size_kb * 1024)
+    with zipfile.ZipFile(archive_path, 'w', zipfile.ZIP_STORED) as zf:
+        for i in range(image_count):
+            zf.writestr(f"gallery/{i:04d}.jpg", payload)
+    return archive_path
+
+
+def _dir_size(path):
+    total = 0
+    for dirpath, _dirnames, filenames in os.walk(path):
+        for name in filenames:
+            total += os.path.getsize(os.path.join(dirpath, name))
+    return total
+
+
+def _run_engine(folder_path, uploader):
+    UploadEngine(uploader).run(
+        folder_path=folder_path,
+        gallery_name="benchmark",
+        thumbnail_size=3,
+        thumbnail_format=2,
+        max_retries=0,
+        parallel_batch_size=4,
+        template_name="default",
+    )
+
+
+def benchmark_extract(archive_path, temp_root):
+    """Old workflow: extractall into temp, then upload from the folder"""
+    service = ArchiveService(os.path.join(temp_root, "extract"))
+    uploader = FakeUploader()
+    start = time.perf_counter()
+    temp_dir = service.extract_archive(archive_path)
+    folder = service.get_folders(temp_dir)[0]
+    _run_engine(str(folder), uploader)
+    total = time.perf_counter() - start
+    written = _dir_size(temp_dir)
+    service.cleanup_temp_dir(temp_dir)
+    return uploader.first_upload_at - start, total, written
+
+
+def benchmark_stream(archive_path, temp_root):
+    """New workflow: list galleries and upload members straight from the archive"""
+    service = ArchiveService(os.path.join(temp_root, "stream"))
+    uploader = FakeUploader()
+    start = time.perf_counter()
+    gallery = service.list_archive_galleries(archive_path)[0]
+    _run_engine(str(gallery), uploader)
+    total = time.perf_counter() - start
+    written = _dir_size(service.base_temp_dir)
+    return uploader.first_upload_at - start, total, written
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Archive extract vs stream benchmark")
+    parser.add_argument('--images', type=int, default=200, help="Images in the archive")
+    parser.add_argument('--size-kb', type=int, default=2048, help="Size of each image in KB")
+    args = parser.parse_args()
+
+    temp_root = tempfile.mkdtemp()
+    try:
+        archive_path = create_test_archive(temp_root, args.images, args.size_kb)
+        archive_mb = os.path.getsize(archive_path) / (1024 * 1024)
+        print(f"Archive: {args.images} images, {archive_mb:.1f} MiB")
+
+        results = {
+            'extract': benchmark_extract(archive_path, temp_root),
+            'stream': benchmark_stream(archive_path, temp_root),
+        }
+
+        print("\n" + "=" * 60)
+        print(f"{'Mode':<10}{'First upload':>15}{'Total':>12}{'Disk written':>18}")
+        print("=" * 60)
+        for mode, (first, total, written) in results.items():
+            print(f"{mode:<10}{first * 1000:>13.1f}ms{total:>11.2f}s{written / (1024 * 1024):>15.1f} MiB")
+
+        speedup = results['extract'][0] / max(results['stream'][0], 1e-9)
+        print(f"\n✓ Time-to-first-upload: {speedup:.1f}x faster when streaming")
+    finally:
+        shutil.rmtree(temp_root, ignore_errors=True)
+
+
+if __name__ == "__main__":
+    main()
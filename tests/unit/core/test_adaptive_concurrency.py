@@ -0,0 +1,201 @@
+"""
+Tests for the adaptive (AIMD) upload concurrency controller.
+
+Covers window decisions, limit bounds, settings/persistence helpers and
+UploadEngine honouring the controller's in-flight limit.
+"""
+
+import configparser
+import threading
+import time
+from unittest.mock import Mock, patch
+
+import pytest
+
+from src.core.adaptive_concurrency import (
+    AdaptiveConcurrencyController,
+    create_concurrency_controller,
+    forget_learned_limit,
+    load_learned_limit,
+    save_learned_limit,
+)
+from src.core.engine import UploadEngine
+from src.core.upload_retry import RetryPolicy
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+def _controller(**kwargs):
+    controller = AdaptiveConcurrencyController(**kwargs)
+    controller._clock = FakeClock()
+    controller.begin()
+    return controller
+
+
+def _window(controller, count, duration=1.0, size=1024 * 1024, failures=0, elapsed=1.0):
+    """Feed one window of completions and return the decision."""
+    controller._clock.now += elapsed
+    decision = None
+    for i in range(count):
+        ok = i >= failures
+        decision = controller.record(ok, duration if ok else None, size) or decision
+    return decision
+
+
+class TestDecisions:
+    """Test AIMD window decisions"""
+
+    def test_healthy_windows_increase_to_maximum(self):
+        controller = _controller(minimum=1, maximum=6, initial=4)
+        for _ in range(5):
+            _window(controller, max(4, controller.limit), elapsed=1.0)
+        assert controller.limit == 6
+        assert controller.last_decision.action == 'hold'
+
+    def test_errors_decrease_multiplicatively(self):
+        changes = []
+        controller = _controller(minimum=2, maximum=12, initial=10, on_change=changes.append)
+        decision = _window(controller, 10, failures=3)
+        assert decision.action == 'decrease'
+        assert controller.limit == 7
+        assert "error rate 30%" in decision.reason
+        assert changes == [decision]
+
+        for _ in range(5):
+            _window(controller, max(4, controller.limit), failures=4)
+        assert controller.limit == 2
+
+    def test_latency_inflation_without_gain_decreases(self):
+        controller = _controller(minimum=1, maximum=12, initial=4)
+        _window(controller, 4, duration=1.0, elapsed=1.0)          # baseline 1s, -> 5
+        decision = _window(controller, 5, duration=3.0, size=800 * 1024, elapsed=1.0)
+        assert decision.action == 'decrease'
+        assert "latency" in decision.reason
+        assert controller.limit == 3
+
+    def test_throughput_drop_after_increase_steps_back(self):
+        controller = _controller(minimum=1, maximum=12, initial=4)
+        _window(controller, 4, elapsed=1.0)                          # 4 MiB/s, -> 5
+        decision = _window(controller, 5, elapsed=2.0)               # 2.5 MiB/s
+        assert decision.action == 'decrease'
+        assert controller.limit == 4
+
+    def test_limit_is_clamped(self):
+        assert AdaptiveConcurrencyController(minimum=2, maximum=5, initial=50).limit == 5
+        assert AdaptiveConcurrencyController(minimum=2, maximum=5, initial=0).limit == 2
+
+    def test_begin_keeps_limit(self):
+        controller = _controller(minimum=1, maximum=12, initial=4)
+        _window(controller, 4)
+        controller.begin()
+        assert controller.limit == 5
+        assert controller.record(True, 1.0, 10) is None
+
+
+class TestSettings:
+    """Test settings and persistence helpers"""
+
+    @pytest.fixture
+    def config_path(self, tmp_path):
+        path = tmp_path / "bbdrop.ini"
+        with patch('bbdrop.get_config_path', return_value=str(path)):
+            yield path
+
+    def test_learned_limit_round_trip(self, config_path):
+        assert load_learned_limit() is None
+        save_learned_limit(7)
+        assert load_learned_limit() == 7
+
+    def test_controller_starts_from_learned_limit(self, config_path):
+        config_path.write_text("[Advanced]\nuploads/concurrency_max = 6\n\n[CONCURRENCY]\nimx_limit = 3\n")
+        controller = create_concurrency_controller(4)
+        assert (controller.minimum, controller.maximum, controller.limit) == (1, 6, 3)
+
+    def test_batch_size_caps_starting_limit(self, config_path):
+        config_path.write_text("[Advanced]\nuploads/concurrency_max = 8\n\n[CONCURRENCY]\nimx_limit = 12\n")
+        controller = create_concurrency_controller(4)
+        assert (controller.minimum, controller.maximum, controller.limit) == (1, 8, 4)
+
+    def test_minimum_kept_below_maximum(self, config_path):
+        config_path.write_text("[Advanced]\nuploads/concurrency_min = 5\nuploads/concurrency_max = 3\n")
+        controller = create_concurrency_controller(4)
+        assert (controller.minimum, controller.maximum, controller.limit) == (3, 3, 3)
+
+    def test_limit_grows_above_batch_size_under_low_latency(self, config_path):
+        config_path.write_text("[Advanced]\nuploads/concurrency_max = 8\n")
+        controller = create_concurrency_controller(4)
+        controller._clock = FakeClock()
+        controller.begin()
+        for _ in range(6):
+            _window(controller, max(4, controller.limit), duration=0.2, elapsed=1.0)
+        assert controller.limit == 8
+
+    def test_save_replaces_config_atomically(self, config_path):
+        config_path.write_text("[DEFAULTS]\nparallel_batch_size = 4\n")
+        with patch('os.replace', side_effect=OSError("disk full")):
+            with pytest.raises(OSError):
+                save_learned_limit(7)
+        assert config_path.read_text() == "[DEFAULTS]\nparallel_batch_size = 4\n"
+        assert [p.name for p in config_path.parent.iterdir()] == [config_path.name]
+
+        save_learned_limit(7)
+        assert load_learned_limit() == 7
+        assert "parallel_batch_size = 4" in config_path.read_text()
+
+    def test_forget_learned_limit(self, config_path):
+        save_learned_limit(7)
+        config = configparser.ConfigParser()
+        config.read(config_path, encoding='utf-8')
+        forget_learned_limit(config)
+        forget_learned_limit(configparser.ConfigParser())  # No saved limit
+        with open(config_path, 'w', encoding='utf-8') as f:
+            config.write(f)
+        assert load_learned_limit() is None
+
+    def test_disabled_returns_none(self, config_path):
+        config_path.write_text("[Advanced]\nuploads/adaptive_concurrency = False\n")
+        assert create_concurrency_controller(4) is None
+
+
+class TestEngineIntegration:
+    """Test UploadEngine dispatching under the controller's limit"""
+
+    def test_engine_backs_off_from_overloaded_server(self, tmp_path):
+        for i in range(40):
+            (tmp_path / f"img{i:02d}.jpg").write_bytes(b'x' * 2048)
+
+        lock = threading.Lock()
+        state = {'active': 0, 'peak': 0}
+
+        def upload(image_path, gallery_id=None, **kwargs):
+            with lock:
+                state['active'] += 1
+                state['peak'] = max(state['peak'], state['active'])
+                overloaded = state['active'] > 3
+            time.sleep(0.01)
+            with lock:
+                state['active'] -= 1
+            if overloaded:
+                return {'status': 'error', 'message': 'HTTP 503'}
+            return {'status': 'success', 'data': {'gallery_id': gallery_id or 'gal1',
+                                                  'image_url': 'https://imx.to/i/x'}}
+
+        uploader = Mock(headers={}, web_url='https://imx.to')
+        uploader.upload_image.side_effect = upload
+        controller = AdaptiveConcurrencyController(minimum=1, maximum=8, initial=8)
+        engine = UploadEngine(uploader, rename_worker=Mock(), concurrency_controller=controller,
+                              retry_policy=RetryPolicy(base_delay=0.01))
+
+        result = engine.run(str(tmp_path), "Test", 3, 2, max_retries=10,
+                            parallel_batch_size=2, template_name="default")
+
+        assert result['successful_count'] == 40
+        assert state['peak'] <= 8
+        assert controller.limit < 8
+        assert result['concurrency_limit'] == controller.limit
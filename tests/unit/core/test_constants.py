@@ -248,11 +248,6 @@ class TestGallerySettings:
 class TestProgressUpdates:
     """Test suite for progress update constants."""
 
-    def test_progress_update_batch_interval_is_positive(self):
-        """Test PROGRESS_UPDATE_BATCH_INTERVAL is positive."""
-        assert PROGRESS_UPDATE_BATCH_INTERVAL == 0.05
-        assert PROGRESS_UPDATE_BATCH_INTERVAL > 0
-
     def test_progress_update_threshold_is_positive(self):
         """Test PROGRESS_UPDATE_THRESHOLD is positive."""
         assert PROGRESS_UPDATE_THRESHOLD == 100
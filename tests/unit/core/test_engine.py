@@ -671,6 +671,36 @@ class TestCallbacks:
 
         assert len(uploaded_images) == 3
 
+    def test_image_timing_callback_reports_ttfb(self, temp_image_folder):
+        """Test on_image_timing receives duration, size and uploader TTFB."""
+        mock_uploader = Mock()
+        mock_uploader.configure_mock(headers={})
+        mock_uploader.configure_mock(web_url='https://imx.to')
+        mock_uploader.upload_image.side_effect = lambda image_path, gallery_id=None, **kwargs: {
+            'status': 'success',
+            'data': {'gallery_id': gallery_id or 'gal123', 'image_url': ''}
+        }
+        mock_uploader.get_last_ttfb.return_value = 0.125
+
+        timings = []
+        engine = UploadEngine(mock_uploader)
+        engine.run(
+            folder_path=temp_image_folder,
+            gallery_name="Test Gallery",
+            thumbnail_size=3,
+            thumbnail_format=2,
+            max_retries=3,
+            parallel_batch_size=2,
+            template_name="default",
+            on_image_timing=lambda *args: timings.append(args)
+        )
+
+        assert len(timings) == 3
+        for _fname, duration, size_bytes, ttfb in timings:
+            assert duration >= 0
+            assert size_bytes > 0
+            assert ttfb == 0.125
+
 
 # ============================================================================
 # Statistics and Results Tests
@@ -976,3 +1006,67 @@ class TestIntegration:
         assert len(uploaded_files) == 5
         assert len(progress_updates) >= 5
         assert result['gallery_url'].startswith('https://imx.to/g/')
+
+
+# ============================================================================
+# Archive Gallery Tests
+# ============================================================================
+
+class TestArchiveGalleryUpload:
+    """Test uploading a gallery straight from a ZIP archive."""
+
+    @pytest.fixture
+    def gallery_zip(self, tmp_path):
+        import zipfile
+        archive = tmp_path / "set.zip"
+        with zipfile.ZipFile(archive, 'w', zipfile.ZIP_STORED) as zf:
+            zf.writestr("photos/img2.jpg", b"b" * 200)
+            zf.writestr("photos/img10.jpg", b"c" * 300)
+            zf.writestr("photos/img1.jpg", b"a" * 100)
+            zf.writestr("photos/readme.txt", b"ignored")
+        return archive
+
+    def test_uploads_members_from_memory(self, gallery_zip, tmp_path):
+        """Images are passed as bytes in archive order without touching disk."""
+        mock_uploader = Mock()
+        mock_uploader.configure_mock(headers={})
+        received = {}
+
+        def mock_upload(image_path, gallery_id=None, file_data=None, **kwargs):
+            received[os.path.basename(image_path)] = file_data
+            return {'status': 'success',
+                    'data': {'gallery_id': gallery_id or 'arc1', 'image_url': 'https://imx.to/i/abc'}}
+
+        mock_uploader.upload_image.side_effect = mock_upload
+        engine = UploadEngine(mock_uploader)
+
+        result = engine.run(
+            folder_path=f"{gallery_zip}::photos",
+            gallery_name=None,
+            thumbnail_size=3,
+            thumbnail_format=2,
+            max_retries=1,
+            parallel_batch_size=2,
+            template_name="default",
+        )
+
+        assert received == {'img1.jpg': b"a" * 100, 'img2.jpg': b"b" * 200, 'img10.jpg': b"c" * 300}
+        assert result['gallery_name'] == 'photos'
+        assert result['total_size'] == 600
+        assert result['uploaded_size'] == 600
+        assert [img['original_filename'] for img in result['images']] == ['img1.jpg', 'img2.jpg', 'img10.jpg']
+        assert sorted(os.listdir(tmp_path)) == ['set.zip']
+
+    def test_missing_archive_raises(self, tmp_path):
+        """A virtual path to a missing archive raises FileNotFoundError."""
+        engine = UploadEngine(Mock())
+        with pytest.raises(FileNotFoundError):
+            engine.run(
+                folder_path=f"{tmp_path / 'gone.zip'}::photos",
+                gallery_name="x",
+                thumbnail_size=3,
+                thumbnail_format=2,
+                max_retries=1,
+                parallel_batch_size=1,
+                template_name="default",
+            )
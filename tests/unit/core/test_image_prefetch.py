@@ -0,0 +1,169 @@
+"""
+Tests for the image read-ahead buffer used by UploadEngine.
+
+Covers reading in upload order, the file count and byte bounds, images
+taken before the reader reaches them, kernel hints and the engine passing
+prefetched bytes to upload_image.
+"""
+
+import os
+import time
+from unittest.mock import Mock, patch
+
+import pytest
+
+from src.core import image_prefetch
+from src.core.engine import UploadEngine
+from src.core.image_prefetch import ImagePrefetcher, is_rotational
+
+
+@pytest.fixture
+def folder(tmp_path):
+    for i in range(10):
+        (tmp_path / f"img{i:02d}.jpg").write_bytes(bytes([i]) * (1000 + i))
+    return tmp_path
+
+
+def _names(count=10):
+    return [f"img{i:02d}.jpg" for i in range(count)]
+
+
+def _wait_for(condition, timeout=5.0):
+    deadline = time.monotonic() + timeout
+    while not condition() and time.monotonic() < deadline:
+        time.sleep(0.01)
+    return condition()
+
+
+class TestImagePrefetcher:
+    """Test the read-ahead buffer"""
+
+    def test_images_taken_from_memory(self, folder):
+        with ImagePrefetcher(str(folder), depth=4) as prefetcher:
+            prefetcher.start(_names())
+            for i, name in enumerate(_names()):
+                assert prefetcher.take(name) == bytes([i]) * (1000 + i)
+            assert prefetcher.hits == 10
+            assert prefetcher.misses == 0
+
+    def test_buffer_bounded_by_depth(self, folder):
+        with ImagePrefetcher(str(folder), depth=3) as prefetcher:
+            prefetcher.start(_names())
+            assert _wait_for(lambda: len(prefetcher._buffer) == 3)
+            time.sleep(0.1)
+            assert list(prefetcher._buffer) == _names(3)
+
+            prefetcher.take("img00.jpg")
+            assert _wait_for(lambda: "img03.jpg" in prefetcher._buffer)
+            assert len(prefetcher._buffer) == 3
+
+    def test_buffer_bounded_by_bytes(self, folder):
+        with ImagePrefetcher(str(folder), depth=10, max_bytes=2500) as prefetcher:
+            prefetcher.start(_names())
+            assert _wait_for(lambda: len(prefetcher._buffer) == 2)
+            time.sleep(0.1)
+            assert prefetcher._buffered_bytes <= 2500
+
+    def test_file_larger_than_bound_still_read(self, folder):
+        with ImagePrefetcher(str(folder), max_bytes=10) as prefetcher:
+            prefetcher.start(_names(2))
+            assert prefetcher.take("img00.jpg") == bytes([0]) * 1000
+            assert prefetcher.take("img01.jpg") == bytes([1]) * 1001
+
+    def test_image_not_reached_is_left_to_caller(self, folder):
+        with ImagePrefetcher(str(folder), depth=2) as prefetcher:
+            prefetcher.start(_names())
+            assert prefetcher.take("img09.jpg") is None
+            assert prefetcher.misses == 1
+            for name in _names(9):
+                assert prefetcher.take(name) is not None
+            assert prefetcher.bytes_prefetched == sum(1000 + i for i in range(9))
+
+    def test_sequential_waits_for_reader_within_window(self, folder):
+        with ImagePrefetcher(str(folder), depth=4, sequential=True) as prefetcher:
+            prefetcher.start(_names())
+            assert prefetcher.take("img03.jpg") == bytes([3]) * 1003
+            assert prefetcher.misses == 0
+
+    def test_waiting_gives_up_when_buffer_full(self, folder):
+        with ImagePrefetcher(str(folder), depth=2, sequential=True) as prefetcher:
+            prefetcher.start(_names())
+            assert _wait_for(lambda: prefetcher._pending_size is not None and len(prefetcher._buffer) == 2)
+            assert prefetcher.take("img03.jpg") is None
+
+    def test_retry_reads_from_disk(self, folder):
+        with ImagePrefetcher(str(folder)) as prefetcher:
+            prefetcher.start(_names(1))
+            assert prefetcher.take("img00.jpg") is not None
+            assert prefetcher.take("img00.jpg") is None
+
+    def test_unreadable_file_left_to_caller(self, folder):
+        os.remove(folder / "img01.jpg")
+        with ImagePrefetcher(str(folder)) as prefetcher:
+            prefetcher.start(_names(3))
+            assert prefetcher.take("img00.jpg") is not None
+            assert prefetcher.take("img01.jpg") is None
+            assert prefetcher.take("img02.jpg") is not None
+
+    def test_close_drops_buffer(self, folder):
+        prefetcher = ImagePrefetcher(str(folder), depth=2)
+        prefetcher.start(_names())
+        assert _wait_for(lambda: len(prefetcher._buffer) == 2)
+        prefetcher.close()
+        assert not prefetcher._buffer
+        assert not prefetcher._thread.is_alive()
+
+
+@pytest.mark.skipif(not hasattr(os, 'posix_fadvise'), reason="posix_fadvise not available")
+class TestKernelHints:
+    """Test WILLNEED hints for the read-ahead window"""
+
+    def _hinted(self, folder, sequential):
+        hinted = []
+        with patch.object(image_prefetch, "_advise_willneed", side_effect=hinted.append):
+            with ImagePrefetcher(str(folder), depth=4, sequential=sequential) as prefetcher:
+                prefetcher.start(_names(6))
+                assert prefetcher.take("img00.jpg") is not None
+                assert prefetcher.take("img01.jpg") is not None
+        return [os.path.basename(path) for path in hinted]
+
+    def test_sequential_hints_current_file_only(self, folder):
+        assert self._hinted(folder, sequential=True)[:2] == _names(2)
+
+    def test_parallel_hints_whole_window(self, folder):
+        assert self._hinted(folder, sequential=False)[:4] == _names(4)
+
+    def test_rotational_detection_never_raises(self, folder):
+        assert is_rotational(str(folder)) in (True, False, None)
+        assert is_rotational(str(folder / "missing")) is None
+
+
+class TestEnginePrefetch:
+    """Test UploadEngine passing prefetched bytes to upload_image"""
+
+    def _uploader(self):
+        uploader = Mock()
+        uploader.headers = {}
+        uploader.upload_image.return_value = {
+            'status': 'success',
+            'data': {'gallery_id': 'gal1', 'image_url': 'https://imx.to/i/x', 'thumb_url': 'https://imx.to/t/x'},
+        }
+        return uploader
+
+    def _run(self, engine, folder):
+        return engine.run(str(folder), "Gallery", 3, 2, 1, 2, "default", precalculated_dimensions=None)
+
+    def test_uploads_use_prefetched_bytes(self, folder):
+        uploader = self._uploader()
+        self._run(UploadEngine(uploader), folder)
+
+        calls = uploader.upload_image.call_args_list
+        assert len(calls) == 10
+        assert all(call.kwargs.get('file_data') is not None for call in calls)
+        by_name = {os.path.basename(call.args[0]): call.kwargs['file_data'] for call in calls}
+        assert by_name["img05.jpg"] == bytes([5]) * 1005
+
+    def test_prefetch_disabled(self, folder):
+        uploader = self._uploader()
+        self._run(UploadEngine(uploader, prefetch_depth=0), folder)
+        assert all('file_data' not in call.kwargs for call in uploader.upload_image.call_args_list)
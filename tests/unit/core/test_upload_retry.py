@@ -0,0 +1,165 @@
+"""
+Tests for per-file upload retries.
+
+Covers error classification, backoff delays and UploadEngine retrying failed
+files inline on the work queue, driven by a fake uploader that fails in
+scripted patterns.
+"""
+
+import os
+import random
+import threading
+import time
+from unittest.mock import Mock
+
+import pytest
+
+from src.core.engine import UploadEngine
+from src.core.upload_retry import (
+    ERROR_API, ERROR_CONNECTION, ERROR_INTERNAL, ERROR_INVALID_FILE, ERROR_RATE_LIMITED,
+    ERROR_SERVER, ERROR_TIMEOUT, ERROR_UNKNOWN, RetryPolicy, classify_upload_error,
+)
+
+
+class ScriptedUploader:
+    """Fake imx.to uploader: each file fails according to its script, then succeeds.
+
+    Script steps: 'timeout', '503', 'invalid', 'api', 'ok'; files without a
+    script (or with an exhausted one) succeed.
+    """
+
+    def __init__(self, scripts=None, duration=0.0):
+        self.headers = {}
+        self.web_url = 'https://imx.to'
+        self.scripts = {name: list(steps) for name, steps in (scripts or {}).items()}
+        self.duration = duration
+        self.calls = []  # (file, monotonic start)
+        self._lock = threading.Lock()
+
+    def attempts(self, name):
+        return sum(1 for f, _ in self.calls if f == name)
+
+    def upload_image(self, image_path, create_gallery=False, gallery_id=None, **kwargs):
+        name = os.path.basename(image_path)
+        with self._lock:
+            self.calls.append((name, time.monotonic()))
+            steps = self.scripts.get(name)
+            step = steps.pop(0) if steps else 'ok'
+        if self.duration:
+            time.sleep(self.duration)
+        if step == 'timeout':
+            raise Exception("Upload timeout (connect=30s, read=120s): Operation timed out")
+        if step == '503':
+            raise Exception("Upload failed with status code 503: Service Unavailable")
+        if step == 'invalid':
+            return {'status': 'error', 'message': 'Invalid image file'}
+        if step == 'api':
+            return {'status': 'error', 'message': 'Temporary failure'}
+        return {'status': 'success', 'data': {'gallery_id': gallery_id or 'gal1',
+                                              'image_url': f'https://imx.to/i/{name}'}}
+
+
+@pytest.fixture
+def gallery(tmp_path):
+    for i in range(6):
+        (tmp_path / f"img{i}.jpg").write_bytes(b'x' * 1024)
+    return tmp_path
+
+
+def _run(uploader, folder, max_retries=3, base_delay=0.01, batch=2, **kwargs):
+    engine = UploadEngine(uploader, rename_worker=Mock(),
+                          retry_policy=RetryPolicy(base_delay=base_delay, rng=random.Random(0)))
+    return engine.run(str(folder), "Test", 3, 2, max_retries=max_retries,
+                      parallel_batch_size=batch, template_name="default", **kwargs)
+
+
+class TestClassification:
+    """Test error classes"""
+
+    @pytest.mark.parametrize("exc, expected", [
+        (Exception("Upload timeout (connect=30s, read=120s): timed out"), ERROR_TIMEOUT),
+        (TimeoutError(), ERROR_TIMEOUT),
+        (Exception("Connection error during upload: refused"), ERROR_CONNECTION),
+        (Exception("Upload failed with status code 502: Bad Gateway"), ERROR_SERVER),
+        (Exception("Upload failed with status code 429: slow down"), ERROR_RATE_LIMITED),
+        (Exception("Upload failed with status code 413: too big"), ERROR_INVALID_FILE),
+        (FileNotFoundError("gone"), ERROR_INVALID_FILE),
+        (TypeError("bad call"), ERROR_INTERNAL),
+        (Exception("something odd"), ERROR_UNKNOWN),
+    ])
+    def test_exceptions(self, exc, expected):
+        assert classify_upload_error(exc=exc) == expected
+
+    def test_api_responses(self):
+        assert classify_upload_error(response={'status': 'error', 'message': 'File too large'}) == ERROR_INVALID_FILE
+        assert classify_upload_error(response={'status': 'error', 'message': 'Try again'}) == ERROR_API
+
+    def test_retryable_classes(self):
+        assert RetryPolicy.should_retry(ERROR_TIMEOUT)
+        assert RetryPolicy.should_retry(ERROR_SERVER)
+        assert not RetryPolicy.should_retry(ERROR_INVALID_FILE)
+        assert not RetryPolicy.should_retry(ERROR_INTERNAL)
+
+
+class TestBackoff:
+    """Test retry delays"""
+
+    def test_exponential_with_jitter_and_cap(self):
+        policy = RetryPolicy(base_delay=1.0, max_delay=5.0, rng=random.Random(1))
+        for retry, (low, high) in enumerate([(0.5, 1), (1, 2), (2, 4), (2.5, 5), (2.5, 5)], start=1):
+            assert low <= policy.delay(retry) <= high
+
+    def test_without_jitter(self):
+        policy = RetryPolicy(base_delay=2.0, jitter=False)
+        assert [policy.delay(n) for n in (1, 2, 3)] == [2.0, 4.0, 8.0]
+
+
+class TestInlineRetries:
+    """Test UploadEngine retrying files on the same work queue"""
+
+    def test_transient_failures_are_retried_until_success(self, gallery):
+        uploader = ScriptedUploader({'img2.jpg': ['timeout', '503'], 'img4.jpg': ['api']})
+        result = _run(uploader, gallery)
+        assert result['successful_count'] == 6
+        assert result['failed_count'] == 0
+        assert uploader.attempts('img2.jpg') == 3
+        assert uploader.attempts('img4.jpg') == 2
+        assert uploader.attempts('img3.jpg') == 1
+
+    def test_invalid_file_is_not_retried(self, gallery):
+        uploader = ScriptedUploader({'img3.jpg': ['invalid', 'ok']})
+        result = _run(uploader, gallery)
+        assert uploader.attempts('img3.jpg') == 1
+        assert [name for name, _ in result['failed_details']] == ['img3.jpg']
+
+    def test_gives_up_after_max_retries(self, gallery):
+        uploader = ScriptedUploader({'img1.jpg': ['503'] * 10})
+        result = _run(uploader, gallery, max_retries=2)
+        assert uploader.attempts('img1.jpg') == 3
+        assert result['successful_count'] == 5
+        assert "status code 503" in result['failed_details'][0][1]
+
+    def test_failed_file_does_not_hold_the_gallery(self, tmp_path):
+        for i in range(20):
+            (tmp_path / f"img{i:02d}.jpg").write_bytes(b'x' * 1024)
+        uploader = ScriptedUploader({'img01.jpg': ['timeout']}, duration=0.02)
+        result = _run(uploader, tmp_path, base_delay=0.03)
+
+        assert result['successful_count'] == 20
+        retry_start = [t for f, t in uploader.calls if f == 'img01.jpg'][1]
+        last_first_attempt = max(t for f, t in uploader.calls if f != 'img01.jpg')
+        # The retry runs alongside the rest of the gallery, not in a later round
+        assert retry_start < last_first_attempt
+
+    def test_soft_stop_drops_pending_retries(self, gallery):
+        uploader = ScriptedUploader({'img1.jpg': ['503']})
+        stop = threading.Event()
+
+        def on_progress(completed, total, percent, current):
+            if current == 'img1.jpg':
+                stop.set()
+
+        result = _run(uploader, gallery, base_delay=5.0, batch=1,
+                      on_progress=on_progress, should_soft_stop=stop.is_set)
+        assert uploader.attempts('img1.jpg') == 1
+        assert [name for name, _ in result['failed_details']] == ['img1.jpg']
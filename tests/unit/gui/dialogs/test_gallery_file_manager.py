@@ -9,6 +9,7 @@ import sys
 import json
 import tempfile
 import shutil
+import zipfile
 from pathlib import Path
 from unittest.mock import Mock, MagicMock, patch, call
 from typing import Dict, Any
@@ -26,6 +27,7 @@ from src.gui.dialogs.gallery_file_manager import (
     FileScanner
 )
 from src.core.constants import IMAGE_EXTENSIONS
+from src.utils.archive_utils import make_archive_gallery_path
 
 
 # Test Fixtures
@@ -778,6 +780,78 @@ class TestCompletedGallery:
         assert "BBCode:" in details
 
 
+class TestArchiveGallery:
+    """Test galleries read directly from an archive"""
+
+    @pytest.fixture
+    def archive_gallery_path(self, tmp_path):
+        """Archive with five 2x3 PNG images in a 'set1' folder"""
+        from io import BytesIO
+        from PIL import Image
+
+        buffer = BytesIO()
+        Image.new('RGB', (2, 3)).save(buffer, format='PNG')
+        archive = tmp_path / "photos.zip"
+        with zipfile.ZipFile(archive, 'w') as zf:
+            for i in range(5):
+                zf.writestr(f"set1/image_{i}.png", buffer.getvalue())
+            zf.writestr("set1/notes.txt", b"not an image")
+        return make_archive_gallery_path(archive, "set1")
+
+    def _wait_for_scan(self, qtbot, dialog):
+        qtbot.waitUntil(lambda: len(dialog.file_status) == 5, timeout=5000)
+        dialog._cleanup_scanner()
+
+    def test_lists_and_validates_archive_images(self, qtbot, archive_gallery_path, mock_queue_manager):
+        """Test archive gallery images are listed and scanned from the archive"""
+        dialog = GalleryFileManagerDialog(archive_gallery_path, mock_queue_manager)
+        qtbot.addWidget(dialog)
+        self._wait_for_scan(qtbot, dialog)
+
+        assert dialog.original_files == {f"image_{i}.png" for i in range(5)}
+        assert all(valid for valid, _ in dialog.file_status.values())
+        assert dialog.windowTitle() == "Manage Files - set1"
+        dialog.reject()
+
+    def test_archive_gallery_is_read_only(self, qtbot, archive_gallery_path, mock_queue_manager):
+        """Test files inside an archive can't be added or removed"""
+        dialog = GalleryFileManagerDialog(archive_gallery_path, mock_queue_manager)
+        qtbot.addWidget(dialog)
+        self._wait_for_scan(qtbot, dialog)
+
+        dialog.file_list.item(0).setSelected(True)
+
+        assert not dialog.add_btn.isEnabled()
+        assert not dialog.remove_btn.isEnabled()
+        assert "archive" in dialog.add_btn.toolTip()
+        dialog.reject()
+
+    def test_show_archive_file_details(self, qtbot, archive_gallery_path, mock_queue_manager):
+        """Test file details are read from the archive member"""
+        dialog = GalleryFileManagerDialog(archive_gallery_path, mock_queue_manager)
+        qtbot.addWidget(dialog)
+        self._wait_for_scan(qtbot, dialog)
+
+        dialog.show_file_details("image_0.png")
+
+        details = dialog.details_text.toPlainText()
+        assert "File not found" not in details
+        assert "Dimensions: 2 x 3" in details
+        dialog.reject()
+
+    def test_source_closed_on_reject(self, qtbot, archive_gallery_path, mock_queue_manager):
+        """Test the archive is closed when the dialog closes"""
+        dialog = GalleryFileManagerDialog(archive_gallery_path, mock_queue_manager)
+        qtbot.addWidget(dialog)
+        self._wait_for_scan(qtbot, dialog)
+        source = dialog.archive_source
+
+        dialog.reject()
+
+        assert dialog.archive_source is None
+        assert source._zip.fp is None
+
+
 class TestDialogAccept:
     """Test dialog accept/close behavior"""
 
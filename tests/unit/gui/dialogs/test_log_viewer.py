@@ -10,10 +10,11 @@ Target: 25-40 tests covering all major functionality.
 import pytest
 import os
 import gzip
+import time
 from datetime import datetime
 from unittest.mock import Mock, patch, MagicMock
 from PyQt6.QtCore import Qt, QSettings
-from PyQt6.QtWidgets import QTableWidgetItem
+from PyQt6.QtWidgets import QApplication
 
 # Mock logger before importing LogViewerDialog
 mock_logger = MagicMock()
@@ -21,6 +22,32 @@ mock_logger.get_logs_dir.return_value = "/tmp/test_logs"
 mock_logger.read_current_log.return_value = ""
 
 
+def _idle(dlg, timeout=5.0):
+    """Wait for the background index/search, then deliver its queued rows."""
+    deadline = time.monotonic() + timeout
+    while dlg.is_loading() and time.monotonic() < deadline:
+        QApplication.processEvents()
+        time.sleep(0.005)
+    QApplication.processEvents()
+
+
+def _rows(dlg):
+    """Rows shown in the log view."""
+    _idle(dlg)
+    return dlg.log_view.model().rowCount()
+
+
+def _cell(dlg, row, column):
+    """Text shown in one cell of the log view."""
+    _idle(dlg)
+    model = dlg.log_view.model()
+    return model.data(model.index(row, column))
+
+
+def _row_header(dlg, row):
+    return dlg.log_view.model().headerData(row, Qt.Orientation.Vertical)
+
+
 @pytest.fixture
 def mock_logger_module(monkeypatch):
     """Mock the logger module to prevent ImportError"""
@@ -97,9 +124,9 @@ class TestLogViewerDialogInitialization:
 
     def test_log_table_columns(self, dialog):
         """Test log table has correct columns"""
-        assert dialog.log_view.columnCount() == 4
+        assert dialog.log_view.model().columnCount() == 4
         headers = [
-            dialog.log_view.horizontalHeaderItem(i).text()
+            dialog.log_view.model().headerData(i, Qt.Orientation.Horizontal)
             for i in range(4)
         ]
         assert headers == ["Timestamp", "Level", "Category", "Message"]
@@ -172,26 +199,26 @@ class TestLogParsing:
         """Test parsing line with full timestamp"""
         # Check first row (newest - logs are reversed so newest first)
         # But level filter might hide TRACE/DEBUG by default, so check what's visible
-        timestamp_item = dialog_with_logs.log_view.item(0, 0)
-        level_item = dialog_with_logs.log_view.item(0, 1)
-        category_item = dialog_with_logs.log_view.item(0, 2)
-        message_item = dialog_with_logs.log_view.item(0, 3)
+        timestamp = _cell(dialog_with_logs, 0, 0)
+        level = _cell(dialog_with_logs, 0, 1)
+        category = _cell(dialog_with_logs, 0, 2)
+        message = _cell(dialog_with_logs, 0, 3)
 
         # Verify we have valid data (actual content depends on default filter)
-        assert len(timestamp_item.text()) == 19  # YYYY-MM-DD HH:MM:SS format
-        assert level_item.text() in ["TRACE", "DEBUG", "INFO", "WARNING", "ERROR"]
-        assert category_item.text() in ["uploads", "auth", "network", "ui", "queue"]
-        assert len(message_item.text()) > 0
+        assert len(timestamp) == 19  # YYYY-MM-DD HH:MM:SS format
+        assert level in ["TRACE", "DEBUG", "INFO", "WARNING", "ERROR"]
+        assert category in ["uploads", "auth", "network", "ui", "queue"]
+        assert len(message) > 0
 
     def test_logs_displayed_newest_first(self, dialog_with_logs):
         """Test logs are displayed in reverse chronological order"""
         # Get timestamps from all rows
-        if dialog_with_logs.log_view.rowCount() < 2:
+        if _rows(dialog_with_logs) < 2:
             pytest.skip("Need at least 2 rows to test ordering")
 
-        first_timestamp = dialog_with_logs.log_view.item(0, 0).text()
-        last_row = dialog_with_logs.log_view.rowCount() - 1
-        last_timestamp = dialog_with_logs.log_view.item(last_row, 0).text()
+        first_timestamp = _cell(dialog_with_logs, 0, 0)
+        last_row = _rows(dialog_with_logs) - 1
+        last_timestamp = _cell(dialog_with_logs, last_row, 0)
 
         # First should be >= last (newer or equal)
         assert first_timestamp >= last_timestamp
@@ -199,8 +226,8 @@ class TestLogParsing:
     def test_parse_different_log_levels(self, dialog_with_logs):
         """Test parsing different log levels"""
         levels = []
-        for row in range(dialog_with_logs.log_view.rowCount()):
-            level = dialog_with_logs.log_view.item(row, 1).text()
+        for row in range(_rows(dialog_with_logs)):
+            level = _cell(dialog_with_logs, row, 1)
             levels.append(level)
 
         # Should have at least some log levels (may be filtered by default level filter)
@@ -212,8 +239,8 @@ class TestLogParsing:
     def test_parse_different_categories(self, dialog_with_logs):
         """Test parsing different categories"""
         categories = []
-        for row in range(dialog_with_logs.log_view.rowCount()):
-            category = dialog_with_logs.log_view.item(row, 2).text()
+        for row in range(_rows(dialog_with_logs)):
+            category = _cell(dialog_with_logs, row, 2)
             categories.append(category)
 
         # Should have at least some categories
@@ -228,9 +255,9 @@ class TestLogParsing:
 
     def test_row_numbering(self, dialog_with_logs):
         """Test row numbers are sequential"""
-        for row in range(dialog_with_logs.log_view.rowCount()):
-            header_item = dialog_with_logs.log_view.verticalHeaderItem(row)
-            assert header_item.text() == str(row + 1)
+        for row in range(_rows(dialog_with_logs)):
+            header_item = _row_header(dialog_with_logs, row)
+            assert header_item == str(row + 1)
 
 
 class TestLogFiltering:
@@ -238,7 +265,7 @@ class TestLogFiltering:
 
     def test_category_filter_unchecked_hides_entries(self, dialog_with_logs, qtbot):
         """Test unchecking category filter removes those entries"""
-        initial_rows = dialog_with_logs.log_view.rowCount()
+        initial_rows = _rows(dialog_with_logs)
 
         # Uncheck "uploads" category
         dialog_with_logs._filters_row["uploads"].setChecked(False)
@@ -246,8 +273,8 @@ class TestLogFiltering:
 
         # Count visible rows
         visible_categories = []
-        for row in range(dialog_with_logs.log_view.rowCount()):
-            category = dialog_with_logs.log_view.item(row, 2).text()
+        for row in range(_rows(dialog_with_logs)):
+            category = _cell(dialog_with_logs, row, 2)
             visible_categories.append(category)
 
         assert "uploads" not in visible_categories
@@ -261,8 +288,8 @@ class TestLogFiltering:
 
         # Check remaining categories
         visible_categories = []
-        for row in range(dialog_with_logs.log_view.rowCount()):
-            category = dialog_with_logs.log_view.item(row, 2).text()
+        for row in range(_rows(dialog_with_logs)):
+            category = _cell(dialog_with_logs, row, 2)
             visible_categories.append(category)
 
         assert "auth" not in visible_categories
@@ -274,12 +301,12 @@ class TestLogFiltering:
         qtbot.wait(100)
 
         # Should have all log entries (at least more than with restrictive filter)
-        all_count = dialog_with_logs.log_view.rowCount()
+        all_count = _rows(dialog_with_logs)
 
         # Now set to ERROR+ which should show fewer
         dialog_with_logs.cmb_level_filter.setCurrentText("ERROR+")
         qtbot.wait(100)
-        error_count = dialog_with_logs.log_view.rowCount()
+        error_count = _rows(dialog_with_logs)
 
         # All should show more than ERROR+
         assert all_count >= error_count
@@ -291,8 +318,8 @@ class TestLogFiltering:
 
         # Check levels - TRACE and DEBUG should not be visible
         visible_levels = []
-        for row in range(dialog_with_logs.log_view.rowCount()):
-            level = dialog_with_logs.log_view.item(row, 1).text()
+        for row in range(_rows(dialog_with_logs)):
+            level = _cell(dialog_with_logs, row, 1)
             visible_levels.append(level)
 
         # Should not have TRACE or DEBUG
@@ -310,8 +337,8 @@ class TestLogFiltering:
 
         # Should only have ERROR level logs
         visible_levels = []
-        for row in range(dialog_with_logs.log_view.rowCount()):
-            level = dialog_with_logs.log_view.item(row, 1).text()
+        for row in range(_rows(dialog_with_logs)):
+            level = _cell(dialog_with_logs, row, 1)
             visible_levels.append(level)
 
         # Should only show ERROR or higher
@@ -341,10 +368,7 @@ class TestSearchFunctionality:
         qtbot.wait(100)
 
         # Count visible rows
-        visible_count = sum(
-            1 for row in range(dialog_with_logs.log_view.rowCount())
-            if not dialog_with_logs.log_view.isRowHidden(row)
-        )
+        visible_count = _rows(dialog_with_logs)
 
         # Should only show the "uploaded" message
         assert visible_count == 1
@@ -354,10 +378,7 @@ class TestSearchFunctionality:
         dialog_with_logs.find_input.setText("UPLOADED")
         qtbot.wait(100)
 
-        visible_count = sum(
-            1 for row in range(dialog_with_logs.log_view.rowCount())
-            if not dialog_with_logs.log_view.isRowHidden(row)
-        )
+        visible_count = _rows(dialog_with_logs)
 
         assert visible_count == 1
 
@@ -367,10 +388,7 @@ class TestSearchFunctionality:
         dialog_with_logs.find_input.setText("auth")
         qtbot.wait(100)
 
-        visible_count = sum(
-            1 for row in range(dialog_with_logs.log_view.rowCount())
-            if not dialog_with_logs.log_view.isRowHidden(row)
-        )
+        visible_count = _rows(dialog_with_logs)
 
         assert visible_count >= 1
 
@@ -384,22 +402,16 @@ class TestSearchFunctionality:
         dialog_with_logs.find_input.setText("")
         qtbot.wait(100)
 
-        visible_count = sum(
-            1 for row in range(dialog_with_logs.log_view.rowCount())
-            if not dialog_with_logs.log_view.isRowHidden(row)
-        )
+        visible_count = _rows(dialog_with_logs)
 
-        assert visible_count == dialog_with_logs.log_view.rowCount()
+        assert visible_count == _rows(dialog_with_logs)
 
     def test_search_no_matches_hides_all(self, dialog_with_logs, qtbot):
         """Test search with no matches hides all rows"""
         dialog_with_logs.find_input.setText("xyznonexistent123")
         qtbot.wait(100)
 
-        visible_count = sum(
-            1 for row in range(dialog_with_logs.log_view.rowCount())
-            if not dialog_with_logs.log_view.isRowHidden(row)
-        )
+        visible_count = _rows(dialog_with_logs)
 
         assert visible_count == 0
 
@@ -413,12 +425,9 @@ class TestSearchFunctionality:
         qtbot.wait(100)
 
         # Search should still be active
-        visible_count = sum(
-            1 for row in range(dialog_with_logs.log_view.rowCount())
-            if not dialog_with_logs.log_view.isRowHidden(row)
-        )
+        visible_count = _rows(dialog_with_logs)
 
-        assert visible_count <= dialog_with_logs.log_view.rowCount()
+        assert visible_count <= _rows(dialog_with_logs)
 
 
 class TestClearAndRefreshActions:
@@ -426,20 +435,20 @@ class TestClearAndRefreshActions:
 
     def test_clear_removes_all_rows(self, dialog_with_logs, qtbot):
         """Test clear button removes all log entries"""
-        initial_rows = dialog_with_logs.log_view.rowCount()
+        initial_rows = _rows(dialog_with_logs)
         assert initial_rows > 0
 
         dialog_with_logs.btn_clear.click()
         qtbot.wait(50)
 
-        assert dialog_with_logs.log_view.rowCount() == 0
+        assert _rows(dialog_with_logs) == 0
 
     def test_refresh_reloads_logs(self, dialog_with_logs, qtbot):
         """Test refresh button reloads log content"""
         # Clear first
         dialog_with_logs.btn_clear.click()
         qtbot.wait(50)
-        assert dialog_with_logs.log_view.rowCount() == 0
+        assert _rows(dialog_with_logs) == 0
 
         # Mock logger to return data
         with patch.object(mock_logger, 'read_current_log',
@@ -448,7 +457,7 @@ class TestClearAndRefreshActions:
             qtbot.wait(100)
 
         # Should have reloaded data
-        assert dialog_with_logs.log_view.rowCount() > 0
+        assert _rows(dialog_with_logs) > 0
 
     def test_file_select_triggers_refresh(self, dialog, qtbot):
         """Test changing file selection triggers refresh"""
@@ -496,7 +505,7 @@ class TestLiveLogAppend:
 
     def test_append_message_adds_row(self, dialog, qtbot):
         """Test append_message adds a new row at top"""
-        initial_rows = dialog.log_view.rowCount()
+        initial_rows = _rows(dialog)
 
         dialog.append_message(
             "2025-11-13 15:00:00 INFO: [general] Test message",
@@ -505,7 +514,7 @@ class TestLiveLogAppend:
         )
         qtbot.wait(50)
 
-        assert dialog.log_view.rowCount() == initial_rows + 1
+        assert _rows(dialog) == initial_rows + 1
 
     def test_append_message_inserts_at_top(self, dialog, qtbot):
         """Test new messages are inserted at row 0"""
@@ -524,7 +533,7 @@ class TestLiveLogAppend:
         qtbot.wait(50)
 
         # Second message should be at top (row 0)
-        message_text = dialog.log_view.item(0, 3).text()
+        message_text = _cell(dialog, 0, 3)
         assert "Second message" in message_text
 
     def test_append_message_parses_timestamp(self, dialog, qtbot):
@@ -536,7 +545,7 @@ class TestLiveLogAppend:
         )
         qtbot.wait(50)
 
-        timestamp = dialog.log_view.item(0, 0).text()
+        timestamp = _cell(dialog, 0, 0)
         assert timestamp == "2025-11-13 15:00:00"
 
     def test_append_message_strips_level_prefix(self, dialog, qtbot):
@@ -548,7 +557,7 @@ class TestLiveLogAppend:
         )
         qtbot.wait(50)
 
-        message = dialog.log_view.item(0, 3).text()
+        message = _cell(dialog, 0, 3)
         assert not message.startswith("INFO:")
         assert "Clean message" in message
 
@@ -561,13 +570,13 @@ class TestLiveLogAppend:
         )
         qtbot.wait(50)
 
-        message = dialog.log_view.item(0, 3).text()
+        message = _cell(dialog, 0, 3)
         assert not message.startswith("[")
         assert "Clean message" in message
 
     def test_append_message_respects_category_filter(self, dialog, qtbot):
         """Test append_message respects category filters"""
-        initial_rows = dialog.log_view.rowCount()
+        initial_rows = _rows(dialog)
 
         # Disable uploads category
         dialog._filters_row["uploads"].setChecked(False)
@@ -582,11 +591,11 @@ class TestLiveLogAppend:
         qtbot.wait(50)
 
         # Row count should not increase
-        assert dialog.log_view.rowCount() == initial_rows
+        assert _rows(dialog) == initial_rows
 
     def test_append_message_respects_level_filter(self, dialog, qtbot):
         """Test append_message respects level filters"""
-        initial_rows = dialog.log_view.rowCount()
+        initial_rows = _rows(dialog)
 
         # Set filter to ERROR+
         dialog.cmb_level_filter.setCurrentText("ERROR+")
@@ -601,7 +610,7 @@ class TestLiveLogAppend:
         qtbot.wait(50)
 
         # Row count should not increase
-        assert dialog.log_view.rowCount() == initial_rows
+        assert _rows(dialog) == initial_rows
 
     def test_append_message_with_search_active(self, dialog, qtbot):
         """Test append_message applies search filter to new row"""
@@ -620,8 +629,9 @@ class TestLiveLogAppend:
         )
         qtbot.wait(100)
 
-        # Row should be visible (matching search)
-        assert not dialog.log_view.isRowHidden(0)
+        # Row should be shown (matching search)
+        assert _rows(dialog) == 1
+        assert "specific" in _cell(dialog, 0, 3)
 
         # Add non-matching message
         dialog.append_message(
@@ -631,12 +641,9 @@ class TestLiveLogAppend:
         )
         qtbot.wait(100)
 
-        # New row is now at index 0, should be hidden (not matching search)
-        # But first row should still be matching message (visible)
-        rows_visibility = [not dialog.log_view.isRowHidden(r)
-                          for r in range(dialog.log_view.rowCount())]
-        # Should have at least one visible row (the matching one)
-        assert any(rows_visibility)
+        # Non-matching message is filtered out; the matching one stays
+        assert _rows(dialog) == 1
+        assert "specific" in _cell(dialog, 0, 3)
 
     def test_append_message_updates_row_numbers(self, dialog, qtbot):
         """Test append_message updates all row numbers"""
@@ -655,9 +662,9 @@ class TestLiveLogAppend:
         qtbot.wait(50)
 
         # Check row numbers are sequential
-        for row in range(dialog.log_view.rowCount()):
-            header_item = dialog.log_view.verticalHeaderItem(row)
-            assert header_item.text() == str(row + 1)
+        for row in range(_rows(dialog)):
+            header_item = _row_header(dialog, row)
+            assert header_item == str(row + 1)
 
 
 class TestTextFormatting:
@@ -684,15 +691,14 @@ class TestTextFormatting:
         qtbot.wait(100)
 
         # Get the message before selection
-        message_before = dialog_with_logs.log_view.item(0, 3).text()
+        message_before = _cell(dialog_with_logs, 0, 3)
 
         # Select the row
         dialog_with_logs.log_view.selectRow(0)
         qtbot.wait(100)
 
         # Message should have been processed
-        message_item = dialog_with_logs.log_view.item(0, 3)
-        message_after = message_item.text()
+        message_after = _cell(dialog_with_logs, 0, 3)
 
         # Either it expands \\n to \n, or it stays the same
         # The expansion happens if the text contains the literal escape sequence
@@ -716,8 +722,8 @@ class TestTextFormatting:
         qtbot.wait(50)
 
         # Message should have \\n again
-        message_item = dialog_with_logs.log_view.item(0, 3)
-        assert '\\n' in message_item.text() or '\n' not in message_item.text()
+        message = _cell(dialog_with_logs, 0, 3)
+        assert '\\n' in message or '\n' not in message
 
 
 class TestFileReading:
@@ -733,7 +739,7 @@ class TestFileReading:
         qtbot.wait(100)
 
         # Should have loaded the log
-        assert dialog.log_view.rowCount() >= 0
+        assert _rows(dialog) >= 0
 
     def test_tail_bytes_conversion(self, dialog):
         """Test tail size text converts to correct byte values"""
@@ -782,7 +788,7 @@ class TestEdgeCases:
 
     def test_empty_log_display(self, dialog):
         """Test dialog with no logs"""
-        assert dialog.log_view.rowCount() >= 0
+        assert _rows(dialog) >= 0
 
     def test_append_message_without_timestamp(self, dialog, qtbot):
         """Test append_message handles messages without timestamps"""
@@ -790,7 +796,7 @@ class TestEdgeCases:
         dialog.cmb_level_filter.setCurrentText("All")
         qtbot.wait(50)
 
-        initial_count = dialog.log_view.rowCount()
+        initial_count = _rows(dialog)
 
         dialog.append_message(
             "Message without timestamp",
@@ -800,7 +806,7 @@ class TestEdgeCases:
         qtbot.wait(100)
 
         # Should have added the row
-        assert dialog.log_view.rowCount() > initial_count
+        assert _rows(dialog) > initial_count
 
     def test_malformed_log_line_handling(self, qtbot, mock_logger_module):
         """Test handling of malformed log lines"""
@@ -811,7 +817,7 @@ class TestEdgeCases:
         qtbot.addWidget(dlg)
 
         # Should not crash
-        assert dlg.log_view.rowCount() >= 0
+        assert _rows(dlg) >= 0
 
     def test_unicode_in_log_messages(self, dialog, qtbot):
         """Test handling of Unicode characters in logs"""
@@ -819,7 +825,7 @@ class TestEdgeCases:
         dialog.cmb_level_filter.setCurrentText("All")
         qtbot.wait(50)
 
-        initial_count = dialog.log_view.rowCount()
+        initial_count = _rows(dialog)
 
         dialog.append_message(
             "2025-11-13 16:00:00 INFO: [general] Unicode: ✓ ✗ ★ 中文",
@@ -829,9 +835,9 @@ class TestEdgeCases:
         qtbot.wait(100)
 
         # Should have added the row
-        assert dialog.log_view.rowCount() > initial_count
-        if dialog.log_view.rowCount() > 0:
-            message = dialog.log_view.item(0, 3).text()
+        assert _rows(dialog) > initial_count
+        if _rows(dialog) > 0:
+            message = _cell(dialog, 0, 3)
             assert len(message) > 0
 
     def test_very_long_message(self, dialog, qtbot):
@@ -840,7 +846,7 @@ class TestEdgeCases:
         dialog.cmb_level_filter.setCurrentText("All")
         qtbot.wait(50)
 
-        initial_count = dialog.log_view.rowCount()
+        initial_count = _rows(dialog)
         long_message = "A" * 1000
 
         dialog.append_message(
@@ -851,9 +857,9 @@ class TestEdgeCases:
         qtbot.wait(100)
 
         # Should have added the row
-        assert dialog.log_view.rowCount() > initial_count
-        if dialog.log_view.rowCount() > 0:
-            message = dialog.log_view.item(0, 3).text()
+        assert _rows(dialog) > initial_count
+        if _rows(dialog) > 0:
+            message = _cell(dialog, 0, 3)
             assert len(message) > 500  # Should have substantial content
 
     def test_should_show_level_with_invalid_level(self, dialog):
@@ -903,7 +909,7 @@ class TestPerformance:
         qtbot.wait(100)
 
         # Should have loaded many entries
-        assert dlg.log_view.rowCount() >= 50
+        assert _rows(dlg) >= 50
 
     def test_rapid_append_messages(self, dialog, qtbot):
         """Test rapidly appending many messages"""
@@ -911,7 +917,7 @@ class TestPerformance:
         dialog.cmb_level_filter.setCurrentText("All")
         qtbot.wait(50)
 
-        initial_count = dialog.log_view.rowCount()
+        initial_count = _rows(dialog)
 
         for i in range(50):
             dialog.append_message(
@@ -922,4 +928,87 @@ class TestPerformance:
 
         qtbot.wait(200)
         # Should have added 50 messages
-        assert dialog.log_view.rowCount() >= initial_count + 40
+        assert _rows(dialog) >= initial_count + 40
+
+
+class TestIndexedLogFiles:
+    """Test viewing log files through the background line index"""
+
+    @pytest.fixture
+    def log_file(self, tmp_path):
+        path = tmp_path / "bbdrop.log"
+        path.write_text("".join(
+            f"2025-11-13 10:00:{i % 60:02d} {'DEBUG' if i % 2 else 'INFO'}: [uploads] Message {i}\n"
+            for i in range(5000)
+        ))
+        return path
+
+    @pytest.fixture
+    def file_dialog(self, qtbot, mock_logger_module, log_file):
+        from src.gui.dialogs.log_viewer import LogViewerDialog
+
+        with patch.object(mock_logger, 'get_current_log_path', return_value=str(log_file)):
+            dlg = LogViewerDialog()
+            qtbot.addWidget(dlg)
+            dlg.cmb_level_filter.setCurrentText("All")
+            yield dlg
+            dlg.close()
+
+    def test_current_log_file_indexed(self, file_dialog):
+        assert _rows(file_dialog) == 5000
+        assert _cell(file_dialog, 0, 3) == "Message 4999"
+        assert _cell(file_dialog, 4999, 3) == "Message 0"
+
+    def test_level_and_find_filters_use_index(self, file_dialog):
+        file_dialog.cmb_level_filter.setCurrentText("INFO+")
+        assert _rows(file_dialog) == 2500
+        assert _cell(file_dialog, 0, 1) == "INFO"
+
+        file_dialog.find_input.setText("message 424")
+        # Message 424 and Message 4240-4248 (even numbers only at INFO+)
+        assert _rows(file_dialog) == 6
+        assert _cell(file_dialog, 0, 3) == "Message 4248"
+
+    def test_follow_reads_appended_lines(self, file_dialog, log_file):
+        assert _rows(file_dialog) == 5000
+        with open(log_file, "a") as f:
+            f.write("2025-11-13 11:00:00 ERROR: [network] Appended\n")
+
+        file_dialog._follow_tick()
+
+        assert _rows(file_dialog) == 5001
+        assert _cell(file_dialog, 0, 3) == "Appended"
+        assert _cell(file_dialog, 1, 3) == "Message 4999"
+
+    def test_live_messages_not_duplicated_for_files(self, file_dialog):
+        assert _rows(file_dialog) == 5000
+        file_dialog.append_message("2025-11-13 11:00:00 INFO: [general] Live", level="info")
+        assert _rows(file_dialog) == 5000
+
+    def test_gz_archive(self, qtbot, mock_logger_module, temp_log_dir):
+        from src.gui.dialogs.log_viewer import LogViewerDialog
+
+        with patch.object(mock_logger, 'get_logs_dir', return_value=str(temp_log_dir)):
+            dlg = LogViewerDialog()
+            qtbot.addWidget(dlg)
+        dlg.cmb_file_select.setCurrentIndex(dlg.cmb_file_select.findText("bbdrop.log.1.gz"))
+
+        assert _rows(dlg) == 1
+        assert _cell(dlg, 0, 3) == "Old log entry"
+        dlg.close()
+
+    def test_live_messages_from_worker_thread(self, dialog, qtbot):
+        import threading
+        dialog.cmb_level_filter.setCurrentText("All")
+        initial = _rows(dialog)
+
+        def worker():
+            for i in range(20):
+                dialog.append_message(f"12:00:{i:02d} INFO: [uploads] Threaded {i}",
+                                      level="info", category="uploads")
+        thread = threading.Thread(target=worker)
+        thread.start()
+        thread.join()
+
+        qtbot.waitUntil(lambda: _rows(dialog) == initial + 20, timeout=2000)
+        assert _cell(dialog, 0, 3) == "Threaded 19"
@@ -95,6 +95,35 @@ def mock_qsettings():
         yield mock
 
 
+UPLOAD_STATS = {
+    'totals': {'galleries': 50, 'images': 500, 'bytes': 1073741824},  # 1 GiB
+    'by_day': [
+        {'day': '2025-01-02', 'galleries': 20, 'images': 200, 'bytes': 536870912},
+        {'day': '2025-01-01', 'galleries': 30, 'images': 300, 'bytes': 536870912},
+    ],
+    'by_tab': [{'tab_id': 1, 'tab_name': 'Main', 'galleries': 50, 'images': 500, 'bytes': 1073741824}],
+    'by_template': [
+        {'template': 'Default', 'galleries': 45, 'images': 450, 'bytes': 1000000000},
+        {'template': '', 'galleries': 5, 'images': 50, 'bytes': 73741824},
+    ],
+    'by_host': [{'host_name': 'rapidgator', 'files': 12, 'failed': 1, 'bytes': 1073741824}],
+}
+
+
+@pytest.fixture(autouse=True)
+def mock_queue_store():
+    """Mock the QueueStore the dialog reads upload statistics from."""
+    with patch('src.storage.database.QueueStore') as mock_cls:
+        store = MagicMock()
+        mock_cls.return_value = store
+        store.get_upload_totals.return_value = dict(UPLOAD_STATS['totals'])
+        store.get_upload_stats.side_effect = lambda since_ts=None: (
+            UPLOAD_STATS if since_ts is None else {**{k: [] for k in UPLOAD_STATS}, 'totals': {
+                'galleries': 0, 'images': 0, 'bytes': 0}}
+        )
+        yield store
+
+
 @pytest.fixture
 def mock_metrics_store():
     """Mock MetricsStore for file host statistics."""
@@ -178,12 +207,14 @@ class TestStatisticsDialogInitialization:
     def test_has_tab_widget(self, dialog):
         """Test dialog has tabbed interface."""
         assert hasattr(dialog, '_tab_widget')
-        assert dialog._tab_widget.count() == 2
+        assert dialog._tab_widget.count() == 4
 
     def test_tab_names(self, dialog):
         """Test tab names are correct."""
         assert dialog._tab_widget.tabText(0) == "General"
-        assert dialog._tab_widget.tabText(1) == "File Hosts"
+        assert dialog._tab_widget.tabText(1) == "Breakdown"
+        assert dialog._tab_widget.tabText(2) == "File Hosts"
+        assert dialog._tab_widget.tabText(3) == "Latency"
 
 
 class TestFileHostStatsLoading:
@@ -342,6 +373,25 @@ class TestGeneralTabContent:
         text = dialog._first_startup_label.text()
         assert "2025-01-01" in text
 
+    def test_upload_totals_read_from_store(self, dialog, mock_queue_store):
+        """Test upload totals come from the database, not QSettings counters."""
+        mock_queue_store.get_upload_totals.assert_called()
+
+    def test_store_from_parent_window(self, qtbot, mock_qsettings, mock_metrics_store):
+        """Test the parent's queue store is used when present."""
+        from src.gui.dialogs.statistics_dialog import StatisticsDialog
+
+        parent = QWidget()
+        qtbot.addWidget(parent)
+        parent_store = MagicMock()
+        parent_store.get_upload_totals.return_value = {'galleries': 7, 'images': 70, 'bytes': 0}
+        parent_store.get_upload_stats.return_value = {**UPLOAD_STATS, 'by_day': []}
+        parent.queue_manager = Mock(store=parent_store)
+
+        dlg = StatisticsDialog(parent=parent)
+        qtbot.addWidget(dlg)
+        assert dlg._total_galleries_label.text() == "7"
+
     def test_total_galleries_displayed(self, dialog):
         """Test total galleries count is displayed."""
         text = dialog._total_galleries_label.text()
@@ -564,3 +614,98 @@ class TestOnTimeframeChanged:
 
         # Should have called with 'today'
         mock_store.get_hosts_for_period.assert_called_with('today')
+
+
+class TestLatencyTab:
+    """Test latency percentile table and chart."""
+
+    @pytest.fixture
+    def latency_store(self, mock_metrics_store):
+        mock_get, mock_store = mock_metrics_store
+        mock_store.get_latency_hosts.return_value = ['imx.to', 'rapidgator']
+        mock_store.get_latency_percentiles.side_effect = lambda host, metric, *args, **kwargs: {
+            'count': 200 if host == 'imx.to' else 3,
+            'p50': 0.25, 'p90': 0.8, 'p95': 1.5, 'p99': 4.0,
+        }
+        mock_store.get_latency_series.return_value = [
+            {'ts': 1700000000, 'count': 10, 'p50': 0.2, 'p95': 1.0},
+            {'ts': 1700003600, 'count': 12, 'p50': 0.3, 'p95': 1.4},
+        ]
+        return mock_store
+
+    def test_table_shows_percentiles(self, qtbot, mock_qsettings, latency_store):
+        from src.gui.dialogs.statistics_dialog import StatisticsDialog
+        dlg = StatisticsDialog()
+        qtbot.addWidget(dlg)
+
+        table = dlg._latency_table
+        assert table.rowCount() == 2
+        assert table.item(0, 0).text() == "imx.to"
+        assert table.item(0, 1).text() == "200"
+        assert table.item(0, 2).text() == "250 ms"
+        assert table.item(0, 5).text() == "4.00 s"
+
+    def test_chart_loaded_for_selected_host(self, qtbot, mock_qsettings, latency_store):
+        from src.gui.dialogs.statistics_dialog import StatisticsDialog
+        dlg = StatisticsDialog()
+        qtbot.addWidget(dlg)
+
+        args = latency_store.get_latency_series.call_args
+        assert args[0][0] == 'imx.to'
+        assert len(dlg._latency_chart._series) == 2
+
+    def test_metric_change_requeries(self, dialog, latency_store):
+        latency_store.get_latency_percentiles.reset_mock()
+        dialog._latency_metric_combo.setCurrentIndex(1)  # Speed
+        assert latency_store.get_latency_percentiles.call_args[0][1] == 'speed'
+
+    def test_no_data_message(self, dialog, mock_metrics_store):
+        _mock_get, mock_store = mock_metrics_store
+        mock_store.get_latency_hosts.return_value = []
+        dialog._load_latency_stats()
+        assert "No uploads" in dialog._latency_table.item(0, 0).text()
+
+
+class TestBreakdownTab:
+    """Test the upload Breakdown tab."""
+
+    def _select(self, combo, text):
+        combo.setCurrentIndex(combo.findText(text))
+
+    def test_defaults_to_all_time_by_day(self, dialog):
+        """Test days are listed newest first for all time."""
+        table = dialog._breakdown_table
+        assert table.rowCount() == 2
+        assert table.item(0, 0).text() == "2025-01-02"
+        assert table.item(0, 1).text() == "20"
+        assert table.horizontalHeaderItem(1).text() == "Galleries"
+        assert "50 galleries" in dialog._breakdown_total_label.text()
+
+    def test_group_by_template(self, dialog):
+        """Test grouping by template names galleries without one."""
+        self._select(dialog._breakdown_group_combo, "Template")
+        table = dialog._breakdown_table
+        assert table.horizontalHeaderItem(0).text() == "Template"
+        assert [table.item(r, 0).text() for r in range(table.rowCount())] == ["Default", "(none)"]
+
+    def test_group_by_host(self, dialog):
+        """Test file hosts show files and failures."""
+        self._select(dialog._breakdown_group_combo, "File Host")
+        table = dialog._breakdown_table
+        assert table.horizontalHeaderItem(2).text() == "Failed"
+        assert table.item(0, 0).text() == "Rapidgator"
+        assert table.item(0, 2).text() == "1"
+
+    def test_timeframe_passed_to_store(self, dialog, mock_queue_store):
+        """Test timeframes query the store from the start of the range."""
+        self._select(dialog._breakdown_timeframe_combo, "Last 7 Days")
+        since_ts = mock_queue_store.get_upload_stats.call_args[0][0]
+        assert abs(time.time() - 6 * 86400 - since_ts) < 60
+
+    def test_empty_timeframe_shows_message(self, dialog):
+        """Test a timeframe without uploads shows a message row."""
+        self._select(dialog._breakdown_timeframe_combo, "Today")
+        table = dialog._breakdown_table
+        assert table.rowCount() == 1
+        assert "No uploads for Today" in table.item(0, 0).text()
+        assert dialog._breakdown_total_label.text() == ""
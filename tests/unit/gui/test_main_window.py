@@ -300,14 +300,10 @@ def mock_dependencies(monkeypatch, tmp_path):
     mock_filehost_mgr.test_completed.connect = Mock()
     mock_filehost_mgr.upload_started = Mock()
     mock_filehost_mgr.upload_started.connect = Mock()
-    mock_filehost_mgr.upload_progress = Mock()
-    mock_filehost_mgr.upload_progress.connect = Mock()
     mock_filehost_mgr.upload_completed = Mock()
     mock_filehost_mgr.upload_completed.connect = Mock()
     mock_filehost_mgr.upload_failed = Mock()
     mock_filehost_mgr.upload_failed.connect = Mock()
-    mock_filehost_mgr.bandwidth_updated = Mock()
-    mock_filehost_mgr.bandwidth_updated.connect = Mock()
     monkeypatch.setattr('src.processing.file_host_worker_manager.FileHostWorkerManager', lambda x: mock_filehost_mgr)
 
     return {
@@ -470,7 +470,7 @@ class TestMenuActions:
         """Test open_help_dialog opens help"""
         window = create_minimal_window()
 
-        with patch('src.gui.main_window.HelpDialog') as mock_dialog_class:
+        with patch('src.gui.dialogs.help_dialog.HelpDialog') as mock_dialog_class:
             # Create mock instance with exec properly mocked
             mock_instance = Mock()
             mock_instance.exec = Mock(return_value=0)
@@ -734,6 +734,35 @@ class TestFileHostIntegration:
                 window.on_file_host_upload_failed(123, 'pixhost', 'Connection timeout')
                 mock_log.assert_called()
 
+    @pytest.mark.parametrize("archive_exists", [True, False])
+    def test_file_host_icon_click_archive_gallery(self, tmp_path, archive_exists):
+        """Test manual upload of an archive gallery checks the archive, not a folder"""
+        import zipfile
+        from src.utils.archive_utils import make_archive_gallery_path
+
+        archive = tmp_path / "photos.zip"
+        if archive_exists:
+            with zipfile.ZipFile(archive, 'w') as zf:
+                zf.writestr("set1/001.jpg", b"img")
+        gallery_path = make_archive_gallery_path(archive, "set1")
+
+        window = Mock()
+        window.queue_manager.store.get_file_host_uploads.return_value = []
+        window._handle_missing_gallery_folder.return_value = None
+
+        with patch('src.core.file_host_config.get_config_manager') as mock_config, \
+                patch('PyQt6.QtWidgets.QMessageBox.information'):
+            mock_config.return_value.get_host.return_value = Mock()
+            BBDropGUI._on_file_host_icon_clicked(window, gallery_path, 'pixhost')
+
+        if archive_exists:
+            window._handle_missing_gallery_folder.assert_not_called()
+            window.queue_manager.store.add_file_host_upload.assert_called_once_with(
+                gallery_path=gallery_path, host_name='pixhost', status='pending')
+        else:
+            window._handle_missing_gallery_folder.assert_called_once_with(gallery_path, 'pixhost')
+            window.queue_manager.store.add_file_host_upload.assert_not_called()
+
 
 # ============================================================================
 # BBCode Operations Tests
@@ -772,7 +801,7 @@ class TestBBCodeOperations:
         mock_item = Mock(path=str(test_path), gallery_id='123', status='completed')
         comprehensive_mock_dependencies['queue_mgr'].get_item.return_value = mock_item
 
-        with patch('src.gui.main_window.BBCodeViewerDialog') as mock_dialog_class:
+        with patch('src.gui.dialogs.bbcode_viewer.BBCodeViewerDialog') as mock_dialog_class:
             # Create mock instance with exec properly mocked to prevent actual dialog
             mock_instance = Mock()
             mock_instance.exec = Mock(return_value=0)
@@ -0,0 +1,107 @@
+"""
+Tests for ProgressBusPump.
+
+Covers per-channel dispatch, flushing ahead of completion signals, rate
+limits and a stress run with 50 concurrent transfers.
+"""
+
+import threading
+import time
+
+from src.gui.progress_pump import MAX_REFRESH_HZ, ProgressBusPump
+from src.utils.progress_bus import (
+    CHANNEL_BANDWIDTH, CHANNEL_FILE_HOST, CHANNEL_GALLERY, ProgressBus,
+)
+
+
+class TestProgressBusPump:
+    """Test draining the bus on the GUI thread"""
+
+    def test_flush_dispatches_latest_state_per_channel(self, qtbot):
+        bus = ProgressBus()
+        pump = ProgressBusPump(bus)
+        gallery, bandwidth = [], []
+        pump.subscribe(CHANNEL_GALLERY, lambda key, state: gallery.append((key, state)))
+        pump.subscribe(CHANNEL_BANDWIDTH, lambda key, state: bandwidth.append((key, state)))
+
+        bus.publish(CHANNEL_GALLERY, "/a", (1, 4, 25, "1.jpg"))
+        bus.publish(CHANNEL_GALLERY, "/a", (2, 4, 50, "2.jpg"))
+        bus.publish(CHANNEL_BANDWIDTH, "imx.to", 512.0)
+        bus.publish(CHANNEL_FILE_HOST, (1, "host"), (1, 2, 0.0))  # no subscriber
+        pump.flush("/a", {})  # accepts and ignores signal arguments
+
+        assert gallery == [("/a", (2, 4, 50, "2.jpg"))]
+        assert bandwidth == [("imx.to", 512.0)]
+        assert bus.stats().pending == 0
+
+    def test_failing_handler_does_not_block_others(self, qtbot):
+        bus = ProgressBus()
+        pump = ProgressBusPump(bus)
+        received = []
+        pump.subscribe(CHANNEL_GALLERY, lambda key, state: 1 / 0)
+        pump.subscribe(CHANNEL_GALLERY, lambda key, state: received.append(key))
+        bus.publish(CHANNEL_GALLERY, "/a", None)
+        pump.flush()
+        assert received == ["/a"]
+
+    def test_rate_is_clamped(self, qtbot):
+        pump = ProgressBusPump(ProgressBus(), rate_hz=1000)
+        assert pump.rate_hz == MAX_REFRESH_HZ
+        pump.set_rate(0)
+        assert pump.rate_hz == 1
+
+
+class TestProgressBusStress:
+    """Test 50 active transfers publishing while the pump runs"""
+
+    def test_fifty_transfers(self, qtbot):
+        bus = ProgressBus()
+        pump = ProgressBusPump(bus, rate_hz=20)
+        latest = {}
+        frames = []
+        dispatched = [0]
+
+        def on_progress(key, state):
+            latest[key] = state
+            dispatched[0] += 1
+
+        pump.subscribe(CHANNEL_FILE_HOST, on_progress)
+        original_drain = bus.drain
+
+        def counting_drain():
+            pending = original_drain()
+            frames.append(sum(len(updates) for updates in pending.values()))
+            return pending
+
+        bus.drain = counting_drain
+
+        steps = 200
+        done = threading.Event()
+        finished = [0]
+        lock = threading.Lock()
+
+        def transfer(db_id):
+            for uploaded in range(1, steps + 1):
+                bus.publish(CHANNEL_FILE_HOST, (db_id, "host"), (uploaded, steps, 1024.0))
+                time.sleep(0.001)
+            with lock:
+                finished[0] += 1
+                if finished[0] == 50:
+                    done.set()
+
+        pump.start()
+        threads = [threading.Thread(target=transfer, args=(i,)) for i in range(50)]
+        for t in threads:
+            t.start()
+        qtbot.waitUntil(done.is_set, timeout=20000)
+        for t in threads:
+            t.join()
+        pump.stop()  # delivers what is still pending
+
+        assert latest == {(i, "host"): (steps, steps, 1024.0) for i in range(50)}
+        stats = bus.stats()
+        assert stats.published == 50 * steps
+        assert stats.delivered + stats.coalesced == stats.published
+        assert stats.coalesced > stats.delivered  # most updates never reach the GUI
+        assert dispatched[0] == stats.delivered
+        assert max(frames) <= 50  # at most one state per transfer per frame
@@ -0,0 +1,176 @@
+"""
+Unit tests for ThemeManager stylesheet caching.
+
+Tests verify that:
+1. Compiled stylesheets are cached in memory and on disk per theme
+2. Changing a source file (QSS or tokens) invalidates the cache
+3. Re-applying the current theme does not reset the app stylesheet or palette
+4. Theme switches are timed
+"""
+
+import json
+import os
+import time
+from unittest.mock import Mock
+
+import pytest
+from PyQt6.QtWidgets import QApplication
+
+import src.gui.theme_manager as theme_manager
+from src.gui.theme_manager import ThemeManager
+
+
+@pytest.fixture
+def qt_app():
+    """Ensure QApplication exists and restore its styling afterwards"""
+    app = QApplication.instance()
+    if app is None:
+        app = QApplication([])
+    stylesheet, palette = app.styleSheet(), app.palette()
+    yield app
+    app.setStyleSheet(stylesheet)
+    app.setPalette(palette)
+
+
+@pytest.fixture
+def assets(tmp_path, monkeypatch):
+    """Temporary modular QSS assets and stylesheet cache directory"""
+    assets_dir = tmp_path / "assets"
+    styles = assets_dir / "styles"
+    (styles / "components").mkdir(parents=True)
+    (styles / "themes").mkdir()
+    (styles / "base.qss").write_text("QWidget { font-size: $typography.fontSize.base; }")
+    (styles / "components" / "buttons.qss").write_text(
+        "QPushButton { padding: 2px; }\n/* LIGHT_THEME_START */\nQPushButton { color: red; }")
+    (styles / "themes" / "dark.qss").write_text("QWidget { background: $colors.background.primary; }")
+    (styles / "themes" / "light.qss").write_text("QWidget { background: $colors.background.primary; }")
+    (assets_dir / "tokens.json").write_text(json.dumps({
+        "typography": {"fontSize": {"base": "9pt"}},
+        "colors": {"dark": {"background": {"primary": "#111111"}},
+                   "light": {"background": {"primary": "#fefefe"}}},
+    }))
+    cache_dir = tmp_path / "cache"
+    monkeypatch.setattr(theme_manager, "get_assets_dir", lambda: str(assets_dir))
+    monkeypatch.setattr(theme_manager, "get_stylesheet_cache_dir", lambda: str(cache_dir))
+    monkeypatch.setattr(theme_manager, "_cached_tokens", None)
+    return assets_dir, cache_dir
+
+
+def _touch(path, text):
+    """Rewrite a source file with a newer mtime"""
+    path.write_text(text)
+    stat = os.stat(path)
+    os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+
+
+def _main_window():
+    return Mock(spec=['setUpdatesEnabled', '_refresh_button_icons', 'refresh_all_status_icons',
+                      '_current_theme_mode'])
+
+
+class TestStylesheetCache:
+    """Test compiled stylesheet caching"""
+
+    def test_compiles_once_then_uses_memory(self, assets):
+        manager = ThemeManager(_main_window())
+
+        dark = manager._get_stylesheet_for_theme('dark')
+        assert manager._last_stylesheet_source == 'compiled'
+        assert "background: #111111" in dark
+        assert "font-size: 9pt" in dark
+        assert "color: red" not in dark
+
+        assert manager._get_stylesheet_for_theme('dark') == dark
+        assert manager._last_stylesheet_source == 'memory'
+
+    def test_themes_cached_separately(self, assets):
+        manager = ThemeManager(_main_window())
+        dark = manager._get_stylesheet_for_theme('dark')
+        light = manager._get_stylesheet_for_theme('light')
+        assert "#fefefe" in light and "#fefefe" not in dark
+        assert manager._get_stylesheet_for_theme('dark') == dark
+        assert manager._last_stylesheet_source == 'memory'
+
+    def test_disk_cache_used_by_new_instance(self, assets, monkeypatch):
+        _, cache_dir = assets
+        dark = ThemeManager(_main_window())._get_stylesheet_for_theme('dark')
+        assert len(list(cache_dir.glob("dark-*.qss"))) == 1
+
+        manager = ThemeManager(_main_window())
+        monkeypatch.setattr(manager, "_compile_stylesheet", Mock(side_effect=AssertionError("recompiled")))
+        assert manager._get_stylesheet_for_theme('dark') == dark
+        assert manager._last_stylesheet_source == 'disk'
+
+    def test_changed_qss_invalidates_cache(self, assets):
+        assets_dir, cache_dir = assets
+        manager = ThemeManager(_main_window())
+        manager._get_stylesheet_for_theme('dark')
+
+        _touch(assets_dir / "styles" / "themes" / "dark.qss", "QWidget { background: black; }")
+
+        dark = manager._get_stylesheet_for_theme('dark')
+        assert manager._last_stylesheet_source == 'compiled'
+        assert "background: black" in dark
+        # The stale build is replaced on disk
+        assert len(list(cache_dir.glob("dark-*.qss"))) == 1
+
+    def test_changed_tokens_invalidate_cache(self, assets):
+        assets_dir, _ = assets
+        manager = ThemeManager(_main_window())
+        manager._get_stylesheet_for_theme('dark')
+
+        _touch(assets_dir / "tokens.json", json.dumps({
+            "typography": {"fontSize": {"base": "11pt"}},
+            "colors": {"dark": {"background": {"primary": "#222222"}}},
+        }))
+
+        dark = manager._get_stylesheet_for_theme('dark')
+        assert "#222222" in dark
+        assert "font-size: 11pt" in dark
+
+    def test_unwritable_cache_dir_still_compiles(self, assets, monkeypatch, tmp_path):
+        blocker = tmp_path / "not-a-dir"
+        blocker.write_text("")
+        monkeypatch.setattr(theme_manager, "get_stylesheet_cache_dir", lambda: str(blocker / "styles"))
+
+        manager = ThemeManager(_main_window())
+        assert "#111111" in manager._get_stylesheet_for_theme('dark')
+
+
+class TestApplyTheme:
+    """Test applying themes to the application"""
+
+    def test_reapplying_theme_skips_restyle(self, qt_app, assets, monkeypatch):
+        manager = ThemeManager(_main_window())
+        manager.apply_theme('dark')
+        assert "#111111" in qt_app.styleSheet()
+
+        set_stylesheet = Mock()
+        set_palette = Mock()
+        monkeypatch.setattr(qt_app, "setStyleSheet", set_stylesheet)
+        monkeypatch.setattr(qt_app, "setPalette", set_palette)
+
+        manager.apply_theme('dark')
+        set_stylesheet.assert_not_called()
+        set_palette.assert_not_called()
+
+    def test_switch_restyles_and_is_timed(self, qt_app, assets):
+        manager = ThemeManager(_main_window())
+        manager.apply_theme('dark')
+        manager.apply_theme('light')
+
+        assert "#fefefe" in qt_app.styleSheet()
+        assert manager.last_theme_switch_ms is not None
+        assert manager.last_theme_switch_ms >= 0
+
+    def test_cached_switch_skips_compile(self, qt_app, assets, monkeypatch):
+        manager = ThemeManager(_main_window())
+        manager.apply_theme('dark')
+        manager.apply_theme('light')
+
+        monkeypatch.setattr(manager, "_compile_stylesheet", Mock(side_effect=AssertionError("recompiled")))
+        started = time.perf_counter()
+        manager.apply_theme('dark')
+        assert "#111111" in qt_app.styleSheet()
+        assert manager._last_stylesheet_source == 'memory'
+        assert manager.last_theme_switch_ms <= (time.perf_counter() - started) * 1000
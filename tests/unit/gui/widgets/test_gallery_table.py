@@ -478,7 +478,7 @@ class TestGalleryManagementActions:
         parent_mock.queue_manager = mock_queue_manager
 
         with patch.object(gallery_table, 'parent', return_value=parent_mock):
-            with patch('src.gui.widgets.gallery_table.GalleryFileManagerDialog') as mock_dialog:
+            with patch('src.gui.dialogs.gallery_file_manager.GalleryFileManagerDialog') as mock_dialog:
                 mock_dialog_instance = Mock()
                 mock_dialog_instance.exec.return_value = QDialog.DialogCode.Accepted
                 mock_dialog.return_value = mock_dialog_instance
@@ -575,6 +575,22 @@ class TestGalleryManagementActions:
             gallery_table.open_folders_via_menu([str(test_dir)])
             mock_open.assert_called_once()
 
+    def test_open_folders_via_menu_archive_gallery(self, gallery_table, tmp_path):
+        """Test an archive gallery opens the folder holding its archive"""
+        from src.utils.archive_utils import make_archive_gallery_path
+
+        archive = tmp_path / "photos.zip"
+        archive.write_bytes(b"PK\x05\x06" + b"\x00" * 18)
+        missing = tmp_path / "missing.zip"
+
+        with patch('src.gui.widgets.gallery_table.QDesktopServices.openUrl') as mock_open:
+            gallery_table.open_folders_via_menu([
+                make_archive_gallery_path(archive, "set1"),
+                make_archive_gallery_path(missing, "set1"),
+            ])
+
+        mock_open.assert_called_once_with(QUrl.fromLocalFile(str(tmp_path)))
+
 
 # ============================================================================
 # Test: Upload Status Operations
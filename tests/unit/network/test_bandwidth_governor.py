@@ -0,0 +1,164 @@
+"""
+Test suite for the upload bandwidth governor.
+
+Tests token-bucket accuracy, weighted sharing of the global limit,
+per-service ceilings, rebalancing, schedules and curl upload shaping.
+"""
+
+import threading
+import time
+from datetime import datetime
+
+import pytest
+
+from src.network import bandwidth_governor
+from src.network.bandwidth_governor import (
+    BandwidthGovernor, IMX_SERVICE, file_host_service, parse_schedule, scheduled_limit,
+)
+
+HOST = file_host_service("rapidgator")
+
+
+def _pump(governor, service, seconds, sent, chunk=16 * 1024):
+    """Push bytes through a transfer as fast as the governor allows."""
+    with governor.transfer(service) as shaper:
+        total = 0
+        end = time.perf_counter() + seconds
+        while time.perf_counter() < end:
+            total += chunk
+            shaper.update(total)
+        sent.append(total)
+
+
+class TestRateLimiting:
+    """Test that the aggregate rate stays at the limit"""
+
+    def test_aggregate_rate_within_five_percent(self):
+        governor = BandwidthGovernor()
+        governor.configure(global_kbps=2048)
+        sent = []
+        threads = [threading.Thread(target=_pump, args=(governor, service, 1.5, sent))
+                   for service in (IMX_SERVICE, IMX_SERVICE, HOST, file_host_service("k2s"))]
+        start = time.perf_counter()
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+        rate = sum(sent) / (time.perf_counter() - start)
+        assert rate == pytest.approx(2048 * 1024, rel=0.05)
+
+    def test_unlimited_does_not_block(self):
+        governor = BandwidthGovernor()
+        governor.configure()
+        start = time.perf_counter()
+        with governor.transfer(IMX_SERVICE) as shaper:
+            shaper.update(500 * 1024 * 1024)
+        assert time.perf_counter() - start < 0.1
+        assert governor.describe_limit() == "unlimited"
+
+
+class TestSharing:
+    """Test hierarchical sharing between services"""
+
+    def test_weights_split_global_limit(self):
+        governor = BandwidthGovernor()
+        governor.configure(global_kbps=4096, service_weights={IMX_SERVICE: 3})
+        with governor.transfer(IMX_SERVICE), governor.transfer(HOST):
+            assert governor.service_rate(IMX_SERVICE) == pytest.approx(3072 * 1024)
+            assert governor.service_rate(HOST) == pytest.approx(1024 * 1024)
+
+    def test_ceiling_leftover_goes_to_other_services(self):
+        governor = BandwidthGovernor()
+        governor.configure(global_kbps=4096, service_limits={IMX_SERVICE: 512})
+        with governor.transfer(IMX_SERVICE), governor.transfer(HOST):
+            assert governor.service_rate(IMX_SERVICE) == pytest.approx(512 * 1024)
+            assert governor.service_rate(HOST) == pytest.approx(3584 * 1024)
+
+    def test_rebalances_when_transfers_end(self):
+        governor = BandwidthGovernor()
+        governor.configure(global_kbps=1000)
+        with governor.transfer(HOST):
+            with governor.transfer(IMX_SERVICE):
+                assert governor.service_rate(HOST) == pytest.approx(500 * 1024)
+            assert governor.service_rate(HOST) == pytest.approx(1000 * 1024)
+
+    def test_default_file_host_limit_without_global(self):
+        governor = BandwidthGovernor()
+        governor.configure(file_host_limit_kbps=300)
+        with governor.transfer(HOST), governor.transfer(IMX_SERVICE):
+            assert governor.service_rate(HOST) == pytest.approx(300 * 1024)
+            assert governor.service_rate(IMX_SERVICE) is None
+
+    def test_live_global_change(self):
+        governor = BandwidthGovernor()
+        governor.configure(global_kbps=100)
+        with governor.transfer(IMX_SERVICE):
+            governor.set_global_limit(800)
+            assert governor.service_rate(IMX_SERVICE) == pytest.approx(800 * 1024)
+            governor.set_global_limit(0)
+            assert governor.service_rate(IMX_SERVICE) is None
+
+
+class TestSchedule:
+    """Test time-of-day schedules"""
+
+    def test_parse_and_match(self):
+        rules = parse_schedule("08:00-18:00=2048; 22:30-06:00=0, bogus")
+        assert rules == [(480, 1080, 2048), (1350, 360, 0)]
+        assert scheduled_limit(rules, datetime(2026, 1, 1, 9, 15)) == 2048
+        assert scheduled_limit(rules, datetime(2026, 1, 1, 23, 0)) == 0
+        assert scheduled_limit(rules, datetime(2026, 1, 1, 5, 59)) == 0
+        assert scheduled_limit(rules, datetime(2026, 1, 1, 19, 0)) is None
+
+    def test_schedule_overrides_global_limit(self):
+        governor = BandwidthGovernor()
+        governor._clock = lambda: datetime(2026, 1, 1, 12, 0)
+        governor.configure(global_kbps=4096, schedule="08:00-18:00=1024; 18:00-20:00=0")
+        assert governor.effective_limit_kbps() == 1024
+
+        governor._clock = lambda: datetime(2026, 1, 1, 19, 0)
+        governor.configure(global_kbps=4096, schedule="08:00-18:00=1024; 18:00-20:00=0")
+        assert governor.effective_limit_kbps() is None
+
+        governor._clock = lambda: datetime(2026, 1, 1, 21, 0)
+        governor.configure(global_kbps=4096, schedule="08:00-18:00=1024; 18:00-20:00=0")
+        assert governor.effective_limit_kbps() == 4096
+
+
+class TestCurlUploads:
+    """Test shaping of real FileHostClient uploads against the benchmark mock server"""
+
+    def test_concurrent_file_host_uploads_respect_limit(self, tmp_path, monkeypatch):
+        from benchmarks.mock_server import MockServer
+        from src.core.engine import AtomicCounter
+        from src.core.file_host_config import HostConfig
+        from src.network.file_host_client import FileHostClient
+
+        governor = BandwidthGovernor()
+        governor.configure(global_kbps=1024)
+        monkeypatch.setattr(bandwidth_governor, "_governor", governor)
+
+        files = []
+        for i in range(2):
+            path = tmp_path / f"f{i}.zip"
+            path.write_bytes(b"x" * (1024 * 1024))
+            files.append(path)
+
+        with MockServer() as server:
+            def upload(path, host_id):
+                config = HostConfig(name=host_id, upload_endpoint=f"{server.url}/host/upload",
+                                    link_path=["result", "url"])
+                FileHostClient(config, AtomicCounter()).upload_file(path)
+
+            threads = [threading.Thread(target=upload, args=(path, f"host{i}"))
+                       for i, path in enumerate(files)]
+            start = time.perf_counter()
+            for t in threads:
+                t.start()
+            for t in threads:
+                t.join()
+            elapsed = time.perf_counter() - start
+            received = server.stats.bytes_received
+
+        assert received >= 2 * 1024 * 1024
+        assert received / elapsed <= 1024 * 1024 * 1.05
@@ -16,6 +16,7 @@ from PyQt6.QtCore import QThread
 from src.network.client import GUIImxToUploader, SingleInstanceServer
 from src.core.engine import AtomicCounter
 from src.core.constants import COMMUNICATION_PORT
+from src.utils.progress_bus import CHANNEL_GALLERY
 
 
 class TestGUIImxToUploaderInitialization:
@@ -451,8 +452,6 @@ class TestUploadFolderCallbacks:
         worker.current_item = None
         worker.gallery_started = Mock()
         worker.gallery_started.emit = Mock()
-        worker.progress_updated = Mock()
-        worker.progress_updated.emit = Mock()
         worker._emit_current_bandwidth = Mock()
         return worker
 
@@ -461,12 +460,12 @@ class TestUploadFolderCallbacks:
     def test_on_progress_callback(
         self, mock_engine_class, mock_parent_init, temp_folder_with_images, mock_worker_thread
     ):
-        """Test that on_progress callback emits progress signal."""
+        """Test that on_progress callback publishes progress to the bus."""
         captured_callbacks = {}
 
         def capture_engine_init(uploader, rename_worker, **kwargs):
             engine = Mock()
-            captured_callbacks['on_progress'] = kwargs.get('on_progress')
+            captured_callbacks['engine'] = engine
             engine.run.return_value = {
                 'images': [],
                 'successful_count': 0,
@@ -478,15 +477,16 @@ class TestUploadFolderCallbacks:
         mock_engine_class.side_effect = capture_engine_init
 
         uploader = GUIImxToUploader(worker_thread=mock_worker_thread)
-        uploader.upload_folder(
-            folder_path=temp_folder_with_images,
-            gallery_name="test_gallery"
-        )
-
-        on_progress = captured_callbacks.get('on_progress')
-        if on_progress:
+        with patch('src.network.client.get_progress_bus') as mock_bus:
+            uploader.upload_folder(
+                folder_path=temp_folder_with_images,
+                gallery_name="test_gallery"
+            )
+            on_progress = captured_callbacks['engine'].run.call_args.kwargs['on_progress']
             on_progress(1, 3, 33, "image_0.jpg")
-            mock_worker_thread.progress_updated.emit.assert_called()
+
+        mock_bus.return_value.publish.assert_any_call(
+            CHANNEL_GALLERY, temp_folder_with_images, (1, 3, 33, "image_0.jpg"))
 
     @patch('src.network.client.ImxToUploader.__init__', return_value=None)
     @patch('src.network.client.UploadEngine')
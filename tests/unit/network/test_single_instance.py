@@ -0,0 +1,159 @@
+"""
+Tests for the single-instance IPC protocol.
+
+Covers message framing, legacy raw-text senders, sender batching and
+SingleInstanceServer acknowledging and emitting forwarded paths.
+"""
+
+import socket
+import threading
+import time
+
+import pytest
+from PyQt6.QtCore import Qt
+
+from src.network.client import SingleInstanceServer
+from src.network.single_instance import (
+    ProtocolError, encode_message, forward_to_running_instance, read_message, request,
+)
+
+
+def _free_port_pair():
+    for _ in range(50):
+        with socket.socket() as first:
+            first.bind(('localhost', 0))
+            port = first.getsockname()[1]
+            try:
+                with socket.socket() as second:
+                    second.bind(('localhost', port + 1))
+                    return port
+            except OSError:
+                continue
+    pytest.skip("No free port pair")
+
+
+def _wait_for(predicate, timeout=3.0):
+    deadline = time.monotonic() + timeout
+    while not predicate() and time.monotonic() < deadline:
+        time.sleep(0.01)
+
+
+@pytest.fixture
+def ipc_server():
+    """SingleInstanceServer running on a plain thread, recording its signals."""
+    port = _free_port_pair()
+    server = SingleInstanceServer(port=port)
+    received = {'messages': [], 'legacy': []}
+    lock = threading.Lock()
+
+    def on_paths(paths, options):
+        with lock:
+            received['messages'].append((paths, options))
+
+    server.paths_received.connect(on_paths, Qt.ConnectionType.DirectConnection)
+    server.folder_received.connect(received['legacy'].append, Qt.ConnectionType.DirectConnection)
+    thread = threading.Thread(target=server.run, daemon=True)
+    thread.start()
+    deadline = time.monotonic() + 3
+    while time.monotonic() < deadline:
+        try:
+            socket.create_connection(('localhost', port), timeout=0.2).close()
+            break
+        except OSError:
+            time.sleep(0.02)
+    # The probe above arrives as an empty legacy message
+    time.sleep(0.05)
+    received['legacy'].clear()
+    yield port, received
+    server.running = False
+    thread.join(timeout=3)
+
+
+class TestFraming:
+    """Test length-prefixed JSON frames"""
+
+    def test_round_trip_long_paths(self):
+        paths = ["C:\\" + "x" * 5000, "/tmp/ünïcode"]
+        a, b = socket.socketpair()
+        with a, b:
+            a.sendall(encode_message({'type': 'add', 'paths': paths}))
+            assert read_message(b)['paths'] == paths
+
+    def test_legacy_raw_text(self):
+        a, b = socket.socketpair()
+        with b:
+            a.sendall("/some/folder".encode('utf-8'))
+            a.close()
+            message = read_message(b)
+        assert message == {'type': 'add', 'paths': ['/some/folder'], 'legacy': True}
+
+    def test_rejects_malformed(self):
+        a, b = socket.socketpair()
+        with a, b:
+            a.sendall(b"\x00\x00\x00\x05[1,2]")
+            with pytest.raises(ProtocolError):
+                read_message(b)
+
+
+class TestServer:
+    """Test SingleInstanceServer"""
+
+    def test_acknowledges_and_emits_options(self, ipc_server):
+        port, received = ipc_server
+        reply = request({'type': 'add', 'paths': ['/a', '/b'], 'tab': 'Later', 'template': 'Plain'}, port)
+        assert reply == {'ok': True, 'received': 2}
+        _wait_for(lambda: received['messages'])
+        assert received['messages'] == [(['/a', '/b'], {'tab': 'Later', 'template': 'Plain'})]
+
+    def test_legacy_sender_still_works(self, ipc_server):
+        port, received = ipc_server
+        with socket.create_connection(('localhost', port)) as sock:
+            sock.sendall(b"/legacy/folder")
+        _wait_for(lambda: received['legacy'])
+        assert received['legacy'] == ['/legacy/folder']
+
+
+class TestForwarding:
+    """Test batching of concurrent senders"""
+
+    def test_concurrent_senders_are_batched(self, ipc_server):
+        port, received = ipc_server
+        results = []
+
+        def send(i):
+            results.append(forward_to_running_instance([f"/folder/{i}"], template='Plain', port=port))
+
+        threads = [threading.Thread(target=send, args=(i,)) for i in range(100)]
+        start = time.perf_counter()
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+        elapsed = time.perf_counter() - start
+
+        assert all(delivered for delivered, _ in results)
+        _wait_for(lambda: sum(len(p) for p, _ in received['messages']) >= 100)
+        paths = [p for msg_paths, _ in received['messages'] for p in msg_paths]
+        assert sorted(paths) == sorted(f"/folder/{i}" for i in range(100))
+        assert len(received['messages']) < 10
+        assert received['messages'][0][1] == {'template': 'Plain'}
+        assert elapsed < 5
+
+    def test_no_instance_returns_collected_paths(self):
+        port = _free_port_pair()
+        results = {}
+
+        def send(name, paths, delay):
+            time.sleep(delay)
+            results[name] = forward_to_running_instance(paths, port=port, batch_window=0.3)
+
+        collector = threading.Thread(target=send, args=('collector', ['/a'], 0))
+        follower = threading.Thread(target=send, args=('follower', ['/b', '/c'], 0.1))
+        collector.start()
+        follower.start()
+        collector.join()
+        follower.join()
+
+        # The follower handed off to the collector, which starts the GUI with everything
+        assert results['follower'] == (True, ['/b', '/c'])
+        assert results['collector'] == (False, ['/a', '/b', '/c'])
@@ -643,3 +643,43 @@ class TestArchiveCoordinatorIntegration:
 
         assert result is None
         mock_service.cleanup_temp_dir.assert_called_once_with(temp_dir)
+
+
+class TestProcessArchiveEarlyQueueing:
+    """Test selecting folders before extraction and queueing them early"""
+
+    def test_selects_then_extracts_only_selected(self):
+        """Test only the selected inner folders are extracted"""
+        mock_service = Mock()
+        mock_service.list_archive_folders.return_value = ["a", "b"]
+        mock_service.extract_archive.return_value = Path("/tmp/extract_set")
+        mock_service.get_folders.return_value = [Path("/tmp/extract_set/b")]
+        on_ready = Mock()
+        on_progress = Mock()
+
+        coordinator = ArchiveCoordinator(mock_service)
+        with patch('src.processing.archive_coordinator.ArchiveFolderSelector') as mock_dialog_class:
+            mock_dialog = Mock()
+            mock_dialog.exec.return_value = True
+            mock_dialog.get_selected_folders.return_value = [Path("set", "b")]
+            mock_dialog_class.return_value = mock_dialog
+
+            result = coordinator.process_archive("/tmp/set.zip", on_folder_ready=on_ready,
+                                                 on_progress=on_progress)
+
+        assert result == [Path("/tmp/extract_set/b")]
+        mock_service.extract_archive.assert_called_once_with(
+            Path("/tmp/set.zip"), folders=["b"], on_folder_ready=on_ready, on_progress=on_progress
+        )
+
+    def test_cancel_skips_extraction(self):
+        """Test cancelling the selector extracts nothing"""
+        mock_service = Mock()
+        mock_service.list_archive_folders.return_value = ["a", "b"]
+
+        coordinator = ArchiveCoordinator(mock_service)
+        with patch('src.processing.archive_coordinator.ArchiveFolderSelector') as mock_dialog_class:
+            mock_dialog_class.return_value.exec.return_value = False
+            assert coordinator.process_archive("/tmp/set.zip", on_folder_ready=Mock()) is None
+
+        mock_service.extract_archive.assert_not_called()
@@ -5,7 +5,7 @@ Tests archive extraction worker with threading and signal mocking.
 
 import pytest
 from pathlib import Path
-from unittest.mock import Mock, MagicMock, patch, call
+from unittest.mock import ANY, Mock, MagicMock, patch, call
 from PyQt6.QtCore import QObject
 
 from src.processing.archive_worker import (
@@ -138,7 +138,9 @@ class TestArchiveExtractionWorkerRunSuccess:
         worker.run()
 
         # Verify coordinator was called
-        mock_coordinator.process_archive.assert_called_once_with("/path/to/archive.zip")
+        mock_coordinator.process_archive.assert_called_once_with(
+            "/path/to/archive.zip", on_folder_ready=ANY, on_progress=ANY
+        )
         # Verify finished signal was emitted with string paths
         finished_spy.assert_called_once()
         args = finished_spy.call_args[0]
@@ -429,7 +431,7 @@ class TestArchiveExtractionWorkerEdgeCases:
 
         worker.run()
 
-        mock_coordinator.process_archive.assert_called_once_with(archive_path)
+        mock_coordinator.process_archive.assert_called_once_with(archive_path, on_folder_ready=ANY, on_progress=ANY)
 
     def test_run_with_unicode_in_path(self):
         """Test handling unicode characters in path"""
@@ -460,7 +462,7 @@ class TestArchiveExtractionWorkerEdgeCases:
 
         worker.run()
 
-        mock_coordinator.process_archive.assert_called_once_with(long_path)
+        mock_coordinator.process_archive.assert_called_once_with(long_path, on_folder_ready=ANY, on_progress=ANY)
 
     def test_run_multiple_times(self):
         """Test worker can be run multiple times"""
@@ -495,7 +497,7 @@ class TestArchiveExtractionWorkerEdgeCases:
 
         worker.run()
 
-        mock_coordinator.process_archive.assert_called_once_with(archive_path)
+        mock_coordinator.process_archive.assert_called_once_with(archive_path, on_folder_ready=ANY, on_progress=ANY)
 
 
 class TestArchiveExtractionWorkerCoordination:
@@ -510,7 +512,7 @@ class TestArchiveExtractionWorkerCoordination:
         worker = ArchiveExtractionWorker(archive_path, mock_coordinator)
         worker.run()
 
-        mock_coordinator.process_archive.assert_called_once_with(archive_path)
+        mock_coordinator.process_archive.assert_called_once_with(archive_path, on_folder_ready=ANY, on_progress=ANY)
 
     def test_run_respects_coordinator_return_value(self):
         """Test worker uses coordinator's return value"""
@@ -587,3 +589,30 @@ class TestArchiveExtractionWorkerIntegration:
         error_spy.assert_called_once()
         args = error_spy.call_args[0]
         assert "Corrupted archive" in args[1]
+
+
+class TestArchiveExtractionWorkerEarlyQueueing:
+    """Test per-folder and progress signals emitted during extraction"""
+
+    def test_folder_ready_and_progress_forwarded(self):
+        """Test coordinator callbacks are forwarded as signals"""
+        mock_coordinator = Mock()
+
+        def process(archive_path, on_folder_ready=None, on_progress=None):
+            on_progress(50, 200)
+            on_progress(51, 200)  # same percent, not re-emitted
+            on_folder_ready(Path("/extracted/folder1"))
+            on_progress(200, 200)
+            return [Path("/extracted/folder1")]
+
+        mock_coordinator.process_archive.side_effect = process
+        worker = ArchiveExtractionWorker("/path/to/archive.zip", mock_coordinator)
+        ready_spy = Mock()
+        progress_spy = Mock()
+        worker.signals.folder_ready.connect(ready_spy)
+        worker.signals.progress.connect(progress_spy)
+
+        worker.run()
+
+        ready_spy.assert_called_once_with("/path/to/archive.zip", str(Path("/extracted/folder1")))
+        assert [c.args[1] for c in progress_spy.call_args_list] == [25, 100]
@@ -0,0 +1,235 @@
+"""
+Tests for headless batch uploads.
+
+Covers the connection budget, JSON-lines progress events, the resume journal
+and exit codes, driven by a fake uploader.
+"""
+
+import io
+import json
+import os
+import threading
+import time
+from unittest.mock import Mock
+
+import pytest
+
+from src.core.upload_retry import RetryPolicy
+from src.processing.batch_upload import (
+    EXIT_ALL_FAILED, EXIT_INTERRUPTED, EXIT_OK, EXIT_PARTIAL,
+    BatchOptions, BatchUploader, ConnectionBudget, ProgressWriter, ResumeJournal,
+)
+
+
+class FakeUploader:
+    """Fake imx.to uploader tracking in-flight uploads.
+
+    Entries in `fail` ("img3.jpg" or "gallery1/img3.jpg") always error.
+    """
+
+    def __init__(self, fail=(), duration=0.01):
+        self.headers = {}
+        self.web_url = 'https://imx.to'
+        self.fail = set(fail)
+        self.duration = duration
+        self.uploaded = []
+        self.gallery_ids = {}
+        self._lock = threading.Lock()
+        self.active = 0
+        self.peak = 0
+        self.active_galleries = set()
+        self.peak_galleries = 0
+
+    def upload_image(self, image_path, create_gallery=False, gallery_id=None, **kwargs):
+        name = os.path.basename(image_path)
+        folder = os.path.dirname(image_path)
+        with self._lock:
+            self.active += 1
+            self.peak = max(self.peak, self.active)
+            self.active_galleries.add(folder)
+            self.peak_galleries = max(self.peak_galleries, len(self.active_galleries))
+            if create_gallery:
+                gallery_id = self.gallery_ids.setdefault(folder, f"gal{len(self.gallery_ids) + 1}")
+        time.sleep(self.duration)
+        with self._lock:
+            self.active -= 1
+            if not self.active:
+                self.active_galleries.clear()
+        if name in self.fail or f"{os.path.basename(folder)}/{name}" in self.fail:
+            return {'status': 'error', 'message': 'Invalid image file'}
+        with self._lock:
+            self.uploaded.append((folder, name))
+        return {'status': 'success', 'data': {'gallery_id': gallery_id,
+                                              'image_url': f'https://imx.to/i/{name}'}}
+
+
+@pytest.fixture
+def galleries(tmp_path):
+    paths = []
+    for g in range(3):
+        folder = tmp_path / f"gallery{g}"
+        folder.mkdir()
+        for i in range(6):
+            (folder / f"img{i}.jpg").write_bytes(b'x' * 512)
+        paths.append(str(folder))
+    return paths
+
+
+def _batch(uploader, jobs=3, parallel=6, journal=None, progress=None):
+    saved = []
+    batch = BatchUploader(
+        uploader, Mock(),
+        BatchOptions(jobs=jobs, parallel=parallel, max_retries=0),
+        progress=progress, journal=journal,
+        retry_policy=RetryPolicy(base_delay=0.01),
+        save_artifacts=lambda folder_path, results, template_name: saved.append(results),
+    )
+    return batch, saved
+
+
+class TestConnectionBudget:
+    """Test splitting the connection budget between galleries"""
+
+    def test_shares_split_and_rebalance(self):
+        budget = ConnectionBudget(7)
+        with budget.share() as a, budget.share() as b, budget.share() as c:
+            assert [a.limit, b.limit, c.limit] == [3, 2, 2]
+            with budget.share() as d:
+                assert sum(s.limit for s in (a, b, c, d)) == 7
+        with budget.share() as a:
+            assert a.limit == 7
+
+
+class TestBatchUploader:
+    """Test concurrent gallery uploads"""
+
+    def test_jobs_share_connection_budget(self, galleries):
+        uploader = FakeUploader(duration=0.02)
+        stream = io.StringIO()
+        batch, saved = _batch(uploader, jobs=3, parallel=4, progress=ProgressWriter('jsonl', stream))
+
+        summary = batch.run(galleries)
+
+        assert summary.exit_code == EXIT_OK
+        assert len(saved) == 3 and all(r['successful_count'] == 6 for r in saved)
+        assert uploader.peak <= 4
+        assert uploader.peak_galleries > 1
+
+        events = [json.loads(line) for line in stream.getvalue().splitlines()]
+        names = [e['event'] for e in events]
+        assert names[0] == 'batch_started' and names[-1] == 'batch_done'
+        assert names.count('file_done') == 18
+        assert names.count('gallery_done') == 3
+        assert events[-1]['exit_code'] == EXIT_OK
+
+    def test_failed_images_give_partial_exit(self, galleries):
+        uploader = FakeUploader(fail={'img3.jpg'})
+        stream = io.StringIO()
+        batch, _ = _batch(uploader, progress=ProgressWriter('jsonl', stream))
+        summary = batch.run(galleries[:1])
+        assert summary.exit_code == EXIT_PARTIAL
+        failed = [json.loads(l) for l in stream.getvalue().splitlines() if '"file_failed"' in l]
+        assert [e['file'] for e in failed] == ['img3.jpg']
+
+    def test_all_failed_exit(self, tmp_path):
+        summary = _batch(FakeUploader())[0].run([str(tmp_path / "missing")])
+        assert summary.exit_code == EXIT_ALL_FAILED
+        assert summary.failed[0]['path'].endswith("missing")
+
+    def test_stop_before_start_is_interrupted(self, galleries):
+        batch, saved = _batch(FakeUploader(), jobs=1)
+        batch.stop()
+        summary = batch.run(galleries)
+        assert summary.exit_code == EXIT_INTERRUPTED
+        assert saved == []
+
+    def test_text_mode_writes_no_events(self):
+        stream = io.StringIO()
+        ProgressWriter('text', stream).event('file_done', file='a.jpg')
+        assert stream.getvalue() == ''
+
+
+class TestResumeJournal:
+    """Test resuming an interrupted batch from the journal"""
+
+    def test_resume_skips_uploaded_files_and_galleries(self, galleries, tmp_path):
+        journal_path = str(tmp_path / "run.journal")
+
+        # First run: gallery0 completes, gallery1 loses two images
+        first = FakeUploader(fail={'gallery1/img4.jpg', 'gallery1/img5.jpg'})
+        batch, _ = _batch(first, journal=ResumeJournal(journal_path))
+        assert batch.run(galleries[:2]).exit_code == EXIT_PARTIAL
+
+        # A line truncated by a kill mid-write is ignored
+        with open(journal_path, 'a', encoding='utf-8') as f:
+            f.write('{"type": "file", "path": ')
+
+        journal = ResumeJournal(journal_path)
+        assert journal.get(galleries[0]).done
+        entry = journal.get(galleries[1])
+        assert entry.gallery_id == first.gallery_ids[galleries[1]]
+        assert not entry.done
+        assert sorted(entry.files) == ['img0.jpg', 'img1.jpg', 'img2.jpg', 'img3.jpg']
+
+        second = FakeUploader()
+        batch, saved = _batch(second, journal=journal)
+        summary = batch.run(galleries[:2])
+
+        assert summary.exit_code == EXIT_OK
+        assert summary.skipped == [galleries[0]]
+        assert sorted(second.uploaded) == [(galleries[1], 'img4.jpg'), (galleries[1], 'img5.jpg')]
+        assert second.gallery_ids == {}  # appended to the existing gallery
+        assert saved[0]['successful_count'] == 6
+        assert sorted(img['image_url'].rsplit('/', 1)[1] for img in saved[0]['images']) == \
+            [f'img{i}.jpg' for i in range(6)]
+        assert ResumeJournal(journal_path).get(galleries[1]).done
+
+
+class TestCliMain:
+    """Test the command-line upload path of bbdrop.main() with the uploads faked"""
+
+    def _main(self, galleries, *options):
+        import sys
+        from unittest.mock import patch
+
+        import bbdrop
+
+        summary = Mock(results=[], failed=[], interrupted=False, skipped=[], exit_code=EXIT_OK)
+        argv = ['bbdrop.py', galleries[0], *options]
+        with patch.object(sys, 'argv', argv), \
+                patch('bbdrop.migrate_credentials_from_ini'), patch('bbdrop.migrate_from_imxup'), \
+                patch('bbdrop.ImxToUploader'), patch('src.processing.rename_worker.RenameWorker'), \
+                patch('src.processing.batch_upload.BatchUploader') as batch_class:
+            batch_class.return_value.run.return_value = summary
+            code = bbdrop.main()
+        return code, batch_class
+
+    def test_upload_runs_batch(self, galleries):
+        code, batch_class = self._main(galleries)
+
+        assert code == EXIT_OK
+        batch_class.return_value.run.assert_called_once_with([galleries[0]])
+
+    def test_jsonl_stdout_restored(self, galleries):
+        import sys
+
+        stdout = sys.stdout
+        code, batch_class = self._main(galleries, '--progress-format', 'jsonl')
+
+        assert code == EXIT_OK
+        assert batch_class.call_args.kwargs['progress'].stream is stdout
+        assert sys.stdout is stdout
+
+    def test_progress_file_closed(self, galleries, tmp_path):
+        import sys
+
+        stdout = sys.stdout
+        path = tmp_path / "progress.jsonl"
+        code, batch_class = self._main(galleries, '--progress-format', 'jsonl',
+                                       '--progress-file', str(path))
+
+        stream = batch_class.call_args.kwargs['progress'].stream
+        assert code == EXIT_OK
+        assert stream.name == str(path)
+        assert stream.closed
+        assert sys.stdout is stdout
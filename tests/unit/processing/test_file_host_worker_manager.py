@@ -43,10 +43,8 @@ def mock_worker():
     worker.test_completed = Mock()
     worker.spinup_complete = Mock()
     worker.upload_started = Mock()
-    worker.upload_progress = Mock()
     worker.upload_completed = Mock()
     worker.upload_failed = Mock()
-    worker.bandwidth_updated = Mock()
 
     return worker
 
@@ -83,10 +81,8 @@ class TestFileHostWorkerManagerInit:
         assert hasattr(manager, 'spinup_complete')
         assert hasattr(manager, 'enabled_workers_changed')
         assert hasattr(manager, 'upload_started')
-        assert hasattr(manager, 'upload_progress')
         assert hasattr(manager, 'upload_completed')
         assert hasattr(manager, 'upload_failed')
-        assert hasattr(manager, 'bandwidth_updated')
 
     def test_init_multiple_instances(self, mock_queue_store):
         """Test creating multiple manager instances."""
@@ -473,17 +469,9 @@ class TestConnectWorkerSignals:
 
         # Verify all upload signals have connect called
         assert mock_worker.upload_started.connect.called
-        assert mock_worker.upload_progress.connect.called
         assert mock_worker.upload_completed.connect.called
         assert mock_worker.upload_failed.connect.called
 
-    def test_connect_bandwidth_signal(self, manager, mock_worker):
-        """Test bandwidth_updated signal is connected."""
-        with patch.object(mock_worker.bandwidth_updated, 'connect') as mock_connect:
-            manager._connect_worker_signals(mock_worker)
-
-            mock_connect.assert_called_once()
-
 
 # ============================================================================
 # PAUSE/RESUME TESTS
@@ -549,6 +537,38 @@ class TestResumeAllWorkers:
             worker.resume.assert_called_once()
 
 
+# ============================================================================
+# SHARED ZIP READ TESTS
+# ============================================================================
+
+class TestOpenZipStream:
+    """Test choosing the hosts a shared ZIP read waits for."""
+
+    def test_expects_only_hosts_free_for_gallery(self, manager, mock_queue_store, tmp_path):
+        """Test hosts busy with another gallery are not waited for."""
+        manager.workers = {
+            'idle': Mock(current_db_id=None),
+            'same': Mock(current_db_id=7),
+            'busy': Mock(current_db_id=3),
+        }
+        mock_queue_store.get_file_host_uploads.return_value = [
+            {'gallery_fk': 7, 'host_name': host, 'status': 'pending'}
+            for host in ('idle', 'same', 'busy', 'disabled')
+        ]
+        zip_path = tmp_path / "gallery.zip"
+        zip_path.write_bytes(b"zip")
+
+        with patch.object(manager.zip_fanout, 'open_stream') as open_stream:
+            manager.open_zip_stream(7, 'same', zip_path, '/gallery')
+
+        _, host, _, expected, available = open_stream.call_args.args
+        assert host == 'same'
+        assert expected == {'idle', 'same'}
+        manager.workers['idle'].current_db_id = 5
+        assert not available('idle')
+        assert not available('disabled')
+
+
 # ============================================================================
 # WORKER COUNT AND LIST TESTS
 # ============================================================================
@@ -911,13 +931,6 @@ class TestSignalRelay:
         signal_spy = Mock()
         manager.upload_started.connect(signal_spy)
 
-    def test_upload_progress_relayed(self, manager, mock_worker):
-        """Test upload_progress signal is relayed."""
-        manager._connect_worker_signals(mock_worker)
-
-        signal_spy = Mock()
-        manager.upload_progress.connect(signal_spy)
-
     def test_upload_completed_relayed(self, manager, mock_worker):
         """Test upload_completed signal is relayed."""
         manager._connect_worker_signals(mock_worker)
@@ -932,13 +945,6 @@ class TestSignalRelay:
         signal_spy = Mock()
         manager.upload_failed.connect(signal_spy)
 
-    def test_bandwidth_updated_relayed(self, manager, mock_worker):
-        """Test bandwidth_updated signal is relayed."""
-        manager._connect_worker_signals(mock_worker)
-
-        signal_spy = Mock()
-        manager.bandwidth_updated.connect(signal_spy)
-
 
 # ============================================================================
 # ERROR HANDLING AND EDGE CASES
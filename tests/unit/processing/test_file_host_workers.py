@@ -92,10 +92,8 @@ class TestFileHostWorkerSignals:
         worker = FileHostWorker("testhost", Mock())
 
         assert hasattr(worker, 'upload_started')
-        assert hasattr(worker, 'upload_progress')
         assert hasattr(worker, 'upload_completed')
         assert hasattr(worker, 'upload_failed')
-        assert hasattr(worker, 'bandwidth_updated')
         assert hasattr(worker, 'log_message')
         assert hasattr(worker, 'storage_updated')
         assert hasattr(worker, 'test_completed')
@@ -327,7 +325,7 @@ class TestFileHostWorkerBandwidth:
     @patch('src.processing.file_host_workers.get_zip_manager')
     @patch('src.processing.file_host_workers.QSettings')
     def test_emit_bandwidth(self, mock_qsettings, mock_zip_mgr, mock_coord, mock_config_mgr):
-        """Test bandwidth emission"""
+        """Test bandwidth is published to the progress bus"""
         mock_config = Mock()
         mock_config.name = "TestHost"
         mock_config_mgr.return_value.get_host.return_value = mock_config
@@ -335,20 +333,20 @@ class TestFileHostWorkerBandwidth:
         worker = FileHostWorker("testhost", Mock())
         worker.bandwidth_counter.add(1024 * 100)  # 100 KB
 
-        bandwidth_spy = Mock()
-        worker.bandwidth_updated.connect(bandwidth_spy)
+        bus = Mock()
+        with patch('src.processing.file_host_workers.get_progress_bus', return_value=bus):
+            # Simulate time passage
+            worker._bw_last_time = time.time() - 1.0
+            worker._bw_last_emit = time.time() - 1.0
+            worker._emit_bandwidth()
 
-        # First emission should be skipped (no time elapsed)
-        worker._emit_bandwidth()
+            # Throttled to one sample per 0.5 seconds
+            worker._emit_bandwidth_immediate(50.0)
 
-        # Simulate time passage
-        worker._bw_last_time = time.time() - 1.0
-        worker._bw_last_emit = time.time() - 1.0
-
-        worker._emit_bandwidth()
-
-        # Should emit bandwidth signal
-        assert bandwidth_spy.call_count >= 0  # May or may not emit based on timing
+        bus.publish.assert_called_once()
+        channel, source, kbps = bus.publish.call_args.args
+        assert (channel, source) == ('bandwidth', 'testhost')
+        assert 90 < kbps <= 100
 
     @patch('src.processing.file_host_workers.get_config_manager')
     @patch('src.processing.file_host_workers.get_coordinator')
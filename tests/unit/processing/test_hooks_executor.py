@@ -4,17 +4,31 @@ Tests external program hook execution with subprocess mocking and error handling
 """
 
 import pytest
+import io
 import os
 import subprocess
 import json
+import threading
 import time
+import zipfile
 from unittest.mock import Mock, MagicMock, patch, call, mock_open
 
 from src.processing.hooks_executor import (
     HooksExecutor,
+    HookScheduler,
     get_hooks_executor,
     execute_gallery_hooks
 )
+from src.utils.archive_utils import make_archive_gallery_path
+
+
+def _popen(returncode=0, stdout="", stderr=""):
+    """Mock Popen process that writes stdout/stderr and exits with returncode"""
+    process = Mock()
+    process.stdout = io.StringIO(stdout)
+    process.stderr = io.StringIO(stderr)
+    process.wait.return_value = returncode
+    return process
 
 
 class TestHooksExecutorInit:
@@ -173,14 +187,10 @@ class TestHooksExecutorVariableSubstitution:
 class TestHooksExecutorExecution:
     """Test hook execution"""
 
-    @patch('src.processing.hooks_executor.subprocess.run')
-    def test_execute_hook_success(self, mock_run):
+    @patch('src.processing.hooks_executor.subprocess.Popen')
+    def test_execute_hook_success(self, mock_popen):
         """Test successful hook execution"""
-        mock_result = Mock()
-        mock_result.returncode = 0
-        mock_result.stdout = "Success output"
-        mock_result.stderr = ""
-        mock_run.return_value = mock_result
+        mock_popen.side_effect = lambda *args, **kwargs: _popen(0, "Success output", "")
 
         executor = HooksExecutor()
         config = {
@@ -195,16 +205,12 @@ class TestHooksExecutorExecution:
         success, json_data = executor._execute_hook_with_config('test_hook', context, config)
 
         assert success is True
-        mock_run.assert_called_once()
+        mock_popen.assert_called_once()
 
-    @patch('src.processing.hooks_executor.subprocess.run')
-    def test_execute_hook_failure(self, mock_run):
+    @patch('src.processing.hooks_executor.subprocess.Popen')
+    def test_execute_hook_failure(self, mock_popen):
         """Test hook execution failure"""
-        mock_result = Mock()
-        mock_result.returncode = 1
-        mock_result.stdout = ""
-        mock_result.stderr = "Error output"
-        mock_run.return_value = mock_result
+        mock_popen.side_effect = lambda *args, **kwargs: _popen(1, "", "Error output")
 
         executor = HooksExecutor()
         config = {
@@ -221,15 +227,11 @@ class TestHooksExecutorExecution:
         assert success is False
         assert json_data is None
 
-    @patch('src.processing.hooks_executor.subprocess.run')
-    def test_execute_hook_json_output(self, mock_run):
+    @patch('src.processing.hooks_executor.subprocess.Popen')
+    def test_execute_hook_json_output(self, mock_popen):
         """Test hook with JSON output"""
         json_output = {"download_url": "http://example.com/file", "file_id": "12345"}
-        mock_result = Mock()
-        mock_result.returncode = 0
-        mock_result.stdout = json.dumps(json_output)
-        mock_result.stderr = ""
-        mock_run.return_value = mock_result
+        mock_popen.side_effect = lambda *args, **kwargs: _popen(0, json.dumps(json_output), "")
 
         executor = HooksExecutor()
         config = {
@@ -246,10 +248,12 @@ class TestHooksExecutorExecution:
         assert success is True
         assert json_data == json_output
 
-    @patch('src.processing.hooks_executor.subprocess.run')
-    def test_execute_hook_timeout(self, mock_run):
+    @patch('src.processing.hooks_executor.subprocess.Popen')
+    def test_execute_hook_timeout(self, mock_popen):
         """Test hook execution timeout"""
-        mock_run.side_effect = subprocess.TimeoutExpired('cmd', 300)
+        process = _popen()
+        process.wait.side_effect = [subprocess.TimeoutExpired('cmd', 300), -9]
+        mock_popen.return_value = process
 
         executor = HooksExecutor()
         config = {
@@ -265,9 +269,11 @@ class TestHooksExecutorExecution:
 
         assert success is False
         assert json_data is None
+        process.kill.assert_called_once()
+        assert executor.get_stats()['test_hook'].timeouts == 1
 
-    @patch('src.processing.hooks_executor.subprocess.run')
-    def test_execute_hook_disabled(self, mock_run):
+    @patch('src.processing.hooks_executor.subprocess.Popen')
+    def test_execute_hook_disabled(self, mock_popen):
         """Test disabled hook is skipped"""
         executor = HooksExecutor()
         config = {
@@ -283,10 +289,10 @@ class TestHooksExecutorExecution:
 
         assert success is True
         assert json_data is None
-        mock_run.assert_not_called()
+        mock_popen.assert_not_called()
 
-    @patch('src.processing.hooks_executor.subprocess.run')
-    def test_execute_hook_empty_command(self, mock_run):
+    @patch('src.processing.hooks_executor.subprocess.Popen')
+    def test_execute_hook_empty_command(self, mock_popen):
         """Test hook with empty command"""
         executor = HooksExecutor()
         config = {
@@ -302,25 +308,21 @@ class TestHooksExecutorExecution:
 
         assert success is True
         assert json_data is None
-        mock_run.assert_not_called()
+        mock_popen.assert_not_called()
 
 
 class TestHooksExecutorTempZip:
     """Test temporary ZIP creation for hooks"""
 
-    @patch('src.processing.hooks_executor.subprocess.run')
+    @patch('src.processing.hooks_executor.subprocess.Popen')
     @patch('src.processing.hooks_executor.create_temp_zip')
     @patch('src.processing.hooks_executor.os.path.isdir')
-    def test_execute_hook_creates_temp_zip(self, mock_isdir, mock_create_zip, mock_run):
+    def test_execute_hook_creates_temp_zip(self, mock_isdir, mock_create_zip, mock_popen):
         """Test hook creates temporary ZIP when needed"""
         mock_isdir.return_value = True
         mock_create_zip.return_value = '/tmp/temp_gallery.zip'
 
-        mock_result = Mock()
-        mock_result.returncode = 0
-        mock_result.stdout = ""
-        mock_result.stderr = ""
-        mock_run.return_value = mock_result
+        mock_popen.side_effect = lambda *args, **kwargs: _popen(0, "", "")
 
         executor = HooksExecutor()
         config = {
@@ -341,14 +343,10 @@ class TestHooksExecutorTempZip:
         mock_create_zip.assert_called_once_with('/path/to/gallery')
         assert success is True
 
-    @patch('src.processing.hooks_executor.subprocess.run')
-    def test_execute_hook_uses_existing_zip(self, mock_run):
+    @patch('src.processing.hooks_executor.subprocess.Popen')
+    def test_execute_hook_uses_existing_zip(self, mock_popen):
         """Test hook uses existing ZIP path"""
-        mock_result = Mock()
-        mock_result.returncode = 0
-        mock_result.stdout = ""
-        mock_result.stderr = ""
-        mock_run.return_value = mock_result
+        mock_popen.side_effect = lambda *args, **kwargs: _popen(0, "", "")
 
         executor = HooksExecutor()
         config = {
@@ -368,10 +366,56 @@ class TestHooksExecutorTempZip:
         # Should use existing ZIP, not create new one
         assert success is True
         # Verify command was called with existing ZIP path
-        call_args = mock_run.call_args[0][0]
+        call_args = mock_popen.call_args[0][0]
         assert '/existing/gallery.zip' in ' '.join(call_args)
 
 
+    @patch('src.processing.hooks_executor.subprocess.Popen')
+    def test_archive_root_gallery_passes_archive_as_zip(self, mock_popen, tmp_path):
+        """Test a gallery at an archive's root uses the archive itself as %z"""
+        archive = tmp_path / "gallery.zip"
+        with zipfile.ZipFile(archive, 'w') as zf:
+            zf.writestr("001.jpg", b"img")
+        mock_popen.side_effect = lambda *args, **kwargs: _popen(0, "", "")
+
+        executor = HooksExecutor()
+        config = {'test_hook': {'enabled': True, 'command': 'process_zip %z', 'show_console': False}}
+        context = {'gallery_path': make_archive_gallery_path(archive), 'zip_path': ''}
+
+        with patch('src.processing.upload_to_filehost.create_temp_zip') as mock_create_zip, \
+                patch.object(executor, '_remove_temp_file_with_retry') as mock_remove:
+            success, _ = executor._execute_hook_with_config('test_hook', context, config)
+
+        assert success is True
+        assert str(archive) in mock_popen.call_args[0][0]
+        mock_create_zip.assert_not_called()
+        mock_remove.assert_not_called()
+        assert archive.exists()
+
+    @patch('src.processing.hooks_executor.subprocess.Popen')
+    def test_archive_subdir_gallery_gets_temp_zip(self, mock_popen, tmp_path):
+        """Test a gallery in an archive subfolder gets a re-packed temporary ZIP"""
+        archive = tmp_path / "photos.zip"
+        with zipfile.ZipFile(archive, 'w') as zf:
+            zf.writestr("set1/001.jpg", b"img")
+        gallery_path = make_archive_gallery_path(archive, "set1")
+        mock_popen.side_effect = lambda *args, **kwargs: _popen(0, "", "")
+
+        executor = HooksExecutor()
+        config = {'test_hook': {'enabled': True, 'command': 'process_zip %z', 'show_console': False}}
+        context = {'gallery_path': gallery_path, 'zip_path': ''}
+
+        with patch('src.processing.upload_to_filehost.create_temp_zip',
+                   return_value='/tmp/set1.zip') as mock_create_zip, \
+                patch.object(executor, '_remove_temp_file_with_retry') as mock_remove:
+            success, _ = executor._execute_hook_with_config('test_hook', context, config)
+
+        assert success is True
+        mock_create_zip.assert_called_once_with(gallery_path)
+        assert '/tmp/set1.zip' in mock_popen.call_args[0][0]
+        mock_remove.assert_called_once_with('/tmp/set1.zip')
+
+
 class TestHooksExecutorTempFileRemoval:
     """Test temporary file removal with retry"""
 
@@ -431,14 +475,10 @@ class TestHooksExecutorTempFileRemoval:
 class TestHooksExecutorParallelExecution:
     """Test parallel and sequential hook execution"""
 
-    @patch('src.processing.hooks_executor.subprocess.run')
-    def test_execute_hooks_parallel(self, mock_run):
+    @patch('src.processing.hooks_executor.subprocess.Popen')
+    def test_execute_hooks_parallel(self, mock_popen):
         """Test parallel execution of multiple hooks"""
-        mock_result = Mock()
-        mock_result.returncode = 0
-        mock_result.stdout = ""
-        mock_result.stderr = ""
-        mock_run.return_value = mock_result
+        mock_popen.side_effect = lambda *args, **kwargs: _popen(0, "", "")
 
         executor = HooksExecutor()
 
@@ -463,16 +503,12 @@ class TestHooksExecutorParallelExecution:
             results = executor.execute_hooks(['added', 'started'], context)
 
         # Both hooks should be executed
-        assert mock_run.call_count == 2
+        assert mock_popen.call_count == 2
 
-    @patch('src.processing.hooks_executor.subprocess.run')
-    def test_execute_hooks_sequential(self, mock_run):
+    @patch('src.processing.hooks_executor.subprocess.Popen')
+    def test_execute_hooks_sequential(self, mock_popen):
         """Test sequential execution of multiple hooks"""
-        mock_result = Mock()
-        mock_result.returncode = 0
-        mock_result.stdout = ""
-        mock_result.stderr = ""
-        mock_run.return_value = mock_result
+        mock_popen.side_effect = lambda *args, **kwargs: _popen(0, "", "")
 
         executor = HooksExecutor()
 
@@ -497,10 +533,10 @@ class TestHooksExecutorParallelExecution:
             results = executor.execute_hooks(['added', 'started'], context)
 
         # Both hooks should be executed sequentially
-        assert mock_run.call_count == 2
+        assert mock_popen.call_count == 2
 
-    @patch('src.processing.hooks_executor.subprocess.run')
-    def test_execute_hooks_no_enabled(self, mock_run):
+    @patch('src.processing.hooks_executor.subprocess.Popen')
+    def test_execute_hooks_no_enabled(self, mock_popen):
         """Test execution when no hooks are enabled"""
         executor = HooksExecutor()
 
@@ -519,15 +555,15 @@ class TestHooksExecutorParallelExecution:
             results = executor.execute_hooks(['added'], context)
 
         # No hooks should be executed
-        mock_run.assert_not_called()
+        mock_popen.assert_not_called()
         assert results == {}
 
 
 class TestHooksExecutorKeyMapping:
     """Test JSON key mapping to ext fields"""
 
-    @patch('src.processing.hooks_executor.subprocess.run')
-    def test_execute_hooks_extracts_ext_fields(self, mock_run):
+    @patch('src.processing.hooks_executor.subprocess.Popen')
+    def test_execute_hooks_extracts_ext_fields(self, mock_popen):
         """Test extraction of ext fields from JSON"""
         json_output = {
             "download_url": "http://example.com/file",
@@ -535,11 +571,7 @@ class TestHooksExecutorKeyMapping:
             "extra_field": "value"
         }
 
-        mock_result = Mock()
-        mock_result.returncode = 0
-        mock_result.stdout = json.dumps(json_output)
-        mock_result.stderr = ""
-        mock_run.return_value = mock_result
+        mock_popen.side_effect = lambda *args, **kwargs: _popen(0, json.dumps(json_output), "")
 
         executor = HooksExecutor()
 
@@ -568,16 +600,12 @@ class TestHooksExecutorKeyMapping:
         assert results['ext4'] == "value"
         assert 'ext3' not in results  # Empty mapping should be skipped
 
-    @patch('src.processing.hooks_executor.subprocess.run')
-    def test_execute_hooks_missing_json_keys(self, mock_run):
+    @patch('src.processing.hooks_executor.subprocess.Popen')
+    def test_execute_hooks_missing_json_keys(self, mock_popen):
         """Test handling of missing JSON keys"""
         json_output = {"file_id": "12345"}
 
-        mock_result = Mock()
-        mock_result.returncode = 0
-        mock_result.stdout = json.dumps(json_output)
-        mock_result.stderr = ""
-        mock_run.return_value = mock_result
+        mock_popen.side_effect = lambda *args, **kwargs: _popen(0, json.dumps(json_output), "")
 
         executor = HooksExecutor()
 
@@ -652,15 +680,11 @@ class TestGlobalFunctions:
 class TestHooksExecutorCommandParsing:
     """Test command parsing for different platforms"""
 
-    @patch('src.processing.hooks_executor.subprocess.run')
+    @patch('src.processing.hooks_executor.subprocess.Popen')
     @patch('src.processing.hooks_executor.sys.platform', 'win32')
-    def test_execute_hook_windows_command_parsing(self, mock_run):
+    def test_execute_hook_windows_command_parsing(self, mock_popen):
         """Test Windows command parsing with quotes"""
-        mock_result = Mock()
-        mock_result.returncode = 0
-        mock_result.stdout = ""
-        mock_result.stderr = ""
-        mock_run.return_value = mock_result
+        mock_popen.side_effect = lambda *args, **kwargs: _popen(0, "", "")
 
         executor = HooksExecutor()
         config = {
@@ -675,19 +699,15 @@ class TestHooksExecutorCommandParsing:
         success, json_data = executor._execute_hook_with_config('test_hook', context, config)
 
         assert success is True
-        # Verify subprocess.run was called with proper argument list
-        call_args = mock_run.call_args[0][0]
+        # Verify subprocess.Popen was called with proper argument list
+        call_args = mock_popen.call_args[0][0]
         assert isinstance(call_args, list)
 
-    @patch('src.processing.hooks_executor.subprocess.run')
+    @patch('src.processing.hooks_executor.subprocess.Popen')
     @patch('src.processing.hooks_executor.sys.platform', 'linux')
-    def test_execute_hook_unix_command_parsing(self, mock_run):
+    def test_execute_hook_unix_command_parsing(self, mock_popen):
         """Test Unix command parsing with shlex"""
-        mock_result = Mock()
-        mock_result.returncode = 0
-        mock_result.stdout = ""
-        mock_result.stderr = ""
-        mock_run.return_value = mock_result
+        mock_popen.side_effect = lambda *args, **kwargs: _popen(0, "", "")
 
         executor = HooksExecutor()
         config = {
@@ -702,5 +722,156 @@ class TestHooksExecutorCommandParsing:
         success, json_data = executor._execute_hook_with_config('test_hook', context, config)
 
         assert success is True
-        call_args = mock_run.call_args[0][0]
+        call_args = mock_popen.call_args[0][0]
         assert isinstance(call_args, list)
+
+
+class TestHooksExecutorConfigCache:
+    """Test cached hooks configuration"""
+
+    @patch('src.processing.hooks_executor.get_config_path')
+    def test_config_loaded_once_until_changed(self, mock_get_path, tmp_path):
+        """Test config is re-read only after invalidation or a file change"""
+        config_file = tmp_path / "bbdrop.ini"
+        config_file.write_text("[EXTERNAL_APPS]\nhook_added_enabled = False\n")
+        mock_get_path.return_value = str(config_file)
+
+        executor = HooksExecutor()
+        with patch.object(executor, '_load_config', wraps=executor._load_config) as mock_load:
+            assert executor.get_config()['added']['enabled'] is False
+            executor.get_config()
+            assert mock_load.call_count == 1
+
+            executor.invalidate_config()
+            executor.get_config()
+            assert mock_load.call_count == 2
+
+            config_file.write_text("[EXTERNAL_APPS]\nhook_added_enabled = True\nmax_concurrent = 3\n")
+            os.utime(config_file, (time.time() + 5, time.time() + 5))
+            config = executor.get_config()
+            assert mock_load.call_count == 3
+            assert config['added']['enabled'] is True
+            assert config['max_concurrent'] == 3
+
+
+class TestHooksExecutorStreaming:
+    """Test streamed hook output and timing stats"""
+
+    @patch('src.processing.hooks_executor.log')
+    @patch('src.processing.hooks_executor.subprocess.Popen')
+    def test_output_logged_per_line(self, mock_popen, mock_log):
+        """Test each stdout/stderr line is logged separately"""
+        mock_popen.return_value = _popen(0, "first\nsecond\n", "warn\n")
+        executor = HooksExecutor()
+        config = {'test_hook': {'enabled': True, 'command': 'prog', 'show_console': False}}
+
+        success, _ = executor._execute_hook_with_config('test_hook', {}, config)
+
+        assert success is True
+        messages = [c.args[0] for c in mock_log.call_args_list]
+        assert "Hook 'test_hook' [stdout] first" in messages
+        assert "Hook 'test_hook' [stdout] second" in messages
+        assert "Hook 'test_hook' [stderr] warn" in messages
+
+    def test_real_process_json_and_stats(self):
+        """Test a real process's JSON output and recorded timing"""
+        import sys
+        executor = HooksExecutor()
+        script = ("import json, sys; print('progress', file=sys.stderr); "
+                  "print(json.dumps({'url': 'http://x'}))")
+        command = f'"{sys.executable}" -c "{script}"'
+        success, json_data = executor._execute_hook_with_config(
+            'completed', {}, {'completed': {'enabled': True, 'command': command}})
+
+        assert success is True
+        assert json_data == {'url': 'http://x'}
+        stats = executor.get_stats()['completed']
+        assert stats.runs == 1
+        assert stats.max_seconds > 0
+
+    @patch('src.processing.hooks_executor.subprocess.Popen')
+    def test_failures_counted(self, mock_popen):
+        """Test failed runs are counted in stats"""
+        mock_popen.side_effect = lambda *args, **kwargs: _popen(2, "", "boom\n")
+        executor = HooksExecutor()
+        config = {'test_hook': {'enabled': True, 'command': 'prog'}}
+
+        executor._execute_hook_with_config('test_hook', {}, config)
+        executor._execute_hook_with_config('test_hook', {}, config)
+
+        stats = executor.get_stats()['test_hook']
+        assert stats.runs == 2
+        assert stats.failures == 2
+
+
+class TestHookScheduler:
+    """Test bounded, per hook type job scheduling"""
+
+    def test_concurrency_limited_per_type(self):
+        """Test no more than max_concurrent jobs of a type run at once"""
+        scheduler = HookScheduler(max_concurrent=2)
+        lock = threading.Lock()
+        running = {'now': 0, 'peak': 0}
+
+        def job():
+            with lock:
+                running['now'] += 1
+                running['peak'] = max(running['peak'], running['now'])
+            time.sleep(0.02)
+            with lock:
+                running['now'] -= 1
+
+        for _ in range(10):
+            scheduler.submit('completed', job)
+        assert scheduler.wait_idle(timeout=5)
+        assert running['peak'] == 2
+
+    def test_types_do_not_block_each_other(self):
+        """Test a busy hook type does not delay other types"""
+        scheduler = HookScheduler(max_concurrent=1)
+        release = threading.Event()
+        done = threading.Event()
+
+        scheduler.submit('completed', release.wait)
+        scheduler.submit('added', done.set)
+
+        assert done.wait(timeout=2)
+        release.set()
+        assert scheduler.wait_idle(timeout=2)
+
+    def test_submit_blocks_when_queue_full(self):
+        """Test backpressure once max_pending jobs are waiting"""
+        scheduler = HookScheduler(max_concurrent=1, max_pending=2)
+        release = threading.Event()
+        started = threading.Event()
+
+        def blocker():
+            started.set()
+            release.wait()
+
+        scheduler.submit('completed', blocker)
+        assert started.wait(timeout=2)
+        scheduler.submit('completed', lambda: None)
+        scheduler.submit('completed', lambda: None)
+
+        submitted = threading.Event()
+        threading.Thread(target=lambda: (scheduler.submit('completed', lambda: None), submitted.set()),
+                         daemon=True).start()
+        assert not submitted.wait(timeout=0.2)
+        assert scheduler.pending('completed') == 2
+
+        release.set()
+        assert submitted.wait(timeout=2)
+        assert scheduler.wait_idle(timeout=2)
+
+    def test_job_exception_does_not_kill_worker(self):
+        """Test a failing job is logged and the worker keeps running"""
+        scheduler = HookScheduler(max_concurrent=1)
+        done = threading.Event()
+
+        def boom():
+            raise RuntimeError("boom")
+
+        scheduler.submit('started', boom)
+        scheduler.submit('started', done.set)
+        assert done.wait(timeout=2)
@@ -0,0 +1,245 @@
+"""
+Tests for parallel multi-host uploading in hooks/muh.py
+Uses a local stub HTTP server standing in for the file hosts.
+"""
+
+import json
+import sys
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from urllib.parse import parse_qs, urlparse
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[3] / "hooks"))
+import muh  # noqa: E402
+
+HOST_DELAY = 0.6
+
+
+class _StubHandler(BaseHTTPRequestHandler):
+    """Reads the whole upload, waits ?delay= seconds and echoes what it got"""
+
+    def _handle(self):
+        query = parse_qs(urlparse(self.path).query)
+        body = self.rfile.read(int(self.headers.get("Content-Length", 0)))
+        server = self.server
+        with server.lock:
+            server.requests.append((self.command, urlparse(self.path).path, body, dict(self.headers)))
+            count = sum(1 for r in server.requests if r[1] == urlparse(self.path).path)
+        fail_first = int(query.get("fail_first", ["0"])[0])
+        status = int(query.get("status", ["503"])[0])
+        if count <= fail_first:
+            self.send_response(status)
+            self.send_header("Content-Length", "0")
+            self.end_headers()
+            return
+        time.sleep(float(query.get("delay", ["0"])[0]))
+        payload = json.dumps({"url": f"https://stub{urlparse(self.path).path}/{count}",
+                              "received": len(body)}).encode()
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(payload)))
+        self.end_headers()
+        self.wfile.write(payload)
+
+    do_POST = _handle
+    do_PUT = _handle
+
+    def log_message(self, format, *args):
+        pass
+
+
+@pytest.fixture
+def stub_server():
+    server = ThreadingHTTPServer(("127.0.0.1", 0), _StubHandler)
+    server.daemon_threads = True
+    server.lock = threading.Lock()
+    server.requests = []
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    server.base_url = f"http://127.0.0.1:{server.server_address[1]}"
+    yield server
+    server.shutdown()
+    server.server_close()
+
+
+@pytest.fixture
+def payload(tmp_path):
+    data = bytes(range(256)) * 12_000   # ~3 MB, several shared chunks
+    path = tmp_path / "gallery.zip"
+    path.write_bytes(data)
+    return path, data
+
+
+@pytest.fixture(autouse=True)
+def fresh_uploaders(monkeypatch):
+    monkeypatch.setattr(muh, "_UPLOADERS", {})
+
+
+def _register(monkeypatch, server, name, query="", method="POST"):
+    monkeypatch.setitem(muh.HOSTS, name, muh.HostConfig(
+        name=f"Stub {name}",
+        upload_endpoint=f"{server.base_url}/{name}?{query}",
+        method=method,
+        file_field="file",
+        response_type="json",
+        link_path=["url"],
+    ))
+
+
+class TestFanOutReader:
+    """Test the shared single-read buffer"""
+
+    def test_all_consumers_get_whole_file(self, payload):
+        path, data = payload
+        reader = muh.FanOutReader(path, 3, chunk_size=4096, max_buffered=4)
+        streams = [reader.stream(i) for i in range(3)]
+        results = [None] * 3
+
+        def consume(i, size):
+            parts = []
+            while chunk := streams[i].read(size):
+                parts.append(chunk)
+            results[i] = b"".join(parts)
+
+        threads = [threading.Thread(target=consume, args=(i, size)) for i, size in enumerate((1000, 8192, 65536))]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join(10)
+        assert all(result == data for result in results)
+        assert len(streams[0]) == len(data)
+
+    def test_buffer_is_bounded(self, payload):
+        path, _ = payload
+        reader = muh.FanOutReader(path, 2, chunk_size=1024, max_buffered=3)
+        fast, slow = reader.stream(0), reader.stream(1)
+        slow.read(1)
+
+        got = []
+        thread = threading.Thread(target=lambda: got.append(fast.read(1024 * 10)), daemon=True)
+        thread.start()
+        thread.join(0.5)
+        # The fast consumer cannot get more than max_buffered chunks ahead of the slow one
+        assert thread.is_alive()
+        assert len(reader._chunks) <= 3
+
+        # A consumer that gives up no longer holds the others back
+        slow.close()
+        thread.join(5)
+        assert got and len(got[0]) == 1024 * 10
+
+
+class TestStreamingUpload:
+    """Test single uploads with the streaming request bodies"""
+
+    def test_multipart_post_carries_file_and_fields(self, monkeypatch, stub_server, payload):
+        path, data = payload
+        _register(monkeypatch, stub_server, "post")
+        muh.HOSTS["post"].extra_fields = {"expiry": "1d"}
+
+        result = muh.upload_with_retries("post", None, path)
+
+        assert result["success"]
+        assert result["attempts"] == 1
+        method, _, body, headers = stub_server.requests[0]
+        assert method == "POST"
+        assert headers["Content-Type"].startswith("multipart/form-data; boundary=")
+        assert int(headers["Content-Length"]) == len(body)
+        assert data in body
+        assert b'name="expiry"\r\n\r\n1d\r\n' in body
+        assert b'name="file"; filename="gallery.zip"' in body
+
+    def test_put_sends_raw_file(self, monkeypatch, stub_server, payload):
+        path, data = payload
+        _register(monkeypatch, stub_server, "put", method="PUT")
+
+        reader = muh.FanOutReader(path, 1)
+        result = muh.upload_with_retries("put", None, path, reader.stream(0))
+
+        assert result["success"]
+        assert stub_server.requests[0][2] == data
+
+
+class TestRetries:
+    """Test per-host retry with backoff"""
+
+    def test_transient_error_is_retried(self, monkeypatch, stub_server, payload):
+        path, data = payload
+        _register(monkeypatch, stub_server, "flaky", "fail_first=2&status=503")
+
+        reader = muh.FanOutReader(path, 1)
+        result = muh.upload_with_retries("flaky", None, path, reader.stream(0), retries=2, backoff=0.01)
+
+        assert result["success"]
+        assert result["attempts"] == 3
+        # Retries reopen the file and still send all of it
+        assert data in stub_server.requests[-1][2]
+
+    def test_client_error_is_not_retried(self, monkeypatch, stub_server, payload):
+        path, _ = payload
+        _register(monkeypatch, stub_server, "denied", "fail_first=5&status=403")
+
+        result = muh.upload_with_retries("denied", None, path, retries=2, backoff=0.01)
+
+        assert not result["success"]
+        assert result["status"] == "failed"
+        assert result["attempts"] == 1
+        assert "403" in result["error"]
+
+    def test_unknown_host_fails_cleanly(self, payload):
+        path, _ = payload
+        result = muh.upload_with_retries("no-such-host", None, path)
+        assert not result["success"]
+        assert "Unsupported host" in result["error"]
+
+
+class TestParallelHosts:
+    """Test uploading to several hosts at once"""
+
+    def test_hosts_run_concurrently(self, monkeypatch, stub_server, payload):
+        path, data = payload
+        hosts = ["h1", "h2", "h3", "h4"]
+        for host in hosts:
+            _register(monkeypatch, stub_server, host, f"delay={HOST_DELAY}")
+
+        started = time.monotonic()
+        results = muh.upload_to_hosts(hosts, [None] * len(hosts), path)
+        elapsed = time.monotonic() - started
+
+        assert list(results) == hosts
+        assert all(r["success"] for r in results.values())
+        assert all(r["elapsed_seconds"] >= HOST_DELAY for r in results.values())
+        # About the slowest host, not the sum of all of them
+        assert elapsed < HOST_DELAY * len(hosts) * 0.6
+        assert all(data in body for _, _, body, _ in stub_server.requests)
+
+    def test_failed_host_does_not_block_others(self, monkeypatch, stub_server, payload):
+        path, _ = payload
+        _register(monkeypatch, stub_server, "good")
+        _register(monkeypatch, stub_server, "bad", "fail_first=5&status=400")
+
+        results = muh.upload_to_hosts(["bad", "good"], [None, None], path, retries=1, backoff=0.01)
+
+        assert not results["bad"]["success"]
+        assert results["good"]["success"]
+
+    def test_main_outputs_per_host_results(self, monkeypatch, stub_server, payload, capsys):
+        path, _ = payload
+        _register(monkeypatch, stub_server, "h1")
+        _register(monkeypatch, stub_server, "h2")
+        monkeypatch.setattr(sys, "argv", ["muh.py", "h1,h2", str(path)])
+
+        muh.main()
+
+        output = json.loads(capsys.readouterr().out)
+        assert output["status"] == "success"
+        assert output["url"] == output["h1_url"]
+        assert output["h2_url"].startswith("https://stub/h2")
+        assert set(output["hosts"]) == {"h1", "h2"}
+        assert output["hosts"]["h2"]["attempts"] == 1
+        assert "elapsed_seconds" in output["hosts"]["h1"]
+        assert output["file_name"] == "gallery.zip"
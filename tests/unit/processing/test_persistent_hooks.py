@@ -0,0 +1,280 @@
+"""
+Tests for src/processing/persistent_hooks.py and hooks/hook_worker.py
+Runs a small echo hook as a real persistent worker process.
+"""
+
+import json
+import os
+import subprocess
+import sys
+import textwrap
+from pathlib import Path
+
+import pytest
+
+from src.processing.hooks_executor import HooksExecutor
+from src.processing.persistent_hooks import (
+    PERSISTENT_FLAG,
+    HookWorkerError,
+    PersistentHookPool,
+    PersistentHookWorker,
+    split_launch_args,
+)
+
+HOOKS_DIR = Path(__file__).resolve().parents[3] / "hooks"
+
+ECHO_HOOK = textwrap.dedent("""
+    import json, os, sys, time
+    sys.path.insert(0, {hooks_dir!r})
+    from hook_worker import PERSISTENT_FLAG, serve
+
+    RUNS = []
+
+    def main():
+        RUNS.append(sys.argv[1:])
+        if sys.argv[1] == "crash":
+            os._exit(3)
+        if sys.argv[1] == "sleep":
+            time.sleep(30)
+        if sys.argv[1] == "fail":
+            print("bad input", file=sys.stderr)
+            sys.exit(2)
+        print("working", file=sys.stderr)
+        print(json.dumps({{"echo": sys.argv[1:], "runs": len(RUNS), "pid": os.getpid()}}))
+
+    if PERSISTENT_FLAG in sys.argv[1:]:
+        serve(main)
+    else:
+        main()
+""")
+
+
+@pytest.fixture
+def echo_hook(tmp_path):
+    script = tmp_path / "echo_hook.py"
+    script.write_text(ECHO_HOOK.format(hooks_dir=str(HOOKS_DIR)), encoding="utf-8")
+    return str(script)
+
+
+@pytest.fixture
+def pool():
+    pool = PersistentHookPool()
+    yield pool
+    pool.shutdown()
+
+
+class TestSplitLaunchArgs:
+    """Test splitting hook commands into worker launch args and job argv"""
+
+    def test_python_script(self):
+        launch, argv = split_launch_args(["python", "-u", "muh.py", "gofile", "/tmp/a.zip"])
+        assert launch == ["python", "-u", "muh.py", PERSISTENT_FLAG]
+        assert argv == ["muh.py", "gofile", "/tmp/a.zip"]
+
+    def test_python_module(self):
+        launch, argv = split_launch_args(["python3.14", "-m", "uploader", "x"])
+        assert launch == ["python3.14", "-m", "uploader", PERSISTENT_FLAG]
+        assert argv == ["uploader", "x"]
+
+    def test_windows_interpreter_path(self):
+        launch, argv = split_launch_args([r"C:\Python314\python.exe", "k2s.py", "a.zip"])
+        assert launch == [r"C:\Python314\python.exe", "k2s.py", PERSISTENT_FLAG]
+        assert argv == ["k2s.py", "a.zip"]
+
+    def test_other_program(self):
+        launch, argv = split_launch_args(["uploader", "a.zip"])
+        assert launch == ["uploader", PERSISTENT_FLAG]
+        assert argv == ["uploader", "a.zip"]
+
+    def test_empty_command(self):
+        with pytest.raises(ValueError):
+            split_launch_args([])
+
+
+class TestPersistentHookWorker:
+    """Test a single worker process"""
+
+    def test_jobs_reuse_process(self, echo_hook):
+        worker = PersistentHookWorker([sys.executable, echo_hook, PERSISTENT_FLAG], "echo")
+        worker.start()
+        try:
+            first = worker.run_job(["echo_hook.py", "one"], {}, timeout=10)
+            second = worker.run_job(["echo_hook.py", "two", "x y"], {}, timeout=10)
+        finally:
+            worker.stop()
+
+        assert first[0] == 0 and second[0] == 0
+        one, two = json.loads(first[1]), json.loads(second[1])
+        assert one["echo"] == ["one"]
+        assert two["echo"] == ["two", "x y"]
+        assert two["runs"] == 2
+        assert one["pid"] == two["pid"] == worker.pid
+        assert worker.jobs_run == 2
+
+    def test_sys_exit_ends_job_not_worker(self, echo_hook):
+        worker = PersistentHookWorker([sys.executable, echo_hook, PERSISTENT_FLAG], "echo")
+        worker.start()
+        try:
+            exit_code, output, _ = worker.run_job(["echo_hook.py", "fail"], {}, timeout=10)
+            assert exit_code == 2
+            assert output == ""
+            assert worker.is_alive()
+            assert worker.run_job(["echo_hook.py", "ok"], {}, timeout=10)[0] == 0
+        finally:
+            worker.stop()
+
+    def test_ping(self, echo_hook):
+        worker = PersistentHookWorker([sys.executable, echo_hook, PERSISTENT_FLAG], "echo")
+        worker.start()
+        try:
+            assert worker.ping()
+        finally:
+            worker.stop()
+        assert not worker.is_alive()
+        assert not worker.ping()
+
+
+class TestPersistentHookPool:
+    """Test worker reuse, restarts and timeouts"""
+
+    def test_reuses_worker(self, pool, echo_hook):
+        cmd = [sys.executable, echo_hook]
+        first = json.loads(pool.run("echo", cmd + ["a"], {}, timeout=10)[1])
+        second = json.loads(pool.run("echo", cmd + ["b"], {}, timeout=10)[1])
+        assert first["pid"] == second["pid"]
+        assert second["runs"] == 2
+        assert pool.idle_count() == 1
+
+    def test_crash_fails_job_and_restarts(self, pool, echo_hook):
+        cmd = [sys.executable, echo_hook]
+        before = json.loads(pool.run("echo", cmd + ["a"], {}, timeout=10)[1])
+
+        with pytest.raises(HookWorkerError):
+            pool.run("echo", cmd + ["crash"], {}, timeout=10)
+        assert pool.idle_count() == 0
+
+        after = json.loads(pool.run("echo", cmd + ["b"], {}, timeout=10)[1])
+        assert after["pid"] != before["pid"]
+        assert after["runs"] == 1
+
+    def test_restarts_worker_that_died_while_idle(self, pool, echo_hook):
+        cmd = [sys.executable, echo_hook]
+        before = json.loads(pool.run("echo", cmd + ["a"], {}, timeout=10)[1])
+        idle_worker = next(iter(pool._idle.values()))[0]
+        idle_worker._process.kill()
+        idle_worker._process.wait()
+
+        after = json.loads(pool.run("echo", cmd + ["b"], {}, timeout=10)[1])
+        assert after["pid"] != before["pid"]
+
+    def test_health_check_after_idle(self, pool, echo_hook, monkeypatch):
+        import src.processing.persistent_hooks as persistent_hooks
+        cmd = [sys.executable, echo_hook]
+        pool.run("echo", cmd + ["a"], {}, timeout=10)
+
+        pings = []
+        original_ping = PersistentHookWorker.ping
+        monkeypatch.setattr(persistent_hooks, "HEALTH_CHECK_IDLE_SECONDS", 0.0)
+        monkeypatch.setattr(PersistentHookWorker, "ping",
+                            lambda self, timeout=5.0: pings.append(self.pid) or original_ping(self, timeout))
+
+        result = json.loads(pool.run("echo", cmd + ["b"], {}, timeout=10)[1])
+        assert pings == [result["pid"]]
+        assert result["runs"] == 2
+
+    def test_timeout_kills_worker(self, pool, echo_hook):
+        cmd = [sys.executable, echo_hook]
+        with pytest.raises(subprocess.TimeoutExpired):
+            pool.run("echo", cmd + ["sleep"], {}, timeout=0.5)
+        assert pool.idle_count() == 0
+
+    def test_shutdown_stops_idle_workers(self, pool, echo_hook):
+        pool.run("echo", [sys.executable, echo_hook, "a"], {}, timeout=10)
+        pool.shutdown()
+        assert pool.idle_count() == 0
+
+
+class TestHooksExecutorPersistentMode:
+    """Test persistent mode through HooksExecutor"""
+
+    def _config(self, echo_hook, persistent=True):
+        return {
+            'completed': {
+                'enabled': True,
+                'command': f'"{sys.executable}" "{echo_hook}" %N',
+                'show_console': False,
+                'persistent': persistent,
+                'key_mapping': {'ext1': 'runs', 'ext2': '', 'ext3': '', 'ext4': ''},
+            }
+        }
+
+    def test_runs_on_persistent_worker(self, echo_hook):
+        executor = HooksExecutor()
+        config = self._config(echo_hook)
+        try:
+            ok1, data1 = executor._execute_hook_with_config('completed', {'gallery_name': 'First'}, config)
+            ok2, data2 = executor._execute_hook_with_config('completed', {'gallery_name': 'Second'}, config)
+        finally:
+            executor.shutdown()
+
+        assert ok1 and ok2
+        assert data1["echo"] == ["First"]
+        assert data2["echo"] == ["Second"]
+        assert data1["pid"] == data2["pid"]
+        assert data2["runs"] == 2
+        assert executor.get_stats()['completed'].runs == 2
+
+    def test_failed_job_reported(self, echo_hook):
+        executor = HooksExecutor()
+        try:
+            ok, data = executor._execute_hook_with_config('completed', {'gallery_name': 'crash'},
+                                                          self._config(echo_hook))
+        finally:
+            executor.shutdown()
+        assert not ok
+        assert data is None
+        assert executor.get_stats()['completed'].failures == 1
+
+    def test_same_hook_runs_one_shot(self, echo_hook):
+        executor = HooksExecutor()
+        ok, data = executor._execute_hook_with_config('completed', {'gallery_name': 'Once'},
+                                                      self._config(echo_hook, persistent=False))
+        assert ok
+        assert data["echo"] == ["Once"]
+        assert data["pid"] != os.getpid()
+
+    def test_global_executor_shut_down_on_exit(self, echo_hook, monkeypatch):
+        from src.processing import hooks_executor
+        monkeypatch.setattr(hooks_executor, "_hooks_executor", None)
+        hooks_executor.shutdown_hooks_executor()  # Never created: nothing to stop
+
+        executor = hooks_executor.get_hooks_executor()
+        ok, data = executor._execute_hook_with_config('completed', {'gallery_name': 'First'},
+                                                      self._config(echo_hook))
+        assert ok
+        worker_pid = data["pid"]
+
+        hooks_executor.shutdown_hooks_executor()
+
+        ok, data = executor._execute_hook_with_config('completed', {'gallery_name': 'Second'},
+                                                      self._config(echo_hook))
+        executor.shutdown()
+        assert ok
+        assert data["pid"] != worker_pid
+
+
+class TestBundledHookSessions:
+    """Test the bundled hooks keeping state between persistent jobs"""
+
+    @pytest.fixture
+    def k2s(self, monkeypatch):
+        monkeypatch.syspath_prepend(str(HOOKS_DIR))
+        import k2s
+        monkeypatch.setattr(k2s, "_SESSIONS", {})
+        return k2s
+
+    def test_k2s_session_reused(self, k2s):
+        session = k2s.get_session("k2s", "token")
+        assert session is k2s.get_session("k2s", "token")
+        assert k2s.get_session("k2s", "other") is not session
+        assert k2s.get_session("tez", "token") is not session
@@ -1,10 +1,9 @@
 """
 Comprehensive test suite for src/processing/tasks.py
-Tests background task management, progress batching, icon caching, and table updates.
+Tests background task management, icon caching, and table updates.
 """
 
 import pytest
-import time
 from unittest.mock import Mock, MagicMock, patch, call
 from PyQt6.QtCore import QTimer, QMutex, Qt
 from PyQt6.QtWidgets import QTableWidgetItem
@@ -12,7 +11,6 @@ from PyQt6.QtWidgets import QTableWidgetItem
 from src.processing.tasks import (
     BackgroundTask,
     BackgroundTaskSignals,
-    ProgressUpdateBatcher,
     IconCache,
     TableRowUpdateTask,
     TableUpdateQueue,
@@ -83,83 +81,6 @@ class TestBackgroundTask:
         finished_spy.assert_called_once_with(42)
 
 
-class TestProgressUpdateBatcher:
-    """Test ProgressUpdateBatcher class"""
-
-    @patch('src.processing.tasks.QTimer')
-    def test_init(self, mock_timer_class):
-        """Test ProgressUpdateBatcher initialization"""
-        mock_callback = Mock()
-        mock_timer = Mock()
-        mock_timer_class.return_value = mock_timer
-
-        batcher = ProgressUpdateBatcher(mock_callback, batch_interval=0.5)
-
-        assert batcher._callback == mock_callback
-        assert batcher._batch_interval == 0.5
-        assert batcher._pending_updates == {}
-        mock_timer.setSingleShot.assert_called_once_with(True)
-
-    @patch('src.processing.tasks.QTimer')
-    def test_add_update(self, mock_timer_class):
-        """Test adding progress update to batch"""
-        mock_callback = Mock()
-        mock_timer = Mock()
-        mock_timer.isActive.return_value = False
-        mock_timer_class.return_value = mock_timer
-
-        batcher = ProgressUpdateBatcher(mock_callback, batch_interval=1.0)
-        # Set _last_batch_time to a recent time to prevent immediate processing
-        batcher._last_batch_time = time.time()
-
-        batcher.add_update("/path/test", 50, 100, 50, "image.jpg")
-
-        assert "/path/test" in batcher._pending_updates
-        update = batcher._pending_updates["/path/test"]
-        assert update['completed'] == 50
-        assert update['total'] == 100
-        assert update['progress_percent'] == 50
-        assert update['current_image'] == "image.jpg"
-
-    @patch('src.processing.tasks.QTimer')
-    def test_process_batch(self, mock_timer_class):
-        """Test batch processing of updates"""
-        mock_callback = Mock()
-        mock_timer = Mock()
-        mock_timer_class.return_value = mock_timer
-
-        batcher = ProgressUpdateBatcher(mock_callback)
-        batcher._pending_updates = {
-            "/path/1": {
-                'completed': 10, 'total': 100, 'progress_percent': 10,
-                'current_image': 'img1.jpg', 'timestamp': time.time()
-            },
-            "/path/2": {
-                'completed': 20, 'total': 100, 'progress_percent': 20,
-                'current_image': 'img2.jpg', 'timestamp': time.time()
-            }
-        }
-
-        batcher._process_batch()
-
-        assert len(batcher._pending_updates) == 0
-        assert mock_callback.call_count == 2
-        mock_callback.assert_any_call("/path/1", 10, 100, 10, "img1.jpg")
-        mock_callback.assert_any_call("/path/2", 20, 100, 20, "img2.jpg")
-
-    @patch('src.processing.tasks.QTimer')
-    def test_cleanup(self, mock_timer_class):
-        """Test cleanup stops timer"""
-        mock_timer = Mock()
-        mock_timer.isActive.return_value = True
-        mock_timer_class.return_value = mock_timer
-
-        batcher = ProgressUpdateBatcher(Mock())
-        batcher.cleanup()
-
-        mock_timer.stop.assert_called_once()
-
-
 class TestIconCache:
     """Test IconCache class"""
 
@@ -407,40 +328,6 @@ class TestCredentialFunctions:
         assert result is False
 
 
-class TestProgressUpdateBatcherEdgeCases:
-    """Test edge cases for ProgressUpdateBatcher"""
-
-    @patch('src.processing.tasks.QTimer')
-    def test_multiple_updates_same_path(self, mock_timer_class):
-        """Test multiple updates for same path overwrites"""
-        mock_callback = Mock()
-        mock_timer = Mock()
-        mock_timer.isActive.return_value = False
-        mock_timer_class.return_value = mock_timer
-
-        batcher = ProgressUpdateBatcher(mock_callback)
-        batcher._last_batch_time = 0
-
-        batcher.add_update("/path/test", 10, 100, 10, "img1.jpg")
-        batcher.add_update("/path/test", 20, 100, 20, "img2.jpg")
-
-        # Should only have one entry (latest)
-        assert len(batcher._pending_updates) == 1
-        assert batcher._pending_updates["/path/test"]['completed'] == 20
-
-    @patch('src.processing.tasks.QTimer')
-    def test_process_batch_empty(self, mock_timer_class):
-        """Test processing empty batch"""
-        mock_callback = Mock()
-        mock_timer = Mock()
-        mock_timer_class.return_value = mock_timer
-
-        batcher = ProgressUpdateBatcher(mock_callback)
-        batcher._process_batch()
-
-        mock_callback.assert_not_called()
-
-
 class TestTableUpdateQueueEdgeCases:
     """Test edge cases for TableUpdateQueue"""
 
@@ -15,6 +15,7 @@ from src.processing.upload_to_filehost import (
     zip_folder,
     create_temp_zip
 )
+from src.utils.archive_utils import make_archive_gallery_path
 
 
 class TestZipFolderBasic:
@@ -359,6 +360,23 @@ class TestCreateTempZip:
             for info in zipf.infolist():
                 assert info.compress_type == zipfile.ZIP_STORED
 
+    def test_create_temp_zip_repacks_archive_gallery(self, tmp_path):
+        """Test that an archive gallery's images are re-packed under its folder name"""
+        archive = tmp_path / "photos.zip"
+        with zipfile.ZipFile(archive, 'w', zipfile.ZIP_DEFLATED) as zf:
+            zf.writestr("set1/001.jpg", b"first")
+            zf.writestr("set1/002.png", b"second")
+            zf.writestr("set2/003.jpg", b"other gallery")
+
+        result = create_temp_zip(make_archive_gallery_path(archive, "set1"))
+
+        assert os.path.basename(result) == "set1.zip"
+        with zipfile.ZipFile(result, 'r') as zipf:
+            assert sorted(zipf.namelist()) == ["set1/001.jpg", "set1/002.png"]
+            assert zipf.read("set1/001.jpg") == b"first"
+            assert all(i.compress_type == zipfile.ZIP_STORED for i in zipf.infolist())
+        os.remove(result)
+
     def test_create_temp_zip_removes_existing_file(self, tmp_path):
         """Test that create_temp_zip removes existing temp file"""
         test_folder = tmp_path / "test_folder"
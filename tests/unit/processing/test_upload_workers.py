@@ -66,7 +66,6 @@ class TestUploadWorkerSignals:
         mock_queue_manager = Mock()
         worker = UploadWorker(mock_queue_manager)
 
-        assert hasattr(worker, 'progress_updated')
         assert hasattr(worker, 'gallery_started')
         assert hasattr(worker, 'gallery_completed')
         assert hasattr(worker, 'gallery_failed')
@@ -75,7 +74,6 @@ class TestUploadWorkerSignals:
         assert hasattr(worker, 'ext_fields_updated')
         assert hasattr(worker, 'log_message')
         assert hasattr(worker, 'queue_stats')
-        assert hasattr(worker, 'bandwidth_updated')
 
 
 class TestUploadWorkerControl:
@@ -218,6 +216,32 @@ class TestUploadWorkerProcessing:
         # Verify status was updated to uploading
         mock_queue_manager.update_item_status.assert_called()
 
+    @patch('src.processing.upload_workers.RenameWorker')
+    @patch('src.processing.upload_workers.create_concurrency_controller')
+    @patch('src.processing.upload_workers.load_user_defaults')
+    @patch('src.processing.upload_workers.execute_gallery_hooks')
+    def test_upload_gallery_hands_learned_limit_to_gui(self, mock_hooks, mock_defaults,
+                                                       mock_create_controller, mock_rename_worker_class):
+        """Test the chosen in-flight limit is emitted for the GUI thread to save"""
+        mock_defaults.return_value = {'parallel_batch_size': 4}
+        mock_hooks.return_value = {}
+        controller = Mock(initial=4, limit=6)
+        mock_create_controller.return_value = controller
+
+        worker = UploadWorker(Mock())
+        worker.uploader = Mock()
+        worker.uploader.upload_folder.return_value = None
+        learned = []
+        worker.concurrency_learned.connect(learned.append)
+
+        mock_item = Mock(path="/path/to/gallery", total_images=1, status="uploading",
+                         scan_complete=False)
+        with patch('src.core.adaptive_concurrency.save_learned_limit') as mock_save:
+            worker.upload_gallery(mock_item)
+
+        assert learned == [6]
+        mock_save.assert_not_called()
+
     @patch('src.processing.upload_workers.RenameWorker')
     @patch('src.processing.upload_workers.load_user_defaults')
     @patch('src.processing.upload_workers.execute_gallery_hooks')
@@ -443,12 +467,11 @@ class TestUploadWorkerBandwidth:
 
     @patch('src.processing.upload_workers.RenameWorker')
     def test_emit_current_bandwidth(self, mock_rename_worker_class):
-        """Test bandwidth emission"""
+        """Test bandwidth is published to the progress bus"""
         mock_queue_manager = Mock()
         worker = UploadWorker(mock_queue_manager)
 
-        bandwidth_spy = Mock()
-        worker.bandwidth_updated.connect(bandwidth_spy)
+        bus = Mock()
 
         # Simulate bytes transferred (use .add() not .increment())
         worker.global_byte_counter.add(1024 * 100)  # 100 KB
@@ -457,10 +480,11 @@ class TestUploadWorkerBandwidth:
         worker._bw_last_time = time.time() - 1.0
         worker._bw_last_emit = time.time() - 1.0
 
-        worker._emit_current_bandwidth()
+        with patch('src.processing.upload_workers.get_progress_bus', return_value=bus):
+            worker._emit_current_bandwidth()
 
-        # Should emit bandwidth (may or may not based on timing)
-        assert bandwidth_spy.call_count >= 0
+        bus.publish.assert_called_once()
+        assert bus.publish.call_args[0][2] > 0
 
 
 class TestCompletionWorkerInit:
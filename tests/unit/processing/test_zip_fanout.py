@@ -0,0 +1,250 @@
+"""
+Tests for src/processing/zip_fanout.py
+Shared ZIP reads for several file hosts and streamed uploads through FileHostClient.
+"""
+
+import os
+import threading
+import time
+
+import pytest
+
+from src.processing.zip_fanout import ZipFanOut, ZipFanOutRegistry, ZipStream
+
+CHUNK = 1024
+WHOLE_FILE = 64  # ring chunks holding the whole test file, so no host is ever detached
+
+
+@pytest.fixture
+def zip_file(tmp_path):
+    data = os.urandom(CHUNK * 40 + 123)
+    path = tmp_path / "gallery.zip"
+    path.write_bytes(data)
+    return path, data
+
+
+def _read_all(stream, size=700):
+    parts = []
+    while chunk := stream.read(size):
+        parts.append(chunk)
+    return b"".join(parts)
+
+
+def _read_in_threads(streams, sizes=None):
+    results = [None] * len(streams)
+
+    def run(i):
+        results[i] = _read_all(streams[i], (sizes or [700] * len(streams))[i])
+
+    threads = [threading.Thread(target=run, args=(i,)) for i in range(len(streams))]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join(10)
+    return results
+
+
+class TestZipStream:
+    """Test standalone streams"""
+
+    def test_reads_whole_file(self, zip_file):
+        path, data = zip_file
+        with ZipStream(path, "host") as stream:
+            assert len(stream) == len(data)
+            assert _read_all(stream) == data
+            assert stream.own_bytes == len(data)
+            assert not stream.fell_back
+
+    def test_closed_stream_returns_nothing(self, zip_file):
+        path, _ = zip_file
+        stream = ZipStream(path, "host")
+        stream.close()
+        assert stream.read(10) == b""
+
+
+class TestZipFanOut:
+    """Test the shared read and per-host ring buffers"""
+
+    def _session(self, path, hosts, ring_chunks=WHOLE_FILE, join_window=2.0):
+        session = ZipFanOut(path, hosts, chunk_size=CHUNK, ring_chunks=ring_chunks, join_window=join_window)
+        streams = [session.join(host) for host in hosts]
+        session.start()
+        return session, streams
+
+    def test_hosts_share_one_read(self, zip_file):
+        path, data = zip_file
+        session, streams = self._session(path, ["a", "b", "c"])
+
+        results = _read_in_threads(streams, [100, CHUNK, 5000])
+
+        assert results == [data, data, data]
+        assert session.wait_done(5)
+        assert session.bytes_read == len(data)
+        assert all(not s.fell_back and s.own_bytes == 0 for s in streams)
+
+    def test_ring_buffers_are_bounded(self, zip_file):
+        path, _ = zip_file
+        session, (a, b) = self._session(path, ["a", "b"], ring_chunks=3)
+
+        time.sleep(0.2)
+        # Neither host has read anything: the reader stops once both rings are full
+        assert len(a._ring) == len(b._ring) == 3
+        assert session.shared_bytes_read == 3 * CHUNK
+        a.close()
+        b.close()
+
+    def test_slow_host_falls_back_without_stalling_others(self, zip_file):
+        path, data = zip_file
+        session, (fast, slow) = self._session(path, ["fast", "slow"], ring_chunks=4)
+
+        # The fast host reads everything while the slow one has not started
+        assert _read_in_threads([fast]) == [data]
+        assert session.wait_done(5)
+
+        assert _read_all(slow) == data
+        assert slow.fell_back
+        assert not fast.fell_back
+        assert slow.shared_bytes == 4 * CHUNK
+        assert slow.own_bytes == len(data) - 4 * CHUNK
+        assert session.bytes_read == len(data) + slow.own_bytes
+
+    def test_closed_host_does_not_hold_back_others(self, zip_file):
+        path, data = zip_file
+        session, (a, b) = self._session(path, ["a", "b"], ring_chunks=2)
+        b.read(10)
+        b.close()
+        assert _read_in_threads([a]) == [data]
+        assert not a.fell_back
+
+    def test_waits_for_expected_hosts(self, zip_file):
+        path, data = zip_file
+        session = ZipFanOut(path, ["a", "b"], chunk_size=CHUNK, ring_chunks=WHOLE_FILE, join_window=5.0)
+        a = session.join("a")
+        session.start()
+        time.sleep(0.2)
+        assert session.shared_bytes_read == 0
+        b = session.join("b")
+        assert _read_in_threads([a, b]) == [data, data]
+        assert session.bytes_read == len(data)
+
+    def test_starts_without_missing_host_after_join_window(self, zip_file):
+        path, data = zip_file
+        session = ZipFanOut(path, ["a", "never"], chunk_size=CHUNK, join_window=0.2)
+        a = session.join("a")
+        session.start()
+        assert _read_all(a) == data
+        assert session.join("never") is None
+
+    def test_busy_host_not_waited_for(self, zip_file):
+        path, data = zip_file
+        busy = set()
+        session = ZipFanOut(path, ["a", "b"], chunk_size=CHUNK, join_window=5.0,
+                            host_available=lambda host: host not in busy)
+        a = session.join("a")
+        session.start()
+        time.sleep(0.2)
+        assert session.shared_bytes_read == 0
+
+        busy.add("b")  # b picked up another gallery
+        started = time.monotonic()
+        assert _read_all(a) == data
+        assert time.monotonic() - started < 1.0
+
+
+class TestZipFanOutRegistry:
+    """Test joining sessions by gallery"""
+
+    def test_single_host_reads_alone(self, zip_file):
+        path, data = zip_file
+        registry = ZipFanOutRegistry(chunk_size=CHUNK)
+        stream = registry.open_stream(1, "a", path, ["a"])
+        assert registry.session(1) is None
+        assert _read_all(stream) == data
+
+    def test_hosts_join_same_session(self, zip_file):
+        path, data = zip_file
+        registry = ZipFanOutRegistry(chunk_size=CHUNK, ring_chunks=WHOLE_FILE, join_window=5.0)
+        a = registry.open_stream(7, "a", path, ["a", "b"])
+        b = registry.open_stream(7, "b", path, ["a", "b"])
+
+        assert _read_in_threads([a, b]) == [data, data]
+        assert registry.session(7).bytes_read == len(data)
+
+    def test_late_host_reads_alone(self, zip_file):
+        path, data = zip_file
+        registry = ZipFanOutRegistry(chunk_size=CHUNK, ring_chunks=2, join_window=0.1)
+        a = registry.open_stream(7, "a", path, ["a", "b"])
+        time.sleep(0.3)  # Shared read started without b
+        b = registry.open_stream(7, "b", path, ["a", "b"])
+
+        assert b._session is None
+        assert _read_in_threads([a, b]) == [data, data]
+
+    def test_new_session_after_previous_read_finished(self, zip_file):
+        path, data = zip_file
+        registry = ZipFanOutRegistry(chunk_size=CHUNK, ring_chunks=WHOLE_FILE, join_window=5.0)
+        first = [registry.open_stream(7, h, path, ["a", "b"]) for h in ("a", "b")]
+        _read_in_threads(first)
+        old_session = registry.session(7)
+        assert old_session.wait_done(5)
+
+        retry = registry.open_stream(7, "a", path, ["a", "b"])
+        assert registry.session(7) is not old_session
+        retry.close()
+
+
+class TestStreamedUpload:
+    """Test FileHostClient uploads reading from a ZipStream"""
+
+    @pytest.fixture
+    def server(self):
+        from benchmarks.mock_server import MockServer, MockServerConfig
+        with MockServer(MockServerConfig(seed=1)) as srv:
+            yield srv
+
+    def _client(self, server, extra_fields=None):
+        from src.core.engine import AtomicCounter
+        from src.core.file_host_config import HostConfig
+        from src.network.file_host_client import FileHostClient
+        config = HostConfig(
+            name="Mock Standard",
+            upload_endpoint=f"{server.url}/host/upload",
+            file_field="file",
+            extra_fields=extra_fields or {},
+            link_path=["result", "url"],
+            file_id_path=["result", "file_id"],
+        )
+        return FileHostClient(config, AtomicCounter())
+
+    def test_multipart_from_stream(self, server, zip_file):
+        path, data = zip_file
+        progress = []
+        client = self._client(server, {"folder": "galleries"})
+
+        with ZipStream(path, "mock") as stream:
+            result = client.upload_file(path, on_progress=lambda up, total, speed: progress.append(total),
+                                        source=stream)
+
+        assert result['url'].startswith("https://host.example/f/")
+        assert result['raw_response']['result']['size'] == len(data)
+        assert stream.own_bytes == len(data)
+        assert progress and progress[-1] > len(data)
+
+    def test_shared_read_feeds_several_uploads(self, server, zip_file):
+        path, data = zip_file
+        registry = ZipFanOutRegistry(chunk_size=CHUNK, ring_chunks=WHOLE_FILE, join_window=5.0)
+        hosts = ["a", "b", "c"]
+        streams = [registry.open_stream(3, host, path, hosts) for host in hosts]
+        results = [None] * len(hosts)
+
+        def upload(i):
+            results[i] = self._client(server).upload_file(path, source=streams[i])
+
+        threads = [threading.Thread(target=upload, args=(i,)) for i in range(len(hosts))]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join(30)
+
+        assert all(r['raw_response']['result']['size'] == len(data) for r in results)
+        assert registry.session(3).bytes_read == len(data)
@@ -0,0 +1,225 @@
+"""
+Tests for the SQLite-backed artifact index used for duplicate detection.
+
+Tests cover:
+- Content fingerprints (order/case independence, size sensitivity)
+- Recording saved artifacts and batch lookups by name and fingerprint
+- One-time backfill from existing central store JSON artifacts
+- Renamed-folder detection via fingerprint
+- Lookups by gallery ID with stat-based consistency checks
+"""
+
+import json
+import os
+
+import pytest
+
+from src.storage.database import QueueStore
+from src.storage.artifact_index import (
+    compute_fingerprint,
+    compute_folder_fingerprint,
+    fingerprint_from_images,
+    record_saved_artifacts,
+    backfill_artifact_index,
+    find_previously_uploaded,
+    find_artifacts_by_gallery_ids,
+)
+
+
+@pytest.fixture
+def store(tmp_path):
+    store = QueueStore(db_path=str(tmp_path / "test.db"))
+    yield store
+    store._executor.shutdown(wait=True)
+
+
+def _make_gallery(base, name, files):
+    folder = base / name
+    folder.mkdir()
+    for fname, size in files.items():
+        (folder / fname).write_bytes(b"x" * size)
+    return folder
+
+
+def _write_artifacts(directory, gallery_name, gallery_id, images):
+    json_path = directory / f"{gallery_name}_{gallery_id}.json"
+    bbcode_path = directory / f"{gallery_name}_{gallery_id}_bbcode.txt"
+    json_path.write_text(json.dumps({
+        'meta': {'gallery_name': gallery_name, 'gallery_id': gallery_id},
+        'images': images,
+    }), encoding='utf-8')
+    bbcode_path.write_text("[url]...[/url]", encoding='utf-8')
+    return str(json_path), str(bbcode_path)
+
+
+class TestFingerprint:
+    """Test content fingerprint helpers."""
+
+    def test_order_and_case_independent(self):
+        a = compute_fingerprint([("B.JPG", 10), ("a.jpg", 20)])
+        b = compute_fingerprint([("a.jpg", 20), ("b.jpg", 10)])
+        assert a == b
+
+    def test_size_changes_fingerprint(self):
+        a = compute_fingerprint([("a.jpg", 20)])
+        b = compute_fingerprint([("a.jpg", 21)])
+        assert a != b
+
+    def test_empty_returns_none(self):
+        assert compute_fingerprint([]) is None
+
+    def test_folder_matches_json_images(self, tmp_path):
+        folder = _make_gallery(tmp_path, "g", {"01.JPG": 5, "02.png": 7, "notes.txt": 3})
+        images = [
+            {'original_filename': '01.jpg', 'size_bytes': 5},
+            {'original_filename': '02.png', 'size_bytes': 7},
+        ]
+        assert compute_folder_fingerprint(str(folder)) == fingerprint_from_images(images)
+
+    def test_missing_folder_returns_none(self, tmp_path):
+        assert compute_folder_fingerprint(str(tmp_path / "missing")) is None
+
+
+class TestRecordAndLookup:
+    """Test recording artifacts and batch lookups."""
+
+    def test_record_then_find_by_name(self, store, tmp_path):
+        folder = _make_gallery(tmp_path, "Gallery One", {"a.jpg": 10})
+        central = tmp_path / "central"
+        central.mkdir()
+        json_path, bbcode_path = _write_artifacts(central, "Gallery One", "abc123", [])
+        store.mark_artifact_index_backfilled()
+
+        written = record_saved_artifacts(
+            str(folder), "abc123", "Gallery One",
+            {'central': {'json': json_path, 'bbcode': bbcode_path}},
+            store=store,
+        )
+        assert written == 1
+
+        results = find_previously_uploaded([str(folder)], store=store)
+        assert set(results[str(folder)]) == {json_path, bbcode_path}
+
+    def test_renamed_folder_matches_by_fingerprint(self, store, tmp_path):
+        folder = _make_gallery(tmp_path, "Original", {"a.jpg": 10, "b.jpg": 20})
+        central = tmp_path / "central"
+        central.mkdir()
+        json_path, bbcode_path = _write_artifacts(central, "Original", "xyz", [])
+        store.mark_artifact_index_backfilled()
+        record_saved_artifacts(str(folder), "xyz", "Original",
+                               {'central': {'json': json_path, 'bbcode': bbcode_path}},
+                               store=store)
+
+        renamed = tmp_path / "Renamed"
+        os.rename(folder, renamed)
+
+        results = find_previously_uploaded([str(renamed)], store=store)
+        assert json_path in results[str(renamed)]
+
+    def test_unrelated_folders_not_reported(self, store, tmp_path):
+        store.mark_artifact_index_backfilled()
+        folder = _make_gallery(tmp_path, "Fresh", {"a.jpg": 1})
+        assert find_previously_uploaded([str(folder)], store=store) == {}
+
+    def test_deleted_artifacts_are_ignored(self, store, tmp_path):
+        folder = _make_gallery(tmp_path, "Gone", {"a.jpg": 10})
+        central = tmp_path / "central"
+        central.mkdir()
+        json_path, bbcode_path = _write_artifacts(central, "Gone", "g1", [])
+        store.mark_artifact_index_backfilled()
+        record_saved_artifacts(str(folder), "g1", "Gone",
+                               {'central': {'json': json_path, 'bbcode': bbcode_path}},
+                               store=store)
+        os.remove(json_path)
+        os.remove(bbcode_path)
+        assert find_previously_uploaded([str(folder)], store=store) == {}
+
+    def test_batch_lookup_many_names(self, store, tmp_path):
+        entries = [
+            {'gallery_id': f"id{i}", 'gallery_name': f"gallery {i}",
+             'json_path': str(tmp_path / f"gallery {i}_id{i}.json")}
+            for i in range(1200)
+        ]
+        assert store.index_gallery_artifacts(entries) == 1200
+
+        names = [f"gallery {i}" for i in range(0, 1200, 3)] + ["missing"]
+        by_name, by_fp = store.find_existing_artifacts(names)
+        assert len(by_name) == 400
+        assert "missing" not in by_name
+        assert by_fp == {}
+
+
+class TestGalleryIdLookup:
+    """Test lookups by gallery ID."""
+
+    def test_newest_first_with_mtime(self, store, tmp_path):
+        store.mark_artifact_index_backfilled()
+        old_dir, new_dir = tmp_path / "old", tmp_path / "new"
+        old_dir.mkdir()
+        new_dir.mkdir()
+        old_json, _ = _write_artifacts(old_dir, "G", "id1", [])
+        new_json, _ = _write_artifacts(new_dir, "G", "id1", [])
+        os.utime(old_json, (1_000_000, 1_000_000))
+        for json_path in (new_json, old_json):
+            record_saved_artifacts("", "id1", "G", {'central': {'json': json_path}}, store=store)
+
+        results = find_artifacts_by_gallery_ids(["id1", "missing"], store=store)
+        assert [a['json_path'] for a in results["id1"]] == [new_json, old_json]
+        assert results["id1"][1]['json_mtime'] == 1_000_000
+        assert "missing" not in results
+
+    def test_stat_check_prunes_and_refreshes(self, store, tmp_path):
+        store.mark_artifact_index_backfilled()
+        kept, _ = _write_artifacts(tmp_path, "Kept", "k1", [])
+        gone, _ = _write_artifacts(tmp_path, "Gone", "g1", [])
+        for gallery_id, name, json_path in (("k1", "Kept", kept), ("g1", "Gone", gone)):
+            record_saved_artifacts("", gallery_id, name, {'central': {'json': json_path}}, store=store)
+        os.remove(gone)
+        os.utime(kept, (2_000_000, 2_000_000))
+
+        results = find_artifacts_by_gallery_ids(["k1", "g1"], store=store)
+        assert list(results) == ["k1"]
+        stored = store.get_artifacts_by_gallery_ids(["k1", "g1"])
+        assert list(stored) == ["k1"]
+        assert stored["k1"][0]['json_mtime'] == 2_000_000
+
+    def test_batch_lookup_many_ids(self, store, tmp_path):
+        entries = [
+            {'gallery_id': f"id{i}", 'gallery_name': f"gallery {i}",
+             'json_path': str(tmp_path / f"gallery {i}_id{i}.json"), 'json_mtime': float(i)}
+            for i in range(1200)
+        ]
+        store.index_gallery_artifacts(entries)
+
+        results = store.get_artifacts_by_gallery_ids([f"id{i}" for i in range(0, 1200, 2)])
+        assert len(results) == 600
+        assert results["id10"][0]['json_mtime'] == 10.0
+
+
+class TestBackfill:
+    """Test one-time backfill from the central store."""
+
+    def test_backfill_indexes_existing_json(self, store, tmp_path):
+        central = tmp_path / "central"
+        central.mkdir()
+        images = [{'original_filename': 'a.jpg', 'size_bytes': 10}]
+        json_path, bbcode_path = _write_artifacts(central, "Old Gallery", "old1", images)
+        (central / "broken.json").write_text("{not json", encoding='utf-8')
+
+        assert backfill_artifact_index(store, central_path=str(central)) == 1
+        assert store.is_artifact_index_backfilled()
+
+        by_name, by_fp = store.find_existing_artifacts(
+            ["Old Gallery"], [fingerprint_from_images(images)]
+        )
+        assert set(by_name["Old Gallery"]) == {os.path.normpath(json_path), os.path.normpath(bbcode_path)}
+        assert len(by_fp) == 1
+
+    def test_backfill_runs_once(self, store, tmp_path):
+        central = tmp_path / "central"
+        central.mkdir()
+        _write_artifacts(central, "One", "1", [])
+        assert backfill_artifact_index(store, central_path=str(central)) == 1
+        _write_artifacts(central, "Two", "2", [])
+        assert backfill_artifact_index(store, central_path=str(central)) == 0
+        assert backfill_artifact_index(store, central_path=str(central), force=True) == 2
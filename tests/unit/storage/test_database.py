@@ -485,6 +485,29 @@ class TestImagesCRUD:
         conn.close()
 
 
+    def test_get_uploaded_images(self, queue_store):
+        """Test per-image upload data round-trips through bulk_upsert."""
+        queue_store.bulk_upsert([{
+            'path': '/test/gallery1',
+            'status': 'completed',
+            'added_time': int(time.time()),
+            'tab_name': 'Main',
+            'uploaded_files': ['b.jpg', 'a.jpg'],
+            'uploaded_images_data': [
+                ('b.jpg', {'image_url': 'https://imx.to/i/b', 'thumb_url': 'https://imx.to/u/t/b.jpg',
+                           'size_bytes': 2048, 'width': 800, 'height': 600}),
+                ('a.jpg', {'image_url': 'https://imx.to/i/a'}),
+            ],
+        }])
+
+        images = dict(queue_store.get_uploaded_images('/test/gallery1'))
+
+        assert images['b.jpg'] == {'image_url': 'https://imx.to/i/b', 'thumb_url': 'https://imx.to/u/t/b.jpg',
+                                   'size_bytes': 2048, 'width': 800, 'height': 600}
+        assert images['a.jpg']['image_url'] == 'https://imx.to/i/a'
+        assert queue_store.get_uploaded_images('/test/missing') == []
+
+
 class TestTabManagement:
     """Test tab management operations."""
 
@@ -757,6 +780,21 @@ class TestFileHostUploads:
         assert len(pending) == 1
         assert pending[0]['host_name'] == 'gofile'
 
+    def test_bulk_add_file_host_uploads(self, queue_store):
+        """Test adding uploads for many galleries in one call."""
+        paths = [os.path.normpath(f'/test/gallery{i}') for i in range(3)]
+        queue_store.bulk_upsert([
+            {'path': p, 'status': 'validating', 'added_time': int(time.time()), 'tab_name': 'Main'}
+            for p in paths
+        ])
+
+        uploads = [(p, host) for p in paths for host in ('gofile', 'filedot')]
+        written = queue_store.bulk_add_file_host_uploads(uploads + [('/test/unknown', 'gofile')])
+
+        assert written == 6
+        assert sorted(u['host_name'] for u in queue_store.get_file_host_uploads(paths[1])) == ['filedot', 'gofile']
+        assert queue_store.get_file_host_uploads('/test/unknown') == []
+
 
 class TestTransactions:
     """Test transaction handling."""
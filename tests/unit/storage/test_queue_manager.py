@@ -141,6 +141,71 @@ class TestGalleryQueueItem:
         item.uploaded_files.add('image1.jpg')
         assert 'image1.jpg' in item.uploaded_files
 
+    def test_uses_slots(self):
+        """Test items carry no per-instance __dict__."""
+        item = GalleryQueueItem(path='/test/path')
+
+        assert not hasattr(item, '__dict__')
+        with pytest.raises(AttributeError):
+            item.not_a_field = 1
+
+
+
+class TestUploadedImageData:
+    """Test releasing and reloading per-image data of completed galleries."""
+
+    IMAGES = [('image0.jpg', {'image_url': 'https://imx.to/i/a'}),
+              ('image1.jpg', {'image_url': 'https://imx.to/i/b'})]
+
+    def _completed(self, queue_manager, gallery_dir):
+        queue_manager.add_item(gallery_dir)
+        item = queue_manager.get_item(gallery_dir)
+        item.status = QUEUE_STATE_COMPLETED
+        item.uploaded_images = 2
+        item.uploaded_files = {name for name, _ in self.IMAGES}
+        item.uploaded_images_data = list(self.IMAGES)
+        return item
+
+    def test_save_releases_completed_gallery_data(self, queue_manager, mock_store, gallery_dir):
+        item = self._completed(queue_manager, gallery_dir)
+        mock_store.bulk_upsert_async.reset_mock()
+
+        queue_manager.save_persistent_queue([gallery_dir])
+
+        saved = mock_store.bulk_upsert_async.call_args[0][0][0]
+        assert sorted(saved['uploaded_files']) == ['image0.jpg', 'image1.jpg']
+        assert saved['uploaded_images_data'] == self.IMAGES
+        assert item.uploaded_files == set() and item.uploaded_images_data == []
+
+    def test_unfinished_gallery_keeps_data(self, queue_manager, gallery_dir):
+        item = self._completed(queue_manager, gallery_dir)
+        item.status = QUEUE_STATE_INCOMPLETE
+
+        queue_manager.save_persistent_queue([gallery_dir])
+
+        assert len(item.uploaded_files) == 2
+
+    def test_released_data_loaded_from_store(self, queue_manager, mock_store, gallery_dir):
+        item = self._completed(queue_manager, gallery_dir)
+        queue_manager.save_persistent_queue([gallery_dir])
+        mock_store.get_uploaded_images.return_value = list(self.IMAGES)
+
+        assert queue_manager.get_uploaded_images(gallery_dir) == self.IMAGES
+        assert queue_manager.load_uploaded_images(gallery_dir) is True
+        assert item.uploaded_files == {'image0.jpg', 'image1.jpg'}
+        assert item.uploaded_images_data == self.IMAGES
+        # Already in memory: served without another query
+        mock_store.get_uploaded_images.reset_mock()
+        assert queue_manager.load_uploaded_images(gallery_dir) is False
+        assert queue_manager.get_uploaded_images(gallery_dir) == self.IMAGES
+        mock_store.get_uploaded_images.assert_not_called()
+
+    def test_nothing_loaded_without_uploads(self, queue_manager, mock_store, gallery_dir):
+        queue_manager.add_item(gallery_dir)
+
+        assert queue_manager.load_uploaded_images(gallery_dir) is False
+        mock_store.get_uploaded_images.assert_not_called()
+
 
 class TestQueueManagerInitialization:
     """Test QueueManager initialization."""
@@ -148,7 +213,7 @@ class TestQueueManagerInitialization:
     def test_initialization(self, queue_manager):
         """Test basic initialization."""
         assert hasattr(queue_manager, 'items')
-        assert hasattr(queue_manager, 'queue')
+        assert hasattr(queue_manager, 'scheduler')
         assert hasattr(queue_manager, 'mutex')
         assert isinstance(queue_manager.items, dict)
 
@@ -233,6 +298,78 @@ class TestAddItem:
         assert queue_manager.items[gallery_dir].insertion_order < queue_manager.items[gallery_dir2].insertion_order
 
 
+class TestAddItemsBulk:
+    """Test adding many items at once."""
+
+    @pytest.fixture
+    def galleries(self, temp_dir):
+        paths = []
+        for i in range(5):
+            path = os.path.join(temp_dir, f'gallery{i}')
+            os.makedirs(path)
+            paths.append(path)
+        return paths
+
+    def test_single_persist_and_duplicates(self, queue_manager, mock_store, galleries):
+        """All new rows are written in one store call; known paths count as duplicates."""
+        queue_manager.add_item(galleries[0])
+        mock_store.bulk_upsert_async.reset_mock()
+
+        with patch('src.processing.hooks_executor.execute_gallery_hooks', return_value={}):
+            results = queue_manager.add_items_bulk(galleries + [galleries[1]], template_name='t', tab_name='Later')
+
+        assert results['added'] == 4
+        assert results['duplicates'] == 2
+        assert results['added_paths'] == galleries[1:]
+        mock_store.bulk_upsert_async.assert_called_once()
+        rows = mock_store.bulk_upsert_async.call_args[0][0]
+        assert [row['path'] for row in rows] == galleries[1:]
+        assert all(row['status'] == QUEUE_STATE_VALIDATING and row['tab_name'] == 'Later' for row in rows)
+        orders = [queue_manager.items[p].insertion_order for p in galleries]
+        assert orders == sorted(orders)
+        assert queue_manager.get_scan_queue_status()['items_pending_scan'] >= 1
+
+    def test_scans_in_queue_order(self, queue_manager, galleries):
+        """The scan worker receives the new paths in insertion order."""
+        scanned = []
+        with patch.object(queue_manager, '_comprehensive_scan_item', side_effect=scanned.append), \
+             patch('src.processing.hooks_executor.execute_gallery_hooks', return_value={}):
+            queue_manager.add_items_bulk(galleries)
+            deadline = time.time() + 3
+            while len(scanned) < len(galleries) and time.time() < deadline:
+                time.sleep(0.01)
+
+        assert scanned == galleries
+
+    def test_file_host_triggers_batched(self, queue_manager, mock_store, galleries):
+        """'On Added' file host uploads are queued in one store call after the rows."""
+        config_manager = Mock()
+        config_manager.get_hosts_by_trigger.return_value = {'gofile': Mock(), 'filedot': Mock()}
+        with patch('src.core.file_host_config.get_config_manager', return_value=config_manager), \
+             patch('src.processing.hooks_executor.execute_gallery_hooks', return_value={}):
+            queue_manager.add_items_bulk(galleries[:2])
+
+        config_manager.get_hosts_by_trigger.assert_called_once_with('added')
+        mock_store._executor.submit.assert_called_once()
+        func, uploads = mock_store._executor.submit.call_args[0]
+        assert func is mock_store.bulk_add_file_host_uploads
+        assert sorted(uploads) == sorted((p, h) for p in galleries[:2] for h in ('gofile', 'filedot'))
+        mock_store.add_file_host_upload.assert_not_called()
+
+    def test_unscanned_items_requeued_on_load(self, mock_store, galleries):
+        """Items persisted before their scan finished are scanned again on startup."""
+        mock_store.load_all_items.return_value = [
+            {'path': galleries[0], 'status': QUEUE_STATE_VALIDATING},
+            {'path': galleries[1], 'status': QUEUE_STATE_READY},
+        ]
+        with patch('src.storage.queue_manager.QueueStore', return_value=mock_store), \
+             patch('src.storage.queue_manager.QSettings'), \
+             patch.object(QueueManager, '_start_scan_worker'):
+            manager = QueueManager()
+
+        assert list(manager._scan_queue.queue) == [galleries[0]]
+
+
 class TestRemoveItem:
     """Test removing items from queue."""
 
@@ -430,6 +567,29 @@ class TestScanOperations:
 
         assert 'readme.txt' not in files
 
+    def test_archive_gallery_scanned_without_extraction(self, queue_manager, tmp_path):
+        """Test listing and validating images inside a ZIP archive."""
+        import io
+        import zipfile
+        from PIL import Image
+
+        archive = tmp_path / "set.zip"
+        with zipfile.ZipFile(archive, 'w', zipfile.ZIP_STORED) as zf:
+            for i in range(3):
+                buf = io.BytesIO()
+                Image.new('RGB', (40, 30)).save(buf, format='PNG')
+                zf.writestr(f"photos/{i}.png", buf.getvalue())
+            zf.writestr("photos/broken.jpg", b"not an image")
+        path = f"{archive}::photos"
+
+        files = queue_manager._get_image_files(path)
+        assert sorted(files) == ['0.png', '1.png', '2.png', 'broken.jpg']
+
+        result = queue_manager._scan_images(path, sorted(files))
+        assert [f for f, _ in result['failed_files']] == ['broken.jpg']
+        assert result['total_size'] > 0
+        assert list(tmp_path.iterdir()) == [archive]
+
     def test_mark_scan_failed(self, queue_manager, gallery_dir):
         """Test marking scan as failed."""
         queue_manager.add_item(gallery_dir)
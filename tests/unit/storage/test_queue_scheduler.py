@@ -0,0 +1,247 @@
+"""
+Tests for the upload order of queued galleries.
+
+Tests cover:
+- FIFO order with the default policy
+- Priorities, shortest-job-first and aging
+- Tab weights (stride scheduling) and held tabs
+- Re-queueing, re-prioritising and stale entries
+- Order and fairness with 10k queued galleries
+- QueueManager.get_next_item using the scheduler
+"""
+
+import random
+import time
+from collections import Counter
+from unittest.mock import Mock, patch
+
+import pytest
+
+from src.storage.queue_scheduler import (
+    GIB, PRIORITY_HIGH, PRIORITY_LOW, PRIORITY_URGENT,
+    QueueScheduler, SchedulerPolicy, clamp_priority,
+)
+
+
+def _drain(scheduler, accept=None):
+    order = []
+    while (path := scheduler.pop(accept)) is not None:
+        order.append(path)
+    return order
+
+
+class TestOrder:
+    """Test ordering within one queue"""
+
+    def test_default_is_fifo(self):
+        scheduler = QueueScheduler()
+        for i in range(5):
+            scheduler.push(f"g{i}", queued_at=100 + i)
+        assert _drain(scheduler) == [f"g{i}" for i in range(5)]
+
+    def test_priority_first(self):
+        scheduler = QueueScheduler()
+        scheduler.push("normal", queued_at=100)
+        scheduler.push("low", PRIORITY_LOW, queued_at=101)
+        scheduler.push("urgent", PRIORITY_URGENT, queued_at=102)
+        scheduler.push("high", PRIORITY_HIGH, queued_at=103)
+        assert _drain(scheduler) == ["urgent", "high", "normal", "low"]
+
+    def test_aging_prevents_starvation(self):
+        scheduler = QueueScheduler(SchedulerPolicy(priority_step=600))
+        scheduler.push("old-normal", queued_at=0)
+        scheduler.push("recent-high", PRIORITY_HIGH, queued_at=500)  # bonus 600s > 500s head start
+        scheduler.push("late-high", PRIORITY_HIGH, queued_at=700)    # waited too little to overtake
+        assert _drain(scheduler) == ["recent-high", "old-normal", "late-high"]
+
+    def test_shortest_first(self):
+        scheduler = QueueScheduler(SchedulerPolicy(shortest_first=True, size_step=300))
+        scheduler.push("big", size=4 * GIB, queued_at=100)
+        scheduler.push("small", size=GIB // 10, queued_at=110)
+        scheduler.push("medium", size=GIB, queued_at=120)
+        assert _drain(scheduler) == ["small", "medium", "big"]
+
+    def test_size_penalty_is_capped(self):
+        policy = SchedulerPolicy(shortest_first=True, size_step=300, max_size_delay=600)
+        scheduler = QueueScheduler(policy)
+        scheduler.push("huge", size=1000 * GIB, queued_at=0)
+        scheduler.push("tiny", size=0, queued_at=601)
+        assert _drain(scheduler) == ["huge", "tiny"]
+
+    def test_priority_clamped(self):
+        assert clamp_priority(99) == PRIORITY_URGENT
+        assert clamp_priority(-99) == PRIORITY_LOW
+        assert clamp_priority("x") == 0
+
+
+class TestUpdates:
+    """Test entries following gallery changes"""
+
+    def test_requeue_replaces_entry(self):
+        scheduler = QueueScheduler()
+        scheduler.push("a", queued_at=1)
+        scheduler.push("b", queued_at=2)
+        scheduler.push("a", queued_at=3)
+        assert _drain(scheduler) == ["b", "a"]
+
+    def test_update_priority_keeps_queue_time(self):
+        scheduler = QueueScheduler()
+        scheduler.push("a", queued_at=1)
+        scheduler.push("b", queued_at=2)
+        assert scheduler.update("b", priority=PRIORITY_HIGH)
+        assert not scheduler.update("missing", priority=PRIORITY_HIGH)
+        assert _drain(scheduler) == ["b", "a"]
+
+    def test_discard_and_rejected_entries(self):
+        scheduler = QueueScheduler()
+        for name in "abcd":
+            scheduler.push(name)
+        scheduler.discard("b")
+        assert _drain(scheduler, accept=lambda path: path != "c") == ["a", "d"]
+        assert len(scheduler) == 0
+
+
+class TestTabWeights:
+    """Test sharing uploads between tabs"""
+
+    def test_weighted_share(self):
+        scheduler = QueueScheduler(SchedulerPolicy(tab_weights={"Fast": 3, "Slow": 1}))
+        for i in range(40):
+            scheduler.push(f"fast{i}", tab="Fast", queued_at=i)
+            scheduler.push(f"slow{i}", tab="Slow", queued_at=i)
+        first = [scheduler.pop() for _ in range(20)]
+        assert sum(p.startswith("fast") for p in first) == 15
+
+    def test_zero_weight_holds_tab(self):
+        scheduler = QueueScheduler(SchedulerPolicy(tab_weights={"Night": 1, "Main": 0}))
+        scheduler.push("main", tab="Main", queued_at=0)
+        scheduler.push("night", tab="Night", queued_at=1)
+        assert _drain(scheduler) == ["night"]
+        assert "main" in scheduler
+
+        scheduler.set_policy(SchedulerPolicy())
+        assert _drain(scheduler) == ["main"]
+
+    def test_idle_tab_gets_no_saved_up_turns(self):
+        scheduler = QueueScheduler(SchedulerPolicy(tab_weights={"A": 1, "B": 1}))
+        for i in range(10):
+            scheduler.push(f"a{i}", tab="A", queued_at=i)
+        for _ in range(8):
+            scheduler.pop()
+        scheduler.push("b0", tab="B", queued_at=20)
+        scheduler.push("b1", tab="B", queued_at=21)
+        assert _drain(scheduler) == ["b0", "a8", "b1", "a9"]
+
+
+class TestLargeQueue:
+    """Test order and fairness with 10k queued galleries"""
+
+    COUNT = 10_000
+
+    def test_order_matches_deadlines(self):
+        rng = random.Random(1)
+        policy = SchedulerPolicy(shortest_first=True)
+        scheduler = QueueScheduler(policy)
+        deadlines = {}
+        for i in range(self.COUNT):
+            priority = rng.choice([PRIORITY_LOW, 0, 0, 0, PRIORITY_HIGH, PRIORITY_URGENT])
+            size = rng.randrange(0, 8 * GIB)
+            scheduler.push(f"g{i}", priority, size, queued_at=i)
+            deadlines[f"g{i}"] = (policy.deadline(priority, size, i), i)
+
+        started = time.perf_counter()
+        order = _drain(scheduler)
+        elapsed = time.perf_counter() - started
+
+        assert order == sorted(deadlines, key=deadlines.get)
+        assert elapsed < 1.0
+
+    def test_no_gallery_waits_past_its_bound(self):
+        # Galleries keep arriving; each one must run before anything queued
+        # more than the largest possible bonus after it
+        policy = SchedulerPolicy(priority_step=600, shortest_first=True, size_step=300, max_size_delay=3600)
+        max_bonus = (PRIORITY_URGENT - PRIORITY_LOW) * policy.priority_step + policy.max_size_delay
+        rng = random.Random(2)
+        scheduler = QueueScheduler(policy)
+        queued_at = {}
+        order = []
+        for i in range(self.COUNT):
+            priority = rng.choice([PRIORITY_LOW, 0, PRIORITY_HIGH, PRIORITY_URGENT])
+            scheduler.push(f"g{i}", priority, rng.randrange(0, 20 * GIB), queued_at=i * 10)
+            queued_at[f"g{i}"] = i * 10
+            if i % 2:
+                order.append(scheduler.pop())
+        order.extend(_drain(scheduler))
+
+        latest_seen = 0
+        for path in order:
+            latest_seen = max(latest_seen, queued_at[path])
+            assert latest_seen - queued_at[path] <= max_bonus
+
+    def test_weighted_fairness(self):
+        weights = {"A": 1, "B": 2, "C": 5}
+        scheduler = QueueScheduler(SchedulerPolicy(tab_weights=weights))
+        for i in range(self.COUNT):
+            for tab in weights:
+                scheduler.push(f"{tab}{i}", tab=tab, queued_at=i)
+
+        picks = Counter(scheduler.pop()[0] for _ in range(8000))
+        for tab, weight in weights.items():
+            assert picks[tab] == pytest.approx(8000 * weight / 8, abs=2)
+
+
+class TestQueueManagerScheduling:
+    """Test QueueManager handing out galleries in scheduler order"""
+
+    @pytest.fixture
+    def manager(self):
+        from src.storage.queue_manager import QueueManager
+        store = Mock()
+        store.load_all_items.return_value = []
+        with patch('src.storage.queue_manager.QueueStore', return_value=store), \
+                patch('src.storage.queue_manager.QSettings'):
+            manager = QueueManager()
+            yield manager
+            manager._scan_worker_running = False
+            manager._scan_queue.put(None)
+
+    def _add_ready(self, manager, path, **fields):
+        from src.storage.queue_manager import GalleryQueueItem
+        manager.items[path] = GalleryQueueItem(path=path, status="ready", **fields)
+
+    def test_get_next_item_by_priority(self, manager):
+        for name in ("a", "b", "c"):
+            self._add_ready(manager, name)
+            manager.start_item(name)
+        manager.set_item_priority("c", PRIORITY_URGENT)
+
+        assert [manager.get_next_item().path for _ in range(3)] == ["c", "a", "b"]
+        assert manager.get_next_item() is None
+
+    def test_items_leaving_queue_are_skipped(self, manager):
+        for name in ("a", "b"):
+            self._add_ready(manager, name)
+            manager.start_item(name)
+        manager.update_item_status("a", "paused")
+        manager.items["b"].status = "ready"  # changed without update_item_status
+
+        assert manager.get_next_item() is None
+        assert len(manager.scheduler) == 0
+
+    def test_policy_saved(self, manager):
+        policy = SchedulerPolicy(shortest_first=True, tab_weights={"Main": 2})
+        manager.set_scheduler_policy(policy)
+        assert manager.scheduler.policy is policy
+        manager.settings.setValue.assert_any_call("scheduler/shortest_first", True)
+
+    def test_policy_from_settings(self):
+        values = {"scheduler/priority_step": "120", "scheduler/shortest_first": "true",
+                  "scheduler/tab_weights": '{"Main": 0.5}'}
+        settings = Mock()
+        settings.value.side_effect = lambda key, default=None: values.get(key, default)
+
+        policy = SchedulerPolicy.from_settings(settings)
+
+        assert policy.priority_step == 120
+        assert policy.shortest_first
+        assert policy.tab_weights == {"Main": 0.5}
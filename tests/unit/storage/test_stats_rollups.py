@@ -0,0 +1,193 @@
+"""
+Tests for the statistics rollup tables in the queue database.
+
+Tests cover:
+- Counting galleries once when they are saved as completed
+- Totals surviving galleries being cleared from the queue
+- Breakdowns by day, tab, template and file host
+- One-time backfill of existing galleries and legacy QSettings totals
+- Query time on a large database
+"""
+
+import sqlite3
+import time
+
+import pytest
+
+from src.storage import database
+from src.storage.database import QueueStore
+
+DAY = 86400
+
+
+@pytest.fixture
+def store(tmp_path):
+    store = QueueStore(db_path=str(tmp_path / "test.db"))
+    yield store
+    store._executor.shutdown(wait=True)
+
+
+def _gallery(path, status='completed', **fields):
+    item = {'path': path, 'name': path.strip('/'), 'status': status, 'added_time': time.time(),
+            'uploaded_images': 10, 'uploaded_bytes': 1000}
+    if status == 'completed':
+        item['finished_time'] = time.time()
+    item.update(fields)
+    return item
+
+
+class FakeStatsSettings:
+    """Stands in for QSettings("BBDropUploader", "Stats")"""
+
+    def __init__(self, values):
+        self._values = values
+
+    def value(self, key, default=None, type=None):
+        value = self._values.get(key, default)
+        return type(value) if type is not None else value
+
+
+class TestGalleryRollups:
+    """Test counting completed galleries"""
+
+    def test_completion_counted_once(self, store):
+        store.bulk_upsert([_gallery('/a', status='uploading')])
+        assert store.get_upload_totals() == {'galleries': 0, 'images': 0, 'bytes': 0}
+
+        store.bulk_upsert([_gallery('/a')])
+        store.bulk_upsert([_gallery('/a')])  # Saving a completed gallery again
+
+        assert store.get_upload_totals() == {'galleries': 1, 'images': 10, 'bytes': 1000}
+
+    def test_reupload_counted_again(self, store):
+        store.bulk_upsert([_gallery('/a')])
+        store.bulk_upsert([_gallery('/a', status='ready')])
+        store.bulk_upsert([_gallery('/a')])
+        assert store.get_upload_totals()['galleries'] == 2
+
+    def test_failed_galleries_not_counted(self, store):
+        store.bulk_upsert([_gallery('/a', status='failed')])
+        assert store.get_upload_totals()['galleries'] == 0
+
+    def test_size_used_when_bytes_not_tracked(self, store):
+        store.bulk_upsert([_gallery('/a', uploaded_bytes=0, total_size=4096)])
+        assert store.get_upload_totals()['bytes'] == 4096
+
+    def test_totals_survive_clearing_queue(self, store):
+        store.bulk_upsert([_gallery('/a'), _gallery('/b')])
+        store.delete_by_status(['completed'])
+        assert store.get_upload_totals() == {'galleries': 2, 'images': 20, 'bytes': 2000}
+
+
+class TestBreakdowns:
+    """Test grouped upload statistics"""
+
+    def test_by_tab_and_template(self, store):
+        store.create_tab("Archive")
+        store.bulk_upsert([
+            _gallery('/a', template_name='Default'),
+            _gallery('/b', template_name='Default', tab_name='Archive'),
+            _gallery('/c', tab_name='Archive'),
+        ])
+
+        stats = store.get_upload_stats()
+
+        assert [(t['tab_name'], t['galleries']) for t in stats['by_tab']] == [('Archive', 2), ('Main', 1)]
+        assert [(t['template'], t['galleries']) for t in stats['by_template']] == [('Default', 2), ('', 1)]
+        assert stats['totals']['galleries'] == 3
+
+    def test_by_day_and_timeframe(self, store):
+        old = time.time() - 10 * DAY
+        store.bulk_upsert([_gallery('/old', finished_time=old), _gallery('/new')])
+
+        all_time = store.get_upload_stats()
+        assert [d['galleries'] for d in all_time['by_day']] == [1, 1]
+        assert all_time['by_day'][0]['day'] == time.strftime('%Y-%m-%d')
+
+        last_week = store.get_upload_stats(time.time() - 6 * DAY)
+        assert last_week['totals']['galleries'] == 1
+        assert len(last_week['by_day']) == 1
+
+    def test_by_host(self, store):
+        store.bulk_upsert([_gallery('/a'), _gallery('/b')])
+        first = store.add_file_host_upload('/a', 'rapidgator')
+        second = store.add_file_host_upload('/b', 'rapidgator')
+        store.update_file_host_upload(first, status='uploading')
+        store.update_file_host_upload(first, status='completed', total_bytes=500)
+        store.update_file_host_upload(second, status='failed')
+
+        stats = store.get_upload_stats()
+        assert stats['by_host'] == [{'host_name': 'rapidgator', 'files': 1, 'failed': 1, 'bytes': 500}]
+
+
+class TestBackfill:
+    """Test filling the rollups for existing databases"""
+
+    def test_existing_galleries_backfilled(self, store, tmp_path):
+        store.bulk_upsert([_gallery('/a'), _gallery('/b'), _gallery('/c', status='ready')])
+        upload_id = store.add_file_host_upload('/a', 'gofile')
+        store.update_file_host_upload(upload_id, status='completed', total_bytes=300)
+
+        # Simulate a database from before the rollups existed
+        with sqlite3.connect(store.db_path) as conn:
+            for name in ('stats_gallery_completed_insert', 'stats_gallery_completed_update',
+                         'stats_host_upload_finished_insert', 'stats_host_upload_finished'):
+                conn.execute(f"DROP TRIGGER {name}")
+            conn.execute("DROP TABLE stats_gallery_daily")
+            conn.execute("DROP TABLE stats_host_daily")
+        database._schema_initialized_dbs.clear()
+
+        reopened = QueueStore(db_path=store.db_path)
+        try:
+            stats = reopened.get_upload_stats()
+            assert stats['totals'] == {'galleries': 2, 'images': 20, 'bytes': 2000}
+            assert stats['by_host'][0]['bytes'] == 300
+
+            # Triggers are back for new completions
+            reopened.bulk_upsert([_gallery('/c')])
+            assert reopened.get_upload_totals()['galleries'] == 3
+        finally:
+            reopened._executor.shutdown(wait=True)
+
+    def test_legacy_totals_kept_as_baseline(self, store):
+        store.bulk_upsert([_gallery('/a')])
+        legacy = FakeStatsSettings({'total_galleries': 5, 'total_images': 40, 'total_size_bytes_v2': '9000'})
+
+        store.migrate_stats_from_qsettings_if_needed(legacy)
+        store.migrate_stats_from_qsettings_if_needed(FakeStatsSettings({'total_galleries': 100}))
+
+        assert store.get_upload_totals() == {'galleries': 5, 'images': 40, 'bytes': 9000}
+        # Timeframe queries only count what the database has
+        assert store.get_upload_stats(time.time())['totals']['galleries'] == 1
+
+        store.bulk_upsert([_gallery('/b')])
+        assert store.get_upload_totals()['galleries'] == 6
+
+    def test_legacy_totals_below_database_ignored(self, store):
+        store.bulk_upsert([_gallery('/a'), _gallery('/b')])
+        store.migrate_stats_from_qsettings_if_needed(FakeStatsSettings({'total_galleries': 1}))
+        assert store.get_upload_totals()['galleries'] == 2
+
+
+class TestQueryTime:
+    """Test statistics queries stay fast on large databases"""
+
+    def test_large_database(self, store):
+        now = int(time.time())
+        with sqlite3.connect(store.db_path) as conn:
+            conn.executemany(
+                """
+                INSERT INTO galleries(path, name, status, added_ts, finished_ts, template, uploaded_images,
+                                      uploaded_bytes, tab_id)
+                VALUES (?, ?, 'completed', ?, ?, ?, 50, 1000000, 1)
+                """,
+                ((f"/g/{i}", f"g{i}", now, now - (i % 365) * DAY, f"T{i % 5}") for i in range(100_000))
+            )
+
+        started = time.perf_counter()
+        stats = store.get_upload_stats()
+        elapsed = time.perf_counter() - started
+
+        assert stats['totals']['galleries'] == 100_000
+        assert len(stats['by_day']) == 365
+        assert elapsed < 0.1
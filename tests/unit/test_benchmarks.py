@@ -0,0 +1,89 @@
+#!/usr/bin/env python3
+"""
+Test suite for the offline benchmark suite
+Tests the mock imx.to/file host server, error injection and result comparison
+"""
+
+import time
+
+import pytest
+import requests
+
+from benchmarks.mock_server import MockServer, MockServerConfig, _Throttle
+from benchmarks.runner import compare_results
+
+
+@pytest.fixture
+def server():
+    with MockServer(MockServerConfig(seed=1)) as srv:
+        yield srv
+
+
+class TestMockServer:
+    """Test mock endpoints"""
+
+    def test_imx_upload_creates_gallery_then_appends(self, server):
+        files = {'image': ('a.jpg', b'x' * 1000, 'image/jpeg')}
+        first = requests.post(f"{server.url}/upload.php", files=files,
+                              data={'create_gallery': 'true'}).json()
+        assert first['status'] == 'success'
+        gallery_id = first['data']['gallery_id']
+        assert first['data']['size'] == 1000
+
+        second = requests.post(f"{server.url}/upload.php", files=files,
+                               data={'gallery_id': gallery_id}).json()
+        assert second['data']['gallery_id'] == gallery_id
+        assert server.stats.galleries_created == 1
+        assert len(server.images) == 2
+
+    def test_rename_and_moderate(self, server):
+        assert requests.post(f"{server.url}/user/gallery/edit?id=g1",
+                             data={'gallery_name': 'New'}).status_code == 200
+        assert server.galleries['g1'] == 'New'
+
+        urls = [f"https://imx.to/i/abc{i}" for i in range(5)]
+        page = requests.post(f"{server.url}/user/moderate", data={'imagesid': "\n".join(urls)}).text
+        assert "Found: 5 images" in page
+        assert urls[0] in page.split('imageallcodes', 1)[1]
+
+    def test_multistep_upload_flow(self):
+        with MockServer(MockServerConfig(poll_ready_after=2)) as srv:
+            init = requests.get(f"{srv.url}/host/init?name=a.zip&size=3").json()
+            upload = init['response']['upload']
+            requests.post(upload['url'], files={'file': ('a.zip', b'abc')})
+            poll_url = f"{srv.url}/host/poll/{upload['upload_id']}"
+            assert requests.get(poll_url).json()['response']['upload']['state'] == 1
+            done = requests.get(poll_url).json()['response']['upload']
+            assert done['file']['url'].endswith(upload['upload_id'])
+
+    def test_error_injection(self):
+        with MockServer(MockServerConfig(error_rate=1.0)) as srv:
+            assert requests.get(f"{srv.url}/user/dashboard").status_code == 500
+            assert srv.stats.errors_injected == 1
+
+    def test_throttle_caps_rate(self):
+        throttle = _Throttle(bytes_per_second=100_000)
+        start = time.perf_counter()
+        for _ in range(5):
+            throttle.consume(5_000)
+        assert time.perf_counter() - start >= 0.2
+
+
+class TestCompareResults:
+    """Test regression detection between result files"""
+
+    def _doc(self, ops, p95):
+        return {'scenarios': {'imx_upload': {'ops_per_sec': ops, 'latency_ms': {'p95': p95}}}}
+
+    def test_statuses(self):
+        rows = {r['metric']: r for r in compare_results(self._doc(100, 50), self._doc(80, 40))}
+        assert rows['ops_per_sec']['status'] == 'regressed'
+        assert rows['latency_ms.p95']['status'] == 'improved'
+
+    def test_within_threshold_and_missing_scenarios(self):
+        baseline = self._doc(100, 50)
+        current = self._doc(95, 52)
+        current['scenarios']['rename'] = {'ops_per_sec': 1}
+        rows = compare_results(baseline, current, threshold=0.10)
+        assert {r['status'] for r in rows} == {'same'}
+        assert {r['scenario'] for r in rows} == {'imx_upload'}
@@ -0,0 +1,122 @@
+#!/usr/bin/env python3
+"""
+Test suite for parallel archive extraction
+Tests folder listing, selective extraction, per-folder readiness and progress
+"""
+
+import zipfile
+
+import pytest
+
+from src.services.archive_extractor import ParallelArchiveExtractor, list_archive_folders
+from src.services.archive_service import ArchiveService
+
+
+@pytest.fixture
+def multi_folder_zip(tmp_path):
+    archive = tmp_path / "multi.zip"
+    with zipfile.ZipFile(archive, 'w', zipfile.ZIP_DEFLATED) as zf:
+        zf.writestr("root.jpg", b"r" * 10)
+        for folder in ("a", "b", "b/c"):
+            for i in range(5):
+                zf.writestr(f"{folder}/{i}.jpg", f"{folder}{i}".encode() * 1000)
+        zf.writestr("empty/", b"")
+    return archive
+
+
+class TestListArchiveFolders:
+    """Test listing folders from the central directory"""
+
+    def test_lists_folders_with_files(self, multi_folder_zip):
+        assert list_archive_folders(multi_folder_zip) == ["", "a", "b", "b/c"]
+
+    def test_invalid_archive(self, tmp_path):
+        bad = tmp_path / "bad.zip"
+        bad.write_bytes(b"nope")
+        assert list_archive_folders(bad) is None
+
+
+class TestParallelArchiveExtractor:
+    """Test parallel member extraction"""
+
+    def test_extracts_all_members(self, multi_folder_zip, tmp_path):
+        dest = tmp_path / "out"
+        dest.mkdir()
+        ParallelArchiveExtractor(multi_folder_zip, dest, max_workers=3).extract()
+
+        with zipfile.ZipFile(multi_folder_zip) as zf:
+            for info in zf.infolist():
+                if not info.is_dir():
+                    assert (dest / info.filename).read_bytes() == zf.read(info)
+
+    def test_folder_ready_once_per_folder(self, multi_folder_zip, tmp_path):
+        dest = tmp_path / "out"
+        dest.mkdir()
+        ready = []
+
+        def on_ready(folder):
+            # Every file of the folder must already be on disk
+            assert len([p for p in folder.iterdir() if p.is_file()]) == (1 if folder == dest else 5)
+            ready.append(folder)
+
+        result = ParallelArchiveExtractor(multi_folder_zip, dest).extract(on_folder_ready=on_ready)
+        assert sorted(ready) == sorted([dest, dest / "a", dest / "b", dest / "b" / "c"])
+        assert result == ready
+
+    def test_progress_reports_bytes(self, multi_folder_zip, tmp_path):
+        dest = tmp_path / "out"
+        dest.mkdir()
+        progress = []
+        ParallelArchiveExtractor(multi_folder_zip, dest).extract(
+            on_progress=lambda done, total: progress.append((done, total)))
+
+        with zipfile.ZipFile(multi_folder_zip) as zf:
+            total = sum(i.file_size for i in zf.infolist())
+        assert progress[-1] == (total, total)
+        assert [d for d, _ in progress] == sorted(d for d, _ in progress)
+
+    def test_selected_folders_only(self, multi_folder_zip, tmp_path):
+        dest = tmp_path / "out"
+        dest.mkdir()
+        ParallelArchiveExtractor(multi_folder_zip, dest).extract(folders=["b"])
+        assert sorted(p.name for p in (dest / "b").iterdir() if p.is_file()) == [f"{i}.jpg" for i in range(5)]
+        assert not (dest / "a").exists()
+        assert not (dest / "b" / "c").exists()
+        assert not (dest / "root.jpg").exists()
+
+    def test_path_traversal_is_contained(self, tmp_path):
+        archive = tmp_path / "evil.zip"
+        with zipfile.ZipFile(archive, 'w') as zf:
+            zf.writestr("../../escape.jpg", b"x")
+            zf.writestr("/abs/file.jpg", b"y")
+        dest = tmp_path / "out"
+        dest.mkdir()
+        ParallelArchiveExtractor(archive, dest).extract()
+        assert (dest / "escape.jpg").exists()
+        assert (dest / "abs" / "file.jpg").exists()
+        assert not (tmp_path.parent / "escape.jpg").exists()
+
+
+class TestArchiveServiceExtraction:
+    """Test ArchiveService extraction with callbacks"""
+
+    def test_extract_archive_with_callbacks(self, multi_folder_zip, tmp_path):
+        service = ArchiveService(tmp_path / "temp", max_workers=2)
+        ready = []
+        temp_dir = service.extract_archive(multi_folder_zip, folders=["a", ""],
+                                           on_folder_ready=ready.append)
+        assert temp_dir is not None
+        assert sorted(ready) == sorted([temp_dir, temp_dir / "a"])
+        assert sorted(service.get_folders(temp_dir)) == sorted([temp_dir, temp_dir / "a"])
+
+    def test_corrupt_member_cleans_up(self, tmp_path):
+        archive = tmp_path / "corrupt.zip"
+        with zipfile.ZipFile(archive, 'w', zipfile.ZIP_DEFLATED) as zf:
+            zf.writestr("g/0.jpg", b"z" * 50000)
+        data = bytearray(archive.read_bytes())
+        data[100:200] = b"\0" * 100  # damage compressed data
+        archive.write_bytes(bytes(data))
+
+        service = ArchiveService(tmp_path / "temp")
+        assert service.extract_archive(archive) is None
+        assert list((tmp_path / "temp").iterdir()) == []
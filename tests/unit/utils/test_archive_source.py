@@ -0,0 +1,131 @@
+#!/usr/bin/env python3
+"""
+Test suite for reading gallery images directly from archives
+Tests virtual archive gallery paths, ArchiveImageSource and gallery listing
+"""
+
+import zipfile
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from src.utils.archive_utils import (
+    make_archive_gallery_path,
+    is_archive_gallery_path,
+    split_archive_gallery_path,
+    get_archive_gallery_name,
+)
+from src.services.archive_source import ArchiveImageSource, list_archive_galleries
+
+
+def _make_zip(path, members, compression=zipfile.ZIP_STORED):
+    with zipfile.ZipFile(path, 'w', compression) as zf:
+        for name, data in members.items():
+            zf.writestr(name, data)
+    return path
+
+
+@pytest.fixture
+def gallery_zip(tmp_path):
+    return _make_zip(tmp_path / "set.zip", {
+        "cover.jpg": b"C" * 10,
+        "day1/01.jpg": b"A" * 100,
+        "day1/02.PNG": b"B" * 200,
+        "day1/notes.txt": b"text",
+        "day1/sub/03.jpg": b"D" * 5,
+        "__MACOSX/day1/._01.jpg": b"junk",
+    })
+
+
+class TestArchiveGalleryPaths:
+    """Test virtual archive gallery path helpers"""
+
+    def test_round_trip(self):
+        path = make_archive_gallery_path("/dl/set.zip", "day1/sub")
+        assert is_archive_gallery_path(path)
+        assert split_archive_gallery_path(path) == ("/dl/set.zip", "day1/sub")
+
+    def test_windows_paths_normalized(self):
+        path = make_archive_gallery_path("C:\\dl\\Set.CBZ", "day1\\sub\\")
+        assert split_archive_gallery_path(path) == ("C:\\dl\\Set.CBZ", "day1/sub")
+
+    def test_root_gallery(self):
+        path = make_archive_gallery_path("/dl/set.zip")
+        assert split_archive_gallery_path(path) == ("/dl/set.zip", "")
+        assert get_archive_gallery_name(path) == "set"
+
+    def test_gallery_name_is_inner_folder(self):
+        assert get_archive_gallery_name("/dl/set.zip::day1/sub") == "sub"
+
+    @pytest.mark.parametrize("path", ["/dl/set.zip", "/dl/folder", "/dl/a::b", "", None])
+    def test_regular_paths_not_matched(self, path):
+        assert not is_archive_gallery_path(path)
+
+    def test_split_rejects_regular_path(self):
+        with pytest.raises(ValueError):
+            split_archive_gallery_path("/dl/folder")
+
+
+class TestListArchiveGalleries:
+    """Test discovery of galleries inside an archive"""
+
+    def test_lists_dirs_with_images(self, gallery_zip):
+        galleries = list_archive_galleries(gallery_zip)
+        assert [split_archive_gallery_path(g)[1] for g in galleries] == ["", "day1", "day1/sub"]
+
+    def test_encrypted_member_not_streamable(self, gallery_zip):
+        data = bytearray(gallery_zip.read_bytes())
+        # Set the encryption flag in the central directory entry of the first member
+        first_cd = data.find(b"PK\x01\x02")
+        data[first_cd + 8] |= 0x1
+        gallery_zip.write_bytes(bytes(data))
+        assert list_archive_galleries(gallery_zip) is None
+
+    def test_invalid_archive_returns_none(self, tmp_path):
+        bad = tmp_path / "bad.zip"
+        bad.write_bytes(b"not a zip")
+        assert list_archive_galleries(bad) is None
+
+
+class TestArchiveImageSource:
+    """Test reading images from an archive gallery"""
+
+    def test_lists_only_direct_images(self, gallery_zip):
+        with ArchiveImageSource(gallery_zip, "day1") as source:
+            assert sorted(source.list_images()) == ["01.jpg", "02.PNG"]
+            assert source.get_size("02.PNG") == 200
+            assert source.is_streamable()
+
+    def test_read_stored_member(self, gallery_zip):
+        with ArchiveImageSource.from_gallery_path(f"{gallery_zip}::day1") as source:
+            assert source.read("01.jpg") == b"A" * 100
+            assert source.read("02.PNG") == b"B" * 200
+
+    def test_read_deflated_member(self, tmp_path):
+        archive = _make_zip(tmp_path / "d.cbz", {"p/01.jpg": b"Z" * 5000}, zipfile.ZIP_DEFLATED)
+        with ArchiveImageSource(archive, "p") as source:
+            assert source.read("01.jpg") == b"Z" * 5000
+            with source.open("01.jpg") as fh:
+                assert fh.read(3) == b"ZZZ"
+
+    def test_unknown_image_raises(self, gallery_zip):
+        with ArchiveImageSource(gallery_zip, "day1") as source:
+            with pytest.raises(KeyError):
+                source.read("missing.jpg")
+
+    def test_concurrent_reads(self, tmp_path):
+        members = {f"g/{i:03d}.jpg": bytes([i]) * (1000 + i) for i in range(40)}
+        archive = _make_zip(tmp_path / "many.zip", members)
+        with ArchiveImageSource(archive, "g") as source:
+            with ThreadPoolExecutor(max_workers=8) as pool:
+                results = dict(zip(source.list_images(), pool.map(source.read, source.list_images())))
+            assert len(source._handles) <= 8
+        for name, data in members.items():
+            assert results[name.split('/')[1]] == data
+
+    def test_close_releases_handles(self, gallery_zip):
+        source = ArchiveImageSource(gallery_zip, "day1")
+        source.read("01.jpg")
+        handles = list(source._handles)
+        source.close()
+        assert handles and all(h.closed for h in handles)
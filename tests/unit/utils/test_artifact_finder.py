@@ -0,0 +1,95 @@
+"""
+Tests for finding gallery artifacts by gallery ID.
+"""
+
+import json
+import os
+from unittest.mock import patch
+
+import pytest
+
+from src.storage.database import QueueStore
+from src.storage.artifact_index import record_saved_artifacts
+from src.utils.artifact_finder import (
+    find_gallery_json_by_id,
+    find_gallery_jsons_by_ids,
+    find_gallery_bbcode_by_id,
+)
+
+
+@pytest.fixture
+def store(tmp_path):
+    store = QueueStore(db_path=str(tmp_path / "test.db"))
+    store.mark_artifact_index_backfilled()
+    yield store
+    store._executor.shutdown(wait=True)
+
+
+def _write_json(directory, gallery_name, gallery_id):
+    directory.mkdir(parents=True, exist_ok=True)
+    json_path = directory / f"{gallery_name}_{gallery_id}.json"
+    json_path.write_text(json.dumps({
+        'meta': {'gallery_name': gallery_name, 'gallery_id': gallery_id}, 'images': [],
+    }), encoding='utf-8')
+    bbcode_path = directory / f"{gallery_name}_{gallery_id}_bbcode.txt"
+    bbcode_path.write_text("[url]...[/url]", encoding='utf-8')
+    return str(json_path), str(bbcode_path)
+
+
+class TestFindGalleryJson:
+    """Test JSON artifact lookup through the index"""
+
+    def test_indexed_central_artifact(self, store, tmp_path):
+        json_path, bbcode_path = _write_json(tmp_path / "central", "Gallery", "abc")
+        record_saved_artifacts("", "abc", "Gallery",
+                               {'central': {'json': json_path, 'bbcode': bbcode_path}}, store=store)
+
+        with patch('glob.glob') as mock_glob:
+            assert find_gallery_json_by_id("abc", store=store) == json_path
+        mock_glob.assert_not_called()
+
+    def test_prefers_own_uploaded_folder(self, store, tmp_path):
+        gallery = tmp_path / "Gallery"
+        central_json, _ = _write_json(tmp_path / "central", "Gallery", "abc")
+        uploaded_json, _ = _write_json(gallery / ".uploaded", "Gallery", "abc")
+        record_saved_artifacts(str(gallery), "abc", "Gallery", {
+            'central': {'json': central_json},
+            'uploaded': {'json': uploaded_json},
+        }, store=store)
+
+        assert find_gallery_json_by_id("abc", str(gallery), store=store) == uploaded_json
+        assert find_gallery_json_by_id("abc", str(tmp_path / "Other"), store=store) == central_json
+
+    def test_unindexed_uploaded_artifact_is_found_and_indexed(self, store, tmp_path):
+        gallery = tmp_path / "Gallery"
+        uploaded_json, _ = _write_json(gallery / ".uploaded", "Gallery", "old1")
+
+        assert find_gallery_json_by_id("old1", str(gallery), store=store) == uploaded_json
+        indexed = store.get_artifacts_by_gallery_ids(["old1"])["old1"]
+        assert indexed[0]['json_path'] == os.path.normpath(uploaded_json)
+        assert indexed[0]['location'] == 'uploaded'
+
+    def test_batch_lookup(self, store, tmp_path):
+        for i in range(50):
+            json_path, _ = _write_json(tmp_path / "central", f"G{i}", f"id{i}")
+            record_saved_artifacts("", f"id{i}", f"G{i}", {'central': {'json': json_path}}, store=store)
+
+        found = find_gallery_jsons_by_ids([(f"id{i}", None) for i in range(0, 60, 5)], store=store)
+        assert sorted(found) == sorted(f"id{i}" for i in range(0, 50, 5))
+
+    def test_missing_returns_none(self, store):
+        assert find_gallery_json_by_id("nope", store=store) is None
+        assert find_gallery_json_by_id("", store=store) is None
+
+
+class TestFindGalleryBBCode:
+    """Test BBCode artifact lookup through the index"""
+
+    def test_central_bbcode(self, store, tmp_path):
+        json_path, bbcode_path = _write_json(tmp_path / "central", "Renamed", "r1")
+        record_saved_artifacts("", "r1", "Renamed",
+                               {'central': {'json': json_path, 'bbcode': bbcode_path}}, store=store)
+        assert find_gallery_bbcode_by_id("r1", store=store) == bbcode_path
+
+        os.remove(bbcode_path)
+        assert find_gallery_bbcode_by_id("r1", store=store) is None
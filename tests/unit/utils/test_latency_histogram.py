@@ -0,0 +1,214 @@
+#!/usr/bin/env python3
+"""
+Test suite for latency histograms
+Tests LogHistogram accuracy/merging and MetricsStore latency rollups
+"""
+
+import random
+import time
+
+import pytest
+
+from src.utils.latency_histogram import BUCKET_GROWTH, LogHistogram
+from src.utils.metrics_store import LATENCY_DOWNSAMPLE_INTERVAL, MetricsStore
+
+
+class TestLogHistogram:
+    """Test log-bucketed histogram behaviour"""
+
+    def test_empty(self):
+        hist = LogHistogram()
+        assert hist.count == 0
+        assert hist.mean == 0.0
+        assert hist.percentile(99) == 0.0
+
+    def test_percentiles_within_relative_error(self):
+        rng = random.Random(42)
+        values = sorted(rng.lognormvariate(0, 1.5) for _ in range(5000))
+        hist = LogHistogram()
+        for value in values:
+            hist.record(value)
+
+        for pct in (50, 90, 95, 99):
+            exact = values[int(len(values) * pct / 100) - 1]
+            assert hist.percentile(pct) == pytest.approx(exact, rel=BUCKET_GROWTH - 1)
+
+    def test_min_max_and_sum_are_exact(self):
+        hist = LogHistogram()
+        for value in (0.25, 3.0, 12.5):
+            hist.record(value)
+        assert hist.min == 0.25
+        assert hist.max == 12.5
+        assert hist.percentile(0) == 0.25
+        assert hist.percentile(100) == 12.5
+        assert hist.mean == pytest.approx(15.75 / 3)
+
+    def test_zero_and_negative_values(self):
+        hist = LogHistogram()
+        hist.record(0)
+        hist.record(-1)
+        assert hist.count == 2
+        assert hist.percentile(50) == 0.0
+
+    def test_merge_equals_combined(self):
+        a, b, combined = LogHistogram(), LogHistogram(), LogHistogram()
+        for i in range(1, 200):
+            (a if i % 2 else b).record(i / 10)
+            combined.record(i / 10)
+        a.merge(b)
+        assert a.counts == combined.counts
+        assert a.count == combined.count
+        assert (a.min, a.max) == (combined.min, combined.max)
+
+    def test_json_round_trip(self):
+        hist = LogHistogram()
+        for value in (0.001, 0.5, 7, 1e6):
+            hist.record(value)
+        restored = LogHistogram.from_json(hist.to_json())
+        assert restored.counts == hist.counts
+        assert restored.count == hist.count
+        assert restored.total == pytest.approx(hist.total)
+        assert (restored.min, restored.max) == (hist.min, hist.max)
+
+
+@pytest.fixture
+def metrics_store(tmp_path, monkeypatch):
+    """Fresh MetricsStore backed by a temporary database"""
+    monkeypatch.setattr(MetricsStore, "_get_db_path", lambda self: str(tmp_path / "metrics.db"))
+    MetricsStore._instance = None
+    store = MetricsStore()
+    yield store
+    store.close()
+    MetricsStore._instance = None
+
+
+class TestMetricsStoreLatency:
+    """Test latency recording, querying and downsampling"""
+
+    def test_record_and_query_percentiles(self, metrics_store):
+        now = time.time()
+        for i in range(1, 101):
+            metrics_store.record_latency("imx.to", upload_time=i / 10, bytes_uploaded=1_000_000,
+                                         ttfb=0.05, timestamp=now)
+
+        # Buffered samples are visible before the flush
+        result = metrics_store.get_latency_percentiles("imx.to", "upload_time", now - 60)
+        assert result['count'] == 100
+        assert result['p50'] == pytest.approx(5.0, rel=0.05)
+        assert result['p99'] == pytest.approx(9.9, rel=0.05)
+
+        metrics_store.flush()
+        assert not metrics_store._latency_buffer
+        result = metrics_store.get_latency_percentiles("imx.to", "upload_time", now - 60)
+        assert result['count'] == 100
+        assert result['max'] == pytest.approx(10.0)
+
+        speed = metrics_store.get_latency_percentiles("imx.to", "speed", now - 60, percentiles=(50,))
+        assert speed['p50'] == pytest.approx(1_000_000 / 5.0, rel=0.05)
+        assert metrics_store.get_latency_percentiles("imx.to", "ttfb", now - 60)['count'] == 100
+
+    def test_flush_merges_into_existing_bucket(self, metrics_store):
+        now = time.time()
+        metrics_store.record_latency("rapidgator", 1.0, timestamp=now)
+        metrics_store.flush()
+        metrics_store.record_latency("rapidgator", 3.0, timestamp=now)
+        metrics_store.flush()
+
+        assert metrics_store.get_latency_percentiles("rapidgator", "upload_time", now - 60)['count'] == 2
+        assert metrics_store.get_latency_percentiles("rapidgator", "ttfb", now - 60)['count'] == 0
+        assert metrics_store.get_latency_hosts(now - 60) == ["rapidgator"]
+
+    def test_time_range_excludes_other_buckets(self, metrics_store):
+        now = time.time()
+        metrics_store.record_latency("imx.to", 1.0, timestamp=now - 7200)
+        metrics_store.record_latency("imx.to", 2.0, timestamp=now)
+        metrics_store.flush()
+
+        assert metrics_store.get_latency_percentiles("imx.to", "upload_time", now - 600)['count'] == 1
+        assert metrics_store.get_latency_percentiles("imx.to", "upload_time", now - 10800)['count'] == 2
+
+    def test_cleanup_downsamples_resolutions(self, metrics_store):
+        now = time.time()
+        old_minute = now - 3 * 86400
+        old_hour = now - 40 * 86400
+        expired = now - 200 * 86400
+        for ts in (old_minute, old_minute + 60, old_hour, expired, now):
+            metrics_store.record_latency("imx.to", 2.0, timestamp=ts)
+        metrics_store.flush()
+
+        metrics_store.cleanup_old_metrics(days_to_keep=90)
+
+        with metrics_store._db_lock:
+            conn = metrics_store._connect()
+            rows = conn.execute(
+                "SELECT resolution, sample_count FROM latency_histograms WHERE metric = 'upload_time'"
+            ).fetchall()
+            conn.close()
+        by_resolution = {}
+        for row in rows:
+            by_resolution.setdefault(row['resolution'], []).append(row['sample_count'])
+
+        assert by_resolution['minute'] == [1]
+        assert by_resolution['hour'] == [2]
+        assert by_resolution['day'] == [1]
+        # Downsampled data still answers range queries
+        assert metrics_store.get_latency_percentiles("imx.to", "upload_time", now - 100 * 86400)['count'] == 4
+
+    def test_store_startup_downsamples_old_buckets(self, tmp_path, monkeypatch):
+        monkeypatch.setattr(MetricsStore, "_get_db_path", lambda self: str(tmp_path / "metrics.db"))
+        now = time.time()
+        MetricsStore._instance = None
+        store = MetricsStore()
+        store._last_latency_downsample = time.monotonic()  # Skip this store's startup run
+        for ts in (now - 3 * 86400, now - 3 * 86400 + 60, now):
+            store.record_latency("imx.to", 2.0, timestamp=ts)
+        store.flush()
+        store.close()
+
+        def resolutions(metrics_store):
+            with metrics_store._db_lock:
+                conn = metrics_store._connect()
+                rows = conn.execute(
+                    "SELECT resolution FROM latency_histograms WHERE metric = 'upload_time'"
+                ).fetchall()
+                conn.close()
+            return sorted(row['resolution'] for row in rows)
+
+        MetricsStore._instance = None
+        store = MetricsStore()
+        try:
+            deadline = time.monotonic() + 5
+            while resolutions(store) != ['hour', 'minute'] and time.monotonic() < deadline:
+                time.sleep(0.05)
+            assert resolutions(store) == ['hour', 'minute']
+        finally:
+            store.close()
+            MetricsStore._instance = None
+
+    def test_downsampling_runs_once_per_interval(self, metrics_store, monkeypatch):
+        calls = []
+        monkeypatch.setattr(metrics_store, "_downsample_latency_resolutions",
+                            lambda conn, now: calls.append(now) or (0, 0))
+        metrics_store._last_latency_downsample = None
+
+        metrics_store._maybe_downsample_latency()
+        metrics_store._maybe_downsample_latency()
+        assert len(calls) == 1
+
+        metrics_store._last_latency_downsample -= LATENCY_DOWNSAMPLE_INTERVAL
+        metrics_store._maybe_downsample_latency()
+        assert len(calls) == 2
+
+    def test_series_groups_by_resolution(self, metrics_store):
+        now = time.time()
+        start = (int(now) // 3600 - 3) * 3600
+        for hour in range(3):
+            for i in range(10):
+                metrics_store.record_latency("imx.to", hour + 1.0, timestamp=start + hour * 3600 + i * 60)
+        metrics_store.flush()
+
+        series = metrics_store.get_latency_series("imx.to", "upload_time", start, start + 3 * 3600,
+                                                  resolution='hour')
+        assert [p['ts'] for p in series] == [start, start + 3600, start + 7200]
+        assert [p['count'] for p in series] == [10, 10, 10]
+        assert series[2]['p50'] == pytest.approx(3.0, rel=0.05)
@@ -0,0 +1,144 @@
+"""
+Tests for the log viewer's line-offset index and queries.
+"""
+
+import gzip
+
+import pytest
+
+from src.utils import log_index
+from src.utils.log_index import LogLineIndex, LogQuery, find_matches, parse_log_line
+
+LINES = [f"2025-11-13 10:00:{i % 60:02d} {'DEBUG' if i % 3 else 'WARNING'}: [uploads:file] Line {i}"
+         for i in range(3000)]
+TEXT = "\n".join(LINES) + "\n"
+
+
+@pytest.fixture
+def small_blocks(monkeypatch):
+    """Small blocks so a few thousand lines span many blocks and checkpoints."""
+    monkeypatch.setattr(log_index, "BLOCK_SIZE", 4096)
+    monkeypatch.setattr(log_index, "GZ_CHECKPOINT_SPACING", 8192)
+    monkeypatch.setattr(log_index, "SCAN_WINDOW", 5000)
+    monkeypatch.setattr(log_index, "_GZ_READ_SIZE", 256)
+
+
+class TestParseLogLine:
+    """Test splitting log lines into columns"""
+
+    def test_file_line(self):
+        assert parse_log_line("2025-11-13 10:30:45 ERROR: [uploads:file] Failed") == (
+            "2025-11-13 10:30:45", "ERROR", "uploads", "Failed")
+
+    def test_time_only_line_dated_today(self):
+        timestamp, level, category, message = parse_log_line("10:30:45 [auth] Token")
+        assert timestamp.endswith(" 10:30:45") and len(timestamp) == 19
+        assert (level, category, message) == ("INFO", "auth", "Token")
+
+    def test_plain_text(self):
+        assert parse_log_line("no structure") == ("", "INFO", "general", "no structure")
+
+
+class TestLogLineIndex:
+    """Test indexing plain, gzipped and in-memory logs"""
+
+    def test_plain_file(self, tmp_path, small_blocks):
+        path = tmp_path / "bbdrop.log"
+        path.write_text(TEXT)
+        index = LogLineIndex(str(path))
+
+        assert index.build() == len(LINES)
+        assert [index.line(i) for i in (0, 1234, len(LINES) - 1)] == [LINES[0], LINES[1234], LINES[-1]]
+
+    def test_gzip_members_and_blocks(self, tmp_path, small_blocks):
+        path = tmp_path / "bbdrop.log.1.gz"
+        half = len(TEXT) // 2
+        path.write_bytes(gzip.compress(TEXT[:half].encode()) + gzip.compress(TEXT[half:].encode()))
+        index = LogLineIndex(str(path))
+
+        assert index.build() == len(LINES)
+        assert len(index._checkpoints) > 10
+        assert all(index.line(i) == LINES[i] for i in range(0, len(LINES), 7))
+        assert index.line(len(LINES) - 1) == LINES[-1]
+
+    def test_gzip_checkpoints_are_spaced(self, tmp_path, small_blocks):
+        path = tmp_path / "bbdrop.log.1.gz"
+        # Many small members must not add a checkpoint each
+        path.write_bytes(b"".join(gzip.compress(f"{line}\n".encode()) for line in LINES))
+        index = LogLineIndex(str(path))
+
+        assert index.build() == len(LINES)
+        outs = index._checkpoint_outs
+        assert len(outs) <= len(TEXT) // 8192 + 1
+        assert all(b - a >= 8192 for a, b in zip(outs, outs[1:]))
+        assert all(index.line(i) == LINES[i] for i in range(0, len(LINES), 11))
+        assert len(index._blocks) <= log_index.CACHED_GZ_BLOCKS
+
+    def test_tail_starts_at_line_boundary(self, tmp_path):
+        path = tmp_path / "bbdrop.log"
+        path.write_text(TEXT)
+        index = LogLineIndex(str(path), tail_bytes=1000)
+
+        count = index.build()
+        assert 0 < count < len(LINES)
+        assert index.line(0) == LINES[-count]
+
+    def test_update_indexes_appended_lines_only(self, tmp_path):
+        path = tmp_path / "bbdrop.log"
+        path.write_text(TEXT)
+        index = LogLineIndex(str(path))
+        index.build()
+
+        with open(path, "a") as f:
+            f.write("2025-11-13 11:00:00 INFO: partial")
+        assert index.update() == (len(LINES), len(LINES))
+        with open(path, "a") as f:
+            f.write(" line\n2025-11-13 11:00:01 INFO: next\n")
+        assert index.update() == (len(LINES), len(LINES) + 2)
+        assert index.line(len(LINES)) == "2025-11-13 11:00:00 INFO: partial line"
+
+    def test_update_detects_rotation(self, tmp_path):
+        path = tmp_path / "bbdrop.log"
+        path.write_text(TEXT)
+        index = LogLineIndex(str(path))
+        index.build()
+
+        path.write_text("2025-11-13 12:00:00 INFO: new file\n")
+        assert index.update() is None
+
+    def test_from_text_keeps_last_line(self):
+        index = LogLineIndex.from_text("first\nsecond")
+        assert index.build() == 2
+        assert index.line(1) == "second"
+
+
+class TestFindMatches:
+    """Test filtering over an index"""
+
+    @pytest.fixture
+    def index(self):
+        index = LogLineIndex.from_text(TEXT)
+        index.build()
+        return index
+
+    def test_everything_newest_first_in_chunks(self, index):
+        chunks = list(find_matches(index, LogQuery(), 0, len(index), chunk_size=1000))
+        assert [len(c) for c in chunks] == [1000, 1000, 1000]
+        assert chunks[0][0] == len(LINES) - 1 and chunks[-1][-1] == 0
+
+    def test_level_category_and_pattern(self, index):
+        warnings = [n for c in find_matches(index, LogQuery(min_level=30), 0, len(index)) for n in c]
+        assert warnings == list(range(2997, -1, -3))
+
+        found = [n for c in find_matches(index, LogQuery(min_level=30, pattern="line 29"), 0, len(index))
+                 for n in c]
+        assert found == [n for n in range(len(LINES) - 1, -1, -1)
+                         if n % 3 == 0 and "line 29" in LINES[n].lower()]
+        assert found[0] == 2997
+
+        hidden = LogQuery(hidden_categories=frozenset({"uploads"}))
+        assert list(find_matches(index, hidden, 0, len(index))) == []
+
+    def test_stop_ends_search(self, index):
+        query = LogQuery(pattern="line")
+        assert list(find_matches(index, query, 0, len(index), should_stop=lambda: True)) == []
@@ -0,0 +1,73 @@
+"""
+Tests for the coalescing progress bus.
+
+Covers latest-value coalescing, drain grouping, the dropped-update counters
+and concurrent publishers.
+"""
+
+import threading
+
+from src.utils.progress_bus import (
+    CHANNEL_BANDWIDTH, CHANNEL_FILE_HOST, CHANNEL_GALLERY, ProgressBus,
+)
+
+
+class TestProgressBus:
+    """Test publishing and draining"""
+
+    def test_drain_returns_latest_state_per_key(self):
+        bus = ProgressBus()
+        bus.publish(CHANNEL_GALLERY, "/a", (1, 10, 10, "1.jpg"))
+        bus.publish(CHANNEL_GALLERY, "/a", (2, 10, 20, "2.jpg"))
+        bus.publish(CHANNEL_GALLERY, "/b", (5, 5, 100, ""))
+        bus.publish(CHANNEL_FILE_HOST, (7, "rapidgator"), (100, 200, 50.0))
+
+        assert bus.drain() == {
+            CHANNEL_GALLERY: {"/a": (2, 10, 20, "2.jpg"), "/b": (5, 5, 100, "")},
+            CHANNEL_FILE_HOST: {(7, "rapidgator"): (100, 200, 50.0)},
+        }
+        assert bus.drain() == {}
+
+    def test_stats_count_coalesced_updates(self):
+        bus = ProgressBus()
+        for kbps in (1.0, 2.0, 3.0):
+            bus.publish(CHANNEL_BANDWIDTH, "imx.to", kbps)
+        assert bus.stats().pending == 1
+        bus.drain()
+        bus.publish(CHANNEL_BANDWIDTH, "imx.to", 4.0)
+
+        stats = bus.stats()
+        assert (stats.published, stats.delivered, stats.coalesced, stats.drains, stats.pending) == (4, 1, 2, 1, 1)
+
+        bus.reset_stats()
+        assert bus.stats().published == 0
+
+    def test_concurrent_publishers(self):
+        bus = ProgressBus()
+        drained = {}
+        stop = threading.Event()
+
+        def drain_loop():
+            while not stop.is_set():
+                for key, state in bus.drain().get(CHANNEL_GALLERY, {}).items():
+                    drained[key] = state
+
+        def publish(worker):
+            for i in range(1, 1001):
+                bus.publish(CHANNEL_GALLERY, worker, i)
+
+        drainer = threading.Thread(target=drain_loop)
+        drainer.start()
+        workers = [threading.Thread(target=publish, args=(w,)) for w in range(8)]
+        for t in workers:
+            t.start()
+        for t in workers:
+            t.join()
+        stop.set()
+        drainer.join()
+        drained.update(bus.drain().get(CHANNEL_GALLERY, {}))
+
+        assert drained == {w: 1000 for w in range(8)}
+        stats = bus.stats()
+        assert stats.published == 8000
+        assert stats.delivered + stats.coalesced == stats.published
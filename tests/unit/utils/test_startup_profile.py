@@ -0,0 +1,117 @@
+"""
+Tests for startup profiling and the lazy-import startup path.
+
+Covers the --profile-startup phase report and an import-time budget for
+the CLI path (`import bbdrop`), measured with `python -X importtime`.
+"""
+
+import io
+import os
+import subprocess
+import sys
+
+import pytest
+
+from src.utils import startup_profile
+
+REPO_ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), "..", "..", ".."))
+
+# Heavy packages the CLI path must not load at import time
+HEAVY_MODULES = ('PyQt6', 'PIL', 'pycurl', 'requests', 'keyring', 'cryptography', 'tqdm')
+
+# Budget for bbdrop's own import work (self time of the modules it adds),
+# relative to the interpreter's startup imports so machine load cancels out.
+# Eager imports put this near 3.7x; the lazy path is about 1.3x.
+IMPORT_BUDGET_RATIO = 2.5
+
+
+def _import_times(code):
+    """Run code under -X importtime and return {module: self time in microseconds}."""
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", code],
+        cwd=REPO_ROOT, capture_output=True, text=True, timeout=60,
+    )
+    assert result.returncode == 0, result.stderr[-2000:]
+    times = {}
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:") or "self [us]" in line:
+            continue
+        self_us, _, name = line[len("import time:"):].split("|", 2)
+        times[name.strip()] = int(self_us)
+    return times
+
+
+@pytest.fixture
+def profile(monkeypatch):
+    """Fresh profiler state for each test."""
+    monkeypatch.setattr(startup_profile, "_enabled", False)
+    monkeypatch.setattr(startup_profile, "_origin", None)
+    monkeypatch.setattr(startup_profile, "_phases", [])
+    monkeypatch.setattr(startup_profile, "_reported", False)
+    return startup_profile
+
+
+class TestStartupProfile:
+    """Test phase recording and the report"""
+
+    def test_disabled_records_nothing(self, profile):
+        with profile.startup_phase("idle"):
+            pass
+        assert profile._phases == []
+        stream = io.StringIO()
+        profile.report_startup_profile(stream)
+        assert stream.getvalue() == ""
+
+    def test_phases_count_imported_modules(self, profile, monkeypatch):
+        profile.enable_startup_profile()
+        monkeypatch.delitem(sys.modules, "colorsys", raising=False)
+        with profile.startup_phase("import colorsys"):
+            import colorsys  # noqa: F401
+        name, seconds, modules = profile._phases[0]
+        assert name == "import colorsys"
+        assert seconds >= 0 and modules == 1
+
+    def test_report_printed_once(self, profile):
+        profile.enable_startup_profile()
+        with profile.startup_phase("parse arguments"):
+            pass
+        stream = io.StringIO()
+        profile.report_startup_profile(stream)
+        profile.report_startup_profile(stream)
+        report = stream.getvalue()
+        assert report.count("Startup profile") == 1
+        assert "parse arguments" in report and "Total" in report
+
+
+class TestImportBudget:
+    """Test that the CLI path stays free of heavy imports"""
+
+    def test_cli_import_skips_heavy_modules(self):
+        code = ("import sys, bbdrop; "
+                "print(','.join(m for m in %r if m in sys.modules))" % (HEAVY_MODULES,))
+        result = subprocess.run([sys.executable, "-c", code], cwd=REPO_ROOT,
+                                capture_output=True, text=True, timeout=60)
+        assert result.returncode == 0, result.stderr[-2000:]
+        assert result.stdout.strip() == ""
+
+    def test_cli_import_time_budget(self):
+        # Best of three rounds, so a busy test machine doesn't fail the budget
+        rounds = []
+        for _ in range(3):
+            baseline = _import_times("pass")
+            loaded = _import_times("import bbdrop")
+            own = {name: us for name, us in loaded.items() if name not in baseline}
+            assert "bbdrop" in own
+            rounds.append((sum(own.values()) / sum(baseline.values()), own))
+        ratio, own = min(rounds, key=lambda item: item[0])
+        slowest = sorted(own.items(), key=lambda item: -item[1])[:5]
+        assert ratio < IMPORT_BUDGET_RATIO, (
+            f"import bbdrop took {ratio:.1f}x interpreter startup; slowest: {slowest}")
+
+    def test_single_instance_forwarding_skips_qt(self):
+        code = ("import sys, src.network.single_instance; "
+                "print('PyQt6' in sys.modules)")
+        result = subprocess.run([sys.executable, "-c", code], cwd=REPO_ROOT,
+                                capture_output=True, text=True, timeout=60)
+        assert result.returncode == 0, result.stderr[-2000:]
+        assert result.stdout.strip() == "False"
@@ -0,0 +1,150 @@
+#!/usr/bin/env python3
+"""
+Test suite for pipeline tracing
+Tests span recording, gallery tagging, ring buffer and Chrome trace export
+"""
+
+import json
+import threading
+
+import pytest
+
+from src.utils import tracing
+from src.utils.tracing import (
+    span, traced, enable_tracing, disable_tracing, clear_trace,
+    get_trace_events, export_chrome_trace,
+)
+
+
+@pytest.fixture(autouse=True)
+def reset_tracing():
+    clear_trace()
+    yield
+    disable_tracing()
+    enable_tracing()  # restore default capacity
+    disable_tracing()
+    clear_trace()
+
+
+def _spans(gallery=None):
+    return [e for e in get_trace_events(gallery) if e['ph'] == 'X']
+
+
+class TestSpans:
+    """Test span recording"""
+
+    def test_disabled_records_nothing(self):
+        with span("scan", gallery="/g") as s:
+            s.set(extra=1)
+
+        @traced("work")
+        def work():
+            return 42
+
+        assert work() == 42
+        assert _spans() == []
+
+    def test_span_and_decorator_recorded(self):
+        enable_tracing()
+
+        @traced("inner", category="test")
+        def inner(x):
+            return x * 2
+
+        with span("outer", category="test", files=3):
+            assert inner(2) == 4
+
+        events = {e['name']: e for e in _spans()}
+        assert set(events) == {"outer", "inner"}
+        assert events["outer"]['args']['files'] == 3
+        assert events["outer"]['dur'] >= events["inner"]['dur']
+        assert events["inner"]['cat'] == "test"
+
+    def test_exception_marks_span(self):
+        enable_tracing()
+        with pytest.raises(ValueError):
+            with span("fails"):
+                raise ValueError("boom")
+        assert _spans()[0]['args']['error'] == "ValueError"
+
+    def test_ring_buffer_capacity(self):
+        enable_tracing(capacity=10)
+        for i in range(25):
+            with span(f"s{i}"):
+                pass
+        names = [e['name'] for e in _spans()]
+        assert names == [f"s{i}" for i in range(15, 25)]
+
+
+class TestGalleryTagging:
+    """Test gallery propagation and filtering"""
+
+    def test_nested_spans_inherit_gallery(self):
+        enable_tracing()
+        with span("upload_gallery", gallery="/a"):
+            with span("upload_file"):
+                pass
+        with span("upload_gallery", gallery="/b"):
+            pass
+        with span("untagged"):
+            pass
+
+        assert sorted(e['name'] for e in _spans("/a")) == ["upload_file", "upload_gallery"]
+        assert [e['name'] for e in _spans("/b")] == ["upload_gallery"]
+        assert len(_spans()) == 4
+
+    def test_gallery_is_thread_local(self):
+        enable_tracing()
+
+        def other_thread():
+            with span("worker"):
+                pass
+
+        with span("outer", gallery="/a"):
+            t = threading.Thread(target=other_thread, name="Worker-1")
+            t.start()
+            t.join()
+
+        worker = [e for e in _spans() if e['name'] == "worker"][0]
+        assert 'gallery' not in worker['args']
+        names = [e['args']['name'] for e in get_trace_events() if e['ph'] == 'M']
+        assert "Worker-1" in names
+
+    def test_traced_gallery_arg(self):
+        enable_tracing()
+
+        @traced("save", gallery_arg="folder_path")
+        def save(folder_path, results=None):
+            with span("write"):
+                pass
+
+        save("/g1")
+        save(folder_path="/g2")
+        assert sorted(e['name'] for e in _spans("/g1")) == ["save", "write"]
+        assert len(_spans("/g2")) == 2
+
+
+class TestExport:
+    """Test Chrome trace export"""
+
+    def test_export_writes_chrome_trace(self, tmp_path):
+        enable_tracing()
+        with span("scan", gallery="/g", path=tmp_path):
+            pass
+        out = tmp_path / "trace.json"
+        assert export_chrome_trace(str(out)) == 1
+
+        data = json.loads(out.read_text())
+        event = [e for e in data['traceEvents'] if e['ph'] == 'X'][0]
+        assert event['name'] == "scan"
+        assert {'ts', 'dur', 'pid', 'tid'} <= set(event)
+        assert event['args']['path'] == str(tmp_path)
+
+    def test_export_filtered_by_gallery(self, tmp_path):
+        enable_tracing()
+        with span("a", gallery="/a"):
+            pass
+        with span("b", gallery="/b"):
+            pass
+        assert export_chrome_trace(str(tmp_path / "t.json"), gallery="/b") == 1
+        assert tracing.is_tracing_enabled()